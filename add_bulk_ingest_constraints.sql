@@ -0,0 +1,24 @@
+-- ========================================
+-- Unique keys for bulk game ingest (save-games-bulk)
+-- Run this in Supabase SQL Editor
+-- ========================================
+
+-- upsert(..., { onConflict: 'playerId,gameId' }) needs a unique constraint
+-- Remove duplicates left by earlier per-game inserts first (keep the newest row)
+DELETE FROM public.appearances a
+USING public.appearances b
+WHERE a."playerId" = b."playerId"
+  AND a."gameId" = b."gameId"
+  AND a."appearanceId" < b."appearanceId";
+
+DELETE FROM public.player_stats a
+USING public.player_stats b
+WHERE a."playerId" = b."playerId"
+  AND a."gameId" = b."gameId"
+  AND a."statId" < b."statId";
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_appearances_player_game
+  ON public.appearances("playerId", "gameId");
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_player_stats_player_game
+  ON public.player_stats("playerId", "gameId");
@@ -0,0 +1,52 @@
+-- ========================================
+-- Dirty marker for incremental stats recalculation (recalculate-stats)
+-- Run this in Supabase SQL Editor
+-- ========================================
+
+-- TRUE = the player's games changed since the last recalculation (new rows start dirty)
+ALTER TABLE public.players
+  ADD COLUMN IF NOT EXISTS "statsDirty" BOOLEAN DEFAULT TRUE;
+
+-- Bumped on every games[] change - recalculate-stats clears "statsDirty" only if it is unchanged
+ALTER TABLE public.players
+  ADD COLUMN IF NOT EXISTS "statsVersion" BIGINT DEFAULT 0;
+
+-- Any update that touches games[] marks the player dirty
+-- (recalculate-stats upserts only the totals, so it does not re-mark;
+--  no INSERT trigger - it would also rewrite the proposed row of an upsert)
+CREATE OR REPLACE FUNCTION public.mark_player_stats_dirty()
+RETURNS TRIGGER AS $$
+BEGIN
+  NEW."statsDirty" := TRUE;
+  NEW."statsVersion" := COALESCE(OLD."statsVersion", 0) + 1;
+  RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_players_stats_dirty ON public.players;
+CREATE TRIGGER trg_players_stats_dirty
+  BEFORE UPDATE OF games ON public.players
+  FOR EACH ROW
+  EXECUTE FUNCTION public.mark_player_stats_dirty();
+
+-- Compare-and-clear: p_players = [{ "id": ..., "version": ... }] as read before the recompute.
+-- A player whose games[] changed in the meantime keeps "statsDirty" = TRUE for the next run.
+CREATE OR REPLACE FUNCTION public.clear_player_stats_dirty(p_players JSONB)
+RETURNS INTEGER AS $$
+DECLARE
+  cleared INTEGER;
+BEGIN
+  UPDATE public.players AS p
+  SET "statsDirty" = FALSE
+  FROM jsonb_to_recordset(p_players) AS r(id TEXT, version BIGINT)
+  WHERE p.id = r.id
+    AND COALESCE(p."statsVersion", 0) = r.version;
+  GET DIAGNOSTICS cleared = ROW_COUNT;
+  RETURN cleared;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Partial index - the incremental run only reads dirty rows
+CREATE INDEX IF NOT EXISTS idx_players_stats_dirty
+  ON public.players("statsDirty")
+  WHERE "statsDirty" = TRUE;
@@ -0,0 +1,195 @@
+-- ========================================
+-- Materialized team aggregates for game prep (loadTeamAverages)
+-- Run this in Supabase SQL Editor
+-- ========================================
+
+-- One row per (game, team): the team's totals in that game + the opponent's points
+-- save-game / delete-game replace a game's rows and refresh only the teams involved
+CREATE TABLE IF NOT EXISTS public.team_game_totals (
+  "gameSerial" INTEGER NOT NULL,
+  team TEXT NOT NULL,
+  "isHome" BOOLEAN,              -- teams[0] = home, teams[1] = away, NULL = not in games.teams
+  points NUMERIC DEFAULT 0,
+  "opponentPoints" NUMERIC DEFAULT 0,
+  rebounds NUMERIC DEFAULT 0,
+  assists NUMERIC DEFAULT 0,
+  steals NUMERIC DEFAULT 0,
+  blocks NUMERIC DEFAULT 0,
+  turnovers NUMERIC DEFAULT 0,
+  fouls NUMERIC DEFAULT 0,
+  fgm NUMERIC DEFAULT 0,
+  fga NUMERIC DEFAULT 0,
+  tpm NUMERIC DEFAULT 0,
+  tpa NUMERIC DEFAULT 0,
+  ftm NUMERIC DEFAULT 0,
+  fta NUMERIC DEFAULT 0,
+  efficiency NUMERIC DEFAULT 0,
+  PRIMARY KEY ("gameSerial", team)
+);
+
+CREATE INDEX IF NOT EXISTS idx_team_game_totals_team ON public.team_game_totals(team);
+
+-- One row per team: season totals + home/away records (what game prep reads)
+CREATE TABLE IF NOT EXISTS public.team_aggregates (
+  team TEXT PRIMARY KEY,
+  games INTEGER DEFAULT 0,
+  points NUMERIC DEFAULT 0,
+  rebounds NUMERIC DEFAULT 0,
+  assists NUMERIC DEFAULT 0,
+  steals NUMERIC DEFAULT 0,
+  blocks NUMERIC DEFAULT 0,
+  turnovers NUMERIC DEFAULT 0,
+  fouls NUMERIC DEFAULT 0,
+  fgm NUMERIC DEFAULT 0,
+  fga NUMERIC DEFAULT 0,
+  tpm NUMERIC DEFAULT 0,
+  tpa NUMERIC DEFAULT 0,
+  ftm NUMERIC DEFAULT 0,
+  fta NUMERIC DEFAULT 0,
+  efficiency NUMERIC DEFAULT 0,
+  "homeWins" INTEGER DEFAULT 0,
+  "homeLosses" INTEGER DEFAULT 0,
+  "awayWins" INTEGER DEFAULT 0,
+  "awayLosses" INTEGER DEFAULT 0,
+  "homeWinMarginSum" NUMERIC DEFAULT 0,
+  "homeLossMarginSum" NUMERIC DEFAULT 0,
+  "awayWinMarginSum" NUMERIC DEFAULT 0,
+  "awayLossMarginSum" NUMERIC DEFAULT 0,
+  "updatedAt" TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+ALTER TABLE public.team_game_totals ENABLE ROW LEVEL SECURITY;
+ALTER TABLE public.team_aggregates ENABLE ROW LEVEL SECURITY;
+
+DROP POLICY IF EXISTS "Public read team_game_totals" ON public.team_game_totals;
+DROP POLICY IF EXISTS "Public read team_aggregates" ON public.team_aggregates;
+CREATE POLICY "Public read team_game_totals" ON public.team_game_totals FOR SELECT USING (true);
+CREATE POLICY "Public read team_aggregates" ON public.team_aggregates FOR SELECT USING (true);
+-- Writes only through the functions below (called by Edge Functions with the service role key)
+
+-- Recompute team_aggregates rows for the given teams from their team_game_totals rows
+CREATE OR REPLACE FUNCTION public.refresh_team_aggregates(p_teams TEXT[])
+RETURNS VOID AS $$
+BEGIN
+  DELETE FROM public.team_aggregates WHERE team = ANY(p_teams);
+
+  INSERT INTO public.team_aggregates (
+    team, games, points, rebounds, assists, steals, blocks, turnovers, fouls,
+    fgm, fga, tpm, tpa, ftm, fta, efficiency,
+    "homeWins", "homeLosses", "awayWins", "awayLosses",
+    "homeWinMarginSum", "homeLossMarginSum", "awayWinMarginSum", "awayLossMarginSum"
+  )
+  SELECT
+    team, COUNT(*), SUM(points), SUM(rebounds), SUM(assists), SUM(steals), SUM(blocks), SUM(turnovers), SUM(fouls),
+    SUM(fgm), SUM(fga), SUM(tpm), SUM(tpa), SUM(ftm), SUM(fta), SUM(efficiency),
+    COUNT(*) FILTER (WHERE "isHome" AND points > "opponentPoints"),
+    COUNT(*) FILTER (WHERE "isHome" AND points < "opponentPoints"),
+    COUNT(*) FILTER (WHERE NOT "isHome" AND points > "opponentPoints"),
+    COUNT(*) FILTER (WHERE NOT "isHome" AND points < "opponentPoints"),
+    COALESCE(SUM(points - "opponentPoints") FILTER (WHERE "isHome" AND points > "opponentPoints"), 0),
+    COALESCE(SUM("opponentPoints" - points) FILTER (WHERE "isHome" AND points < "opponentPoints"), 0),
+    COALESCE(SUM(points - "opponentPoints") FILTER (WHERE NOT "isHome" AND points > "opponentPoints"), 0),
+    COALESCE(SUM("opponentPoints" - points) FILTER (WHERE NOT "isHome" AND points < "opponentPoints"), 0)
+  FROM public.team_game_totals
+  WHERE team = ANY(p_teams)
+  GROUP BY team;
+END;
+$$ LANGUAGE plpgsql;
+
+-- save-game: replace one game's rows (p_rows = JSON array of team_game_totals rows) and refresh its teams
+-- (teams that were in the old version of the game are refreshed too, in case a team was renamed)
+CREATE OR REPLACE FUNCTION public.apply_team_game_totals(p_game_serial INTEGER, p_rows JSONB)
+RETURNS VOID AS $$
+DECLARE
+  affected TEXT[];
+BEGIN
+  SELECT COALESCE(array_agg(team), '{}') INTO affected
+  FROM public.team_game_totals WHERE "gameSerial" = p_game_serial;
+
+  DELETE FROM public.team_game_totals WHERE "gameSerial" = p_game_serial;
+
+  INSERT INTO public.team_game_totals
+  SELECT * FROM jsonb_populate_recordset(NULL::public.team_game_totals, p_rows)
+  WHERE "gameSerial" = p_game_serial;
+
+  SELECT affected || COALESCE(array_agg(row->>'team'), '{}') INTO affected
+  FROM jsonb_array_elements(p_rows) AS row;
+
+  PERFORM public.refresh_team_aggregates(affected);
+END;
+$$ LANGUAGE plpgsql;
+
+-- delete-game: remove one game's rows and refresh its teams
+CREATE OR REPLACE FUNCTION public.remove_team_game_totals(p_game_serial INTEGER)
+RETURNS VOID AS $$
+DECLARE
+  affected TEXT[];
+BEGIN
+  SELECT COALESCE(array_agg(team), '{}') INTO affected
+  FROM public.team_game_totals WHERE "gameSerial" = p_game_serial;
+
+  DELETE FROM public.team_game_totals WHERE "gameSerial" = p_game_serial;
+
+  PERFORM public.refresh_team_aggregates(affected);
+END;
+$$ LANGUAGE plpgsql;
+
+-- Full recompute from players.games (initial backfill, or repair after a failed consistency check)
+-- Same rules as getTeamsAggregate + calculateHomeAwayStats: team score = sum of its players' points
+CREATE OR REPLACE FUNCTION public.rebuild_team_aggregates()
+RETURNS INTEGER AS $$
+DECLARE
+  team_count INTEGER;
+BEGIN
+  DELETE FROM public.team_game_totals;
+
+  INSERT INTO public.team_game_totals (
+    "gameSerial", team, "isHome", points, "opponentPoints", rebounds, assists, steals, blocks, turnovers, fouls,
+    fgm, fga, tpm, tpa, ftm, fta, efficiency
+  )
+  WITH lines AS (
+    SELECT (g->>'gameId')::INTEGER AS game_serial, g->>'team' AS team, g
+    FROM public.players p, unnest(p.games) AS g
+    WHERE g->>'gameId' ~ '^[0-9]+$' AND COALESCE(g->>'team', '') <> ''
+  ),
+  per_team AS (
+    SELECT
+      game_serial, team,
+      SUM(COALESCE(NULLIF(g->>'points', '')::NUMERIC, 0)) AS points,
+      SUM(COALESCE(NULLIF(g->>'rebounds', '')::NUMERIC, 0)) AS rebounds,
+      SUM(COALESCE(NULLIF(g->>'assists', '')::NUMERIC, 0)) AS assists,
+      SUM(COALESCE(NULLIF(g->>'steals', '')::NUMERIC, 0)) AS steals,
+      SUM(COALESCE(NULLIF(g->>'blocks', '')::NUMERIC, 0)) AS blocks,
+      SUM(COALESCE(NULLIF(g->>'turnovers', '')::NUMERIC, 0)) AS turnovers,
+      SUM(COALESCE(NULLIF(g->>'fouls', '')::NUMERIC, 0)) AS fouls,
+      SUM(COALESCE(NULLIF(g->>'fieldGoalsMade', '')::NUMERIC, 0)) AS fgm,
+      SUM(COALESCE(NULLIF(g->>'fieldGoalsAttempted', '')::NUMERIC, 0)) AS fga,
+      SUM(COALESCE(NULLIF(g->>'threePointsMade', '')::NUMERIC, 0)) AS tpm,
+      SUM(COALESCE(NULLIF(g->>'threePointsAttempted', '')::NUMERIC, 0)) AS tpa,
+      SUM(COALESCE(NULLIF(g->>'freeThrowsMade', '')::NUMERIC, 0)) AS ftm,
+      SUM(COALESCE(NULLIF(g->>'freeThrowsAttempted', '')::NUMERIC, 0)) AS fta,
+      SUM(COALESCE(NULLIF(g->>'efficiency', '')::NUMERIC, 0)) AS efficiency
+    FROM lines
+    GROUP BY game_serial, team
+  )
+  SELECT
+    t.game_serial, t.team,
+    CASE array_position(gm.teams, t.team) WHEN 1 THEN TRUE WHEN 2 THEN FALSE END,
+    t.points, COALESCE(o.points, 0), t.rebounds, t.assists, t.steals, t.blocks, t.turnovers, t.fouls,
+    t.fgm, t.fga, t.tpm, t.tpa, t.ftm, t.fta, t.efficiency
+  FROM per_team t
+  LEFT JOIN public.games gm ON gm."gameSerial" = t.game_serial
+  LEFT JOIN per_team o
+    ON o.game_serial = t.game_serial
+   AND o.team = gm.teams[3 - array_position(gm.teams, t.team)];
+
+  DELETE FROM public.team_aggregates;
+  PERFORM public.refresh_team_aggregates(ARRAY(SELECT DISTINCT team FROM public.team_game_totals));
+
+  SELECT COUNT(*) INTO team_count FROM public.team_aggregates;
+  RETURN team_count;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Initial backfill
+SELECT public.rebuild_team_aggregates();
@@ -1,74 +1,309 @@
 /**
  * Vercel Serverless Function - CORS Proxy
  * פותר בעיות CORS על ידי העברת הבקשות דרך השרת שלנו
+ *
+ * שכבת upstream עם מטמון:
+ * - מטמון LRU בזיכרון התהליך (לכל instance חם של הפונקציה), TTL לפי סוג ה-URL
+ * - בקשות זהות שרצות במקביל מתאחדות לקריאה אחת ל-ibasketball.co.il
+ * - רענון עם ETag / If-None-Match (גם מול ה-upstream וגם מול הלקוח)
+ * - stale-if-error רק לשגיאת רשת / 5xx / 429 - תשובת 4xx מועברת ללקוח כמו שהיא
+ * - מעביר JSON ו-HTML כמו שהם (דפי טבלה ושחקנים)
+ * - מונים: GET /api/proxy?stats=1
  */
 
+import { createHash } from 'node:crypto';
+
+const MINUTE = 60 * 1000;
+const HOUR = 60 * MINUTE;
+
+// TTL לפי סוג URL - משחק שהסתיים לא משתנה, רשימות חודש וטבלה מתעדכנות כל הזמן
+const URL_CLASSES = [
+  { name: 'event', pattern: /\/wp-json\/(sportspress\/v2|wp\/v2)\/events\/\d+\/?$/, ttlMs: MINUTE, finishedTtlMs: 7 * 24 * HOUR },
+  { name: 'events', pattern: /\/wp-json\/sportspress\/v2\/events\/?$/, ttlMs: MINUTE },
+  { name: 'players', pattern: /\/wp-json\/sportspress\/v2\/players/, ttlMs: HOUR },
+  { name: 'standings', pattern: /^\/leagues?\//, ttlMs: 5 * MINUTE },
+  { name: 'player-page', pattern: /^\/player\//, ttlMs: HOUR },
+  { name: 'default', pattern: /.*/, ttlMs: MINUTE }
+];
+
+const MAX_ENTRIES = 500;
+const MAX_BYTES = 50 * 1024 * 1024;
+
+/**
+ * מטמון LRU פשוט על Map (סדר הכנסה = סדר שימוש)
+ */
+export class LRUCache {
+  constructor({ maxEntries = MAX_ENTRIES, maxBytes = MAX_BYTES } = {}) {
+    this.maxEntries = maxEntries;
+    this.maxBytes = maxBytes;
+    this.entries = new Map();
+    this.bytes = 0;
+    this.evictions = 0;
+  }
+
+  get(key) {
+    const entry = this.entries.get(key);
+    if (!entry) return null;
+
+    // שימוש מעביר לסוף (הכי חדש)
+    this.entries.delete(key);
+    this.entries.set(key, entry);
+    return entry;
+  }
+
+  set(key, entry) {
+    this.delete(key);
+    if (entry.size > this.maxBytes) return;
+
+    this.entries.set(key, entry);
+    this.bytes += entry.size;
+
+    while (this.entries.size > this.maxEntries || this.bytes > this.maxBytes) {
+      const oldestKey = this.entries.keys().next().value;
+      this.delete(oldestKey);
+      this.evictions++;
+    }
+  }
+
+  delete(key) {
+    const entry = this.entries.get(key);
+    if (!entry) return;
+    this.entries.delete(key);
+    this.bytes -= entry.size;
+  }
+
+  clear() {
+    this.entries.clear();
+    this.bytes = 0;
+  }
+
+  get size() {
+    return this.entries.size;
+  }
+}
+
+const cache = new LRUCache();
+const inFlight = new Map();
+const stats = {
+  hits: 0,
+  misses: 0,
+  coalesced: 0,
+  revalidated: 0,      // 304 מה-upstream - רשומה קיימת חודשה
+  staleServed: 0,      // ה-upstream נכשל והוגשה רשומה ישנה
+  notModified: 0,      // 304 ללקוח (If-None-Match)
+  upstreamRequests: 0,
+  upstreamErrors: 0
+};
+
+export function getProxyStats() {
+  return {
+    ...stats,
+    entries: cache.size,
+    bytes: cache.bytes,
+    evictions: cache.evictions,
+    inFlight: inFlight.size
+  };
+}
+
+export function resetProxyCache() {
+  cache.clear();
+  cache.evictions = 0;
+  inFlight.clear();
+  Object.keys(stats).forEach(key => { stats[key] = 0; });
+}
+
+export function classifyUrl(targetUrl) {
+  return URL_CLASSES.find(urlClass => urlClass.pattern.test(targetUrl.pathname));
+}
+
+/**
+ * משחק שהסתיים = יש לו performance (סטטיסטיקות) - לא ישתנה יותר
+ */
+function isFinishedEvent(body) {
+  try {
+    const event = JSON.parse(body);
+    return !!event?.performance && typeof event.performance === 'object' && Object.keys(event.performance).length > 0;
+  } catch (e) {
+    return false;
+  }
+}
+
+function getTtl(urlClass, entry) {
+  if (urlClass.finishedTtlMs && entry.contentType.includes('json') && isFinishedEvent(entry.body)) {
+    return urlClass.finishedTtlMs;
+  }
+  return urlClass.ttlMs;
+}
+
+/**
+ * האם מותר להגיש רשומה ישנה במקום השגיאה: שגיאת רשת (אין status), 5xx או 429.
+ * 4xx אחר (404 למשחק שנמחק וכו') הוא תשובה אמיתית של ה-upstream ולא תקלה.
+ */
+function isStaleEligible(error) {
+  return !error.status || error.status >= 500 || error.status === 429;
+}
+
+function computeEtag(body) {
+  return `W/"${createHash('sha1').update(body).digest('base64').slice(0, 27)}"`;
+}
+
+/**
+ * קריאה ל-upstream (עם If-None-Match / If-Modified-Since אם יש רשומה ישנה)
+ * @returns {Promise<Object>} { entry, revalidated } - entry: { body, contentType, etag, upstreamEtag, lastModified, expiresAt, size }
+ */
+async function fetchUpstream(url, urlClass, staleEntry) {
+  const headers = {
+    'User-Agent': 'Basketball-Stats-Manager/1.0',
+    'Accept': 'application/json, text/html;q=0.9, */*;q=0.8'
+  };
+  if (staleEntry?.upstreamEtag) headers['If-None-Match'] = staleEntry.upstreamEtag;
+  if (staleEntry?.lastModified) headers['If-Modified-Since'] = staleEntry.lastModified;
+
+  stats.upstreamRequests++;
+  const response = await fetch(url, { headers });
+
+  if (response.status === 304 && staleEntry) {
+    stats.revalidated++;
+    return { entry: { ...staleEntry, expiresAt: Date.now() + getTtl(urlClass, staleEntry) }, revalidated: true };
+  }
+
+  if (!response.ok) {
+    const error = new Error(`Upstream error: ${response.status}`);
+    error.status = response.status;
+    throw error;
+  }
+
+  const body = await response.text();
+  const entry = {
+    body,
+    contentType: response.headers.get('content-type') || 'application/json; charset=utf-8',
+    upstreamEtag: response.headers.get('etag'),
+    lastModified: response.headers.get('last-modified'),
+    etag: computeEtag(body),
+    size: Buffer.byteLength(body)
+  };
+  entry.expiresAt = Date.now() + getTtl(urlClass, entry);
+  return { entry, revalidated: false };
+}
+
+/**
+ * רשומה למפתח: מהמטמון אם טרייה, אחרת קריאה אחת משותפת לכל הבקשות הממתינות
+ * @returns {Promise<{ entry, cacheStatus }>}
+ */
+export async function getEntry(url, urlClass) {
+  const cached = cache.get(url);
+  if (cached && cached.expiresAt > Date.now()) {
+    stats.hits++;
+    return { entry: cached, cacheStatus: 'HIT' };
+  }
+
+  let request = inFlight.get(url);
+  const coalesced = !!request;
+
+  if (coalesced) {
+    stats.coalesced++;
+  } else {
+    stats.misses++;
+    request = fetchUpstream(url, urlClass, cached)
+      .then(result => {
+        cache.set(url, result.entry);
+        return result;
+      })
+      .finally(() => inFlight.delete(url));
+    inFlight.set(url, request);
+  }
+
+  try {
+    const { entry, revalidated } = await request;
+    const cacheStatus = coalesced ? 'COALESCED' : (revalidated ? 'REVALIDATED' : 'MISS');
+    return { entry, cacheStatus };
+  } catch (error) {
+    if (!coalesced) stats.upstreamErrors++;
+    if (cached && isStaleEligible(error)) {
+      // stale-if-error - עדיף נתון ישן מכישלון
+      stats.staleServed++;
+      return { entry: cached, cacheStatus: 'STALE' };
+    }
+    // 4xx - הרשומה כבר לא נכונה
+    if (cached && error.status) cache.delete(url);
+    throw error;
+  }
+}
+
 export default async function handler(req, res) {
   // CORS headers
   res.setHeader('Access-Control-Allow-Origin', '*');
   res.setHeader('Access-Control-Allow-Methods', 'GET, OPTIONS');
-  res.setHeader('Access-Control-Allow-Headers', 'Content-Type');
-  
+  res.setHeader('Access-Control-Allow-Headers', 'Content-Type, If-None-Match');
+  res.setHeader('Access-Control-Expose-Headers', 'ETag, X-Proxy-Cache');
+
   // Handle preflight
   if (req.method === 'OPTIONS') {
     return res.status(200).end();
   }
-  
+
   // Only allow GET requests
   if (req.method !== 'GET') {
     return res.status(405).json({ error: 'Method not allowed' });
   }
-  
+
+  // מונים של המטמון (לכל instance)
+  if (req.query.stats !== undefined) {
+    res.setHeader('Cache-Control', 'no-store');
+    return res.status(200).json(getProxyStats());
+  }
+
   // Get target URL from query parameter
   const { url } = req.query;
-  
+
   if (!url) {
     return res.status(400).json({ error: 'Missing url parameter' });
   }
-  
+
   // Validate URL - only allow ibasketball.co.il
+  let targetUrl;
   try {
-    const targetUrl = new URL(url);
+    targetUrl = new URL(url);
     if (!targetUrl.hostname.endsWith('ibasketball.co.il')) {
       return res.status(403).json({ error: 'Only ibasketball.co.il URLs are allowed' });
     }
   } catch (e) {
     return res.status(400).json({ error: 'Invalid URL' });
   }
-  
+
   try {
-    console.log(`🔄 Proxying request to: ${url}`);
-    
-    const response = await fetch(url, {
-      headers: {
-        'User-Agent': 'Basketball-Stats-Manager/1.0',
-        'Accept': 'application/json',
-      },
-    });
-    
-    if (!response.ok) {
-      console.error(`❌ Upstream error: ${response.status}`);
-      return res.status(response.status).json({ 
-        error: `Upstream error: ${response.status}`,
+    const urlClass = classifyUrl(targetUrl);
+    const { entry, cacheStatus } = await getEntry(targetUrl.href, urlClass);
+
+    console.log(`${cacheStatus === 'MISS' ? '🔄' : '⚡'} Proxy ${cacheStatus} (${urlClass.name}): ${url}`);
+
+    const maxAge = Math.max(0, Math.round((entry.expiresAt - Date.now()) / 1000));
+    res.setHeader('Cache-Control', `s-maxage=${maxAge}, stale-while-revalidate`);
+    res.setHeader('ETag', entry.etag);
+    res.setHeader('X-Proxy-Cache', cacheStatus);
+
+    // הלקוח כבר מחזיק את הגרסה הזו
+    if (req.headers?.['if-none-match'] === entry.etag) {
+      stats.notModified++;
+      return res.status(304).end();
+    }
+
+    res.setHeader('Content-Type', entry.contentType);
+    return res.status(200).send(entry.body);
+
+  } catch (error) {
+    if (error.status) {
+      console.error(`❌ Upstream error: ${error.status}`);
+      return res.status(error.status).json({
+        error: `Upstream error: ${error.status}`,
         url: url
       });
     }
-    
-    const data = await response.json();
-    
-    console.log(`✅ Successfully proxied ${Array.isArray(data) ? data.length : 1} items`);
-    
-    // Cache for 1 minute
-    res.setHeader('Cache-Control', 's-maxage=60, stale-while-revalidate');
-    
-    return res.status(200).json(data);
-    
-  } catch (error) {
+
     console.error('❌ Proxy error:', error.message);
-    return res.status(500).json({ 
-      error: 'Proxy error', 
-      message: error.message 
+    return res.status(500).json({
+      error: 'Proxy error',
+      message: error.message
     });
   }
 }
-
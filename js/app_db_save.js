@@ -671,6 +671,7 @@ ${suspectedDuplicates}
             req.onerror = () => reject(req.error);
           });
         }
+        window.dbAdapter?.notifyWrite?.('players');
         
         showOk(`המיגרציה הושלמה בהצלחה! ${migratedCount} שחקנים עודכנו, ${mergedCount} שחקנים מוזגו, ${skippedCount} שחקנים ריקים הוסרו.`);
         
@@ -707,6 +708,8 @@ ${suspectedDuplicates}
           });
           console.log(`טבלת ${storeName} נמחקה`);
         }
+        window.dbAdapter?.notifyWrite?.('players');
+        window.dbAdapter?.notifyWrite?.('teams');
         
         console.log('ניקוי מלא הושלם! המשחקים נשמרו לטעינה מחדש.');
         showOk('ניקוי מלא הושלם!<br>כל הסטטיסטיקות נמחקו (חוץ ממשחקים).<br>עכשיו לחץ על "טעינה מחדש של שחקנים וקבוצות" כדי לשחזר את הנתונים.');
@@ -728,6 +731,47 @@ ${suspectedDuplicates}
       }
     }
 
+    // תיקון קידוד עברית (CP-1252 ↔ UTF-8) בכל המסד - קבוצות, שחקנים ומשחקים (cp1252Utf8Repair.js)
+    async function repairHebrewEncodingInDatabase() {
+      if (!(DB_AVAILABLE && DB)) {
+        showError('מסד הנתונים לא זמין');
+        return;
+      }
+      if (typeof window.repairDatabaseHebrew !== 'function') {
+        showError('מודול תיקון הקידוד (cp1252Utf8Repair.js) לא נטען');
+        return;
+      }
+
+      try {
+        // סריקה בלי כתיבה קודם - המשתמש רואה כמה רשומות ישתנו לפני האישור
+        const preview = await window.repairDatabaseHebrew(DB, { dryRun: true });
+        const total = Object.values(preview.stores).reduce((sum, store) => sum + store.changedRecords, 0);
+        if (total === 0) {
+          showOk('לא נמצאו טקסטים עם קידוד שבור');
+          return;
+        }
+
+        const summary = Object.entries(preview.stores).map(([store, s]) => `${store}: ${s.changedRecords}`).join(', ');
+        if (!confirm(`נמצאו ${total} רשומות עם קידוד שבור (${summary}). לתקן?`)) {
+          return;
+        }
+
+        const report = await window.repairDatabaseHebrew(DB, {
+          onProgress: ({ store, scanned }) => showOk(`מתקן ${store}: ${scanned} רשומות נסרקו...`)
+        });
+        console.log('🔤 Hebrew repair report:', report);
+        showOk(`תיקון הקידוד הושלם: ${Object.entries(report.stores).map(([store, s]) => `${store} ${s.changedRecords}/${s.scanned}`).join(', ')} (${report.durationMs}ms)`);
+
+        await loadTeamsIndex();
+        if (!$("view-players").classList.contains("hidden")) {
+          renderPlayersTable();
+        }
+      } catch (error) {
+        console.error('Error repairing Hebrew encoding:', error);
+        showError('שגיאה בתיקון הקידוד: ' + (error?.message || error));
+      }
+    }
+
     // רענון חישוב סטטיסטיקות שחקנים
     async function recalculatePlayerStats() {
       if (!(DB_AVAILABLE && DB)) {
@@ -818,6 +862,7 @@ ${suspectedDuplicates}
             };
           };
         });
+        window.dbAdapter?.notifyWrite?.('players');
 
         console.log(`רענון חישוב הושלם: ${processedCount} שחקנים נבדקו, ${updatedCount} עודכנו, ${skippedCount} דולגו`);
         showOk(`רענון חישוב סטטיסטיקות הושלם!<br>כל השחקנים נמחקו.<br>עכשיו שמור מחדש את כל המשחקים שלך כדי ליצור סטטיסטיקות מדויקות.`);
@@ -833,13 +878,48 @@ ${suspectedDuplicates}
       }
     }
 
-    // ייצוא מסד נתונים מלא
+    // הורדת Blob כקובץ
+    function downloadBlob(blob, fileName) {
+      const url = URL.createObjectURL(blob);
+      const a = document.createElement("a");
+      a.style.display = "none";
+      a.href = url;
+      a.download = fileName;
+      document.body.appendChild(a);
+      a.click();
+      window.setTimeout(() => {
+        document.body.removeChild(a);
+        window.URL.revokeObjectURL(url);
+      }, 100);
+    }
+
+    // ייצוא מסד נתונים מלא - NDJSON דחוס (db_backup_stream.js), מנה אחרי מנה
     async function exportFullDatabase() {
       if(!(DB_AVAILABLE && DB)) { 
         showError("מסד נתונים אינו זמין");
         return;
       }
       
+      if (!window.DBBackupStream) {
+        return exportFullDatabaseJson();
+      }
+      
+      try {
+        const { blob, counts, extension } = await window.DBBackupStream.exportDatabase(DB, {
+          meta: { version: (typeof REQUIRED_DB_VERSION !== "undefined" ? REQUIRED_DB_VERSION : 1) },
+          onProgress: ({ store, rows }) => showOk(`מגבה ${store}: ${rows} רשומות...`)
+        });
+        
+        downloadBlob(blob, `basketball_db_backup_${new Date().toISOString().slice(0, 10)}.${extension}`);
+        
+        showOk(`גיבוי מסד הנתונים הסתיים: ${counts.teams || 0} קבוצות, ${counts.players || 0} שחקנים, ${counts.games || 0} משחקים (${(blob.size / 1024).toFixed(0)}KB)`);
+      } catch(err) {
+        showError(`שגיאה בגיבוי מסד הנתונים: ${err.message}`);
+      }
+    }
+    
+    // ייצוא בפורמט JSON הישן (כשמודול הגיבוי הזורם לא נטען)
+    async function exportFullDatabaseJson() {
       try {
         const backup = {
           teams: [],
@@ -890,19 +970,9 @@ ${suspectedDuplicates}
         });
         
         // Create download file
-        const dataStr = JSON.stringify(backup, null, 2);
+        const dataStr = JSON.stringify(backup);
         const blob = new Blob([dataStr], { type: "application/json" });
-        const url = URL.createObjectURL(blob);
-        const a = document.createElement("a");
-        a.style.display = "none";
-        a.href = url;
-        a.download = `basketball_db_backup_${new Date().toISOString().slice(0, 10)}.json`;
-        document.body.appendChild(a);
-        a.click();
-        window.setTimeout(() => {
-          document.body.removeChild(a);
-          window.URL.revokeObjectURL(url);
-        }, 100);
+        downloadBlob(blob, `basketball_db_backup_${new Date().toISOString().slice(0, 10)}.json`);
         
         showOk(`גיבוי מסד הנתונים הסתיים: ${backup.teams.length} קבוצות, ${backup.players.length} שחקנים, ${backup.games.length} משחקים`);
       } catch(err) {
@@ -921,6 +991,55 @@ ${suspectedDuplicates}
         return;
       }
       
+      if (!window.DBBackupStream) {
+        return importFullDatabaseJson(file);
+      }
+      
+      try {
+        // NDJSON / NDJSON.gz נקראים בזרימה; קבצי JSON ישנים נקראים במלואם ונכתבים באותן מנות
+        const result = await window.DBBackupStream.importDatabase(DB, file, {
+          onProgress: ({ stage, store, rows, bytesRead, totalBytes }) => {
+            const percent = totalBytes ? Math.min(100, Math.round((bytesRead / totalBytes) * 100)) : 0;
+            showOk(`${stage === 'verify' ? 'בודק את קובץ הגיבוי' : 'משחזר'} ${store}: ${rows} רשומות (${percent}%)...`);
+          }
+        });
+        
+        if (result.failed > 0) {
+          console.warn(`⚠️ ${result.failed} רשומות לא שוחזרו (מפתח כפול או רשומה לא תקינה)`);
+        }
+        
+        await reloadAfterRestore(result.written);
+      } catch(err) {
+        if (err.code !== 'INVALID_BACKUP') {
+          // השחזור נכשל באמצע הכתיבה - ה-stores כבר השתנו
+          notifyRestoreWrites();
+        }
+        showError(err.code === 'INVALID_BACKUP' ? err.message : `שגיאה בשחזור מסד הנתונים: ${err.message}`);
+      }
+    }
+    
+    // השחזור כתב ישירות ל-IndexedDB - מטמון השחקנים/הקבוצות של dbAdapter לא יודע על כך
+    function notifyRestoreWrites() {
+      window.dbAdapter?.notifyWrite?.('players');
+      window.dbAdapter?.notifyWrite?.('teams');
+    }
+    
+    // רענון אינדקסים ותצוגה אחרי שחזור
+    async function reloadAfterRestore(counts) {
+      notifyRestoreWrites();
+      await loadTeamsIndex();
+      await setNextGameSerialToUI();
+      showOk(`שחזור מסד הנתונים הסתיים: ${counts.teams || 0} קבוצות, ${counts.players || 0} שחקנים, ${counts.games || 0} משחקים`);
+      
+      // Reload current view
+      const currentView = document.querySelector('#tabs .tab.active');
+      if(currentView) {
+        switchTab(currentView.dataset.tab);
+      }
+    }
+    
+    // שחזור מקובץ JSON ישן (כשמודול הגיבוי הזורם לא נטען)
+    async function importFullDatabaseJson(file) {
       try {
         const text = await new Promise((resolve, reject) => {
           const reader = new FileReader();
@@ -979,15 +1098,7 @@ ${suspectedDuplicates}
         }
         
         // Reload indices and UI
-        await loadTeamsIndex();
-        await setNextGameSerialToUI();
-        showOk(`שחזור מסד הנתונים הסתיים: ${backup.teams.length} קבוצות, ${backup.players.length} שחקנים, ${backup.games.length} משחקים`);
-        
-        // Reload current view
-        const currentView = document.querySelector('#tabs .tab.active');
-        if(currentView) {
-          switchTab(currentView.dataset.tab);
-        }
+        await reloadAfterRestore({ teams: backup.teams.length, players: backup.players.length, games: backup.games.length });
       } catch(err) {
         showError(`שגיאה בשחזור מסד הנתונים: ${err.message}`);
       }
@@ -1595,422 +1706,370 @@ ${suspectedDuplicates}
     let currentPlayersSortField = null; // Track active sort field
     let currentPlayersSortDirection = 'desc'; // Track sort direction
 
-    async function renderPlayersTable(sortField = null, sortDirection = 'desc'){
-      // Store in global state for preservation
-      if (sortField !== null) {
-        currentPlayersSortField = sortField;
-        currentPlayersSortDirection = sortDirection;
-      }
-      
-      // Use stored values if none provided
-      sortField = sortField || currentPlayersSortField;
-      sortDirection = sortDirection || currentPlayersSortDirection;
-      // 🔥 Guard: If already rendering, skip this call
-      if (isRenderingPlayers) {
-        console.log('⏭️ Skipping renderPlayersTable - already in progress');
-        return;
+    // גוף וירטואלי שמוחלף בהודעת "אין שורות" - מנתקים את מאזיני הגלילה שלו,
+    // אחרת הגלילה הבאה מציירת את השורות הישנות מעל ההודעה
+    function releaseTableBody(body) {
+      if (body) body.destroy();
+      return null;
+    }
+    
+    // ===== Players table view model =====
+    // TableViewModel / VirtualTableBody - js/table_view_model.js, נטען לפני הקובץ הזה
+    // (ב-index.ALL-IN-ONE.html מוטמע בבלוק שלפניו)
+    // השחקנים נשלפים פעם אחת (reload); מיון, סינון והחלפת תצוגה רצים על השורות השמורות
+    // וסטטיסטיקות כל שחקן מחושבות פעם אחת לכל טעינה
+    
+    // [שדה במשחק, שם הסכום]
+    const PLAYER_SUM_FIELDS = [
+      ['points', 'totalPoints'],
+      ['rebounds', 'totalRebounds'],
+      ['assists', 'totalAssists'],
+      ['steals', 'totalSteals'],
+      ['blocks', 'totalBlocks'],
+      ['turnovers', 'totalTurnovers'],
+      ['fouls', 'totalFouls'],
+      ['foulsOn', 'totalFoulsDrawn'],
+      ['efficiency', 'totalEfficiency'],
+      ['fieldGoalsMade', 'totalFGM'],
+      ['fieldGoalsAttempted', 'totalFGA'],
+      ['threePointsMade', 'total3PM'],
+      ['threePointsAttempted', 'total3PA'],
+      ['freeThrowsMade', 'totalFTM'],
+      ['freeThrowsAttempted', 'totalFTA']
+    ];
+    
+    function sumPlayerGames(games) {
+      const sums = {};
+      for (const [, total] of PLAYER_SUM_FIELDS) sums[total] = 0;
+      for (const g of games) {
+        for (const [field, total] of PLAYER_SUM_FIELDS) {
+          sums[total] += g[field] || 0;
+        }
       }
+      return sums;
+    }
+    
+    function addPlayerSums(a, b) {
+      const sums = {};
+      for (const [, total] of PLAYER_SUM_FIELDS) sums[total] = a[total] + b[total];
+      return sums;
+    }
+    
+    // Stats are stored as NUMBERS for proper sorting (formatted only when rendered)
+    function playerStatsFromSums(sums, totalGames) {
+      const avg = total => totalGames ? total / totalGames : 0;
+      return {
+        totalPoints: sums.totalPoints,
+        totalRebounds: sums.totalRebounds,
+        totalAssists: sums.totalAssists,
+        totalSteals: sums.totalSteals,
+        totalBlocks: sums.totalBlocks,
+        totalTurnovers: sums.totalTurnovers,
+        totalFouls: sums.totalFouls,
+        totalFoulsDrawn: sums.totalFoulsDrawn,
+        totalEfficiency: sums.totalEfficiency,
+        fgPercentage: sums.totalFGA > 0 ? (sums.totalFGM / sums.totalFGA) * 100 : 0,
+        threePointPercentage: sums.total3PA > 0 ? (sums.total3PM / sums.total3PA) * 100 : 0,
+        ftPercentage: sums.totalFTA > 0 ? (sums.totalFTM / sums.totalFTA) * 100 : 0,
+        avgPoints: avg(sums.totalPoints),
+        avgRebounds: avg(sums.totalRebounds),
+        avgAssists: avg(sums.totalAssists),
+        avgSteals: avg(sums.totalSteals),
+        avgBlocks: avg(sums.totalBlocks),
+        avgTurnovers: avg(sums.totalTurnovers),
+        avgFouls: avg(sums.totalFouls),
+        avgFoulsDrawn: avg(sums.totalFoulsDrawn),
+        avgEfficiency: avg(sums.totalEfficiency)
+      };
+    }
+    
+    // שורת תצוגה לשחקן: נתוני השחקן + סטטיסטיקות + מפתחות חיפוש/איחוד
+    function preparePlayerRow(pl) {
+      const games = pl.games || [];
+      const sums = sumPlayerGames(games);
+      return {
+        ...pl,
+        ...playerStatsFromSums(sums, games.length),
+        _sums: sums,
+        _hay: [pl.name || '', pl.jersey || '', pl.id || ''].join(' ').toLowerCase(),
+        _team: String(pl.team || '').trim(),
+        _nameKey: String(pl.name || '').toLowerCase().trim(),
+        _jerseyKey: String(pl.jersey || '').trim()
+      };
+    }
+    
+    // איחוד כפילויות לפי שם + מספר (בלי קשר לקבוצה) - רק בין השחקנים שעברו את הסינון
+    function mergeDuplicatePlayerRows(rows) {
+      const playersMap = new Map();
+      let duplicateCount = 0;
       
-      // 🔥 Mark that we're starting to render
-      isRenderingPlayers = true;
-      console.log('🎨 START renderPlayersTable');
-      
-      try {
-        const tbody = $("playersTbody"); 
-        if (!tbody) return;
+      for (const row of rows) {
+        // Skip players without name
+        if (!row._nameKey) continue;
         
-        // Initialize dbAdapter if not already done
-        if (window.dbAdapter && !window.dbAdapter.isDbAvailable()) {
-          await window.dbAdapter.init();
+        const dedupKey = `${row._nameKey}|${row._jerseyKey}`;
+        const existing = playersMap.get(dedupKey);
+        if (!existing) {
+          playersMap.set(dedupKey, row);
+          continue;
         }
         
-        const q = ($("playersSearch")?.value || "").trim().toLowerCase();
-        const teamFilter = ($("playersTeamFilter")?.value || "").trim();
-        const playersMap = new Map(); // Deduplicate by ID
-        
-        // Get all players from dbAdapter
-        const allPlayers = await window.dbAdapter.getPlayers();
-        
-        if (!allPlayers || allPlayers.length === 0) { 
-          tbody.innerHTML = '<tr><td colspan="13" class="text-center text-gray-500">אין שחקנים במערכת</td></tr>'; 
-          return; 
-        }
-      
-      let totalPlayers = 0;
-      let playersWithGames = 0;
-      let duplicateCount = 0;
+        duplicateCount++;
+        // Merge games from both players, keep the most recent/complete data
+        const games = [...(existing.games || []), ...(row.games || [])];
+        const sums = addPlayerSums(existing._sums, row._sums);
+        playersMap.set(dedupKey, {
+          ...existing,
+          ...playerStatsFromSums(sums, games.length),
+          games,
+          _sums: sums,
+          name: row.name || existing.name,
+          team: row.team || existing.team,
+          jersey: row.jersey || existing.jersey
+        });
+      }
       
-      // Process all players
-      for (const pl of allPlayers) {
-          totalPlayers++;
-          
-          // דילוג על שחקנים ללא משחקים בלבד
-          if (!pl.games || pl.games.length === 0) {
-            continue;
+      if (duplicateCount > 0) {
+        console.log(`🔍 Duplicates found and merged: ${duplicateCount}`);
+      }
+      return Array.from(playersMap.values());
+    }
+    
+    const PLAYER_NUMERIC_SORT_FIELDS = new Set([
+      'totalPoints', 'totalRebounds', 'totalAssists', 'totalSteals', 'totalBlocks', 'totalTurnovers',
+      'totalFouls', 'totalFoulsDrawn', 'avgPoints', 'avgRebounds', 'avgAssists', 'avgSteals', 'avgBlocks',
+      'avgTurnovers', 'avgFouls', 'avgFoulsDrawn', 'avgEfficiency', 'totalEfficiency',
+      'fgPercentage', 'threePointPercentage', 'ftPercentage'
+    ]);
+    
+    let playersTableView = null;
+    let playersTableBody = null;
+    
+    function getPlayersTableView() {
+      if (playersTableView) return playersTableView;
+      
+      playersTableView = new window.TableViewModel({
+        load: async () => {
+          // Initialize dbAdapter if not already done
+          if (window.dbAdapter && !window.dbAdapter.isDbAvailable()) {
+            await window.dbAdapter.init();
           }
           
-          playersWithGames++;
-          
-          // חיפוש
-          const hay = [
-            pl.name || '', 
-            pl.jersey || '', 
-            pl.id || ''
-          ].join(' ').toLowerCase();
+          const allPlayers = await window.dbAdapter.getPlayers() || [];
           
-          // Team filter
-          const playerTeam = (pl.team || '').trim();
-          const teamMatch = !teamFilter || playerTeam === teamFilter;
+          // טעינת מיפויי קבוצות להצגת שמות מתורגמים
+          const teamMappings = {};
+          const tTx = DB.transaction(['teams'], 'readonly');
+          const tStore = tTx.objectStore('teams');
+          await new Promise(res => {
+            const req = tStore.openCursor();
+            req.onsuccess = e => {
+              const c = e.target.result; 
+              if (!c) return res();
+              const team = c.value;
+              // שמירת מיפויים קנוניים ואליאסים
+              if (team.name_en) teamMappings[normalizeEn(team.name_en)] = team.name_he;
+              (team.aliases || []).forEach(alias => {
+                teamMappings[normalizeEn(alias)] = team.name_he;
+              });
+              c.continue();
+            };
+          });
           
-          // Apply search filter and team filter
-          if (teamMatch && (!q || hay.includes(q))) {
-            // Create a unique key for deduplication (use name + jersey for proper deduplication)
-            // This handles players who play for different teams (before team merging)
-            const playerName = (pl.name || '').toLowerCase().trim();
-            const playerJersey = (pl.jersey || '').trim();
-            
-            if (!playerName) {
-              // Skip players without name
-              continue;
-            }
-            
-            // Use name + jersey as the deduplication key (ignore team differences)
-            const dedupKey = `${playerName}|${playerJersey}`;
-            
-            if (!playersMap.has(dedupKey)) {
-              playersMap.set(dedupKey, pl);
-            } else {
-              duplicateCount++;
-              // If duplicate found, merge the games from both players
-              const existing = playersMap.get(dedupKey);
-              const existingGames = (existing.games || []).length;
-              const currentGames = (pl.games || []).length;
-              console.log(`Duplicate found: ${pl.name} (${pl.team}) - existing: ${existingGames} games, current: ${currentGames} games`);
-              console.log(`  Existing team: ${existing.team}, Current team: ${pl.team}`);
-              
-              // Merge games from both players
-              const mergedGames = [...(existing.games || []), ...(pl.games || [])];
-              
-              // Create merged player object
-              const mergedPlayer = {
-                ...existing,
-                games: mergedGames,
-                // Keep the most recent/complete data
-                name: pl.name || existing.name,
-                team: pl.team || existing.team,
-                jersey: pl.jersey || existing.jersey
+          // Hebrew display names by player ID from player_mappings
+          const heNameById = new Map();
+          try {
+            const pmTx = DB.transaction(['player_mappings'], 'readonly');
+            const pmStore = pmTx.objectStore('player_mappings');
+            await new Promise(res => {
+              const rq = pmStore.openCursor();
+              rq.onsuccess = (e) => {
+                const c = e.target.result; if(!c) return res();
+                const v = c.value || {};
+                const pid = v.id && String(v.id).trim();
+                const heFirst = (v.first_he||'').trim();
+                const heFamily = (v.family_he||'').trim();
+                if (pid && (heFirst || heFamily)) {
+                  heNameById.set(pid, `${heFirst}${heFirst&&heFamily?' ':''}${heFamily}`.trim());
+                }
+                c.continue();
               };
-              
-              playersMap.set(dedupKey, mergedPlayer);
-              console.log(`Merged player ${pl.name}: ${existingGames} + ${currentGames} = ${mergedGames.length} games`);
+              rq.onerror = () => res();
+            });
+          } catch(_e) { /* no-op */ }
+          
+          // פונקציית עזר לקבלת שם קבוצה בעברית
+          const getTeamHeName = (teamName) => {
+            if (!teamName) return '-';
+            // אם השם כבר בעברית, החזר אותו כפי שהוא
+            if (/[\u0590-\u05FF]/.test(teamName)) {
+              return teamName;
             }
-          }
+            // אחרת, נסה למצוא מיפוי
+            return teamMappings[normalizeEn(teamName)] || teamName; // חזרה למקור אם אין מיפוי
+          };
+          
+          return { allPlayers, getTeamHeName, heNameById };
+        },
+        
+        // דילוג על שחקנים ללא משחקים בלבד
+        prepare: ({ allPlayers }) => allPlayers
+          .filter(pl => pl.games && pl.games.length > 0)
+          .map(preparePlayerRow),
+        
+        sortKeys: {
+          name: p => p.name || '',
+          team: p => playersTableView.data.getTeamHeName(p.team || ''),
+          // Convert jersey to number for proper sorting
+          jersey: p => parseInt(p.jersey) || 0,
+          games: p => (p.games || []).length
+        },
+        // Numeric fields are already stored as numbers
+        defaultSortKey: (p, field) => p[field] || (PLAYER_NUMERIC_SORT_FIELDS.has(field) ? 0 : '')
+      });
+      
+      return playersTableView;
+    }
+    
+    function renderPlayerRow(p) {
+      const { getTeamHeName, heNameById } = playersTableView.data;
+      const displayName = heNameById.get(p.id) || p.name || '-';
+      const totalGames = (p.games || []).length;
+      const avg = value => totalGames ? (value || 0).toFixed(1) : '-';
+      
+      // Conditional rendering based on view
+      if (currentPlayersView === 'totals') {
+        return `<tr>
+            <td class="col-name" title="${p.id || ''}">${displayName}</td>
+            <td class="col-jersey">${p.jersey || '-'}</td>
+            <td class="col-team">${getTeamHeName(p.team)}</td>
+            <td class="col-games">${totalGames}</td>
+            <td class="num points">${p.totalPoints || 0}</td>
+            <td class="num rebounds">${p.totalRebounds || 0}</td>
+            <td class="num assists">${p.totalAssists || 0}</td>
+            <td class="num">${p.totalSteals || 0}</td>
+            <td class="num">${p.totalBlocks || 0}</td>
+            <td class="num">${p.totalTurnovers || 0}</td>
+            <td class="num">${p.totalFouls || 0}</td>
+            <td class="num">${p.totalFoulsDrawn || 0}</td>
+            <td class="num efficiency">${totalGames ? Math.round(p.totalEfficiency || 0) : '-'}</td>
+          </tr>`;
       }
       
-      console.log(`Total players in DB: ${totalPlayers}, with games: ${playersWithGames}, duplicates found: ${duplicateCount}`);
-      
-      // Populate team filter dropdown (before filtering, using all players)
-      populatePlayersTeamFilter(allPlayers);
-      
-      // Convert Map to array
-      const rows = Array.from(playersMap.values());
-      console.log(`Final display: ${rows.length} unique players after deduplication`);
-      console.log(`🔍 Duplicates found and merged: ${duplicateCount}`);
-      console.log(`🔍 Sample player data:`, rows[0] ? {
-        name: rows[0].name,
-        games: rows[0].games?.length || 0,
-        totalPoints: rows[0].totalPoints,
-        hasCalculatedStats: !!rows[0].totalPoints
-      } : 'No players found');
-      
-      // 🔥 FIX: Calculate stats for ALL players BEFORE sorting
-      // This ensures sorting works correctly with numeric values
-      for (const p of rows) {
-        if (p.games && p.games.length > 0) {
-          // Recalculate totals from games
-          p.totalPoints = p.games.reduce((s, g) => s + (g.points || 0), 0);
-          p.totalRebounds = p.games.reduce((s, g) => s + (g.rebounds || 0), 0);
-          p.totalAssists = p.games.reduce((s, g) => s + (g.assists || 0), 0);
-          p.totalSteals = p.games.reduce((s, g) => s + (g.steals || 0), 0);
-          p.totalBlocks = p.games.reduce((s, g) => s + (g.blocks || 0), 0);
-          p.totalTurnovers = p.games.reduce((s, g) => s + (g.turnovers || 0), 0);
-          p.totalFouls = p.games.reduce((s, g) => s + (g.fouls || 0), 0);
-          p.totalFoulsDrawn = p.games.reduce((s, g) => s + (g.foulsOn || 0), 0);
-          
-          // Calculate shooting percentages
-          const totalFGM = p.games.reduce((s, g) => s + (g.fieldGoalsMade || 0), 0);
-          const totalFGA = p.games.reduce((s, g) => s + (g.fieldGoalsAttempted || 0), 0);
-          const total3PM = p.games.reduce((s, g) => s + (g.threePointsMade || 0), 0);
-          const total3PA = p.games.reduce((s, g) => s + (g.threePointsAttempted || 0), 0);
-          const totalFTM = p.games.reduce((s, g) => s + (g.freeThrowsMade || 0), 0);
-          const totalFTA = p.games.reduce((s, g) => s + (g.freeThrowsAttempted || 0), 0);
-          
-          // Store as NUMBERS for proper sorting
-          p.fgPercentage = totalFGA > 0 ? (totalFGM/totalFGA)*100 : 0;
-          p.threePointPercentage = total3PA > 0 ? (total3PM/total3PA)*100 : 0;
-          p.ftPercentage = totalFTA > 0 ? (totalFTM/totalFTA)*100 : 0;
-          
-          // Calculate averages as NUMBERS
-          const totalGames = p.games.length;
-          p.avgPoints = totalGames ? p.totalPoints / totalGames : 0;
-          p.avgRebounds = totalGames ? p.totalRebounds / totalGames : 0;
-          p.avgAssists = totalGames ? p.totalAssists / totalGames : 0;
-          p.avgSteals = totalGames ? p.totalSteals / totalGames : 0;
-          p.avgBlocks = totalGames ? p.totalBlocks / totalGames : 0;
-          p.avgTurnovers = totalGames ? p.totalTurnovers / totalGames : 0;
-          p.avgFouls = totalGames ? p.totalFouls / totalGames : 0;
-          p.avgFoulsDrawn = totalGames ? p.totalFoulsDrawn / totalGames : 0;
-          
-          const totalEfficiency = p.games.reduce((s, g) => s + (g.efficiency || 0), 0);
-          p.totalEfficiency = totalEfficiency; // Store total efficiency for cumulative view
-          p.avgEfficiency = totalGames ? totalEfficiency / totalGames : 0;
-        } else {
-          // Set to 0 if no games
-          p.totalPoints = 0;
-          p.totalRebounds = 0;
-          p.totalAssists = 0;
-          p.totalSteals = 0;
-          p.totalBlocks = 0;
-          p.totalTurnovers = 0;
-          p.totalFouls = 0;
-          p.totalFoulsDrawn = 0;
-          p.totalEfficiency = 0;
-          p.fgPercentage = 0;
-          p.threePointPercentage = 0;
-          p.ftPercentage = 0;
-          p.avgPoints = 0;
-          p.avgRebounds = 0;
-          p.avgAssists = 0;
-          p.avgSteals = 0;
-          p.avgBlocks = 0;
-          p.avgTurnovers = 0;
-          p.avgFouls = 0;
-          p.avgFoulsDrawn = 0;
-          p.avgEfficiency = 0;
-        }
+      // averages
+      return `<tr>
+            <td class="col-name" title="${p.id || ''}">${displayName}</td>
+            <td class="col-jersey">${p.jersey || '-'}</td>
+            <td class="col-team">${getTeamHeName(p.team)}</td>
+            <td class="col-games">${totalGames}</td>
+            <td class="num">${avg(p.avgPoints)}</td>
+            <td class="num">${avg(p.avgRebounds)}</td>
+            <td class="num">${avg(p.avgAssists)}</td>
+            <td class="num">${avg(p.avgSteals)}</td>
+            <td class="num">${avg(p.avgBlocks)}</td>
+            <td class="num">${avg(p.avgTurnovers)}</td>
+            <td class="num">${avg(p.avgFouls)}</td>
+            <td class="num">${avg(p.avgFoulsDrawn)}</td>
+            <td class="num pct">${totalGames ? (p.fgPercentage || 0).toFixed(1) + '%' : '-'}</td>
+            <td class="num pct">${totalGames ? (p.threePointPercentage || 0).toFixed(1) + '%' : '-'}</td>
+            <td class="num pct">${totalGames ? (p.ftPercentage || 0).toFixed(1) + '%' : '-'}</td>
+            <td class="num efficiency">${avg(p.avgEfficiency)}</td>
+          </tr>`;
+    }
+    
+    /**
+     * @param {string|null} sortField - null = המיון הנוכחי
+     * @param {string|null} sortDirection
+     * @param {Object} options - { reload: false = מיון/סינון/החלפת תצוגה על השורות השמורות, בלי שליפה מה-DB }
+     */
+    async function renderPlayersTable(sortField = null, sortDirection = 'desc', options = {}){
+      // Store in global state for preservation
+      if (sortField !== null) {
+        currentPlayersSortField = sortField;
+        currentPlayersSortDirection = sortDirection || currentPlayersSortDirection;
       }
       
-      // טעינת מיפויי קבוצות להצגת שמות מתורגמים
-      const teamMappings = {};
-      const tTx = DB.transaction(['teams'], 'readonly');
-      const tStore = tTx.objectStore('teams');
-      
-      await new Promise(res => {
-        const req = tStore.openCursor();
-        req.onsuccess = e => {
-          const c = e.target.result; 
-          if (!c) return res();
-          const team = c.value;
-          // שמירת מיפויים קנוניים ואליאסים
-          if (team.name_en) teamMappings[normalizeEn(team.name_en)] = team.name_he;
-          (team.aliases || []).forEach(alias => {
-            teamMappings[normalizeEn(alias)] = team.name_he;
-          });
-          c.continue();
-        };
-      });
+      const tbody = $("playersTbody"); 
+      if (!tbody) return;
+      const view = getPlayersTableView();
       
-      // פונקציית עזר לקבלת שם קבוצה בעברית
-      const getTeamHeName = (teamName) => {
-        if (!teamName) return '-';
-        // אם השם כבר בעברית, החזר אותו כפי שהוא
-        if (/[\u0590-\u05FF]/.test(teamName)) {
-          return teamName;
+      if (options.reload !== false || !view.isLoaded()) {
+        // 🔥 Guard: If already loading, skip this call
+        if (isRenderingPlayers) {
+          console.log('⏭️ Skipping renderPlayersTable - already in progress');
+          return;
         }
-        // אחרת, נסה למצוא מיפוי
-        const normalizedName = normalizeEn(teamName);
-        return teamMappings[normalizedName] || teamName; // חזרה למקור אם אין מיפוי
-      };
+        
+        // 🔥 Mark that we're starting to render
+        isRenderingPlayers = true;
+        console.log('🎨 START renderPlayersTable');
+        
+        try {
+          await view.load();
+          // Populate team filter dropdown (before filtering, using all players)
+          populatePlayersTeamFilter(view.data.allPlayers);
+          console.log(`Total players in DB: ${view.data.allPlayers.length}, with games: ${view.rows.length} (${view.stats.lastLoadMs}ms)`);
+        } catch (error) {
+          console.error('❌ Error in renderPlayersTable:', error);
+          return;
+        } finally {
+          // 🔥 CRITICAL: Always release the flag, even if there was an error
+          isRenderingPlayers = false;
+        }
+      }
       
-      // מיון
-      if (sortField) {
-        rows.sort((a, b) => {
-          let aVal, bVal;
-          
-          // טיפול מיוחד בשדות מסוימים
-          switch (sortField) {
-            case 'team':
-              aVal = getTeamHeName(a.team || '');
-              bVal = getTeamHeName(b.team || '');
-              break;
-            case 'jersey':
-              // Convert jersey to number for proper sorting
-              aVal = parseInt(a.jersey) || 0;
-              bVal = parseInt(b.jersey) || 0;
-              break;
-            case 'games':
-              aVal = (a.games || []).length;
-              bVal = (b.games || []).length;
-              break;
-            // All numeric fields - already stored as numbers
-            case 'totalPoints':
-            case 'totalRebounds':
-            case 'totalAssists':
-            case 'totalSteals':
-            case 'totalBlocks':
-            case 'totalTurnovers':
-            case 'totalFouls':
-            case 'totalFoulsDrawn':
-            case 'avgPoints':
-            case 'avgRebounds':
-            case 'avgAssists':
-            case 'avgSteals':
-            case 'avgBlocks':
-            case 'avgTurnovers':
-            case 'avgFouls':
-            case 'avgFoulsDrawn':
-            case 'avgEfficiency':
-            case 'totalEfficiency':
-            case 'fgPercentage':
-            case 'threePointPercentage':
-            case 'ftPercentage':
-              aVal = a[sortField] || 0;
-              bVal = b[sortField] || 0;
-              break;
-            default:
-              aVal = a[sortField] || '';
-              bVal = b[sortField] || '';
-          }
-          
-          // השוואת מחרוזות לשדות טקסט
-          if (typeof aVal === 'string' && typeof bVal === 'string') {
-            if (sortDirection === 'asc') {
-              return aVal.localeCompare(bVal, 'he');
-            } else {
-              return bVal.localeCompare(aVal, 'he');
-            }
-          }
-          
-          // השוואה מספרית
-          if (sortDirection === 'asc') {
-            return aVal - bVal;
-          } else {
-            return bVal - aVal;
-          }
-        });
-      } else {
-        // מיון ברירת מחדל לפי שם אם לא צוין מיון
-        rows.sort((a, b) => (a.name || '').localeCompare(b.name || '', 'he'));
+      try {
+        drawPlayersTable(tbody, view);
+        console.log('✅ END renderPlayersTable');
+      } catch (error) {
+        console.error('❌ Error in renderPlayersTable:', error);
+      }
+    }
+    
+    // סינון + מיון + ציור החלון הנראה (סינכרוני, על השורות השמורות)
+    function drawPlayersTable(tbody, view) {
+      if (view.data.allPlayers.length === 0) {
+        playersTableBody = releaseTableBody(playersTableBody);
+        tbody.innerHTML = '<tr><td colspan="13" class="text-center text-gray-500">אין שחקנים במערכת</td></tr>'; 
+        return;
       }
       
+      const q = ($("playersSearch")?.value || "").trim().toLowerCase();
+      const teamFilter = ($("playersTeamFilter")?.value || "").trim();
+      
+      // מיון ברירת מחדל לפי שם אם לא צוין מיון
+      const rows = view.query({
+        filter: p => (!teamFilter || p._team === teamFilter) && (!q || p._hay.includes(q)),
+        derive: mergeDuplicatePlayerRows,
+        sortField: currentPlayersSortField || 'name',
+        sortDirection: currentPlayersSortField ? currentPlayersSortDirection : 'asc'
+      });
+      
       // Update table headers based on current view
       updatePlayersTableHeaders(currentPlayersView);
       
-      tbody.innerHTML = '';
-      
       // Update players count in header
       const playersCountEl = document.getElementById('playersCount');
       if (playersCountEl) playersCountEl.textContent = rows.length;
       
-      // Hebrew display names by player ID from player_mappings
-      const heNameById = new Map();
-      try {
-        const pmTx = DB.transaction(['player_mappings'], 'readonly');
-        const pmStore = pmTx.objectStore('player_mappings');
-        await new Promise(res => {
-          const rq = pmStore.openCursor();
-          rq.onsuccess = (e) => {
-            const c = e.target.result; if(!c) return res();
-            const v = c.value || {};
-            const pid = v.id && String(v.id).trim();
-            const heFirst = (v.first_he||'').trim();
-            const heFamily = (v.family_he||'').trim();
-            if (pid && (heFirst || heFamily)) {
-              heNameById.set(pid, `${heFirst}${heFirst&&heFamily?' ':''}${heFamily}`.trim());
-            }
-            c.continue();
-          };
-          rq.onerror = () => res();
-        });
-      } catch(_e) { /* no-op */ }
-    // הוספת כותרת אם אין שחקנים
+      // הוספת כותרת אם אין שחקנים
       if (rows.length === 0) {
-        const tr = document.createElement('tr');
-        tr.innerHTML = `<td colspan="17" class="px-3 py-2 text-center text-gray-500">לא נמצאו שחקנים${q ? ' עבור החיפוש' : ''}</td>`;
-        tbody.appendChild(tr);
+        playersTableBody = releaseTableBody(playersTableBody);
+        tbody.innerHTML = `<tr><td colspan="17" class="px-3 py-2 text-center text-gray-500">לא נמצאו שחקנים${q ? ' עבור החיפוש' : ''}</td></tr>`;
         return;
       }
       
-      // הצגת השחקנים
-      for (const p of rows) {
-        const tr = document.createElement('tr');
-        // טיפול במזהים ארוכים - קיצור והצגה בצורה נוחה יותר
-        const displayId = (p.id || '').length > 20 
-          ? (p.id || '').substring(0, 18) + '...'
-          : p.id || '';
-        
-        // 🔥 FIX: Use pre-calculated stats (already computed before sorting)
-        // Stats are now stored as NUMBERS for proper sorting
-        const totalPoints = p.totalPoints || 0;
-        const totalRebounds = p.totalRebounds || 0;
-        const totalAssists = p.totalAssists || 0;
-        const totalSteals = p.totalSteals || 0;
-        const totalBlocks = p.totalBlocks || 0;
-        const totalTurnovers = p.totalTurnovers || 0;
-        const totalFouls = p.totalFouls || 0;
-        const totalFoulsDrawn = p.totalFoulsDrawn || 0;
-        
-        // Format percentages and averages for display (with .toFixed)
-        const fgPercentage = (p.fgPercentage || 0).toFixed(1);
-        const threePointPercentage = (p.threePointPercentage || 0).toFixed(1);
-        const ftPercentage = (p.ftPercentage || 0).toFixed(1);
-        const avgEfficiency = (p.avgEfficiency || 0).toFixed(1);
-        const totalEfficiency = Math.round(p.totalEfficiency || 0); // Whole number, no decimals
-        const totalGames = (p.games || []).length;
-          
-        // Conditional rendering based on view
-        if (currentPlayersView === 'totals') {
-          tr.innerHTML = `
-            <td class="col-name" title="${p.id || ''}">${(heNameById && heNameById.get(p.id)) || p.name || '-'}</td>
-            <td class="col-jersey">${p.jersey || '-'}</td>
-            <td class="col-team">${getTeamHeName(p.team)}</td>
-            <td class="col-games">${totalGames}</td>
-            <td class="num points">${totalPoints}</td>
-            <td class="num rebounds">${totalRebounds}</td>
-            <td class="num assists">${totalAssists}</td>
-            <td class="num">${totalSteals}</td>
-            <td class="num">${totalBlocks}</td>
-            <td class="num">${totalTurnovers}</td>
-            <td class="num">${totalFouls}</td>
-            <td class="num">${totalFoulsDrawn}</td>
-            <td class="num efficiency">${totalGames ? totalEfficiency : '-'}</td>
-          `;
-        } else { // averages
-          tr.innerHTML = `
-            <td class="col-name" title="${p.id || ''}">${(heNameById && heNameById.get(p.id)) || p.name || '-'}</td>
-            <td class="col-jersey">${p.jersey || '-'}</td>
-            <td class="col-team">${getTeamHeName(p.team)}</td>
-            <td class="col-games">${totalGames}</td>
-            <td class="num">${totalGames ? (p.avgPoints || 0).toFixed(1) : '-'}</td>
-            <td class="num">${totalGames ? (p.avgRebounds || 0).toFixed(1) : '-'}</td>
-            <td class="num">${totalGames ? (p.avgAssists || 0).toFixed(1) : '-'}</td>
-            <td class="num">${totalGames ? (p.avgSteals || 0).toFixed(1) : '-'}</td>
-            <td class="num">${totalGames ? (p.avgBlocks || 0).toFixed(1) : '-'}</td>
-            <td class="num">${totalGames ? (p.avgTurnovers || 0).toFixed(1) : '-'}</td>
-            <td class="num">${totalGames ? (p.avgFouls || 0).toFixed(1) : '-'}</td>
-            <td class="num">${totalGames ? (p.avgFoulsDrawn || 0).toFixed(1) : '-'}</td>
-            <td class="num pct">${totalGames ? fgPercentage + '%' : '-'}</td>
-            <td class="num pct">${totalGames ? threePointPercentage + '%' : '-'}</td>
-            <td class="num pct">${totalGames ? ftPercentage + '%' : '-'}</td>
-            <td class="num efficiency">${totalGames ? avgEfficiency : '-'}</td>
-          `;
-        }
-        tbody.appendChild(tr);
+      // הצגת השחקנים - רק החלון הנראה
+      if (!playersTableBody || playersTableBody.tbody !== tbody) {
+        if (playersTableBody) playersTableBody.destroy();
+        playersTableBody = new window.VirtualTableBody(tbody, { renderRow: renderPlayerRow, columns: 17 });
       }
+      playersTableBody.setRows(rows);
       
       // Update sort indicators
       if (currentPlayersSortField) {
         updateSortHeaders(currentPlayersSortField, currentPlayersSortDirection);
       }
-      
-      console.log('✅ END renderPlayersTable');
-      
-      } catch (error) {
-        console.error('❌ Error in renderPlayersTable:', error);
-      } finally {
-        // 🔥 CRITICAL: Always release the flag, even if there was an error
-        isRenderingPlayers = false;
-      }
     }
 
     function updatePlayersTableHeaders(view) {
@@ -2067,7 +2126,7 @@ ${suspectedDuplicates}
           const newDirection = (field === currentPlayersSortField && currentPlayersSortDirection === 'desc') ? 'asc' : 'desc';
           currentPlayersSortField = field;
           currentPlayersSortDirection = newDirection;
-          renderPlayersTable(field, newDirection);
+          renderPlayersTable(field, newDirection, { reload: false });
         };
       });
     }
@@ -2141,13 +2200,13 @@ ${suspectedDuplicates}
       
       if (teamFilter) {
         teamFilter.addEventListener('change', () => {
-          renderPlayersTable();
+          renderPlayersTable(null, null, { reload: false });
         });
       }
       
       if (searchInput) {
         searchInput.addEventListener('input', () => {
-          renderPlayersTable();
+          renderPlayersTable(null, null, { reload: false });
         });
       }
       
@@ -2155,7 +2214,7 @@ ${suspectedDuplicates}
         clearBtn.addEventListener('click', () => {
           if (teamFilter) teamFilter.value = '';
           if (searchInput) searchInput.value = '';
-          renderPlayersTable();
+          renderPlayersTable(null, null, { reload: false });
         });
       }
       
@@ -2192,7 +2251,7 @@ ${suspectedDuplicates}
           
           // Update headers and re-render
           updatePlayersTableHeaders(currentPlayersView);
-          renderPlayersTable(currentPlayersSortField, currentPlayersSortDirection);
+          renderPlayersTable(currentPlayersSortField, currentPlayersSortDirection, { reload: false });
         });
         
         console.log('✅ Players view toggle initialized');
@@ -2314,7 +2373,75 @@ ${suspectedDuplicates}
     let currentGamesSortField = 'gameId';
     let currentGamesSortDirection = 'desc';
     
-    async function renderGamesTable(sortField = null, sortDirection = null){
+    // ===== Games table view model (כמו בטבלת השחקנים) =====
+    let gamesTableView = null;
+    let gamesTableBody = null;
+    let gamesTableIsAdmin = false;
+    
+    function getGamesTableView() {
+      if (gamesTableView) return gamesTableView;
+      
+      // סכום הנקודות במשחק (-1 לקבוצה בלי סיכום) - למיון לפי תוצאה
+      const resultKey = g => {
+        const totals = g.totals || {};
+        return (totals[g.teams?.[0] || '']?.points ?? -1) + (totals[g.teams?.[1] || '']?.points ?? -1);
+      };
+      
+      gamesTableView = new window.TableViewModel({
+        load: async () => ({ games: await getGameListWithTeamTotals() }),
+        prepare: ({ games }) => games.map(g => ({
+          ...g,
+          _hay: [
+            String(g.id||""),
+            String(g.cycle||""),
+            String(g.date||""),
+            (g.teams||[]).join(" ")
+          ].join(" ").toLowerCase()
+        })),
+        sortKeys: {
+          gameId: g => Number(g.id) || 0,
+          cycle: g => Number(g.cycle) || 0,
+          date: g => g.date || '',
+          game: g => (g.teams || []).join(' '),
+          result: resultKey
+        },
+        // שדה לא מוכר - בלי מיון (כמו return 0)
+        defaultSortKey: () => 0
+      });
+      
+      return gamesTableView;
+    }
+    
+    function renderGameRow(g) {
+      const home = g.teams?.[0] || "";
+      const away = g.teams?.[1] || "";
+      const totals = g.totals || {};
+      const homePts = (totals[home]?.points ?? null);
+      const awayPts = (totals[away]?.points ?? null);
+
+      const result = (homePts===null || awayPts===null) ? "–" : `${awayPts}:${homePts}`;
+
+      return `<tr>
+          <td class="px-3 py-2 mono">${g.id}</td>
+          <td class="px-3 py-2">${g.cycle ?? "-"}</td>
+          <td class="px-3 py-2">${g.date || "-"}</td>
+          <td class="px-3 py-2">${home || "-"} - ${away || "-"}</td>
+          <td class="px-3 py-2 font-semibold">${result}</td>
+          <td class="px-3 py-2">
+            ${gamesTableIsAdmin ? `
+              <button class="text-blue-700 hover:underline mr-2" data-reload="${g.id}">טען מחדש</button>
+              <button class="text-red-700 hover:underline" data-del="${g.id}">מחק</button>
+            ` : ''}
+          </td>
+        </tr>`;
+    }
+    
+    /**
+     * @param {string|null} sortField - null = המיון הנוכחי
+     * @param {string|null} sortDirection
+     * @param {Object} options - { reload: false = מיון/סינון על השורות השמורות, בלי שליפה מה-DB }
+     */
+    async function renderGamesTable(sortField = null, sortDirection = null, options = {}){
       // Use provided sort params or fall back to current state
       if (sortField === null) sortField = currentGamesSortField;
       if (sortDirection === null) sortDirection = currentGamesSortDirection;
@@ -2322,21 +2449,7 @@ ${suspectedDuplicates}
       // Update current sort state
       currentGamesSortField = sortField;
       currentGamesSortDirection = sortDirection;
-      // 🔥 Guard: If already rendering, skip this call
-      if (isRenderingGames) {
-        console.log('⏭️ Skipping renderGamesTable - already in progress');
-        return;
-      }
       
-      // 🔥 Mark that we're starting to render
-      isRenderingGames = true;
-      console.log('🎨 START renderGamesTable');
-      
-      // Check auth state for debugging
-      const isAdmin = window.authModule && window.authModule.isAuthenticated();
-      console.log('🔐 renderGamesTable - isAdmin =', isAdmin, 'authModule =', !!window.authModule);
-      
-      try {
       // מחיקה בלחיצה על כפתור "מחק" בתוך הטבלה
       const _tbody = document.getElementById("gamesTbody");
       if(_tbody){
@@ -2357,105 +2470,64 @@ ${suspectedDuplicates}
           if(!id) return;
           if(confirm(`למחוק את המשחק ${id}?`)){
             await deleteGameById(id);
-            await renderGamesTable(sortField, sortDirection);
+            await renderGamesTable();
             if(typeof renderTeamsAggregate === "function"){ await renderTeamsAggregate(); }
           }
         };
       }
 
       const tbody = $("gamesTbody"); if(!tbody) return;
+      const view = getGamesTableView();
+      
+      if (options.reload !== false || !view.isLoaded()) {
+        // 🔥 Guard: If already loading, skip this call
+        if (isRenderingGames) {
+          console.log('⏭️ Skipping renderGamesTable - already in progress');
+          return;
+        }
+        
+        // 🔥 Mark that we're starting to render
+        isRenderingGames = true;
+        console.log('🎨 START renderGamesTable');
+        
+        try {
+          await view.load();
+          // Populate filter dropdowns with unique values
+          populateGamesFilters(view.data.games);
+        } catch (error) {
+          console.error('❌ Error in renderGamesTable:', error);
+          return;
+        } finally {
+          // 🔥 CRITICAL: Always release the flag, even if there was an error
+          isRenderingGames = false;
+        }
+      }
       
+      try {
+        drawGamesTable(tbody, view, sortField, sortDirection);
+        console.log('✅ END renderGamesTable');
+      } catch (error) {
+        console.error('❌ Error in renderGamesTable:', error);
+      }
+    }
+    
+    function drawGamesTable(tbody, view, sortField, sortDirection) {
       // Get filter values
       const searchQuery = ($("gamesSearch")?.value || "").trim().toLowerCase();
       const cycleFilter = $("cycleFilter")?.value || "";
       const teamFilter = $("teamFilter")?.value || "";
-
-      const games = await getGameListWithTeamTotals();
-      
-      // Populate filter dropdowns with unique values
-      populateGamesFilters(games);
       
-      // Check admin status ONCE before loop (not inside loop)
-      const isAdmin = window.authModule && window.authModule.isAuthenticated();
-      console.log('🔐 isAdmin for all rows =', isAdmin);
-
-      // Apply filters
-      const filtered = games.filter(g=>{
-        // Cycle filter
-        if (cycleFilter && String(g.cycle) !== cycleFilter) {
-          return false;
-        }
-        
-        // Team filter
-        if (teamFilter && !(g.teams || []).includes(teamFilter)) {
-          return false;
-        }
-        
-        // Search query
-        if (searchQuery) {
-          const hay = [
-            String(g.id||""),
-            String(g.cycle||""),
-            String(g.date||""),
-            (g.teams||[]).join(" ")
-          ].join(" ").toLowerCase();
-          if (!hay.includes(searchQuery)) {
-            return false;
-          }
-        }
-        
-        return true;
-      });
+      // Check admin status ONCE per draw (not per row)
+      gamesTableIsAdmin = !!(window.authModule && window.authModule.isAuthenticated());
+      console.log('🔐 isAdmin for all rows =', gamesTableIsAdmin);
 
-      // Sort the filtered games
-      filtered.sort((a, b) => {
-        let valA, valB;
-        
-        switch(sortField) {
-          case 'gameId':
-            valA = Number(a.id) || 0;
-            valB = Number(b.id) || 0;
-            break;
-          case 'cycle':
-            valA = Number(a.cycle) || 0;
-            valB = Number(b.cycle) || 0;
-            break;
-          case 'date':
-            valA = a.date || '';
-            valB = b.date || '';
-            break;
-          case 'game':
-            valA = (a.teams || []).join(' ');
-            valB = (b.teams || []).join(' ');
-            break;
-          case 'result':
-            const homeA = a.teams?.[0] || '';
-            const awayA = a.teams?.[1] || '';
-            const totalsA = a.totals || {};
-            const homePtsA = (totalsA[homeA]?.points ?? -1);
-            const awayPtsA = (totalsA[awayA]?.points ?? -1);
-            valA = homePtsA + awayPtsA;
-            
-            const homeB = b.teams?.[0] || '';
-            const awayB = b.teams?.[1] || '';
-            const totalsB = b.totals || {};
-            const homePtsB = (totalsB[homeB]?.points ?? -1);
-            const awayPtsB = (totalsB[awayB]?.points ?? -1);
-            valB = homePtsB + awayPtsB;
-            break;
-          default:
-            return 0;
-        }
-        
-        if (typeof valA === 'string') {
-          return sortDirection === 'asc' 
-            ? valA.localeCompare(valB, 'he') 
-            : valB.localeCompare(valA, 'he');
-        } else {
-          return sortDirection === 'asc' 
-            ? valA - valB 
-            : valB - valA;
-        }
+      // Apply filters, then sort
+      const filtered = view.query({
+        filter: g => (!cycleFilter || String(g.cycle) === cycleFilter)
+          && (!teamFilter || (g.teams || []).includes(teamFilter))
+          && (!searchQuery || g._hay.includes(searchQuery)),
+        sortField,
+        sortDirection
       });
 
       // Update games count
@@ -2464,52 +2536,21 @@ ${suspectedDuplicates}
         gamesCountSpan.textContent = filtered.length;
       }
 
-      tbody.innerHTML = "";
       if(!filtered.length){
-        const tr = document.createElement("tr");
-        tr.innerHTML = `<td class="px-3 py-2 text-center text-gray-500" colspan="6">אין משחקים להצגה</td>`;
-        tbody.appendChild(tr);
+        gamesTableBody = releaseTableBody(gamesTableBody);
+        tbody.innerHTML = `<tr><td class="px-3 py-2 text-center text-gray-500" colspan="6">אין משחקים להצגה</td></tr>`;
         return;
       }
 
-      for(const g of filtered){
-        const home = g.teams?.[0] || "";
-        const away = g.teams?.[1] || "";
-        const totals = g.totals || {};
-        const homePts = (totals[home]?.points ?? null);
-        const awayPts = (totals[away]?.points ?? null);
-
-        const result = (homePts===null || awayPts===null) ? "–" : `${awayPts}:${homePts}`;
-
-        // isAdmin is now checked once before the loop (line 1776)
-        const tr = document.createElement("tr");
-        tr.innerHTML = `
-          <td class="px-3 py-2 mono">${g.id}</td>
-          <td class="px-3 py-2">${g.cycle ?? "-"}</td>
-          <td class="px-3 py-2">${g.date || "-"}</td>
-          <td class="px-3 py-2">${home || "-"} - ${away || "-"}</td>
-          <td class="px-3 py-2 font-semibold">${result}</td>
-          <td class="px-3 py-2">
-            ${isAdmin ? `
-              <button class="text-blue-700 hover:underline mr-2" data-reload="${g.id}">טען מחדש</button>
-              <button class="text-red-700 hover:underline" data-del="${g.id}">מחק</button>
-            ` : ''}
-          </td>
-        `;
-        tbody.appendChild(tr);
+      // הצגת המשחקים - רק החלון הנראה
+      if (!gamesTableBody || gamesTableBody.tbody !== tbody) {
+        if (gamesTableBody) gamesTableBody.destroy();
+        gamesTableBody = new window.VirtualTableBody(tbody, { renderRow: renderGameRow, columns: 6 });
       }
+      gamesTableBody.setRows(filtered);
       
       // Update table headers with sort indicators
       updateGamesTableHeaders(sortField, sortDirection);
-      
-      console.log('✅ END renderGamesTable');
-      
-      } catch (error) {
-        console.error('❌ Error in renderGamesTable:', error);
-      } finally {
-        // 🔥 CRITICAL: Always release the flag, even if there was an error
-        isRenderingGames = false;
-      }
     }
 
     // Populate games filter dropdowns with unique values
@@ -2576,7 +2617,7 @@ ${suspectedDuplicates}
         header.style.cursor = 'pointer';
         header.onclick = function() {
           const newDirection = (field === sortField && sortDirection === 'desc') ? 'asc' : 'desc';
-          renderGamesTable(field, newDirection);
+          renderGamesTable(field, newDirection, { reload: false });
         };
       });
     }
@@ -2604,14 +2645,14 @@ ${suspectedDuplicates}
       if (cycleFilter) {
         cycleFilter.addEventListener('change', () => {
           console.log('🔄 Cycle filter changed to:', cycleFilter.value);
-          renderGamesTable();
+          renderGamesTable(null, null, { reload: false });
         });
       }
       
       if (teamFilter) {
         teamFilter.addEventListener('change', () => {
           console.log('🔄 Team filter changed to:', teamFilter.value);
-          renderGamesTable();
+          renderGamesTable(null, null, { reload: false });
         });
       }
       
@@ -2619,7 +2660,7 @@ ${suspectedDuplicates}
       if (searchInput && searchBtn) {
         const doSearch = () => {
           console.log('🔍 Search triggered with query:', searchInput.value);
-          renderGamesTable();
+          renderGamesTable(null, null, { reload: false });
         };
         
         searchBtn.addEventListener('click', doSearch);
@@ -2638,7 +2679,7 @@ ${suspectedDuplicates}
           if (cycleFilter) cycleFilter.value = "";
           if (teamFilter) teamFilter.value = "";
           if (searchInput) searchInput.value = "";
-          renderGamesTable();
+          renderGamesTable(null, null, { reload: false });
         });
       }
       
@@ -2787,6 +2828,7 @@ ${suspectedDuplicates}
           };
           req.onerror = ()=>resolve();
         });
+        window.dbAdapter?.notifyWrite?.('players');
       }catch(e){}
 
       showOk && showOk('המשחק נמחק בהצלחה');
@@ -2818,6 +2860,7 @@ ${suspectedDuplicates}
             };
             next();
           });
+          window.dbAdapter?.notifyWrite?.('players', backupPlayers.map(p => p.id));
         }
         await renderGamesTable();
         if(typeof renderTeamsAggregate === "function"){ await renderTeamsAggregate(); }
@@ -3417,9 +3460,9 @@ ${suspectedDuplicates}
       if (!teamAveragesDiv) return;
       
       try {
-        // Get all team statistics for ranking calculation
-        const allTeamStats = await getTeamsAggregate();
-        console.log('All team stats from getTeamsAggregate:', allTeamStats);
+        // Get all team statistics for ranking calculation (materialized team aggregates when available)
+        const { rows: allTeamStats, byTeam: aggregatesByTeam } = await getTeamAggregateRows();
+        console.log('All team stats for game prep:', allTeamStats);
         
         // Calculate averages and rankings for both teams
         // Use team names instead of team_id since that's how they're stored in getTeamsAggregate
@@ -3427,8 +3470,8 @@ ${suspectedDuplicates}
         const awayStats = await calculateTeamStats(awayTeam.name_he, allTeamStats);
         
         // Calculate home/away specific stats
-        const homeHomeAwayStats = await calculateHomeAwayStats(homeTeam, true); // true = home team
-        const awayHomeAwayStats = await calculateHomeAwayStats(awayTeam, false); // false = away team
+        const homeHomeAwayStats = await calculateHomeAwayStats(homeTeam, true, aggregatesByTeam); // true = home team
+        const awayHomeAwayStats = await calculateHomeAwayStats(awayTeam, false, aggregatesByTeam); // false = away team
         
         console.log('Home team calculated stats:', homeStats);
         console.log('Away team calculated stats:', awayStats);
@@ -3761,10 +3804,35 @@ ${suspectedDuplicates}
       return `${rank}/${totalTeams}`;
     }
     
+    // Team rows for game prep: one read of the materialized team aggregates,
+    // or the full scan (getTeamsAggregate) when they are not available yet
+    async function getTeamAggregateRows() {
+      try {
+        const stored = window.dbAdapter?.getTeamAggregates ? await window.dbAdapter.getTeamAggregates() : null;
+        if (stored && stored.length > 0 && window.TeamAggregates) {
+          return {
+            rows: stored.map(window.TeamAggregates.toTeamsAggregateRow),
+            byTeam: new Map(stored.map(row => [row.team, row]))
+          };
+        }
+      } catch (error) {
+        console.warn('⚠️ Team aggregates unavailable, falling back to a full scan:', error);
+      }
+      return { rows: await getTeamsAggregate(), byTeam: null };
+    }
+    
     // Calculate home/away specific statistics
-    async function calculateHomeAwayStats(team, isHomeTeam) {
+    // aggregatesByTeam (from getTeamAggregateRows) - one lookup instead of scanning all games
+    async function calculateHomeAwayStats(team, isHomeTeam, aggregatesByTeam = null) {
       console.log('Calculating home/away stats for:', team.name_he, 'isHome:', isHomeTeam);
       
+      if (aggregatesByTeam && window.TeamAggregates) {
+        const aggregate = [team.name_he, team.team_id, team.name_en]
+          .map(name => aggregatesByTeam.get(name))
+          .find(Boolean);
+        return window.TeamAggregates.toHomeAwayStats(aggregate, isHomeTeam);
+      }
+      
       try {
         // Get all games from database
         const allGames = await getAllGames();
@@ -4432,7 +4500,7 @@ ${suspectedDuplicates}
       
       window.addEventListener('authStateChanged', (event) => {
         console.log('🔐 [app_db_save] authStateChanged received!', event.detail);
-        renderGamesTable();
+        renderGamesTable(null, null, { reload: false });
       });
       
       console.log('✅ [app_db_save] authStateChanged listener registered');
@@ -216,7 +216,7 @@
         on(ps, 'input', () => {
           clearTimeout(playersSearchTimeout);
           playersSearchTimeout = setTimeout(() => {
-            if (typeof renderPlayersTable === 'function') renderPlayersTable();
+            if (typeof renderPlayersTable === 'function') renderPlayersTable(null, null, { reload: false });
           }, 300); // Wait 300ms after user stops typing
         });
         
@@ -224,7 +224,7 @@
         on(ps, 'keypress', (e) => {
           if (e.key === 'Enter') {
             clearTimeout(playersSearchTimeout);
-            if (typeof renderPlayersTable === 'function') renderPlayersTable();
+            if (typeof renderPlayersTable === 'function') renderPlayersTable(null, null, { reload: false });
           }
         });
       }
@@ -235,7 +235,7 @@
         on(gs, 'input', () => {
           clearTimeout(gamesSearchTimeout);
           gamesSearchTimeout = setTimeout(() => {
-            if (typeof renderGamesTable === 'function') renderGamesTable();
+            if (typeof renderGamesTable === 'function') renderGamesTable(null, null, { reload: false });
           }, 300);
         });
         
@@ -243,7 +243,7 @@
         on(gs, 'keypress', (e) => {
           if (e.key === 'Enter') {
             clearTimeout(gamesSearchTimeout);
-            if (typeof renderGamesTable === 'function') renderGamesTable();
+            if (typeof renderGamesTable === 'function') renderGamesTable(null, null, { reload: false });
           }
         });
       }
@@ -425,6 +425,7 @@
 
       setOnClick('migratePlayersBtn', () => (typeof migratePlayerDatabase==='function' && migratePlayerDatabase()));
       setOnClick('recalcStatsBtn', () => (typeof recalculatePlayerStats==='function' && recalculatePlayerStats()));
+      setOnClick('repairHebrewBtn', () => (typeof repairHebrewEncodingInDatabase==='function' && repairHebrewEncodingInDatabase()));
       setOnClick('clearAllBtn', () => (typeof clearAllDatabase==='function' && clearAllDatabase()));
       setOnClick('loadFromUrlBtn', async () => {
         const urlInput = byId('gameUrlInput');
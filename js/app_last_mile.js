@@ -324,9 +324,11 @@ if (window.App) {
       
       console.log('🔍 Team found:', team);
       
-      // Get all players from dbAdapter
-      const allPlayers = await window.dbAdapter.getPlayers();
-      console.log('🔍 Total players in DB:', allPlayers.length);
+      // Get the team's players from dbAdapter (team index of the entity cache; full list on older adapters)
+      const allPlayers = window.dbAdapter.getPlayersByTeam
+        ? await window.dbAdapter.getPlayersByTeam([teamId, team.name_he, team.name_en].filter(Boolean))
+        : await window.dbAdapter.getPlayers();
+      console.log('🔍 Candidate players for team:', allPlayers.length);
       
       // Use a Map to deduplicate players by name + jersey (same logic as renderPlayersTable)
       const playersMap = new Map();
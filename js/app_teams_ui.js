@@ -122,6 +122,7 @@
           const req = store.put(teamData);
           req.onsuccess = () => {
             console.log('Team stored in DB successfully:', teamData);
+            window.dbAdapter?.notifyWrite?.('teams', [teamData.team_id]);
             resolve();
           };
           req.onerror = (e) => {
@@ -225,6 +226,7 @@
       if(DB_AVAILABLE && DB){
         const tx = DB.transaction(["teams"], "readwrite");
         await new Promise((res, rej)=>{ const r = tx.objectStore("teams").delete(team_id); r.onsuccess = ()=>res(); r.onerror = ()=>rej(r.error); });
+        window.dbAdapter?.notifyWrite?.('teams', [team_id]);
       } else {
         TEAMS_MEM = TEAMS_MEM.filter(t=>t.team_id!==team_id);
       }
@@ -318,6 +320,7 @@
             req.onerror = () => reject(req.error);
           });
         }
+        window.dbAdapter?.notifyWrite?.('teams');
         
         await loadTeamsIndex();
         await listTeams();
@@ -526,6 +529,7 @@ async function cleanupOldPlayerSystem() {
         const cursor = e.target.result;
         if (!cursor) {
           console.log('✅ Old system players cleanup completed');
+          window.dbAdapter?.notifyWrite?.('players');
           resolve();
           return;
         }
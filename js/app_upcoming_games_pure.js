@@ -16,58 +16,41 @@ const SEASON_ID = 119472;  // עונת 2025
 // מטמון נתונים
 let cachedGames = null;
 let cachedGamesByRound = null;
+let cachedRoundIndex = null;
+let currentRound = null;
+let pendingRevalidation = null;
+
+// אינדקס מחזורים שמור (localStorage) - מוצג מיד בכניסה הבאה ומתעדכן ברקע
+const ROUND_INDEX_VERSION = 1;
+const ROUND_INDEX_STORAGE_KEY = `ibba_upcoming_rounds_${LEAGUE_ID}_${SEASON_ID}`;
 
 // ========================================
 // פונקציה ראשית: טעינת משחקים קרובים
 // ========================================
 
 async function loadUpcomingGames() {
+  // כניסה חוזרת: הצגה מיידית מהאינדקס השמור, ואימות מול ה-API ברקע
+  const storedIndex = cachedRoundIndex || loadRoundIndex();
+  if (storedIndex) {
+    console.log(`⚡ Showing ${storedIndex.order.length} rounds from saved index, revalidating in background...`);
+    applyRoundIndex(storedIndex);
+    
+    if (!pendingRevalidation) {
+      pendingRevalidation = revalidateRoundIndex()
+        .catch(error => {
+          console.warn('⚠️ Background revalidation failed, keeping saved rounds:', error);
+          return [];
+        })
+        .finally(() => { pendingRevalidation = null; });
+    }
+    
+    return cachedGames;
+  }
+  
   console.log('📅 Loading upcoming games from IBBA API...');
   
   try {
-    const apiUrl = `${IBBA_API_URL}?leagues=${LEAGUE_ID}&seasons=${SEASON_ID}&per_page=300`;
-    
-    console.log('📡 Fetching from:', apiUrl);
-    
-    // טעינה ישירה (עובד מ-localhost ומאתרים עם HTTPS)
-    let allGames = null;
-    
-    try {
-      console.log(`🔄 Loading games from API...`);
-      
-      const controller = new AbortController();
-      const timeoutId = setTimeout(() => controller.abort(), 15000); // 15 שניות timeout
-      
-      const response = await fetch(apiUrl, {
-        signal: controller.signal
-      });
-      
-      clearTimeout(timeoutId);
-      
-      if (!response.ok) {
-        throw new Error(`HTTP ${response.status}: ${response.statusText}`);
-      }
-      
-      const data = await response.json();
-      
-      // וידוא שהתשובה היא מערך
-      if (!Array.isArray(data)) {
-        throw new Error('התשובה מה-API אינה מערך תקין');
-      }
-      
-      allGames = data;
-      console.log(`✅ Successfully loaded ${data.length} games from API`);
-      
-    } catch (fetchError) {
-      console.error('❌ Direct fetch failed:', fetchError);
-      throw new Error(`לא הצלחנו לטעון את המשחקים מה-API.\nודא שהאתר רץ על localhost:8000 ושהאינטרנט פעיל.\n\nשגיאה: ${fetchError.message}`);
-    }
-    
-    if (!allGames) {
-      throw new Error('לא התקבלו נתונים מה-API');
-    }
-    
-    console.log(`📊 Received ${allGames.length} total games from API`);
+    const allGames = await fetchUpcomingGamesFromApi();
     
     // כל המשחקים רלוונטיים - ההחלטה לפי תאריך בלבד (לא לפי status שלא אמין)
     let relevantGames = allGames;
@@ -81,25 +64,16 @@ async function loadUpcomingGames() {
     
     console.log(`📊 Processing ${relevantGames.length} games from API`);
     
-    // מיון לפי תאריך (הקרוב ביותר ראשון)
-    relevantGames.sort((a, b) => new Date(a.date) - new Date(b.date));
-    
-    // שמירה במטמון
-    cachedGames = relevantGames;
-    
-    // קיבוץ לפי מחזור
-    const gamesByRound = groupGamesByRound(relevantGames);
-    cachedGamesByRound = gamesByRound;
-    
-    // מציאת מחזור ברירת מחדל
-    const defaultRound = findDefaultRound(gamesByRound);
-    
-    console.log(`🎯 Default round selected: ${defaultRound}`);
+    // אינדקס מחזורים (ממוין לפי תאריך) - נשמר רק כשהגיע מה-API
+    const index = buildRoundIndex(relevantGames);
+    if (allGames.length > 0) {
+      saveRoundIndex(index);
+    }
     
     // הצגת הממשק
-    renderUpcomingGamesUI(gamesByRound, defaultRound);
+    applyRoundIndex(index);
     
-    return relevantGames;
+    return cachedGames;
     
   } catch (error) {
     console.error('❌ Error loading upcoming games:', error);
@@ -108,6 +82,53 @@ async function loadUpcomingGames() {
   }
 }
 
+async function fetchUpcomingGamesFromApi() {
+  const apiUrl = `${IBBA_API_URL}?leagues=${LEAGUE_ID}&seasons=${SEASON_ID}&per_page=300`;
+  
+  console.log('📡 Fetching from:', apiUrl);
+  
+  // טעינה ישירה (עובד מ-localhost ומאתרים עם HTTPS)
+  let allGames = null;
+  
+  try {
+    console.log(`🔄 Loading games from API...`);
+    
+    const controller = new AbortController();
+    const timeoutId = setTimeout(() => controller.abort(), 15000); // 15 שניות timeout
+    
+    const response = await fetch(apiUrl, {
+      signal: controller.signal
+    });
+    
+    clearTimeout(timeoutId);
+    
+    if (!response.ok) {
+      throw new Error(`HTTP ${response.status}: ${response.statusText}`);
+    }
+    
+    const data = await response.json();
+    
+    // וידוא שהתשובה היא מערך
+    if (!Array.isArray(data)) {
+      throw new Error('התשובה מה-API אינה מערך תקין');
+    }
+    
+    allGames = data;
+    console.log(`✅ Successfully loaded ${data.length} games from API`);
+    
+  } catch (fetchError) {
+    console.error('❌ Direct fetch failed:', fetchError);
+    throw new Error(`לא הצלחנו לטעון את המשחקים מה-API.\nודא שהאתר רץ על localhost:8000 ושהאינטרנט פעיל.\n\nשגיאה: ${fetchError.message}`);
+  }
+  
+  if (!allGames) {
+    throw new Error('לא התקבלו נתונים מה-API');
+  }
+  
+  console.log(`📊 Received ${allGames.length} total games from API`);
+  return allGames;
+}
+
 // ========================================
 // קיבוץ משחקים לפי מחזור
 // ========================================
@@ -200,6 +221,220 @@ function findDefaultRound(gamesByRound) {
   return closestRound;
 }
 
+// ========================================
+// אינדקס מחזורים שמור
+// ========================================
+// לכל מחזור: המשחקים (מזהה, תאריך, זוג קבוצות), זמני המשחקים ממוינים, סטטוס שוחק/קרוב וחתימה.
+// מחזור ברירת המחדל מחושב מהזמנים השמורים בלי לעבור על כל המשחקים עם new Date,
+// והחתימה מאפשרת לזהות אילו מחזורים השתנו ברענון ברקע.
+
+function sortRoundKeys(keys) {
+  return keys.slice().sort((a, b) => (parseInt(a) || 0) - (parseInt(b) || 0));
+}
+
+function buildRoundIndex(games, now = Date.now()) {
+  const entries = games
+    .map(game => ({
+      game: {
+        id: game.id,
+        date: game.date,
+        stage_id: String(game.stage_id || 'לא ידוע'),
+        home: { team: game.home?.team || '' },
+        away: { team: game.away?.team || '' }
+      },
+      time: new Date(game.date).getTime()
+    }))
+    .sort((a, b) => (a.time || 0) - (b.time || 0));
+  
+  const rounds = {};
+  entries.forEach(({ game, time }) => {
+    const key = game.stage_id;
+    if (!rounds[key]) {
+      rounds[key] = { round: key, games: [], times: [] };
+    }
+    rounds[key].games.push(game);
+    if (Number.isFinite(time)) {
+      rounds[key].times.push(time);
+    }
+  });
+  
+  Object.values(rounds).forEach(round => {
+    round.firstDate = round.games[0].date;
+    round.lastDate = round.games[round.games.length - 1].date;
+    round.signature = round.games
+      .map(game => [game.id, game.date, game.home.team, game.away.team].join('|'))
+      .join('\n');
+  });
+  
+  const index = {
+    version: ROUND_INDEX_VERSION,
+    leagueId: LEAGUE_ID,
+    seasonId: SEASON_ID,
+    builtAt: now,
+    order: sortRoundKeys(Object.keys(rounds)),
+    rounds
+  };
+  refreshRoundStatus(index, now);
+  return index;
+}
+
+/**
+ * עדכון סטטוס שוחק/קרוב לפי השעה הנוכחית
+ * @returns {Array} מחזורים שהסטטוס שלהם השתנה
+ */
+function refreshRoundStatus(index, now = Date.now()) {
+  const changed = [];
+  index.order.forEach(key => {
+    const round = index.rounds[key];
+    const upcoming = round.times.filter(time => time >= now).length;
+    const played = round.times.length - upcoming;
+    if (round.played !== played || round.upcoming !== upcoming) {
+      changed.push(key);
+    }
+    round.played = played;
+    round.upcoming = upcoming;
+    round.status = upcoming === 0 ? 'played' : (played === 0 ? 'upcoming' : 'partial');
+  });
+  index.statusAt = now;
+  return changed;
+}
+
+/**
+ * מחזור ברירת מחדל: המחזור של המשחק העתידי הקרוב ביותר, אחרת המחזור האחרון ששוחק
+ * (אותם כללים כמו findDefaultRound)
+ */
+function findDefaultRoundInIndex(index, now = Date.now()) {
+  let closestRound = null;
+  let minDiff = Infinity;
+  let latestPastRound = null;
+  let latestPastTime = -Infinity;
+  
+  index.order.forEach(key => {
+    const times = index.rounds[key].times;
+    const next = times.find(time => time >= now);
+    if (next !== undefined && next - now < minDiff) {
+      minDiff = next - now;
+      closestRound = key;
+    }
+    
+    for (let i = times.length - 1; i >= 0; i--) {
+      if (times[i] < now) {
+        if (times[i] > latestPastTime) {
+          latestPastTime = times[i];
+          latestPastRound = key;
+        }
+        break;
+      }
+    }
+  });
+  
+  return closestRound || latestPastRound || index.order[0] || null;
+}
+
+function gamesByRoundFromIndex(index) {
+  const gamesByRound = {};
+  index.order.forEach(key => {
+    gamesByRound[key] = index.rounds[key].games;
+  });
+  return gamesByRound;
+}
+
+/**
+ * השוואת שני אינדקסים
+ * @returns {Object} { changed: מחזורים חדשים או שהמשחקים בהם השתנו, removed: מחזורים שנעלמו }
+ */
+function diffRoundIndex(previous, next) {
+  const previousRounds = previous?.rounds || {};
+  const changed = next.order.filter(key => previousRounds[key]?.signature !== next.rounds[key].signature);
+  const removed = Object.keys(previousRounds).filter(key => !next.rounds[key]);
+  return { changed, removed };
+}
+
+function loadRoundIndex() {
+  try {
+    if (typeof localStorage === 'undefined') return null;
+    const stored = localStorage.getItem(ROUND_INDEX_STORAGE_KEY);
+    if (!stored) return null;
+    
+    const index = JSON.parse(stored);
+    if (index?.version !== ROUND_INDEX_VERSION || index.leagueId !== LEAGUE_ID || index.seasonId !== SEASON_ID) {
+      return null;
+    }
+    return index;
+  } catch (error) {
+    console.warn('⚠️ Could not read saved round index:', error);
+    return null;
+  }
+}
+
+function saveRoundIndex(index) {
+  try {
+    if (typeof localStorage === 'undefined') return;
+    localStorage.setItem(ROUND_INDEX_STORAGE_KEY, JSON.stringify(index));
+  } catch (error) {
+    console.warn('⚠️ Could not save round index:', error);
+  }
+}
+
+function setCachedRoundIndex(index) {
+  cachedRoundIndex = index;
+  cachedGamesByRound = gamesByRoundFromIndex(index);
+  cachedGames = index.order.flatMap(key => index.rounds[key].games);
+}
+
+/**
+ * הצגה מלאה מאינדקס (dropdown + טבלת מחזור ברירת המחדל)
+ */
+function applyRoundIndex(index, now = Date.now()) {
+  refreshRoundStatus(index, now);
+  setCachedRoundIndex(index);
+  
+  const defaultRound = findDefaultRoundInIndex(index, now);
+  console.log(`🎯 Default round selected: ${defaultRound}`);
+  renderUpcomingGamesUI(cachedGamesByRound, defaultRound);
+}
+
+/**
+ * רענון ברקע: טעינה מה-API, שמירה, והצגה מחדש רק של מה שהשתנה
+ * @returns {Promise<Array>} מחזורים שהשתנו
+ */
+async function revalidateRoundIndex(now = Date.now()) {
+  const games = await fetchUpcomingGamesFromApi();
+  if (games.length === 0) {
+    console.log('ℹ️ API returned no games, keeping saved rounds');
+    return [];
+  }
+  
+  const next = buildRoundIndex(games, now);
+  const { changed, removed } = diffRoundIndex(cachedRoundIndex, next);
+  saveRoundIndex(next);
+  
+  if (changed.length === 0 && removed.length === 0) {
+    console.log('✅ Saved round index is up to date');
+    setCachedRoundIndex(next);
+    return [];
+  }
+  
+  console.log(`🔄 Rounds changed since last visit: ${changed.join(', ') || '-'}${removed.length ? ` (removed: ${removed.join(', ')})` : ''}`);
+  setCachedRoundIndex(next);
+  
+  // ה-dropdown מציג את מספר המשחקים בכל מחזור - זול לבנות מחדש
+  const shownRound = next.rounds[currentRound] ? currentRound : findDefaultRoundInIndex(next, now);
+  renderRoundDropdown(cachedGamesByRound, shownRound);
+  
+  // הטבלה מוצגת מחדש רק אם המחזור המוצג השתנה או נעלם
+  if (shownRound !== currentRound || changed.includes(shownRound)) {
+    currentRound = shownRound;
+    if (shownRound) {
+      renderUpcomingGamesTable(cachedGamesByRound[shownRound], shownRound);
+    } else {
+      showNoGamesMessage();
+    }
+  }
+  
+  return changed;
+}
+
 // ========================================
 // הצגת הממשק המלא
 // ========================================
@@ -209,6 +444,8 @@ function renderUpcomingGamesUI(gamesByRound, defaultRound) {
   console.log('🎨 [UPCOMING] defaultRound:', defaultRound);
   console.log('🎨 [UPCOMING] games in defaultRound:', gamesByRound[defaultRound]?.length || 0);
   
+  currentRound = defaultRound;
+  
   // עדכון dropdown של מחזורים
   renderRoundDropdown(gamesByRound, defaultRound);
   
@@ -651,9 +888,63 @@ function renderSelectedRound(roundNumber) {
     return;
   }
   
+  currentRound = roundNumber;
   renderUpcomingGamesTable(cachedGamesByRound[roundNumber], roundNumber);
 }
 
+// ========================================
+// הכנת דוחות לכל משחקי מחזור (batch)
+// ========================================
+
+let roundReportsRunner = null;
+
+function getRoundFixtures(roundNumber) {
+  const games = cachedGamesByRound?.[roundNumber] || [];
+  
+  return games
+    .map((game, index) => ({
+      gameId: game.id || `game-${index}`,
+      date: game.date,
+      round: roundNumber,
+      homeTeam: decodeHtmlEntities(game.home?.team || ''),
+      awayTeam: decodeHtmlEntities(game.away?.team || '')
+    }))
+    .filter(fixture => fixture.homeTeam && fixture.awayTeam);
+}
+
+/**
+ * בניית דוחות ניתוח לכל משחקי המחזור ב-workers (הדף לא נתקע)
+ * @param {string|number} roundNumber - מפתח ב-gamesByRound
+ * @param {Object} options - { onReport(result, index), signal, concurrency, useWorkers }
+ * @returns {Promise<Array>} [{ fixture, report } | { fixture, error }]
+ */
+async function prepareRoundReports(roundNumber, options = {}) {
+  if (!window.IBBAAnalytics || !window.IBBAAdvanced || !window.IBBARoundReports) {
+    throw new Error('מודולי הניתוח המתקדם לא נטענו');
+  }
+  if (!Array.isArray(window.allGames) || window.allGames.length === 0) {
+    throw new Error('המשחקים עדיין נטענים...');
+  }
+  
+  const fixtures = getRoundFixtures(roundNumber);
+  console.log(`📋 Preparing ${fixtures.length} reports for round ${roundNumber}`);
+  
+  const advanced = new window.IBBAAdvanced(new window.IBBAAnalytics(window.allGames));
+  if (window.playerNamesLoader) {
+    advanced.setPlayerNames(window.playerNamesLoader);
+  }
+  
+  cancelRoundReports();
+  roundReportsRunner = new window.IBBARoundReports(advanced, options);
+  return roundReportsRunner.run(fixtures, options);
+}
+
+function cancelRoundReports() {
+  if (roundReportsRunner) {
+    roundReportsRunner.cancel();
+  }
+}
+
 // ========================================
 // הצגת הודעות UI
 // ========================================
@@ -722,5 +1013,7 @@ function hideStatusMessage() {
 
 window.loadUpcomingGames = loadUpcomingGames;
 window.renderSelectedRound = renderSelectedRound;
+window.prepareRoundReports = prepareRoundReports;
+window.cancelRoundReports = cancelRoundReports;
 
 console.log('✅ Upcoming Games module loaded successfully! (PURE API version)');
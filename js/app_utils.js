@@ -241,6 +241,7 @@
           req.onsuccess = () => resolve();
           req.onerror = () => reject(req.error);
         });
+        window.dbAdapter?.notifyWrite?.('players', [playerData.id]);
         
         // Save aliases
         const aliasTx = db.transaction(['player_aliases'], 'readwrite');
@@ -537,6 +538,7 @@ function initDb() {
         const tx=DB.transaction(["teams"],"readwrite");
         const store=tx.objectStore("teams");
         await new Promise((res,rej)=>{ const rq=store.put(rec); rq.onsuccess=()=>res(); rq.onerror=()=>rej(rq.error); });
+        window.dbAdapter?.notifyWrite?.('teams', [rec.team_id]);
         await loadTeamsIndex(); // רענון אינדקס הקבוצות
       } else {
         const idx = TEAMS_MEM.findIndex(t=>t.team_id===rec.team_id);
@@ -159,6 +159,346 @@ function deepRepairHebrewNames(obj) {
   return obj;
 }
 
+// ========================================
+// תיקון גורף (batch) - אוספים שלמים של שחקנים / קבוצות / משחקים
+// ========================================
+// - מסווג מהיר במעבר אחד: עברית תקינה / ASCII בלי \xNN לא עוברים בניית בתים בכלל
+// - מפענח עם טבלת בתים (אותה תוצאה בדיוק כמו buildBytesFromCp1252PrintedString) ו-TextDecoder יחיד
+// - שמות חוזרים (קבוצה מופיעה בכל משחק) מפוענחים פעם אחת - memo לכל ריצה
+// - רשומות עוברות במנות: קריאה בטווח מפתחות, תיקון, וכתיבה חזרה של הרשומות שהשתנו בטרנזקציה אחת
+
+const REPAIR_BATCH_SIZE = 200;
+const REPAIR_REPORT_LIMIT = 200;
+
+// תו → בית (-1 = אין מיפוי): 0x00-0xFF לעצמם, ותווי CP1252 של 0x80-0x9F
+const CP1252_CHAR_TO_BYTE = (() => {
+  const table = new Int16Array(0x2123).fill(-1);
+  for (let code = 0; code <= 0xFF; code++) table[code] = code;
+  for (const [code, byte] of Object.entries(CP1252_UNICODE_TO_BYTE)) table[code] = byte;
+  return table;
+})();
+
+const HEX_VALUE = (() => {
+  const table = new Int8Array(128).fill(-1);
+  for (let i = 0; i < 10; i++) table[0x30 + i] = i;
+  for (let i = 0; i < 6; i++) {
+    table[0x41 + i] = 10 + i;
+    table[0x61 + i] = 10 + i;
+  }
+  return table;
+})();
+
+let sharedUtf8Decoder = null;
+
+function hexAt(input, i) {
+  const code = input.charCodeAt(i);
+  return code < 128 ? HEX_VALUE[code] : -1;
+}
+
+function hasEscapeAt(input, i) {
+  return input.charCodeAt(i) === 0x5C && input.charCodeAt(i + 1) === 0x78 && hexAt(input, i + 2) >= 0 && hexAt(input, i + 3) >= 0;
+}
+
+/**
+ * סיווג במעבר אחד
+ * 'clean' - repairHebrewNames יחזיר את הקלט כמו שהוא (עברית בלי × ו-\xNN, או ASCII בלי \xNN)
+ * 'suspect' - צריך פענוח
+ */
+function classifyHebrewText(input) {
+  let hasHebrew = false;
+  let hasHigh = false;
+  for (let i = 0; i < input.length; i++) {
+    const code = input.charCodeAt(i);
+    if (code === 0xD7) return 'suspect';
+    if (code === 0x5C && hasEscapeAt(input, i)) return 'suspect';
+    if (code >= 0x0590 && code <= 0x05FF) hasHebrew = true;
+    else if (code >= 0x80) hasHigh = true;
+  }
+  return hasHebrew || !hasHigh ? 'clean' : 'suspect';
+}
+
+/**
+ * כמו fixFromCp1252PrintedUtf8 - מעבר אחד עם טבלת בתים ומערך בתים מוקצה מראש
+ */
+function fastFixFromCp1252PrintedUtf8(input) {
+  const bytes = new Uint8Array(input.length + 1);
+  let length = 0;
+  let i = 0;
+  let awaitingSecondByte = false;
+
+  while (i < input.length) {
+    if (input.charCodeAt(i) === 0x5C && i + 3 < input.length && input.charCodeAt(i + 1) === 0x78) {
+      const h1 = hexAt(input, i + 2);
+      const h2 = hexAt(input, i + 3);
+      if (h1 >= 0 && h2 >= 0) {
+        bytes[length++] = h1 * 16 + h2;
+        awaitingSecondByte = false;
+        i += 4;
+        continue;
+      }
+    }
+
+    const code = input.codePointAt(i);
+    if (code === 0xD7) {
+      bytes[length++] = 0xD7;
+      awaitingSecondByte = true;
+      i++;
+      continue;
+    }
+
+    if (awaitingSecondByte) {
+      awaitingSecondByte = false;
+      if (code === 0x22) {
+        let runLen = 0;
+        while (i < input.length && input.charCodeAt(i) === 0x22) {
+          runLen++;
+          i++;
+        }
+        bytes[length++] = runLen % 2 === 0 ? 0x93 : 0x94;
+        continue;
+      }
+      if (code === 0x27) { bytes[length++] = 0x91; i++; continue; }
+      if (code === 0x20) { bytes[length++] = 0xA0; i++; continue; }
+      // אחרי D7 רק תווים מעל ASCII ממופים (0x80-0x9F לעצמם, Latin-1, תווי CP1252)
+      const byte = code >= 0x80 && code < CP1252_CHAR_TO_BYTE.length ? CP1252_CHAR_TO_BYTE[code] : -1;
+      bytes[length++] = byte >= 0 ? byte : 0x3F;
+      i += byte < 0 && code > 0xFFFF ? 2 : 1;
+      continue;
+    }
+
+    const byte = code < CP1252_CHAR_TO_BYTE.length ? CP1252_CHAR_TO_BYTE[code] : -1;
+    bytes[length++] = byte >= 0 ? byte : 0x3F;
+    i += byte < 0 && code > 0xFFFF ? 2 : 1;
+  }
+
+  if (awaitingSecondByte) bytes[length++] = 0x3F;
+
+  try {
+    if (!sharedUtf8Decoder) sharedUtf8Decoder = new TextDecoder("utf-8", { fatal: true });
+    return sharedUtf8Decoder.decode(bytes.subarray(0, length));
+  } catch {
+    return null;
+  }
+}
+
+function countChar(text, char) {
+  let count = 0;
+  for (let i = text.indexOf(char); i !== -1; i = text.indexOf(char, i + 1)) count++;
+  return count;
+}
+
+/**
+ * הקשר לריצה אחת: memo + מונים
+ * תיקון שמוסיף '?' (תווים ללא מיפוי, למשל קירילית) נדחה - בתיקון גורף זה היה הורס טקסט תקין
+ */
+function createHebrewRepairContext() {
+  const memo = new Map();
+  const stats = { strings: 0, clean: 0, decoded: 0, memoHits: 0, lossySkipped: 0 };
+
+  function repair(input) {
+    stats.strings++;
+    if (!input) return input;
+    if (classifyHebrewText(input) === 'clean') {
+      stats.clean++;
+      return input;
+    }
+    const cached = memo.get(input);
+    if (cached !== undefined) {
+      stats.memoHits++;
+      return cached;
+    }
+
+    stats.decoded++;
+    let output = fastFixFromCp1252PrintedUtf8(input) ?? input;
+    if (output !== input && countChar(output, '?') > countChar(input, '?')) {
+      stats.lossySkipped++;
+      output = input;
+    }
+    memo.set(input, output);
+    return output;
+  }
+
+  return { repair, memo, stats };
+}
+
+// trail = מסלול השדה הנוכחי (מחרוזת המסלול נבנית רק כשיש שינוי)
+function formatRepairPath(trail) {
+  let path = '';
+  for (const part of trail) {
+    path += typeof part === 'number' ? `[${part}]` : (path ? `.${part}` : part);
+  }
+  return path;
+}
+
+function repairDeepValue(value, context, trail, changes) {
+  if (typeof value === 'string') {
+    const fixed = context.repair(value);
+    if (fixed !== value) changes.push({ path: formatRepairPath(trail), before: value, after: fixed });
+    return fixed;
+  }
+  if (!value || typeof value !== 'object') return value;
+  if (Array.isArray(value)) {
+    let out = value;
+    for (let i = 0; i < value.length; i++) {
+      trail.push(i);
+      const fixed = repairDeepValue(value[i], context, trail, changes);
+      trail.pop();
+      if (fixed !== value[i]) {
+        if (out === value) out = value.slice();
+        out[i] = fixed;
+      }
+    }
+    return out;
+  }
+  if (Object.prototype.toString.call(value) === '[object Object]') {
+    let out = value;
+    for (const key in value) {
+      if (!Object.prototype.hasOwnProperty.call(value, key)) continue;
+      trail.push(key);
+      const fixed = repairDeepValue(value[key], context, trail, changes);
+      trail.pop();
+      if (fixed !== value[key]) {
+        if (out === value) out = { ...value };
+        out[key] = fixed;
+      }
+    }
+    return out;
+  }
+  return value;
+}
+
+/**
+ * תיקון רשומה אחת (copy-on-write - רשומה בלי שינוי מוחזרת כמו שהיא)
+ * @param {Object} record
+ * @param {Object} options - { context, keyPath } - שדות המפתח לא משתנים (מזהה שחקן כולל את השם)
+ * @returns {{record: Object, changes: Array<{path, before, after}>}}
+ */
+function repairRecordHebrew(record, options = {}) {
+  const context = options.context || createHebrewRepairContext();
+  const keyFields = new Set([].concat(options.keyPath || []));
+  const changes = [];
+
+  if (!record || typeof record !== 'object' || Array.isArray(record)) {
+    return { record: repairDeepValue(record, context, [], changes), changes };
+  }
+
+  let out = record;
+  const trail = [];
+  for (const key of Object.keys(record)) {
+    if (keyFields.has(key)) continue;
+    trail[0] = key;
+    const fixed = repairDeepValue(record[key], context, trail, changes);
+    if (fixed !== record[key]) {
+      if (out === record) out = { ...record };
+      out[key] = fixed;
+    }
+  }
+  return { record: out, changes };
+}
+
+/**
+ * תיקון אוסף שלם בזיכרון
+ * @returns {{records: Array, changed: Array<{index, record, changes}>, stats: Object}}
+ */
+function repairCollectionHebrew(records, options = {}) {
+  const context = options.context || createHebrewRepairContext();
+  const changed = [];
+  const out = records.map((record, index) => {
+    const result = repairRecordHebrew(record, { context, keyPath: options.keyPath });
+    if (result.changes.length > 0) changed.push({ index, record: result.record, changes: result.changes });
+    return result.record;
+  });
+  return { records: out, changed, stats: context.stats };
+}
+
+function readRepairBatch(db, storeName, afterKey, limit) {
+  return new Promise((resolve, reject) => {
+    const tx = db.transaction([storeName], 'readonly');
+    const store = tx.objectStore(storeName);
+    const range = afterKey === undefined ? null : IDBKeyRange.lowerBound(afterKey, true);
+    const valuesReq = store.getAll(range, limit);
+    const keysReq = store.getAllKeys(range, limit);
+    tx.oncomplete = () => resolve({ rows: valuesReq.result, keys: keysReq.result, keyPath: store.keyPath });
+    tx.onabort = () => reject(tx.error || valuesReq.error || keysReq.error);
+  });
+}
+
+function writeRepairBatch(db, storeName, entries, inlineKeys) {
+  return new Promise((resolve, reject) => {
+    const tx = db.transaction([storeName], 'readwrite');
+    const store = tx.objectStore(storeName);
+    entries.forEach(({ record, key }) => {
+      if (inlineKeys) store.put(record);
+      else store.put(record, key);
+    });
+    tx.oncomplete = () => resolve(entries.length);
+    tx.onabort = () => reject(tx.error);
+  });
+}
+
+/**
+ * תיקון גורף של מסד IndexedDB שלם, מנה אחרי מנה
+ * @param {IDBDatabase} db
+ * @param {Object} options - { stores, batchSize, dryRun, onProgress({store, scanned, changed}), reportLimit }
+ * @returns {Promise<Object>} דוח: סיכום לכל store, השינויים (עד reportLimit) ומוני המסווג / memo
+ */
+async function repairDatabaseHebrew(db, options = {}) {
+  const {
+    stores = ['teams', 'players', 'games'],
+    batchSize = REPAIR_BATCH_SIZE,
+    dryRun = false,
+    onProgress = null,
+    reportLimit = REPAIR_REPORT_LIMIT
+  } = options;
+  const now = () => (typeof performance !== 'undefined' ? performance.now() : Date.now());
+  const startedAt = now();
+  const context = createHebrewRepairContext();
+  const report = { dryRun, stores: {}, changes: [], omittedChanges: 0, stats: context.stats, durationMs: 0 };
+
+  for (const storeName of stores) {
+    if (!db.objectStoreNames.contains(storeName)) continue;
+    const summary = { scanned: 0, changedRecords: 0, changedFields: 0 };
+    report.stores[storeName] = summary;
+
+    let afterKey;
+    for (;;) {
+      const { rows, keys, keyPath } = await readRepairBatch(db, storeName, afterKey, batchSize);
+      if (rows.length === 0) break;
+
+      const { changed } = repairCollectionHebrew(rows, { context, keyPath });
+      const entries = changed.map(({ index, record, changes }) => ({ record, key: keys[index], changes }));
+      if (!dryRun && entries.length > 0) {
+        await writeRepairBatch(db, storeName, entries, keyPath !== null && keyPath !== undefined);
+      }
+
+      summary.scanned += rows.length;
+      summary.changedRecords += entries.length;
+      entries.forEach(({ key, changes }) => {
+        summary.changedFields += changes.length;
+        changes.forEach(change => {
+          if (report.changes.length < reportLimit) report.changes.push({ store: storeName, key, ...change });
+          else report.omittedChanges++;
+        });
+      });
+      if (onProgress) onProgress({ store: storeName, scanned: summary.scanned, changed: summary.changedRecords });
+
+      afterKey = keys[keys.length - 1];
+      if (rows.length < batchSize) break;
+    }
+
+    if (!dryRun && summary.changedRecords > 0 && typeof window !== 'undefined') {
+      window.dbAdapter?.notifyWrite?.(storeName);
+    }
+  }
+
+  report.stats = { ...context.stats, memoSize: context.memo.size };
+  report.durationMs = Math.round(now() - startedAt);
+  console.log(`🔤 Hebrew repair${dryRun ? ' (dry run)' : ''}: ` +
+    Object.entries(report.stores).map(([store, s]) => `${store} ${s.changedRecords}/${s.scanned}`).join(', ') +
+    ` in ${report.durationMs}ms`);
+  return report;
+}
+
 // Expose functions to global scope
 window.looksLikeCleanHebrew = looksLikeCleanHebrew;
 window.isHexPair = isHexPair;
@@ -167,5 +507,11 @@ window.decodeUtf8 = decodeUtf8;
 window.fixFromCp1252PrintedUtf8 = fixFromCp1252PrintedUtf8;
 window.repairHebrewNames = repairHebrewNames;
 window.deepRepairHebrewNames = deepRepairHebrewNames;
+window.classifyHebrewText = classifyHebrewText;
+window.fastFixFromCp1252PrintedUtf8 = fastFixFromCp1252PrintedUtf8;
+window.createHebrewRepairContext = createHebrewRepairContext;
+window.repairRecordHebrew = repairRecordHebrew;
+window.repairCollectionHebrew = repairCollectionHebrew;
+window.repairDatabaseHebrew = repairDatabaseHebrew;
 
 console.log('CP-1252 to UTF-8 repair utility loaded (final production version)');
\ No newline at end of file
@@ -205,6 +205,62 @@
     });
   }
 
+  /**
+   * Get many games by ID in one query per chunk (instead of one getGame per ID)
+   * @param {Array} gameSerials - game IDs
+   * @param {Object} options - { columns, chunkSize }
+   * @returns {Promise<Array>} rows that exist (missing IDs are simply absent)
+   */
+  async function dbGetGamesByIds(gameSerials, options = {}) {
+    const { columns = '*', chunkSize = 200 } = options;
+    const ids = [...new Set(gameSerials)].filter(id => id !== null && id !== undefined);
+    if (ids.length === 0) return [];
+
+    if (useSupabase && supabase) {
+      const rows = [];
+      for (let i = 0; i < ids.length; i += chunkSize) {
+        const chunk = ids.slice(i, i + chunkSize);
+        const { data, error } = await supabase
+          .from('games')
+          .select(columns)
+          .in('gameSerial', chunk);
+        
+        if (error) {
+          console.error('Error getting games by IDs:', error);
+          throw error;
+        }
+        rows.push(...(data || []));
+      }
+      return rows;
+    }
+
+    // IndexedDB fallback - all lookups in a single transaction
+    if (!DB) return [];
+    return new Promise((resolve) => {
+      const rows = [];
+      const tx = DB.transaction(['games'], 'readonly');
+      const store = tx.objectStore('games');
+      ids.forEach(id => {
+        const request = store.get(id);
+        request.onsuccess = () => {
+          if (request.result) rows.push(request.result);
+        };
+      });
+      tx.oncomplete = () => resolve(rows);
+      tx.onerror = () => resolve(rows);
+    });
+  }
+
+  /**
+   * Check which game IDs already exist (fetches only the key column)
+   * @returns {Promise<Set>} subset of the given IDs that exist
+   */
+  async function dbGameIdsExist(gameSerials, options = {}) {
+    const rows = await dbGetGamesByIds(gameSerials, { ...options, columns: 'gameSerial' });
+    const found = new Set(rows.map(row => String(row.gameSerial)));
+    return new Set(gameSerials.filter(id => found.has(String(id))));
+  }
+
   /**
    * Save/update game
    * Uses Edge Function if admin is authenticated, otherwise direct Supabase
@@ -240,6 +296,7 @@
         
         const result = await response.json();
         console.log('✅ Saved via Edge Function:', result);
+        teamAggregatesSynced = false; // save-game updated team_aggregates on the server
         return gameData; // Return original gameData for consistency
       } catch (error) {
         console.error('❌ Edge Function error:', error);
@@ -265,13 +322,84 @@
 
     // IndexedDB fallback
     if (!DB) throw new Error('Database not available');
-    return new Promise((resolve, reject) => {
+    await new Promise((resolve, reject) => {
       const tx = DB.transaction(['games'], 'readwrite');
       const store = tx.objectStore('games');
       const request = store.put(gameData);
       request.onsuccess = () => resolve(gameData);
       request.onerror = () => reject(request.error);
     });
+    await applyLocalTeamGameTotals(gameData, playersData);
+    return gameData;
+  }
+
+  /**
+   * Bulk save: one upsert per table for a whole batch of games
+   * Uses the save-games-bulk Edge Function if admin is authenticated
+   * @param {Object} payload - { games, appearances, playerStats }
+   */
+  async function dbSaveGamesBulk({ games = [], appearances = [], playerStats = [] }) {
+    const adminPassword = window.authModule?.getPassword?.();
+    
+    if (useSupabase && supabase && adminPassword) {
+      const supabaseUrl = window.CONFIG?.SUPABASE_URL;
+      const anonKey = window.CONFIG?.SUPABASE_ANON_KEY;
+      const response = await fetch(`${supabaseUrl}/functions/v1/save-games-bulk`, {
+        method: 'POST',
+        headers: {
+          'Content-Type': 'application/json',
+          'Authorization': `Bearer ${anonKey}`,
+          'apikey': anonKey,
+          'x-admin-password': adminPassword
+        },
+        body: JSON.stringify({ games, appearances, playerStats })
+      });
+      
+      if (!response.ok) {
+        const errorText = await response.text();
+        throw new Error(`Bulk Edge Function call failed: ${response.status} ${errorText}`);
+      }
+      
+      return await response.json();
+    }
+    
+    if (useSupabase && supabase) {
+      // Direct Supabase (will fail if RLS is enabled)
+      const writes = [
+        ['games', games, 'gameSerial'],
+        ['appearances', appearances, 'playerId,gameId'],
+        ['player_stats', playerStats, 'playerId,gameId']
+      ];
+      
+      for (const [table, rows, onConflict] of writes) {
+        if (rows.length === 0) continue;
+        const { error } = await supabase.from(table).upsert(rows, { onConflict });
+        if (error) {
+          console.error(`Error bulk saving ${table}:`, error);
+          throw error;
+        }
+      }
+      
+      return { success: true, games: games.length, appearances: appearances.length, playerStats: playerStats.length };
+    }
+    
+    // IndexedDB fallback - one transaction for all three stores
+    // (deterministic keys so re-ingesting a game overwrites instead of duplicating)
+    if (!DB) throw new Error('Database not available');
+    return new Promise((resolve, reject) => {
+      const tx = DB.transaction(['games', 'appearances', 'player_stats'], 'readwrite');
+      const gamesStore = tx.objectStore('games');
+      const appearancesStore = tx.objectStore('appearances');
+      const statsStore = tx.objectStore('player_stats');
+      
+      games.forEach(row => gamesStore.put(row));
+      appearances.forEach(row => appearancesStore.put({ ...row, appearanceId: `${row.gameId}:${row.playerId}` }));
+      playerStats.forEach(row => statsStore.put({ ...row, statId: `${row.gameId}:${row.playerId}` }));
+      
+      tx.oncomplete = () => resolve({ success: true, games: games.length, appearances: appearances.length, playerStats: playerStats.length });
+      tx.onerror = () => reject(tx.error);
+      tx.onabort = () => reject(tx.error || new Error('Bulk save transaction aborted'));
+    });
   }
 
   /**
@@ -307,6 +435,7 @@
           
           const result = await response.json();
           console.log('✅ Game deleted via Edge Function:', result);
+          teamAggregatesSynced = false; // delete-game updated team_aggregates on the server
           return true;
         } catch (edgeFunctionError) {
           console.error('❌ Edge Function error:', edgeFunctionError);
@@ -330,24 +459,414 @@
 
     // IndexedDB fallback
     if (!DB) throw new Error('Database not available');
-    return new Promise((resolve, reject) => {
+    await new Promise((resolve, reject) => {
       const tx = DB.transaction(['games'], 'readwrite');
       const store = tx.objectStore('games');
       const request = store.delete(gameSerial);
       request.onsuccess = () => resolve(true);
       request.onerror = () => reject(request.error);
     });
+    await removeLocalTeamGameTotals(gameSerial);
+    return true;
   }
 
   // ========================================
-  // PLAYERS API
+  // TEAM AGGREGATES API
+  // ========================================
+  // Supabase: team_aggregates (kept up to date by save-game / delete-game, see add_team_aggregates.sql)
+  // IndexedDB: the local TeamAggregateStore is updated on every saveGame / deleteGame
+  // Either way the rows are mirrored locally, so game prep reads one small table instead of all players
+  // Any other write to players / games (restore, clearing stats, encoding repair...) drops the mirror
+  // through notifyWrite, and the next read rebuilds it
+
+  // Tables the team aggregates are computed from (players.games + games rows)
+  const TEAM_AGGREGATE_SOURCES = new Set(['players', 'games']);
+
+  let teamAggregateStore = null;
+  let teamAggregatesSynced = false;
+  let teamAggregatesClearing = Promise.resolve();
+
+  function getTeamAggregateStore() {
+    if (!teamAggregateStore && window.TeamAggregates) {
+      teamAggregateStore = new window.TeamAggregates.TeamAggregateStore();
+    }
+    return teamAggregateStore;
+  }
+
+  /**
+   * Drop the mirror after a write it was not updated for (Supabase: refetch team_aggregates on the next read)
+   */
+  function invalidateTeamAggregates() {
+    teamAggregatesSynced = false;
+    const store = getTeamAggregateStore();
+    if (!store || useSupabase) return;
+    teamAggregatesClearing = teamAggregatesClearing
+      .then(() => store.replaceAll([]))
+      .catch(error => console.warn('⚠️ Team aggregates not cleared (run checkTeamAggregates to repair):', error));
+  }
+
+  /**
+   * The mirror is empty until the first read builds it from all players -
+   * a single game's totals must not be applied to it before that
+   */
+  async function hasLocalTeamAggregates(store) {
+    await teamAggregatesClearing;
+    return (await store.getAll()).length > 0;
+  }
+
+  async function applyLocalTeamGameTotals(gameData, playersData) {
+    const store = getTeamAggregateStore();
+    if (!store) return;
+    try {
+      if (!(await hasLocalTeamAggregates(store))) return;
+      const { buildGameTotals, collectGameLines } = window.TeamAggregates;
+      const rows = buildGameTotals(gameData.gameSerial, gameData.teams, collectGameLines(playersData, gameData.gameSerial));
+      await store.applyGame(gameData.gameSerial, rows);
+    } catch (error) {
+      console.warn('⚠️ Team aggregates not updated (run checkTeamAggregates to repair):', error);
+    }
+  }
+
+  async function removeLocalTeamGameTotals(gameSerial) {
+    const store = getTeamAggregateStore();
+    if (!store) return;
+    try {
+      if (!(await hasLocalTeamAggregates(store))) return;
+      await store.removeGame(gameSerial);
+    } catch (error) {
+      console.warn('⚠️ Team aggregates not updated (run checkTeamAggregates to repair):', error);
+    }
+  }
+
+  /**
+   * Get the materialized aggregates of all teams (team_aggregates rows)
+   * @returns {Promise<Array|null>} null if unavailable (table not created yet) - callers fall back to a full scan
+   */
+  async function dbGetTeamAggregates() {
+    const store = getTeamAggregateStore();
+    if (!store) return null;
+
+    if (useSupabase && supabase) {
+      if (teamAggregatesSynced) return store.getAll();
+
+      const { data, error } = await supabase
+        .from('team_aggregates')
+        .select('*');
+
+      if (error) {
+        console.warn('⚠️ team_aggregates not available (run add_team_aggregates.sql):', error.message || error);
+        return null;
+      }
+      await store.replaceAll(data || []);
+      teamAggregatesSynced = true;
+      return store.getAll();
+    }
+
+    await teamAggregatesClearing;
+    const rows = await store.getAll();
+    if (rows.length > 0) return rows;
+
+    // First use of the local store - build it once from the existing players
+    const check = await dbCheckTeamAggregates({ repair: true });
+    return check.repaired ? store.getAll() : rows;
+  }
+
+  /**
+   * Get the materialized aggregates of one team
+   */
+  async function dbGetTeamAggregate(team) {
+    const rows = await dbGetTeamAggregates();
+    return rows ? rows.find(row => row.team === team) || null : null;
+  }
+
+  /**
+   * Consistency check: stored aggregates vs a full recompute from players.games
+   * @param {Object} options - { repair: rebuild when they differ }
+   * @returns {Promise<Object>} { consistent, mismatches, teams, repaired }
+   */
+  async function dbCheckTeamAggregates(options = {}) {
+    const store = getTeamAggregateStore();
+    if (!store) return { consistent: false, mismatches: [], teams: 0, repaired: false };
+
+    const { fromPlayers, diff } = window.TeamAggregates;
+    const expected = fromPlayers((await fetchPlayers()) || [], await dbGetGames());
+
+    let stored;
+    if (useSupabase && supabase) {
+      const { data, error } = await supabase.from('team_aggregates').select('*');
+      if (error) throw error;
+      stored = data || [];
+    } else {
+      await teamAggregatesClearing;
+      stored = await store.getAll();
+    }
+
+    const mismatches = diff(stored, expected.aggregates);
+    let repaired = false;
+
+    if (mismatches.length > 0) {
+      console.warn(`⚠️ Team aggregates differ from a full recompute (${mismatches.length} values):`, mismatches.slice(0, 10));
+      if (options.repair) {
+        if (useSupabase && supabase) {
+          const { error } = await supabase.rpc('rebuild_team_aggregates');
+          if (error) {
+            console.warn('⚠️ rebuild_team_aggregates failed - run it in the Supabase SQL Editor:', error.message || error);
+          } else {
+            repaired = true;
+            teamAggregatesSynced = false;
+          }
+        } else {
+          await store.replaceAll(expected.aggregates, expected.gameTotals);
+          repaired = true;
+        }
+      }
+    } else {
+      console.log(`✅ Team aggregates consistent (${expected.aggregates.length} teams)`);
+    }
+
+    return { consistent: mismatches.length === 0, mismatches, teams: expected.aggregates.length, repaired };
+  }
+
+  // ========================================
+  // ENTITY CACHE (players / teams)
   // ========================================
+  // Read-through cache with secondary indexes: players by id, players by team, teams by id
+  // - A full-table read fills the indexes, so getPlayer / getTeam / getPlayersByTeam are then local
+  // - Identical reads that are already in flight share one query
+  // - Writes invalidate through notifyWrite (dbAdapter's own write methods call it; code that writes
+  //   the IndexedDB stores directly calls dbAdapter.notifyWrite) which also dispatches a 'dbWrite' event
+  // - Entries older than CACHE_TTL_MS are refetched (another admin may have written to Supabase)
+  // - Callers get copies: several paths modify a fetched player and then save it
+
+  const CACHE_TTL_MS = 5 * 60 * 1000;
+  const entityCache = {
+    players: createTableCache('id'),
+    teams: createTableCache('team_id')
+  };
+  const inflightReads = new Map();
+  const cacheStats = { hits: 0, misses: 0, shared: 0, invalidations: 0, fullLoads: { players: 0, teams: 0 } };
+
+  function createTableCache(idField) {
+    return { idField, all: null, loadedAt: 0, byId: new Map(), byTeam: null, position: null, generation: 0 };
+  }
+
+  function isFresh(loadedAt) {
+    return loadedAt > 0 && Date.now() - loadedAt < CACHE_TTL_MS;
+  }
+
+  function cloneRow(row) {
+    if (row === null || row === undefined) return row;
+    return typeof structuredClone === 'function' ? structuredClone(row) : JSON.parse(JSON.stringify(row));
+  }
+
+  /**
+   * Run loader once per key while it is in flight (later callers get the same promise)
+   */
+  function sharedRead(key, loader) {
+    if (inflightReads.has(key)) {
+      cacheStats.shared++;
+      return inflightReads.get(key);
+    }
+    cacheStats.misses++;
+    const promise = loader().finally(() => {
+      if (inflightReads.get(key) === promise) inflightReads.delete(key);
+    });
+    inflightReads.set(key, promise);
+    return promise;
+  }
+
+  // Team names a player is indexed under: current team, last seen team and every team in games[]
+  function playerTeamKeys(player) {
+    const keys = new Set();
+    if (player.team) keys.add(player.team);
+    if (player.lastSeenTeam) keys.add(player.lastSeenTeam);
+    (player.games || []).forEach(game => {
+      if (game && game.team) keys.add(game.team);
+    });
+    return keys;
+  }
+
+  function buildTeamIndex(rows) {
+    const byTeam = new Map();
+    rows.forEach(row => playerTeamKeys(row).forEach(team => {
+      if (!byTeam.has(team)) byTeam.set(team, []);
+      byTeam.get(team).push(row);
+    }));
+    return byTeam;
+  }
+
+  function fillTableCache(table, rows) {
+    const cache = entityCache[table];
+    const now = Date.now();
+    cache.all = rows;
+    cache.loadedAt = now;
+    cache.byId = new Map(rows.map(row => [String(row[cache.idField]), { row, loadedAt: now }]));
+    cache.position = new Map(rows.map((row, index) => [row, index]));
+    cache.byTeam = table === 'players' ? buildTeamIndex(rows) : null;
+    cacheStats.fullLoads[table]++;
+  }
+
+  /**
+   * Whole table, from the cache when fresh (null if the fetch failed)
+   */
+  async function readTable(table, fetchAll) {
+    const cache = entityCache[table];
+    if (cache.all && isFresh(cache.loadedAt)) {
+      cacheStats.hits++;
+      return cache.all;
+    }
+
+    return sharedRead(`${table}:*`, async () => {
+      const generation = cache.generation;
+      const rows = await fetchAll();
+      // A write during the fetch may have made these rows stale - return them but don't cache them
+      if (rows && cache.generation === generation) fillTableCache(table, rows);
+      return rows;
+    });
+  }
+
+  /**
+   * One row by id, from the cache when fresh
+   */
+  async function readEntity(table, id, fetchOne) {
+    const cache = entityCache[table];
+    const key = String(id);
+    const entry = cache.byId.get(key);
+    if (entry && isFresh(entry.loadedAt)) {
+      cacheStats.hits++;
+      return entry.row;
+    }
+
+    return sharedRead(`${table}:${key}`, async () => {
+      const generation = cache.generation;
+      const row = await fetchOne();
+      if (row && cache.generation === generation) cache.byId.set(key, { row, loadedAt: Date.now() });
+      return row;
+    });
+  }
+
+  /**
+   * Drop cached rows of a table (ids = null → the whole table)
+   */
+  function invalidateCache(table, ids = null) {
+    const cache = entityCache[table];
+    if (!cache) return;
+    cache.generation++;
+    cache.all = null;
+    cache.loadedAt = 0;
+    cache.byTeam = null;
+    cache.position = null;
+    if (ids) ids.forEach(id => cache.byId.delete(String(id)));
+    else cache.byId.clear();
+    // Reads started before the write may return old rows - later readers start a new read
+    Array.from(inflightReads.keys())
+      .filter(key => key.startsWith(`${table}:`))
+      .forEach(key => inflightReads.delete(key));
+    cacheStats.invalidations++;
+  }
+
+  /**
+   * Write event: invalidate the cache and let other modules know ('dbWrite' on window)
+   * @param {string} table - table name ('players', 'teams', ...)
+   * @param {Array|null} ids - changed row ids (null = unknown / many)
+   * @param {Object} options - { teamAggregatesApplied: the write already updated the team aggregates (saveGame / deleteGame) }
+   */
+  function notifyWrite(table, ids = null, options = {}) {
+    invalidateCache(table, ids);
+    if (!options.teamAggregatesApplied && TEAM_AGGREGATE_SOURCES.has(table)) {
+      invalidateTeamAggregates();
+    }
+    if (typeof window.dispatchEvent === 'function' && typeof CustomEvent === 'function') {
+      window.dispatchEvent(new CustomEvent('dbWrite', { detail: { table, ids } }));
+    }
+  }
+
+  /**
+   * Wrap a write method so it always ends with notifyWrite (also on failure - the write may be partial)
+   * @param {string|Function} table - table name, or (...args) => table name
+   * @param {Object} options - passed to notifyWrite
+   */
+  function withWriteEvent(table, write, idsOf = () => null, options = {}) {
+    return async function(...args) {
+      try {
+        return await write(...args);
+      } finally {
+        notifyWrite(typeof table === 'function' ? table(...args) : table, idsOf(...args), options);
+      }
+    };
+  }
+
+  function getCacheStats() {
+    return {
+      ...cacheStats,
+      fullLoads: { ...cacheStats.fullLoads },
+      inflight: inflightReads.size,
+      players: { loaded: !!entityCache.players.all, rows: entityCache.players.byId.size },
+      teams: { loaded: !!entityCache.teams.all, rows: entityCache.teams.byId.size }
+    };
+  }
 
   /**
    * Get all players
    */
   async function dbGetPlayers() {
-    console.log('📡 dbGetPlayers called, useSupabase:', useSupabase);
+    const rows = await readTable('players', fetchPlayers);
+    return (rows || []).map(cloneRow);
+  }
+
+  /**
+   * Get player by ID
+   */
+  async function dbGetPlayer(playerId) {
+    return cloneRow(await readEntity('players', playerId, () => fetchPlayer(playerId)));
+  }
+
+  /**
+   * Players who played for a team (by current team, last seen team or any game), in table order
+   * @param {string|Array} teamNames - one name or several (e.g. [team_id, name_he, name_en])
+   */
+  async function dbGetPlayersByTeam(teamNames) {
+    const names = [...new Set((Array.isArray(teamNames) ? teamNames : [teamNames]).filter(Boolean))];
+    const rows = await readTable('players', fetchPlayers);
+    if (!rows) return [];
+
+    const cache = entityCache.players;
+    const cached = cache.all === rows;
+    const byTeam = cached ? cache.byTeam : buildTeamIndex(rows);
+    const matched = new Set();
+    names.forEach(name => (byTeam.get(name) || []).forEach(row => matched.add(row)));
+
+    const position = cached ? cache.position : new Map(rows.map((row, index) => [row, index]));
+    return Array.from(matched)
+      .sort((a, b) => position.get(a) - position.get(b))
+      .map(cloneRow);
+  }
+
+  /**
+   * Get all teams
+   */
+  async function dbGetTeams() {
+    const rows = await readTable('teams', fetchTeams);
+    return (rows || []).map(cloneRow);
+  }
+
+  /**
+   * Get team by ID
+   */
+  async function dbGetTeam(teamId) {
+    return cloneRow(await readEntity('teams', teamId, () => fetchTeam(teamId)));
+  }
+
+  // ========================================
+  // PLAYERS API
+  // ========================================
+
+  /**
+   * Get all players (uncached - use dbGetPlayers)
+   * @returns {Promise<Array|null>} null on error (so the failure is not cached)
+   */
+  async function fetchPlayers() {
+    console.log('📡 fetchPlayers called, useSupabase:', useSupabase);
     
     if (useSupabase && supabase) {
       try {
@@ -358,7 +877,7 @@
         
         if (error) {
           console.error('❌ Supabase error getting players:', error);
-          return [];
+          return null;
         }
         
         console.log(`✅ Supabase returned ${data?.length || 0} players`);
@@ -366,7 +885,7 @@
         
       } catch (error) {
         console.error('❌ Exception getting players from Supabase:', error);
-        return [];
+        return null;
       }
     }
 
@@ -374,7 +893,7 @@
     console.log('📦 Using IndexedDB for players');
     if (!DB) {
       console.error('❌ IndexedDB not initialized');
-      return [];
+      return null;
     }
     
     return new Promise((resolve) => {
@@ -390,19 +909,19 @@
         
         request.onerror = (e) => {
           console.error('❌ IndexedDB error getting players:', e);
-          resolve([]);
+          resolve(null);
         };
       } catch (error) {
         console.error('❌ Exception with IndexedDB players:', error);
-        resolve([]);
+        resolve(null);
       }
     });
   }
 
   /**
-   * Get player by ID
+   * Get player by ID (uncached - use dbGetPlayer)
    */
-  async function dbGetPlayer(playerId) {
+  async function fetchPlayer(playerId) {
     if (useSupabase && supabase) {
       const { data, error } = await supabase
         .from('players')
@@ -556,10 +1075,11 @@
   // ========================================
 
   /**
-   * Get all teams
+   * Get all teams (uncached - use dbGetTeams)
+   * @returns {Promise<Array|null>} null on error (so the failure is not cached)
    */
-  async function dbGetTeams() {
-    console.log('📡 dbGetTeams called, useSupabase:', useSupabase);
+  async function fetchTeams() {
+    console.log('📡 fetchTeams called, useSupabase:', useSupabase);
     
     if (useSupabase && supabase) {
       try {
@@ -570,7 +1090,7 @@
         
         if (error) {
           console.error('❌ Supabase error getting teams:', error);
-          return [];
+          return null;
         }
         
         console.log(`✅ Supabase returned ${data?.length || 0} teams`);
@@ -578,7 +1098,7 @@
         
       } catch (error) {
         console.error('❌ Exception getting teams from Supabase:', error);
-        return [];
+        return null;
       }
     }
 
@@ -586,7 +1106,7 @@
     console.log('📦 Using IndexedDB for teams');
     if (!DB) {
       console.error('❌ IndexedDB not initialized');
-      return [];
+      return null;
     }
     
     return new Promise((resolve) => {
@@ -602,19 +1122,19 @@
         
         request.onerror = (e) => {
           console.error('❌ IndexedDB error getting teams:', e);
-          resolve([]);
+          resolve(null);
         };
       } catch (error) {
         console.error('❌ Exception with IndexedDB teams:', error);
-        resolve([]);
+        resolve(null);
       }
     });
   }
 
   /**
-   * Get team by ID
+   * Get team by ID (uncached - use dbGetTeam)
    */
-  async function dbGetTeam(teamId) {
+  async function fetchTeam(teamId) {
     if (useSupabase && supabase) {
       const { data, error } = await supabase
         .from('teams')
@@ -885,20 +1405,30 @@
     // Games
     getGames: dbGetGames,
     getGame: dbGetGame,
-    saveGame: dbSaveGame,
-    deleteGame: dbDeleteGame,
+    getGamesByIds: dbGetGamesByIds,
+    gameIdsExist: dbGameIdsExist,
+    // save-game / delete-game Edge Functions also update players
+    saveGame: withWriteEvent('players', dbSaveGame, (gameData, playersData = []) => playersData.map(player => player.id), { teamAggregatesApplied: true }),
+    saveGamesBulk: dbSaveGamesBulk,
+    deleteGame: withWriteEvent('players', dbDeleteGame, () => null, { teamAggregatesApplied: true }),
+    
+    // Team aggregates
+    getTeamAggregates: dbGetTeamAggregates,
+    getTeamAggregate: dbGetTeamAggregate,
+    checkTeamAggregates: dbCheckTeamAggregates,
     
     // Players
     getPlayers: dbGetPlayers,
     getPlayer: dbGetPlayer,
-    savePlayer: dbSavePlayer,
-    deletePlayer: dbDeletePlayer,
+    getPlayersByTeam: dbGetPlayersByTeam,
+    savePlayer: withWriteEvent('players', dbSavePlayer, playerData => [playerData?.id]),
+    deletePlayer: withWriteEvent('players', dbDeletePlayer, playerId => [playerId]),
     
     // Teams
     getTeams: dbGetTeams,
     getTeam: dbGetTeam,
-    saveTeam: dbSaveTeam,
-    deleteTeam: dbDeleteTeam,
+    saveTeam: withWriteEvent('teams', dbSaveTeam, teamData => [teamData?.team_id]),
+    deleteTeam: withWriteEvent('teams', dbDeleteTeam, teamId => [teamId]),
     
     // Player Mappings
     getPlayerMappings: dbGetPlayerMappings,
@@ -907,7 +1437,12 @@
     
     // Generic
     getAll: dbGetAll,
-    clearTable: dbClearTable,
+    clearTable: withWriteEvent(tableName => tableName, dbClearTable),
+    
+    // Entity cache
+    notifyWrite,
+    invalidateCache,
+    getCacheStats,
     
     // Utility
     isUsingSupabase,
@@ -0,0 +1,401 @@
+/**
+ * DB Backup Stream
+ * גיבוי/שחזור מלא של IndexedDB בפורמט זורם: NDJSON דחוס ב-gzip
+ *
+ * מבנה הקובץ (שורה = אובייקט JSON):
+ *   {"type":"header","appName":"BasketballStatsDB","format":"bsdb-ndjson","formatVersion":1,"stores":[...],...}
+ *   {"type":"rows","store":"teams","rows":[...]}      ← עד batchSize רשומות בשורה
+ *   ...
+ *   {"type":"end","counts":{"teams":12,...}}          ← בלי שורת end הקובץ נחשב קטוע
+ *
+ * - ייצוא: כל store נקרא במנות (getAll עם טווח מפתחות) ישר לתוך ה-stream - בלי להחזיק את כל ה-DB בזיכרון
+ * - שחזור: הקובץ נקרא ב-stream, מנה אחרי מנה, וכל מנה נכתבת בטרנזקציה אחת
+ * - קבצי JSON ישנים (exportFullDatabase הקודם) עדיין נטענים
+ */
+
+(function() {
+  'use strict';
+
+  const APP_NAME = 'BasketballStatsDB';
+  const FORMAT = 'bsdb-ndjson';
+  const FORMAT_VERSION = 1;
+  const DEFAULT_STORES = ['teams', 'players', 'games'];
+  const DEFAULT_BATCH_SIZE = 200;
+
+  function invalidBackup(message) {
+    const error = new Error(message);
+    error.code = 'INVALID_BACKUP';
+    return error;
+  }
+
+  // ---------- IndexedDB ----------
+
+  /**
+   * מנה אחת מ-store, אחרי afterKey (לא כולל)
+   * @returns {Promise<{rows: Array, lastKey: *}>}
+   */
+  function readStoreBatch(db, storeName, afterKey, limit) {
+    return new Promise((resolve, reject) => {
+      const tx = db.transaction([storeName], 'readonly');
+      const store = tx.objectStore(storeName);
+      const range = afterKey === undefined ? null : IDBKeyRange.lowerBound(afterKey, true);
+      let rows = null;
+      let keys = null;
+
+      const valuesReq = store.getAll(range, limit);
+      const keysReq = store.getAllKeys(range, limit);
+      valuesReq.onsuccess = () => { rows = valuesReq.result; };
+      keysReq.onsuccess = () => { keys = keysReq.result; };
+
+      tx.oncomplete = () => resolve({ rows, lastKey: keys.length > 0 ? keys[keys.length - 1] : undefined });
+      tx.onabort = () => reject(tx.error || valuesReq.error || keysReq.error);
+    });
+  }
+
+  /**
+   * כותב מנה בטרנזקציה אחת; רשומה שנכשלת (למשל מפתח כפול) מדולגת - כמו בשחזור הקודם
+   * @returns {Promise<{written: number, failed: number}>}
+   */
+  function writeStoreBatch(db, storeName, rows) {
+    return new Promise((resolve, reject) => {
+      const tx = db.transaction([storeName], 'readwrite');
+      const store = tx.objectStore(storeName);
+      let failed = 0;
+
+      rows.forEach(row => {
+        const req = store.add(row);
+        req.onerror = event => {
+          failed++;
+          // Continue even on error (לא מבטל את כל הטרנזקציה)
+          event.preventDefault();
+          event.stopPropagation();
+        };
+      });
+
+      tx.oncomplete = () => resolve({ written: rows.length - failed, failed });
+      tx.onabort = () => reject(tx.error);
+    });
+  }
+
+  function clearStores(db, storeNames) {
+    if (storeNames.length === 0) return Promise.resolve();
+    return new Promise((resolve, reject) => {
+      const tx = db.transaction(storeNames, 'readwrite');
+      storeNames.forEach(name => tx.objectStore(name).clear());
+      tx.oncomplete = () => resolve();
+      tx.onabort = () => reject(tx.error);
+    });
+  }
+
+  function hasStore(db, name) {
+    const names = db.objectStoreNames;
+    return !!names && (typeof names.contains === 'function' ? names.contains(name) : Array.from(names).includes(name));
+  }
+
+  // ---------- Export ----------
+
+  /**
+   * ReadableStream של שורות NDJSON (מחרוזות)
+   * @param {Object} options - {
+   *   readBatch(storeName, afterKey, limit) => Promise<{rows, lastKey}>,
+   *   stores, batchSize, meta (שדות נוספים ל-header), onProgress({ stage, store, rows })
+   * }
+   * @returns {{stream: ReadableStream, counts: Object}} counts מתמלא תוך כדי קריאה
+   */
+  function createExportStream(options) {
+    const {
+      readBatch,
+      stores = DEFAULT_STORES,
+      batchSize = DEFAULT_BATCH_SIZE,
+      meta = {},
+      onProgress = null
+    } = options;
+
+    const counts = {};
+    stores.forEach(store => { counts[store] = 0; });
+    let headerSent = false;
+    let storeIndex = 0;
+    let afterKey;
+
+    const stream = new ReadableStream({
+      async pull(controller) {
+        if (!headerSent) {
+          headerSent = true;
+          controller.enqueue(JSON.stringify({
+            type: 'header',
+            appName: APP_NAME,
+            format: FORMAT,
+            formatVersion: FORMAT_VERSION,
+            timestamp: new Date().toISOString(),
+            ...meta,
+            stores
+          }) + '\n');
+          return;
+        }
+
+        while (storeIndex < stores.length) {
+          const store = stores[storeIndex];
+          const { rows, lastKey } = await readBatch(store, afterKey, batchSize);
+
+          if (rows.length < batchSize) {
+            storeIndex++;
+            afterKey = undefined;
+          } else {
+            afterKey = lastKey;
+          }
+
+          if (rows.length > 0) {
+            counts[store] += rows.length;
+            controller.enqueue(JSON.stringify({ type: 'rows', store, rows }) + '\n');
+            if (onProgress) onProgress({ stage: 'export', store, rows: counts[store] });
+            return;
+          }
+        }
+
+        controller.enqueue(JSON.stringify({ type: 'end', counts }) + '\n');
+        controller.close();
+      }
+    });
+
+    return { stream, counts };
+  }
+
+  /**
+   * הגיבוי כ-Blob (gzip אם הדפדפן תומך ב-CompressionStream)
+   * @param {Object} options - כמו createExportStream, + compress (ברירת מחדל true)
+   * @returns {Promise<{blob: Blob, compressed: boolean, counts: Object, extension: string}>}
+   */
+  async function exportToBlob(options) {
+    const { stream, counts } = createExportStream(options);
+    const compressed = options.compress !== false && typeof CompressionStream !== 'undefined';
+
+    let bytes = stream.pipeThrough(new TextEncoderStream());
+    if (compressed) {
+      bytes = bytes.pipeThrough(new CompressionStream('gzip'));
+    }
+
+    const body = await new Response(bytes).blob();
+    return {
+      blob: new Blob([body], { type: compressed ? 'application/gzip' : 'application/x-ndjson' }),
+      compressed,
+      counts,
+      extension: compressed ? 'ndjson.gz' : 'ndjson'
+    };
+  }
+
+  /**
+   * גיבוי של מסד IndexedDB פתוח
+   * @param {IDBDatabase} db
+   * @param {Object} options - { stores, batchSize, meta, onProgress, compress }
+   */
+  function exportDatabase(db, options = {}) {
+    const stores = (options.stores || DEFAULT_STORES).filter(name => hasStore(db, name));
+    return exportToBlob({
+      ...options,
+      stores,
+      readBatch: (storeName, afterKey, limit) => readStoreBatch(db, storeName, afterKey, limit)
+    });
+  }
+
+  // ---------- Import ----------
+
+  async function* readLines(textStream) {
+    const reader = textStream.getReader();
+    let buffer = '';
+    try {
+      while (true) {
+        const { value, done } = await reader.read();
+        if (done) break;
+        buffer += value;
+        let start = 0;
+        let newline;
+        while ((newline = buffer.indexOf('\n', start)) >= 0) {
+          yield buffer.slice(start, newline);
+          start = newline + 1;
+        }
+        buffer = buffer.slice(start);
+      }
+      if (buffer) yield buffer;
+    } finally {
+      reader.releaseLock();
+    }
+  }
+
+  function tryParse(line) {
+    try {
+      return JSON.parse(line);
+    } catch (error) {
+      return null;
+    }
+  }
+
+  /**
+   * קורא קובץ גיבוי (NDJSON / NDJSON.gz / JSON ישן) ומעביר אותו במנות
+   * @param {Blob|File} file
+   * @param {Object} handlers - {
+   *   onHeader(header) - נקרא פעם אחת, אחרי אימות ולפני כל מנה (כאן מנקים את ה-DB);
+   *                      מותר לצמצם את header.stores - מנות של stores אחרים ידולגו,
+   *   onRows(store, rows) - לכל מנה, לפי הסדר,
+   *   onProgress({ stage, store, rows, bytesRead, totalBytes }),
+   *   stage - שם השלב בדיווחי ההתקדמות (ברירת מחדל 'import'),
+   *   batchSize - גודל מנה לקבצי JSON ישנים
+   * }
+   * @returns {Promise<{format: string, compressed: boolean, header: Object, counts: Object}>}
+   */
+  async function readBackup(file, handlers = {}) {
+    const { onHeader = null, onRows, onProgress = null, stage = 'import', batchSize = DEFAULT_BATCH_SIZE } = handlers;
+    const totalBytes = file.size;
+    let bytesRead = 0;
+
+    const magic = new Uint8Array(await file.slice(0, 2).arrayBuffer());
+    const compressed = magic[0] === 0x1f && magic[1] === 0x8b;
+    if (compressed && typeof DecompressionStream === 'undefined') {
+      throw invalidBackup('הדפדפן אינו תומך בקבצי גיבוי דחוסים');
+    }
+
+    let bytes = file.stream().pipeThrough(new TransformStream({
+      transform(chunk, controller) {
+        bytesRead += chunk.byteLength;
+        controller.enqueue(chunk);
+      }
+    }));
+    if (compressed) {
+      bytes = bytes.pipeThrough(new DecompressionStream('gzip'));
+    }
+    const lines = readLines(bytes.pipeThrough(new TextDecoderStream()));
+
+    const counts = {};
+    const deliver = async (header, store, rows) => {
+      counts[store] = (counts[store] || 0) + rows.length;
+      await onRows(store, rows);
+      if (onProgress) onProgress({ stage, store, rows: counts[store], bytesRead, totalBytes });
+    };
+
+    // השורה הראשונה קובעת את הפורמט
+    let first = await lines.next();
+    while (!first.done && first.value.trim() === '') {
+      first = await lines.next();
+    }
+    if (first.done) throw invalidBackup('קובץ הגיבוי ריק');
+    const firstRecord = tryParse(first.value);
+
+    if (!firstRecord || firstRecord.type !== 'header') {
+      // JSON ישן - כל הקובץ אובייקט אחד
+      let text = first.value;
+      for await (const line of lines) text += '\n' + line;
+      const backup = tryParse(text);
+      if (!backup || backup.appName !== APP_NAME) {
+        throw invalidBackup('קובץ הגיבוי אינו תקין או אינו מתאים למערכת זו');
+      }
+
+      const header = {
+        appName: backup.appName,
+        version: backup.version,
+        timestamp: backup.timestamp,
+        stores: DEFAULT_STORES.filter(store => Array.isArray(backup[store]))
+      };
+      if (onHeader) await onHeader(header);
+
+      for (const store of header.stores) {
+        counts[store] = 0;
+        for (let i = 0; i < backup[store].length; i += batchSize) {
+          await deliver(header, store, backup[store].slice(i, i + batchSize));
+        }
+      }
+      return { format: 'json', compressed, header, counts };
+    }
+
+    const header = firstRecord;
+    if (header.appName !== APP_NAME || header.format !== FORMAT || !Array.isArray(header.stores)) {
+      throw invalidBackup('קובץ הגיבוי אינו תקין או אינו מתאים למערכת זו');
+    }
+    if (header.formatVersion > FORMAT_VERSION) {
+      throw invalidBackup(`קובץ הגיבוי נוצר בגרסה חדשה יותר (${header.formatVersion})`);
+    }
+    header.stores.forEach(store => { counts[store] = 0; });
+    if (onHeader) await onHeader(header);
+
+    let end = null;
+    for await (const line of lines) {
+      if (line.trim() === '') continue;
+      const record = tryParse(line);
+      if (!record) throw invalidBackup('שורה לא תקינה בקובץ הגיבוי');
+
+      if (record.type === 'rows' && header.stores.includes(record.store) && Array.isArray(record.rows)) {
+        await deliver(header, record.store, record.rows);
+      } else if (record.type === 'end') {
+        end = record;
+      }
+    }
+
+    if (!end) throw invalidBackup('קובץ הגיבוי קטוע (חסרה שורת סיום)');
+    const mismatch = header.stores.filter(store => (end.counts?.[store] ?? counts[store]) !== counts[store]);
+    if (mismatch.length > 0) {
+      throw invalidBackup(`מספר הרשומות אינו תואם בקובץ הגיבוי: ${mismatch.join(', ')}`);
+    }
+
+    return { format: FORMAT, compressed, header, counts };
+  }
+
+  /**
+   * שחזור מלא לתוך מסד IndexedDB פתוח
+   * שני מעברים: קודם הקובץ כולו נקרא ומאומת (כולל שורת הסיום ומספרי הרשומות) בלי לגעת ב-DB,
+   * ורק אז ה-stores שבגיבוי מנוקים ונכתבים - קובץ קטוע או פגום לא מוחק את הנתונים הקיימים.
+   * כל מנה נכתבת בטרנזקציה אחת
+   * @returns {Promise<{format, compressed, header, counts, written: Object, failed: number}>}
+   */
+  async function importDatabase(db, file, options = {}) {
+    const written = {};
+    let failed = 0;
+
+    // מעבר 1: אימות בלבד (זורק INVALID_BACKUP לפני כל כתיבה)
+    await readBackup(file, {
+      batchSize: options.batchSize,
+      onProgress: options.onProgress,
+      stage: 'verify',
+      onRows: async () => {}
+    });
+
+    // מעבר 2: ניקוי וכתיבה
+    const result = await readBackup(file, {
+      batchSize: options.batchSize,
+      onProgress: options.onProgress,
+      onHeader: async header => {
+        header.stores = header.stores.filter(store => hasStore(db, store));
+        header.stores.forEach(store => { written[store] = 0; });
+        await clearStores(db, header.stores);
+      },
+      onRows: async (store, rows) => {
+        const batch = await writeStoreBatch(db, store, rows);
+        written[store] += batch.written;
+        failed += batch.failed;
+      }
+    });
+
+    return { ...result, written, failed };
+  }
+
+  const DBBackupStream = {
+    APP_NAME,
+    FORMAT,
+    FORMAT_VERSION,
+    DEFAULT_STORES,
+    createExportStream,
+    exportToBlob,
+    exportDatabase,
+    readBackup,
+    importDatabase,
+    readStoreBatch,
+    writeStoreBatch,
+    clearStores
+  };
+
+  // Expose to global scope
+  if (typeof window !== 'undefined') {
+    window.DBBackupStream = DBBackupStream;
+  }
+
+  if (typeof module !== 'undefined' && module.exports) {
+    module.exports = { DBBackupStream };
+  }
+})();
@@ -6,13 +6,17 @@
  * @version 1.0.0
  */
 class IBBAAdapter {
-  constructor() {
+  /**
+   * @param {Object} season - אופציונלי: { leagueId, seasonId, seasonMonths, playersPageURL } לעונה אחרת
+   *                          (ברירת המחדל - העונה הנוכחית; ראה IBBASeasonRegistry)
+   */
+  constructor(season = {}) {
     this.baseURL = 'https://ibasketball.co.il/wp-json/wp/v2';
     this.sportspressURL = 'https://ibasketball.co.il/wp-json/sportspress/v2';
-    this.leagueId = 119474; // ליגה לאומית 2025
-    this.seasonId = 119472; // עונת 2025
-    this.playersPageURL = 'https://ibasketball.co.il/league/2025-2/';
-    this.seasonMonths = [
+    this.leagueId = season.leagueId ?? 119474; // ליגה לאומית 2025
+    this.seasonId = season.seasonId ?? 119472; // עונת 2025
+    this.playersPageURL = season.playersPageURL || 'https://ibasketball.co.il/league/2025-2/';
+    this.seasonMonths = season.seasonMonths ? [...season.seasonMonths] : [
       '2025-10',
       '2025-11',
       '2025-12',
@@ -23,35 +27,140 @@ class IBBAAdapter {
       '2026-05',
       '2026-06'
     ];
+    
+    // טעינת חודשים במקביל
+    this.monthFetchConcurrency = 3;   // מספר בקשות חודשיות במקביל (1 = סדרתי)
+    this.monthFetchTimeoutMs = 15000; // timeout לבקשה ישירה לפני מעבר ל-proxy
+    this.lastFetchTimings = null;     // זמני טעינה של הריצה האחרונה (לצורך השוואה/debug)
+  }
+
+  /**
+   * מפתח ליגה+עונה (אותו מפתח כמו ב-IBBAGameCache)
+   */
+  getSeasonKey() {
+    return `${this.leagueId}:${this.seasonId}`;
+  }
+
+  /**
+   * הגדרת העונה של ה-adapter (לרישום ב-IBBASeasonRegistry)
+   */
+  getSeasonDefinition() {
+    return {
+      key: this.getSeasonKey(),
+      leagueId: this.leagueId,
+      seasonId: this.seasonId,
+      seasonMonths: [...this.seasonMonths],
+      playersPageURL: this.playersPageURL
+    };
+  }
+
+  /**
+   * adapter חדש לעונה אחרת (אותן הגדרות טעינה)
+   */
+  forSeason(season) {
+    const adapter = new IBBAAdapter(season);
+    adapter.monthFetchConcurrency = this.monthFetchConcurrency;
+    adapter.monthFetchTimeoutMs = this.monthFetchTimeoutMs;
+    adapter.proxyClient = this.proxyClient;
+    return adapter;
   }
 
-  async fetchSeasonMonthGames(limit = 500) {
+  /**
+   * מביא את משחקי העונה לפי חודשים, במקביל עם הגבלת concurrency
+   * התוצאות ממוזגות לפי סדר החודשים (כמו בריצה סדרתית) כך שה-dedup לפי game.id נשמר
+   * @param {number} limit - מספר משחקים (עד 100 = מצב preview, מהחודש האחרון אחורה)
+   * @param {Object} options - { concurrency, timeoutMs, months (תת-קבוצה של seasonMonths) }
+   */
+  async fetchSeasonMonthGames(limit = 500, options = {}) {
     const shouldLoadPreview = limit <= 100;
-    const months = shouldLoadPreview ? [...this.seasonMonths].reverse() : this.seasonMonths;
+    const seasonMonths = options.months || this.seasonMonths;
+    const months = shouldLoadPreview ? [...seasonMonths].reverse() : seasonMonths;
+    const concurrency = Math.max(1, options.concurrency || this.monthFetchConcurrency);
+    const timeoutMs = options.timeoutMs ?? this.monthFetchTimeoutMs;
+    const startedAt = Date.now();
+    
     const gamesById = new Map();
+    const results = new Array(months.length);
+    const timings = [];
+    const controllers = new Set();
+    let nextIndex = 0;
+    let mergedCount = 0;
+    let cancelled = false;
     
-    for (const month of months) {
-      const url = `${this.sportspressURL}/events?order=asc&by=post_date&seasons=${this.seasonId}&leagues=${this.leagueId}&month=${month}&per_page=1000`;
-      console.log(`Fetching monthly games from: ${url}`);
-      
-      try {
-        const monthGames = await this.fetchJsonWithProxyFallback(url);
+    // מיזוג לפי הסדר - רק רצף החודשים שהסתיימו מתחילת הרשימה
+    const mergeCompletedMonths = () => {
+      while (!cancelled && mergedCount < months.length && results[mergedCount] !== undefined) {
+        results[mergedCount].forEach(game => {
+          if (game?.id) {
+            gamesById.set(game.id, game);
+          }
+        });
+        mergedCount++;
         
-        if (Array.isArray(monthGames)) {
-          monthGames.forEach(game => {
-            if (game?.id) {
-              gamesById.set(game.id, game);
-            }
-          });
+        // ביטול מוקדם - הגענו ל-limit, אין צורך בשאר החודשים
+        if (shouldLoadPreview && gamesById.size >= limit) {
+          cancelled = true;
+          controllers.forEach(controller => controller.abort());
         }
+      }
+    };
+    
+    const worker = async () => {
+      while (!cancelled && nextIndex < months.length) {
+        const index = nextIndex++;
+        const month = months[index];
+        const url = `${this.sportspressURL}/events?order=asc&by=post_date&seasons=${this.seasonId}&leagues=${this.leagueId}&month=${month}&per_page=1000`;
+        console.log(`Fetching monthly games from: ${url}`);
         
-        if (shouldLoadPreview && gamesById.size >= limit) {
-          break;
+        const controller = typeof AbortController !== 'undefined' ? new AbortController() : null;
+        if (controller) controllers.add(controller);
+        const monthStartedAt = Date.now();
+        let monthGames = [];
+        let status = 'ok';
+        
+        try {
+          const data = await this.fetchJsonWithProxyFallback(url, {
+            signal: controller?.signal,
+            timeoutMs
+          });
+          monthGames = Array.isArray(data) ? data : [];
+        } catch (error) {
+          status = cancelled ? 'cancelled' : 'error';
+          if (!cancelled) {
+            console.warn(`Failed to fetch games for ${month}:`, error.message);
+          }
+        } finally {
+          if (controller) controllers.delete(controller);
         }
-      } catch (error) {
-        console.warn(`Failed to fetch games for ${month}:`, error.message);
+        
+        timings.push({
+          month,
+          status,
+          games: monthGames.length,
+          startMs: monthStartedAt - startedAt,
+          durationMs: Date.now() - monthStartedAt
+        });
+        
+        results[index] = monthGames;
+        mergeCompletedMonths();
       }
+    };
+    
+    const workers = [];
+    for (let i = 0; i < Math.min(concurrency, months.length); i++) {
+      workers.push(worker());
     }
+    await Promise.all(workers);
+    
+    this.lastFetchTimings = {
+      mode: concurrency === 1 ? 'serial' : 'parallel',
+      concurrency,
+      totalMs: Date.now() - startedAt,
+      monthsRequested: timings.length,
+      monthsMerged: mergedCount,
+      cancelled,
+      months: timings
+    };
     
     const games = Array.from(gamesById.values())
       .sort((a, b) => new Date(b.date) - new Date(a.date));
@@ -59,9 +168,29 @@ class IBBAAdapter {
     return shouldLoadPreview ? games.slice(0, limit) : games;
   }
 
-  async fetchJsonWithProxyFallback(url) {
+  /**
+   * fetch ישיר עם timeout, ואם נכשל - דרך proxy
+   * @param {string} url
+   * @param {Object} options - { signal (ביטול חיצוני), timeoutMs }
+   */
+  async fetchJsonWithProxyFallback(url, options = {}) {
+    const { signal = null, timeoutMs = 0 } = options;
+    const controller = typeof AbortController !== 'undefined' ? new AbortController() : null;
+    const onAbort = () => controller.abort();
+    let timeoutId = null;
+    
+    if (controller) {
+      if (signal) {
+        if (signal.aborted) controller.abort();
+        signal.addEventListener('abort', onAbort);
+      }
+      if (timeoutMs > 0) {
+        timeoutId = setTimeout(() => controller.abort(), timeoutMs);
+      }
+    }
+    
     try {
-      const response = await fetch(url);
+      const response = await fetch(url, controller ? { signal: controller.signal } : undefined);
       
       if (!response.ok) {
         throw new Error(`API Error: ${response.status} ${response.statusText}`);
@@ -69,8 +198,15 @@ class IBBAAdapter {
       
       return await response.json();
     } catch (error) {
-      console.warn('Direct monthly fetch failed, trying via CORS proxy...', error.message);
-      return await this.fetchViaProxy(url);
+      if (signal?.aborted) {
+        throw error;
+      }
+      const errorMsg = error.name === 'AbortError' ? `timeout (${timeoutMs / 1000}s)` : error.message;
+      console.warn('Direct monthly fetch failed, trying via CORS proxy...', errorMsg);
+      return await this.fetchViaProxy(url, { signal });
+    } finally {
+      if (timeoutId) clearTimeout(timeoutId);
+      if (signal) signal.removeEventListener('abort', onAbort);
     }
   }
 
@@ -172,34 +308,33 @@ class IBBAAdapter {
     return 'other'; // סביבה אחרת
   }
 
+  /**
+   * לקוח ה-proxy (משותף לכל המודולים בדף - סטטיסטיקות ו-circuit breaker משותפים)
+   */
+  getProxyClient() {
+    return this.proxyClient || window.IBBAProxyClient.getShared();
+  }
+
   /**
    * קריאה דרך CORS proxy (fallback)
    * משתמש ב-proxy מותאם אישית של Vercel + fallback ל-proxies ציבוריים
+   * הסדר בפועל נקבע ע"י IBBAProxyClient לפי זמני תגובה והצלחות קודמות
+   * @param {Object} options - { signal } לביטול חיצוני של כל שרשרת ה-proxies
    */
-  async fetchViaProxy(targetUrl) {
+  async fetchViaProxy(targetUrl, options = {}) {
+    const { signal = null } = options;
     const env = this.getEnvironment();
     console.log(`🌍 Environment detected: ${env}`);
     
-    // ה-URL של ה-proxy שלנו ב-Vercel (production)
-    const VERCEL_PROXY = 'https://basketball-stats-manager.vercel.app/api/proxy';
-    
     // בניית רשימת proxies לפי הסביבה
     let proxies = [];
     
     if (env === 'vercel') {
       // Production - הproxy היחסי שלנו קודם
-      proxies = [
-        `/api/proxy?url=${encodeURIComponent(targetUrl)}`,  // Vercel API route (relative)
-        `https://corsproxy.io/?${encodeURIComponent(targetUrl)}`,
-        `https://api.allorigins.win/raw?url=${encodeURIComponent(targetUrl)}`
-      ];
+      proxies = ['vercel-relative', 'corsproxy', 'allorigins-raw'];
     } else if (env === 'localhost' || env === 'other') {
       // Local/Other - הproxy המלא שלנו ב-Vercel קודם!
-      proxies = [
-        `${VERCEL_PROXY}?url=${encodeURIComponent(targetUrl)}`,  // Vercel API route (absolute)
-        `https://corsproxy.io/?${encodeURIComponent(targetUrl)}`,
-        `https://api.allorigins.win/raw?url=${encodeURIComponent(targetUrl)}`
-      ];
+      proxies = ['vercel', 'corsproxy', 'allorigins-raw'];
     } else if (env === 'file') {
       // פתיחה ישירה מקובץ - בעייתי!
       console.error('⚠️ Running from file:// protocol - CORS will fail!');
@@ -208,43 +343,20 @@ class IBBAAdapter {
       console.error('   Then open: http://localhost:8000/admin_players.html');
       
       // עדיין ננסה דרך Vercel proxy
-      proxies = [
-        `${VERCEL_PROXY}?url=${encodeURIComponent(targetUrl)}`,
-        `https://corsproxy.io/?${encodeURIComponent(targetUrl)}`
-      ];
+      proxies = ['vercel', 'corsproxy'];
     }
     
-    for (let i = 0; i < proxies.length; i++) {
-      try {
-        console.log(`🔄 Trying proxy ${i + 1}/${proxies.length}...`);
-        
-        // הוספת timeout של 15 שניות (הגדלנו מ-10)
-        const controller = new AbortController();
-        const timeoutId = setTimeout(() => controller.abort(), 15000);
-        
-        const response = await fetch(proxies[i], { signal: controller.signal });
-        clearTimeout(timeoutId);
-        
-        if (!response.ok) {
-          throw new Error(`Proxy ${i + 1} failed: ${response.status}`);
-        }
-        
-        const data = await response.json();
-        console.log(`✅ Successfully fetched via proxy ${i + 1}`);
-        return data;
-        
-      } catch (error) {
-        const errorMsg = error.name === 'AbortError' ? 'timeout (15s)' : error.message;
-        console.warn(`⚠️ Proxy ${i + 1} failed:`, errorMsg);
-        
-        // אם זה הproxy האחרון - זרוק שגיאה
-        if (i === proxies.length - 1) {
-          const helpMsg = env === 'file' 
-            ? 'Cannot run from file://. Please use: python -m http.server 8000'
-            : 'All proxies failed. Try running a local server (python -m http.server 8000)';
-          throw new Error(helpMsg);
-        }
+    try {
+      return await this.getProxyClient().fetch(targetUrl, { proxies, as: 'json', signal, timeoutMs: 15000 });
+    } catch (error) {
+      if (signal?.aborted) {
+        throw new Error('Request cancelled');
       }
+      console.warn('⚠️ Proxy fallback failed:', error.message);
+      const helpMsg = env === 'file' 
+        ? 'Cannot run from file://. Please use: python -m http.server 8000'
+        : 'All proxies failed. Try running a local server (python -m http.server 8000)';
+      throw new Error(helpMsg);
     }
   }
 
@@ -570,4 +682,18 @@ class IBBAAdapter {
 // Export for use
 window.IBBAAdapter = IBBAAdapter;
 
+// IBBATracer: טעינת חודשים, fallback ל-proxy והמרת משחקים (gameId / url לכל span)
+if (window.IBBATracer) {
+  window.IBBATracer.getShared().instrument(IBBAAdapter.prototype, [
+    'fetchSeasonMonthGames', 'fetchJsonWithProxyFallback', 'fetchGames', 'fetchGame', 'fetchViaProxy',
+    'convertToInternalFormat', 'parsePlayersFromHTML'
+  ], {
+    category: 'adapter',
+    attributes: (name, args) => {
+      if (name === 'convertToInternalFormat') return { gameId: args[0]?.id };
+      return typeof args[0] === 'string' ? { url: args[0] } : null;
+    }
+  });
+}
+
 console.log('✅ IBBA Adapter loaded successfully');
@@ -27,6 +27,21 @@ class IBBAAdvanced {
     this.playerNamesLoader = playerNamesLoader;
   }
 
+  /**
+   * Shared CORS proxy client (see ibba_proxy_client.js)
+   * @private
+   */
+  getProxyClient() {
+    return this.proxyClient || window.IBBAProxyClient.getShared();
+  }
+
+  /**
+   * מחלץ הטבלאות המשותף (worker + מטמון לפי hash)
+   */
+  getTableExtractor() {
+    return this.tableExtractor || window.IBBATableExtractor.getShared();
+  }
+
   /**
    * ===============================================
    * STANDINGS FROM HTML
@@ -92,61 +107,23 @@ class IBBAAdvanced {
     try {
       console.log('🔄 Loading league standings from HTML via CORS proxy...');
       
-      let html = null;
-      
       // Use CORS proxies (direct fetch will fail due to CORS policy)
-      const proxies = [
-        { 
-          url: 'https://api.allorigins.win/raw?url=',
-          parseResponse: (response) => response.text() // Returns raw HTML
-        },
-        { 
-          url: 'https://api.allorigins.win/get?url=',
-          parseResponse: async (response) => {
-            const data = await response.json();
-            return data.contents;
-          }
-        },
-        { 
-          url: 'https://corsproxy.io/?',
-          parseResponse: (response) => response.text()
-        }
-      ];
-      
-      for (let i = 0; i < proxies.length; i++) {
-        try {
-          const proxy = proxies[i];
-          const proxyUrl = proxy.url + encodeURIComponent(this.leagueUrl);
-          console.log(`🔄 Trying proxy ${i + 1}/${proxies.length}: ${proxy.url.split('?')[0]}...`);
-          
-          const response = await fetch(proxyUrl);
-          if (!response.ok) {
-            throw new Error(`HTTP ${response.status}`);
-          }
-          
-          html = await proxy.parseResponse(response);
-          
-          if (html && html.length > 1000) { // Basic validation
-            console.log(`✅ Proxy ${i + 1} succeeded! Got ${(html.length / 1024).toFixed(1)}KB of HTML`);
-            break;
-          } else {
-            throw new Error('Response too short, probably invalid');
-          }
-          
-        } catch (error) {
-          console.warn(`⚠️ Proxy ${i + 1} failed:`, error.message);
-          if (i === proxies.length - 1) {
-            throw new Error('All CORS proxies failed. Cannot load standings from HTML.');
-          }
-        }
-      }
-      
-      if (!html) {
-        throw new Error('Failed to fetch league HTML from any proxy');
+      // Order is decided by the shared proxy client (latency, success rate, circuit breaker)
+      let html;
+      try {
+        html = await this.getProxyClient().fetch(this.leagueUrl, {
+          proxies: ['allorigins-raw', 'allorigins-get', 'corsproxy'],
+          as: 'text',
+          validate: body => !!body && body.length > 1000 // Basic validation
+        });
+      } catch (error) {
+        console.warn('⚠️ Proxy fallback failed:', error.message);
+        throw new Error('All CORS proxies failed. Cannot load standings from HTML.');
       }
+      console.log(`✅ Got ${(html.length / 1024).toFixed(1)}KB of standings HTML`);
       
       // Parse HTML to extract standings
-      this.parseStandingsFromHTML(html);
+      await this.parseStandingsFromHTML(html);
       
       // Save to cache
       this.saveStandingsToCache();
@@ -165,78 +142,57 @@ class IBBAAdvanced {
 
   /**
    * Parse standings from HTML
+   * רק .sp-league-table נחתך מהדף ונפרס (ב-worker כשאפשר); טבלה שלא השתנתה מוחזרת מהמטמון
    * @private
    */
-  parseStandingsFromHTML(html) {
+  async parseStandingsFromHTML(html) {
     try {
-      const parser = new DOMParser();
-      const doc = parser.parseFromString(html, 'text/html');
-      
-      // Find the standings table
-      const table = doc.querySelector('.sp-league-table');
-      if (!table) {
+      const rows = await this.getTableExtractor().extract(html, 'standings');
+      if (rows.length === 0) {
         console.warn('⚠️ Could not find standings table in HTML');
         return;
       }
-      
-      // Find all team rows
-      const rows = table.querySelectorAll('tbody tr');
       console.log(`📊 Found ${rows.length} teams in standings table`);
-      
+
+      const toInt = value => (value !== undefined ? parseInt(value) : 0);
       rows.forEach(row => {
-        try {
-          // Extract data from cells
-          const rankCell = row.querySelector('.data-rank');
-          const nameCell = row.querySelector('.data-name a');
-          const gpCell = row.querySelector('.data-gp');
-          const wCell = row.querySelector('.data-w');
-          const lCell = row.querySelector('.data-l');
-          const bfCell = row.querySelector('.data-bf'); // Points for
-          const baCell = row.querySelector('.data-ba'); // Points against
-          const bdCell = row.querySelector('.data-bd'); // Point differential
-          const ptsCell = row.querySelector('.data-pts'); // League points
-          
-          if (!rankCell || !nameCell) {
-            console.warn('⚠️ Missing rank or name in row, skipping');
-            return;
-          }
-          
-          const rank = parseInt(rankCell.textContent.trim());
-          const teamName = nameCell.textContent.trim();
-          const gamesPlayed = gpCell ? parseInt(gpCell.textContent.trim()) : 0;
-          const wins = wCell ? parseInt(wCell.textContent.trim()) : 0;
-          const losses = lCell ? parseInt(lCell.textContent.trim()) : 0;
-          const pointsFor = bfCell ? parseInt(bfCell.textContent.trim()) : 0;
-          const pointsAgainst = baCell ? parseInt(baCell.textContent.trim()) : 0;
-          const pointDiff = bdCell ? parseInt(bdCell.textContent.trim()) : 0;
-          const leaguePoints = ptsCell ? parseInt(ptsCell.textContent.trim()) : 0;
-          
-          // Calculate win percentage
-          const winPct = gamesPlayed > 0 ? (wins / gamesPlayed * 100).toFixed(1) : '0.0';
-          
-          // Store in map
-          this.standingsFromHTML.set(teamName, {
-            teamName,
-            rank,
-            gamesPlayed,
-            wins,
-            losses,
-            winPct: parseFloat(winPct),
-            pointsFor,
-            pointsAgainst,
-            pointDiff,
-            leaguePoints,
-            ppg: gamesPlayed > 0 ? (pointsFor / gamesPlayed).toFixed(1) : '0.0',
-            oppPpg: gamesPlayed > 0 ? (pointsAgainst / gamesPlayed).toFixed(1) : '0.0'
-          });
-          
-          console.log(`  ${rank}. ${teamName} (${wins}-${losses})`);
-          
-        } catch (error) {
-          console.warn('⚠️ Error parsing standings row:', error);
+        if (row.rank === undefined || row.name === undefined) {
+          console.warn('⚠️ Missing rank or name in row, skipping');
+          return;
         }
+
+        const rank = parseInt(row.rank);
+        const teamName = row.name;
+        const gamesPlayed = toInt(row.gp);
+        const wins = toInt(row.w);
+        const losses = toInt(row.l);
+        const pointsFor = toInt(row.bf);      // Points for
+        const pointsAgainst = toInt(row.ba);  // Points against
+        const pointDiff = toInt(row.bd);      // Point differential
+        const leaguePoints = toInt(row.pts);  // League points
+
+        // Calculate win percentage
+        const winPct = gamesPlayed > 0 ? (wins / gamesPlayed * 100).toFixed(1) : '0.0';
+
+        // Store in map
+        this.standingsFromHTML.set(teamName, {
+          teamName,
+          rank,
+          gamesPlayed,
+          wins,
+          losses,
+          winPct: parseFloat(winPct),
+          pointsFor,
+          pointsAgainst,
+          pointDiff,
+          leaguePoints,
+          ppg: gamesPlayed > 0 ? (pointsFor / gamesPlayed).toFixed(1) : '0.0',
+          oppPpg: gamesPlayed > 0 ? (pointsAgainst / gamesPlayed).toFixed(1) : '0.0'
+        });
+
+        console.log(`  ${rank}. ${teamName} (${wins}-${losses})`);
       });
-      
+
     } catch (error) {
       console.error('❌ Error parsing HTML:', error);
     }
@@ -861,24 +817,41 @@ class IBBAAdvanced {
    * ===============================================
    */
 
+  /**
+   * נתוני עונה שמשותפים לכל דוחות המשחק (לא תלויים בזוג הקבוצות)
+   * דוחות של מחזור שלם מחשבים אותם פעם אחת ומעבירים ל-buildMatchupReport
+   */
+  getSeasonContext() {
+    return {
+      teamAverages: this.analytics.getTeamAverages(), // מחזיר מערך
+      advancedMetrics: this.getAdvancedTeamMetrics(),
+      trends: this.getTeamTrends(5),
+      standings: this.getLeagueStandings(),
+      homeAwayRecords: this.analytics.getTeamHomeAwayRecords()
+    };
+  }
+
   /**
    * בניית דוח מקיף לפני משחק
+   * @param {Object} seasonContext - אופציונלי, מ-getSeasonContext (הטבלה כבר נטענה)
    */
-  async buildMatchupReport(teamA, teamB) {
+  async buildMatchupReport(teamA, teamB, seasonContext = null) {
     console.time('⏱️ Matchup Report');
     
     // טען את הטבלה מה-HTML אם עדיין לא נטענה
-    if (!this.standingsLoaded) {
+    if (!seasonContext && !this.standingsLoaded) {
       await this.loadStandingsFromHTML();
     }
     
     // Get all necessary data
-    const teamAveragesArray = this.analytics.getTeamAverages(); // מחזיר מערך
-    const advancedMetrics = this.getAdvancedTeamMetrics();
-    const trends = this.getTeamTrends(5);
+    const {
+      teamAverages: teamAveragesArray,
+      advancedMetrics,
+      trends,
+      standings,
+      homeAwayRecords
+    } = seasonContext || this.getSeasonContext();
     const h2h = this.getH2HHistory(teamA, teamB);
-    const standings = this.getLeagueStandings();
-    const homeAwayRecords = this.analytics.getTeamHomeAwayRecords();
 
     // Find team data
     const teamAStats = teamAveragesArray.find(t => t.teamName === teamA);
@@ -993,6 +966,47 @@ class IBBAAdvanced {
     };
   }
 
+  /**
+   * דוחות לכל משחקי מחזור ב-thread הנוכחי - נתוני העונה מחושבים פעם אחת לכל המשחקים
+   * (ה-fallback של IBBARoundReports כשאין Worker, וגם מה שכל worker מריץ לכל משחק)
+   * @param {Array} fixtures - [{ homeTeam, awayTeam, ... }]
+   * @param {Object} options - { onReport(result, index), signal }
+   * @returns {Promise<Array>} [{ fixture, report } | { fixture, error }] לפי סדר המשחקים
+   */
+  async buildRoundReports(fixtures, options = {}) {
+    const { onReport = null, signal = null } = options;
+
+    if (!this.standingsLoaded) {
+      await this.loadStandingsFromHTML();
+    }
+    const seasonContext = this.getSeasonContext();
+    const results = [];
+
+    for (let i = 0; i < fixtures.length; i++) {
+      if (signal?.aborted) {
+        throw new Error('Round reports cancelled');
+      }
+
+      const fixture = fixtures[i];
+      let result;
+      try {
+        const report = await this.buildMatchupReport(fixture.homeTeam, fixture.awayTeam, seasonContext);
+        result = { fixture, report };
+      } catch (error) {
+        console.error(`❌ Matchup report failed: ${fixture.homeTeam} vs ${fixture.awayTeam}`, error);
+        result = { fixture, error: error.message };
+      }
+
+      results.push(result);
+      if (onReport) onReport(result, i);
+
+      // מחזירים שליטה ל-UI בין דוח לדוח
+      await new Promise(resolve => setTimeout(resolve, 0));
+    }
+
+    return results;
+  }
+
   /**
    * חישוב ניקוד לכל Insight לפי חשיבות (Weighted Scoring)
    */
@@ -1222,5 +1236,17 @@ class IBBAAdvanced {
 // Export to global scope
 window.IBBAAdvanced = IBBAAdvanced;
 
+// IBBATracer: טבלה, מגמות, היסטוריה ודוחות משחק/מחזור
+if (window.IBBATracer) {
+  window.IBBATracer.getShared().instrument(IBBAAdvanced.prototype, [
+    'loadStandingsFromHTML', 'parseStandingsFromHTML', 'getAdvancedTeamMetrics', 'getLeagueStandings',
+    'getTeamTrends', 'getH2HHistory', 'getSeasonContext', 'generateInsights', 'buildNarrative',
+    'buildMatchupReport', 'buildRoundReports'
+  ], {
+    category: 'advanced',
+    attributes: (name, args) => (name === 'buildMatchupReport' ? { teamA: args[0], teamB: args[1] } : null)
+  });
+}
+
 console.log('🔥 IBBAAdvanced loaded successfully!');
 
@@ -8,6 +8,19 @@
 class IBBAAnalytics {
   constructor(games = []) {
     this.games = games;
+    this._aggregates = null;
+    this._aggregatesGames = null;
+    this._aggregatesLength = 0;
+    this.store = null; // IBBAGameStore - כש-this.games הם המשחקים שלו, המצטברים נבנים מהעמודות
+  }
+
+  /**
+   * Analytics על מאגר עמודתי (IBBAGameStore) - this.games = store.games (שורות השחקנים כתצוגות)
+   */
+  static fromStore(store) {
+    const analytics = new IBBAAnalytics(store.games);
+    analytics.store = store;
+    return analytics;
   }
 
   /**
@@ -15,78 +28,271 @@ class IBBAAnalytics {
    */
   setGames(games) {
     this.games = games;
+    this.invalidateAggregates();
   }
 
   /**
    * ===============================================
-   * TEAM ANALYTICS - סטטיסטיקות קבוצתיות
+   * AGGREGATION ENGINE - מעבר יחיד על המשחקים
    * ===============================================
    */
 
   /**
-   * קבלת סכומים כוללים לכל קבוצה
-   * @returns {Object} מפה של teamName -> stats
+   * ביטול ה-cache (למשל אחרי שינוי ידני של this.games במקום)
    */
-  getTeamStats() {
-    console.time('⏱️ Team Stats Calculation');
+  invalidateAggregates() {
+    this._aggregates = null;
+    this._aggregatesGames = null;
+    this._aggregatesLength = 0;
+  }
+
+  /**
+   * קבלת המצטברים (מחושבים פעם אחת עד שרשימת המשחקים משתנה)
+   */
+  getAggregates() {
+    if (!this._aggregates ||
+        this._aggregatesGames !== this.games ||
+        this._aggregatesLength !== this.games.length) {
+      this._aggregates = this.buildAggregates();
+      this._aggregatesGames = this.games;
+      this._aggregatesLength = this.games.length;
+    }
+    return this._aggregates;
+  }
+
+  createTeamTotals(teamName) {
+    return {
+      teamName: teamName,
+      gamesPlayed: 0,
+      wins: 0,
+      losses: 0,
+      totalPoints: 0,
+      totalPointsAgainst: 0,
+      totalRebounds: 0,
+      totalAssists: 0,
+      totalSteals: 0,
+      totalBlocks: 0,
+      totalTurnovers: 0,
+      totalFouls: 0,
+      totalFGM: 0,
+      totalFGA: 0,
+      total3PM: 0,
+      total3PA: 0,
+      totalFTM: 0,
+      totalFTA: 0,
+      totalEfficiency: 0,
+      // סטטיסטיקות מתקדמות
+      totalPointsFastBreak: 0,
+      totalPointsFromTurnovers: 0,
+      totalPointsInPaint: 0,
+      totalPointsSecondChance: 0,
+      totalPointsBench: 0
+    };
+  }
+
+  createLocationTotals() {
+    return {
+      games: 0,
+      wins: 0,
+      losses: 0,
+      totalPoints: 0,
+      totalPointsAgainst: 0,
+      winPoints: 0  // נקודות רק בניצחונות
+    };
+  }
+
+  createPlayerTotals(player) {
+    return {
+      playerId: player.playerId,
+      name: `Player #${player.jersey}`, // אין לנו שמות אמיתיים
+      jersey: player.jersey,
+      teamName: player.teamName,
+      gamesPlayed: 0,
+      totalPoints: 0,
+      totalRebounds: 0,
+      totalAssists: 0,
+      totalSteals: 0,
+      totalBlocks: 0,
+      totalTurnovers: 0,
+      totalFouls: 0,
+      totalFoulsDrawn: 0,
+      totalMinutes: 0,
+      totalFGM: 0,
+      totalFGA: 0,
+      total3PM: 0,
+      total3PA: 0,
+      totalFTM: 0,
+      totalFTA: 0,
+      totalEfficiency: 0,
+      totalPlusMinus: 0
+    };
+  }
+
+  createPlayerSums() {
+    return {
+      efficiency: 0, rebounds: 0, assists: 0, steals: 0, blocks: 0, turnovers: 0, fouls: 0,
+      fgm: 0, fga: 0, threepm: 0, threepa: 0, ftm: 0, fta: 0
+    };
+  }
+
+  /**
+   * שורות השחקנים של משחק: מצטברי שחקנים (playerStats) + סכומי השחקנים לכל קבוצה במשחק
+   * (במקום filter לכל קבוצה)
+   * @returns {Map} teamName → סכומים
+   */
+  accumulatePlayerLines(game, playerStats) {
+    const playerSumsByTeam = new Map();
+    game.players.forEach(player => {
+      const s = player.stats;
+      
+      let teamSums = playerSumsByTeam.get(player.teamName);
+      if (!teamSums) {
+        teamSums = this.createPlayerSums();
+        playerSumsByTeam.set(player.teamName, teamSums);
+      }
+      teamSums.efficiency += s.efficiency || 0;
+      teamSums.rebounds += s.totalRebounds || 0;
+      teamSums.assists += s.assists || 0;
+      teamSums.steals += s.steals || 0;
+      teamSums.blocks += s.blocks || 0;
+      teamSums.turnovers += s.turnovers || 0;
+      teamSums.fouls += s.personalFouls || 0;
+      teamSums.fgm += s.fieldGoalsMade || 0;
+      teamSums.fga += s.fieldGoalsAttempted || 0;
+      teamSums.threepm += s.threePointsMade || 0;
+      teamSums.threepa += s.threePointsAttempted || 0;
+      teamSums.ftm += s.freeThrowsMade || 0;
+      teamSums.fta += s.freeThrowsAttempted || 0;
+
+      // דלג על שחקנים שלא שיחקו בפועל (0 דקות)
+      const minutes = this.getPlayerMinutes(player);
+      if (minutes === 0) {
+        return;
+      }
+
+      const playerId = player.playerId;
+      if (!playerStats[playerId]) {
+        playerStats[playerId] = this.createPlayerTotals(player);
+      }
+
+      const stats = playerStats[playerId];
+      stats.gamesPlayed++;
+      stats.totalPoints += s.points || 0;
+      stats.totalRebounds += s.totalRebounds || 0;
+      stats.totalAssists += s.assists || 0;
+      stats.totalSteals += s.steals || 0;
+      stats.totalBlocks += s.blocks || 0;
+      stats.totalTurnovers += s.turnovers || 0;
+      stats.totalFouls += s.personalFouls || 0;
+      stats.totalFoulsDrawn += s.foulsDrawn || 0;
+      stats.totalFGM += s.fieldGoalsMade || 0;
+      stats.totalFGA += s.fieldGoalsAttempted || 0;
+      stats.total3PM += s.threePointsMade || 0;
+      stats.total3PA += s.threePointsAttempted || 0;
+      stats.totalFTM += s.freeThrowsMade || 0;
+      stats.totalFTA += s.freeThrowsAttempted || 0;
+      stats.totalEfficiency += s.efficiency || 0;
+      stats.totalPlusMinus += s.plusMinus || 0;
+      stats.totalMinutes += minutes;
+    });
+
+    return playerSumsByTeam;
+  }
+
+  /**
+   * דקות בפורמט עשרוני (calculated, ואם אין - המרה מ-"MM:SS")
+   */
+  getPlayerMinutes(player) {
+    let minutes = player.calculated?.minutesDecimal || 0;
+    
+    // Fallback: אם calculated לא קיים, נסה להמיר ישירות מ-stats.minutesPlayed
+    if (minutes === 0 && player.stats?.minutesPlayed) {
+      const minStr = player.stats.minutesPlayed;
+      if (minStr && minStr !== '0:00') {
+        const parts = String(minStr).split(':');
+        const mins = parseInt(parts[0]) || 0;
+        const secs = parseInt(parts[1]) || 0;
+        minutes = mins + (secs / 60);
+      }
+    }
+    
+    return minutes;
+  }
+
+  /**
+   * בניית כל המצטברים (קבוצות, שחקנים, בית/חוץ, ליגה) במעבר אחד על המשחקים
+   */
+  buildAggregates() {
+    console.time('⏱️ Aggregates Calculation');
     
     const teamStats = {};
+    const homeAwayRecords = {};
+    const playerStats = {};
+    const homeWins = { count: 0, totalPoints: 0, totalPointsAgainst: 0 };
+    const awayWins = { count: 0, totalPoints: 0, totalPointsAgainst: 0 };
+    // מאגר עמודתי: שורות השחקנים נצברות ישר מהעמודות (IBBAGameStore)
+    const lineAggregation = this.store && this.store.games === this.games
+      ? this.store.createLineAggregation(this)
+      : null;
+
+    this.games.forEach((game, gameIndex) => {
+      // ליגה - ניצחונות בית/חוץ
+      if (game.homeScore > game.awayScore) {
+        homeWins.count++;
+        homeWins.totalPoints += game.homeScore;
+        homeWins.totalPointsAgainst += game.awayScore;
+      } else if (game.awayScore > game.homeScore) {
+        awayWins.count++;
+        awayWins.totalPoints += game.awayScore;
+        awayWins.totalPointsAgainst += game.homeScore;
+      }
+
+      // שחקנים - מעבר אחד שמסכם גם לפי קבוצה
+      const playerSumsByTeam = lineAggregation
+        ? lineAggregation.accumulateGame(gameIndex)
+        : this.accumulatePlayerLines(game, playerStats);
 
-    this.games.forEach(game => {
-      // עבור כל קבוצה במשחק
+      // קבוצות
       game.teams.forEach(team => {
         const teamName = team.name;
+        const isHome = team.isHome;
+        const teamScore = isHome ? game.homeScore : game.awayScore;
+        const oppScore = isHome ? game.awayScore : game.homeScore;
         
         if (!teamStats[teamName]) {
-          teamStats[teamName] = {
+          teamStats[teamName] = this.createTeamTotals(teamName);
+        }
+        if (!homeAwayRecords[teamName]) {
+          homeAwayRecords[teamName] = {
             teamName: teamName,
-            gamesPlayed: 0,
-            wins: 0,
-            losses: 0,
-            totalPoints: 0,
-            totalPointsAgainst: 0,
-            totalRebounds: 0,
-            totalAssists: 0,
-            totalSteals: 0,
-            totalBlocks: 0,
-            totalTurnovers: 0,
-            totalFouls: 0,
-            totalFGM: 0,
-            totalFGA: 0,
-            total3PM: 0,
-            total3PA: 0,
-            totalFTM: 0,
-            totalFTA: 0,
-            totalEfficiency: 0,
-            // סטטיסטיקות מתקדמות
-            totalPointsFastBreak: 0,
-            totalPointsFromTurnovers: 0,
-            totalPointsInPaint: 0,
-            totalPointsSecondChance: 0,
-            totalPointsBench: 0
+            home: this.createLocationTotals(),
+            away: this.createLocationTotals()
           };
         }
 
         const stats = teamStats[teamName];
-        stats.gamesPlayed++;
-
-        // ניקוד
-        const isHome = team.isHome;
-        const teamScore = isHome ? game.homeScore : game.awayScore;
-        const oppScore = isHome ? game.awayScore : game.homeScore;
+        const location = isHome ? homeAwayRecords[teamName].home : homeAwayRecords[teamName].away;
         
+        stats.gamesPlayed++;
         stats.totalPoints += teamScore || 0;
         stats.totalPointsAgainst += oppScore || 0;
+        location.games++;
+        location.totalPoints += teamScore || 0;
+        location.totalPointsAgainst += oppScore || 0;
         
         // ניצחונות/הפסדים
         if (teamScore > oppScore) {
           stats.wins++;
+          location.wins++;
+          location.winPoints += teamScore || 0;  // נקודות רק בניצחונות
         } else if (teamScore < oppScore) {
           stats.losses++;
+          location.losses++;
         }
 
         // השתמש בסטטיסטיקות קבוצתיות (כולל team rebounds) במקום לסכום שחקנים
         const teamStatsForGame = isHome ? game.teamStats?.home : game.teamStats?.away;
+        const teamSums = playerSumsByTeam.get(teamName);
         
         if (teamStatsForGame) {
           // סטטיסטיקות שמגיעות מהסכום הקבוצתי (כולל team rebounds)
@@ -108,35 +314,196 @@ class IBBAAnalytics {
           stats.totalPointsInPaint += teamStatsForGame.pointsInPaint || 0;
           stats.totalPointsSecondChance += teamStatsForGame.pointsSecondChance || 0;
           stats.totalPointsBench += teamStatsForGame.pointsBench || 0;
-        } else {
+        } else if (teamSums) {
           // Fallback: אם אין teamStats, סכום מהשחקנים (backwards compatibility)
-          const teamPlayers = game.players.filter(p => p.teamName === teamName);
-          teamPlayers.forEach(player => {
-            const s = player.stats;
-            stats.totalRebounds += s.totalRebounds || 0;
-            stats.totalAssists += s.assists || 0;
-            stats.totalSteals += s.steals || 0;
-            stats.totalBlocks += s.blocks || 0;
-            stats.totalTurnovers += s.turnovers || 0;
-            stats.totalFouls += s.personalFouls || 0;
-            stats.totalFGM += s.fieldGoalsMade || 0;
-            stats.totalFGA += s.fieldGoalsAttempted || 0;
-            stats.total3PM += s.threePointsMade || 0;
-            stats.total3PA += s.threePointsAttempted || 0;
-            stats.totalFTM += s.freeThrowsMade || 0;
-            stats.totalFTA += s.freeThrowsAttempted || 0;
-          });
+          stats.totalRebounds += teamSums.rebounds;
+          stats.totalAssists += teamSums.assists;
+          stats.totalSteals += teamSums.steals;
+          stats.totalBlocks += teamSums.blocks;
+          stats.totalTurnovers += teamSums.turnovers;
+          stats.totalFouls += teamSums.fouls;
+          stats.totalFGM += teamSums.fgm;
+          stats.totalFGA += teamSums.fga;
+          stats.total3PM += teamSums.threepm;
+          stats.total3PA += teamSums.threepa;
+          stats.totalFTM += teamSums.ftm;
+          stats.totalFTA += teamSums.fta;
         }
         
         // Efficiency - תמיד סכום מהשחקנים (teamStats לא כולל efficiency)
-        const teamPlayers = game.players.filter(p => p.teamName === teamName);
-        teamPlayers.forEach(player => {
-          stats.totalEfficiency += player.stats.efficiency || 0;
-        });
+        if (teamSums) {
+          stats.totalEfficiency += teamSums.efficiency;
+        }
       });
     });
 
-    console.timeEnd('⏱️ Team Stats Calculation');
+    if (lineAggregation) lineAggregation.finish(playerStats);
+
+    // ממוצעי בית/חוץ
+    Object.values(homeAwayRecords).forEach(record => this.computeLocationAverages(record));
+
+    const aggregates = this.finalizeAggregates({
+      teamStats,
+      homeAwayRecords,
+      playerStats,
+      leagueTotals: { homeWins, awayWins, totalGames: this.games.length }
+    });
+
+    console.timeEnd('⏱️ Aggregates Calculation');
+    return aggregates;
+  }
+
+  /**
+   * ממוצעים מהסכומים: ממוצעי קבוצות/שחקנים ומאזני ליגה (גם לסכומים ממוזגים של כמה עונות)
+   */
+  finalizeAggregates({ teamStats, homeAwayRecords, playerStats, leagueTotals }) {
+    return {
+      teamStats,
+      homeAwayRecords,
+      leagueHomeAwayStats: this.computeLeagueHomeAwayStats(leagueTotals),
+      leagueTotals,
+      playerStats,
+      teamAverages: this.computeTeamAverages(teamStats),
+      playerAverages: this.computePlayerAverages(playerStats),
+      sortedBy: { teams: {}, players: {} }  // סדר ממוין לפי מדד (נבנה בפעם הראשונה שמבקשים)
+    };
+  }
+
+  computeLocationAverages(record) {
+    ['home', 'away'].forEach(location => {
+      const loc = record[location];
+      const games = loc.games || 1;
+      
+      loc.ppg = (loc.totalPoints / games).toFixed(1);
+      loc.oppPpg = (loc.totalPointsAgainst / games).toFixed(1);
+      loc.winPct = loc.games > 0 ? ((loc.wins / loc.games) * 100).toFixed(1) : '0.0';
+      loc.winPpg = loc.wins > 0 ? (loc.winPoints / loc.wins).toFixed(1) : '0';  // ממוצע נקודות בניצחונות בלבד
+    });
+    return record;
+  }
+
+  computeLeagueHomeAwayStats({ homeWins, awayWins, totalGames }) {
+    return {
+      // ממוצע נקודות בניצחון בית
+      homeWinAvgPpg: homeWins.count > 0 ? (homeWins.totalPoints / homeWins.count).toFixed(1) : '0',
+      homeWinAvgOppPpg: homeWins.count > 0 ? (homeWins.totalPointsAgainst / homeWins.count).toFixed(1) : '0',
+      // ממוצע נקודות בניצחון חוץ
+      awayWinAvgPpg: awayWins.count > 0 ? (awayWins.totalPoints / awayWins.count).toFixed(1) : '0',
+      awayWinAvgOppPpg: awayWins.count > 0 ? (awayWins.totalPointsAgainst / awayWins.count).toFixed(1) : '0',
+      // אחוז ניצחונות בית בליגה
+      homeWinPct: totalGames > 0 ? ((homeWins.count / totalGames) * 100).toFixed(1) : '0',
+      // סה"כ
+      homeWinsCount: homeWins.count,
+      awayWinsCount: awayWins.count,
+      totalGames: totalGames
+    };
+  }
+
+  /**
+   * ===============================================
+   * MULTI-SEASON - שאילתות על כמה עונות
+   * ===============================================
+   */
+
+  /**
+   * Analytics על קבוצת עונות: הסכומים של כל עונה ממוזגים (בלי לעבור שוב על המשחקים)
+   * @param {Array} seasons - [{ aggregates, games }] מהישנה לחדשה; games ריק לעונה שנשמרה רק כמצטברים
+   * @returns {IBBAAnalytics} - this.games = המשחקים הזמינים (רק מעונות שנטענו במלואן)
+   */
+  static fromSeasons(seasons) {
+    const analytics = new IBBAAnalytics([]);
+    const games = [];
+    seasons.forEach(season => {
+      (season.games || []).forEach(game => games.push(game));
+    });
+    analytics.games = games;
+    analytics._aggregates = analytics.mergeAggregates(seasons.map(season => season.aggregates));
+    analytics._aggregatesGames = games;
+    analytics._aggregatesLength = games.length;
+    return analytics;
+  }
+
+  /**
+   * מיזוג סכומים של כמה עונות (מהישנה לחדשה - קבוצה/מספר חולצה של שחקן לפי העונה האחרונה)
+   */
+  mergeAggregates(list) {
+    const teamStats = {};
+    const homeAwayRecords = {};
+    const playerStats = {};
+    const leagueTotals = {
+      homeWins: { count: 0, totalPoints: 0, totalPointsAgainst: 0 },
+      awayWins: { count: 0, totalPoints: 0, totalPointsAgainst: 0 },
+      totalGames: 0
+    };
+    const identityKeys = new Set(['playerId', 'jersey']);
+    const addTotals = (target, source) => {
+      Object.keys(target).forEach(key => {
+        if (!identityKeys.has(key) && typeof target[key] === 'number' && typeof source[key] === 'number') {
+          target[key] += source[key];
+        }
+      });
+    };
+
+    list.forEach(aggregates => {
+      Object.values(aggregates.teamStats).forEach(team => {
+        if (!teamStats[team.teamName]) teamStats[team.teamName] = this.createTeamTotals(team.teamName);
+        addTotals(teamStats[team.teamName], team);
+      });
+
+      Object.values(aggregates.homeAwayRecords).forEach(record => {
+        if (!homeAwayRecords[record.teamName]) {
+          homeAwayRecords[record.teamName] = {
+            teamName: record.teamName,
+            home: this.createLocationTotals(),
+            away: this.createLocationTotals()
+          };
+        }
+        addTotals(homeAwayRecords[record.teamName].home, record.home);
+        addTotals(homeAwayRecords[record.teamName].away, record.away);
+      });
+
+      Object.values(aggregates.playerStats).forEach(player => {
+        if (!playerStats[player.playerId]) playerStats[player.playerId] = this.createPlayerTotals(player);
+        const merged = playerStats[player.playerId];
+        addTotals(merged, player);
+        merged.jersey = player.jersey;
+        merged.name = player.name;
+        merged.teamName = player.teamName;
+      });
+
+      const totals = aggregates.leagueTotals;
+      addTotals(leagueTotals.homeWins, totals.homeWins);
+      addTotals(leagueTotals.awayWins, totals.awayWins);
+      leagueTotals.totalGames += totals.totalGames;
+    });
+
+    Object.values(homeAwayRecords).forEach(record => this.computeLocationAverages(record));
+    return this.finalizeAggregates({ teamStats, homeAwayRecords, playerStats, leagueTotals });
+  }
+
+  /**
+   * הסכומים בלבד (בלי ממוצעים וקשרים למשחקים) - לשמירת עונה ישנה בזיכרון מצומצם
+   */
+  getCompactAggregates() {
+    const { teamStats, homeAwayRecords, playerStats, leagueTotals } = this.getAggregates();
+    return { teamStats, homeAwayRecords, playerStats, leagueTotals };
+  }
+
+  /**
+   * ===============================================
+   * TEAM ANALYTICS - סטטיסטיקות קבוצתיות
+   * ===============================================
+   */
+
+  /**
+   * קבלת סכומים כוללים לכל קבוצה
+   * @returns {Object} מפה של teamName -> stats
+   */
+  getTeamStats() {
+    const teamStats = {};
+    Object.entries(this.getAggregates().teamStats).forEach(([teamName, stats]) => {
+      teamStats[teamName] = { ...stats };
+    });
     return teamStats;
   }
 
@@ -145,9 +512,13 @@ class IBBAAnalytics {
    * @returns {Array} מערך ממוין של קבוצות עם ממוצעים
    */
   getTeamAverages() {
-    console.time('⏱️ Team Averages Calculation');
-    
-    const teamStats = this.getTeamStats();
+    return this.getAggregates().teamAverages.map(team => ({ ...team }));
+  }
+
+  /**
+   * חישוב ממוצעים מתוך סכומי הקבוצות (חלק מ-buildAggregates)
+   */
+  computeTeamAverages(teamStats) {
     const teamAverages = [];
 
     Object.values(teamStats).forEach(team => {
@@ -206,7 +577,6 @@ class IBBAAnalytics {
     // מיון לפי PPG (ברירת מחדל)
     teamAverages.sort((a, b) => parseFloat(b.ppg) - parseFloat(a.ppg));
 
-    console.timeEnd('⏱️ Team Averages Calculation');
     return teamAverages;
   }
 
@@ -215,72 +585,14 @@ class IBBAAnalytics {
    * @returns {Object} מפה של teamName -> { home: {...}, away: {...} }
    */
   getTeamHomeAwayRecords() {
-    console.time('⏱️ Home/Away Records Calculation');
-    
     const homeAwayRecords = {};
-
-    this.games.forEach(game => {
-      game.teams.forEach(team => {
-        const teamName = team.name;
-        const isHome = team.isHome;
-        
-        if (!homeAwayRecords[teamName]) {
-          homeAwayRecords[teamName] = {
-            teamName: teamName,
-            home: {
-              games: 0,
-              wins: 0,
-              losses: 0,
-              totalPoints: 0,
-              totalPointsAgainst: 0,
-              winPoints: 0  // נקודות רק בניצחונות
-            },
-            away: {
-              games: 0,
-              wins: 0,
-              losses: 0,
-              totalPoints: 0,
-              totalPointsAgainst: 0,
-              winPoints: 0  // נקודות רק בניצחונות
-            }
-          };
-        }
-
-        const record = homeAwayRecords[teamName];
-        const location = isHome ? record.home : record.away;
-        
-        // ניקוד
-        const teamScore = isHome ? game.homeScore : game.awayScore;
-        const oppScore = isHome ? game.awayScore : game.homeScore;
-        
-        location.games++;
-        location.totalPoints += teamScore || 0;
-        location.totalPointsAgainst += oppScore || 0;
-        
-        // ניצחונות/הפסדים
-        if (teamScore > oppScore) {
-          location.wins++;
-          location.winPoints += teamScore || 0;  // נקודות רק בניצחונות
-        } else if (teamScore < oppScore) {
-          location.losses++;
-        }
-      });
-    });
-
-    // חישוב ממוצעים
-    Object.values(homeAwayRecords).forEach(record => {
-      ['home', 'away'].forEach(location => {
-        const loc = record[location];
-        const games = loc.games || 1;
-        
-        loc.ppg = (loc.totalPoints / games).toFixed(1);
-        loc.oppPpg = (loc.totalPointsAgainst / games).toFixed(1);
-        loc.winPct = loc.games > 0 ? ((loc.wins / loc.games) * 100).toFixed(1) : '0.0';
-        loc.winPpg = loc.wins > 0 ? (loc.winPoints / loc.wins).toFixed(1) : '0';  // ממוצע נקודות בניצחונות בלבד
-      });
+    Object.entries(this.getAggregates().homeAwayRecords).forEach(([teamName, record]) => {
+      homeAwayRecords[teamName] = {
+        teamName: record.teamName,
+        home: { ...record.home },
+        away: { ...record.away }
+      };
     });
-
-    console.timeEnd('⏱️ Home/Away Records Calculation');
     return homeAwayRecords;
   }
 
@@ -289,37 +601,7 @@ class IBBAAnalytics {
    * @returns {Object} ממוצעי ליגה לניצחונות
    */
   getLeagueHomeAwayStats() {
-    let homeWins = { count: 0, totalPoints: 0, totalPointsAgainst: 0 };
-    let awayWins = { count: 0, totalPoints: 0, totalPointsAgainst: 0 };
-    
-    this.games.forEach(game => {
-      if (game.homeScore > game.awayScore) {
-        // ניצחון בית
-        homeWins.count++;
-        homeWins.totalPoints += game.homeScore;
-        homeWins.totalPointsAgainst += game.awayScore;
-      } else if (game.awayScore > game.homeScore) {
-        // ניצחון חוץ
-        awayWins.count++;
-        awayWins.totalPoints += game.awayScore;
-        awayWins.totalPointsAgainst += game.homeScore;
-      }
-    });
-    
-    return {
-      // ממוצע נקודות בניצחון בית
-      homeWinAvgPpg: homeWins.count > 0 ? (homeWins.totalPoints / homeWins.count).toFixed(1) : '0',
-      homeWinAvgOppPpg: homeWins.count > 0 ? (homeWins.totalPointsAgainst / homeWins.count).toFixed(1) : '0',
-      // ממוצע נקודות בניצחון חוץ
-      awayWinAvgPpg: awayWins.count > 0 ? (awayWins.totalPoints / awayWins.count).toFixed(1) : '0',
-      awayWinAvgOppPpg: awayWins.count > 0 ? (awayWins.totalPointsAgainst / awayWins.count).toFixed(1) : '0',
-      // אחוז ניצחונות בית בליגה
-      homeWinPct: this.games.length > 0 ? ((homeWins.count / this.games.length) * 100).toFixed(1) : '0',
-      // סה"כ
-      homeWinsCount: homeWins.count,
-      awayWinsCount: awayWins.count,
-      totalGames: this.games.length
-    };
+    return { ...this.getAggregates().leagueHomeAwayStats };
   }
 
   /**
@@ -333,86 +615,10 @@ class IBBAAnalytics {
    * @returns {Object} מפה של playerId -> stats
    */
   getPlayerStats() {
-    console.time('⏱️ Player Stats Calculation');
-    
     const playerStats = {};
-
-    this.games.forEach(game => {
-      game.players.forEach(player => {
-        const playerId = player.playerId;
-        
-        // המרת דקות (אם בפורמט מחרוזת "MM:SS")
-        let minutes = player.calculated?.minutesDecimal || 0;
-        
-        // Fallback: אם calculated לא קיים, נסה להמיר ישירות מ-stats.minutesPlayed
-        if (minutes === 0 && player.stats?.minutesPlayed) {
-          const minStr = player.stats.minutesPlayed;
-          if (minStr && minStr !== '0:00') {
-            const parts = String(minStr).split(':');
-            const mins = parseInt(parts[0]) || 0;
-            const secs = parseInt(parts[1]) || 0;
-            minutes = mins + (secs / 60);
-          }
-        }
-        
-        // דלג על שחקנים שלא שיחקו בפועל (0 דקות)
-        if (minutes === 0) {
-          return;
-        }
-
-        if (!playerStats[playerId]) {
-          playerStats[playerId] = {
-            playerId: playerId,
-            name: `Player #${player.jersey}`, // אין לנו שמות אמיתיים
-            jersey: player.jersey,
-            teamName: player.teamName,
-            gamesPlayed: 0,
-            totalPoints: 0,
-            totalRebounds: 0,
-            totalAssists: 0,
-            totalSteals: 0,
-            totalBlocks: 0,
-            totalTurnovers: 0,
-            totalFouls: 0,
-            totalFoulsDrawn: 0,
-            totalMinutes: 0,
-            totalFGM: 0,
-            totalFGA: 0,
-            total3PM: 0,
-            total3PA: 0,
-            totalFTM: 0,
-            totalFTA: 0,
-            totalEfficiency: 0,
-            totalPlusMinus: 0
-          };
-        }
-
-        const stats = playerStats[playerId];
-        stats.gamesPlayed++;
-
-        const s = player.stats;
-        stats.totalPoints += s.points || 0;
-        stats.totalRebounds += s.totalRebounds || 0;
-        stats.totalAssists += s.assists || 0;
-        stats.totalSteals += s.steals || 0;
-        stats.totalBlocks += s.blocks || 0;
-        stats.totalTurnovers += s.turnovers || 0;
-        stats.totalFouls += s.personalFouls || 0;
-        stats.totalFoulsDrawn += s.foulsDrawn || 0;
-        stats.totalFGM += s.fieldGoalsMade || 0;
-        stats.totalFGA += s.fieldGoalsAttempted || 0;
-        stats.total3PM += s.threePointsMade || 0;
-        stats.total3PA += s.threePointsAttempted || 0;
-        stats.totalFTM += s.freeThrowsMade || 0;
-        stats.totalFTA += s.freeThrowsAttempted || 0;
-        stats.totalEfficiency += s.efficiency || 0;
-        stats.totalPlusMinus += s.plusMinus || 0;
-        
-        stats.totalMinutes += minutes;
-      });
+    Object.entries(this.getAggregates().playerStats).forEach(([playerId, stats]) => {
+      playerStats[playerId] = { ...stats };
     });
-
-    console.timeEnd('⏱️ Player Stats Calculation');
     return playerStats;
   }
 
@@ -421,26 +627,35 @@ class IBBAAnalytics {
    * @returns {Array} מערך ממוין של שחקנים עם ממוצעים
    */
   getPlayerAverages() {
-    console.time('⏱️ Player Averages Calculation');
-    
-    const playerStats = this.getPlayerStats();
+    return this.getAggregates().playerAverages.map(player => this.applyPlusMinusOverride({ ...player }));
+  }
+
+  /**
+   * Plus/Minus מחושב מראש ע"י playerNamesLoader (אם קיים) - משתנה בזמן ריצה ולכן לא נשמר ב-cache
+   */
+  applyPlusMinusOverride(player) {
+    if (window.playerNamesLoader?.namesMap) {
+      const playerData = window.playerNamesLoader.namesMap.get(String(player.playerId));
+      if (playerData && typeof playerData.totalPlusMinus === 'number') {
+        const games = player.gamesPlayed || 1;
+        player._totalPlusMinus = playerData.totalPlusMinus;
+        player.plusMinusPg = (playerData.totalPlusMinus / games).toFixed(1);
+      }
+    }
+    return player;
+  }
+
+  /**
+   * חישוב ממוצעים מתוך סכומי השחקנים (חלק מ-buildAggregates)
+   */
+  computePlayerAverages(playerStats) {
     const playerAverages = [];
 
     Object.values(playerStats).forEach(player => {
       const games = player.gamesPlayed || 1;
 
-      // Try to get Plus/Minus from playerNamesLoader (pre-calculated by client)
-      let totalPlusMinus = player.totalPlusMinus;
-      let plusMinusPg = (totalPlusMinus / games).toFixed(1);
-      
-      if (window.playerNamesLoader?.namesMap) {
-        const playerData = window.playerNamesLoader.namesMap.get(String(player.playerId));
-        if (playerData && typeof playerData.totalPlusMinus === 'number') {
-          // Use pre-calculated value from client
-          totalPlusMinus = playerData.totalPlusMinus;
-          plusMinusPg = (totalPlusMinus / games).toFixed(1);
-        }
-      }
+      const totalPlusMinus = player.totalPlusMinus;
+      const plusMinusPg = (totalPlusMinus / games).toFixed(1);
       
       playerAverages.push({
         playerId: player.playerId,
@@ -484,7 +699,6 @@ class IBBAAnalytics {
     // מיון לפי PPG (ברירת מחדל)
     playerAverages.sort((a, b) => parseFloat(b.ppg) - parseFloat(a.ppg));
 
-    console.timeEnd('⏱️ Player Averages Calculation');
     return playerAverages;
   }
 
@@ -495,49 +709,68 @@ class IBBAAnalytics {
    */
 
   /**
-   * קבלת Top N קבוצות לפי מדד מסוים
+   * רשימה ממוינת לפי מדד - נשמרת ב-cache עד שרשימת המשחקים משתנה
+   * @param {string} kind - 'teams' | 'players'
    */
-  getTopTeams(metric = 'ppg', limit = 10) {
-    const teams = this.getTeamAverages();
+  getSortedByMetric(kind, metric) {
+    const aggregates = this.getAggregates();
+    const cache = aggregates.sortedBy[kind];
     
-    // מיון לפי המדד המבוקש
-    teams.sort((a, b) => {
-      const aVal = parseFloat(a[metric]) || 0;
-      const bVal = parseFloat(b[metric]) || 0;
-      return bVal - aVal;
-    });
+    if (!cache[metric]) {
+      const source = kind === 'teams' ? aggregates.teamAverages : aggregates.playerAverages;
+      cache[metric] = source.slice().sort((a, b) => {
+        const aVal = parseFloat(a[metric]) || 0;
+        const bVal = parseFloat(b[metric]) || 0;
+        return bVal - aVal;
+      });
+    }
     
-    return teams.slice(0, limit);
+    return cache[metric];
+  }
+
+  /**
+   * קבלת Top N קבוצות לפי מדד מסוים
+   */
+  getTopTeams(metric = 'ppg', limit = 10) {
+    return this.getSortedByMetric('teams', metric)
+      .slice(0, limit)
+      .map(team => ({ ...team }));
   }
 
   /**
    * קבלת Top N שחקנים לפי מדד מסוים
    */
   getTopPlayers(metric = 'ppg', limit = 10) {
-    const players = this.getPlayerAverages();
-    
-    // מיון לפי המדד המבוקש
-    players.sort((a, b) => {
-      const aVal = parseFloat(a[metric]) || 0;
-      const bVal = parseFloat(b[metric]) || 0;
-      return bVal - aVal;
-    });
+    // Plus/Minus מושפע מ-playerNamesLoader בזמן ריצה - ממיינים מחדש
+    if (metric === 'plusMinusPg' || metric === '_totalPlusMinus') {
+      const players = this.getPlayerAverages();
+      players.sort((a, b) => {
+        const aVal = parseFloat(a[metric]) || 0;
+        const bVal = parseFloat(b[metric]) || 0;
+        return bVal - aVal;
+      });
+      return players.slice(0, limit);
+    }
     
-    return players.slice(0, limit);
+    return this.getSortedByMetric('players', metric)
+      .slice(0, limit)
+      .map(player => this.applyPlusMinusOverride({ ...player }));
   }
 
   /**
    * סטטיסטיקות כלליות על המערך
    */
   getOverallStats() {
-    const teams = Object.keys(this.getTeamStats()).length;
-    const players = Object.keys(this.getPlayerStats()).length;
+    const { teamStats, playerStats, leagueTotals } = this.getAggregates();
+    const totalGames = leagueTotals.totalGames; // כולל עונות שנשמרו רק כמצטברים
+    const teams = Object.keys(teamStats).length;
+    const players = Object.keys(playerStats).length;
     
     return {
-      totalGames: this.games.length,
+      totalGames,
       totalTeams: teams,
       totalPlayers: players,
-      avgPlayersPerGame: this.games.length > 0 ? (players / this.games.length).toFixed(1) : '0.0'
+      avgPlayersPerGame: totalGames > 0 ? (players / totalGames).toFixed(1) : '0.0'
     };
   }
 }
@@ -545,5 +778,10 @@ class IBBAAnalytics {
 // Export to global scope
 window.IBBAAnalytics = IBBAAnalytics;
 
+// IBBATracer: בניית האגרגטים
+if (window.IBBATracer) {
+  window.IBBATracer.getShared().instrument(IBBAAnalytics.prototype, ['buildAggregates'], { category: 'analytics' });
+}
+
 console.log('📊 IBBAAnalytics loaded successfully!');
 
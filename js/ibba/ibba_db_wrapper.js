@@ -55,49 +55,7 @@ class IBBADbWrapper {
       console.log(`💾 Saving game ${game.gameId} to database...`);
       
       // המרה לפורמט של db_adapter
-      const gameData = {
-        game_serial: game.gameSerial || game.gameId,
-        game_id: game.gameId,
-        date: game.date,
-        date_gmt: game.dateGMT || game.date,
-        league: game.league,
-        league_id: game.leagueId,
-        gender: game.gender || 'M',
-        
-        // קבוצות
-        home_team_id: game.teams[0].id,
-        home_team_name: game.teams[0].name,
-        away_team_id: game.teams[1].id,
-        away_team_name: game.teams[1].name,
-        
-        // תוצאה
-        home_score: game.finalScore.home,
-        away_score: game.finalScore.away,
-        
-        // מנצח
-        winner_team_id: game.winner,
-        
-        // רבעים
-        q1_home: game.quarters?.q1?.home || 0,
-        q1_away: game.quarters?.q1?.away || 0,
-        q2_home: game.quarters?.q2?.home || 0,
-        q2_away: game.quarters?.q2?.away || 0,
-        q3_home: game.quarters?.q3?.home || 0,
-        q3_away: game.quarters?.q3?.away || 0,
-        q4_home: game.quarters?.q4?.home || 0,
-        q4_away: game.quarters?.q4?.away || 0,
-        
-        // סטטיסטיקות קבוצתיות (אם יש)
-        home_stats: game.teamStats?.home ? JSON.stringify(game.teamStats.home) : null,
-        away_stats: game.teamStats?.away ? JSON.stringify(game.teamStats.away) : null,
-        
-        // JSON מקורי
-        original_json: game.originalJson ? JSON.stringify(game.originalJson) : null,
-        
-        // מטא-דאטה
-        source: 'ibba_api',
-        imported_at: new Date().toISOString()
-      };
+      const gameData = this.buildGameRow(game);
       
       // שמירה דרך db_adapter
       await window.dbAdapter.saveGame(gameData);
@@ -111,6 +69,115 @@ class IBBADbWrapper {
     }
   }
 
+  /**
+   * המרת משחק לשורת games של db_adapter
+   */
+  buildGameRow(game) {
+    return {
+      gameSerial: game.gameSerial || game.gameId,
+      game_serial: game.gameSerial || game.gameId,
+      game_id: game.gameId,
+      date: game.date,
+      date_gmt: game.dateGMT || game.date,
+      league: game.league,
+      league_id: game.leagueId,
+      gender: game.gender || 'M',
+      
+      // קבוצות
+      home_team_id: game.teams[0].id,
+      home_team_name: game.teams[0].name,
+      away_team_id: game.teams[1].id,
+      away_team_name: game.teams[1].name,
+      
+      // תוצאה
+      home_score: game.finalScore.home,
+      away_score: game.finalScore.away,
+      
+      // מנצח
+      winner_team_id: game.winner,
+      
+      // רבעים
+      q1_home: game.quarters?.q1?.home || 0,
+      q1_away: game.quarters?.q1?.away || 0,
+      q2_home: game.quarters?.q2?.home || 0,
+      q2_away: game.quarters?.q2?.away || 0,
+      q3_home: game.quarters?.q3?.home || 0,
+      q3_away: game.quarters?.q3?.away || 0,
+      q4_home: game.quarters?.q4?.home || 0,
+      q4_away: game.quarters?.q4?.away || 0,
+      
+      // סטטיסטיקות קבוצתיות (אם יש)
+      home_stats: game.teamStats?.home ? JSON.stringify(game.teamStats.home) : null,
+      away_stats: game.teamStats?.away ? JSON.stringify(game.teamStats.away) : null,
+      
+      // JSON מקורי
+      original_json: game.originalJson ? JSON.stringify(game.originalJson) : null,
+      
+      // מטא-דאטה
+      source: 'ibba_api',
+      imported_at: new Date().toISOString()
+    };
+  }
+
+  /**
+   * שורות appearances למשחק (שורה לכל שחקן, ייחודי לפי playerId+gameId)
+   */
+  buildAppearanceRows(game) {
+    return (game.players || []).map(player => ({
+      playerId: String(player.playerId),
+      gameId: game.gameId,
+      team: player.teamName,
+      jersey: String(player.jersey ?? ''),
+      minutesPlayed: player.stats?.minutesPlayed || '0:00',
+      active: true
+    }));
+  }
+
+  /**
+   * שורות player_stats למשחק (ייחודי לפי playerId+gameId)
+   */
+  buildPlayerStatRows(game) {
+    return (game.players || []).map(player => {
+      const stats = player.stats || {};
+      return {
+        playerId: String(player.playerId),
+        gameId: game.gameId,
+        points: stats.points || 0,
+        rebounds: stats.totalRebounds || 0,
+        assists: stats.assists || 0,
+        steals: stats.steals || 0,
+        blocks: stats.blocks || 0,
+        turnovers: stats.turnovers || 0,
+        fouls: stats.personalFouls || 0,
+        foulsDrawn: stats.foulsDrawn || 0,
+        efficiency: stats.efficiency || 0,
+        fieldGoalsMade: stats.fieldGoalsMade || 0,
+        fieldGoalsAttempted: stats.fieldGoalsAttempted || 0,
+        threePointsMade: stats.threePointsMade || 0,
+        threePointsAttempted: stats.threePointsAttempted || 0,
+        freeThrowsMade: stats.freeThrowsMade || 0,
+        freeThrowsAttempted: stats.freeThrowsAttempted || 0
+      };
+    });
+  }
+
+  /**
+   * שמירה מרוכזת של batch משחקים: upsert אחד לכל טבלה (games, appearances, player_stats)
+   * במקום שלוש כתיבות לכל משחק
+   */
+  async saveGamesBulk(games) {
+    await this.ensureReady();
+    
+    const payload = {
+      games: games.map(game => this.buildGameRow(game)),
+      appearances: games.flatMap(game => this.buildAppearanceRows(game)),
+      playerStats: games.flatMap(game => this.buildPlayerStatRows(game))
+    };
+    
+    console.log(`💾 Bulk saving ${payload.games.length} games (${payload.playerStats.length} player lines)...`);
+    return await this.writeRows(payload);
+  }
+
   /**
    * בדיקה אם משחק קיים במסד
    */
@@ -129,14 +196,26 @@ class IBBADbWrapper {
   /**
    * בדיקת קיום של מספר משחקים
    * מחזיר מערך של משחקים שכן קיימים
+   * משתמש בשאילתת in (...) אחת לכל chunk, ואם אין - בדיקה לכל משחק בנפרד
    */
   async checkGamesExist(gameIds) {
     await this.ensureReady();
     
+    if (typeof window.dbAdapter.gameIdsExist === 'function') {
+      try {
+        const existingIds = await window.dbAdapter.gameIdsExist(gameIds);
+        return gameIds
+          .filter(gameId => existingIds.has(gameId))
+          .map(gameId => ({ game_id: gameId }));
+      } catch (error) {
+        console.warn('⚠️ Bulk existence check failed, falling back to per-game check:', error);
+      }
+    }
+    
     try {
       const existingGames = [];
       
-      // בדיקה לכל משחק (לא אופטימלי אבל עובד)
+      // בדיקה לכל משחק (fallback)
       for (const gameId of gameIds) {
         try {
           const game = await window.dbAdapter.getGame(gameId);
@@ -224,27 +303,21 @@ class IBBADbWrapper {
   /**
    * שמירת appearances למשחק
    * (appearances = רשומות של מי שיחק במשחק)
+   * אותן שורות ואותו upsert כמו saveGamesBulk - batch של משחק אחד, רק הטבלה הזו
    */
   async saveAppearances(game) {
     await this.ensureReady();
     
     try {
-      console.log(`💾 Saving appearances for game ${game.gameId}...`);
-      
-      if (!game.players || game.players.length === 0) {
+      const appearances = this.buildAppearanceRows(game);
+      if (appearances.length === 0) {
         console.warn(`⚠️ No players in game ${game.gameId}`);
         return { success: true, saved: 0 };
       }
       
-      // שמירת כל שחקן שהשתתף במשחק
-      // (db_adapter לא תומך ישירות ב-appearances, אז נשתמש בגישה עקיפה)
-      
-      // אופציה 1: נשמור ב-localStorage או IndexedDB ישירות
-      // אופציה 2: נשמור ב-table נפרד אם קיים
-      
-      // בשלב זה נחזיר success - נטפל בזה בהמשך אם צריך
-      console.log(`✅ Appearances for game ${game.gameId} processed (${game.players.length} players)`);
-      return { success: true, saved: game.players.length };
+      await this.writeRows({ appearances });
+      console.log(`✅ Appearances for game ${game.gameId} saved (${appearances.length} players)`);
+      return { success: true, saved: appearances.length };
       
     } catch (error) {
       console.error(`❌ Failed to save appearances for game ${game.gameId}:`, error);
@@ -259,26 +332,21 @@ class IBBADbWrapper {
    */
 
   /**
-   * שמירת סטטיסטיקות שחקנים למשחק
+   * שמירת סטטיסטיקות שחקנים למשחק (אותן שורות כמו saveGamesBulk)
    */
   async savePlayerStats(game) {
     await this.ensureReady();
     
     try {
-      console.log(`💾 Saving player stats for game ${game.gameId}...`);
-      
-      if (!game.players || game.players.length === 0) {
+      const playerStats = this.buildPlayerStatRows(game);
+      if (playerStats.length === 0) {
         console.warn(`⚠️ No players in game ${game.gameId}`);
         return { success: true, saved: 0 };
       }
       
-      // כרגע db_adapter לא תומך ישירות ב-player_stats table
-      // נשמור את הנתונים כחלק מה-game (ב-original_json)
-      
-      // בעתיד אפשר להוסיף table נפרד ל-player_stats
-      
-      console.log(`✅ Player stats for game ${game.gameId} saved (${game.players.length} players)`);
-      return { success: true, saved: game.players.length };
+      await this.writeRows({ playerStats });
+      console.log(`✅ Player stats for game ${game.gameId} saved (${playerStats.length} players)`);
+      return { success: true, saved: playerStats.length };
       
     } catch (error) {
       console.error(`❌ Failed to save player stats for game ${game.gameId}:`, error);
@@ -286,6 +354,17 @@ class IBBADbWrapper {
     }
   }
 
+  /**
+   * upsert של שורות appearances / player_stats דרך dbAdapter.saveGamesBulk
+   * (ה-upsert לפי playerId+gameId - שמירה חוזרת של משחק לא יוצרת כפילויות)
+   */
+  async writeRows({ games = [], appearances = [], playerStats = [] }) {
+    if (typeof window.dbAdapter.saveGamesBulk !== 'function') {
+      throw new Error('dbAdapter.saveGamesBulk is not available');
+    }
+    return await window.dbAdapter.saveGamesBulk({ games, appearances, playerStats });
+  }
+
   /**
    * ============================================
    * פונקציות Transfers (העברות)
@@ -443,6 +522,14 @@ class IBBADbWrapper {
   }
 }
 
+// IBBATracer: כתיבות וקריאות DB
+if (typeof window !== 'undefined' && window.IBBATracer) {
+  window.IBBATracer.getShared().instrument(IBBADbWrapper.prototype, [
+    'saveGame', 'saveGamesBulk', 'isGameExists', 'checkGamesExist', 'savePlayer', 'getAllPlayers', 'getPlayer',
+    'saveAppearances', 'savePlayerStats', 'saveTransfer', 'updatePlayerTeam', 'getAllGames', 'getAllTeams', 'getDbStats'
+  ], { category: 'db' });
+}
+
 // ייצוא למודול
 if (typeof module !== 'undefined' && module.exports) {
   module.exports = IBBADbWrapper;
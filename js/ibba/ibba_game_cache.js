@@ -0,0 +1,256 @@
+/**
+ * IBBA Game Cache
+ * מטמון קבוע (IndexedDB) למשחקי IBBA שהסתיימו + רענון מצטבר "מאז הסנכרון האחרון"
+ *
+ * - כל משחק נשמר לפי ה-event id של IBBA, גם בפורמט המקורי (raw) וגם אחרי convertToInternalFormat
+ * - בטעינה מבקשים רק את החודשים שמהמשחק האחרון במטמון (פחות חלון ביטחון) ואילך
+ * - משחקים עתידיים / ללא performance לא נשמרים - הם יירעננו בטעינה הבאה
+ * - אם IndexedDB לא זמין (file://, מצב פרטי) - נופל למטמון בזיכרון בלבד
+ *
+ * @module IBBAGameCache
+ * @version 1.0.0
+ */
+class IBBAGameCache {
+  /**
+   * @param {Object} options - { dbName, safetyWindowDays, storage }
+   */
+  constructor(options = {}) {
+    this.dbName = options.dbName || 'IBBAGameCache';
+    this.dbVersion = 1;
+    this.storeName = 'games';
+    this.metaStoreName = 'meta';
+
+    // גרסת הפורמט המומר - העלאה שלה גורמת להמרה מחדש מה-raw (בלי הורדה מהרשת)
+    this.converterVersion = 1;
+
+    // חלון ביטחון - משחקים שעודכנו באיחור (תוצאה/סטטיסטיקה) סמוך למשחק האחרון במטמון
+    this.safetyWindowDays = options.safetyWindowDays ?? 7;
+
+    this.storage = options.storage || (typeof indexedDB !== 'undefined' ? null : new Map());
+    this.db = null;
+
+    this.stats = {
+      hits: 0,          // משחקים שהוגשו מהמטמון
+      misses: 0,        // משחקים שהגיעו מהרשת והומרו
+      reconverted: 0,   // משחקים שהומרו מחדש מה-raw בגלל שינוי גרסה
+      monthsRequested: 0,
+      fullResync: false,
+      lastSync: null
+    };
+  }
+
+  /**
+   * פתיחת מסד הנתונים (פעם אחת)
+   */
+  async open() {
+    if (this.storage || this.db) return;
+
+    this.db = await new Promise((resolve, reject) => {
+      const request = indexedDB.open(this.dbName, this.dbVersion);
+
+      request.onupgradeneeded = (e) => {
+        const db = e.target.result;
+        if (!db.objectStoreNames.contains(this.storeName)) {
+          const store = db.createObjectStore(this.storeName, { keyPath: 'id' });
+          store.createIndex('leagueSeason', 'leagueSeason', { unique: false });
+        }
+        if (!db.objectStoreNames.contains(this.metaStoreName)) {
+          db.createObjectStore(this.metaStoreName, { keyPath: 'key' });
+        }
+      };
+
+      request.onsuccess = (e) => resolve(e.target.result);
+      request.onerror = () => reject(new Error(`Cannot open ${this.dbName}`));
+    });
+  }
+
+  /**
+   * מפתח ליגה+עונה (כדי שעונות שונות לא יתערבבו)
+   */
+  getLeagueSeasonKey(adapter) {
+    return `${adapter.leagueId}:${adapter.seasonId}`;
+  }
+
+  /**
+   * קריאת כל הרשומות של ליגה+עונה
+   */
+  async getEntries(leagueSeason) {
+    await this.open();
+
+    if (this.storage) {
+      return Array.from(this.storage.values()).filter(entry => entry.leagueSeason === leagueSeason);
+    }
+
+    return new Promise((resolve, reject) => {
+      const tx = this.db.transaction([this.storeName], 'readonly');
+      const request = tx.objectStore(this.storeName).index('leagueSeason').getAll(leagueSeason);
+      request.onsuccess = () => resolve(request.result || []);
+      request.onerror = () => reject(request.error);
+    });
+  }
+
+  /**
+   * שמירת רשומות בטרנזקציה אחת
+   */
+  async putEntries(entries) {
+    if (entries.length === 0) return;
+    await this.open();
+
+    if (this.storage) {
+      entries.forEach(entry => this.storage.set(entry.id, entry));
+      return;
+    }
+
+    await new Promise((resolve, reject) => {
+      const tx = this.db.transaction([this.storeName], 'readwrite');
+      const store = tx.objectStore(this.storeName);
+      entries.forEach(entry => store.put(entry));
+      tx.oncomplete = () => resolve();
+      tx.onerror = () => reject(tx.error);
+    });
+  }
+
+  /**
+   * מחיקת כל המשחקים של ליגה+עונה (לפני סנכרון מלא)
+   */
+  async clear(leagueSeason) {
+    const entries = await this.getEntries(leagueSeason);
+
+    if (this.storage) {
+      entries.forEach(entry => this.storage.delete(entry.id));
+      return;
+    }
+
+    await new Promise((resolve, reject) => {
+      const tx = this.db.transaction([this.storeName], 'readwrite');
+      const store = tx.objectStore(this.storeName);
+      entries.forEach(entry => store.delete(entry.id));
+      tx.oncomplete = () => resolve();
+      tx.onerror = () => reject(tx.error);
+    });
+  }
+
+  /**
+   * האם המשחק הסתיים (יש performance) - רק משחקים כאלה נשמרים
+   */
+  isCompletedGame(rawGame) {
+    return !!rawGame?.performance && rawGame.performance !== '' && Object.keys(rawGame.performance).length > 0;
+  }
+
+  /**
+   * החודשים שצריך לבקש: מהמשחק האחרון במטמון פחות חלון הביטחון ואילך
+   */
+  getMonthsToRefresh(seasonMonths, newestDate) {
+    if (!newestDate) return seasonMonths;
+
+    const cutoff = new Date(new Date(newestDate).getTime() - this.safetyWindowDays * 24 * 60 * 60 * 1000);
+    if (isNaN(cutoff.getTime())) return seasonMonths;
+
+    const cutoffMonth = `${cutoff.getFullYear()}-${String(cutoff.getMonth() + 1).padStart(2, '0')}`;
+    return seasonMonths.filter(month => month >= cutoffMonth);
+  }
+
+  /**
+   * המרת רשומת מטמון למשחק פנימי (ה-raw לא נשמר פעמיים - מוחזר כ-originalJson)
+   */
+  entryToGame(entry) {
+    return { ...entry.converted, originalJson: entry.raw };
+  }
+
+  createEntry(rawGame, converted, leagueSeason) {
+    const { originalJson, ...convertedWithoutRaw } = converted;
+    return {
+      id: rawGame.id,
+      leagueSeason,
+      date: rawGame.date,
+      converterVersion: this.converterVersion,
+      raw: rawGame,
+      converted: convertedWithoutRaw,
+      cachedAt: new Date().toISOString()
+    };
+  }
+
+  /**
+   * טעינת משחקי העונה: מהמטמון + רענון מצטבר מהרשת
+   * @param {IBBAAdapter} adapter
+   * @param {Object} options - { forceFullResync }
+   * @returns {Promise<Array>} משחקים בפורמט פנימי, מהחדש לישן
+   */
+  async loadSeasonGames(adapter, options = {}) {
+    const { forceFullResync = false } = options;
+    const leagueSeason = this.getLeagueSeasonKey(adapter);
+
+    if (forceFullResync) {
+      console.log('🔄 Game cache: forcing full resync');
+      await this.clear(leagueSeason);
+    }
+
+    const cachedEntries = await this.getEntries(leagueSeason);
+    const gamesById = new Map();
+    const toWrite = [];
+
+    cachedEntries.forEach(entry => {
+      if (entry.converterVersion !== this.converterVersion) {
+        const converted = adapter.convertToInternalFormat(entry.raw);
+        toWrite.push(this.createEntry(entry.raw, converted, leagueSeason));
+        gamesById.set(entry.id, converted);
+        this.stats.reconverted++;
+      } else {
+        gamesById.set(entry.id, this.entryToGame(entry));
+      }
+      this.stats.hits++;
+    });
+
+    const newestDate = cachedEntries.reduce(
+      (newest, entry) => (!newest || new Date(entry.date) > new Date(newest) ? entry.date : newest),
+      null
+    );
+    const months = this.getMonthsToRefresh(adapter.seasonMonths, newestDate);
+    console.log(`📦 Game cache: ${cachedEntries.length} cached games, refreshing ${months.length}/${adapter.seasonMonths.length} months`);
+
+    const rawGames = months.length > 0
+      ? await adapter.fetchSeasonMonthGames(Infinity, { months })
+      : [];
+    this.stats.monthsRequested += months.length;
+
+    rawGames.forEach(rawGame => {
+      const cached = gamesById.get(rawGame.id);
+      if (cached && this.isCompletedGame(cached.originalJson)) {
+        return; // משחק שהסתיים לא משתנה - אין צורך להמיר שוב
+      }
+
+      const converted = adapter.convertToInternalFormat(rawGame);
+      gamesById.set(rawGame.id, converted);
+      this.stats.misses++;
+
+      if (this.isCompletedGame(rawGame)) {
+        toWrite.push(this.createEntry(rawGame, converted, leagueSeason));
+      }
+    });
+
+    await this.putEntries(toWrite);
+
+    this.stats.fullResync = forceFullResync || cachedEntries.length === 0;
+    this.stats.lastSync = new Date().toISOString();
+    console.log(`✅ Game cache: ${this.stats.hits} hits, ${this.stats.misses} misses, ${toWrite.length} written`);
+
+    return Array.from(gamesById.values())
+      .sort((a, b) => new Date(b.date) - new Date(a.date));
+  }
+
+  getStats() {
+    return { ...this.stats };
+  }
+
+  resetStats() {
+    this.stats.hits = 0;
+    this.stats.misses = 0;
+    this.stats.reconverted = 0;
+    this.stats.monthsRequested = 0;
+  }
+}
+
+// Export for use
+window.IBBAGameCache = IBBAGameCache;
+
+console.log('✅ IBBA Game Cache loaded successfully');
@@ -140,8 +140,9 @@ class IBBAGameLoader {
 
   /**
    * טעינה ושמירה אוטומטית של משחקים חדשים
+   * @param {Object} saveOptions - אופציות ל-saveGames (למשל { bulk: true, batchSize: 25 })
    */
-  async loadAndSaveNewGames(since = 'auto', until = 'now', limit = 50) {
+  async loadAndSaveNewGames(since = 'auto', until = 'now', limit = 50, saveOptions = {}) {
     console.log('💾 Starting load and save process...');
     
     // 1. טעינת משחקים חדשים
@@ -162,7 +163,7 @@ class IBBAGameLoader {
     
     // 2. שמירת משחקים חדשים
     console.log(`💾 Saving ${loadResult.games.length} new games...`);
-    const saveResults = await this.saveGames(loadResult.games);
+    const saveResults = await this.saveGames(loadResult.games, saveOptions);
     
     return {
       ...loadResult,
@@ -172,8 +173,13 @@ class IBBAGameLoader {
 
   /**
    * שמירת מערך משחקים למסד
+   * @param {Object} options - { bulk: true } לשמירה מרוכזת ב-batches (ראה saveGamesBulk)
    */
-  async saveGames(games) {
+  async saveGames(games, options = {}) {
+    if (options.bulk) {
+      return this.saveGamesBulk(games, options);
+    }
+    
     const results = {
       saved: 0,
       failed: 0,
@@ -206,6 +212,100 @@ class IBBAGameLoader {
     return results;
   }
 
+  /**
+   * שמירה מרוכזת: כל batch של משחקים נכתב ב-upsert אחד לכל טבלה
+   * עד `concurrency` batches בו-זמנית, עם ניסיונות חוזרים ל-batch שנכשל
+   * 
+   * @param {Array} games - משחקים בפורמט פנימי
+   * @param {Object} options - { batchSize, concurrency, maxRetries, retryDelayMs, onProgress }
+   */
+  async saveGamesBulk(games, options = {}) {
+    const {
+      batchSize = 25,
+      concurrency = 2,
+      maxRetries = 2,
+      retryDelayMs = 500,
+      onProgress = null
+    } = options;
+    
+    const results = {
+      saved: 0,
+      failed: 0,
+      errors: [],
+      batches: 0,
+      retries: 0,
+      durationMs: 0,
+      gamesPerSecond: 0
+    };
+    
+    const batches = [];
+    for (let i = 0; i < games.length; i += batchSize) {
+      batches.push(games.slice(i, i + batchSize));
+    }
+    
+    const startedAt = Date.now();
+    let nextBatch = 0;
+    
+    const saveBatch = async (batch, batchIndex) => {
+      for (let attempt = 0; ; attempt++) {
+        try {
+          await this.db.saveGamesBulk(batch);
+          results.saved += batch.length;
+          return;
+        } catch (error) {
+          if (attempt >= maxRetries) {
+            results.failed += batch.length;
+            batch.forEach(game => results.errors.push({
+              gameId: game.gameId,
+              teams: `${game.teams[0].name} vs ${game.teams[1].name}`,
+              error: error.message
+            }));
+            console.error(`❌ Batch ${batchIndex + 1}/${batches.length} failed after ${attempt + 1} attempts:`, error.message);
+            return;
+          }
+          
+          results.retries++;
+          console.warn(`⚠️ Batch ${batchIndex + 1}/${batches.length} failed, retrying (${attempt + 1}/${maxRetries})...`, error.message);
+          await new Promise(resolve => setTimeout(resolve, retryDelayMs * (attempt + 1)));
+        }
+      }
+    };
+    
+    const worker = async () => {
+      while (nextBatch < batches.length) {
+        const batchIndex = nextBatch++;
+        await saveBatch(batches[batchIndex], batchIndex);
+        results.batches++;
+        
+        console.log(`💾 Batch ${batchIndex + 1}/${batches.length} done (${results.saved}/${games.length} saved)`);
+        if (onProgress) {
+          onProgress({
+            batch: batchIndex + 1,
+            totalBatches: batches.length,
+            completedBatches: results.batches,
+            saved: results.saved,
+            failed: results.failed,
+            total: games.length
+          });
+        }
+      }
+    };
+    
+    const workers = [];
+    for (let i = 0; i < Math.min(concurrency, batches.length); i++) {
+      workers.push(worker());
+    }
+    await Promise.all(workers);
+    
+    results.durationMs = Date.now() - startedAt;
+    results.gamesPerSecond = results.durationMs > 0
+      ? Math.round((results.saved / results.durationMs) * 1000 * 10) / 10
+      : results.saved;
+    
+    console.log(`✅ Bulk saved ${results.saved}/${games.length} games in ${results.batches} batches (${results.gamesPerSecond} games/s)`);
+    return results;
+  }
+
   /**
    * שמירת משחק בודד למסד (עם כל הנתונים הקשורים)
    */
@@ -0,0 +1,542 @@
+/**
+ * IBBA Game Store
+ * מאגר עמודתי למשחקים שהומרו (convertToInternalFormat) - שורות השחקנים במערכים טיפוסיים
+ *
+ * - כל שורת שחקן היא אינדקס; כל סטטיסטיקה היא עמודה (Int16Array, ועמודה שמקבלת ערך לא שלם עוברת ל-Float64Array)
+ * - מזהי שחקן/קבוצה, שמות קבוצות, מספרי חולצה, סטטוס ודקות ("MM:SS") נשמרים פעם אחת בטבלת סמלים,
+ *   והעמודות מחזיקות את האינדקס (Int32Array); שורה מצביעה על המשחק שלה לפי אינדקס המשחק
+ * - store.games - כותרות המשחקים (בלי players ו-originalJson); game.players מחזיר תצוגות (PlayerLineView)
+ *   באותו מבנה של שורה מ-extractPlayers: playerId, teamId, teamName, isHome, jersey, status, stats, calculated
+ *   התצוגות לקריאה בלבד; toObject() מחזיר אובייקט רגיל (למשל לפני spread או שינוי)
+ * - IBBAAnalytics.fromStore(store) - המצטברים מחושבים ישר מהעמודות, בלי לבנות אובייקטים לשורות
+ * - toTransferable() + getTransferList() - העברה ל-Worker בלי העתקת העמודות
+ *   (ה-ArrayBuffers מועברים והמאגר המקורי לא שמיש אחרי ההעברה); בצד השני IBBAGameStore.fromTransferable
+ *
+ * ערכים חסרים נשמרים כ-0 (כמו ב-extractPlayers); אחוזי הקליעה ב-calculated מחושבים מהעמודות בקריאה.
+ *
+ * @module IBBAGameStore
+ * @version 1.0.0
+ */
+(function () {
+  // שדות stats מספריים (minutesPlayed הוא מחרוזת - בטבלת הסמלים)
+  const STAT_FIELDS = [
+    'points', 'fieldGoalsMade', 'fieldGoalsAttempted', 'threePointsMade', 'threePointsAttempted',
+    'freeThrowsMade', 'freeThrowsAttempted', 'offensiveRebounds', 'defensiveRebounds', 'totalRebounds',
+    'assists', 'steals', 'blocks', 'turnovers', 'personalFouls', 'foulsDrawn', 'blocksAgainst',
+    'plusMinus', 'efficiency'
+  ];
+
+  const HEADER_OMIT = new Set(['players', 'originalJson']);
+
+  const INT16_MIN = -32768;
+  const INT16_MAX = 32767;
+
+  /**
+   * אובייקט העמודות במבנה קבוע (literal) - עם מפתחות שנוספים דינמית V8 עובר למצב מילון
+   * וכל גישה לעמודה בלולאת האגרגציה נהיית חיפוש
+   * @param {Function} make - (field, Type) => עמודה
+   */
+  function createColumns(make) {
+    return {
+      gameIndex: make('gameIndex', Int32Array),
+      isHome: make('isHome', Uint8Array),
+      minutesDecimal: make('minutesDecimal', Float64Array),
+      // סמלים
+      playerId: make('playerId', Int32Array),
+      teamId: make('teamId', Int32Array),
+      teamName: make('teamName', Int32Array),
+      jersey: make('jersey', Int32Array),
+      status: make('status', Int32Array),
+      minutesPlayed: make('minutesPlayed', Int32Array),
+      // STAT_FIELDS
+      points: make('points', Int16Array),
+      fieldGoalsMade: make('fieldGoalsMade', Int16Array),
+      fieldGoalsAttempted: make('fieldGoalsAttempted', Int16Array),
+      threePointsMade: make('threePointsMade', Int16Array),
+      threePointsAttempted: make('threePointsAttempted', Int16Array),
+      freeThrowsMade: make('freeThrowsMade', Int16Array),
+      freeThrowsAttempted: make('freeThrowsAttempted', Int16Array),
+      offensiveRebounds: make('offensiveRebounds', Int16Array),
+      defensiveRebounds: make('defensiveRebounds', Int16Array),
+      totalRebounds: make('totalRebounds', Int16Array),
+      assists: make('assists', Int16Array),
+      steals: make('steals', Int16Array),
+      blocks: make('blocks', Int16Array),
+      turnovers: make('turnovers', Int16Array),
+      personalFouls: make('personalFouls', Int16Array),
+      foulsDrawn: make('foulsDrawn', Int16Array),
+      blocksAgainst: make('blocksAgainst', Int16Array),
+      plusMinus: make('plusMinus', Int16Array),
+      efficiency: make('efficiency', Int16Array)
+    };
+  }
+
+  function calculatePercentage(made, attempted) {
+    if (!attempted || attempted === 0) return 0;
+    return Math.round((made / attempted) * 1000) / 10; // כמו IBBAAdapter.calculatePercentage
+  }
+
+  /**
+   * תצוגה של stats של שורה אחת (getters על העמודות)
+   */
+  class StatsView {
+    constructor(store, row) {
+      this.store = store;
+      this.row = row;
+    }
+
+    get minutesPlayed() {
+      return this.store.symbolAt('minutesPlayed', this.row);
+    }
+
+    toObject() {
+      const stats = {};
+      STAT_FIELDS.forEach(field => { stats[field] = this[field]; });
+      stats.minutesPlayed = this.minutesPlayed;
+      return stats;
+    }
+
+    toJSON() {
+      return this.toObject();
+    }
+  }
+
+  STAT_FIELDS.forEach(field => {
+    Object.defineProperty(StatsView.prototype, field, {
+      get() { return this.store.columns[field][this.row]; },
+      enumerable: true
+    });
+  });
+
+  /**
+   * תצוגה של שורת שחקן (flyweight - store + אינדקס שורה)
+   */
+  class PlayerLineView {
+    constructor(store, row) {
+      this.store = store;
+      this.row = row;
+    }
+
+    get isHome() {
+      return this.store.columns.isHome[this.row] === 1;
+    }
+
+    get stats() {
+      return new StatsView(this.store, this.row);
+    }
+
+    get calculated() {
+      const c = this.store.columns;
+      const row = this.row;
+      return {
+        fgPercentage: calculatePercentage(c.fieldGoalsMade[row], c.fieldGoalsAttempted[row]),
+        threePointPercentage: calculatePercentage(c.threePointsMade[row], c.threePointsAttempted[row]),
+        ftPercentage: calculatePercentage(c.freeThrowsMade[row], c.freeThrowsAttempted[row]),
+        minutesDecimal: c.minutesDecimal[row]
+      };
+    }
+
+    get game() {
+      return this.store.games[this.store.columns.gameIndex[this.row]];
+    }
+
+    toObject() {
+      return {
+        playerId: this.playerId,
+        teamId: this.teamId,
+        teamName: this.teamName,
+        isHome: this.isHome,
+        jersey: this.jersey,
+        status: this.status,
+        stats: this.stats.toObject(),
+        calculated: this.calculated
+      };
+    }
+
+    toJSON() {
+      return this.toObject();
+    }
+  }
+
+  ['playerId', 'teamId', 'teamName', 'jersey', 'status'].forEach(field => {
+    Object.defineProperty(PlayerLineView.prototype, field, {
+      get() { return this.store.symbolAt(field, this.row); },
+      enumerable: true
+    });
+  });
+
+  // סכומי שחקן ב-LineAggregation (המקום במערך = האינדקס כאן) ← העמודה שנסכמת
+  const PLAYER_TOTALS = [
+    ['totalPoints', 'points'], ['totalRebounds', 'totalRebounds'], ['totalAssists', 'assists'],
+    ['totalSteals', 'steals'], ['totalBlocks', 'blocks'], ['totalTurnovers', 'turnovers'],
+    ['totalFouls', 'personalFouls'], ['totalFoulsDrawn', 'foulsDrawn'], ['totalFGM', 'fieldGoalsMade'],
+    ['totalFGA', 'fieldGoalsAttempted'], ['total3PM', 'threePointsMade'], ['total3PA', 'threePointsAttempted'],
+    ['totalFTM', 'freeThrowsMade'], ['totalFTA', 'freeThrowsAttempted'], ['totalEfficiency', 'efficiency'],
+    ['totalPlusMinus', 'plusMinus']
+  ];
+  const TOTAL_MINUTES = PLAYER_TOTALS.length;
+  const TOTAL_GAMES = PLAYER_TOTALS.length + 1;
+  const TOTALS_WIDTH = PLAYER_TOTALS.length + 2;
+
+  /**
+   * אגרגציה של שורות השחקנים ישר מהעמודות - אותה תוצאה כמו IBBAAnalytics.accumulatePlayerLines:
+   * סכומי השחקנים נצברים במערך Float64Array לפי סמל השחקן (בלי חיפוש במילון לכל שורה),
+   * ו-finish() יוצר את אובייקטי playerStats לפי סדר ההופעה הראשונה
+   */
+  class LineAggregation {
+    constructor(store, analytics) {
+      this.store = store;
+      this.analytics = analytics;
+      this.totals = new Float64Array(store.symbols.length * TOTALS_WIDTH);
+      this.firstRow = new Int32Array(store.symbols.length).fill(-1);
+      this.order = [];
+    }
+
+    /**
+     * שורות משחק אחד
+     * @returns {Map} teamName → סכומי השחקנים של הקבוצה במשחק (ל-IBBAAnalytics)
+     */
+    accumulateGame(gameIndex) {
+      const store = this.store;
+      const c = store.columns;
+      const totals = this.totals;
+      const playerSumsByTeam = new Map();
+      let lastTeam = -1;
+      let teamSums = null;
+
+      for (let row = store.lineOffsets[gameIndex]; row < store.lineOffsets[gameIndex + 1]; row++) {
+        const team = c.teamName[row];
+        if (team !== lastTeam) {
+          const teamName = store.symbols[team];
+          teamSums = playerSumsByTeam.get(teamName);
+          if (!teamSums) {
+            teamSums = this.analytics.createPlayerSums();
+            playerSumsByTeam.set(teamName, teamSums);
+          }
+          lastTeam = team;
+        }
+        teamSums.efficiency += c.efficiency[row];
+        teamSums.rebounds += c.totalRebounds[row];
+        teamSums.assists += c.assists[row];
+        teamSums.steals += c.steals[row];
+        teamSums.blocks += c.blocks[row];
+        teamSums.turnovers += c.turnovers[row];
+        teamSums.fouls += c.personalFouls[row];
+        teamSums.fgm += c.fieldGoalsMade[row];
+        teamSums.fga += c.fieldGoalsAttempted[row];
+        teamSums.threepm += c.threePointsMade[row];
+        teamSums.threepa += c.threePointsAttempted[row];
+        teamSums.ftm += c.freeThrowsMade[row];
+        teamSums.fta += c.freeThrowsAttempted[row];
+
+        // דלג על שחקנים שלא שיחקו בפועל (0 דקות)
+        const minutes = store.getLineMinutes(row, this.analytics);
+        if (minutes === 0) continue;
+
+        const player = c.playerId[row];
+        if (this.firstRow[player] === -1) {
+          this.firstRow[player] = row;
+          this.order.push(player);
+        }
+        const base = player * TOTALS_WIDTH;
+        totals[base] += c.points[row];
+        totals[base + 1] += c.totalRebounds[row];
+        totals[base + 2] += c.assists[row];
+        totals[base + 3] += c.steals[row];
+        totals[base + 4] += c.blocks[row];
+        totals[base + 5] += c.turnovers[row];
+        totals[base + 6] += c.personalFouls[row];
+        totals[base + 7] += c.foulsDrawn[row];
+        totals[base + 8] += c.fieldGoalsMade[row];
+        totals[base + 9] += c.fieldGoalsAttempted[row];
+        totals[base + 10] += c.threePointsMade[row];
+        totals[base + 11] += c.threePointsAttempted[row];
+        totals[base + 12] += c.freeThrowsMade[row];
+        totals[base + 13] += c.freeThrowsAttempted[row];
+        totals[base + 14] += c.efficiency[row];
+        totals[base + 15] += c.plusMinus[row];
+        totals[base + TOTAL_MINUTES] += minutes;
+        totals[base + TOTAL_GAMES]++;
+      }
+
+      return playerSumsByTeam;
+    }
+
+    /**
+     * אובייקטי הסכומים של השחקנים (אותו מבנה כמו createPlayerTotals)
+     */
+    finish(playerStats) {
+      this.order.forEach(player => {
+        const stats = this.analytics.createPlayerTotals(this.store.getLine(this.firstRow[player]));
+        const base = player * TOTALS_WIDTH;
+        stats.gamesPlayed = this.totals[base + TOTAL_GAMES];
+        PLAYER_TOTALS.forEach(([key], index) => { stats[key] = this.totals[base + index]; });
+        stats.totalMinutes = this.totals[base + TOTAL_MINUTES];
+        playerStats[stats.playerId] = stats;
+      });
+      return playerStats;
+    }
+  }
+
+  class IBBAGameStore {
+    /**
+     * @param {number} capacity - מספר שורות שחקן להקצאה מראש (גדל פי 2 לפי הצורך)
+     */
+    constructor(capacity = 256) {
+      this.games = [];            // כותרות המשחקים (game.players = תצוגות)
+      this.lineOffsets = [0];     // שורות המשחק i: [lineOffsets[i], lineOffsets[i + 1])
+      this.lineCount = 0;
+      this.symbols = [];          // ערכי הסמלים (בסוג המקורי - מחרוזת/מספר)
+      this.symbolIndex = new Map();
+      this.gameIndexById = new Map();
+      this.columns = IBBAGameStore.allocateColumns(Math.max(1, capacity));
+    }
+
+    static allocateColumns(capacity) {
+      return createColumns((field, Type) => new Type(capacity));
+    }
+
+    /**
+     * מאגר ממשחקים בפורמט פנימי (הקצאה אחת בגודל המדויק)
+     */
+    static fromGames(games) {
+      const lines = games.reduce((sum, game) => sum + (game.players ? game.players.length : 0), 0);
+      const store = new IBBAGameStore(lines);
+      games.forEach(game => store.addGame(game));
+      return store;
+    }
+
+    get capacity() {
+      return this.columns.gameIndex.length;
+    }
+
+    intern(value) {
+      let index = this.symbolIndex.get(value);
+      if (index === undefined) {
+        index = this.symbols.length;
+        this.symbols.push(value);
+        this.symbolIndex.set(value, index);
+      }
+      return index;
+    }
+
+    symbolAt(field, row) {
+      return this.symbols[this.columns[field][row]];
+    }
+
+    ensureCapacity(required) {
+      if (required <= this.capacity) return;
+      let capacity = this.capacity;
+      while (capacity < required) capacity *= 2;
+      Object.keys(this.columns).forEach(field => {
+        const grown = new this.columns[field].constructor(capacity);
+        grown.set(this.columns[field]);
+        this.columns[field] = grown;
+      });
+    }
+
+    /**
+     * ערך מספרי לעמודה - עמודת Int16 שמקבלת ערך שלא נכנס בה הופכת ל-Float64Array
+     */
+    setNumber(field, row, value) {
+      const number = Number(value) || 0;
+      let column = this.columns[field];
+      if (column instanceof Int16Array && (!Number.isInteger(number) || number < INT16_MIN || number > INT16_MAX)) {
+        column = Float64Array.from(column);
+        this.columns[field] = column;
+      }
+      column[row] = number;
+    }
+
+    /**
+     * הוספת משחק בפורמט פנימי; מחזיר את כותרת המשחק (עם game.players כתצוגות)
+     */
+    addGame(game) {
+      const gameIndex = this.games.length;
+      const players = game.players || [];
+      this.ensureCapacity(this.lineCount + players.length);
+
+      const c = this.columns;
+      players.forEach(player => {
+        const row = this.lineCount++;
+        const stats = player.stats || {};
+        c.gameIndex[row] = gameIndex;
+        c.isHome[row] = player.isHome ? 1 : 0;
+        c.playerId[row] = this.intern(player.playerId);
+        c.teamId[row] = this.intern(player.teamId);
+        c.teamName[row] = this.intern(player.teamName);
+        c.jersey[row] = this.intern(player.jersey);
+        c.status[row] = this.intern(player.status);
+        c.minutesPlayed[row] = this.intern(stats.minutesPlayed);
+        c.minutesDecimal[row] = player.calculated?.minutesDecimal || 0;
+        STAT_FIELDS.forEach(field => this.setNumber(field, row, stats[field]));
+      });
+      this.lineOffsets.push(this.lineCount);
+
+      const header = this.createHeader(game, gameIndex);
+      this.games.push(header);
+      if (game.gameId !== undefined) this.gameIndexById.set(game.gameId, gameIndex);
+      return header;
+    }
+
+    createHeader(game, gameIndex) {
+      const header = {};
+      Object.keys(game).forEach(key => {
+        if (!HEADER_OMIT.has(key)) header[key] = game[key];
+      });
+      this.attachPlayers(header, gameIndex);
+      return header;
+    }
+
+    attachPlayers(header, gameIndex) {
+      const store = this;
+      Object.defineProperty(header, 'players', {
+        get() { return store.getGameLines(gameIndex); },
+        enumerable: true,
+        configurable: true
+      });
+    }
+
+    /**
+     * שורות השחקנים של משחק (מערך חדש של תצוגות בכל קריאה)
+     */
+    getGameLines(gameIndex) {
+      const lines = [];
+      for (let row = this.lineOffsets[gameIndex]; row < this.lineOffsets[gameIndex + 1]; row++) {
+        lines.push(new PlayerLineView(this, row));
+      }
+      return lines;
+    }
+
+    getLine(row) {
+      return new PlayerLineView(this, row);
+    }
+
+    getGame(gameId) {
+      const index = this.gameIndexById.get(gameId);
+      return index === undefined ? null : this.games[index];
+    }
+
+    /**
+     * המשחקים כאובייקטים רגילים (כמו שיצאו מ-convertToInternalFormat, בלי originalJson)
+     */
+    toGames() {
+      return this.games.map(header => {
+        const game = {};
+        Object.keys(header).forEach(key => {
+          game[key] = key === 'players' ? header.players.map(line => line.toObject()) : header[key];
+        });
+        return game;
+      });
+    }
+
+    // ===============================================
+    // אגרגציה מהעמודות (IBBAAnalytics.fromStore)
+    // ===============================================
+
+    /**
+     * דקות לשורה - כמו IBBAAnalytics.getPlayerMinutes (calculated, ואם 0 - המרה מ-minutesPlayed)
+     */
+    getLineMinutes(row, analytics) {
+      const minutes = this.columns.minutesDecimal[row];
+      if (minutes !== 0) return minutes;
+      const minutesPlayed = this.symbolAt('minutesPlayed', row);
+      if (!minutesPlayed || minutesPlayed === '0:00') return 0;
+      return analytics.getPlayerMinutes({ stats: { minutesPlayed } });
+    }
+
+    /**
+     * מעבר אגרגציה על העמודות (IBBAAnalytics.buildAggregates כש-analytics.store הוא המאגר הזה)
+     */
+    createLineAggregation(analytics) {
+      return new LineAggregation(this, analytics);
+    }
+
+    // ===============================================
+    // זיכרון והעברה ל-Worker
+    // ===============================================
+
+    /**
+     * חיתוך העמודות לגודל המדויק (לפני העברה - כדי לא להעביר קיבולת ריקה)
+     */
+    trim() {
+      if (this.capacity === this.lineCount) return;
+      Object.keys(this.columns).forEach(field => {
+        this.columns[field] = this.columns[field].slice(0, this.lineCount);
+      });
+    }
+
+    /**
+     * הערכת זיכרון: העמודות במדויק, טבלת הסמלים והכותרות לפי JSON (UTF-16 = 2 בתים לתו)
+     */
+    estimateBytes() {
+      const columnBytes = Object.values(this.columns).reduce((sum, column) => sum + column.byteLength, 0);
+      let headerChars = 0;
+      const sampleSize = Math.min(8, this.games.length);
+      for (let i = 0; i < sampleSize; i++) {
+        const { players, ...header } = this.games[Math.floor(i * this.games.length / sampleSize)];
+        headerChars += JSON.stringify(header).length;
+      }
+      const headerBytes = sampleSize > 0 ? headerChars / sampleSize * this.games.length * 2 : 0;
+      const symbolBytes = this.symbols.reduce((sum, symbol) => sum + String(symbol).length * 2 + 16, 0);
+      return Math.round(columnBytes + this.lineOffsets.length * 8 + headerBytes + symbolBytes);
+    }
+
+    /**
+     * המאגר כאובייקט שאפשר להעביר ב-postMessage; העמודות מועברות (לא מועתקות) עם getTransferList
+     */
+    toTransferable() {
+      this.trim();
+      return {
+        version: IBBAGameStore.VERSION,
+        lineCount: this.lineCount,
+        lineOffsets: Int32Array.from(this.lineOffsets),
+        symbols: this.symbols,
+        columns: this.columns,
+        games: this.games.map(header => {
+          const { players, ...rest } = header;
+          return rest;
+        })
+      };
+    }
+
+    getTransferList(transferable) {
+      const data = transferable || this.toTransferable();
+      return [data.lineOffsets.buffer, ...Object.values(data.columns).map(column => column.buffer)];
+    }
+
+    /**
+     * בנייה מחדש מ-toTransferable (בצד ה-Worker) - העמודות נלקחות כמו שהן, בלי העתקה
+     */
+    static fromTransferable(data) {
+      if (!data || data.version !== IBBAGameStore.VERSION) {
+        throw new Error(`Unsupported game store version: ${data && data.version}`);
+      }
+      const store = new IBBAGameStore(1);
+      store.columns = createColumns(field => data.columns[field]);
+      store.lineCount = data.lineCount;
+      store.lineOffsets = Array.from(data.lineOffsets);
+      store.symbols = data.symbols;
+      store.symbols.forEach((symbol, index) => store.symbolIndex.set(symbol, index));
+      data.games.forEach((header, gameIndex) => {
+        store.attachPlayers(header, gameIndex);
+        store.games.push(header);
+        if (header.gameId !== undefined) store.gameIndexById.set(header.gameId, gameIndex);
+      });
+      return store;
+    }
+  }
+
+  IBBAGameStore.VERSION = 1;
+  IBBAGameStore.STAT_FIELDS = STAT_FIELDS;
+  IBBAGameStore.PlayerLineView = PlayerLineView;
+
+  // Export for use
+  if (typeof window !== 'undefined') {
+    window.IBBAGameStore = IBBAGameStore;
+  }
+
+  if (typeof module !== 'undefined' && module.exports) {
+    module.exports = IBBAGameStore;
+  }
+})();
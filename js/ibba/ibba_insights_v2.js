@@ -11,6 +11,7 @@
  * 6. H2H - מפגשים ישירים מתקדמים
  * 7. QUARTERS - ניתוח רבעים
  * 8. LEAGUE - יחסי לליגה
+ * 9. MULTI-SEASON - H2H לאורך עונות, שינוי מהעונה הקודמת (IBBASeasonRegistry)
  * 
  * הערות:
  * - שמות שחקנים: בגלל Pure API, אין גישה ישירה לשמות שחקנים.
@@ -37,6 +38,7 @@ class IBBAInsightsV2 {
   constructor(analytics) {
     this.analytics = analytics;
     this.playerNamesMap = null; // אופציונלי - אם יש מיפוי שמות שחקנים
+    this.matchupContext = null; // הקשר משותף לדוח משחק (ראה createMatchupContext)
   }
 
   /**
@@ -104,6 +106,18 @@ class IBBAInsightsV2 {
   getLeagueAverage(metric, allTeamsData) {
     if (!allTeamsData || allTeamsData.length === 0) return 0;
     
+    const context = this.matchupContext;
+    if (context && context.allTeams === allTeamsData) {
+      if (!(metric in context.leagueAverages)) {
+        context.leagueAverages[metric] = this.computeLeagueAverage(metric, allTeamsData);
+      }
+      return context.leagueAverages[metric];
+    }
+    
+    return this.computeLeagueAverage(metric, allTeamsData);
+  }
+
+  computeLeagueAverage(metric, allTeamsData) {
     const values = allTeamsData.map(team => parseFloat(team[metric]) || 0);
     return values.reduce((sum, val) => sum + val, 0) / values.length;
   }
@@ -117,13 +131,29 @@ class IBBAInsightsV2 {
    * @returns {number} דירוג (1 = הכי טוב)
    */
   getTeamRankInCategory(teamName, metric, allTeamsData, ascending = false) {
-    const sorted = [...allTeamsData].sort((a, b) => {
+    const context = this.matchupContext;
+    if (context && context.allTeams === allTeamsData) {
+      const key = `${metric}:${ascending}`;
+      if (!context.ranks[key]) {
+        const ranks = new Map();
+        this.sortTeamsByMetric(allTeamsData, metric, ascending).forEach((team, index) => {
+          if (!ranks.has(team.teamName)) ranks.set(team.teamName, index);
+        });
+        context.ranks[key] = ranks;
+      }
+      return (context.ranks[key].get(teamName) ?? -1) + 1;
+    }
+    
+    const sorted = this.sortTeamsByMetric(allTeamsData, metric, ascending);
+    return sorted.findIndex(team => team.teamName === teamName) + 1;
+  }
+
+  sortTeamsByMetric(allTeamsData, metric, ascending) {
+    return [...allTeamsData].sort((a, b) => {
       const aVal = parseFloat(a[metric]) || 0;
       const bVal = parseFloat(b[metric]) || 0;
       return ascending ? aVal - bVal : bVal - aVal;
     });
-    
-    return sorted.findIndex(team => team.teamName === teamName) + 1;
   }
 
   /**
@@ -144,9 +174,140 @@ class IBBAInsightsV2 {
    * פונקציית עזר - סינון משחקים של קבוצה
    */
   getTeamGames(games, teamName) {
-    return games.filter(g => 
-      g.teams?.some(t => t.name === teamName)
-    ).sort((a, b) => new Date(b.date) - new Date(a.date));
+    return this.getTeamCached(games, teamName, 'games', () => {
+      // תאריכים מפורסרים פעם אחת (ולא בכל השוואה של ה-sort)
+      return games
+        .filter(g => g.teams?.some(t => t.name === teamName))
+        .map(game => ({ game, time: new Date(game.date).getTime() }))
+        .sort((a, b) => b.time - a.time)
+        .map(entry => entry.game);
+    }).slice();
+  }
+
+  // ========== MATCHUP CONTEXT ==========
+
+  /**
+   * הקשר משותף לדוח משחק - נבנה פעם אחת ב-generateMatchupInsights
+   * כל detector שמקבל את אותו מערך games קורא ממנו במקום לסנן/למיין/לצבור מחדש
+   */
+  createMatchupContext(games, allTeams) {
+    return {
+      games,
+      allTeams,
+      teams: new Map(),      // teamName -> { games, playerLines, playerSeries, quarterLines }
+      leagueAverages: {},    // metric -> ממוצע ליגתי
+      ranks: {}              // `${metric}:${ascending}` -> Map(teamName -> index)
+    };
+  }
+
+  /**
+   * ערך מחושב לקבוצה - מהקשר הדוח אם games הוא מערך הדוח, אחרת חישוב ישיר
+   */
+  getTeamCached(games, teamName, key, build) {
+    const context = this.matchupContext;
+    if (!context || context.games !== games) return build();
+
+    let teamContext = context.teams.get(teamName);
+    if (!teamContext) {
+      teamContext = {};
+      context.teams.set(teamName, teamContext);
+    }
+    if (!(key in teamContext)) {
+      teamContext[key] = build();
+    }
+    return teamContext[key];
+  }
+
+  /**
+   * שורות שחקן של הקבוצה: { game, gameIndex, teamData, oppData, player } לפי סדר games
+   * (לקריאה בלבד - משותף לכל ה-detectors של אותו דוח)
+   */
+  getTeamPlayerLines(games, teamName) {
+    return this.getTeamCached(games, teamName, 'playerLines', () => {
+      const lines = [];
+      games.forEach((game, gameIndex) => {
+        const teamData = this.getTeamFromGame(game, teamName);
+        if (!teamData) return;
+
+        const oppData = this.getOpponentFromGame(game, teamName);
+        game.players?.forEach(player => {
+          if (player.teamName !== teamName) return;
+          lines.push({ game, gameIndex, teamData, oppData, player });
+        });
+      });
+      return lines;
+    });
+  }
+
+  /**
+   * סדרת נקודות/דקות לכל שחקן, ממוינת מהחדש לישן
+   * @returns {Object} playerId -> { playerId, jersey, games: [{ date, points, minutes }] }
+   */
+  getTeamPlayerSeries(games, teamName) {
+    return this.getTeamCached(games, teamName, 'playerSeries', () => {
+      const playerGames = {};
+
+      this.getTeamPlayerLines(games, teamName).forEach(({ game, player }) => {
+        const playerId = player.playerId;
+        if (!playerGames[playerId]) {
+          playerGames[playerId] = {
+            playerId,
+            jersey: player.jersey,
+            games: []
+          };
+        }
+
+        playerGames[playerId].games.push({
+          date: game.date,
+          time: new Date(game.date).getTime(),
+          points: player.stats?.points || 0,
+          minutes: player.stats?.minutes || 0
+        });
+      });
+
+      Object.values(playerGames).forEach(data => data.games.sort((a, b) => b.time - a.time));
+      return playerGames;
+    });
+  }
+
+  /**
+   * שם היום בשבוע של משחק
+   * toLocaleDateString בונה formatter חדש בכל קריאה - formatter אחד משותף זול בהרבה
+   */
+  getGameDayName(game) {
+    const date = new Date(game.date);
+    if (isNaN(date.getTime())) return date.toLocaleDateString('he-IL', { weekday: 'long' });
+
+    if (!IBBAInsightsV2.dayNameFormatter) {
+      IBBAInsightsV2.dayNameFormatter = new Intl.DateTimeFormat('he-IL', { weekday: 'long' });
+    }
+    return IBBAInsightsV2.dayNameFormatter.format(date);
+  }
+
+  /**
+   * נקודות לפי רבעים מנקודת מבט הקבוצה, מקביל ל-getTeamGames (מהחדש לישן)
+   * null למשחק בלי רבעים / בלי שתי הקבוצות - כדי ש-slice(-10) יתנהג כמו על המשחקים
+   * @returns {Array} [{ game, teamData, oppData, team: {q1..q4}, opp: {q1..q4} } | null]
+   */
+  getTeamQuarterLines(games, teamName) {
+    return this.getTeamCached(games, teamName, 'quarterLines', () => {
+      return this.getTeamGames(games, teamName).map(game => {
+        if (!game.quarters) return null;
+
+        const teamData = this.getTeamFromGame(game, teamName);
+        const oppData = this.getOpponentFromGame(game, teamName);
+        if (!teamData || !oppData) return null;
+
+        const team = {};
+        const opp = {};
+        ['q1', 'q2', 'q3', 'q4'].forEach(q => {
+          team[q] = teamData.isHome ? game.quarters[q].home : game.quarters[q].away;
+          opp[q] = teamData.isHome ? game.quarters[q].away : game.quarters[q].home;
+        });
+
+        return { game, teamData, oppData, team, opp };
+      });
+    }).slice();
   }
 
   // ========== CATEGORY 1: STREAKS ==========
@@ -402,39 +563,12 @@ class IBBAInsightsV2 {
     const MIN_MINUTES_INCREASE = 1.25; // אם שחקן שיחק יותר מ-125% מהדקות הרגילות
     
     // אסוף נתוני שחקנים
-    const playerGames = {};
-    
-    games.forEach(game => {
-      const teamData = this.getTeamFromGame(game, teamName);
-      if (!teamData) return;
-      
-      game.players?.forEach(player => {
-        if (player.teamName !== teamName) return;
-        
-        const playerId = player.playerId;
-        if (!playerGames[playerId]) {
-          playerGames[playerId] = {
-            playerId,
-            jersey: player.jersey,
-            games: []
-          };
-        }
-        
-        playerGames[playerId].games.push({
-          date: game.date,
-          points: player.stats?.points || 0,
-          minutes: player.stats?.minutes || 0
-        });
-      });
-    });
+    const playerGames = this.getTeamPlayerSeries(games, teamName);
     
     // חפש שחקן בוער
     for (const [playerId, data] of Object.entries(playerGames)) {
       if (data.games.length < MIN_GAMES) continue;
       
-      // מיון לפי תאריך
-      data.games.sort((a, b) => new Date(b.date) - new Date(a.date));
-      
       // חישוב נקודות
       const seasonAvg = data.games.reduce((sum, g) => sum + g.points, 0) / data.games.length;
       const recentGames = data.games.slice(0, RECENT_WINDOW);
@@ -499,37 +633,11 @@ class IBBAInsightsV2 {
     const THRESHOLD = 0.6; // 60%
     const MIN_MINUTES_DROP = 0.75; // אם שחקן שיחק פחות מ-75% מהדקות הרגילות
     
-    const playerGames = {};
-    
-    games.forEach(game => {
-      const teamData = this.getTeamFromGame(game, teamName);
-      if (!teamData) return;
-      
-      game.players?.forEach(player => {
-        if (player.teamName !== teamName) return;
-        
-        const playerId = player.playerId;
-        if (!playerGames[playerId]) {
-          playerGames[playerId] = {
-            playerId,
-            jersey: player.jersey,
-            games: []
-          };
-        }
-        
-        playerGames[playerId].games.push({
-          date: game.date,
-          points: player.stats?.points || 0,
-          minutes: player.stats?.minutes || 0
-        });
-      });
-    });
+    const playerGames = this.getTeamPlayerSeries(games, teamName);
     
     for (const [playerId, data] of Object.entries(playerGames)) {
       if (data.games.length < MIN_GAMES) continue;
       
-      data.games.sort((a, b) => new Date(b.date) - new Date(a.date));
-      
       // חישוב נקודות
       const seasonAvg = data.games.reduce((sum, g) => sum + g.points, 0) / data.games.length;
       const recentGames = data.games.slice(0, RECENT_WINDOW);
@@ -591,34 +699,26 @@ class IBBAInsightsV2 {
     const playerGames = {};
     const playerH2HGames = {};
     
-    games.forEach(game => {
-      const teamData = this.getTeamFromGame(game, teamName);
-      if (!teamData) return;
-      
-      const oppData = this.getOpponentFromGame(game, teamName);
+    this.getTeamPlayerLines(games, teamName).forEach(({ player, oppData }) => {
       const isH2H = oppData?.name === opponentName;
       
-      game.players?.forEach(player => {
-        if (player.teamName !== teamName) return;
-        
-        const playerId = player.playerId;
-        const points = player.stats?.points || 0;
-        
-        if (!playerGames[playerId]) {
-          playerGames[playerId] = { playerId, jersey: player.jersey, games: [], totalPoints: 0 };
-        }
-        if (!playerH2HGames[playerId]) {
-          playerH2HGames[playerId] = { games: 0, totalPoints: 0 };
-        }
-        
-        playerGames[playerId].games.push(points);
-        playerGames[playerId].totalPoints += points;
-        
-        if (isH2H) {
-          playerH2HGames[playerId].games++;
-          playerH2HGames[playerId].totalPoints += points;
-        }
-      });
+      const playerId = player.playerId;
+      const points = player.stats?.points || 0;
+      
+      if (!playerGames[playerId]) {
+        playerGames[playerId] = { playerId, jersey: player.jersey, games: [], totalPoints: 0 };
+      }
+      if (!playerH2HGames[playerId]) {
+        playerH2HGames[playerId] = { games: 0, totalPoints: 0 };
+      }
+      
+      playerGames[playerId].games.push(points);
+      playerGames[playerId].totalPoints += points;
+      
+      if (isH2H) {
+        playerH2HGames[playerId].games++;
+        playerH2HGames[playerId].totalPoints += points;
+      }
     });
     
     // חפש רוצח
@@ -665,26 +765,19 @@ class IBBAInsightsV2 {
     
     const playerStats = {};
     
-    games.forEach(game => {
-      const teamData = this.getTeamFromGame(game, teamName);
-      if (!teamData) return;
+    this.getTeamPlayerLines(games, teamName).forEach(({ player }) => {
+      const playerId = player.playerId;
+      if (!playerStats[playerId]) {
+        playerStats[playerId] = {
+          playerId,
+          jersey: player.jersey,
+          games: 0,
+          totalAssists: 0
+        };
+      }
       
-      game.players?.forEach(player => {
-        if (player.teamName !== teamName) return;
-        
-        const playerId = player.playerId;
-        if (!playerStats[playerId]) {
-          playerStats[playerId] = {
-            playerId,
-            jersey: player.jersey,
-            games: 0,
-            totalAssists: 0
-          };
-        }
-        
-        playerStats[playerId].games++;
-        playerStats[playerId].totalAssists += player.stats?.assists || 0;
-      });
+      playerStats[playerId].games++;
+      playerStats[playerId].totalAssists += player.stats?.assists || 0;
     });
     
     for (const [playerId, data] of Object.entries(playerStats)) {
@@ -731,26 +824,19 @@ class IBBAInsightsV2 {
     
     const playerStats = {};
     
-    games.forEach(game => {
-      const teamData = this.getTeamFromGame(game, teamName);
-      if (!teamData) return;
+    this.getTeamPlayerLines(games, teamName).forEach(({ player }) => {
+      const playerId = player.playerId;
+      if (!playerStats[playerId]) {
+        playerStats[playerId] = {
+          playerId,
+          jersey: player.jersey,
+          games: 0,
+          totalRebounds: 0
+        };
+      }
       
-      game.players?.forEach(player => {
-        if (player.teamName !== teamName) return;
-        
-        const playerId = player.playerId;
-        if (!playerStats[playerId]) {
-          playerStats[playerId] = {
-            playerId,
-            jersey: player.jersey,
-            games: 0,
-            totalRebounds: 0
-          };
-        }
-        
-        playerStats[playerId].games++;
-        playerStats[playerId].totalRebounds += player.stats?.totalRebounds || 0;
-      });
+      playerStats[playerId].games++;
+      playerStats[playerId].totalRebounds += player.stats?.totalRebounds || 0;
     });
     
     for (const [playerId, data] of Object.entries(playerStats)) {
@@ -796,26 +882,19 @@ class IBBAInsightsV2 {
     
     const playerStats = {};
     
-    games.forEach(game => {
-      const teamInGame = this.getTeamFromGame(game, teamName);
-      if (!teamInGame) return;
+    this.getTeamPlayerLines(games, teamName).forEach(({ player }) => {
+      const playerId = player.playerId;
+      if (!playerStats[playerId]) {
+        playerStats[playerId] = {
+          playerId,
+          jersey: player.jersey,
+          games: 0,
+          totalPoints: 0
+        };
+      }
       
-      game.players?.forEach(player => {
-        if (player.teamName !== teamName) return;
-        
-        const playerId = player.playerId;
-        if (!playerStats[playerId]) {
-          playerStats[playerId] = {
-            playerId,
-            jersey: player.jersey,
-            games: 0,
-            totalPoints: 0
-          };
-        }
-        
-        playerStats[playerId].games++;
-        playerStats[playerId].totalPoints += player.stats?.points || 0;
-      });
+      playerStats[playerId].games++;
+      playerStats[playerId].totalPoints += player.stats?.points || 0;
     });
     
     // מצא את המוביל
@@ -878,36 +957,29 @@ class IBBAInsightsV2 {
     
     const playerStats = {};
     
-    games.forEach(game => {
-      const teamData = this.getTeamFromGame(game, teamName);
-      if (!teamData) return;
+    this.getTeamPlayerLines(games, teamName).forEach(({ player }) => {
+      const playerId = player.playerId;
+      if (!playerStats[playerId]) {
+        playerStats[playerId] = {
+          playerId,
+          jersey: player.jersey,
+          games: 0,
+          doubleDoubles: 0
+        };
+      }
       
-      game.players?.forEach(player => {
-        if (player.teamName !== teamName) return;
-        
-        const playerId = player.playerId;
-        if (!playerStats[playerId]) {
-          playerStats[playerId] = {
-            playerId,
-            jersey: player.jersey,
-            games: 0,
-            doubleDoubles: 0
-          };
-        }
-        
-        const stats = player.stats;
-        const points = stats?.points || 0;
-        const rebounds = stats?.totalRebounds || 0;
-        const assists = stats?.assists || 0;
-        
-        // ספור קטגוריות עם 10+
-        const categories = [points, rebounds, assists].filter(val => val >= 10).length;
-        
-        if (categories >= 2) {
-          playerStats[playerId].doubleDoubles++;
-        }
-        playerStats[playerId].games++;
-      });
+      const stats = player.stats;
+      const points = stats?.points || 0;
+      const rebounds = stats?.totalRebounds || 0;
+      const assists = stats?.assists || 0;
+      
+      // ספור קטגוריות עם 10+
+      const categories = [points, rebounds, assists].filter(val => val >= 10).length;
+      
+      if (categories >= 2) {
+        playerStats[playerId].doubleDoubles++;
+      }
+      playerStats[playerId].games++;
     });
     
     for (const [playerId, data] of Object.entries(playerStats)) {
@@ -1083,27 +1155,20 @@ class IBBAInsightsV2 {
     
     const playerStats = {};
     
-    games.forEach(game => {
-      const team = this.getTeamFromGame(game, teamName);
-      if (!team) return;
+    this.getTeamPlayerLines(games, teamName).forEach(({ player, teamData: team }) => {
+      const pid = player.playerId;
+      if (!playerStats[pid]) {
+        playerStats[pid] = {
+          playerId: pid,
+          jersey: player.jersey,
+          home: { games: 0, points: 0 },
+          away: { games: 0, points: 0 }
+        };
+      }
       
-      game.players?.forEach(player => {
-        if (player.teamName !== teamName) return;
-        
-        const pid = player.playerId;
-        if (!playerStats[pid]) {
-          playerStats[pid] = {
-            playerId: pid,
-            jersey: player.jersey,
-            home: { games: 0, points: 0 },
-            away: { games: 0, points: 0 }
-          };
-        }
-        
-        const location = team.isHome ? 'home' : 'away';
-        playerStats[pid][location].games++;
-        playerStats[pid][location].points += player.stats?.points || 0;
-      });
+      const location = team.isHome ? 'home' : 'away';
+      playerStats[pid][location].games++;
+      playerStats[pid][location].points += player.stats?.points || 0;
     });
     
     let biggestDiff = 0;
@@ -1148,19 +1213,12 @@ class IBBAInsightsV2 {
     
     const playerPoints = {};
     
-    games.forEach((game, idx) => {
-      const team = this.getTeamFromGame(game, teamName);
-      if (!team) return;
-      
-      game.players?.forEach(player => {
-        if (player.teamName !== teamName) return;
-        
-        const pid = player.playerId;
-        if (!playerPoints[pid]) {
-          playerPoints[pid] = { playerId: pid, jersey: player.jersey, points: [] };
-        }
-        playerPoints[pid].points.push({ idx, points: player.stats?.points || 0 });
-      });
+    this.getTeamPlayerLines(games, teamName).forEach(({ player, gameIndex: idx }) => {
+      const pid = player.playerId;
+      if (!playerPoints[pid]) {
+        playerPoints[pid] = { playerId: pid, jersey: player.jersey, points: [] };
+      }
+      playerPoints[pid].points.push({ idx, points: player.stats?.points || 0 });
     });
     
     let biggestRise = 0;
@@ -1921,26 +1979,19 @@ class IBBAInsightsV2 {
       // מצא את השחקן עם הכי הרבה חסימות
       const playerBlocks = {};
       
-      games.forEach(game => {
-        const teamInGame = this.getTeamFromGame(game, teamName);
-        if (!teamInGame) return;
+      this.getTeamPlayerLines(games, teamName).forEach(({ player }) => {
+        const playerId = player.playerId;
+        if (!playerBlocks[playerId]) {
+          playerBlocks[playerId] = {
+            playerId,
+            jersey: player.jersey,
+            games: 0,
+            totalBlocks: 0
+          };
+        }
         
-        game.players?.forEach(player => {
-          if (player.teamName !== teamName) return;
-          
-          const playerId = player.playerId;
-          if (!playerBlocks[playerId]) {
-            playerBlocks[playerId] = {
-              playerId,
-              jersey: player.jersey,
-              games: 0,
-              totalBlocks: 0
-            };
-          }
-          
-          playerBlocks[playerId].games++;
-          playerBlocks[playerId].totalBlocks += player.stats?.blocks || 0;
-        });
+        playerBlocks[playerId].games++;
+        playerBlocks[playerId].totalBlocks += player.stats?.blocks || 0;
       });
       
       // מצא את המוביל
@@ -2224,8 +2275,7 @@ class IBBAInsightsV2 {
     const dayStats = {};
     
     teamGames.forEach(game => {
-      const date = new Date(game.date);
-      const dayName = date.toLocaleDateString('he-IL', { weekday: 'long' });
+      const dayName = this.getGameDayName(game);
       
       if (!dayStats[dayName]) {
         dayStats[dayName] = { games: 0, wins: 0 };
@@ -2491,24 +2541,18 @@ class IBBAInsightsV2 {
     const MIN_GAMES = 5;
     const THRESHOLD = 0.5; // 50%
     
-    const teamGames = this.getTeamGames(games, teamName);
+    const quarterLines = this.getTeamQuarterLines(games, teamName);
     let comebackWins = 0;
     let halftimeDeficits = 0;
     
-    teamGames.forEach(game => {
-      if (!game.quarters) return;
+    quarterLines.forEach(line => {
+      if (!line) return;
       
-      const teamData = this.getTeamFromGame(game, teamName);
-      const oppData = this.getOpponentFromGame(game, teamName);
-      if (!teamData || !oppData) return;
-      
-      const isHome = teamData.isHome;
+      const { teamData, oppData, team, opp } = line;
       
       // חישוב מצב במחצית
-      const teamH1 = (isHome ? game.quarters.q1.home : game.quarters.q1.away) +
-                     (isHome ? game.quarters.q2.home : game.quarters.q2.away);
-      const oppH1 = (isHome ? game.quarters.q1.away : game.quarters.q1.home) +
-                    (isHome ? game.quarters.q2.away : game.quarters.q2.home);
+      const teamH1 = team.q1 + team.q2;
+      const oppH1 = opp.q1 + opp.q2;
       
       // פיגור במחצית
       if (teamH1 < oppH1) {
@@ -2548,17 +2592,13 @@ class IBBAInsightsV2 {
     const MIN_COMEBACKS = 2;
     const DEFICIT_THRESHOLD = 10;
     
-    const teamGames = this.getTeamGames(games, teamName);
+    const quarterLines = this.getTeamQuarterLines(games, teamName);
     let bigComebacks = 0;
     
-    teamGames.forEach(game => {
-      if (!game.quarters) return;
+    quarterLines.forEach(line => {
+      if (!line) return;
       
-      const teamData = this.getTeamFromGame(game, teamName);
-      const oppData = this.getOpponentFromGame(game, teamName);
-      if (!teamData || !oppData) return;
-      
-      const isHome = teamData.isHome;
+      const { teamData, oppData, team, opp } = line;
       
       // מצא את הפיגור המקסימלי (בדוק כל רבע)
       let maxDeficit = 0;
@@ -2566,8 +2606,8 @@ class IBBAInsightsV2 {
       let runningOpp = 0;
       
       ['q1', 'q2', 'q3'].forEach(quarter => {
-        runningTeam += isHome ? game.quarters[quarter].home : game.quarters[quarter].away;
-        runningOpp += isHome ? game.quarters[quarter].away : game.quarters[quarter].home;
+        runningTeam += team[quarter];
+        runningOpp += opp[quarter];
         const deficit = runningOpp - runningTeam;
         if (deficit > maxDeficit) maxDeficit = deficit;
       });
@@ -2608,20 +2648,15 @@ class IBBAInsightsV2 {
     const MIN_GAMES = 5;
     const THRESHOLD = 70; // 70%
     
-    const teamGames = this.getTeamGames(games, teamName).slice(-10);
+    const quarterLines = this.getTeamQuarterLines(games, teamName).slice(-10);
     let q4Losses = 0;
     let gamesWithQ4Data = 0;
     
-    teamGames.forEach(game => {
-      if (!game.quarters) return;
-      
-      const teamData = this.getTeamFromGame(game, teamName);
-      const oppData = this.getOpponentFromGame(game, teamName);
-      if (!teamData || !oppData) return;
+    quarterLines.forEach(line => {
+      if (!line) return;
       
-      const isHome = teamData.isHome;
-      const q4Team = isHome ? game.quarters.q4.home : game.quarters.q4.away;
-      const q4Opp = isHome ? game.quarters.q4.away : game.quarters.q4.home;
+      const q4Team = line.team.q4;
+      const q4Opp = line.opp.q4;
       
       if (q4Team !== undefined && q4Opp !== undefined) {
         gamesWithQ4Data++;
@@ -2664,21 +2699,15 @@ class IBBAInsightsV2 {
     const MIN_GAMES = 5;
     const MIN_DIFF = 2.5; // הפרש ממוצע מינימלי
     
-    const teamGames = this.getTeamGames(games, teamName).slice(-10);
+    const quarterLines = this.getTeamQuarterLines(games, teamName).slice(-10);
     const quarterDiffs = { q1: [], q2: [], q3: [], q4: [] };
     
-    teamGames.forEach(game => {
-      if (!game.quarters) return;
-      
-      const teamData = this.getTeamFromGame(game, teamName);
-      const oppData = this.getOpponentFromGame(game, teamName);
-      if (!teamData || !oppData) return;
-      
-      const isHome = teamData.isHome;
+    quarterLines.forEach(line => {
+      if (!line) return;
       
       ['q1', 'q2', 'q3', 'q4'].forEach(q => {
-        const teamQ = isHome ? game.quarters[q].home : game.quarters[q].away;
-        const oppQ = isHome ? game.quarters[q].away : game.quarters[q].home;
+        const teamQ = line.team[q];
+        const oppQ = line.opp[q];
         
         if (teamQ !== undefined && oppQ !== undefined) {
           quarterDiffs[q].push(teamQ - oppQ);
@@ -2734,22 +2763,16 @@ class IBBAInsightsV2 {
     const MIN_GAMES = 5;
     const THRESHOLD = 70; // 70%
     
-    const teamGames = this.getTeamGames(games, teamName).slice(-10);
+    const quarterLines = this.getTeamQuarterLines(games, teamName).slice(-10);
     const quarterWins = { q1: 0, q2: 0, q3: 0, q4: 0 };
     const quarterGames = { q1: 0, q2: 0, q3: 0, q4: 0 };
     
-    teamGames.forEach(game => {
-      if (!game.quarters) return;
-      
-      const teamData = this.getTeamFromGame(game, teamName);
-      const oppData = this.getOpponentFromGame(game, teamName);
-      if (!teamData || !oppData) return;
-      
-      const isHome = teamData.isHome;
+    quarterLines.forEach(line => {
+      if (!line) return;
       
       ['q1', 'q2', 'q3', 'q4'].forEach(q => {
-        const teamQ = isHome ? game.quarters[q].home : game.quarters[q].away;
-        const oppQ = isHome ? game.quarters[q].away : game.quarters[q].home;
+        const teamQ = line.team[q];
+        const oppQ = line.opp[q];
         
         if (teamQ !== undefined && oppQ !== undefined) {
           quarterGames[q]++;
@@ -2906,12 +2929,116 @@ class IBBAInsightsV2 {
     return null;
   }
 
+  // ========== CATEGORY 9: MULTI-SEASON ==========
+  // קלט מ-IBBASeasonRegistry.getMultiSeasonData: h2h לאורך עונות + ממוצעי הקבוצה בכל עונה
+
+  /**
+   * מאזן מפגשים ישירים לאורך כמה עונות (All-Time H2H)
+   */
+  detectAllTimeH2H(teamA, teamB, h2h) {
+    const MIN_GAMES = 4;
+    const MIN_SEASONS = 2;
+    const DOMINANCE = 0.7; // 70%+ מהמפגשים
+
+    if (!h2h || h2h.totalGames < MIN_GAMES || h2h.seasons < MIN_SEASONS) return null;
+
+    const leader = h2h.teamAWins >= h2h.teamBWins ? teamA : teamB;
+    const other = leader === teamA ? teamB : teamA;
+    const leaderWins = Math.max(h2h.teamAWins, h2h.teamBWins);
+    if (leaderWins / h2h.totalGames < DOMINANCE) return null;
+
+    return {
+      type: 'ALL_TIME_H2H',
+      category: 'H2H',
+      importance: 'high',
+      teamA,
+      teamB,
+      teamName: leader,
+      opponentName: other,
+      record: `${leaderWins}-${h2h.totalGames - leaderWins}`,
+      seasons: h2h.seasons,
+      avgMargin: h2h.avgMargin,
+      icon: '📚',
+      text: `${leader} ניצחה את ${other} ב-${leaderWins} מתוך ${h2h.totalGames} המפגשים ב-${h2h.seasons} העונות האחרונות`,
+      textShort: `${leaderWins}-${h2h.totalGames - leaderWins} במפגשים ב-${h2h.seasons} עונות`
+    };
+  }
+
+  /**
+   * שינוי מהעונה הקודמת (Season over Season): אחוז ניצחונות או הפרש נקודות
+   * @param {Array} seasons - [{ seasonKey, label, stats }] מהישנה לחדשה
+   */
+  detectSeasonOverSeason(teamName, seasons) {
+    const MIN_GAMES = 5;
+    const WIN_PCT_THRESHOLD = 20;  // נקודות אחוז
+    const DIFF_THRESHOLD = 5;      // נקודות הפרש למשחק
+
+    const played = (seasons || []).filter(season => season.stats && season.stats.gamesPlayed >= MIN_GAMES);
+    if (played.length < 2) return null;
+
+    const previous = played[played.length - 2];
+    const current = played[played.length - 1];
+    const winPctChange = parseFloat(current.stats.winPct) - parseFloat(previous.stats.winPct);
+    const diffChange = parseFloat(current.stats.pointDiff) - parseFloat(previous.stats.pointDiff);
+
+    if (Math.abs(winPctChange) < WIN_PCT_THRESHOLD && Math.abs(diffChange) < DIFF_THRESHOLD) return null;
+
+    const improving = Math.abs(winPctChange) >= WIN_PCT_THRESHOLD ? winPctChange > 0 : diffChange > 0;
+    return {
+      type: improving ? 'SEASON_IMPROVEMENT' : 'SEASON_DECLINE',
+      category: 'MOMENTUM',
+      importance: Math.abs(winPctChange) >= WIN_PCT_THRESHOLD ? 'high' : 'medium',
+      teamName,
+      previousSeason: previous.label,
+      previousWinPct: previous.stats.winPct,
+      currentWinPct: current.stats.winPct,
+      previousDiff: previous.stats.pointDiff,
+      currentDiff: current.stats.pointDiff,
+      improving,
+      icon: improving ? '🚀' : '🔻',
+      text: `${teamName} ${improving ? 'השתפרה' : 'נחלשה'} מאז ${previous.label}: ${current.stats.winPct}% ניצחונות (לעומת ${previous.stats.winPct}%), הפרש ${current.stats.pointDiff} למשחק (לעומת ${previous.stats.pointDiff})`,
+      textShort: `${improving ? 'שיפור' : 'ירידה'} מהעונה הקודמת`
+    };
+  }
+
+  /**
+   * Insights שדורשים כמה עונות
+   * @param {Object} multiSeason - { h2h, teamASeasons, teamBSeasons }
+   */
+  generateMultiSeasonInsights(teamA, teamB, multiSeason) {
+    const insights = { H2H: [], MOMENTUM: [] };
+    if (!multiSeason) return insights;
+
+    const allTime = this.detectAllTimeH2H(teamA, teamB, multiSeason.h2h);
+    if (allTime) insights.H2H.push(allTime);
+
+    const seasonA = this.detectSeasonOverSeason(teamA, multiSeason.teamASeasons);
+    if (seasonA) insights.MOMENTUM.push(seasonA);
+
+    const seasonB = this.detectSeasonOverSeason(teamB, multiSeason.teamBSeasons);
+    if (seasonB) insights.MOMENTUM.push(seasonB);
+
+    return insights;
+  }
+
   // ========== MAIN GENERATOR ==========
 
   /**
    * יצירת כל ה-Insights לדוח משחק
+   * ההקשר המשותף (משחקים ממוינים, שורות שחקנים, רבעים, ממוצעי ליגה) נבנה פעם אחת לכל הדוח
    */
   generateMatchupInsights(teamA, teamB, reportData) {
+    const allTeams = this.analytics.getTeamAverages();
+    this.matchupContext = this.createMatchupContext(reportData.games, allTeams);
+
+    try {
+      return this.buildMatchupInsights(teamA, teamB, reportData, allTeams);
+    } finally {
+      this.matchupContext = null;
+    }
+  }
+
+  buildMatchupInsights(teamA, teamB, reportData, allTeams) {
     const insights = {
       STREAKS: [],
       PLAYERS: [],
@@ -2924,7 +3051,6 @@ class IBBAInsightsV2 {
     };
 
     const { games, teamAData, teamBData, h2h, standings } = reportData;
-    const allTeams = this.analytics.getTeamAverages();
     
     // מצא דירוגים
     const rankA = standings?.find(s => s.teamName === teamA)?.rank || null;
@@ -3150,6 +3276,13 @@ class IBBAInsightsV2 {
       if (h2hFlip) insights.H2H.push(h2hFlip);
     }
 
+    // MULTI-SEASON (רק כש-reportData.multiSeason קיים - מ-IBBASeasonRegistry)
+    if (reportData.multiSeason) {
+      const multiSeason = this.generateMultiSeasonInsights(teamA, teamB, reportData.multiSeason);
+      insights.H2H.push(...multiSeason.H2H);
+      insights.MOMENTUM.push(...multiSeason.MOMENTUM);
+    }
+
     // QUARTERS
     // ✅ detectFirstQuarterTeam הוסר - detectQuarterDominance עושה את אותו הדבר (לכל הרבעים)
     
@@ -3339,5 +3472,14 @@ class IBBAInsightsV2 {
 // Export to global scope
 window.IBBAInsightsV2 = IBBAInsightsV2;
 
+// IBBATracer: span לכל detect* ולבניית הקונטקסט
+if (window.IBBATracer) {
+  window.IBBATracer.getShared().instrument(
+    IBBAInsightsV2.prototype,
+    name => name.startsWith('detect') || name === 'generateMatchupInsights' || name === 'createMatchupContext',
+    { category: 'insights' }
+  );
+}
+
 console.log('✅ IBBAInsightsV2 loaded successfully!');
 
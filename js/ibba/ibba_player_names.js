@@ -2,24 +2,61 @@
  * IBBAPlayerNames - Load player names from SportsPress API
  * 
  * Uses the /wp-json/sportspress/v2/players endpoint to fetch all player data
- * including names, jersey numbers, and team IDs. Caches results in sessionStorage.
+ * including names, jersey numbers, and team IDs.
+ * 
+ * - עמודים נטענים במקביל (לפי X-WP-TotalPages כשהכותרת זמינה)
+ * - מטמון מקוצר וממוספר גרסה ב-localStorage: שורה = [id, name, jersey, teamId, plusMinus]
+ * - טעינה חמה: המטמון מוצג מיד, ואחרי cacheExpiry נטענים ברקע רק שחקנים ששונו מאז הסנכרון האחרון (modified_after)
+ * - שחקנים חסרים נטענים לפי id (include=) ולא בסריקת עמודים
  */
 
 class IBBAPlayerNames {
-  constructor(supabaseClient = null) {
+  /**
+   * @param {Object} supabaseClient - Optional Supabase client
+   * @param {Object} options - { storage, pageConcurrency }
+   */
+  constructor(supabaseClient = null, options = {}) {
     this.namesMap = new Map(); // playerId → { name, jersey, teamId }
     this.isLoading = false;
     this.isLoaded = false;
     this.supabase = supabaseClient; // Optional Supabase client
     this.apiUrl = 'https://ibasketball.co.il/wp-json/sportspress/v2/players';
     this.leagueId = '119474'; // Current league
-    this.cacheKey = 'ibba_player_names_api_2025-2_v7'; // v7 = 5min expiry for fast updates
-    this.cacheExpiry = 5 * 60 * 1000; // 5 minutes (fast refresh for admin changes)
+    this.cacheKey = 'ibba_player_names_api_2025-2_v8'; // v8 = compact rows + delta sync
+    this.legacyCacheKeys = ['ibba_player_names_api_2025-2_v7'];
+    this.cacheVersion = 8;
+    this.cacheExpiry = 5 * 60 * 1000; // 5 minutes - after that a delta sync runs in the background
+    this.cacheTtl = 7 * 24 * 60 * 60 * 1000; // 7 days - after that a full reload
+    this.syncOverlapMs = 10 * 60 * 1000; // modified_after חופף 10 דקות (הפרשי שעון מול השרת)
+    this.storage = options.storage || IBBAPlayerNames.getDefaultStorage();
+    
+    // טעינה במקביל
+    this.perPage = 100;
+    this.pageConcurrency = options.pageConcurrency || 4; // עמודים במקביל
+    this.maxPages = 60;                                  // גבול בטיחות (6000 שחקנים)
+    this.idLookupChunkSize = 100;                        // ids לבקשת include= אחת
+    
+    this.lastSync = null;        // זמן תחילת הסנכרון המלא/דלתא האחרון מול ה-API (ms)
+    this.syncPromise = null;     // סנכרון דלתא בתהליך
+    this.refreshPromise = null;  // רענון הרקע אחרי טעינה מהמטמון
+    this.lastLoadTimings = null; // זמני הטעינה האחרונה (לצורך debug)
     
     // Try loading from cache immediately
     this.loadFromCache();
   }
   
+  /**
+   * localStorage (נשמר בין סשנים) - ואם אינו זמין, sessionStorage
+   */
+  static getDefaultStorage() {
+    try {
+      if (typeof localStorage !== 'undefined' && localStorage) return localStorage;
+    } catch (error) {
+      // localStorage חסום (למשל מצב פרטי) - ממשיכים ל-sessionStorage
+    }
+    return typeof sessionStorage !== 'undefined' ? sessionStorage : null;
+  }
+  
   /**
    * Check if we have cached names
    */
@@ -65,45 +102,52 @@ class IBBAPlayerNames {
   }
   
   /**
-   * Load from sessionStorage cache
+   * Load from the persisted cache (compact v8 format)
+   * המטמון מוצג מיד; אם עברו יותר מ-cacheExpiry מאז הסנכרון - סנכרון דלתא ברקע
    */
   loadFromCache() {
     try {
-      const cached = sessionStorage.getItem(this.cacheKey);
+      this.removeLegacyCache();
+      if (!this.storage) return false;
+      
+      const cached = this.storage.getItem(this.cacheKey);
       if (!cached) return false;
       
       const data = JSON.parse(cached);
       
-      // Check expiry
-      if (data.timestamp && Date.now() - data.timestamp > this.cacheExpiry) {
+      // Check format version / league
+      if (data.v !== this.cacheVersion || String(data.leagueId) !== String(this.leagueId) || !Array.isArray(data.players)) {
+        console.log('🔄 Player names cache format changed - ignoring old cache');
+        this.storage.removeItem(this.cacheKey);
+        return false;
+      }
+      
+      // Check expiry: synced caches live for cacheTtl (delta sync keeps them fresh),
+      // caches without a sync point (e.g. from Supabase) still expire after cacheExpiry
+      const age = Date.now() - (data.syncedAt || data.savedAt || 0);
+      if (age > (data.syncedAt ? this.cacheTtl : this.cacheExpiry)) {
         console.log('⏰ Player names cache expired');
-        sessionStorage.removeItem(this.cacheKey);
+        this.storage.removeItem(this.cacheKey);
         return false;
       }
       
       // Load into map
-      if (data.players && Array.isArray(data.players)) {
-        this.namesMap = new Map(data.players);
-        
-        // Validate: cache must have at least 100 players to be valid
-        if (this.namesMap.size < 100) {
-          console.warn(`⚠️ Cache has only ${this.namesMap.size} players (expected 100+) - clearing bad cache`);
-          sessionStorage.removeItem(this.cacheKey);
-          this.namesMap.clear();
-          return false;
-        }
-        
-        console.log(`✅ Loaded ${this.namesMap.size} player names from cache`);
-        
-        // Load Plus/Minus stats from HTML (async, but don't wait for it)
-        this.loadPlayerStatsFromHTML().then(() => {
-          // Save updated cache with Plus/Minus data
-          this.saveToCache();
-        }).catch(err => {
-          console.warn('⚠️ Failed to load Plus/Minus from HTML:', err.message);
-        });
+      this.namesMap = IBBAPlayerNames.decodeCacheRows(data.players);
+      
+      // Validate: cache must have at least 100 players to be valid
+      if (this.namesMap.size < 100) {
+        console.warn(`⚠️ Cache has only ${this.namesMap.size} players (expected 100+) - clearing bad cache`);
+        this.storage.removeItem(this.cacheKey);
+        this.namesMap.clear();
+        return false;
       }
       
+      this.lastSync = data.syncedAt || null;
+      console.log(`✅ Loaded ${this.namesMap.size} player names from cache`);
+      
+      // Delta sync + Plus/Minus stats from HTML (async, but don't wait for it)
+      this.refreshPromise = this.refreshCachedNames();
+      
       this.isLoaded = true;
       return true;
       
@@ -114,7 +158,36 @@ class IBBAPlayerNames {
   }
   
   /**
-   * Save to sessionStorage cache
+   * רענון ברקע אחרי טעינה מהמטמון: שחקנים ששונו (אם המטמון ישן) ואז Plus/Minus
+   * @private
+   */
+  async refreshCachedNames() {
+    if (this.isCacheStale()) {
+      try {
+        await this.syncChangedPlayers();
+      } catch (error) {
+        console.warn('⚠️ Player names delta sync failed:', error.message);
+      }
+    }
+    
+    try {
+      await this.loadPlayerStatsFromHTML();
+      // Save updated cache with Plus/Minus data
+      this.saveToCache();
+    } catch (err) {
+      console.warn('⚠️ Failed to load Plus/Minus from HTML:', err.message);
+    }
+  }
+  
+  /**
+   * האם עבר cacheExpiry מאז הסנכרון האחרון מול ה-API
+   */
+  isCacheStale() {
+    return !!this.lastSync && Date.now() - this.lastSync > this.cacheExpiry;
+  }
+  
+  /**
+   * Save to the persisted cache (compact v8 format)
    */
   saveToCache() {
     try {
@@ -123,13 +196,17 @@ class IBBAPlayerNames {
         console.warn(`⚠️ Not saving cache: only ${this.namesMap.size} players (expected 100+)`);
         return;
       }
+      if (!this.storage) return;
       
       const data = {
-        players: Array.from(this.namesMap.entries()),
-        timestamp: Date.now()
+        v: this.cacheVersion,
+        leagueId: this.leagueId,
+        savedAt: Date.now(),
+        syncedAt: this.lastSync,
+        players: IBBAPlayerNames.encodeCacheRows(this.namesMap)
       };
       
-      sessionStorage.setItem(this.cacheKey, JSON.stringify(data));
+      this.storage.setItem(this.cacheKey, JSON.stringify(data));
       console.log(`💾 Cached ${this.namesMap.size} player names`);
       
     } catch (error) {
@@ -138,15 +215,136 @@ class IBBAPlayerNames {
   }
   
   /**
-   * Fetch single page of players (with CORS proxy fallback)
+   * namesMap → שורות [id, name, jersey, teamId, totalPlusMinus?]
+   * (id מספרי נשמר כמספר, plusMinus רק אם נטען)
+   */
+  static encodeCacheRows(namesMap) {
+    const rows = [];
+    namesMap.forEach((player, id) => {
+      const row = [
+        /^\d+$/.test(id) ? Number(id) : id,
+        player.name,
+        player.jersey ?? '',
+        player.teamId ?? null
+      ];
+      if (player.totalPlusMinus !== undefined) row.push(player.totalPlusMinus);
+      rows.push(row);
+    });
+    return rows;
+  }
+  
+  static decodeCacheRows(rows) {
+    const namesMap = new Map();
+    rows.forEach(row => {
+      if (!Array.isArray(row) || !row[1]) return;
+      const player = { name: row[1], jersey: row[2], teamId: row[3] };
+      if (row.length > 4) player.totalPlusMinus = row[4];
+      namesMap.set(String(row[0]), player);
+    });
+    return namesMap;
+  }
+  
+  /**
+   * מוחק מטמונים בפורמט הישן (sessionStorage, אובייקט לכל שחקן)
    * @private
    */
-  async fetchPlayersPage(page = 1, perPage = 100, useLeagueFilter = true) {
-    // Build URL - with or without league filter
+  removeLegacyCache() {
+    [typeof sessionStorage !== 'undefined' ? sessionStorage : null, this.storage].forEach(storage => {
+      if (!storage) return;
+      this.legacyCacheKeys.forEach(key => storage.removeItem(key));
+    });
+  }
+  
+  /**
+   * SportsPress player → { name, jersey, teamId } (null אם אין שם)
+   * @private
+   */
+  static toPlayerEntry(player) {
+    const name = player?.title?.rendered || '';
+    if (!player?.id || !name) return null;
+    return {
+      name: name,
+      jersey: player.number || '',
+      teamId: player.current_teams?.[0] || null
+    };
+  }
+  
+  /**
+   * מוסיף/מעדכן שחקנים מה-API ב-namesMap (Plus/Minus קיים נשמר)
+   * @returns {number} מספר השחקנים שנוספו/עודכנו
+   * @private
+   */
+  applyPlayers(players) {
+    let count = 0;
+    players.forEach(player => {
+      const entry = IBBAPlayerNames.toPlayerEntry(player);
+      if (!entry) return;
+      const playerId = String(player.id);
+      const existing = this.namesMap.get(playerId);
+      if (existing && existing.totalPlusMinus !== undefined) {
+        entry.totalPlusMinus = existing.totalPlusMinus;
+      }
+      this.namesMap.set(playerId, entry);
+      count++;
+    });
+    return count;
+  }
+  
+  /**
+   * Shared CORS proxy client (see ibba_proxy_client.js)
+   * @private
+   */
+  getProxyClient() {
+    return this.proxyClient || window.IBBAProxyClient.getShared();
+  }
+  
+  /**
+   * Shared HTML table extractor (see ibba_table_extractor.js)
+   * @private
+   */
+  getTableExtractor() {
+    return this.tableExtractor || window.IBBATableExtractor.getShared();
+  }
+  
+  /**
+   * Build players endpoint URL
+   * @param {Object} query - { useLeagueFilter, modifiedAfter (ISO), include (ids) }
+   * @private
+   */
+  buildPlayersUrl(page, perPage, query = {}) {
+    const { useLeagueFilter = true, modifiedAfter = null, include = null } = query;
     let url = `${this.apiUrl}?per_page=${perPage}&page=${page}`;
     if (useLeagueFilter && this.leagueId) {
       url += `&leagues=${this.leagueId}`;
     }
+    if (modifiedAfter) {
+      url += `&modified_after=${encodeURIComponent(modifiedAfter)}`;
+    }
+    if (include && include.length > 0) {
+      url += `&include=${include.join(',')}`;
+    }
+    return url;
+  }
+
+  /**
+   * Fetch single page of players (with CORS proxy fallback)
+   * @private
+   */
+  async fetchPlayersPage(page = 1, perPage = 100, useLeagueFilter = true) {
+    const { players } = await this.fetchPlayersPageWithMeta(page, perPage, { useLeagueFilter });
+    return players;
+  }
+  
+  /**
+   * Fetch single page of players + paging headers
+   * totalPages מגיע מ-X-WP-TotalPages רק בבקשה ישירה (ה-proxies לא מעבירים כותרות) - אחרת null
+   * @param {Object} query - ראה buildPlayersUrl
+   * @returns {Promise<{players: Array, totalPages: number|null, total: number|null}>}
+   * @private
+   */
+  async fetchPlayersPageWithMeta(page = 1, perPage = 100, query = {}) {
+    const url = this.buildPlayersUrl(page, perPage, query);
+    const { useLeagueFilter = true } = query;
     
     console.log(`📥 Fetching players page ${page}${useLeagueFilter ? ` (league ${this.leagueId})` : ' (all leagues)'}...`);
     
@@ -156,7 +354,12 @@ class IBBAPlayerNames {
       
       if (response.ok) {
         console.log(`✅ Direct fetch succeeded for page ${page}`);
-        return await response.json();
+        const data = await response.json();
+        return {
+          players: Array.isArray(data) ? data : [],
+          totalPages: IBBAPlayerNames.readCountHeader(response, 'X-WP-TotalPages'),
+          total: IBBAPlayerNames.readCountHeader(response, 'X-WP-Total')
+        };
       }
       
       // If we get 400/404 from direct fetch, no need to try proxies
@@ -171,39 +374,169 @@ class IBBAPlayerNames {
       console.log(`⚠️ Direct fetch failed, trying CORS proxy...`);
     }
     
-    // Fallback to CORS proxy
-    const proxies = [
-      'https://corsproxy.io/?',
-      'https://api.allorigins.win/raw?url=',
-      'https://cors-anywhere.herokuapp.com/'
-    ];
+    // Fallback to CORS proxy (shared client - fastest healthy proxy first)
+    try {
+      const data = await this.getProxyClient().fetch(url, {
+        proxies: ['corsproxy', 'allorigins-raw', 'cors-anywhere'],
+        as: 'json',
+        timeoutMs: 15000
+      });
+      console.log(`✅ Proxy succeeded for page ${page}`);
+      return { players: Array.isArray(data) ? data : [], totalPages: null, total: null };
+    } catch (error) {
+      console.warn('⚠️ Proxy fallback failed:', error.message);
+      throw new Error(`All proxies failed for page ${page}`);
+    }
+  }
+  
+  static readCountHeader(response, name) {
+    const value = response.headers && typeof response.headers.get === 'function'
+      ? parseInt(response.headers.get(name), 10)
+      : NaN;
+    return Number.isFinite(value) && value >= 0 ? value : null;
+  }
+  
+  /**
+   * מריץ task(index) על 0..count-1 עם עד concurrency משימות במקביל
+   * @private
+   */
+  async runConcurrently(count, concurrency, task) {
+    let nextIndex = 0;
+    const worker = async () => {
+      while (nextIndex < count) {
+        await task(nextIndex++);
+      }
+    };
+    const workers = [];
+    for (let i = 0; i < Math.min(concurrency, count); i++) {
+      workers.push(worker());
+    }
+    await Promise.all(workers);
+  }
+  
+  /**
+   * Fetch all pages of a query, several pages at a time
+   * - עם X-WP-TotalPages: כל העמודים 2..N במקביל
+   * - בלי (proxy): גלים של pageConcurrency עמודים עד עמוד קצר/ריק או 400/404
+   * @param {Object} query - ראה buildPlayersUrl, + concurrency
+   * @param {Function} onPage - ({ page, loaded, totalPages }) אחרי כל עמוד
+   * @returns {Promise<{players: Array, pages: number, totalPages: number|null, failedPages: number[], durationMs: number}>}
+   * @private
+   */
+  async fetchAllPages(query = {}, onPage = null) {
+    const perPage = this.perPage;
+    const concurrency = Math.max(1, query.concurrency || this.pageConcurrency);
+    const startedAt = Date.now();
+    const pages = [];
+    const failedPages = [];
+    let loaded = 0;
     
-    for (let i = 0; i < proxies.length; i++) {
-      try {
-        const proxyUrl = proxies[i] + encodeURIComponent(url);
-        console.log(`🔄 Trying proxy ${i + 1}/${proxies.length}...`);
-        
-        const controller = new AbortController();
-        const timeoutId = setTimeout(() => controller.abort(), 15000); // 15s timeout
-        
-        const response = await fetch(proxyUrl, { signal: controller.signal });
-        clearTimeout(timeoutId);
-        
-        if (!response.ok) {
-          throw new Error(`HTTP ${response.status}`);
-        }
-        
-        console.log(`✅ Proxy ${i + 1} succeeded for page ${page}`);
-        return await response.json();
-        
-      } catch (error) {
-        const errorMsg = error.name === 'AbortError' ? 'timeout (15s)' : error.message;
-        console.warn(`⚠️ Proxy ${i + 1} failed:`, errorMsg);
-        
-        if (i === proxies.length - 1) {
-          throw new Error(`All proxies failed for page ${page}`);
+    // If we get 400/404 (or no proxy works without a known page count), we've reached the end
+    const isEndOfPages = (error, totalPages) =>
+      error.message.includes('400') || error.message.includes('404') ||
+      (!totalPages && error.message.includes('All proxies failed'));
+    
+    let first;
+    try {
+      first = await this.fetchPlayersPageWithMeta(1, perPage, query);
+    } catch (error) {
+      if (!isEndOfPages(error, null)) throw error;
+      console.log('ℹ️ Reached end of players at page 1 (0 total)');
+      first = { players: [], totalPages: null };
+    }
+    
+    pages[0] = first.players;
+    loaded += first.players.length;
+    if (onPage) onPage({ page: 1, loaded, totalPages: first.totalPages });
+    
+    // בלי X-WP-TotalPages - עד maxPages, הסוף מתגלה לפי עמוד קצר/ריק
+    let lastPage = first.players.length < perPage
+      ? 1
+      : Math.min(first.totalPages || this.maxPages, this.maxPages);
+    let nextPage = 2;
+    
+    const worker = async () => {
+      while (nextPage <= lastPage) {
+        const page = nextPage++;
+        try {
+          const { players } = await this.fetchPlayersPageWithMeta(page, perPage, query);
+          pages[page - 1] = players;
+          loaded += players.length;
+          if (players.length < perPage) {
+            lastPage = Math.min(lastPage, page);
+          }
+          if (onPage) onPage({ page, loaded, totalPages: first.totalPages });
+        } catch (error) {
+          if (isEndOfPages(error, first.totalPages)) {
+            lastPage = Math.min(lastPage, page - 1);
+          } else {
+            console.warn(`⚠️ Failed to fetch players page ${page}:`, error.message);
+            failedPages.push(page);
+          }
         }
       }
+    };
+    
+    const workers = [];
+    for (let i = 0; i < Math.min(concurrency, lastPage - 1); i++) {
+      workers.push(worker());
+    }
+    await Promise.all(workers);
+    
+    if (lastPage === this.maxPages && pages[lastPage - 1]?.length === perPage) {
+      console.warn(`⚠️ Reached safety limit (${this.maxPages} pages / ${this.maxPages * perPage} players)`);
+    }
+    
+    // Merge in page order (pages past the end that were fetched speculatively are dropped)
+    const players = [];
+    for (let i = 0; i < Math.min(lastPage, pages.length); i++) {
+      if (pages[i]) players.push(...pages[i]);
+    }
+    
+    const result = {
+      players,
+      pages: Math.min(lastPage, pages.length),
+      totalPages: first.totalPages,
+      failedPages: failedPages.filter(page => page <= lastPage).sort((a, b) => a - b),
+      durationMs: Date.now() - startedAt
+    };
+    this.lastLoadTimings = { ...result, players: players.length, concurrency };
+    return result;
+  }
+  
+  /**
+   * Fetch only players changed since the last sync (modified_after) and merge them in
+   * @returns {Promise<number>} Number of players added/updated
+   */
+  async syncChangedPlayers() {
+    if (!this.lastSync) {
+      console.log('ℹ️ No sync point - delta sync skipped');
+      return 0;
+    }
+    if (this.syncPromise) return this.syncPromise;
+    
+    this.syncPromise = (async () => {
+      const startedAt = Date.now();
+      const since = new Date(this.lastSync - this.syncOverlapMs).toISOString();
+      console.log(`🔄 Syncing players changed since ${since}...`);
+      
+      const { players, failedPages } = await this.fetchAllPages({ modifiedAfter: since });
+      const changed = this.applyPlayers(players);
+      
+      // Pages that failed would be lost - keep the old sync point so the next sync retries them
+      if (failedPages.length === 0) {
+        this.lastSync = startedAt;
+      }
+      this.saveToCache();
+      
+      console.log(`✅ Delta sync: ${changed} players changed (${this.namesMap.size} total)`);
+      return changed;
+    })();
+    
+    try {
+      return await this.syncPromise;
+    } finally {
+      this.syncPromise = null;
     }
   }
   
@@ -217,87 +550,37 @@ class IBBAPlayerNames {
       console.log('🔄 Loading player Plus/Minus stats from league HTML via CORS proxy...');
       
       const leaguePageUrl = 'https://ibasketball.co.il/league/2025-2/';
-      let html = null;
       
       // Use CORS proxies (direct fetch will fail due to CORS policy)
-      // Ordered by reliability - corsproxy.io is most reliable
-      const proxies = [
-        { 
-          url: 'https://corsproxy.io/?',  // Most reliable - try first
-          parseResponse: (response) => response.text(),
-          timeout: 8000
-        },
-        { 
-          url: 'https://api.allorigins.win/get?url=',  // /get works better than /raw
-          parseResponse: async (response) => {
-            const data = await response.json();
-            return data.contents;
-          },
-          timeout: 8000
-        },
-        { 
-          url: 'https://api.allorigins.win/raw?url=',  // Fallback
-          parseResponse: (response) => response.text(),
-          timeout: 5000  // Shorter timeout for known-problematic proxy
-        }
-      ];
-      
-      for (let i = 0; i < proxies.length; i++) {
-        try {
-          const proxy = proxies[i];
-          const proxyUrl = proxy.url + encodeURIComponent(leaguePageUrl);
-          console.log(`🔄 Trying proxy ${i + 1}/${proxies.length}...`);
-          
-          // Report progress to UI
-          if (onProgress) {
-            onProgress({ stage: 'proxy', proxy: i + 1, total: proxies.length });
-          }
-          
-          // Use AbortController with timeout
-          const controller = new AbortController();
-          const timeoutId = setTimeout(() => controller.abort(), proxy.timeout || 8000);
-          
-          const response = await fetch(proxyUrl, { signal: controller.signal });
-          clearTimeout(timeoutId);
-          
-          if (!response.ok) {
-            throw new Error(`HTTP ${response.status}`);
-          }
-          
-          html = await proxy.parseResponse(response);
-          
-          if (html && html.length > 1000) {
-            console.log(`✅ Proxy ${i + 1} succeeded for league HTML`);
-            break;
-          } else {
-            throw new Error('Response too short');
-          }
-          
-        } catch (error) {
-          const errorMsg = error.name === 'AbortError' ? `timeout (${proxies[i].timeout}ms)` : error.message;
-          console.warn(`⚠️ Proxy ${i + 1} failed:`, errorMsg);
-          if (i === proxies.length - 1) {
-            throw new Error('All proxies failed for league HTML');
+      // Listed by reliability - the shared client reorders them by measured latency/success
+      let html;
+      try {
+        html = await this.getProxyClient().fetch(leaguePageUrl, {
+          proxies: [
+            { id: 'corsproxy', timeoutMs: 8000 },
+            { id: 'allorigins-get', timeoutMs: 8000 },   // /get works better than /raw
+            { id: 'allorigins-raw', timeoutMs: 5000 }    // Shorter timeout for known-problematic proxy
+          ],
+          as: 'text',
+          validate: body => !!body && body.length > 1000,
+          onAttempt: ({ attempt, total }) => {
+            // Report progress to UI
+            if (onProgress) {
+              onProgress({ stage: 'proxy', proxy: attempt, total });
+            }
           }
-        }
-      }
-      
-      if (!html) {
-        throw new Error('Failed to fetch league HTML');
+        });
+      } catch (error) {
+        console.warn('⚠️ Proxy fallback failed:', error.message);
+        throw new Error('All proxies failed for league HTML');
       }
+      console.log('✅ Proxy succeeded for league HTML');
       
-      // Parse HTML to extract Plus/Minus data
-      const parser = new DOMParser();
-      const doc = parser.parseFromString(html, 'text/html');
-      
-      // Find player rows with data-pm attribute
-      const playerRows = doc.querySelectorAll('tr[data-pm]');
+      // Extract Plus/Minus data: only the tables with tr[data-pm] rows are parsed (in a worker when available)
+      const playerRows = await this.getTableExtractor().extract(html, 'plusMinus');
       let statsCount = 0;
       
-      playerRows.forEach(row => {
-        const playerId = row.getAttribute('data-id') || row.getAttribute('data-player');
-        const plusMinus = row.getAttribute('data-pm');
-        
+      playerRows.forEach(({ id: playerId, pm: plusMinus }) => {
         if (playerId && plusMinus !== null && plusMinus !== '') {
           const id = String(playerId);
           const existingData = this.namesMap.get(id);
@@ -321,7 +604,7 @@ class IBBAPlayerNames {
   }
   
   /**
-   * Load all player names from API with pagination
+   * Load all player names from API (pages fetched concurrently)
    * @param {Function} onProgress - Optional callback for progress updates
    * @returns {Promise<Map>} Map of playerId → player data
    */
@@ -342,62 +625,33 @@ class IBBAPlayerNames {
       console.log('🔄 Loading player names from SportsPress API...');
       if (onProgress) onProgress({ stage: 'fetching', percent: 10, message: 'Fetching players...' });
       
-      const allPlayers = [];
-      let page = 1;
-      let hasMore = true;
+      const startedAt = Date.now();
       
       // Fetch all pages
-      while (hasMore) {
-        try {
-          const players = await this.fetchPlayersPage(page, 100);
-          
-          if (players.length === 0) {
-            hasMore = false;
-          } else {
-            allPlayers.push(...players);
-            page++;
-            console.log(`📥 Loaded ${allPlayers.length} players so far...`);
-            
-            // Update progress
-            const percent = 10 + (Math.min(page * 10, 60));
-            if (onProgress) {
-              onProgress({ 
-                stage: 'fetching', 
-                percent, 
-                message: `Fetched ${allPlayers.length} players...` 
-              });
-            }
-          }
-        } catch (error) {
-          // If we get 400/404, we've reached the end
-          if (error.message.includes('400') || error.message.includes('404') || error.message.includes('All proxies failed')) {
-            console.log(`ℹ️ Reached end of players at page ${page} (${allPlayers.length} total)`);
-            hasMore = false;
-          } else {
-            // For other errors, rethrow
-            throw error;
-          }
+      const { players: allPlayers, pages, failedPages } = await this.fetchAllPages({ useLeagueFilter: true }, ({ page, loaded, totalPages }) => {
+        console.log(`📥 Loaded ${loaded} players so far...`);
+        
+        // Update progress
+        const percent = totalPages
+          ? 10 + Math.round((Math.min(page, totalPages) / totalPages) * 60)
+          : 10 + Math.min(page * 10, 60);
+        if (onProgress) {
+          onProgress({ 
+            stage: 'fetching', 
+            percent, 
+            message: `Fetched ${loaded} players...` 
+          });
         }
-      }
+      });
       
-      console.log(`✅ Fetched ${allPlayers.length} players from API`);
+      console.log(`✅ Fetched ${allPlayers.length} players from API (${pages} pages, ${this.pageConcurrency} in parallel)`);
       if (onProgress) onProgress({ stage: 'processing', percent: 70, message: 'Processing data...' });
       
       // Build the mapping
-      allPlayers.forEach(player => {
-        const playerId = String(player.id);
-        const name = player.title?.rendered || '';
-        const jersey = player.number || '';
-        const teamId = player.current_teams?.[0] || null;
-        
-        if (playerId && name) {
-          this.namesMap.set(playerId, {
-            name: name,
-            jersey: jersey,
-            teamId: teamId
-          });
-        }
-      });
+      this.applyPlayers(allPlayers);
+      
+      // Sync point for the next warm start (only when no page is missing)
+      this.lastSync = failedPages.length === 0 ? startedAt : null;
       
       console.log(`✅ Built mapping for ${this.namesMap.size} players`);
       
@@ -432,7 +686,7 @@ class IBBAPlayerNames {
   }
   
   /**
-   * Load missing players by scanning ALL players (without league filter)
+   * Load missing players by id (include=, without league filter)
    * @param {Array<string>} missingIds - Array of player IDs to find
    * @returns {Promise<number>} Number of players successfully loaded
    */
@@ -442,65 +696,40 @@ class IBBAPlayerNames {
       return 0;
     }
     
-    console.log(`🔄 Searching for ${missingIds.length} missing players in ALL players (no league filter)...`);
+    console.log(`🔄 Looking up ${missingIds.length} missing players by id (no league filter)...`);
     console.log(`   Missing IDs: ${missingIds.join(', ')}`);
     
-    const missingSet = new Set(missingIds.map(id => String(id)));
+    const missingSet = new Set(missingIds.map(id => String(id)).filter(id => /^\d+$/.test(id)));
+    const ids = Array.from(missingSet);
+    const chunkSize = this.idLookupChunkSize;
+    const chunks = [];
+    for (let i = 0; i < ids.length; i += chunkSize) {
+      chunks.push(ids.slice(i, i + chunkSize));
+    }
     let successCount = 0;
-    let page = 1;
-    let hasMore = true;
-    let totalScanned = 0;
     
-    // Scan players without league filter until we find all missing ones
-    while (hasMore && missingSet.size > 0) {
+    await this.runConcurrently(chunks.length, this.pageConcurrency, async index => {
+      const include = chunks[index];
       try {
-        console.log(`📥 Scanning page ${page} (found ${successCount}/${missingIds.length} so far)...`);
-        
-        const players = await this.fetchPlayersPage(page, 100, false); // false = no league filter
+        const { players } = await this.fetchPlayersPageWithMeta(1, include.length, { useLeagueFilter: false, include });
         
-        if (players.length === 0) {
-          hasMore = false;
-          console.log(`ℹ️ Reached end of players at page ${page}`);
-        } else {
-          totalScanned += players.length;
-          
-          // Check each player
-          players.forEach(player => {
-            const playerId = String(player.id);
-            
-            if (missingSet.has(playerId)) {
-              const name = player.title?.rendered || '';
-              const jersey = player.number || '';
-              const teamId = player.current_teams?.[0] || null;
-              
-              if (name) {
-                this.namesMap.set(playerId, { name, jersey, teamId });
-                console.log(`✅ Found missing player: ${name} (#${jersey}) - ID: ${playerId}`);
-                missingSet.delete(playerId);
-                successCount++;
-              }
-            }
-          });
+        players.forEach(player => {
+          const playerId = String(player.id);
+          const entry = IBBAPlayerNames.toPlayerEntry(player);
           
-          page++;
-          
-          // Safety limit: don't scan more than 30 pages (3000 players)
-          if (page > 30) {
-            console.warn(`⚠️ Reached safety limit (30 pages / 3000 players)`);
-            hasMore = false;
+          if (entry && missingSet.has(playerId)) {
+            this.namesMap.set(playerId, entry);
+            console.log(`✅ Found missing player: ${entry.name} (#${entry.jersey}) - ID: ${playerId}`);
+            missingSet.delete(playerId);
+            successCount++;
           }
-        }
+        });
       } catch (error) {
-        console.error(`❌ Error scanning page ${page}:`, error.message);
-        
-        // If we get errors, try to continue
-        if (error.message.includes('400') || error.message.includes('404')) {
-          hasMore = false;
-        }
+        console.error(`❌ Error looking up ${include.length} players:`, error.message);
       }
-    }
+    });
     
-    console.log(`📊 Scan complete: scanned ${totalScanned} players across ${page - 1} pages`);
+    console.log(`📊 Lookup complete: ${ids.length} ids in ${chunks.length} requests`);
     
     if (successCount > 0) {
       // Save updated cache
@@ -571,8 +800,9 @@ class IBBAPlayerNames {
    * Clear cache
    */
   clearCache() {
-    sessionStorage.removeItem(this.cacheKey);
+    if (this.storage) this.storage.removeItem(this.cacheKey);
     this.namesMap.clear();
+    this.lastSync = null;
     this.isLoaded = false;
     console.log('🗑️ Player names cache cleared');
   }
@@ -585,7 +815,9 @@ class IBBAPlayerNames {
       totalPlayers: this.namesMap.size,
       isLoaded: this.isLoaded,
       isLoading: this.isLoading,
-      hasCachedData: this.hasCachedNames()
+      hasCachedData: this.hasCachedNames(),
+      lastSync: this.lastSync,
+      lastLoad: this.lastLoadTimings
     };
   }
 }
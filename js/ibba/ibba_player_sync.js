@@ -89,29 +89,25 @@ class IBBAPlayerSync {
     }
   }
 
+  /**
+   * לקוח ה-proxy המשותף (סדר לפי ביצועים + circuit breaker)
+   */
+  getProxyClient() {
+    return this.proxyClient || window.IBBAProxyClient.getShared();
+  }
+
   /**
    * קריאה דרך CORS proxy
    */
   async fetchViaProxy(targetUrl) {
-    const proxies = [
-      `https://api.allorigins.win/raw?url=${encodeURIComponent(targetUrl)}`,
-      `https://corsproxy.io/?${encodeURIComponent(targetUrl)}`
-    ];
-    
-    for (let i = 0; i < proxies.length; i++) {
-      try {
-        console.log(`🔄 Trying proxy ${i + 1}/${proxies.length}...`);
-        const response = await fetch(proxies[i]);
-        if (!response.ok) throw new Error(`Proxy ${i + 1} failed: ${response.status}`);
-        const html = await response.text();
-        console.log(`✅ Successfully fetched via proxy ${i + 1}`);
-        return html;
-      } catch (error) {
-        console.warn(`⚠️ Proxy ${i + 1} failed:`, error.message);
-        if (i === proxies.length - 1) {
-          throw new Error('All proxies failed. Cannot fetch league page.');
-        }
-      }
+    try {
+      return await this.getProxyClient().fetch(targetUrl, {
+        proxies: ['allorigins-raw', 'corsproxy'],
+        as: 'text'
+      });
+    } catch (error) {
+      console.warn('⚠️ Proxy fallback failed:', error.message);
+      throw new Error('All proxies failed. Cannot fetch league page.');
     }
   }
 
@@ -169,6 +165,13 @@ class IBBAPlayerSync {
     return Array.from(playersMap.values());
   }
 
+  /**
+   * מחלץ הטבלאות המשותף (חיתוך + tokenizer ב-worker, מטמון לפי hash)
+   */
+  getTableExtractor() {
+    return this.tableExtractor || window.IBBATableExtractor.getShared();
+  }
+
   /**
    * חילוץ שחקנים מ-HTML של דף הליגה (ישן - לא עובד)
    * 
@@ -177,22 +180,17 @@ class IBBAPlayerSync {
    *   <span class="player-name">שם שחקן</span>
    *   <span class="team-name">שם קבוצה</span>
    * </div>
+   * 
+   * הדף לא נטען ל-DOM: IBBATableExtractor מחזיר את אלמנטי השחקן והשדות שבתוכם
    */
-  parsePlayersFromHtml(html) {
+  async parsePlayersFromHtml(html) {
     const players = [];
     
     try {
-      // יצירת parser DOM
-      const parser = new DOMParser();
-      const doc = parser.parseFromString(html, 'text/html');
-      
-      // DEBUG: בואו נראה מה יש בדף
       console.log(`📄 HTML length: ${html.length} characters`);
-      console.log(`📄 Page title: ${doc.title}`);
       
-      // חיפוש רשימת שחקנים
-      // הפורמט המדויק תלוי במבנה האתר - זה דוגמה
-      const playerElements = doc.querySelectorAll('.player-card, .roster-player, [data-player-id]');
+      // .player-card, .roster-player, [data-player-id]
+      const playerElements = await this.getTableExtractor().extract(html, 'playerElements');
       
       console.log(`🔍 Found ${playerElements.length} player elements in HTML`);
       
@@ -222,7 +220,7 @@ class IBBAPlayerSync {
       // אם לא מצאנו שחקנים, אולי המבנה שונה - ננסה גישה אלטרנטיבית
       if (players.length === 0) {
         console.warn('⚠️ No players found with primary method, trying alternative parsing...');
-        return this.parsePlayersAlternative(doc);
+        return await this.parsePlayersAlternative(html);
       }
       
     } catch (error) {
@@ -234,45 +232,19 @@ class IBBAPlayerSync {
   }
 
   /**
-   * גישה אלטרנטיבית לחילוץ שחקנים (במקרה שהמבנה שונה)
+   * גישה אלטרנטיבית לחילוץ שחקנים (במקרה שהמבנה שונה): קישורי /player/ בדף
+   * (רק תגי <a> נבדקים - בלי מעבר על כל האלמנטים וה-classes שלהם)
    */
-  parsePlayersAlternative(doc) {
+  async parsePlayersAlternative(html) {
     const players = [];
     
-    // DEBUG: בואו ננסה למצוא כל מיני דברים
-    console.log('🔍 Trying alternative selectors...');
-    
-    // ניסיון 1: links לשחקנים
-    const playerLinks = doc.querySelectorAll('a[href*="/player/"], a[href*="/players/"]');
-    console.log(`  - Player links: ${playerLinks.length}`);
-    
-    // ניסיון 2: divs עם classes שונים
-    const divs = doc.querySelectorAll('div[class*="player"], div[class*="roster"]');
-    console.log(`  - Divs with player/roster: ${divs.length}`);
-    
-    // ניסיון 3: tables (אולי השחקנים בטבלה?)
-    const tables = doc.querySelectorAll('table');
-    console.log(`  - Tables: ${tables.length}`);
-    
-    // ניסיון 4: בואו נראה אילו classes יש בדף
-    const allElements = doc.querySelectorAll('*[class]');
-    const classes = new Set();
-    allElements.forEach(el => {
-      el.classList.forEach(cls => {
-        if (cls.includes('player') || cls.includes('roster') || cls.includes('team')) {
-          classes.add(cls);
-        }
-      });
-    });
-    console.log(`  - Relevant classes found: ${Array.from(classes).join(', ')}`);
-    
+    const playerLinks = await this.getTableExtractor().extract(html, 'playerLinks');
     console.log(`🔍 Alternative method found ${playerLinks.length} player links`);
     
     playerLinks.forEach(link => {
       try {
-        const href = link.getAttribute('href');
-        const playerId = this.extractPlayerIdFromUrl(href);
-        const playerName = link.textContent.trim();
+        const playerId = this.extractPlayerIdFromUrl(link.href);
+        const playerName = this.cleanText(link.text);
         
         if (playerId && playerName && playerName.length > 1) {
           players.push({
@@ -293,21 +265,20 @@ class IBBAPlayerSync {
   }
 
   /**
-   * חילוץ ID שחקן מאלמנט
+   * חילוץ ID שחקן מאלמנט (כפי שהוחזר מ-IBBATableExtractor)
    */
   extractPlayerId(element) {
     // ניסיון 1: data-player-id
-    let id = element.getAttribute('data-player-id');
+    let id = element.attrs['data-player-id'];
     if (id) return id;
     
     // ניסיון 2: data-id
-    id = element.getAttribute('data-id');
+    id = element.attrs['data-id'];
     if (id) return id;
     
     // ניסיון 3: מתוך href
-    const link = element.querySelector('a[href*="/player/"]');
-    if (link) {
-      return this.extractPlayerIdFromUrl(link.getAttribute('href'));
+    if (element.playerHref) {
+      return this.extractPlayerIdFromUrl(element.playerHref);
     }
     
     return null;
@@ -328,51 +299,41 @@ class IBBAPlayerSync {
    * חילוץ שם שחקן
    */
   extractPlayerName(element) {
-    // ניסיון 1: .player-name
-    let nameEl = element.querySelector('.player-name, .name, h3, h4');
-    if (nameEl) return this.cleanText(nameEl.textContent);
+    // ניסיון 1: .player-name / .name / h3 / h4
+    if (element.name) return this.cleanText(element.name);
     
     // ניסיון 2: data-name
-    let name = element.getAttribute('data-name');
+    let name = element.attrs['data-name'];
     if (name) return this.cleanText(name);
     
     // ניסיון 3: title
-    name = element.getAttribute('title');
+    name = element.attrs.title;
     if (name) return this.cleanText(name);
     
     // ניסיון 4: טקסט ישיר
-    return this.cleanText(element.textContent);
+    return this.cleanText(element.text);
   }
 
   /**
-   * חילוץ שם קבוצה
+   * חילוץ שם קבוצה (.team-name / .team / .club)
    */
   extractTeamName(element) {
-    const teamEl = element.querySelector('.team-name, .team, .club');
-    return teamEl ? this.cleanText(teamEl.textContent) : null;
+    return element.team ? this.cleanText(element.team) : null;
   }
 
   /**
-   * חילוץ ID קבוצה
+   * חילוץ ID קבוצה ([data-team-id])
    */
   extractTeamId(element) {
-    const teamEl = element.querySelector('[data-team-id]');
-    return teamEl ? teamEl.getAttribute('data-team-id') : null;
+    return element.teamId || null;
   }
 
   /**
-   * ניקוי טקסט מרווחים וHTML entities
+   * ניקוי רווחים (ה-entities כבר מפוענחים ב-IBBATableExtractor)
    */
   cleanText(text) {
     if (!text) return '';
-    
-    // יצירת textarea לdecode HTML entities
-    const textarea = document.createElement('textarea');
-    textarea.innerHTML = text;
-    const decoded = textarea.value;
-    
-    // ניקוי רווחים מיותרים
-    return decoded.trim().replace(/\s+/g, ' ');
+    return text.trim().replace(/\s+/g, ' ');
   }
 
   /**
@@ -0,0 +1,361 @@
+/**
+ * IBBA Proxy Client
+ * לקוח fetch משותף לכל הקריאות דרך CORS proxy (adapter, player sync, standings, player names)
+ *
+ * - לכל proxy נשמרים אחוז הצלחה וזמן תגובה ממוצע (EWMA) - ה-proxy המהיר והבריא מנוסה קודם
+ * - circuit breaker: אחרי כמה כשלונות רצופים ה-proxy מדולג לתקופת צינון (שמוכפלת בכל כשלון נוסף)
+ * - בסוף הצינון - ניסיון בודד (half-open); הצלחה מחזירה אותו לשימוש
+ * - אופציונלי: מרוץ בין שני ה-proxies המובילים (race) - הראשון שמצליח מנצח, השני מבוטל
+ * - סטטיסטיקות לדיבאג: IBBAProxyClient.getShared().getStats()
+ *
+ * @module IBBAProxyClient
+ * @version 1.0.0
+ */
+class IBBAProxyClient {
+  /**
+   * @param {Object} options - { timeoutMs, failureThreshold, cooldownMs, maxCooldownMs, race, defaultLatencyMs, now }
+   */
+  constructor(options = {}) {
+    this.timeoutMs = options.timeoutMs || 15000;           // timeout ברירת מחדל לניסיון בודד
+    this.failureThreshold = options.failureThreshold || 3; // כשלונות רצופים עד לפתיחת המעגל
+    this.cooldownMs = options.cooldownMs || 60 * 1000;     // צינון ראשון, מוכפל בכל פתיחה חוזרת
+    this.maxCooldownMs = options.maxCooldownMs || 10 * 60 * 1000;
+    this.race = options.race ?? false;                     // מרוץ בין שני המובילים
+    this.defaultLatencyMs = options.defaultLatencyMs || 2000; // הערכה ל-proxy שעוד לא נמדד
+    this.latencyAlpha = 0.3;                               // משקל המדידה האחרונה ב-EWMA
+    this.now = options.now || (() => Date.now());
+
+    this.health = new Map();
+  }
+
+  /**
+   * מופע משותף לכל המודולים בדף (הסטטיסטיקות מצטברות בין כולם)
+   */
+  static getShared() {
+    if (!window.ibbaProxyClient) {
+      window.ibbaProxyClient = new IBBAProxyClient();
+    }
+    return window.ibbaProxyClient;
+  }
+
+  getProxy(id) {
+    const proxy = IBBAProxyClient.PROXIES[id];
+    if (!proxy) {
+      throw new Error(`Unknown proxy: ${id}`);
+    }
+    return proxy;
+  }
+
+  getHealth(id) {
+    let health = this.health.get(id);
+    if (!health) {
+      health = {
+        attempts: 0,
+        successes: 0,
+        failures: 0,
+        consecutiveFailures: 0,
+        latencyMs: null,
+        lastError: null,
+        openUntil: 0,
+        opens: 0,        // פתיחות רצופות של המעגל (לחישוב הצינון)
+        probing: false   // ניסיון half-open בתהליך
+      };
+      this.health.set(id, health);
+    }
+    return health;
+  }
+
+  /**
+   * מצב המעגל: closed (תקין) / open (מדולג) / half-open (מותר ניסיון אחד)
+   */
+  getState(id) {
+    const health = this.getHealth(id);
+    if (health.opens === 0) return 'closed';
+    return this.now() < health.openUntil ? 'open' : 'half-open';
+  }
+
+  /**
+   * ציון לדירוג - זמן תגובה חלקי אחוז הצלחה (נמוך = עדיף)
+   */
+  getScore(id) {
+    const health = this.getHealth(id);
+    const latency = health.latencyMs ?? this.defaultLatencyMs;
+    const successRate = (health.successes + 1) / (health.attempts + 1);
+    return latency / Math.max(successRate, 0.1);
+  }
+
+  /**
+   * סדר הניסיון: proxies זמינים לפי ציון (שוויון - לפי סדר הרשימה של הקורא),
+   * ואם כולם במצב open - כולם, לפי מי שאמור להיפתח ראשון (עדיף ניסיון מכישלון בטוח)
+   */
+  rankProxies(ids) {
+    const available = [];
+    const open = [];
+
+    ids.forEach((id, index) => {
+      const state = this.getState(id);
+      if (state === 'closed' || (state === 'half-open' && !this.getHealth(id).probing)) {
+        available.push({ id, index, score: this.getScore(id) });
+      } else {
+        open.push({ id, index, openUntil: this.getHealth(id).openUntil });
+      }
+    });
+
+    if (available.length > 0) {
+      return available
+        .sort((a, b) => a.score - b.score || a.index - b.index)
+        .map(entry => entry.id);
+    }
+    return open
+      .sort((a, b) => a.openUntil - b.openUntil || a.index - b.index)
+      .map(entry => entry.id);
+  }
+
+  recordSuccess(id, latencyMs) {
+    const health = this.getHealth(id);
+    health.attempts++;
+    health.successes++;
+    health.consecutiveFailures = 0;
+    health.latencyMs = health.latencyMs === null
+      ? latencyMs
+      : health.latencyMs + this.latencyAlpha * (latencyMs - health.latencyMs);
+    health.opens = 0;
+    health.openUntil = 0;
+  }
+
+  recordFailure(id, errorMessage) {
+    const health = this.getHealth(id);
+    health.attempts++;
+    health.failures++;
+    health.consecutiveFailures++;
+    health.lastError = errorMessage;
+
+    // half-open שנכשל נפתח מחדש מיד, closed - רק אחרי failureThreshold כשלונות רצופים
+    if (health.opens > 0 || health.consecutiveFailures >= this.failureThreshold) {
+      const cooldown = Math.min(this.cooldownMs * Math.pow(2, health.opens), this.maxCooldownMs);
+      health.opens++;
+      health.openUntil = this.now() + cooldown;
+      console.warn(`🔌 Proxy ${id} circuit open for ${Math.round(cooldown / 1000)}s (${health.consecutiveFailures} failures in a row)`);
+    }
+  }
+
+  /**
+   * ניסיון בודד דרך proxy אחד
+   * @returns {Promise<*>} גוף התשובה (JSON או טקסט)
+   */
+  async attempt(id, targetUrl, options) {
+    const { as, signal, raceSignal, timeoutMs, validate } = options;
+    const proxy = this.getProxy(id);
+    const health = this.getHealth(id);
+    const wasHalfOpen = this.getState(id) === 'half-open';
+    if (wasHalfOpen) health.probing = true;
+
+    const controller = new AbortController();
+    const onAbort = () => controller.abort();
+    signal?.addEventListener('abort', onAbort);
+    raceSignal?.addEventListener('abort', onAbort);
+    const timeoutId = setTimeout(() => controller.abort(), timeoutMs);
+    const startedAt = this.now();
+
+    try {
+      const response = await fetch(proxy.buildUrl(targetUrl), { signal: controller.signal });
+      if (!response.ok) {
+        throw new Error(`HTTP ${response.status}`);
+      }
+
+      let body;
+      if (proxy.unwrap) {
+        body = proxy.unwrap(await response.json());
+        if (as === 'json') body = JSON.parse(body);
+      } else {
+        body = as === 'json' ? await response.json() : await response.text();
+      }
+
+      if (validate && !validate(body)) {
+        throw new Error('Invalid response');
+      }
+
+      const latencyMs = this.now() - startedAt;
+      this.recordSuccess(id, latencyMs);
+      console.log(`✅ Fetched via proxy ${id} (${latencyMs}ms)`);
+      return body;
+
+    } catch (error) {
+      if (signal?.aborted) {
+        throw new Error('Request cancelled');
+      }
+      if (raceSignal?.aborted) {
+        // הפסיד במרוץ - לא כשלון של ה-proxy
+        const lost = new Error('Lost race');
+        lost.raceLost = true;
+        throw lost;
+      }
+
+      const message = error.name === 'AbortError' ? `timeout (${timeoutMs}ms)` : error.message;
+      this.recordFailure(id, message);
+      console.warn(`⚠️ Proxy ${id} failed:`, message);
+      throw new Error(message);
+
+    } finally {
+      clearTimeout(timeoutId);
+      signal?.removeEventListener('abort', onAbort);
+      raceSignal?.removeEventListener('abort', onAbort);
+      if (wasHalfOpen) health.probing = false;
+    }
+  }
+
+  /**
+   * מרוץ בין שני proxies - הראשון שמצליח מנצח והשני מבוטל
+   */
+  async raceAttempts(ids, targetUrl, options, attempts) {
+    const raceController = new AbortController();
+    const runners = ids.map(id => this.attempt(id, targetUrl, { ...options, raceSignal: raceController.signal })
+      .then(body => {
+        raceController.abort();
+        return body;
+      })
+      .catch(error => {
+        if (!error.raceLost && error.message !== 'Request cancelled') {
+          attempts.push({ proxy: id, error: error.message });
+        }
+        throw error;
+      }));
+
+    try {
+      return await Promise.any(runners);
+    } catch (aggregate) {
+      const cancelled = aggregate.errors.find(error => error.message === 'Request cancelled');
+      throw cancelled || new Error('Race failed');
+    }
+  }
+
+  /**
+   * קריאה ל-URL דרך רשימת proxies - לפי הדירוג, עם fallback עד שאחד מצליח
+   * @param {string} targetUrl - ה-URL המקורי (ibasketball.co.il)
+   * @param {Object} options - {
+   *   proxies: [id | { id, timeoutMs }] (סדר העדפה של הקורא),
+   *   as: 'json' | 'text', signal, timeoutMs, validate(body) => boolean,
+   *   race (ברירת מחדל - של הלקוח), onAttempt({ proxy, attempt, total })
+   * }
+   * @returns {Promise<*>}
+   */
+  async fetch(targetUrl, options = {}) {
+    const {
+      proxies = ['corsproxy', 'allorigins-raw'],
+      as = 'json',
+      signal = null,
+      validate = null,
+      onAttempt = null
+    } = options;
+    const race = options.race ?? this.race;
+
+    const timeouts = new Map();
+    const ids = proxies.map(entry => {
+      const id = typeof entry === 'string' ? entry : entry.id;
+      timeouts.set(id, (typeof entry === 'object' && entry.timeoutMs) || options.timeoutMs || this.timeoutMs);
+      return id;
+    });
+
+    const ranked = this.rankProxies(ids);
+    const attempts = [];
+    let attemptNumber = 0;
+    let position = 0;
+
+    const attemptOptions = id => ({ as, signal, validate, timeoutMs: timeouts.get(id) });
+    const notify = id => {
+      attemptNumber++;
+      console.log(`🔄 Trying proxy ${id} (${attemptNumber}/${ranked.length})...`);
+      if (onAttempt) onAttempt({ proxy: id, attempt: attemptNumber, total: ranked.length });
+    };
+
+    if (race && ranked.length >= 2) {
+      if (signal?.aborted) throw new Error('Request cancelled');
+      const racers = ranked.slice(0, 2);
+      racers.forEach(notify);
+      position = 2;
+      try {
+        return await this.raceAttempts(racers, targetUrl, {
+          ...attemptOptions(racers[0]),
+          timeoutMs: Math.max(timeouts.get(racers[0]), timeouts.get(racers[1]))
+        }, attempts);
+      } catch (error) {
+        if (error.message === 'Request cancelled') throw error;
+      }
+    }
+
+    for (; position < ranked.length; position++) {
+      if (signal?.aborted) {
+        throw new Error('Request cancelled');
+      }
+      const id = ranked[position];
+      notify(id);
+
+      try {
+        return await this.attempt(id, targetUrl, attemptOptions(id));
+      } catch (error) {
+        if (error.message === 'Request cancelled') throw error;
+        attempts.push({ proxy: id, error: error.message });
+      }
+    }
+
+    const error = new Error(`All proxies failed (${attempts.map(a => `${a.proxy}: ${a.error}`).join(', ')})`);
+    error.attempts = attempts;
+    throw error;
+  }
+
+  /**
+   * סטטיסטיקות לכל proxy שנוסה
+   * @returns {Object} id -> { state, attempts, successes, failures, successRate, latencyMs, consecutiveFailures, lastError, openForMs }
+   */
+  getStats() {
+    const stats = {};
+    this.health.forEach((health, id) => {
+      stats[id] = {
+        state: this.getState(id),
+        attempts: health.attempts,
+        successes: health.successes,
+        failures: health.failures,
+        successRate: health.attempts > 0 ? Math.round((health.successes / health.attempts) * 100) / 100 : null,
+        latencyMs: health.latencyMs === null ? null : Math.round(health.latencyMs),
+        consecutiveFailures: health.consecutiveFailures,
+        lastError: health.lastError,
+        openForMs: Math.max(0, health.openUntil - this.now())
+      };
+    });
+    return stats;
+  }
+
+  resetStats() {
+    this.health.clear();
+  }
+}
+
+// ה-proxies המוכרים - כל מודול בוחר מהם רשימה לפי סדר העדפה
+IBBAProxyClient.PROXIES = {
+  'vercel-relative': { buildUrl: url => `/api/proxy?url=${encodeURIComponent(url)}` },
+  'vercel': { buildUrl: url => `https://basketball-stats-manager.vercel.app/api/proxy?url=${encodeURIComponent(url)}` },
+  'corsproxy': { buildUrl: url => `https://corsproxy.io/?${encodeURIComponent(url)}` },
+  'allorigins-raw': { buildUrl: url => `https://api.allorigins.win/raw?url=${encodeURIComponent(url)}` },
+  'allorigins-get': {
+    buildUrl: url => `https://api.allorigins.win/get?url=${encodeURIComponent(url)}`,
+    unwrap: data => data.contents // עוטף את התוכן ב-{ contents }
+  },
+  'cors-anywhere': { buildUrl: url => `https://cors-anywhere.herokuapp.com/${encodeURIComponent(url)}` }
+};
+
+// Export for use
+if (typeof window !== 'undefined') {
+  window.IBBAProxyClient = IBBAProxyClient;
+
+  // IBBATracer: כל בקשה וכל ניסיון proxy
+  if (window.IBBATracer) {
+    window.IBBATracer.getShared().instrument(IBBAProxyClient.prototype, ['fetch', 'attempt'], {
+      category: 'proxy',
+      attributes: (name, args) => (name === 'attempt' ? { proxy: args[0], url: args[1] } : { url: args[0] })
+    });
+  }
+}
+
+if (typeof module !== 'undefined' && module.exports) {
+  module.exports = IBBAProxyClient;
+}
@@ -0,0 +1,258 @@
+/**
+ * IBBA Round Reports
+ * הכנת דוחות לכל משחקי מחזור בבת אחת, בלי לתקוע את הדף
+ *
+ * - הדוחות נבנים ב-workers (Web Worker בדפדפן, worker_threads ב-Node)
+ * - כל worker מחשב את נתוני העונה (ממוצעים, טרנדים, טבלה) פעם אחת ומשתמש בהם לכל המשחקים שלו
+ * - כל דוח מוחזר ב-onReport ברגע שהוא מוכן (streaming), ואפשר לבטל באמצע (cancel / signal)
+ * - אם אין Worker (או שהוא לא עולה, למשל מ-file://) - fallback ל-IBBAAdvanced.buildRoundReports
+ *
+ * @module IBBARoundReports
+ * @version 1.0.0
+ */
+class IBBARoundReports {
+  /**
+   * @param {IBBAAdvanced} advanced - עם ה-analytics של העונה
+   * @param {Object} options - { workerUrl, concurrency, useWorkers, silentWorkers }
+   */
+  constructor(advanced, options = {}) {
+    this.advanced = advanced;
+    this.workerUrl = options.workerUrl || 'js/ibba/ibba_round_reports_worker.js';
+    this.concurrency = options.concurrency || IBBARoundReports.getDefaultConcurrency();
+    this.useWorkers = options.useWorkers ?? true;
+    this.silentWorkers = options.silentWorkers ?? false;
+
+    this.workers = [];
+    this.abortController = null;
+    this.lastRunTimings = null;
+  }
+
+  /**
+   * מספר workers ברירת מחדל - משאירים ליבה אחת ל-UI, ולא יותר מ-4
+   */
+  static getDefaultConcurrency() {
+    let cores = 2;
+    if (typeof navigator !== 'undefined' && navigator.hardwareConcurrency) {
+      cores = navigator.hardwareConcurrency;
+    } else if (typeof require === 'function') {
+      try {
+        cores = require('os').cpus().length;
+      } catch (e) {
+        // לא Node - נשארים עם ברירת המחדל
+      }
+    }
+    return Math.max(1, Math.min(4, cores - 1));
+  }
+
+  getNodeWorkerClass() {
+    if (typeof require !== 'function') return null;
+    try {
+      return require('worker_threads').Worker;
+    } catch (e) {
+      return null;
+    }
+  }
+
+  isWorkerSupported() {
+    return typeof Worker !== 'undefined' || this.getNodeWorkerClass() !== null;
+  }
+
+  /**
+   * יצירת worker עם ממשק אחיד לדפדפן ול-Node
+   */
+  createWorker() {
+    if (typeof Worker !== 'undefined') {
+      const worker = new Worker(this.workerUrl);
+      return {
+        post: message => worker.postMessage(message),
+        onMessage: handler => { worker.onmessage = event => handler(event.data); },
+        onError: handler => { worker.onerror = event => handler(new Error(event.message || 'Worker error')); },
+        terminate: () => worker.terminate()
+      };
+    }
+
+    const NodeWorker = this.getNodeWorkerClass();
+    const worker = new NodeWorker(this.workerUrl, { workerData: { silent: this.silentWorkers } });
+    return {
+      post: message => worker.postMessage(message),
+      onMessage: handler => worker.on('message', handler),
+      onError: handler => worker.on('error', handler),
+      terminate: () => worker.terminate()
+    };
+  }
+
+  /**
+   * הודעת אתחול ל-worker: המשחקים (בלי ה-JSON המקורי), הטבלה ושמות השחקנים
+   */
+  buildInitMessage() {
+    const games = (this.advanced.analytics.games || []).map(({ originalJson, ...game }) => game);
+    const namesMap = this.advanced.playerNamesLoader?.namesMap;
+
+    return {
+      type: 'init',
+      games,
+      standings: this.advanced.standingsLoaded ? Array.from(this.advanced.standingsFromHTML.entries()) : [],
+      playerNames: namesMap ? Array.from(namesMap.entries()) : [],
+      silent: this.silentWorkers
+    };
+  }
+
+  /**
+   * בניית דוחות לכל משחקי המחזור
+   * @param {Array} fixtures - [{ homeTeam, awayTeam, gameId?, date? }]
+   * @param {Object} options - { onReport(result, index), signal }
+   * @returns {Promise<Array>} [{ fixture, report } | { fixture, error }] לפי סדר המשחקים
+   */
+  async run(fixtures, options = {}) {
+    const { onReport = null, signal = null } = options;
+
+    // batch חדש מבטל את הקודם
+    this.cancel();
+    const controller = new AbortController();
+    this.abortController = controller;
+    const onExternalAbort = () => controller.abort();
+    signal?.addEventListener('abort', onExternalAbort);
+    if (signal?.aborted) controller.abort();
+
+    const startedAt = Date.now();
+    let streamed = 0;
+    const trackReport = (result, index) => {
+      streamed++;
+      if (onReport) onReport(result, index);
+    };
+
+    let mode = this.useWorkers && this.isWorkerSupported() && fixtures.length > 0 ? 'worker' : 'main';
+    console.log(`🏀 Round reports: ${fixtures.length} matchups (${mode === 'worker' ? `${Math.min(this.concurrency, fixtures.length)} workers` : 'main thread'})`);
+
+    try {
+      let results;
+      if (mode === 'worker') {
+        try {
+          results = await this.runInWorkers(fixtures, trackReport, controller.signal);
+        } catch (error) {
+          if (controller.signal.aborted || streamed > 0) throw error;
+          console.warn('⚠️ Round reports: workers unavailable, falling back to main thread:', error.message);
+          mode = 'main';
+        }
+      }
+      if (mode === 'main') {
+        results = await this.advanced.buildRoundReports(fixtures, { onReport: trackReport, signal: controller.signal });
+      }
+
+      console.log(`✅ Round reports: ${results.length} reports in ${Date.now() - startedAt}ms`);
+      return results;
+    } finally {
+      signal?.removeEventListener('abort', onExternalAbort);
+      if (this.abortController === controller) this.abortController = null;
+      this.lastRunTimings = {
+        mode,
+        fixtures: fixtures.length,
+        streamed,
+        totalMs: Date.now() - startedAt,
+        cancelled: controller.signal.aborted
+      };
+    }
+  }
+
+  /**
+   * חלוקת המשחקים בין workers - כל worker מקבל משחק חדש כשסיים את הקודם
+   */
+  async runInWorkers(fixtures, onReport, signal) {
+    if (!this.advanced.standingsLoaded) {
+      await this.advanced.loadStandingsFromHTML();
+    }
+    if (signal.aborted) {
+      throw new Error('Round reports cancelled');
+    }
+
+    const initMessage = this.buildInitMessage();
+    const workerCount = Math.max(1, Math.min(this.concurrency, fixtures.length));
+    const results = new Array(fixtures.length);
+    let nextIndex = 0;
+    let completed = 0;
+
+    return new Promise((resolve, reject) => {
+      let settled = false;
+
+      const finish = (error = null) => {
+        if (settled) return;
+        settled = true;
+        signal.removeEventListener('abort', onAbort);
+        this.terminateWorkers();
+        if (error) reject(error);
+        else resolve(results);
+      };
+
+      const onAbort = () => finish(new Error('Round reports cancelled'));
+      signal.addEventListener('abort', onAbort);
+
+      const dispatch = worker => {
+        if (nextIndex >= fixtures.length) return;
+        const index = nextIndex++;
+        const { homeTeam, awayTeam } = fixtures[index];
+        worker.post({ type: 'report', id: index, homeTeam, awayTeam });
+      };
+
+      for (let i = 0; i < workerCount && !settled; i++) {
+        let worker;
+        try {
+          worker = this.createWorker();
+        } catch (error) {
+          finish(error);
+          return;
+        }
+        this.workers.push(worker);
+
+        worker.onMessage(message => {
+          if (settled) return;
+
+          if (message.type === 'ready') {
+            dispatch(worker);
+            return;
+          }
+          if (message.type === 'error' && message.id === null) {
+            finish(new Error(`Round reports worker failed: ${message.message}`));
+            return;
+          }
+
+          const fixture = fixtures[message.id];
+          const result = message.type === 'report'
+            ? { fixture, report: message.report }
+            : { fixture, error: message.message };
+          results[message.id] = result;
+          completed++;
+          onReport(result, message.id);
+
+          if (completed === fixtures.length) finish();
+          else dispatch(worker);
+        });
+        worker.onError(error => finish(error));
+        worker.post(initMessage);
+      }
+    });
+  }
+
+  terminateWorkers() {
+    this.workers.forEach(worker => worker.terminate());
+    this.workers = [];
+  }
+
+  /**
+   * ביטול ה-batch הנוכחי (דוחות שכבר הוחזרו ב-onReport נשארים)
+   */
+  cancel() {
+    if (this.abortController) {
+      console.log('⏹️ Round reports: cancelled');
+      this.abortController.abort();
+    }
+  }
+}
+
+// Export for use
+if (typeof window !== 'undefined') {
+  window.IBBARoundReports = IBBARoundReports;
+}
+
+if (typeof module !== 'undefined' && module.exports) {
+  module.exports = IBBARoundReports;
+}
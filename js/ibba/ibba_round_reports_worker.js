@@ -0,0 +1,91 @@
+/**
+ * IBBA Round Reports Worker
+ * בניית דוחות משחק מחוץ ל-thread הראשי - Web Worker בדפדפן, worker_threads ב-Node
+ *
+ * הודעות נכנסות:
+ *   { type: 'init', games, standings, playerNames, silent } - פעם אחת לכל batch
+ *   { type: 'report', id, homeTeam, awayTeam }              - דוח אחד
+ * הודעות יוצאות:
+ *   { type: 'ready', seasonMs }
+ *   { type: 'report', id, report } | { type: 'error', id, message } (id null = כשל באתחול)
+ *
+ * @module IBBARoundReportsWorker
+ */
+(function() {
+  const isNode = typeof importScripts !== 'function';
+  const { parentPort, workerData } = isNode ? require('worker_threads') : {};
+  const scripts = ['ibba_analytics.js', 'ibba_insights_templates.js', 'ibba_insights_v2.js', 'ibba_advanced.js'];
+
+  const silence = () => {
+    ['log', 'warn', 'time', 'timeEnd'].forEach(method => { console[method] = () => {}; });
+  };
+  if (workerData?.silent) silence();
+
+  // המודולים נרשמים על window
+  globalThis.window = globalThis;
+
+  if (isNode) {
+    const fs = require('fs');
+    const path = require('path');
+    const vm = require('vm');
+    scripts.forEach(name => {
+      const file = path.join(__dirname, name);
+      vm.runInThisContext(fs.readFileSync(file, 'utf8'), { filename: file });
+    });
+  } else {
+    importScripts(...scripts);
+  }
+
+  const post = message => (isNode ? parentPort.postMessage(message) : self.postMessage(message));
+
+  let advanced = null;
+  let seasonContext = null;
+
+  function init(message) {
+    const startedAt = Date.now();
+
+    if (message.silent) silence();
+
+    advanced = new window.IBBAAdvanced(new window.IBBAAnalytics(message.games || []));
+
+    // הטבלה נטענת ב-thread הראשי - ה-worker לא ניגש לרשת
+    advanced.standingsFromHTML = new Map(message.standings || []);
+    advanced.standingsLoaded = advanced.standingsFromHTML.size > 0;
+
+    if (message.playerNames?.length) {
+      const playerNamesLoader = { namesMap: new Map(message.playerNames) };
+      window.playerNamesLoader = playerNamesLoader;
+      advanced.setPlayerNames(playerNamesLoader);
+    }
+
+    seasonContext = advanced.getSeasonContext();
+    post({ type: 'ready', seasonMs: Date.now() - startedAt });
+  }
+
+  async function report(message) {
+    try {
+      const result = await advanced.buildMatchupReport(message.homeTeam, message.awayTeam, seasonContext);
+      post({ type: 'report', id: message.id, report: result });
+    } catch (error) {
+      post({ type: 'error', id: message.id, message: error.message });
+    }
+  }
+
+  function handleMessage(message) {
+    if (message.type === 'init') {
+      try {
+        init(message);
+      } catch (error) {
+        post({ type: 'error', id: null, message: error.message });
+      }
+    } else if (message.type === 'report') {
+      report(message);
+    }
+  }
+
+  if (isNode) {
+    parentPort.on('message', handleMessage);
+  } else {
+    self.onmessage = event => handleMessage(event.data);
+  }
+})();
@@ -0,0 +1,379 @@
+/**
+ * IBBA Season Registry
+ * כמה עונות בזיכרון - טעינה עצלה, שתי רמות שמירה ופינוי LRU לפי תקציב זיכרון
+ *
+ * - עונה נטענת רק בשאילתה הראשונה שצריכה אותה (טעינה אחת גם כשכמה שאילתות מחכות לה)
+ * - keepFullSeasons העונות שבשימוש האחרון נשמרות כמשחקים מלאים (+ IBBAAnalytics)
+ * - עונות ישנות יותר נשמרות רק כסכומים (getCompactAggregates) + שורת תוצאה לכל משחק (ל-H2H)
+ * - מעל maxBytes: קודם עונה מלאה הופכת למצומצמת, ואם עדיין מעל - העונה המצומצמת הישנה נמחקת
+ *   (ותיטען שוב כשיבקשו אותה; עם IBBAGameCache זו קריאה מ-IndexedDB ולא מהרשת)
+ * - columnar: העונות המלאות נשמרות ב-IBBAGameStore (שורות השחקנים בעמודות, בלי originalJson)
+ *   והמצטברים שלהן נבנים מהעמודות - entry.games הן כותרות המשחקים עם game.players כתצוגות
+ * - הזיכרון מוערך (JSON של דגימת משחקים), לא נמדד
+ *
+ * שאילתות על קבוצת עונות (ברירת מחדל - כל העונות הרשומות, מהישנה לחדשה):
+ *   getAnalytics(keys)        - IBBAAnalytics על הסכומים הממוזגים
+ *   getGames(keys)            - המשחקים המלאים (טוען את העונות במלואן)
+ *   getH2HHistory(a, b, keys) - מפגשים ישירים לאורך העונות
+ *   getTeamSeasons(team, keys) - ממוצעי הקבוצה בכל עונה
+ *   getMultiSeasonData(a, b, keys) - הקלט ל-IBBAInsightsV2.generateMultiSeasonInsights
+ *
+ * @module IBBASeasonRegistry
+ * @version 1.0.0
+ */
+class IBBASeasonRegistry {
+  /**
+   * @param {Object} options - { adapter, gameCache, loader, seasons, maxBytes, keepFullSeasons, columnar }
+   *   adapter  - IBBAAdapter של העונה הנוכחית (נרשמת אוטומטית; עונות אחרות דרך adapter.forSeason)
+   *   loader   - אופציונלי: async (season, adapter) => games בפורמט פנימי (במקום המטמון/הרשת)
+   */
+  constructor(options = {}) {
+    this.adapter = options.adapter || null;
+    this.gameCache = options.gameCache || null;
+    this.loader = options.loader || null;
+    this.maxBytes = options.maxBytes ?? 64 * 1024 * 1024;
+    this.keepFullSeasons = options.keepFullSeasons ?? 2;
+    this.columnar = options.columnar ?? false;
+
+    this.seasons = new Map();  // key → הגדרת עונה
+    this.entries = new Map();  // key → עונה טעונה (סדר ה-Map = LRU, האחרונה בשימוש בסוף)
+    this.loading = new Map();  // key → Promise של טעינה בתהליך
+    this.stats = { loads: 0, hits: 0, demoted: 0, evicted: 0 };
+
+    if (this.adapter) this.register(this.adapter.getSeasonDefinition());
+    (options.seasons || []).forEach(season => this.register(season));
+  }
+
+  /**
+   * רישום עונה
+   * @param {Object} season - { leagueId, seasonId, seasonMonths, playersPageURL, label, key }
+   */
+  register(season) {
+    const key = season.key || `${season.leagueId}:${season.seasonId}`;
+    this.seasons.set(key, {
+      ...season,
+      key,
+      label: season.label || key,
+      seasonMonths: season.seasonMonths ? [...season.seasonMonths] : []
+    });
+    return key;
+  }
+
+  /**
+   * מפתחות העונות לפי סדר כרונולוגי (החודש הראשון של העונה)
+   */
+  getSeasonKeys() {
+    return Array.from(this.seasons.values())
+      .sort((a, b) => String(a.seasonMonths[0] || '').localeCompare(String(b.seasonMonths[0] || '')))
+      .map(season => season.key);
+  }
+
+  resolveKeys(keys) {
+    const ordered = this.getSeasonKeys();
+    if (!keys) return ordered;
+    const requested = new Set(keys);
+    requested.forEach(key => {
+      if (!this.seasons.has(key)) throw new Error(`Unknown season: ${key}`);
+    });
+    return ordered.filter(key => requested.has(key));
+  }
+
+  // ===============================================
+  // טעינה ושמירה
+  // ===============================================
+
+  /**
+   * עונה טעונה (טוען אם צריך)
+   * @param {Object} options - { full: נדרשים המשחקים עצמם, pinned: מפתחות שלא יפונו בזמן השאילתה }
+   */
+  async getSeason(key, options = {}) {
+    const { full = false, pinned = null } = options;
+    if (!this.seasons.has(key)) throw new Error(`Unknown season: ${key}`);
+
+    const entry = this.entries.get(key);
+    if (entry && (entry.tier === 'full' || !full)) {
+      this.touch(entry);
+      this.stats.hits++;
+      return entry;
+    }
+
+    if (!this.loading.has(key)) {
+      const promise = this.loadSeason(key)
+        .finally(() => this.loading.delete(key));
+      this.loading.set(key, promise);
+    }
+    const loaded = await this.loading.get(key);
+    this.enforceBudget(new Set([key, ...(pinned || [])]));
+    return loaded;
+  }
+
+  async loadSeason(key) {
+    const season = this.seasons.get(key);
+    const startedAt = Date.now();
+    const adapter = this.adapter ? this.adapter.forSeason(season) : new window.IBBAAdapter(season);
+
+    let games;
+    if (this.loader) {
+      games = await this.loader(season, adapter);
+    } else if (this.gameCache) {
+      games = await this.gameCache.loadSeasonGames(adapter);
+    } else {
+      const rawGames = await adapter.fetchSeasonMonthGames(Infinity);
+      games = rawGames.map(rawGame => adapter.convertToInternalFormat(rawGame));
+    }
+
+    const store = this.columnar ? window.IBBAGameStore.fromGames(games) : null;
+    const entry = {
+      key,
+      label: season.label,
+      tier: 'full',
+      games: store ? store.games : games,
+      store,
+      analytics: store ? window.IBBAAnalytics.fromStore(store) : new window.IBBAAnalytics(games),
+      aggregates: null,
+      lines: IBBASeasonRegistry.buildGameLines(games, key),
+      bytes: 0
+    };
+    entry.bytes = IBBASeasonRegistry.estimateBytes(entry);
+
+    this.entries.delete(key);
+    this.entries.set(key, entry);
+    this.stats.loads++;
+    console.log(`📅 Season ${season.label}: ${games.length} games loaded in ${Date.now() - startedAt}ms (~${(entry.bytes / 1024 / 1024).toFixed(1)}MB)`);
+    return entry;
+  }
+
+  touch(entry) {
+    this.entries.delete(entry.key);
+    this.entries.set(entry.key, entry);
+  }
+
+  /**
+   * עונה מלאה → סכומים בלבד (המשחקים משוחררים)
+   */
+  demote(entry) {
+    if (entry.tier !== 'full') return;
+    entry.aggregates = entry.analytics.getCompactAggregates();
+    entry.games = null;
+    entry.store = null;
+    entry.analytics = null;
+    entry.tier = 'compact';
+    entry.bytes = IBBASeasonRegistry.estimateBytes(entry);
+    this.stats.demoted++;
+    console.log(`📦 Season ${entry.label}: kept as aggregates only (~${(entry.bytes / 1024).toFixed(0)}KB)`);
+  }
+
+  evict(entry) {
+    this.entries.delete(entry.key);
+    this.stats.evicted++;
+    console.log(`🗑️ Season ${entry.label}: evicted from memory`);
+  }
+
+  /**
+   * מגבלת העונות המלאות ואז תקציב הזיכרון, לפי LRU (pinned לא מפונות)
+   */
+  enforceBudget(pinned = new Set()) {
+    const lru = () => Array.from(this.entries.values()).filter(entry => !pinned.has(entry.key));
+
+    const fullCount = () => Array.from(this.entries.values()).filter(entry => entry.tier === 'full').length;
+    for (const entry of lru()) {
+      if (fullCount() <= this.keepFullSeasons) break;
+      if (entry.tier === 'full') this.demote(entry);
+    }
+
+    while (this.getMemoryUsage().totalBytes > this.maxBytes) {
+      const candidates = lru();
+      const victim = candidates.find(entry => entry.tier === 'full') || candidates[0];
+      if (!victim) break;
+      if (victim.tier === 'full') this.demote(victim);
+      else this.evict(victim);
+    }
+  }
+
+  getMemoryUsage() {
+    const seasons = Array.from(this.entries.values()).map(entry => ({
+      key: entry.key,
+      label: entry.label,
+      tier: entry.tier,
+      games: entry.lines.length,
+      bytes: entry.bytes
+    }));
+    return {
+      totalBytes: seasons.reduce((sum, season) => sum + season.bytes, 0),
+      maxBytes: this.maxBytes,
+      seasons
+    };
+  }
+
+  /**
+   * שורת תוצאה לכל משחק - נשמרת גם בעונה מצומצמת (H2H לאורך עונות)
+   */
+  static buildGameLines(games, seasonKey) {
+    return games
+      .filter(game => game.homeTeam && game.awayTeam)
+      .map(game => ({
+        seasonKey,
+        gameId: game.gameId,
+        date: game.date,
+        homeTeam: game.homeTeam,
+        awayTeam: game.awayTeam,
+        homeScore: game.homeScore,
+        awayScore: game.awayScore
+      }));
+  }
+
+  /**
+   * הערכת זיכרון: JSON של עד 8 משחקים לדוגמה × מספר המשחקים (UTF-16 = 2 בתים לתו)
+   * (עונה עמודתית - לפי IBBAGameStore.estimateBytes)
+   */
+  static estimateBytes(entry) {
+    let bytes = entry.lines.length * 160;
+    if (entry.tier === 'full' && entry.store) {
+      bytes += entry.store.estimateBytes();
+    } else if (entry.tier === 'full') {
+      const games = entry.games;
+      const sampleSize = Math.min(8, games.length);
+      if (sampleSize > 0) {
+        let sampleChars = 0;
+        for (let i = 0; i < sampleSize; i++) {
+          sampleChars += JSON.stringify(games[Math.floor(i * games.length / sampleSize)]).length;
+        }
+        bytes += sampleChars / sampleSize * games.length * 2 * 2; // ×2 - המצטברים והאינדקסים של IBBAAnalytics
+      }
+    } else {
+      bytes += JSON.stringify(entry.aggregates).length * 2;
+    }
+    return Math.round(bytes);
+  }
+
+  // ===============================================
+  // שאילתות על קבוצת עונות
+  // ===============================================
+
+  /**
+   * IBBAAnalytics על העונות המבוקשות (עונה מלאה אחת - המופע של העונה עצמה)
+   */
+  async getAnalytics(keys = null) {
+    const resolved = this.resolveKeys(keys);
+    const seasons = [];
+    for (const key of resolved) {
+      const entry = await this.getSeason(key, { pinned: resolved });
+      seasons.push(entry.tier === 'full'
+        ? { aggregates: entry.analytics.getAggregates(), games: entry.games, analytics: entry.analytics }
+        : { aggregates: entry.aggregates, games: [] });
+    }
+    if (seasons.length === 1 && seasons[0].analytics) return seasons[0].analytics;
+    return window.IBBAAnalytics.fromSeasons(seasons);
+  }
+
+  /**
+   * כל המשחקים של העונות המבוקשות (עונה מצומצמת נטענת מחדש)
+   */
+  async getGames(keys = null) {
+    const resolved = this.resolveKeys(keys);
+    const games = [];
+    for (const key of resolved) {
+      const entry = await this.getSeason(key, { full: true, pinned: resolved });
+      entry.games.forEach(game => games.push(game));
+    }
+    return games;
+  }
+
+  /**
+   * מפגשים ישירים לאורך העונות (מבנה כמו IBBAAdvanced.getH2HHistory + פירוט לפי עונה)
+   */
+  async getH2HHistory(teamA, teamB, keys = null) {
+    const resolved = this.resolveKeys(keys);
+    const h2hGames = [];
+    const bySeason = [];
+
+    for (const key of resolved) {
+      const entry = await this.getSeason(key, { pinned: resolved });
+      const seasonGames = entry.lines
+        .filter(line => (line.homeTeam === teamA && line.awayTeam === teamB) || (line.homeTeam === teamB && line.awayTeam === teamA))
+        .map(line => {
+          const teamAHome = line.homeTeam === teamA;
+          const teamAScore = teamAHome ? line.homeScore : line.awayScore;
+          const teamBScore = teamAHome ? line.awayScore : line.homeScore;
+          return {
+            seasonKey: key,
+            date: line.date,
+            gameId: line.gameId,
+            teamAScore,
+            teamBScore,
+            winner: teamAScore > teamBScore ? teamA : teamB,
+            margin: Math.abs(teamAScore - teamBScore),
+            teamAHome
+          };
+        });
+      seasonGames.forEach(game => h2hGames.push(game));
+      bySeason.push({
+        seasonKey: key,
+        label: entry.label,
+        games: seasonGames.length,
+        teamAWins: seasonGames.filter(game => game.winner === teamA).length,
+        teamBWins: seasonGames.filter(game => game.winner === teamB).length
+      });
+    }
+
+    h2hGames.sort((a, b) => new Date(a.date) - new Date(b.date));
+    const teamAWins = h2hGames.filter(game => game.winner === teamA).length;
+    const avgMargin = h2hGames.length > 0
+      ? h2hGames.reduce((sum, game) => sum + game.margin, 0) / h2hGames.length
+      : 0;
+
+    return {
+      teamA,
+      teamB,
+      totalGames: h2hGames.length,
+      teamAWins,
+      teamBWins: h2hGames.length - teamAWins,
+      avgMargin: avgMargin.toFixed(1),
+      games: h2hGames,
+      lastMeeting: h2hGames.length > 0 ? h2hGames[h2hGames.length - 1] : null,
+      seasons: bySeason.filter(season => season.games > 0).length,
+      bySeason
+    };
+  }
+
+  /**
+   * ממוצעי קבוצה בכל עונה (שורה מ-getTeamAverages, או null אם לא שיחקה באותה עונה)
+   */
+  async getTeamSeasons(teamName, keys = null) {
+    const resolved = this.resolveKeys(keys);
+    const rows = [];
+    for (const key of resolved) {
+      const entry = await this.getSeason(key, { pinned: resolved });
+      const averages = entry.tier === 'full'
+        ? entry.analytics.getAggregates().teamAverages
+        : IBBASeasonRegistry.computeTeamAverages(entry.aggregates.teamStats);
+      const row = averages.find(team => team.teamName === teamName);
+      rows.push({ seasonKey: key, label: entry.label, stats: row ? { ...row } : null });
+    }
+    return rows;
+  }
+
+  static computeTeamAverages(teamStats) {
+    return new window.IBBAAnalytics([]).computeTeamAverages(teamStats);
+  }
+
+  /**
+   * כל מה שצריך ל-IBBAInsightsV2.generateMultiSeasonInsights
+   */
+  async getMultiSeasonData(teamA, teamB, keys = null) {
+    return {
+      h2h: await this.getH2HHistory(teamA, teamB, keys),
+      teamASeasons: await this.getTeamSeasons(teamA, keys),
+      teamBSeasons: await this.getTeamSeasons(teamB, keys)
+    };
+  }
+}
+
+// Export for use
+if (typeof window !== 'undefined') {
+  window.IBBASeasonRegistry = IBBASeasonRegistry;
+}
+
+if (typeof module !== 'undefined' && module.exports) {
+  module.exports = IBBASeasonRegistry;
+}
@@ -0,0 +1,701 @@
+/**
+ * IBBA Table Extractor
+ * חילוץ טבלאות מדפי WordPress בלי לבנות DOM לכל הדף
+ *
+ * - חיתוך: רק ה-<table> הרלוונטי נחתך מהדף (indexOf, בלי parse) - ראש הדף, תפריטים וסקריפטים לא נסרקים
+ * - tokenizer זורם: מעבר אחד על המקטע, אירועי open/close/text, בלי עץ
+ * - worker: מקטעים גדולים נפרסים ב-Web Worker (worker_threads ב-Node); בלי worker - באותו thread
+ * - מטמון לפי hash של המקטע (לא של הדף - WordPress מחליף nonce/פרסומות בכל טעינה),
+ *   כך שטבלה שלא השתנתה לא נפרסת שוב
+ *
+ * סוגי חילוץ (KINDS):
+ *   standings      - .sp-league-table → [{ rank, name, gp, w, l, bf, ba, bd, pts }] (טקסט)
+ *   plusMinus      - שורות tr[data-pm] → [{ id, pm }]
+ *   playerLinks    - קישורי /player/ → [{ href, text }]
+ *   playerElements - .player-card / .roster-player / [data-player-id] → [{ attrs, text, name, team, teamId, playerHref }]
+ *
+ * @module IBBATableExtractor
+ * @version 1.0.0
+ */
+class IBBATableExtractor {
+  /**
+   * @param {Object} options - { workerUrl, useWorker, minWorkerBytes, cacheSize }
+   */
+  constructor(options = {}) {
+    this.workerUrl = options.workerUrl || 'js/ibba/ibba_table_extractor_worker.js';
+    this.useWorker = options.useWorker ?? true;
+    this.minWorkerBytes = options.minWorkerBytes ?? 16 * 1024; // מקטע קטן נפרס מהר יותר מהעברה ל-worker
+    this.cacheSize = options.cacheSize || 32;
+
+    this.cache = new Map();   // `${kind}:${hash}` → תוצאה (סדר הכנסה = LRU)
+    this.stats = { hits: 0, misses: 0, workerParses: 0, inlineParses: 0 };
+
+    this.worker = null;
+    this.workerFailed = false;
+    this.pending = new Map(); // id → { resolve, reject }
+    this.nextId = 1;
+  }
+
+  /**
+   * מופע משותף לכל המודולים בדף
+   */
+  static getShared() {
+    if (!window.ibbaTableExtractor) {
+      window.ibbaTableExtractor = new IBBATableExtractor();
+    }
+    return window.ibbaTableExtractor;
+  }
+
+  /**
+   * חילוץ אסינכרוני: מטמון → worker (מקטע גדול) → אותו thread
+   * @param {string} html - הדף המלא
+   * @param {string} kind - אחד מ-IBBATableExtractor.KINDS
+   */
+  async extract(html, kind) {
+    const spec = IBBATableExtractor.getKind(kind);
+    const fragments = spec.slice(html || '');
+    const key = `${kind}:${IBBATableExtractor.hashFragments(fragments)}`;
+
+    const cached = this.cacheGet(key);
+    if (cached) return cached;
+
+    const bytes = fragments.reduce((sum, fragment) => sum + fragment.length, 0);
+    let result = null;
+    if (this.useWorker && !this.workerFailed && bytes >= this.minWorkerBytes && this.isWorkerSupported()) {
+      try {
+        result = await this.parseInWorker(kind, fragments);
+        this.stats.workerParses++;
+      } catch (error) {
+        console.warn('⚠️ Table extractor worker failed, parsing on main thread:', error.message);
+        this.workerFailed = true;
+        this.terminate();
+      }
+    }
+    if (!result) {
+      result = spec.parse(fragments);
+      this.stats.inlineParses++;
+    }
+
+    this.cacheSet(key, result);
+    return result;
+  }
+
+  /**
+   * חילוץ סינכרוני (אותו thread, אותו מטמון)
+   */
+  extractSync(html, kind) {
+    const spec = IBBATableExtractor.getKind(kind);
+    const fragments = spec.slice(html || '');
+    const key = `${kind}:${IBBATableExtractor.hashFragments(fragments)}`;
+
+    const cached = this.cacheGet(key);
+    if (cached) return cached;
+
+    const result = spec.parse(fragments);
+    this.stats.inlineParses++;
+    this.cacheSet(key, result);
+    return result;
+  }
+
+  static getKind(kind) {
+    const spec = IBBATableExtractor.KINDS[kind];
+    if (!spec) throw new Error(`Unknown extract kind: ${kind}`);
+    return spec;
+  }
+
+  // ===============================================
+  // מטמון
+  // ===============================================
+
+  cacheGet(key) {
+    if (!this.cache.has(key)) {
+      this.stats.misses++;
+      return null;
+    }
+    const value = this.cache.get(key);
+    this.cache.delete(key);
+    this.cache.set(key, value);
+    this.stats.hits++;
+    return value;
+  }
+
+  cacheSet(key, value) {
+    this.cache.set(key, value);
+    while (this.cache.size > this.cacheSize) {
+      this.cache.delete(this.cache.keys().next().value);
+    }
+  }
+
+  clearCache() {
+    this.cache.clear();
+  }
+
+  /**
+   * FNV-1a (32 bit) על המקטעים + האורך הכולל
+   */
+  static hashFragments(fragments) {
+    let hash = 0x811c9dc5;
+    let length = 0;
+    fragments.forEach(fragment => {
+      for (let i = 0; i < fragment.length; i++) {
+        hash ^= fragment.charCodeAt(i);
+        hash = Math.imul(hash, 0x01000193);
+      }
+      hash ^= 0x1f; // מפריד בין מקטעים
+      hash = Math.imul(hash, 0x01000193);
+      length += fragment.length;
+    });
+    return `${length.toString(36)}-${(hash >>> 0).toString(36)}`;
+  }
+
+  // ===============================================
+  // Worker
+  // ===============================================
+
+  getNodeWorkerClass() {
+    if (typeof require !== 'function') return null;
+    try {
+      return require('worker_threads').Worker;
+    } catch (e) {
+      return null;
+    }
+  }
+
+  isWorkerSupported() {
+    return typeof Worker !== 'undefined' || this.getNodeWorkerClass() !== null;
+  }
+
+  /**
+   * worker אחד לכל הדף, נוצר בבקשה הראשונה ונשאר פתוח
+   */
+  getWorker() {
+    if (this.worker) return this.worker;
+
+    const onMessage = message => {
+      const request = this.pending.get(message.id);
+      if (!request) return;
+      this.pending.delete(message.id);
+      if (this.pending.size === 0 && this.worker) this.worker.idle();
+      if (message.type === 'result') request.resolve(message.result);
+      else request.reject(new Error(message.message || 'Extract failed'));
+    };
+    const onError = error => {
+      this.pending.forEach(request => request.reject(error));
+      this.pending.clear();
+    };
+
+    if (typeof Worker !== 'undefined') {
+      const worker = new Worker(this.workerUrl);
+      worker.onmessage = event => onMessage(event.data);
+      worker.onerror = event => onError(new Error(event.message || 'Worker error'));
+      this.worker = {
+        post: message => worker.postMessage(message),
+        idle: () => {},
+        terminate: () => worker.terminate()
+      };
+    } else {
+      const NodeWorker = this.getNodeWorkerClass();
+      const worker = new NodeWorker(this.workerUrl);
+      worker.on('message', onMessage);
+      worker.on('error', onError);
+      // worker בלי בקשות פתוחות לא מחזיק את התהליך
+      this.worker = {
+        post: message => {
+          worker.ref();
+          worker.postMessage(message);
+        },
+        idle: () => worker.unref(),
+        terminate: () => worker.terminate()
+      };
+    }
+    return this.worker;
+  }
+
+  parseInWorker(kind, fragments) {
+    return new Promise((resolve, reject) => {
+      const id = this.nextId++;
+      this.pending.set(id, { resolve, reject });
+      try {
+        this.getWorker().post({ type: 'extract', id, kind, fragments });
+      } catch (error) {
+        this.pending.delete(id);
+        reject(error);
+      }
+    });
+  }
+
+  terminate() {
+    if (this.worker) {
+      this.worker.terminate();
+      this.worker = null;
+    }
+    this.pending.forEach(request => request.reject(new Error('Table extractor terminated')));
+    this.pending.clear();
+  }
+
+  // ===============================================
+  // חיתוך
+  // ===============================================
+
+  /**
+   * טבלאות שתג הפתיחה שלהן עובר את acceptOpen (כולל הטבלאות המקוננות בתוכן)
+   * הערות ותוכן script/style מדולגים - '<table' בתוך מחרוזת JS אינו טבלה
+   */
+  static sliceTables(html, acceptOpen) {
+    const fragments = [];
+    const pattern = /<!--[\s\S]*?(?:-->|$)|<(script|style)\b[\s\S]*?(?:<\/\1\s*>|$)|<(\/?)table\b[^>]*>/gi;
+    let depth = 0;
+    let captureStart = -1;
+    let captureDepth = 0;
+    let match;
+    while ((match = pattern.exec(html))) {
+      if (match[0].length === 0) {
+        pattern.lastIndex++;
+        continue;
+      }
+      if (match[1] || match[0].startsWith('<!--')) continue;
+
+      if (!match[2]) {
+        if (captureStart === -1 && acceptOpen(match[0])) {
+          captureStart = match.index;
+          captureDepth = depth;
+        }
+        depth++;
+      } else if (depth > 0) {
+        depth--;
+        if (captureStart !== -1 && depth === captureDepth) {
+          fragments.push(html.slice(captureStart, pattern.lastIndex));
+          captureStart = -1;
+        }
+      }
+    }
+    if (captureStart !== -1) fragments.push(html.slice(captureStart));
+    return fragments;
+  }
+
+  /**
+   * טבלאות עם ה-class המבוקש
+   */
+  static sliceTablesByClass(html, className) {
+    const classPattern = new RegExp(`\\bclass\\s*=\\s*["']([^"']*\\s)?${className}[\\s"']`, 'i');
+    return IBBATableExtractor.sliceTables(html, openTag => classPattern.test(openTag));
+  }
+
+  /**
+   * הטבלאות (החיצוניות) שמכילות את המחרוזת marker (למשל 'data-pm=')
+   */
+  static sliceTablesContaining(html, marker) {
+    if (html.indexOf(marker) === -1) return [];
+    return IBBATableExtractor.sliceTables(html, () => true).filter(fragment => fragment.indexOf(marker) !== -1);
+  }
+
+  /**
+   * ה-<body> בלבד (בלי head, סקריפטים ו-meta שלפניו)
+   */
+  static sliceBody(html) {
+    const open = html.search(/<body\b/i);
+    if (open === -1) return [html];
+    const close = html.lastIndexOf('</body');
+    return [html.slice(open, close > open ? close : html.length)];
+  }
+
+  // ===============================================
+  // Tokenizer
+  // ===============================================
+
+  /**
+   * מעבר אחד על html: onOpen(tag, attrs, selfClosing), onClose(tag), onText(text)
+   * הערות, doctype ותוכן script/style מדולגים. טקסט מגיע אחרי פענוח entities.
+   */
+  static tokenize(html, handlers) {
+    const { onOpen, onClose, onText } = handlers;
+    const length = html.length;
+    let i = 0;
+
+    while (i < length) {
+      const lt = html.indexOf('<', i);
+      const textEnd = lt === -1 ? length : lt;
+      if (textEnd > i && onText) onText(IBBATableExtractor.decodeEntities(html.slice(i, textEnd)));
+      if (lt === -1) break;
+
+      const next = html.charCodeAt(lt + 1);
+      // <!-- הערה --> / <!DOCTYPE>
+      if (next === 33 /* ! */) {
+        if (html.startsWith('<!--', lt)) {
+          const end = html.indexOf('-->', lt + 4);
+          i = end === -1 ? length : end + 3;
+        } else {
+          const end = html.indexOf('>', lt);
+          i = end === -1 ? length : end + 1;
+        }
+        continue;
+      }
+
+      // </tag>
+      if (next === 47 /* / */) {
+        const end = html.indexOf('>', lt);
+        if (end === -1) break;
+        const tag = html.slice(lt + 2, end).trim().toLowerCase();
+        if (onClose && tag) onClose(tag);
+        i = end + 1;
+        continue;
+      }
+
+      // <tag ...> - חייב להתחיל באות
+      const isLetter = (next >= 65 && next <= 90) || (next >= 97 && next <= 122);
+      if (!isLetter) {
+        if (onText) onText('<');
+        i = lt + 1;
+        continue;
+      }
+
+      const end = IBBATableExtractor.findTagEnd(html, lt + 1);
+      const raw = html.slice(lt + 1, end === -1 ? length : end);
+      i = end === -1 ? length : end + 1;
+
+      let nameEnd = 0;
+      while (nameEnd < raw.length && !/[\s/>]/.test(raw[nameEnd])) nameEnd++;
+      const tag = raw.slice(0, nameEnd).toLowerCase();
+      const selfClosing = raw.endsWith('/') || IBBATableExtractor.VOID_TAGS.has(tag);
+
+      // תוכן script/style לא נסרק
+      if (tag === 'script' || tag === 'style') {
+        const closePattern = tag === 'script' ? /<\/script/gi : /<\/style/gi;
+        closePattern.lastIndex = i;
+        const close = closePattern.exec(html);
+        i = close ? (html.indexOf('>', close.index) + 1 || length) : length;
+        continue;
+      }
+
+      if (onOpen) onOpen(tag, IBBATableExtractor.parseAttributes(raw, nameEnd), selfClosing);
+      if (selfClosing && onClose && !IBBATableExtractor.VOID_TAGS.has(tag)) onClose(tag);
+    }
+  }
+
+  /**
+   * סוף התג (ה-'>' שמחוץ למרכאות)
+   */
+  static findTagEnd(html, from) {
+    let quote = 0;
+    for (let i = from; i < html.length; i++) {
+      const code = html.charCodeAt(i);
+      if (quote) {
+        if (code === quote) quote = 0;
+      } else if (code === 34 || code === 39) {
+        quote = code;
+      } else if (code === 62 /* > */) {
+        return i;
+      }
+    }
+    return -1;
+  }
+
+  static parseAttributes(raw, from) {
+    const attrs = {};
+    const pattern = /([^\s"'=/>]+)(?:\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+)))?/g;
+    pattern.lastIndex = from;
+    let match;
+    while ((match = pattern.exec(raw))) {
+      const value = match[2] ?? match[3] ?? match[4] ?? '';
+      attrs[match[1].toLowerCase()] = IBBATableExtractor.decodeEntities(value);
+    }
+    return attrs;
+  }
+
+  static decodeEntities(text) {
+    if (text.indexOf('&') === -1) return text;
+    return text.replace(/&(#x[0-9a-f]+|#\d+|[a-z]+\d*);/gi, (entity, body) => {
+      if (body[0] === '#') {
+        const code = body[1] === 'x' || body[1] === 'X' ? parseInt(body.slice(2), 16) : parseInt(body.slice(1), 10);
+        return Number.isFinite(code) && code > 0 && code <= 0x10ffff ? String.fromCodePoint(code) : entity;
+      }
+      const named = IBBATableExtractor.NAMED_ENTITIES[body.toLowerCase()];
+      return named !== undefined ? named : entity;
+    });
+  }
+
+  static normalizeText(text) {
+    return text.replace(/\s+/g, ' ').trim();
+  }
+
+  static hasClass(attrs, className) {
+    const value = attrs.class;
+    return !!value && ` ${value} `.replace(/\s+/g, ' ').indexOf(` ${className} `) !== -1;
+  }
+
+  // ===============================================
+  // Parse
+  // ===============================================
+
+  /**
+   * שורות הטבלה: [{ attrs, section, cells: [{ tag, attrs, text, links: [{ href, text }] }] }]
+   * td/tr בלי תג סגירה נסגרים בפתיחת התא/השורה הבאים. טבלה מקוננת נספרת כטקסט של התא.
+   */
+  static parseTableRows(fragment) {
+    const rows = [];
+    let section = 'tbody';
+    let row = null;
+    let cell = null;
+    let link = null;
+    let nested = 0;
+
+    const closeCell = () => {
+      if (!cell) return;
+      cell.text = IBBATableExtractor.normalizeText(cell.text);
+      cell.links.forEach(entry => { entry.text = IBBATableExtractor.normalizeText(entry.text); });
+      cell = null;
+      link = null;
+    };
+    const closeRow = () => {
+      closeCell();
+      row = null;
+    };
+
+    IBBATableExtractor.tokenize(fragment, {
+      onOpen: (tag, attrs) => {
+        if (tag === 'table') {
+          if (row || cell) nested++;
+          return;
+        }
+        if (nested > 0) return;
+        if (tag === 'thead' || tag === 'tbody' || tag === 'tfoot') {
+          closeRow();
+          section = tag;
+        } else if (tag === 'tr') {
+          closeRow();
+          row = { attrs, section, cells: [] };
+          rows.push(row);
+        } else if (tag === 'td' || tag === 'th') {
+          closeCell();
+          if (!row) {
+            row = { attrs: {}, section, cells: [] };
+            rows.push(row);
+          }
+          cell = { tag, attrs, text: '', links: [] };
+          row.cells.push(cell);
+        } else if (tag === 'a' && cell) {
+          link = { href: attrs.href || '', text: '' };
+          cell.links.push(link);
+        } else if (tag === 'br' && cell) {
+          cell.text += ' ';
+        }
+      },
+      onClose: tag => {
+        if (tag === 'table') {
+          if (nested > 0) nested--;
+          else closeRow();
+          return;
+        }
+        if (nested > 0) return;
+        if (tag === 'td' || tag === 'th') closeCell();
+        else if (tag === 'tr') closeRow();
+        else if (tag === 'a') link = null;
+        else if (tag === 'thead' || tag === 'tbody' || tag === 'tfoot') {
+          closeRow();
+          section = 'tbody';
+        }
+      },
+      onText: text => {
+        if (!cell) return;
+        cell.text += text;
+        if (link) link.text += text;
+      }
+    });
+    closeRow();
+    return rows;
+  }
+
+  /**
+   * .sp-league-table: תא לפי class data-*, שם הקבוצה מתוך הקישור שב-.data-name
+   */
+  static parseStandings(fragments) {
+    const standings = [];
+    fragments.forEach(fragment => {
+      IBBATableExtractor.parseTableRows(fragment).forEach(row => {
+        if (row.section !== 'tbody') return;
+        const entry = {};
+        row.cells.forEach(cell => {
+          (cell.attrs.class || '').split(/\s+/).forEach(cls => {
+            if (!cls.startsWith('data-')) return;
+            const field = cls.slice(5);
+            if (field === 'name') {
+              if (cell.links.length > 0) entry.name = cell.links[0].text;
+            } else if (!(field in entry)) {
+              entry[field] = cell.text;
+            }
+          });
+        });
+        if (entry.rank !== undefined || entry.name !== undefined) standings.push(entry);
+      });
+    });
+    return standings;
+  }
+
+  static parsePlusMinus(fragments) {
+    const players = [];
+    fragments.forEach(fragment => {
+      // רק תגי <tr> - התוכן של השורות לא נדרש
+      const pattern = /<tr\b([^>]*)>/gi;
+      let match;
+      while ((match = pattern.exec(fragment))) {
+        if (match[1].indexOf('data-pm') === -1) continue;
+        const attrs = IBBATableExtractor.parseAttributes(match[1], 0);
+        if (attrs['data-pm'] === undefined) continue;
+        players.push({ id: attrs['data-id'] || attrs['data-player'] || null, pm: attrs['data-pm'] });
+      }
+    });
+    return players;
+  }
+
+  static parsePlayerLinks(fragments) {
+    const links = [];
+    let current = null;
+    fragments.forEach(fragment => {
+      IBBATableExtractor.tokenize(fragment, {
+        onOpen: (tag, attrs) => {
+          if (tag !== 'a') return;
+          const href = attrs.href || '';
+          current = /\/players?\/\d+/.test(href) ? { href, text: '' } : null;
+          if (current) links.push(current);
+        },
+        onClose: tag => {
+          if (tag === 'a' && current) {
+            current.text = IBBATableExtractor.normalizeText(current.text);
+            current = null;
+          }
+        },
+        onText: text => {
+          if (current) current.text += text;
+        }
+      });
+    });
+    if (current) current.text = IBBATableExtractor.normalizeText(current.text);
+    return links;
+  }
+
+  /**
+   * אלמנטי שחקן (.player-card / .roster-player / [data-player-id]) והשדות שבתוכם
+   * בסדר העדיפויות של IBBAPlayerSync: שם מ-.player-name/.name/h3/h4, קבוצה מ-.team-name/.team/.club
+   */
+  static parsePlayerElements(fragments) {
+    const elements = [];
+    const isPlayer = attrs => (
+      attrs['data-player-id'] !== undefined ||
+      IBBATableExtractor.hasClass(attrs, 'player-card') ||
+      IBBATableExtractor.hasClass(attrs, 'roster-player')
+    );
+    const nameRank = (tag, attrs) => {
+      if (IBBATableExtractor.hasClass(attrs, 'player-name')) return 1;
+      if (IBBATableExtractor.hasClass(attrs, 'name')) return 2;
+      if (tag === 'h3') return 3;
+      if (tag === 'h4') return 4;
+      return 0;
+    };
+    const isTeam = attrs => ['team-name', 'team', 'club'].some(cls => IBBATableExtractor.hasClass(attrs, cls));
+
+    fragments.forEach(fragment => {
+      const stack = [];       // תגים פתוחים בתוך האלמנט הנוכחי
+      let current = null;     // { entry, nameRank }
+      let captures = [];      // { kind: 'name'|'team', depth, text, rank }
+
+      const finish = () => {
+        const entry = current.entry;
+        entry.text = IBBATableExtractor.normalizeText(entry.text);
+        const names = captures.filter(capture => capture.kind === 'name').sort((a, b) => a.rank - b.rank);
+        const team = captures.find(capture => capture.kind === 'team');
+        entry.name = names.length ? IBBATableExtractor.normalizeText(names[0].text) : null;
+        entry.team = team ? IBBATableExtractor.normalizeText(team.text) : null;
+        elements.push(entry);
+        current = null;
+        captures = [];
+      };
+
+      IBBATableExtractor.tokenize(fragment, {
+        onOpen: (tag, attrs, selfClosing) => {
+          if (!current) {
+            if (!isPlayer(attrs)) return;
+            current = { entry: { attrs, text: '', name: null, team: null, teamId: null, playerHref: null } };
+            if (selfClosing) finish();
+            else stack.push(tag);
+            return;
+          }
+
+          const entry = current.entry;
+          if (entry.teamId === null && attrs['data-team-id'] !== undefined) entry.teamId = attrs['data-team-id'];
+          if (entry.playerHref === null && tag === 'a' && /\/player\//.test(attrs.href || '')) entry.playerHref = attrs.href;
+          if (selfClosing) return;
+
+          stack.push(tag);
+          const rank = nameRank(tag, attrs);
+          if (rank) captures.push({ kind: 'name', depth: stack.length, text: '', rank });
+          if (isTeam(attrs)) captures.push({ kind: 'team', depth: stack.length, text: '' });
+        },
+        onClose: tag => {
+          if (!current) return;
+          const index = stack.lastIndexOf(tag);
+          if (index === -1) return;
+          stack.length = index;
+          captures.forEach(capture => {
+            if (capture.depth > stack.length) capture.closed = true;
+          });
+          if (stack.length === 0) finish();
+        },
+        onText: text => {
+          if (!current) return;
+          current.entry.text += text;
+          captures.forEach(capture => {
+            if (!capture.closed) capture.text += text;
+          });
+        }
+      });
+      if (current) finish();
+    });
+    return elements;
+  }
+}
+
+IBBATableExtractor.VOID_TAGS = new Set([
+  'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'source', 'track', 'wbr'
+]);
+
+IBBATableExtractor.NAMED_ENTITIES = {
+  amp: '&', lt: '<', gt: '>', quot: '"', apos: "'", nbsp: ' ', ndash: '–', mdash: '—',
+  hellip: '…', laquo: '«', raquo: '»', lsquo: '‘', rsquo: '’', ldquo: '“', rdquo: '”',
+  shy: '', lrm: '', rlm: ''
+};
+
+IBBATableExtractor.KINDS = {
+  standings: {
+    slice: html => IBBATableExtractor.sliceTablesByClass(html, 'sp-league-table').slice(0, 1),
+    parse: fragments => IBBATableExtractor.parseStandings(fragments)
+  },
+  plusMinus: {
+    slice: html => IBBATableExtractor.sliceTablesContaining(html, 'data-pm='),
+    parse: fragments => IBBATableExtractor.parsePlusMinus(fragments)
+  },
+  playerLinks: {
+    slice: html => IBBATableExtractor.sliceBody(html),
+    parse: fragments => IBBATableExtractor.parsePlayerLinks(fragments)
+  },
+  playerElements: {
+    slice: html => IBBATableExtractor.sliceBody(html),
+    parse: fragments => IBBATableExtractor.parsePlayerElements(fragments)
+  }
+};
+
+// Export for use
+if (typeof window !== 'undefined') {
+  window.IBBATableExtractor = IBBATableExtractor;
+}
+
+if (typeof module !== 'undefined' && module.exports) {
+  module.exports = IBBATableExtractor;
+}
+
+// IBBATracer: חילוץ טבלה - סוג הטבלה וגודל ה-HTML, או ב-worker
+if (typeof window !== 'undefined' && window.IBBATracer) {
+  window.IBBATracer.getShared().instrument(IBBATableExtractor.prototype, ['extract', 'extractSync', 'parseInWorker'], {
+    category: 'html',
+    attributes: (name, args) => (name === 'parseInWorker' ? { kind: args[0] } : { kind: args[1], bytes: (args[0] || '').length })
+  });
+}
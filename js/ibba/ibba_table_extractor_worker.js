@@ -0,0 +1,45 @@
+/**
+ * IBBA Table Extractor Worker
+ * פירוק מקטעי HTML (טבלאות שנחתכו ב-thread הראשי) מחוץ ל-thread הראשי - Web Worker בדפדפן, worker_threads ב-Node
+ *
+ * הודעות נכנסות:  { type: 'extract', id, kind, fragments }
+ * הודעות יוצאות:  { type: 'result', id, result, parseMs } | { type: 'error', id, message }
+ *
+ * @module IBBATableExtractorWorker
+ */
+(function() {
+  const isNode = typeof importScripts !== 'function';
+  const { parentPort } = isNode ? require('worker_threads') : {};
+
+  // המודול נרשם על window
+  globalThis.window = globalThis;
+
+  if (isNode) {
+    const fs = require('fs');
+    const path = require('path');
+    const vm = require('vm');
+    const file = path.join(__dirname, 'ibba_table_extractor.js');
+    vm.runInThisContext(fs.readFileSync(file, 'utf8'), { filename: file });
+  } else {
+    importScripts('ibba_table_extractor.js');
+  }
+
+  const post = message => (isNode ? parentPort.postMessage(message) : self.postMessage(message));
+
+  function handleMessage(message) {
+    if (message.type !== 'extract') return;
+    const startedAt = Date.now();
+    try {
+      const result = window.IBBATableExtractor.getKind(message.kind).parse(message.fragments);
+      post({ type: 'result', id: message.id, result, parseMs: Date.now() - startedAt });
+    } catch (error) {
+      post({ type: 'error', id: message.id, message: error.message });
+    }
+  }
+
+  if (isNode) {
+    parentPort.on('message', handleMessage);
+  } else {
+    self.onmessage = event => handleMessage(event.data);
+  }
+})();
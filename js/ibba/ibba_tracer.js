@@ -0,0 +1,315 @@
+/**
+ * IBBA Tracer
+ * מעקב זמנים (spans) לאורך ה-pipeline: fetch → convert → aggregate → insights → DB
+ *
+ * - כבוי כברירת מחדל: trace()/startSpan() בודקים דגל אחד ומחזירים מיד
+ * - instrument() רושם מתודות של מחלקה; העטיפה מותקנת רק בזמן enable() ומוסרת ב-disable(),
+ *   כך שכשהמעקב כבוי המתודות המקוריות רצות בלי שום שכבה
+ * - כל מודול נרשם פעם אחת בסוף הקובץ שלו (if (window.IBBATracer) ...instrument(...)):
+ *   בדף שלא טוען את ibba_tracer.js לפני המודול אין רישום בכלל, וכשהוא נטען - רק רישום, בלי עטיפה עד enable()
+ * - הפעלה: ?trace=1 ב-URL, localStorage.ibba_trace = '1', או IBBATracer.getShared().enable()
+ * - ייצוא: exportJSON() (פורמט ibba-trace) / exportChromeTrace() (chrome://tracing, Perfetto)
+ *
+ * קינון: ה-span הפתוח האחרון הוא ההורה. span אסינכרוני נשאר פתוח עד שההבטחה מסתיימת,
+ * כך שקריאות מקבילות עלולות להשתייך להורה הלא נכון - משכי הזמן עצמם תמיד מדויקים.
+ *
+ * @module IBBATracer
+ * @version 1.0.0
+ */
+class IBBATracer {
+  /**
+   * @param {Object} options - { enabled, maxSpans, now }
+   */
+  constructor(options = {}) {
+    this.enabled = false;
+    this.maxSpans = options.maxSpans || 20000;
+    this.now = options.now || (typeof performance !== 'undefined' && performance.now
+      ? () => performance.now()
+      : () => Date.now());
+
+    this.spans = [];      // spans שהסתיימו (לפי סדר הסיום)
+    this.open = [];       // spans פתוחים (ההורה של span חדש = האחרון)
+    this.dropped = 0;     // spans שלא נשמרו בגלל maxSpans
+    this.nextId = 1;
+    this.startedAt = null;
+    this.targets = [];    // מתודות רשומות ל-instrument
+
+    if (options.enabled) this.enable();
+  }
+
+  /**
+   * מופע משותף לכל המודולים בדף
+   */
+  static getShared() {
+    if (!window.ibbaTracer) {
+      window.ibbaTracer = new IBBATracer({ enabled: IBBATracer.isRequested() });
+    }
+    return window.ibbaTracer;
+  }
+
+  /**
+   * האם המעקב התבקש (?trace=1 או localStorage.ibba_trace)
+   */
+  static isRequested() {
+    try {
+      if (typeof location !== 'undefined' && /[?&]trace=1\b/.test(location.search || '')) return true;
+      if (typeof localStorage !== 'undefined' && localStorage.getItem(IBBATracer.STORAGE_KEY) === '1') return true;
+    } catch (error) {
+      // localStorage חסום (file://, מצב פרטי) - נשאר כבוי
+    }
+    return false;
+  }
+
+  isEnabled() {
+    return this.enabled;
+  }
+
+  /**
+   * @param {Object} options - { persist: לשמור ב-localStorage לטעינות הבאות }
+   */
+  enable(options = {}) {
+    if (!this.enabled) {
+      this.enabled = true;
+      this.startedAt = this.startedAt ?? Date.now();
+      this.targets.forEach(entry => this.install(entry));
+    }
+    if (options.persist) this.persist('1');
+    return this;
+  }
+
+  disable(options = {}) {
+    if (this.enabled) {
+      this.enabled = false;
+      this.targets.forEach(entry => this.uninstall(entry));
+    }
+    if (options.persist) this.persist(null);
+    return this;
+  }
+
+  persist(value) {
+    try {
+      if (value) localStorage.setItem(IBBATracer.STORAGE_KEY, value);
+      else localStorage.removeItem(IBBATracer.STORAGE_KEY);
+    } catch (error) {
+      // אין localStorage - המעקב יפעל רק בטעינה הנוכחית
+    }
+  }
+
+  clear() {
+    this.spans = [];
+    this.open = [];
+    this.dropped = 0;
+    this.startedAt = this.enabled ? Date.now() : null;
+  }
+
+  /**
+   * פתיחת span ידני - span.end(attrs) בסיום
+   * כשהמעקב כבוי מוחזר NOOP_SPAN משותף
+   */
+  startSpan(name, attrs = null, category = null) {
+    if (!this.enabled) return IBBATracer.NOOP_SPAN;
+
+    const parent = this.open[this.open.length - 1];
+    const span = {
+      id: this.nextId++,
+      parentId: parent ? parent.id : null,
+      name,
+      category: category || name.split('.')[0],
+      start: this.now(),
+      duration: null,
+      attrs: attrs || null,
+      error: null,
+      end: endAttrs => this.endSpan(span, endAttrs)
+    };
+    this.open.push(span);
+    return span;
+  }
+
+  endSpan(span, attrs = null) {
+    if (span.duration !== null) return span;
+    span.duration = this.now() - span.start;
+    if (attrs) {
+      if (attrs.error) span.error = attrs.error;
+      const { error, ...rest } = attrs;
+      if (Object.keys(rest).length > 0) span.attrs = { ...(span.attrs || {}), ...rest };
+    }
+
+    const index = this.open.lastIndexOf(span);
+    if (index >= 0) this.open.splice(index, 1);
+
+    if (this.spans.length < this.maxSpans) {
+      this.spans.push(span);
+    } else {
+      this.dropped++;
+    }
+    return span;
+  }
+
+  /**
+   * הרצת fn בתוך span (סינכרוני או אסינכרוני - span אסינכרוני נסגר כשההבטחה מסתיימת)
+   */
+  trace(name, fn, attrs = null, category = null) {
+    if (!this.enabled) return fn();
+
+    const span = this.startSpan(name, attrs, category);
+    let result;
+    try {
+      result = fn();
+    } catch (error) {
+      this.endSpan(span, { error: error?.message || String(error) });
+      throw error;
+    }
+
+    if (result && typeof result.then === 'function') {
+      return result.then(
+        value => {
+          this.endSpan(span);
+          return value;
+        },
+        error => {
+          this.endSpan(span, { error: error?.message || String(error) });
+          throw error;
+        }
+      );
+    }
+
+    this.endSpan(span);
+    return result;
+  }
+
+  /**
+   * רישום מתודות למעקב
+   * @param {Object} target - בדרך כלל Class.prototype
+   * @param {string[]|Function} methods - רשימת שמות, או predicate על שם המתודה
+   * @param {Object} options - { category, attributes: (methodName, args) => attrs }
+   */
+  instrument(target, methods, options = {}) {
+    if (!target) return null;
+
+    const names = typeof methods === 'function'
+      ? Object.getOwnPropertyNames(target).filter(name => (
+          name !== 'constructor' &&
+          typeof Object.getOwnPropertyDescriptor(target, name).value === 'function' &&
+          methods(name)
+        ))
+      : methods.filter(name => typeof target[name] === 'function');
+
+    const entry = {
+      target,
+      names,
+      category: options.category || 'app',
+      attributes: options.attributes || null,
+      originals: new Map()
+    };
+    this.targets.push(entry);
+    if (this.enabled) this.install(entry);
+    return entry;
+  }
+
+  install(entry) {
+    const tracer = this;
+    entry.names.forEach(name => {
+      if (entry.originals.has(name)) return;
+
+      const original = entry.target[name];
+      const spanName = `${entry.category}.${name}`;
+      const wrapper = function(...args) {
+        const attrs = entry.attributes ? entry.attributes(name, args) : null;
+        return tracer.trace(spanName, () => original.apply(this, args), attrs, entry.category);
+      };
+      entry.originals.set(name, original);
+      entry.target[name] = wrapper;
+    });
+  }
+
+  uninstall(entry) {
+    entry.originals.forEach((original, name) => {
+      entry.target[name] = original;
+    });
+    entry.originals.clear();
+  }
+
+  /**
+   * סיכום לפי שם span: מספר קריאות, זמן כולל / ממוצע / מקסימום, וזמן עצמי (בלי ילדים)
+   */
+  summarize() {
+    const childTime = new Map();
+    this.spans.forEach(span => {
+      if (span.parentId !== null) {
+        childTime.set(span.parentId, (childTime.get(span.parentId) || 0) + span.duration);
+      }
+    });
+
+    const byName = new Map();
+    this.spans.forEach(span => {
+      let row = byName.get(span.name);
+      if (!row) {
+        row = { name: span.name, category: span.category, count: 0, totalMs: 0, selfMs: 0, maxMs: 0, errors: 0 };
+        byName.set(span.name, row);
+      }
+      row.count++;
+      row.totalMs += span.duration;
+      row.selfMs += Math.max(0, span.duration - (childTime.get(span.id) || 0));
+      row.maxMs = Math.max(row.maxMs, span.duration);
+      if (span.error) row.errors++;
+    });
+
+    return Array.from(byName.values())
+      .map(row => ({ ...row, meanMs: row.totalMs / row.count }))
+      .sort((a, b) => b.totalMs - a.totalMs);
+  }
+
+  getSpans() {
+    return this.spans.map(({ end, ...span }) => span);
+  }
+
+  exportJSON() {
+    return {
+      format: 'ibba-trace',
+      version: 1,
+      startedAt: this.startedAt ? new Date(this.startedAt).toISOString() : null,
+      exportedAt: new Date().toISOString(),
+      dropped: this.dropped,
+      spans: this.getSpans(),
+      summary: this.summarize()
+    };
+  }
+
+  /**
+   * Trace Event Format (complete events) - נפתח ב-chrome://tracing או ב-ui.perfetto.dev
+   */
+  exportChromeTrace() {
+    return {
+      traceEvents: this.spans.map(span => ({
+        name: span.name,
+        cat: span.category,
+        ph: 'X',
+        ts: Math.round(span.start * 1000),
+        dur: Math.max(0, Math.round(span.duration * 1000)),
+        pid: 1,
+        tid: 1,
+        args: { id: span.id, parentId: span.parentId, ...(span.attrs || {}), ...(span.error ? { error: span.error } : {}) }
+      })),
+      displayTimeUnit: 'ms'
+    };
+  }
+}
+
+IBBATracer.STORAGE_KEY = 'ibba_trace';
+
+IBBATracer.NOOP_SPAN = Object.freeze({
+  id: 0,
+  parentId: null,
+  name: '',
+  duration: 0,
+  end() { return this; }
+});
+
+// Export for use
+if (typeof window !== 'undefined') {
+  window.IBBATracer = IBBATracer;
+}
+
+if (typeof module !== 'undefined' && module.exports) {
+  module.exports = IBBATracer;
+}
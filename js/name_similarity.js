@@ -0,0 +1,250 @@
+/**
+ * Name Similarity Engine
+ * מנוע דמיון שמות משותף לכלי המיזוג (שחקנים וקבוצות)
+ *
+ * - levenshteinDistance: מרחק עריכה מלא (כמו בכלים המקוריים)
+ * - boundedLevenshtein: מפסיק ברגע שהזוג כבר לא יכול להגיע לסף
+ * - NameSimilarityIndex: אינדקס n-grams (ברירת מחדל: זוגות תווים) שמצמצם את זוגות המועמדים
+ *   בלי לפספס אף זוג שעובר את הסף (מסנן אורך + מסנן ספירת q-grams)
+ *
+ * הסף מוגדר ע"י פונקציה isSimilar(distance, maxLength) - כך כל כלי שומר על הנוסחה שלו
+ * (אחוז מעוגל > 95 בשחקנים, 1 - d/L > 0.7 בקבוצות) והתוצאה זהה לסריקה המלאה.
+ */
+
+(function() {
+  'use strict';
+
+  /**
+   * Levenshtein distance (full matrix, two rows)
+   */
+  function levenshteinDistance(str1, str2) {
+    if (str1 === str2) return 0;
+    if (str1.length === 0) return str2.length;
+    if (str2.length === 0) return str1.length;
+
+    let previous = new Array(str1.length + 1);
+    let current = new Array(str1.length + 1);
+    for (let j = 0; j <= str1.length; j++) previous[j] = j;
+
+    for (let i = 1; i <= str2.length; i++) {
+      current[0] = i;
+      const code = str2.charCodeAt(i - 1);
+      for (let j = 1; j <= str1.length; j++) {
+        current[j] = code === str1.charCodeAt(j - 1)
+          ? previous[j - 1]
+          : Math.min(previous[j - 1], current[j - 1], previous[j]) + 1;
+      }
+      [previous, current] = [current, previous];
+    }
+
+    return previous[str1.length];
+  }
+
+  /**
+   * Levenshtein distance with an upper bound
+   * מחשב רק את הפס |i - j| <= maxDistance ועוצר ברגע שכל השורה מעל הגבול
+   * @returns {number} המרחק המדויק אם הוא <= maxDistance, אחרת maxDistance + 1
+   */
+  function boundedLevenshtein(str1, str2, maxDistance) {
+    const overLimit = maxDistance + 1;
+    if (maxDistance < 0) return overLimit;
+    if (str1 === str2) return 0;
+    if (Math.abs(str1.length - str2.length) > maxDistance) return overLimit;
+    if (str1.length === 0 || str2.length === 0) return Math.max(str1.length, str2.length);
+
+    let previous = new Array(str1.length + 1);
+    let current = new Array(str1.length + 1);
+    for (let j = 0; j <= str1.length; j++) previous[j] = Math.min(j, overLimit);
+
+    for (let i = 1; i <= str2.length; i++) {
+      const from = Math.max(1, i - maxDistance);
+      const to = Math.min(str1.length, i + maxDistance);
+      current[0] = Math.min(i, overLimit);
+      if (from > 1) current[from - 1] = overLimit;
+
+      const code = str2.charCodeAt(i - 1);
+      let rowMin = current[0];
+      for (let j = from; j <= to; j++) {
+        const value = code === str1.charCodeAt(j - 1)
+          ? previous[j - 1]
+          : Math.min(previous[j - 1], current[j - 1], previous[j]) + 1;
+        current[j] = value < overLimit ? value : overLimit;
+        if (current[j] < rowMin) rowMin = current[j];
+      }
+      // התא הבא מחוץ לפס - השורה הבאה תקרא אותו כ"מעל הגבול"
+      if (to < str1.length) current[to + 1] = overLimit;
+
+      if (rowMin > maxDistance) return overLimit;
+      [previous, current] = [current, previous];
+    }
+
+    return previous[str1.length];
+  }
+
+  /**
+   * המרחק המקסימלי שעדיין נחשב דומה לאורך נתון (-1 = אף מרחק לא מספיק)
+   * @param {Function} isSimilar - (distance, maxLength) => boolean, מונוטונית יורדת במרחק
+   */
+  function maxSimilarDistance(maxLength, isSimilar) {
+    let distance = -1;
+    while (distance < maxLength && isSimilar(distance + 1, maxLength)) {
+      distance++;
+    }
+    return distance;
+  }
+
+  /**
+   * אינדקס n-grams על רשימת שמות - מחזיר רק זוגות שיכולים לעבור את הסף
+   */
+  class NameSimilarityIndex {
+    /**
+     * @param {string[]} names - השמות בדיוק כפי שהם יושוו (אחרי lowercase וכו')
+     * @param {Object} options - { q: אורך ה-gram, words: לאנדקס גם מילים (3+ תווים) }
+     */
+    constructor(names, options = {}) {
+      this.names = names;
+      this.q = options.q || 2;
+      this.postings = new Map();      // gram -> length -> [index, count, index, count, ...]
+      this.lengthBuckets = new Map(); // length -> [index, ...] (עולה)
+      this.wordPostings = options.words ? new Map() : null;
+      this.counts = new Int32Array(names.length);
+
+      names.forEach((name, index) => {
+        // לפי אורך - מסנן האורך חוסך את רוב הרשימות עוד לפני הספירה
+        this.getGramCounts(name).forEach((count, gram) => {
+          if (!this.postings.has(gram)) this.postings.set(gram, new Map());
+          const byLength = this.postings.get(gram);
+          if (!byLength.has(name.length)) byLength.set(name.length, []);
+          byLength.get(name.length).push(index, count);
+        });
+
+        if (!this.lengthBuckets.has(name.length)) this.lengthBuckets.set(name.length, []);
+        this.lengthBuckets.get(name.length).push(index);
+
+        if (this.wordPostings) {
+          new Set(NameSimilarityIndex.getWords(name)).forEach(word => {
+            if (!this.wordPostings.has(word)) this.wordPostings.set(word, []);
+            this.wordPostings.get(word).push(index);
+          });
+        }
+      });
+    }
+
+    static getWords(name) {
+      return name.split(/\s+/).filter(word => word.length > 2);
+    }
+
+    getGramCounts(name) {
+      const grams = new Map();
+      for (let i = 0; i + this.q <= name.length; i++) {
+        const gram = name.substr(i, this.q);
+        grams.set(gram, (grams.get(gram) || 0) + 1);
+      }
+      return grams;
+    }
+
+    /**
+     * מועמדים להשוואה עם names[index] - רק אינדקסים גדולים ממנו, בסדר עולה
+     * (כמו לולאת j = i + 1 המקורית)
+     * @param {Object} options - {
+     *   isSimilar(distance, maxLength) - סף Levenshtein,
+     *   substrings: גם זוגות שבהם שם אחד מוכל בשני,
+     *   words: גם זוגות עם מילה משותפת (דורש words באינדקס)
+     * }
+     */
+    candidates(index, options = {}) {
+      const { isSimilar = null, substrings = false, words = false } = options;
+      const name = this.names[index];
+      const length = name.length;
+      const q = this.q;
+      const result = new Set();
+
+      const distanceCache = new Map();
+      const maxDistanceFor = maxLength => {
+        if (!distanceCache.has(maxLength)) {
+          distanceCache.set(maxLength, maxSimilarDistance(maxLength, isSimilar));
+        }
+        return distanceCache.get(maxLength);
+      };
+
+      // כמה q-grams משותפים חייבים להיות (<= 0 = המסנן לא שולל כלום, Infinity = האורך לבד פוסל)
+      const requiredForEdit = otherLength => {
+        const maxLength = Math.max(length, otherLength);
+        const maxDistance = maxDistanceFor(maxLength);
+        if (maxDistance < 0 || Math.abs(length - otherLength) > maxDistance) return Infinity;
+        return maxLength - q + 1 - maxDistance * q;
+      };
+      const requiredForSubstring = otherLength => Math.min(length, otherLength) - q + 1;
+
+      // אורכים שיכולים בכלל לעבור אחד הכללים
+      const lengths = Array.from(this.lengthBuckets.keys())
+        .filter(otherLength => substrings || (isSimilar && requiredForEdit(otherLength) !== Infinity));
+
+      // ספירת q-grams משותפים (מינימום מופעים) לכל שם אחרי index
+      const counts = this.counts;
+      const touched = [];
+      this.getGramCounts(name).forEach((count, gram) => {
+        const byLength = this.postings.get(gram);
+        for (const otherLength of lengths) {
+          const posting = byLength.get(otherLength);
+          if (!posting) continue;
+          for (let p = 0; p < posting.length; p += 2) {
+            const other = posting[p];
+            if (other <= index) continue;
+            if (counts[other] === 0) touched.push(other);
+            counts[other] += Math.min(count, posting[p + 1]);
+          }
+        }
+      });
+
+      for (const other of touched) {
+        const otherLength = this.names[other].length;
+        const common = counts[other];
+        counts[other] = 0;
+
+        if (isSimilar && common >= requiredForEdit(otherLength)) {
+          result.add(other);
+        } else if (substrings && common >= requiredForSubstring(otherLength)) {
+          result.add(other);
+        }
+      }
+
+      // שמות קצרים מדי בשביל המסנן - לפי דליי אורך
+      this.lengthBuckets.forEach((bucket, otherLength) => {
+        const includeAll = (isSimilar && requiredForEdit(otherLength) <= 0)
+          || (substrings && requiredForSubstring(otherLength) <= 0);
+        if (!includeAll) return;
+        for (const other of bucket) {
+          if (other > index) result.add(other);
+        }
+      });
+
+      if (words && this.wordPostings) {
+        NameSimilarityIndex.getWords(name).forEach(word => {
+          for (const other of this.wordPostings.get(word) || []) {
+            if (other > index) result.add(other);
+          }
+        });
+      }
+
+      return Array.from(result).sort((a, b) => a - b);
+    }
+  }
+
+  const NameSimilarity = {
+    levenshteinDistance,
+    boundedLevenshtein,
+    maxSimilarDistance,
+    createIndex: (names, options) => new NameSimilarityIndex(names, options)
+  };
+
+  // Expose to global scope
+  if (typeof window !== 'undefined') {
+    window.NameSimilarity = NameSimilarity;
+    window.NameSimilarityIndex = NameSimilarityIndex;
+  }
+
+  if (typeof module !== 'undefined' && module.exports) {
+    module.exports = { NameSimilarity, NameSimilarityIndex };
+  }
+})();
@@ -1,6 +1,7 @@
 /**
  * Player Merge Tool - Identifies and merges players with similar names
  * Similar to team merge tool but for players
+ * Requires js/name_similarity.js (loaded before this file)
  */
 
 // Global variables for detected player aliases
@@ -149,20 +150,36 @@ async function getAllPlayersFromDB() {
   }
 }
 
+// Similarity thresholds (same formula as calculateNameSimilarity: rounded percentage)
+const SAME_TEAM_JERSEY_SIMILARITY = 80;
+const HIGH_SIMILARITY = 95;
+
 /**
  * Detect player aliases (similar names)
+ * Candidate pairs come from a bigram index (NameSimilarityIndex) instead of comparing every pair -
+ * the index never drops a pair that can pass the threshold, so the groups are the same as a full scan
  */
 function detectPlayerAliases(players) {
   console.log('🔍 === Starting Player Alias Detection ===');
+  const startedAt = Date.now();
   const aliases = [];
   const processed = new Set();
+  let comparisons = 0;
+  
+  // Name/team/jersey once per player (team & jersey sort the games array)
+  const infoById = new Map();
+  const getInfo = (player) => {
+    if (!infoById.has(player)) {
+      infoById.set(player, getPlayerMatchInfo(player));
+    }
+    return infoById.get(player);
+  };
   
   // Group players by team and jersey for more efficient comparison
   const playersByTeamJersey = new Map();
   
   for (const player of players) {
-    const team = getPlayerTeam(player);
-    const jersey = getPlayerJersey(player);
+    const { team, jersey } = getInfo(player);
     const key = `${team}|${jersey}`;
     
     if (!playersByTeamJersey.has(key)) {
@@ -181,6 +198,11 @@ function detectPlayerAliases(players) {
     
     console.log(`🔍 Checking group: ${key} (${groupPlayers.length} players)`);
     
+    // Known team & jersey -> the 80% rule may apply, otherwise only 95%
+    const { team, jersey } = getInfo(groupPlayers[0]);
+    const threshold = team && jersey ? SAME_TEAM_JERSEY_SIMILARITY : HIGH_SIMILARITY;
+    const index = window.NameSimilarity.createIndex(groupPlayers.map(player => getInfo(player).name));
+    
     for (let i = 0; i < groupPlayers.length; i++) {
       const player1 = groupPlayers[i];
       
@@ -191,7 +213,7 @@ function detectPlayerAliases(players) {
       const similarPlayers = [player1];
       processed.add(player1.id);
       
-      for (let j = i + 1; j < groupPlayers.length; j++) {
+      for (const j of index.candidates(i, { isSimilar: similarityPredicate(threshold) })) {
         const player2 = groupPlayers[j];
         
         if (processed.has(player2.id)) {
@@ -199,7 +221,8 @@ function detectPlayerAliases(players) {
         }
         
         // Check if players are similar
-        if (arePlayersSimilar(player1, player2)) {
+        comparisons++;
+        if (arePlayersSimilar(player1, player2, getInfo(player1), getInfo(player2))) {
           console.log(`🔍 Similar players found: "${player1.firstNameHe} ${player1.familyNameHe}" and "${player2.firstNameHe} ${player2.familyNameHe}"`);
           similarPlayers.push(player2);
           processed.add(player2.id);
@@ -221,6 +244,9 @@ function detectPlayerAliases(players) {
   // Also check for very high name similarity across all players (for cases where team/jersey data is missing)
   console.log('🔍 Checking for high similarity matches across all players...');
   
+  const names = players.map(player => getInfo(player).name);
+  const index = window.NameSimilarity.createIndex(names);
+  
   for (let i = 0; i < players.length; i++) {
     const player1 = players[i];
     
@@ -231,7 +257,7 @@ function detectPlayerAliases(players) {
     const similarPlayers = [player1];
     processed.add(player1.id);
     
-    for (let j = i + 1; j < players.length; j++) {
+    for (const j of index.candidates(i, { isSimilar: similarityPredicate(HIGH_SIMILARITY) })) {
       const player2 = players[j];
       
       if (processed.has(player2.id)) {
@@ -239,13 +265,13 @@ function detectPlayerAliases(players) {
       }
       
       // Check for very high name similarity (95%+)
-      const name1 = `${player1.firstNameHe || ''} ${player1.familyNameHe || ''}`.trim().toLowerCase();
-      const name2 = `${player2.firstNameHe || ''} ${player2.familyNameHe || ''}`.trim().toLowerCase();
+      const name1 = names[i];
+      const name2 = names[j];
       
       if (name1 && name2) {
-        const similarity = calculateNameSimilarity(name1, name2);
-        if (similarity > 95) {
-          console.log(`🔍 Very high similarity found: "${name1}" and "${name2}" (${similarity}%)`);
+        comparisons++;
+        if (isNameSimilarityAbove(name1, name2, HIGH_SIMILARITY)) {
+          console.log(`🔍 Very high similarity found: "${name1}" and "${name2}" (${calculateNameSimilarity(name1, name2)}%)`);
           similarPlayers.push(player2);
           processed.add(player2.id);
         }
@@ -263,18 +289,28 @@ function detectPlayerAliases(players) {
     }
   }
   
+  console.log(`⏱️ Alias detection: ${players.length} players, ${comparisons} name comparisons in ${Date.now() - startedAt}ms`);
   return aliases;
 }
 
+/**
+ * Name (lowercase Hebrew), team and jersey used for alias matching
+ */
+function getPlayerMatchInfo(player) {
+  return {
+    name: `${player.firstNameHe || ''} ${player.familyNameHe || ''}`.trim().toLowerCase(),
+    team: getPlayerTeam(player),
+    jersey: getPlayerJersey(player)
+  };
+}
+
 /**
  * Check if two players are similar
  */
-function arePlayersSimilar(player1, player2) {
+function arePlayersSimilar(player1, player2, info1 = getPlayerMatchInfo(player1), info2 = getPlayerMatchInfo(player2)) {
   // Get player names
-  const name1 = `${player1.firstNameHe || ''} ${player1.familyNameHe || ''}`.trim().toLowerCase();
-  const name2 = `${player2.firstNameHe || ''} ${player2.familyNameHe || ''}`.trim().toLowerCase();
-  
-  console.log(`🔍 Comparing: "${name1}" vs "${name2}"`);
+  const name1 = info1.name;
+  const name2 = info2.name;
   
   // Skip if names are empty
   if (!name1 || !name2) {
@@ -282,37 +318,26 @@ function arePlayersSimilar(player1, player2) {
   }
   
   // Get team and jersey information from appearances or games
-  const team1 = getPlayerTeam(player1);
-  const team2 = getPlayerTeam(player2);
-  const jersey1 = getPlayerJersey(player1);
-  const jersey2 = getPlayerJersey(player2);
-  
-  console.log(`🔍 Team comparison: "${team1}" vs "${team2}"`);
-  console.log(`🔍 Jersey comparison: "${jersey1}" vs "${jersey2}"`);
+  const team1 = info1.team;
+  const team2 = info2.team;
+  const jersey1 = info1.jersey;
+  const jersey2 = info2.jersey;
   
   // Check if they have the same team and jersey (strong indicator of same player)
   const sameTeam = team1 && team2 && team1 === team2;
   const sameJersey = jersey1 && jersey2 && jersey1 === jersey2;
   
-  console.log(`🔍 Same team: ${sameTeam}, Same jersey: ${sameJersey}`);
-  
   // If same team and jersey, check name similarity
-  if (sameTeam && sameJersey) {
-    const similarity = calculateNameSimilarity(name1, name2);
-    console.log(`🔍 Name similarity: ${similarity}%`);
-    
-    // Consider similar if similarity is above 80%
-    if (similarity > 80) {
-      console.log(`✅ Players are similar (${similarity}% similarity, same team & jersey)`);
-      return true;
-    }
+  // Consider similar if similarity is above 80%
+  if (sameTeam && sameJersey && isNameSimilarityAbove(name1, name2, SAME_TEAM_JERSEY_SIMILARITY)) {
+    console.log(`✅ Players are similar (${calculateNameSimilarity(name1, name2)}% similarity, same team & jersey)`);
+    return true;
   }
   
   // Also check for very high name similarity (95%+) even without team/jersey match
   // This handles cases where team/jersey data might be missing
-  const highSimilarity = calculateNameSimilarity(name1, name2);
-  if (highSimilarity > 95) {
-    console.log(`✅ Players are similar (${highSimilarity}% similarity, very high match)`);
+  if (isNameSimilarityAbove(name1, name2, HIGH_SIMILARITY)) {
+    console.log(`✅ Players are similar (${calculateNameSimilarity(name1, name2)}% similarity, very high match)`);
     return true;
   }
   
@@ -363,7 +388,7 @@ function getPlayerJersey(player) {
  * Calculate name similarity using Levenshtein distance
  */
 function calculateNameSimilarity(name1, name2) {
-  const distance = levenshteinDistance(name1, name2);
+  const distance = window.NameSimilarity.levenshteinDistance(name1, name2);
   const maxLength = Math.max(name1.length, name2.length);
   
   if (maxLength === 0) return 100;
@@ -373,34 +398,23 @@ function calculateNameSimilarity(name1, name2) {
 }
 
 /**
- * Levenshtein distance calculation
+ * (distance, maxLength) => calculateNameSimilarity(...) > threshold
  */
-function levenshteinDistance(str1, str2) {
-  const matrix = [];
-  
-  for (let i = 0; i <= str2.length; i++) {
-    matrix[i] = [i];
-  }
-  
-  for (let j = 0; j <= str1.length; j++) {
-    matrix[0][j] = j;
-  }
-  
-  for (let i = 1; i <= str2.length; i++) {
-    for (let j = 1; j <= str1.length; j++) {
-      if (str2.charAt(i - 1) === str1.charAt(j - 1)) {
-        matrix[i][j] = matrix[i - 1][j - 1];
-      } else {
-        matrix[i][j] = Math.min(
-          matrix[i - 1][j - 1] + 1,
-          matrix[i][j - 1] + 1,
-          matrix[i - 1][j] + 1
-        );
-      }
-    }
-  }
+function similarityPredicate(threshold) {
+  return (distance, maxLength) => Math.round(((maxLength - distance) / maxLength) * 100) > threshold;
+}
+
+/**
+ * calculateNameSimilarity(name1, name2) > threshold, with a bounded Levenshtein
+ * (stops as soon as the pair can no longer reach the threshold)
+ */
+function isNameSimilarityAbove(name1, name2, threshold) {
+  const maxLength = Math.max(name1.length, name2.length);
+  if (maxLength === 0) return 100 > threshold;
   
-  return matrix[str2.length][str1.length];
+  const { maxSimilarDistance, boundedLevenshtein } = window.NameSimilarity;
+  const maxDistance = maxSimilarDistance(maxLength, similarityPredicate(threshold));
+  return boundedLevenshtein(name1, name2, maxDistance) <= maxDistance;
 }
 
 /**
@@ -707,6 +721,7 @@ async function updatePlayerInDB(player) {
     const request = store.put(player);
     
     request.onsuccess = () => {
+      window.dbAdapter?.notifyWrite?.('players', [player.id]);
       resolve(request.result);
     };
     
@@ -782,6 +797,7 @@ async function deletePlayerFromDB(playerId) {
     const request = store.delete(playerId);
     
     request.onsuccess = () => {
+      window.dbAdapter?.notifyWrite?.('players', [playerId]);
       resolve();
     };
     
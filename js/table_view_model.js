@@ -0,0 +1,264 @@
+/**
+ * Table View Model
+ * מודל תצוגה לטבלאות גדולות (שחקנים / משחקים)
+ *
+ * - TableViewModel: טוען את השורות פעם אחת (load + prepare), ומיון/סינון רצים בזיכרון.
+ *   מפתחות המיון מחושבים פעם אחת לכל שורה ושדה (לא בכל השוואה)
+ * - VirtualTableBody: מצייר רק את חלון השורות הנראה (+ overscan) בין שתי שורות ריווח,
+ *   כך שמיון טבלה של אלפי שחקנים לא בונה מחדש אלפי <tr>
+ */
+
+(function() {
+  'use strict';
+
+  const hebrewCollator = typeof Intl !== 'undefined' ? new Intl.Collator('he') : null;
+
+  function compareKeys(a, b) {
+    if (typeof a === 'string' && typeof b === 'string') {
+      return hebrewCollator ? hebrewCollator.compare(a, b) : a.localeCompare(b, 'he');
+    }
+    return a - b;
+  }
+
+  class TableViewModel {
+    /**
+     * @param {Object} options - {
+     *   load: async () => data - שליפה מה-DB (רק ב-load),
+     *   prepare: (data) => rows - חישובים קבועים לכל שורה (סטטיסטיקות, מחרוזת חיפוש...),
+     *   sortKeys: { [field]: row => key } - מפתח מספרי או מחרוזת (מחרוזות לפי סדר עברי),
+     *   defaultSortKey: row => key - לשדות שאין להם פונקציה ב-sortKeys
+     * }
+     */
+    constructor(options = {}) {
+      this.loader = options.load;
+      this.prepare = options.prepare || (data => data);
+      this.sortKeys = options.sortKeys || {};
+      this.defaultSortKey = options.defaultSortKey || null;
+
+      this.data = null;
+      this.rows = [];
+      this.loaded = false;
+      this.loadPromise = null;
+      this.keyCache = new Map(); // field -> WeakMap(row -> key)
+      this.stats = { loads: 0, queries: 0, keysComputed: 0, lastLoadMs: 0, lastQueryMs: 0 };
+    }
+
+    isLoaded() {
+      return this.loaded;
+    }
+
+    /**
+     * שליפה מחדש מה-DB (קריאות מקבילות מקבלות את אותה הבטחה)
+     */
+    load() {
+      if (this.loadPromise) return this.loadPromise;
+
+      const startedAt = Date.now();
+      this.loadPromise = (async () => {
+        const data = await this.loader();
+        this.data = data;
+        this.rows = this.prepare(data) || [];
+        this.keyCache.clear();
+        this.loaded = true;
+        this.stats.loads++;
+        this.stats.lastLoadMs = Date.now() - startedAt;
+        return this.rows;
+      })();
+
+      return this.loadPromise.finally(() => {
+        this.loadPromise = null;
+      });
+    }
+
+    async ensureLoaded() {
+      if (!this.loaded) await this.load();
+      return this.rows;
+    }
+
+    /**
+     * הנתונים השתנו - הטעינה הבאה תשלוף מחדש
+     */
+    invalidate() {
+      this.loaded = false;
+      this.data = null;
+      this.rows = [];
+      this.keyCache.clear();
+    }
+
+    getSortKey(row, field) {
+      let cache = this.keyCache.get(field);
+      if (!cache) {
+        cache = new WeakMap();
+        this.keyCache.set(field, cache);
+      }
+      if (cache.has(row)) return cache.get(row);
+
+      const keyOf = this.sortKeys[field] || this.defaultSortKey || (r => r[field]);
+      const key = keyOf(row, field);
+      cache.set(row, key);
+      this.stats.keysComputed++;
+      return key;
+    }
+
+    /**
+     * סינון + מיון בזיכרון
+     * @param {Object} options - {
+     *   filter: row => boolean,
+     *   derive: rows => rows - שלב נוסף אחרי הסינון (למשל איחוד כפילויות),
+     *   sortField, sortDirection ('asc' | 'desc')
+     * }
+     * @returns {Array} שורות לתצוגה (מיון יציב - כמו Array.sort עם השוואה ישירה)
+     */
+    query(options = {}) {
+      const { filter = null, derive = null, sortField = null, sortDirection = 'asc' } = options;
+      const startedAt = Date.now();
+
+      let rows = filter ? this.rows.filter(filter) : this.rows.slice();
+      if (derive) rows = derive(rows);
+
+      if (sortField) {
+        const keys = rows.map(row => this.getSortKey(row, sortField));
+        const order = rows.map((_, index) => index);
+        const direction = sortDirection === 'asc' ? 1 : -1;
+        order.sort((a, b) => direction === 1 ? compareKeys(keys[a], keys[b]) : compareKeys(keys[b], keys[a]));
+        rows = order.map(index => rows[index]);
+      }
+
+      this.stats.queries++;
+      this.stats.lastQueryMs = Date.now() - startedAt;
+      return rows;
+    }
+  }
+
+  class VirtualTableBody {
+    /**
+     * @param {HTMLElement} tbody
+     * @param {Object} options - {
+     *   renderRow: row => '<tr>...</tr>',
+     *   columns: מספר עמודות (לשורות הריווח),
+     *   rowHeight: הערכה ראשונית (נמדדת מחדש אחרי הציור הראשון),
+     *   overscan: שורות נוספות מעל ומתחת לחלון,
+     *   threshold: עד כמה שורות מציירים הכל בלי וירטואליזציה
+     * }
+     */
+    constructor(tbody, options = {}) {
+      this.tbody = tbody;
+      this.renderRow = options.renderRow;
+      this.columns = options.columns || 1;
+      this.rowHeight = options.rowHeight || 37;
+      this.overscan = options.overscan ?? 15;
+      this.threshold = options.threshold ?? 200;
+
+      this.rows = [];
+      this.range = null;
+      this.frame = null;
+      this.measured = false;
+      this.onScroll = () => this.scheduleRender();
+
+      // capture - גלילה של החלון או של כל מיכל עוטף
+      window.addEventListener('scroll', this.onScroll, true);
+      window.addEventListener('resize', this.onScroll);
+    }
+
+    /**
+     * טווח השורות לציור
+     * @param {Object} viewport - { count, rowHeight, overscan, offsetTop (ראש ה-tbody ביחס לראש החלון הנראה), viewportHeight }
+     * @returns {{start: number, end: number}} end לא כולל
+     */
+    static computeRange({ count, rowHeight, overscan, offsetTop, viewportHeight }) {
+      // אחרי סוף הטבלה (למשל גלילה לפני ציור מחדש) - לפחות השורה האחרונה
+      const firstVisible = Math.min(Math.floor(-offsetTop / rowHeight), count - 1);
+      const lastVisible = Math.max(Math.ceil((viewportHeight - offsetTop) / rowHeight), firstVisible + 1);
+      const start = Math.max(0, firstVisible - overscan);
+      const end = Math.max(start, Math.min(count, lastVisible + overscan));
+      return { start, end };
+    }
+
+    setRows(rows) {
+      this.rows = rows;
+      this.range = null;
+      this.render();
+    }
+
+    scheduleRender() {
+      if (this.frame || this.rows.length <= this.threshold) return;
+      const schedule = typeof requestAnimationFrame === 'function' ? requestAnimationFrame : fn => setTimeout(fn, 16);
+      this.frame = schedule(() => {
+        this.frame = null;
+        this.render();
+      });
+    }
+
+    getViewport() {
+      const tbodyTop = this.tbody.getBoundingClientRect().top;
+      let container = this.tbody.parentElement;
+      while (container && container !== document.body) {
+        const overflowY = getComputedStyle(container).overflowY;
+        if ((overflowY === 'auto' || overflowY === 'scroll') && container.scrollHeight > container.clientHeight) {
+          const containerTop = container.getBoundingClientRect().top;
+          return { offsetTop: tbodyTop - containerTop, viewportHeight: container.clientHeight };
+        }
+        container = container.parentElement;
+      }
+      return { offsetTop: tbodyTop, viewportHeight: window.innerHeight };
+    }
+
+    spacer(height, position) {
+      return `<tr class="virtual-spacer" data-spacer="${position}" aria-hidden="true"><td colspan="${this.columns}" style="height:${height}px;padding:0;border:0"></td></tr>`;
+    }
+
+    render() {
+      const count = this.rows.length;
+
+      if (count <= this.threshold) {
+        this.range = { start: 0, end: count };
+        this.tbody.innerHTML = this.rows.map(row => this.renderRow(row)).join('');
+        return;
+      }
+
+      const range = VirtualTableBody.computeRange({
+        count,
+        rowHeight: this.rowHeight,
+        overscan: this.overscan,
+        ...this.getViewport()
+      });
+      if (this.range && this.range.start === range.start && this.range.end === range.end) return;
+      this.range = range;
+
+      const html = [];
+      if (range.start > 0) html.push(this.spacer(range.start * this.rowHeight, 'top'));
+      for (let i = range.start; i < range.end; i++) {
+        html.push(this.renderRow(this.rows[i]));
+      }
+      if (range.end < count) html.push(this.spacer((count - range.end) * this.rowHeight, 'bottom'));
+      this.tbody.innerHTML = html.join('');
+
+      // גובה שורה אמיתי - פעם אחת, ואז ציור מחדש עם הגובה הנכון
+      if (!this.measured) {
+        const sample = this.tbody.querySelector('tr:not(.virtual-spacer)');
+        const height = sample ? sample.getBoundingClientRect().height : 0;
+        this.measured = true;
+        if (height > 0 && Math.abs(height - this.rowHeight) > 0.5) {
+          this.rowHeight = height;
+          this.range = null;
+          this.render();
+        }
+      }
+    }
+
+    destroy() {
+      window.removeEventListener('scroll', this.onScroll, true);
+      window.removeEventListener('resize', this.onScroll);
+    }
+  }
+
+  // Expose to global scope
+  if (typeof window !== 'undefined') {
+    window.TableViewModel = TableViewModel;
+    window.VirtualTableBody = VirtualTableBody;
+  }
+
+  if (typeof module !== 'undefined' && module.exports) {
+    module.exports = { TableViewModel, VirtualTableBody };
+  }
+})();
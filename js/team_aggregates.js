@@ -0,0 +1,424 @@
+/**
+ * Team Aggregates
+ * סכומי קבוצה מוכנים מראש להכנת משחק (loadTeamAverages) - במקום סריקת כל השחקנים והמשחקים בכל ניתוח
+ *
+ * - team_game_totals: שורה לכל (משחק, קבוצה) - סכומי הקבוצה במשחק + הנקודות של היריבה
+ * - team_aggregates: שורה לכל קבוצה - סכומי עונה + מאזן בית/חוץ (מה שהכנת המשחק קוראת)
+ * - Supabase: הטבלאות מתעדכנות ב-Edge Functions (save-game / delete-game) דרך add_team_aggregates.sql
+ * - TeamAggregateStore: העותק המקומי (IndexedDB נפרד, או זיכרון כשאין IndexedDB) -
+ *   ב-IndexedDB mode הוא מקור האמת ומתעדכן במצטבר (מחסרים את המשחק הישן ומוסיפים את החדש)
+ * - fromPlayers + diff: חישוב מלא מ-players.games (אותם כללים כמו getTeamsAggregate + calculateHomeAwayStats)
+ *   לבדיקת עקביות מול הטבלה
+ */
+
+(function() {
+  'use strict';
+
+  // שדה במשחק של שחקן → עמודה בסכומי הקבוצה
+  const STAT_FIELDS = [
+    ['points', 'points'],
+    ['rebounds', 'rebounds'],
+    ['assists', 'assists'],
+    ['steals', 'steals'],
+    ['blocks', 'blocks'],
+    ['turnovers', 'turnovers'],
+    ['fouls', 'fouls'],
+    ['fieldGoalsMade', 'fgm'],
+    ['fieldGoalsAttempted', 'fga'],
+    ['threePointsMade', 'tpm'],
+    ['threePointsAttempted', 'tpa'],
+    ['freeThrowsMade', 'ftm'],
+    ['freeThrowsAttempted', 'fta'],
+    ['efficiency', 'efficiency']
+  ];
+
+  const RECORD_FIELDS = [
+    'homeWins', 'homeLosses', 'awayWins', 'awayLosses',
+    'homeWinMarginSum', 'homeLossMarginSum', 'awayWinMarginSum', 'awayLossMarginSum'
+  ];
+
+  const AGGREGATE_FIELDS = ['games', ...STAT_FIELDS.map(([, column]) => column), ...RECORD_FIELDS];
+
+  /**
+   * שורות team_game_totals של משחק אחד
+   * @param {number} gameSerial
+   * @param {Array} teams - games.teams (teams[0] = בית, teams[1] = חוץ)
+   * @param {Array} playerGames - הרשומות של המשחק הזה מתוך players[].games
+   */
+  function buildGameTotals(gameSerial, teams, playerGames) {
+    const byTeam = new Map();
+    for (const line of playerGames) {
+      if (!line || !line.team) continue;
+      if (!byTeam.has(line.team)) {
+        const row = { gameSerial: Number(gameSerial), team: line.team };
+        STAT_FIELDS.forEach(([, column]) => { row[column] = 0; });
+        byTeam.set(line.team, row);
+      }
+      const row = byTeam.get(line.team);
+      STAT_FIELDS.forEach(([field, column]) => { row[column] += Number(line[field]) || 0; });
+    }
+
+    const gameTeams = teams || [];
+    return Array.from(byTeam.values()).map(row => {
+      const index = gameTeams.indexOf(row.team);
+      const opponent = index === 0 || index === 1 ? byTeam.get(gameTeams[1 - index]) : null;
+      return {
+        ...row,
+        isHome: index === 0 ? true : index === 1 ? false : null,
+        opponentPoints: opponent ? opponent.points : 0
+      };
+    });
+  }
+
+  /**
+   * הרשומות של משחק אחד מתוך רשימת שחקנים
+   */
+  function collectGameLines(players, gameSerial) {
+    const lines = [];
+    for (const player of players || []) {
+      for (const line of (player.games || [])) {
+        if (String(line.gameId) === String(gameSerial)) lines.push(line);
+      }
+    }
+    return lines;
+  }
+
+  function emptyAggregate(team) {
+    const aggregate = { team };
+    AGGREGATE_FIELDS.forEach(field => { aggregate[field] = 0; });
+    return aggregate;
+  }
+
+  /**
+   * הוספה (sign = 1) או הסרה (sign = -1) של שורות משחק מהסכומים - מעדכן את byTeam במקום
+   * קבוצה שנשארה בלי משחקים נמחקת
+   */
+  function applyGameTotals(byTeam, rows, sign = 1) {
+    for (const row of rows) {
+      if (!byTeam.has(row.team)) byTeam.set(row.team, emptyAggregate(row.team));
+      const aggregate = byTeam.get(row.team);
+
+      aggregate.games += sign;
+      STAT_FIELDS.forEach(([, column]) => { aggregate[column] += sign * (Number(row[column]) || 0); });
+
+      if (row.isHome === true || row.isHome === false) {
+        const side = row.isHome ? 'home' : 'away';
+        const margin = (Number(row.points) || 0) - (Number(row.opponentPoints) || 0);
+        if (margin > 0) {
+          aggregate[`${side}Wins`] += sign;
+          aggregate[`${side}WinMarginSum`] += sign * margin;
+        } else if (margin < 0) {
+          aggregate[`${side}Losses`] += sign;
+          aggregate[`${side}LossMarginSum`] += sign * -margin;
+        }
+      }
+
+      if (aggregate.games <= 0) byTeam.delete(row.team);
+    }
+    return byTeam;
+  }
+
+  function summarize(gameTotals) {
+    const byTeam = applyGameTotals(new Map(), gameTotals, 1);
+    return sortByTeam(Array.from(byTeam.values()));
+  }
+
+  function sortByTeam(rows) {
+    return rows.sort((a, b) => a.team.localeCompare(b.team, 'he'));
+  }
+
+  /**
+   * חישוב מלא מ-players.games (+ games.teams לבית/חוץ)
+   * @returns {{ gameTotals: Array, aggregates: Array }}
+   */
+  function fromPlayers(players, games) {
+    const teamsByGame = new Map((games || []).map(game => [String(game.gameSerial), game.teams || []]));
+    const linesByGame = new Map();
+    for (const player of players || []) {
+      for (const line of (player.games || [])) {
+        const key = String(line.gameId);
+        if (!linesByGame.has(key)) linesByGame.set(key, []);
+        linesByGame.get(key).push(line);
+      }
+    }
+
+    const gameTotals = [];
+    linesByGame.forEach((lines, key) => {
+      if (!/^\d+$/.test(key)) return;
+      buildGameTotals(Number(key), teamsByGame.get(key) || [], lines).forEach(row => gameTotals.push(row));
+    });
+    return { gameTotals, aggregates: summarize(gameTotals) };
+  }
+
+  /**
+   * השוואת הטבלה השמורה לחישוב מלא
+   * @returns {Array} [{ team, field, stored, expected }] - ריק אם עקבי
+   */
+  function diff(stored, expected, tolerance = 1e-6) {
+    const storedByTeam = new Map((stored || []).map(row => [row.team, row]));
+    const expectedByTeam = new Map((expected || []).map(row => [row.team, row]));
+    const teams = new Set([...storedByTeam.keys(), ...expectedByTeam.keys()]);
+    const mismatches = [];
+
+    teams.forEach(team => {
+      const storedRow = storedByTeam.get(team) || emptyAggregate(team);
+      const expectedRow = expectedByTeam.get(team) || emptyAggregate(team);
+      AGGREGATE_FIELDS.forEach(field => {
+        const storedValue = Number(storedRow[field]) || 0;
+        const expectedValue = Number(expectedRow[field]) || 0;
+        if (Math.abs(storedValue - expectedValue) > tolerance) {
+          mismatches.push({ team, field, stored: storedValue, expected: expectedValue });
+        }
+      });
+    });
+    return mismatches;
+  }
+
+  /**
+   * שורת team_aggregates → אותו מבנה שמחזירה getTeamsAggregate
+   */
+  function toTeamsAggregateRow(aggregate) {
+    const t = {};
+    AGGREGATE_FIELDS.forEach(field => { t[field] = Number(aggregate[field]) || 0; });
+    const gameCount = t.games;
+
+    return {
+      team: aggregate.team,
+      games: gameCount,
+      // Totals
+      totalPoints: t.points,
+      totalRebounds: t.rebounds,
+      totalAssists: t.assists,
+      totalSteals: t.steals,
+      totalBlocks: t.blocks,
+      totalTurnovers: t.turnovers,
+      totalFouls: t.fouls,
+      totalEfficiency: t.efficiency,
+      // Averages
+      avgPoints: gameCount ? t.points / gameCount : 0,
+      avgRebounds: gameCount ? t.rebounds / gameCount : 0,
+      avgAssists: gameCount ? t.assists / gameCount : 0,
+      avgSteals: gameCount ? t.steals / gameCount : 0,
+      avgBlocks: gameCount ? t.blocks / gameCount : 0,
+      avgTurnovers: gameCount ? t.turnovers / gameCount : 0,
+      avgFouls: gameCount ? t.fouls / gameCount : 0,
+      avgEfficiency: gameCount ? t.efficiency / gameCount : 0,
+      // Shooting stats
+      fgm: t.fgm, fga: t.fga,
+      tpm: t.tpm, tpa: t.tpa,
+      ftm: t.ftm, fta: t.fta,
+      // Percentages
+      fgPercentage: t.fga > 0 ? (t.fgm / t.fga) * 100 : 0,
+      threePointPercentage: t.tpa > 0 ? (t.tpm / t.tpa) * 100 : 0,
+      ftPercentage: t.fta > 0 ? (t.ftm / t.fta) * 100 : 0,
+      // Backward compatibility
+      points: t.points,
+      rebounds: t.rebounds,
+      assists: t.assists,
+      steals: t.steals,
+      blocks: t.blocks,
+      turnovers: t.turnovers,
+      fouls: t.fouls,
+      efficiency: t.efficiency
+    };
+  }
+
+  /**
+   * שורת team_aggregates → אותו מבנה שמחזירה calculateHomeAwayStats
+   */
+  function toHomeAwayStats(aggregate, isHomeTeam) {
+    const value = field => Number(aggregate?.[field]) || 0;
+    const side = isHomeTeam ? 'home' : 'away';
+    const wins = value(`${side}Wins`);
+    const losses = value(`${side}Losses`);
+
+    return {
+      homeWins: value('homeWins'),
+      homeLosses: value('homeLosses'),
+      awayWins: value('awayWins'),
+      awayLosses: value('awayLosses'),
+      avgWinMargin: wins > 0 ? value(`${side}WinMarginSum`) / wins : 0,
+      avgLossMargin: losses > 0 ? value(`${side}LossMarginSum`) / losses : 0
+    };
+  }
+
+  // ===============================================
+  // העותק המקומי
+  // ===============================================
+
+  class TeamAggregateStore {
+    /**
+     * @param {Object} options - { dbName, storage: true = זיכרון בלבד (בדיקות / אין IndexedDB) }
+     */
+    constructor(options = {}) {
+      this.dbName = options.dbName || 'BasketballStatsTeamAggregates';
+      this.dbVersion = 1;
+      this.memory = options.storage || typeof indexedDB === 'undefined'
+        ? { gameTotals: new Map(), aggregates: new Map() }
+        : null;
+      this.db = null;
+      this.openPromise = null;
+    }
+
+    async open() {
+      if (this.memory || this.db) return;
+      if (!this.openPromise) {
+        this.openPromise = new Promise((resolve, reject) => {
+          const request = indexedDB.open(this.dbName, this.dbVersion);
+          request.onupgradeneeded = (e) => {
+            const db = e.target.result;
+            if (!db.objectStoreNames.contains('gameTotals')) {
+              const store = db.createObjectStore('gameTotals', { keyPath: 'key' });
+              store.createIndex('gameSerial', 'gameSerial', { unique: false });
+            }
+            if (!db.objectStoreNames.contains('aggregates')) {
+              db.createObjectStore('aggregates', { keyPath: 'team' });
+            }
+          };
+          request.onsuccess = (e) => resolve(e.target.result);
+          request.onerror = () => reject(new Error(`Cannot open ${this.dbName}`));
+        }).then(db => { this.db = db; });
+      }
+      await this.openPromise;
+    }
+
+    async getAll() {
+      await this.open();
+      if (this.memory) return sortByTeam(Array.from(this.memory.aggregates.values()).map(row => ({ ...row })));
+
+      return new Promise((resolve, reject) => {
+        const request = this.db.transaction(['aggregates'], 'readonly').objectStore('aggregates').getAll();
+        request.onsuccess = () => resolve(sortByTeam(request.result || []));
+        request.onerror = () => reject(request.error);
+      });
+    }
+
+    async get(team) {
+      await this.open();
+      if (this.memory) {
+        const row = this.memory.aggregates.get(team);
+        return row ? { ...row } : null;
+      }
+
+      return new Promise((resolve, reject) => {
+        const request = this.db.transaction(['aggregates'], 'readonly').objectStore('aggregates').get(team);
+        request.onsuccess = () => resolve(request.result || null);
+        request.onerror = () => reject(request.error);
+      });
+    }
+
+    /**
+     * שמירת משחק (חדש או עדכון): מחסר את השורות הקודמות של המשחק ומוסיף את החדשות
+     */
+    async applyGame(gameSerial, rows) {
+      return this.updateGame(gameSerial, rows);
+    }
+
+    async removeGame(gameSerial) {
+      return this.updateGame(gameSerial, []);
+    }
+
+    async updateGame(gameSerial, rows) {
+      await this.open();
+      const serial = Number(gameSerial);
+
+      if (this.memory) {
+        const previous = Array.from(this.memory.gameTotals.values()).filter(row => row.gameSerial === serial);
+        applyGameTotals(this.memory.aggregates, previous, -1);
+        previous.forEach(row => this.memory.gameTotals.delete(`${row.gameSerial}:${row.team}`));
+        applyGameTotals(this.memory.aggregates, rows, 1);
+        rows.forEach(row => this.memory.gameTotals.set(`${serial}:${row.team}`, { ...row, gameSerial: serial }));
+        return;
+      }
+
+      // טרנזקציה אחת: קריאת השורות הקודמות והקבוצות שלהן, ואז כתיבה
+      await new Promise((resolve, reject) => {
+        const tx = this.db.transaction(['gameTotals', 'aggregates'], 'readwrite');
+        const totalsStore = tx.objectStore('gameTotals');
+        const aggregatesStore = tx.objectStore('aggregates');
+
+        const previousRequest = totalsStore.index('gameSerial').getAll(serial);
+        previousRequest.onsuccess = () => {
+          const previous = previousRequest.result || [];
+          const teams = [...new Set([...previous, ...rows].map(row => row.team))];
+          const byTeam = new Map();
+          let pending = teams.length;
+
+          const write = () => {
+            applyGameTotals(byTeam, previous, -1);
+            applyGameTotals(byTeam, rows, 1);
+            previous.forEach(row => totalsStore.delete(row.key));
+            rows.forEach(row => totalsStore.put({ ...row, gameSerial: serial, key: `${serial}:${row.team}` }));
+            teams.forEach(team => {
+              if (byTeam.has(team)) aggregatesStore.put(byTeam.get(team));
+              else aggregatesStore.delete(team);
+            });
+          };
+
+          if (pending === 0) return write();
+          teams.forEach(team => {
+            const request = aggregatesStore.get(team);
+            request.onsuccess = () => {
+              if (request.result) byTeam.set(team, request.result);
+              if (--pending === 0) write();
+            };
+          });
+        };
+
+        tx.oncomplete = () => resolve();
+        tx.onerror = () => reject(tx.error);
+        tx.onabort = () => reject(tx.error || new Error('Team aggregates transaction aborted'));
+      });
+    }
+
+    /**
+     * החלפת כל העותק (אחרי חישוב מלא, או סנכרון מ-Supabase - שם gameTotals לא נשמרות מקומית)
+     */
+    async replaceAll(aggregates, gameTotals = []) {
+      await this.open();
+
+      if (this.memory) {
+        this.memory.aggregates = new Map(aggregates.map(row => [row.team, { ...row }]));
+        this.memory.gameTotals = new Map(gameTotals.map(row => [`${row.gameSerial}:${row.team}`, { ...row }]));
+        return;
+      }
+
+      await new Promise((resolve, reject) => {
+        const tx = this.db.transaction(['gameTotals', 'aggregates'], 'readwrite');
+        const totalsStore = tx.objectStore('gameTotals');
+        const aggregatesStore = tx.objectStore('aggregates');
+        totalsStore.clear();
+        aggregatesStore.clear();
+        gameTotals.forEach(row => totalsStore.put({ ...row, key: `${row.gameSerial}:${row.team}` }));
+        aggregates.forEach(row => aggregatesStore.put(row));
+        tx.oncomplete = () => resolve();
+        tx.onerror = () => reject(tx.error);
+      });
+    }
+  }
+
+  const TeamAggregates = {
+    STAT_FIELDS,
+    RECORD_FIELDS,
+    AGGREGATE_FIELDS,
+    buildGameTotals,
+    collectGameLines,
+    emptyAggregate,
+    applyGameTotals,
+    summarize,
+    fromPlayers,
+    diff,
+    toTeamsAggregateRow,
+    toHomeAwayStats,
+    TeamAggregateStore
+  };
+
+  // Expose to global scope
+  if (typeof window !== 'undefined') {
+    window.TeamAggregates = TeamAggregates;
+  }
+
+  if (typeof module !== 'undefined' && module.exports) {
+    module.exports = TeamAggregates;
+  }
+})();
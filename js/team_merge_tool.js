@@ -1,5 +1,6 @@
 // =========================
 // Team Merge / Migration Tool
+// Requires js/name_similarity.js (loaded before this file)
 // =========================
 
 (function() {
@@ -171,11 +172,18 @@
     });
   }
 
+  // Levenshtein rule of areTeamsSimilar: 1 - distance / maxLength > 0.7
+  const isSpellingSimilar = (distance, maxLength) => 1 - (distance / maxLength) > 0.7;
+
   // Detect team aliases using similarity algorithms
+  // Only pairs that share a bigram/word in the shared NameSimilarityIndex are compared -
+  // the index keeps every pair that can pass one of the areTeamsSimilar rules
   function detectTeamAliases(teams) {
     console.log(`🔍 Starting alias detection for ${teams.length} teams`);
     const aliases = [];
     const processed = new Set();
+    const index = window.NameSimilarity.createIndex(teams.map(getTeamCompareName), { words: true });
+    const candidateOptions = { isSimilar: isSpellingSimilar, substrings: true, words: true };
 
     for (let i = 0; i < teams.length; i++) {
       if (processed.has(i)) continue;
@@ -183,14 +191,14 @@
       const team1 = teams[i];
       const similarTeams = [team1];
 
-      for (let j = i + 1; j < teams.length; j++) {
+      for (const j of index.candidates(i, candidateOptions)) {
         if (processed.has(j)) continue;
 
         const team2 = teams[j];
         
         // Check if teams are similar AND different (not the same team)
         const isSimilar = areTeamsSimilar(team1, team2);
-        const isDifferent = areTeamsDifferent(team1, team2);
+        const isDifferent = isSimilar && areTeamsDifferent(team1, team2);
         
         if (isSimilar && isDifferent) {
           console.log(`✅ Adding to aliases: "${team1.name_he || team1.name_en}" + "${team2.name_he || team2.name_en}"`);
@@ -221,10 +229,15 @@
     return aliases;
   }
 
+  // Name used by areTeamsSimilar
+  function getTeamCompareName(team) {
+    return (team.name_he || team.name_en || '').toLowerCase();
+  }
+
   // Check if two teams are similar
   function areTeamsSimilar(team1, team2) {
-    const name1 = (team1.name_he || team1.name_en || '').toLowerCase();
-    const name2 = (team2.name_he || team2.name_en || '').toLowerCase();
+    const name1 = getTeamCompareName(team1);
+    const name2 = getTeamCompareName(team2);
 
     // Exact match
     if (name1 === name2) return true;
@@ -246,13 +259,14 @@
       return true;
     }
 
-    // Check for Levenshtein distance (similar spelling)
-    const distance = levenshteinDistance(name1, name2);
+    // Check for Levenshtein distance (similar spelling) - bounded, gives up past the 70% threshold
+    const { maxSimilarDistance, boundedLevenshtein, levenshteinDistance } = window.NameSimilarity;
     const maxLength = Math.max(name1.length, name2.length);
-    const similarity = 1 - (distance / maxLength);
+    const maxDistance = maxSimilarDistance(maxLength, isSpellingSimilar);
+    const isSimilar = boundedLevenshtein(name1, name2, maxDistance) <= maxDistance;
     
-    const isSimilar = similarity > 0.7; // 70% similarity threshold
     if (isSimilar) {
+      const similarity = 1 - (levenshteinDistance(name1, name2) / maxLength);
       console.log(`✅ SIMILAR: "${name1}" vs "${name2}" - High similarity: ${(similarity * 100).toFixed(1)}%`);
     }
     
@@ -318,35 +332,6 @@
     return result;
   }
 
-  // Calculate Levenshtein distance between two strings
-  function levenshteinDistance(str1, str2) {
-    const matrix = [];
-
-    for (let i = 0; i <= str2.length; i++) {
-      matrix[i] = [i];
-    }
-
-    for (let j = 0; j <= str1.length; j++) {
-      matrix[0][j] = j;
-    }
-
-    for (let i = 1; i <= str2.length; i++) {
-      for (let j = 1; j <= str1.length; j++) {
-        if (str2.charAt(i - 1) === str1.charAt(j - 1)) {
-          matrix[i][j] = matrix[i - 1][j - 1];
-        } else {
-          matrix[i][j] = Math.min(
-            matrix[i - 1][j - 1] + 1,
-            matrix[i][j - 1] + 1,
-            matrix[i - 1][j] + 1
-          );
-        }
-      }
-    }
-
-    return matrix[str2.length][str1.length];
-  }
-
   // Display team aliases in the UI
   function displayTeamAliases(aliases) {
     const tbody = document.getElementById('teamAliasesTableBody');
@@ -516,6 +501,7 @@
         const cursor = e.target.result;
         if (!cursor) {
           console.log(`✅ Updated team names in ${updatedCount} player records`);
+          window.dbAdapter?.notifyWrite?.('players');
           resolve();
           return;
         }
@@ -788,7 +774,10 @@
         });
       });
 
-      Promise.all(promises).then(resolve).catch(reject);
+      Promise.all(promises).then(() => {
+        window.dbAdapter?.notifyWrite?.('teams', aliasTeams.map(aliasTeam => aliasTeam.team_id));
+        resolve();
+      }).catch(reject);
     });
   }
 
@@ -885,6 +874,7 @@
             if (unmatchedTeams.size > 0) {
               console.log(`⚠️ Unmatched teams (${unmatchedTeams.size}):`, Array.from(unmatchedTeams).sort());
             }
+            window.dbAdapter?.notifyWrite?.('players');
             resolve();
             return;
           }
@@ -1059,6 +1049,7 @@
   window.scanTeamAliases = scanTeamAliases;
   window.executeTeamMerges = executeTeamMerges;
   window.fixTeamNamesInPlayerGames = fixTeamNamesInPlayerGames;
+  window.detectTeamAliases = detectTeamAliases;
 
   // Auto-initialize when DOM is ready
   if (document.readyState === 'loading') {
@@ -146,8 +146,14 @@ serve(async (req) => {
 
     console.log(`✅ Game ${gameSerial} deleted successfully`)
 
+    // Step 4: Remove the game from team_game_totals and refresh its teams' team_aggregates
+    const { error: aggregatesError } = await supabase.rpc('remove_team_game_totals', { p_game_serial: gameSerial })
+    if (aggregatesError) {
+      console.error('⚠️ Team aggregates update error:', aggregatesError)
+    }
+
     return new Response(
-      JSON.stringify({ success: true, gameSerial, playersUpdated: updatedPlayersCount }),
+      JSON.stringify({ success: true, gameSerial, playersUpdated: updatedPlayersCount, teamAggregatesUpdated: !aggregatesError }),
       { 
         status: 200, 
         headers: { 'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*' }
@@ -1,27 +1,87 @@
 import { serve } from 'https://deno.land/std@0.168.0/http/server.ts'
 import { createClient } from 'https://esm.sh/@supabase/supabase-js@2'
 
+const corsHeaders = {
+  'Access-Control-Allow-Origin': '*',
+  'Access-Control-Allow-Methods': 'POST, OPTIONS',
+  'Access-Control-Allow-Headers': 'Content-Type, x-admin-password, Authorization, apikey'
+}
+
+const CHUNK_SIZE = 500        // rows per bulk upsert
+const ID_FILTER_CHUNK = 200   // ids per .in() filter (keeps the URL short)
+const PLAYER_COLUMNS = 'id, games, statsDirty, statsVersion'  // add_incremental_stats.sql
+
+type PlayerRow = {
+  id: string,
+  games: Record<string, number>[] | null,
+  statsDirty?: boolean | null,
+  statsVersion?: number | null
+}
+
+// Per-game field -> total column
+const TOTAL_FIELDS: [string, string][] = [
+  ['points', 'totalPoints'],
+  ['rebounds', 'totalRebounds'],
+  ['assists', 'totalAssists'],
+  ['steals', 'totalSteals'],
+  ['blocks', 'totalBlocks'],
+  ['turnovers', 'totalTurnovers'],
+  ['fouls', 'totalFouls'],
+  ['foulsDrawn', 'totalFoulsDrawn'],
+  ['fieldGoalsMade', 'totalFieldGoalsMade'],
+  ['fieldGoalsAttempted', 'totalFieldGoalsAttempted'],
+  ['threePointsMade', 'totalThreePointsMade'],
+  ['threePointsAttempted', 'totalThreePointsAttempted'],
+  ['freeThrowsMade', 'totalFreeThrowsMade'],
+  ['freeThrowsAttempted', 'totalFreeThrowsAttempted']
+]
+
+function chunk<T>(items: T[], size: number): T[][] {
+  const chunks: T[][] = []
+  for (let i = 0; i < items.length; i += size) {
+    chunks.push(items.slice(i, i + size))
+  }
+  return chunks
+}
+
+// All totals, percentages and averages for one player in a single pass over games[]
+function computePlayerStats(games: Record<string, number>[]) {
+  const totals: Record<string, number> = {}
+  for (const [, column] of TOTAL_FIELDS) totals[column] = 0
+
+  for (const g of games) {
+    for (const [field, column] of TOTAL_FIELDS) {
+      totals[column] += g?.[field] || 0
+    }
+  }
+
+  const gamesCount = games.length
+  return {
+    ...totals,
+    fgPercentage: totals.totalFieldGoalsAttempted > 0 ? (totals.totalFieldGoalsMade / totals.totalFieldGoalsAttempted) * 100 : 0,
+    threePointPercentage: totals.totalThreePointsAttempted > 0 ? (totals.totalThreePointsMade / totals.totalThreePointsAttempted) * 100 : 0,
+    ftPercentage: totals.totalFreeThrowsAttempted > 0 ? (totals.totalFreeThrowsMade / totals.totalFreeThrowsAttempted) * 100 : 0,
+    avgPoints: gamesCount > 0 ? totals.totalPoints / gamesCount : 0,
+    avgRebounds: gamesCount > 0 ? totals.totalRebounds / gamesCount : 0,
+    avgAssists: gamesCount > 0 ? totals.totalAssists / gamesCount : 0
+  }
+}
+
 serve(async (req) => {
   // Handle CORS preflight
   if (req.method === 'OPTIONS') {
-    return new Response(null, {
-      headers: {
-        'Access-Control-Allow-Origin': '*',
-        'Access-Control-Allow-Methods': 'POST, OPTIONS',
-        'Access-Control-Allow-Headers': 'Content-Type, x-admin-password, Authorization, apikey'
-      }
-    })
+    return new Response(null, { headers: corsHeaders })
   }
 
   try {
     // Check admin password
     const adminPassword = req.headers.get('x-admin-password')
     const expectedPassword = Deno.env.get('ADMIN_PASSWORD')
-    
+
     if (!adminPassword || adminPassword !== expectedPassword) {
       return new Response(
         JSON.stringify({ error: 'Unauthorized: Invalid admin password' }),
-        { status: 401, headers: { 'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*' } }
+        { status: 401, headers: { ...corsHeaders, 'Content-Type': 'application/json' } }
       )
     }
 
@@ -30,109 +90,173 @@ serve(async (req) => {
     const supabaseServiceKey = Deno.env.get('SUPABASE_SERVICE_ROLE_KEY')!
     const supabase = createClient(supabaseUrl, supabaseServiceKey)
 
-    console.log(`🔄 Recalculating all player statistics...`)
+    // Body is optional: {} / no body = full recompute (previous behaviour)
+    // { mode: 'incremental', gameIds?: number[] } = only players touched by those games or marked "statsDirty"
+    let body: { mode?: string, gameIds?: number[], chunkSize?: number } = {}
+    try {
+      body = await req.json()
+    } catch (_e) {
+      body = {}
+    }
+    const gameIds = Array.isArray(body.gameIds) ? body.gameIds : []
+    const mode = body.mode === 'incremental' || gameIds.length > 0 ? 'incremental' : 'full'
+    const chunkSize = Math.max(1, Math.min(body.chunkSize || CHUNK_SIZE, 1000))
+
+    const startedAt = Date.now()
+    console.log(`🔄 Recalculating player statistics (${mode})...`)
 
-    // Get all players
-    const { data: playersData, error: playersError } = await supabase
-      .from('players')
-      .select('*')
+    // ---- 1. Load the players to recompute (only id + games) ----
+    let players: PlayerRow[] = []
+    let useDirtyMarker = true
+    let touchedPlayerIds = 0
 
-    if (playersError) {
-      console.error('Error fetching players:', playersError)
-      return new Response(
-        JSON.stringify({ error: playersError.message }),
-        { status: 500, headers: { 'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*' } }
-      )
+    if (mode === 'full') {
+      let { data, error } = await supabase.from('players').select(PLAYER_COLUMNS)
+      if (error) {
+        // Column missing (migration not run yet) - recompute without clearing the marker
+        useDirtyMarker = false;
+        ({ data, error } = await supabase.from('players').select('id, games'))
+      }
+      if (error) throw error
+      players = data || []
+    } else {
+      const ids = new Set<string>()
+
+      // Players who appeared in the given games
+      for (const gameIdChunk of chunk(gameIds, ID_FILTER_CHUNK)) {
+        const { data, error } = await supabase
+          .from('appearances')
+          .select('playerId')
+          .in('gameId', gameIdChunk)
+        if (error) throw error
+        for (const row of data || []) ids.add(String(row.playerId))
+      }
+      touchedPlayerIds = ids.size
+
+      // Players whose games[] changed since the last run (add_incremental_stats.sql)
+      const { data: dirtyPlayers, error: dirtyError } = await supabase
+        .from('players')
+        .select(PLAYER_COLUMNS)
+        .eq('statsDirty', true)
+
+      if (dirtyError) {
+        // Column missing (migration not run yet) - incremental by gameIds only
+        console.warn('⚠️ statsDirty marker unavailable, using gameIds only:', dirtyError.message)
+        useDirtyMarker = false
+      } else {
+        players = dirtyPlayers || []
+        players.forEach(player => ids.delete(String(player.id)))
+      }
+
+      for (const idChunk of chunk([...ids], ID_FILTER_CHUNK)) {
+        const { data, error } = await supabase
+          .from('players')
+          .select(useDirtyMarker ? PLAYER_COLUMNS : 'id, games')
+          .in('id', idChunk)
+        if (error) throw error
+        players.push(...(data || []))
+      }
     }
 
-    console.log(`📋 Found ${playersData?.length || 0} players`)
+    const fetchMs = Date.now() - startedAt
+    console.log(`📋 Loaded ${players.length} players in ${fetchMs}ms`)
 
-    let updatedCount = 0
-    for (const player of playersData || []) {
+    // ---- 2. One pass per player ----
+    const computeStartedAt = Date.now()
+    const rows: Record<string, unknown>[] = []
+    // Version read with each dirty player - cleared after the write only if still the same
+    const dirtyVersions = new Map<string, number>()
+    let skipped = 0
+    let zeroed = 0
+
+    for (const player of players) {
       const games = player.games || []
-      
+      const dirty = useDirtyMarker && player.statsDirty === true
+
       if (games.length === 0) {
-        continue
+        // A dirty player whose games were all deleted still has the old totals - write zeros
+        if (!dirty) {
+          skipped++
+          continue
+        }
+        zeroed++
       }
 
-      // Recalculate totals from games array
-      const totalPoints = games.reduce((sum, g) => sum + (g.points || 0), 0)
-      const totalRebounds = games.reduce((sum, g) => sum + (g.rebounds || 0), 0)
-      const totalAssists = games.reduce((sum, g) => sum + (g.assists || 0), 0)
-      const totalSteals = games.reduce((sum, g) => sum + (g.steals || 0), 0)
-      const totalBlocks = games.reduce((sum, g) => sum + (g.blocks || 0), 0)
-      const totalTurnovers = games.reduce((sum, g) => sum + (g.turnovers || 0), 0)
-      const totalFouls = games.reduce((sum, g) => sum + (g.fouls || 0), 0)
-      const totalFoulsDrawn = games.reduce((sum, g) => sum + (g.foulsDrawn || 0), 0)
-      const totalFieldGoalsMade = games.reduce((sum, g) => sum + (g.fieldGoalsMade || 0), 0)
-      const totalFieldGoalsAttempted = games.reduce((sum, g) => sum + (g.fieldGoalsAttempted || 0), 0)
-      const totalThreePointsMade = games.reduce((sum, g) => sum + (g.threePointsMade || 0), 0)
-      const totalThreePointsAttempted = games.reduce((sum, g) => sum + (g.threePointsAttempted || 0), 0)
-      const totalFreeThrowsMade = games.reduce((sum, g) => sum + (g.freeThrowsMade || 0), 0)
-      const totalFreeThrowsAttempted = games.reduce((sum, g) => sum + (g.freeThrowsAttempted || 0), 0)
-      
-      // Calculate percentages
-      const fgPercentage = totalFieldGoalsAttempted > 0 ? (totalFieldGoalsMade / totalFieldGoalsAttempted) * 100 : 0
-      const threePointPercentage = totalThreePointsAttempted > 0 ? (totalThreePointsMade / totalThreePointsAttempted) * 100 : 0
-      const ftPercentage = totalFreeThrowsAttempted > 0 ? (totalFreeThrowsMade / totalFreeThrowsAttempted) * 100 : 0
-      
-      // Calculate averages
-      const gamesCount = games.length
-      const avgPoints = gamesCount > 0 ? totalPoints / gamesCount : 0
-      const avgRebounds = gamesCount > 0 ? totalRebounds / gamesCount : 0
-      const avgAssists = gamesCount > 0 ? totalAssists / gamesCount : 0
-      
-      const { error: updateError } = await supabase
+      rows.push({ id: player.id, ...computePlayerStats(games) })
+      if (dirty) dirtyVersions.set(String(player.id), Number(player.statsVersion) || 0)
+    }
+    const computeMs = Date.now() - computeStartedAt
+
+    // ---- 3. Chunked bulk upserts (rows always exist - only the listed columns are updated) ----
+    const writeStartedAt = Date.now()
+    let updatedCount = 0
+    let failedChunks = 0
+    const chunks = chunk(rows, chunkSize)
+    const written: { id: string, version: number }[] = []
+
+    for (const rowsChunk of chunks) {
+      const { error: upsertError } = await supabase
         .from('players')
-        .update({
-          totalPoints,
-          totalRebounds,
-          totalAssists,
-          totalSteals,
-          totalBlocks,
-          totalTurnovers,
-          totalFouls,
-          totalFoulsDrawn,
-          totalFieldGoalsMade,
-          totalFieldGoalsAttempted,
-          totalThreePointsMade,
-          totalThreePointsAttempted,
-          totalFreeThrowsMade,
-          totalFreeThrowsAttempted,
-          fgPercentage,
-          threePointPercentage,
-          ftPercentage,
-          avgPoints,
-          avgRebounds,
-          avgAssists
-        })
-        .eq('id', player.id)
-
-      if (updateError) {
-        console.error(`⚠️ Error updating player ${player.id}:`, updateError)
+        .upsert(rowsChunk, { onConflict: 'id' })
+
+      if (upsertError) {
+        failedChunks++
+        console.error(`⚠️ Error upserting ${rowsChunk.length} players:`, upsertError)
       } else {
-        updatedCount++
+        updatedCount += rowsChunk.length
+        for (const row of rowsChunk) {
+          const id = String(row.id)
+          const version = dirtyVersions.get(id)
+          if (version !== undefined) written.push({ id, version })
+        }
       }
     }
 
-    console.log(`✅ Recalculated stats for ${updatedCount} players`)
+    // ---- 4. Compare-and-clear "statsDirty" (a games[] write during the recompute bumps the version and keeps it set) ----
+    let dirtyCleared = 0
+    for (const clearChunk of chunk(written, chunkSize)) {
+      const { data: cleared, error: clearError } = await supabase
+        .rpc('clear_player_stats_dirty', { p_players: clearChunk })
+
+      if (clearError) {
+        // Flags stay set - those players are simply recomputed again on the next run
+        console.error(`⚠️ Error clearing statsDirty for ${clearChunk.length} players:`, clearError)
+      } else {
+        dirtyCleared += Number(cleared) || 0
+      }
+    }
+    const writeMs = Date.now() - writeStartedAt
+    const totalMs = Date.now() - startedAt
+
+    console.log(`✅ Recalculated stats for ${updatedCount} players in ${totalMs}ms (fetch ${fetchMs}ms, compute ${computeMs}ms, write ${writeMs}ms)`)
 
     return new Response(
-      JSON.stringify({ success: true, playersUpdated: updatedCount }),
-      { 
-        status: 200, 
-        headers: { 'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*' }
+      JSON.stringify({
+        success: failedChunks === 0,
+        mode,
+        playersUpdated: updatedCount,
+        playersScanned: players.length,
+        playersSkipped: skipped,
+        playersZeroed: zeroed,
+        dirtyCleared,
+        dirtyKept: written.length - dirtyCleared,
+        touchedPlayerIds,
+        gameIds: gameIds.length,
+        dirtyMarker: useDirtyMarker && mode === 'incremental',
+        chunks: chunks.length,
+        failedChunks,
+        timings: { fetchMs, computeMs, writeMs, totalMs }
+      }),
+      {
+        status: 200,
+        headers: { ...corsHeaders, 'Content-Type': 'application/json' }
       }
     )
   } catch (error) {
     console.error('Edge function error:', error)
     return new Response(
       JSON.stringify({ error: error.message }),
-      { status: 500, headers: { 'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*' } }
+      { status: 500, headers: { ...corsHeaders, 'Content-Type': 'application/json' } }
     )
   }
 })
-
-
-
-
@@ -7,6 +7,51 @@ const corsHeaders = {
   'Access-Control-Allow-Methods': 'POST, OPTIONS',
 }
 
+// Per-game field -> team_game_totals column (same as js/team_aggregates.js)
+const STAT_FIELDS: [string, string][] = [
+  ['points', 'points'],
+  ['rebounds', 'rebounds'],
+  ['assists', 'assists'],
+  ['steals', 'steals'],
+  ['blocks', 'blocks'],
+  ['turnovers', 'turnovers'],
+  ['fouls', 'fouls'],
+  ['fieldGoalsMade', 'fgm'],
+  ['fieldGoalsAttempted', 'fga'],
+  ['threePointsMade', 'tpm'],
+  ['threePointsAttempted', 'tpa'],
+  ['freeThrowsMade', 'ftm'],
+  ['freeThrowsAttempted', 'fta'],
+  ['efficiency', 'efficiency']
+]
+
+// team_game_totals rows of this game, from the saved players' games[] (teams[0] = home, teams[1] = away)
+function buildTeamGameTotals(gameSerial: number, teams: string[], players: { games?: Record<string, any>[] }[]) {
+  const byTeam = new Map<string, Record<string, any>>()
+  for (const player of players) {
+    for (const g of player.games || []) {
+      if (String(g?.gameId) !== String(gameSerial) || !g.team) continue
+      if (!byTeam.has(g.team)) {
+        const row: Record<string, any> = { gameSerial: Number(gameSerial), team: g.team }
+        for (const [, column] of STAT_FIELDS) row[column] = 0
+        byTeam.set(g.team, row)
+      }
+      const row = byTeam.get(g.team)!
+      for (const [field, column] of STAT_FIELDS) row[column] += Number(g[field]) || 0
+    }
+  }
+
+  return Array.from(byTeam.values()).map(row => {
+    const index = (teams || []).indexOf(row.team)
+    const opponent = index === 0 || index === 1 ? byTeam.get(teams[1 - index]) : null
+    return {
+      ...row,
+      isHome: index === 0 ? true : index === 1 ? false : null,
+      opponentPoints: opponent ? opponent.points : 0
+    }
+  })
+}
+
 serve(async (req) => {
   // Handle CORS preflight requests
   if (req.method === 'OPTIONS') {
@@ -81,11 +126,27 @@ serve(async (req) => {
       console.log(`✅ Players saved: ${playersSaved}/${playersData.length}`)
     }
 
+    // Team aggregates: replace this game's team_game_totals rows and refresh its teams
+    // (a failure here does not fail the save - checkTeamAggregates / rebuild_team_aggregates() repair it)
+    let teamAggregatesUpdated = false
+    const teamRows = buildTeamGameTotals(game.gameSerial, game.teams || [], playersData || [])
+    const { error: aggregatesError } = await supabaseAdmin.rpc('apply_team_game_totals', {
+      p_game_serial: game.gameSerial,
+      p_rows: teamRows
+    })
+    if (aggregatesError) {
+      console.error('⚠️ Team aggregates update error:', aggregatesError)
+    } else {
+      teamAggregatesUpdated = true
+      console.log(`✅ Team aggregates updated: ${teamRows.map(row => row.team).join(', ')}`)
+    }
+
     return new Response(
       JSON.stringify({ 
         success: true, 
         gameId: game.gameSerial,
-        playersSaved: playersSaved
+        playersSaved: playersSaved,
+        teamAggregatesUpdated
       }),
       { 
         headers: { ...corsHeaders, 'Content-Type': 'application/json' } 
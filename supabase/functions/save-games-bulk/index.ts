@@ -0,0 +1,103 @@
+import { serve } from 'https://deno.land/std@0.168.0/http/server.ts'
+import { createClient } from 'https://esm.sh/@supabase/supabase-js@2'
+
+const corsHeaders = {
+  'Access-Control-Allow-Origin': '*',
+  'Access-Control-Allow-Headers': 'authorization, x-client-info, apikey, content-type, x-admin-password',
+  'Access-Control-Allow-Methods': 'POST, OPTIONS',
+}
+
+// Bulk variant of save-game: one upsert per table for a whole batch of games
+serve(async (req) => {
+  // Handle CORS preflight requests
+  if (req.method === 'OPTIONS') {
+    return new Response('ok', { headers: corsHeaders })
+  }
+
+  try {
+    // Get admin password from header
+    const authPassword = req.headers.get('x-admin-password')
+    const expectedPassword = Deno.env.get('ADMIN_PASSWORD')
+    
+    console.log('🔐 Checking authentication...')
+    
+    if (!authPassword || authPassword !== expectedPassword) {
+      console.log('❌ Authentication failed')
+      return new Response(
+        JSON.stringify({ error: 'Unauthorized - Invalid admin password' }),
+        { 
+          status: 401, 
+          headers: { ...corsHeaders, 'Content-Type': 'application/json' } 
+        }
+      )
+    }
+    
+    console.log('✅ Authentication successful')
+
+    // Create Supabase client with SERVICE_ROLE_KEY (bypasses RLS)
+    const supabaseAdmin = createClient(
+      Deno.env.get('SUPABASE_URL') ?? '',
+      Deno.env.get('SUPABASE_SERVICE_ROLE_KEY') ?? ''
+    )
+
+    // Get data from request
+    const { games = [], appearances = [], playerStats = [] } = await req.json()
+    
+    console.log('📦 Received batch:', {
+      games: games.length,
+      appearances: appearances.length,
+      playerStats: playerStats.length
+    })
+
+    const startedAt = Date.now()
+    const writes: [string, unknown[], string][] = [
+      ['games', games, 'gameSerial'],
+      ['appearances', appearances, 'playerId,gameId'],
+      ['player_stats', playerStats, 'playerId,gameId']
+    ]
+
+    // Games first, so appearances/stats never reference a missing game
+    for (const [table, rows, onConflict] of writes) {
+      if (rows.length === 0) continue
+
+      console.log(`💾 Upserting ${rows.length} rows into ${table}...`)
+      const { error } = await supabaseAdmin
+        .from(table)
+        .upsert(rows, { onConflict })
+
+      if (error) {
+        console.error(`❌ ${table} bulk upsert error:`, error)
+        throw error
+      }
+    }
+
+    const durationMs = Date.now() - startedAt
+    console.log(`✅ Batch saved in ${durationMs}ms`)
+
+    return new Response(
+      JSON.stringify({ 
+        success: true, 
+        games: games.length,
+        appearances: appearances.length,
+        playerStats: playerStats.length,
+        durationMs
+      }),
+      { 
+        headers: { ...corsHeaders, 'Content-Type': 'application/json' } 
+      }
+    )
+
+  } catch (error) {
+    console.error('❌ Error:', error)
+    return new Response(
+      JSON.stringify({ 
+        error: error.message || 'Internal server error',
+        details: error.toString()
+      }),
+      { 
+        status: 500, 
+        headers: { ...corsHeaders, 'Content-Type': 'application/json' } 
+      }
+    )
+  }
+})
@@ -127,6 +127,7 @@ CREATE TABLE IF NOT EXISTS public.appearances (
 -- Index for appearance queries
 CREATE INDEX IF NOT EXISTS idx_appearances_player ON public.appearances("playerId");
 CREATE INDEX IF NOT EXISTS idx_appearances_game ON public.appearances("gameId");
+CREATE UNIQUE INDEX IF NOT EXISTS idx_appearances_player_game ON public.appearances("playerId", "gameId");
 
 -- ========================================
 -- TABLE: player_stats
@@ -157,6 +158,7 @@ CREATE TABLE IF NOT EXISTS public.player_stats (
 -- Index for stats queries
 CREATE INDEX IF NOT EXISTS idx_player_stats_player ON public.player_stats("playerId");
 CREATE INDEX IF NOT EXISTS idx_player_stats_game ON public.player_stats("gameId");
+CREATE UNIQUE INDEX IF NOT EXISTS idx_player_stats_player_game ON public.player_stats("playerId", "gameId");
 
 -- ========================================
 -- TABLE: transfer_events
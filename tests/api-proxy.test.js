@@ -0,0 +1,143 @@
+const assert = require('assert');
+const fs = require('fs');
+const path = require('path');
+
+// api/proxy.js is an ES module (Vercel function) - load it without a package-level "type": "module"
+async function loadProxy() {
+  const source = fs.readFileSync(path.join(__dirname, '..', 'api', 'proxy.js'), 'utf8');
+  return import(`data:text/javascript;base64,${Buffer.from(source).toString('base64')}`);
+}
+
+function createResponse() {
+  return {
+    statusCode: null,
+    headers: {},
+    body: undefined,
+    setHeader(name, value) { this.headers[name.toLowerCase()] = value; },
+    status(code) { this.statusCode = code; return this; },
+    json(data) { this.body = data; return this; },
+    send(data) { this.body = data; return this; },
+    end() { return this; }
+  };
+}
+
+async function request(handler, url, headers = {}) {
+  const res = createResponse();
+  await handler({ method: 'GET', query: url === null ? { stats: '1' } : { url }, headers }, res);
+  return res;
+}
+
+function upstreamResponse(status, body, headers = {}) {
+  const lower = Object.fromEntries(Object.entries(headers).map(([key, value]) => [key.toLowerCase(), value]));
+  return {
+    status,
+    ok: status >= 200 && status < 300,
+    headers: { get: name => lower[name.toLowerCase()] ?? null },
+    text: async () => body
+  };
+}
+
+async function run() {
+  const { default: handler, getProxyStats, resetProxyCache, LRUCache } = await loadProxy();
+  const { log, error } = console;
+  console.log = console.error = () => {};
+  const calls = [];
+  let respond = () => upstreamResponse(200, '[]', { 'content-type': 'application/json' });
+  globalThis.fetch = async (url, options) => {
+    calls.push({ url, headers: options.headers });
+    await new Promise(resolve => setTimeout(resolve, 5));
+    return respond(url, options);
+  };
+
+  const monthUrl = 'https://ibasketball.co.il/wp-json/sportspress/v2/events?leagues=1&month=2025-11';
+
+  // Identical concurrent requests -> one upstream fetch
+  resetProxyCache();
+  respond = () => upstreamResponse(200, '[{"id":1}]', { 'content-type': 'application/json; charset=UTF-8', etag: '"v1"' });
+  const concurrent = await Promise.all([1, 2, 3].map(() => request(handler, monthUrl)));
+  assert.strictEqual(calls.length, 1);
+  assert.deepStrictEqual(concurrent.map(res => res.headers['x-proxy-cache']).sort(), ['COALESCED', 'COALESCED', 'MISS']);
+  concurrent.forEach(res => assert.strictEqual(res.body, '[{"id":1}]'));
+
+  // Fresh entry -> HIT, client ETag -> 304
+  const hit = await request(handler, monthUrl);
+  assert.strictEqual(hit.headers['x-proxy-cache'], 'HIT');
+  assert.strictEqual(calls.length, 1);
+  const notModified = await request(handler, monthUrl, { 'if-none-match': hit.headers.etag });
+  assert.strictEqual(notModified.statusCode, 304);
+  assert.strictEqual(notModified.body, undefined);
+
+  // Expired entry -> conditional upstream request, 304 keeps the cached body
+  const realNow = Date.now;
+  Date.now = () => realNow() + 2 * 60 * 1000;
+  respond = () => upstreamResponse(304, '');
+  const revalidated = await request(handler, monthUrl);
+  assert.strictEqual(calls[1].headers['If-None-Match'], '"v1"');
+  assert.strictEqual(revalidated.headers['x-proxy-cache'], 'REVALIDATED');
+  assert.strictEqual(revalidated.body, '[{"id":1}]');
+
+  // Upstream down -> stale copy instead of an error
+  Date.now = () => realNow() + 4 * 60 * 1000;
+  respond = () => upstreamResponse(503, 'busy');
+  const stale = await request(handler, monthUrl);
+  assert.strictEqual(stale.statusCode, 200);
+  assert.strictEqual(stale.headers['x-proxy-cache'], 'STALE');
+
+  // Network error and 429 -> stale as well
+  respond = () => { throw new TypeError('fetch failed'); };
+  assert.strictEqual((await request(handler, monthUrl)).headers['x-proxy-cache'], 'STALE');
+  respond = () => upstreamResponse(429, 'slow down');
+  assert.strictEqual((await request(handler, monthUrl)).headers['x-proxy-cache'], 'STALE');
+
+  // Other 4xx is a real answer -> passed through, the stale entry is dropped
+  respond = () => upstreamResponse(404, 'gone');
+  const gone = await request(handler, monthUrl);
+  assert.strictEqual(gone.statusCode, 404);
+  assert.strictEqual(gone.headers['x-proxy-cache'], undefined);
+  Date.now = realNow;
+
+  // Finished game events are kept for days, HTML passes through untouched
+  respond = url => (url.includes('/events/')
+    ? upstreamResponse(200, '{"id":5,"performance":{"10":{"0":{"pts":80}}}}', { 'content-type': 'application/json' })
+    : upstreamResponse(200, '<html><table class="sp-league-table"></table></html>', { 'content-type': 'text/html; charset=UTF-8' }));
+  const finished = await request(handler, 'https://ibasketball.co.il/wp-json/sportspress/v2/events/5');
+  assert.ok(/s-maxage=6048\d\d/.test(finished.headers['cache-control']), finished.headers['cache-control']);
+  const standings = await request(handler, 'https://ibasketball.co.il/league/2025-2/');
+  assert.strictEqual(standings.headers['content-type'], 'text/html; charset=UTF-8');
+  assert.strictEqual(standings.body, '<html><table class="sp-league-table"></table></html>');
+  assert.ok(/s-maxage=300/.test(standings.headers['cache-control']));
+
+  // Errors without a cached copy are forwarded, other hosts are rejected
+  respond = () => upstreamResponse(404, 'missing');
+  const missing = await request(handler, 'https://ibasketball.co.il/wp-json/sportspress/v2/events/404');
+  assert.strictEqual(missing.statusCode, 404);
+  const forbidden = await request(handler, 'https://example.com/');
+  assert.strictEqual(forbidden.statusCode, 403);
+
+  const stats = (await request(handler, null)).body;
+  assert.deepStrictEqual(
+    { hits: stats.hits, misses: stats.misses, coalesced: stats.coalesced, revalidated: stats.revalidated,
+      staleServed: stats.staleServed, notModified: stats.notModified, upstreamRequests: stats.upstreamRequests },
+    { hits: 2, misses: 9, coalesced: 2, revalidated: 1, staleServed: 3, notModified: 1, upstreamRequests: 9 }
+  );
+  assert.deepStrictEqual(getProxyStats().entries, 2);
+
+  // LRU eviction by entry count and by size
+  const lru = new LRUCache({ maxEntries: 2, maxBytes: 10 });
+  lru.set('a', { size: 4 });
+  lru.set('b', { size: 4 });
+  lru.get('a');
+  lru.set('c', { size: 4 });
+  assert.deepStrictEqual([...lru.entries.keys()], ['a', 'c']);
+  lru.set('d', { size: 8 });
+  assert.deepStrictEqual([...lru.entries.keys()], ['d']);
+  assert.strictEqual(lru.bytes, 8);
+
+  Object.assign(console, { log, error });
+  console.log('api-proxy tests passed');
+}
+
+run().catch(error => {
+  process.stderr.write(`${error.stack}\n`); // console is silenced while the proxy logs
+  process.exit(1);
+});
@@ -0,0 +1,118 @@
+const assert = require('assert');
+const fs = require('fs');
+const path = require('path');
+const vm = require('vm');
+
+// js/app_db_save.js is a classic script (top-level functions) - load it after table_view_model.js
+function loadTables(elements) {
+  const listeners = [];
+  const context = {
+    console: { log() {}, warn() {}, error() {} },
+    Intl,
+    innerHeight: 740,
+    addEventListener: (type, fn) => listeners.push({ type, fn }),
+    removeEventListener: (type, fn) => {
+      const index = listeners.findIndex(listener => listener.fn === fn && listener.type === type);
+      if (index >= 0) listeners.splice(index, 1);
+    },
+    requestAnimationFrame: fn => { fn(); return 1; },
+    document: {
+      body: {},
+      readyState: 'complete',
+      addEventListener() {},
+      getElementById: id => elements[id] || null,
+      querySelector: () => null,
+      querySelectorAll: () => []
+    },
+    $: id => elements[id] || null
+  };
+  context.window = context;
+  context.listeners = listeners;
+  vm.createContext(context);
+  for (const file of ['table_view_model.js', 'app_db_save.js']) {
+    const filename = path.join(__dirname, '..', 'js', file);
+    vm.runInContext(fs.readFileSync(filename, 'utf8'), context, { filename });
+  }
+  return context;
+}
+
+function createFakeTbody() {
+  return {
+    innerHTML: '',
+    parentElement: null,
+    getBoundingClientRect: () => ({ top: -37 * 100 }),
+    querySelector: () => ({ getBoundingClientRect: () => ({ height: 37 }) })
+  };
+}
+
+function scroll(context) {
+  context.listeners.filter(listener => listener.type === 'scroll' || listener.type === 'resize').forEach(listener => listener.fn());
+}
+
+function run() {
+  const elements = {
+    playersSearch: { value: '' },
+    playersTeamFilter: { value: '' },
+    gamesSearch: { value: '' }
+  };
+  const context = loadTables(elements);
+  const scrollListeners = () => context.listeners.filter(listener => listener.type === 'scroll').length;
+
+  // Players: a virtualized table (> 200 rows), then a search that matches nothing
+  const allPlayers = Array.from({ length: 300 }, (_, i) => ({
+    id: `p${i}`,
+    name: `player ${i}`,
+    jersey: String(i),
+    team: 'team',
+    games: [{ points: i, rebounds: 1, assists: 1 }]
+  }));
+  const players = vm.runInContext('getPlayersTableView()', context);
+  players.data = { allPlayers, getTeamHeName: team => team, heNameById: new Map() };
+  players.rows = allPlayers.map(context.preparePlayerRow);
+  players.loaded = true;
+
+  const playersTbody = createFakeTbody();
+  context.drawPlayersTable(playersTbody, players);
+  assert.ok(playersTbody.innerHTML.includes('virtual-spacer'));
+  assert.strictEqual(scrollListeners(), 1);
+
+  elements.playersSearch.value = 'no such player';
+  context.drawPlayersTable(playersTbody, players);
+  assert.ok(playersTbody.innerHTML.includes('לא נמצאו שחקנים'));
+  assert.strictEqual(scrollListeners(), 0);
+  scroll(context);
+  assert.ok(playersTbody.innerHTML.includes('לא נמצאו שחקנים'), 'scroll redrew stale rows over the empty message');
+
+  // Clearing the search draws again with a single body
+  elements.playersSearch.value = '';
+  context.drawPlayersTable(playersTbody, players);
+  assert.ok(playersTbody.innerHTML.includes('player '));
+  assert.strictEqual(scrollListeners(), 1);
+
+  // Games: same for the "no games" message
+  const games = vm.runInContext('getGamesTableView()', context);
+  games.data = { games: [] };
+  games.rows = Array.from({ length: 300 }, (_, i) => ({ id: i + 1, cycle: 1, date: '2025-11-01', teams: ['a', 'b'], _hay: String(i + 1) }));
+  games.loaded = true;
+
+  const gamesTbody = createFakeTbody();
+  context.drawGamesTable(gamesTbody, games, 'gameId', 'desc');
+  assert.ok(gamesTbody.innerHTML.includes('virtual-spacer'));
+  assert.strictEqual(scrollListeners(), 2);
+
+  elements.gamesSearch.value = 'no such game';
+  context.drawGamesTable(gamesTbody, games, 'gameId', 'desc');
+  assert.ok(gamesTbody.innerHTML.includes('אין משחקים להצגה'));
+  assert.strictEqual(scrollListeners(), 1);
+  scroll(context);
+  assert.ok(gamesTbody.innerHTML.includes('אין משחקים להצגה'), 'scroll redrew stale rows over the empty message');
+
+  console.log('app-db-save-tables tests passed');
+}
+
+try {
+  run();
+} catch (error) {
+  console.error(error);
+  process.exit(1);
+}
@@ -0,0 +1,66 @@
+const assert = require('assert');
+const { measureStage, compareToBaseline, percentile } = require('./helpers/bench-harness');
+const { generateSeason } = require('./helpers/synthetic-season');
+
+async function run() {
+  assert.strictEqual(percentile([1, 2, 3, 4, 5, 6, 7, 8, 9, 10], 50), 5);
+  assert.strictEqual(percentile([1, 2, 3, 4, 5, 6, 7, 8, 9, 10], 95), 10);
+  assert.strictEqual(percentile([], 95), 0);
+
+  // Sync stages are batched up to minSampleMs; async stages are awaited
+  let syncCalls = 0;
+  const fast = await measureStage(() => { syncCalls++; }, { samples: 5, warmup: 1, warmupMs: 0, minSampleMs: 1 });
+  assert.ok(fast.batch > 1, `batch ${fast.batch}`);
+  assert.ok(syncCalls >= fast.batch * 5);
+  assert.ok(fast.p50Ms <= fast.p95Ms);
+  assert.ok(fast.opsPerSec > 0);
+
+  let resolved = 0;
+  const slow = await measureStage(() => new Promise(resolve => setTimeout(() => { resolved++; resolve(); }, 2)),
+    { samples: 3, warmup: 1, warmupMs: 0, minSampleMs: 1 });
+  assert.strictEqual(slow.batch, 1);
+  assert.strictEqual(resolved, 5);
+  assert.ok(slow.p50Ms >= 1.5, `p50 ${slow.p50Ms}`);
+
+  // Regression check: tolerance + minimum delta, missing stages
+  const baseline = {
+    gcExposed: true,
+    stages: {
+      convert: { p50Ms: 1, heapGrowthBytes: 1000 },
+      tiny: { p50Ms: 0.001, heapGrowthBytes: 0 },
+      removed: { p50Ms: 1, heapGrowthBytes: 0 }
+    }
+  };
+  const results = {
+    gcExposed: true,
+    stages: {
+      convert: { p50Ms: 1.2, heapGrowthBytes: 1000 },
+      tiny: { p50Ms: 0.004, heapGrowthBytes: 0 }
+    }
+  };
+  assert.deepStrictEqual(compareToBaseline(results, baseline).map(r => `${r.stage}:${r.metric}`), ['removed:missing']);
+
+  results.stages.convert.p50Ms = 1.5;
+  results.stages.convert.heapGrowthBytes = 64 * 1024 * 1024;
+  assert.deepStrictEqual(
+    compareToBaseline(results, baseline).map(r => `${r.stage}:${r.metric}`),
+    ['convert:p50Ms', 'convert:heapGrowthBytes', 'removed:missing']
+  );
+  assert.deepStrictEqual(
+    compareToBaseline({ ...results, gcExposed: false }, baseline, { tolerance: 0.6 }).map(r => `${r.stage}:${r.metric}`),
+    ['removed:missing']
+  );
+
+  // Generator scale knobs: teams x rounds x seasons
+  const events = generateSeason({ seed: 3, teams: 6, rounds: 4, seasons: 2 });
+  assert.strictEqual(events.length, 6 / 2 * 4 * 2);
+  assert.deepStrictEqual(generateSeason({ seed: 3, teams: 6, rounds: 4, seasons: 2 }), events);
+  assert.strictEqual(new Set(events.map(event => event.id)).size, events.length);
+
+  console.log('bench-harness tests passed');
+}
+
+run().catch(error => {
+  console.error(error);
+  process.exit(1);
+});
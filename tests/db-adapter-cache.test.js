@@ -0,0 +1,151 @@
+const assert = require('assert');
+const fs = require('fs');
+const path = require('path');
+const vm = require('vm');
+
+const plain = value => JSON.parse(JSON.stringify(value));
+
+// Supabase client double: counts reads per table (full table / by id), rows can be changed between reads
+function createSupabase(tables, reads, delayMs = 5) {
+  const query = table => {
+    let id = null;
+    const result = () => new Promise(resolve => setTimeout(() => {
+      const rows = plain(tables[table]);
+      if (id === null) return resolve({ data: rows, error: null });
+      const row = rows.find(r => String(r.id ?? r.team_id) === String(id));
+      resolve(row ? { data: row, error: null } : { data: null, error: { message: 'not found' } });
+    }, delayMs));
+    const builder = {
+      select: () => builder,
+      order: () => builder,
+      eq: (field, value) => { id = value; return builder; },
+      single: () => builder,
+      upsert: row => {
+        const list = tables[table];
+        const index = list.findIndex(r => r.id === row.id);
+        if (index >= 0) list[index] = plain(row); else list.push(plain(row));
+        id = row.id;
+        return builder;
+      },
+      then: (resolve, reject) => {
+        reads.push(id === null ? `${table}:*` : `${table}:${id}`);
+        return result().then(resolve, reject);
+      }
+    };
+    return builder;
+  };
+  return { createClient: () => ({ from: query, rpc: () => Promise.resolve({ error: null }) }) };
+}
+
+async function loadAdapter(tables) {
+  const reads = [];
+  const events = [];
+  const context = {
+    console: { log() {}, warn() {}, error() {} },
+    setTimeout,
+    supabaseConfig: { url: 'https://example.supabase.co', key: 'anon' },
+    supabase: createSupabase(tables, reads),
+    CustomEvent: class { constructor(type, init) { this.type = type; this.detail = init.detail; } },
+    dispatchEvent: event => events.push(plain({ type: event.type, detail: event.detail }))
+  };
+  context.window = context;
+  vm.createContext(context);
+  const file = path.join(__dirname, '..', 'js', 'db_adapter.js');
+  vm.runInContext(fs.readFileSync(file, 'utf8'), context, { filename: file });
+  await context.dbAdapter.init();
+  reads.length = 0; // connection check
+  return { dbAdapter: context.dbAdapter, reads, events };
+}
+
+function buildTables() {
+  return {
+    teams: [
+      { team_id: 't-1', name_he: 'מכבי', name_en: 'Maccabi' },
+      { team_id: 't-2', name_he: 'הפועל', name_en: 'Hapoel' }
+    ],
+    players: [
+      { id: 'p1', name: 'א', team: 'מכבי', games: [{ gameId: 1, team: 'מכבי' }] },
+      { id: 'p2', name: 'ב', team: 'הפועל', games: [{ gameId: 1, team: 'הפועל' }] },
+      { id: 'p3', name: 'ג', team: 'הפועל', lastSeenTeam: 'הפועל', games: [{ gameId: 1, team: 'מכבי' }] },
+      { id: 'p4', name: 'ד', team: 'Maccabi', games: [] }
+    ]
+  };
+}
+
+async function run() {
+  // Full-table read fills the indexes: later lookups by id / team are local
+  {
+    const tables = buildTables();
+    const { dbAdapter, reads } = await loadAdapter(tables);
+    assert.strictEqual((await dbAdapter.getPlayers()).length, 4);
+    assert.strictEqual((await dbAdapter.getPlayer('p2')).name, 'ב');
+    assert.deepStrictEqual(plain((await dbAdapter.getPlayersByTeam(['t-1', 'מכבי', 'Maccabi'])).map(p => p.id)), ['p1', 'p3', 'p4']);
+    assert.deepStrictEqual(plain((await dbAdapter.getPlayersByTeam('הפועל')).map(p => p.id)), ['p2', 'p3']);
+    assert.deepStrictEqual(plain(reads), ['players:*']);
+
+    const stats = dbAdapter.getCacheStats();
+    assert.strictEqual(stats.misses, 1);
+    assert.strictEqual(stats.hits, 3);
+    assert.strictEqual(stats.fullLoads.players, 1);
+
+    // Callers get copies
+    const player = await dbAdapter.getPlayer('p1');
+    player.games.push({ gameId: 2, team: 'מכבי' });
+    assert.strictEqual((await dbAdapter.getPlayer('p1')).games.length, 1);
+  }
+
+  // Concurrent identical reads share one query; by-id reads without a loaded table are cached per row
+  {
+    const tables = buildTables();
+    const { dbAdapter, reads } = await loadAdapter(tables);
+    const [a, b] = await Promise.all([dbAdapter.getTeam('t-1'), dbAdapter.getTeam('t-1')]);
+    assert.strictEqual(a.name_he, 'מכבי');
+    assert.notStrictEqual(a, b);
+    await dbAdapter.getTeam('t-1');
+    assert.deepStrictEqual(plain(reads), ['teams:t-1']);
+    assert.strictEqual(dbAdapter.getCacheStats().shared, 1);
+
+    await Promise.all([dbAdapter.getPlayers(), dbAdapter.getPlayers(), dbAdapter.getPlayersByTeam('מכבי')]);
+    assert.strictEqual(reads.filter(read => read === 'players:*').length, 1);
+  }
+
+  // Writes invalidate: adapter write methods and notifyWrite from direct IndexedDB writers
+  {
+    const tables = buildTables();
+    const { dbAdapter, reads, events } = await loadAdapter(tables);
+    await dbAdapter.getPlayers();
+    await dbAdapter.savePlayer({ id: 'p2', name: 'ב', team: 'מכבי', games: [{ gameId: 3, team: 'מכבי' }] });
+    assert.deepStrictEqual(events, [{ type: 'dbWrite', detail: { table: 'players', ids: ['p2'] } }]);
+
+    assert.deepStrictEqual(plain((await dbAdapter.getPlayersByTeam('מכבי')).map(p => p.id)), ['p1', 'p2', 'p3']);
+    assert.strictEqual(reads.filter(read => read === 'players:*').length, 2);
+
+    await dbAdapter.getTeams();
+    tables.teams[0].name_he = 'מכבי חדש';
+    assert.strictEqual((await dbAdapter.getTeam('t-1')).name_he, 'מכבי');
+    dbAdapter.notifyWrite('teams', ['t-1']);
+    assert.strictEqual((await dbAdapter.getTeam('t-1')).name_he, 'מכבי חדש');
+    assert.strictEqual(dbAdapter.getCacheStats().invalidations, 2);
+  }
+
+  // A write while a read is in flight: the read's rows are not cached, and new readers don't join it
+  {
+    const tables = buildTables();
+    const { dbAdapter, reads } = await loadAdapter(tables);
+    const pending = dbAdapter.getPlayers();
+    tables.players.push({ id: 'p5', name: 'ה', team: 'מכבי', games: [] });
+    dbAdapter.notifyWrite('players', ['p5']);
+    const fresh = dbAdapter.getPlayers();
+    await pending;
+    assert.strictEqual((await fresh).length, 5);
+    assert.strictEqual((await dbAdapter.getPlayers()).length, 5);
+    assert.strictEqual(reads.filter(read => read === 'players:*').length, 2);
+  }
+
+  console.log('db-adapter-cache tests passed');
+}
+
+run().catch(error => {
+  console.error(error);
+  process.exit(1);
+});
@@ -0,0 +1,166 @@
+const assert = require('assert');
+const fs = require('fs');
+const path = require('path');
+const vm = require('vm');
+const { generateSeason } = require('./helpers/synthetic-season');
+const { createFakeDb } = require('./helpers/fake-indexeddb');
+
+function loadBackupStream() {
+  const context = {
+    console: { log() {}, warn() {}, error() {} },
+    ReadableStream,
+    TransformStream,
+    TextEncoderStream,
+    TextDecoderStream,
+    CompressionStream,
+    DecompressionStream,
+    Response,
+    Blob,
+    IDBKeyRange: {
+      lowerBound: (lower, lowerOpen) => ({ lower, lowerOpen })
+    }
+  };
+  context.window = context;
+  vm.createContext(context);
+  const file = path.join(__dirname, '..', 'js', 'db_backup_stream.js');
+  vm.runInContext(fs.readFileSync(file, 'utf8'), context, { filename: file });
+  return context.DBBackupStream;
+}
+
+// IBBA events -> rows shaped like the app's teams / players / games stores
+function toDbRows(events) {
+  const teams = new Map();
+  const players = new Map();
+  const games = events.map(event => {
+    event.teams.forEach((teamId, side) => {
+      teams.set(teamId, { team_id: teamId, name_he: side === 0 ? event.home.team : event.away.team });
+      Object.entries(event.performance[teamId]).forEach(([playerId, line]) => {
+        if (playerId === '0') return;
+        if (!players.has(playerId)) players.set(playerId, { id: playerId, team: teamId, games: [] });
+        players.get(playerId).games.push({ gameSerial: event.id, points: line.pts, jersey: line.number });
+      });
+    });
+    return { gameSerial: event.id, date: event.date, teams: event.teams, performance: event.performance };
+  });
+  return { teams: Array.from(teams.values()), players: Array.from(players.values()), games };
+}
+
+function fillDb(db, season) {
+  season.teams.forEach(team => db.stores.get('teams').rows.set(team.team_id, team));
+  season.players.forEach(player => db.stores.get('players').rows.set(player.id, player));
+  season.games.forEach(game => db.stores.get('games').rows.set(game.gameSerial, game));
+}
+
+// Store contents in key order
+const dump = db => JSON.parse(JSON.stringify(Object.fromEntries(Array.from(db.stores, ([name, store]) => [
+  name,
+  Array.from(store.rows.keys()).sort((a, b) => (a < b ? -1 : a > b ? 1 : 0)).map(key => store.rows.get(key))
+]))));
+
+async function run() {
+  const DBBackupStream = loadBackupStream();
+  const season = toDbRows(generateSeason({ seed: 11, teams: 20, rounds: 8 }));
+  const storeDefs = { teams: 'team_id', players: 'id', games: 'gameSerial', appearances: 'id' };
+
+  const source = createFakeDb(storeDefs);
+  fillDb(source, season);
+  assert.ok(source.stores.get('players').rows.size > 200, 'fixture spans several batches');
+
+  // Export -> gzip NDJSON, read in batches
+  const progress = [];
+  const exported = await DBBackupStream.exportDatabase(source, {
+    batchSize: 50,
+    meta: { version: 7 },
+    onProgress: update => progress.push(update)
+  });
+  assert.strictEqual(exported.compressed, true);
+  assert.strictEqual(exported.extension, 'ndjson.gz');
+  assert.strictEqual(exported.counts.players, season.players.length);
+  assert.ok(progress.length > 3);
+
+  const bytes = new Uint8Array(await exported.blob.arrayBuffer());
+  assert.deepStrictEqual([bytes[0], bytes[1]], [0x1f, 0x8b]);
+  const pretty = Buffer.byteLength(JSON.stringify({ ...dump(source), appName: 'BasketballStatsDB' }, null, 2));
+  assert.ok(bytes.length < pretty / 4, `compressed ${bytes.length} vs pretty JSON ${pretty}`);
+
+  // Import into a database with other data -> identical content, one transaction per batch
+  const target = createFakeDb(storeDefs);
+  target.stores.get('teams').rows.set('stale', { team_id: 'stale' });
+  target.stores.get('appearances').rows.set(1, { id: 1 });
+  const importProgress = [];
+  const result = await DBBackupStream.importDatabase(target, exported.blob, { onProgress: update => importProgress.push(update) });
+
+  const expected = dump(source);
+  const actual = dump(target);
+  ['teams', 'players', 'games'].forEach(store => assert.deepStrictEqual(actual[store], expected[store], store));
+  assert.strictEqual(target.stores.get('appearances').rows.size, 1, 'stores not in the backup are left alone');
+  assert.strictEqual(result.format, 'bsdb-ndjson');
+  assert.strictEqual(result.header.version, 7);
+  assert.strictEqual(result.written.games, season.games.length);
+  const batches = ['teams', 'players', 'games'].reduce((sum, store) => sum + Math.ceil(season[store].length / 50), 0);
+  assert.strictEqual(target.transactions, batches + 1, 'one clear + one write transaction per batch');
+  assert.strictEqual(importProgress[importProgress.length - 1].bytesRead, exported.blob.size);
+
+  // Old pretty-printed JSON backups still import
+  const legacy = new Blob([JSON.stringify({
+    teams: season.teams,
+    players: season.players,
+    games: season.games,
+    version: 3,
+    timestamp: new Date().toISOString(),
+    appName: 'BasketballStatsDB'
+  }, null, 2)]);
+  const legacyTarget = createFakeDb(storeDefs);
+  const legacyResult = await DBBackupStream.importDatabase(legacyTarget, legacy, { batchSize: 100 });
+  assert.strictEqual(legacyResult.format, 'json');
+  assert.deepStrictEqual(dump(legacyTarget).players, expected.players);
+
+  // Uncompressed NDJSON imports too
+  const plain = await DBBackupStream.exportDatabase(source, { compress: false });
+  assert.strictEqual(plain.extension, 'ndjson');
+  const plainTarget = createFakeDb(storeDefs);
+  await DBBackupStream.importDatabase(plainTarget, plain.blob);
+  assert.deepStrictEqual(dump(plainTarget).games, expected.games);
+
+  // Invalid / truncated files are rejected - the database is not cleared for a bad header
+  const guarded = createFakeDb(storeDefs);
+  fillDb(guarded, season);
+  await assert.rejects(
+    DBBackupStream.importDatabase(guarded, new Blob(['{"appName":"Other"}'])),
+    error => error.code === 'INVALID_BACKUP'
+  );
+  assert.strictEqual(guarded.stores.get('players').rows.size, season.players.length);
+
+  // A truncated file or a bad row is rejected before anything is cleared or written
+  const text = await plain.blob.text();
+  const populated = createFakeDb(storeDefs);
+  fillDb(populated, season);
+  populated.stores.get('players').rows.set('only-here', { id: 'only-here' });
+  const before = dump(populated);
+  const truncated = new Blob([text.slice(0, text.lastIndexOf('{"type":"end"'))]);
+  await assert.rejects(
+    DBBackupStream.importDatabase(populated, truncated),
+    error => error.code === 'INVALID_BACKUP' && error.message.includes('קטוע')
+  );
+  assert.deepStrictEqual(dump(populated), before, 'truncated backup leaves the database unchanged');
+  assert.strictEqual(populated.transactions, 0);
+
+  const lines = text.split('\n');
+  lines.splice(lines.length - 3, 0, '{"type":"rows","store":"games","rows":[');
+  await assert.rejects(
+    DBBackupStream.importDatabase(populated, new Blob([lines.join('\n')])),
+    error => error.code === 'INVALID_BACKUP'
+  );
+  assert.deepStrictEqual(dump(populated), before, 'corrupt row leaves the database unchanged');
+
+  // Progress: the verification pass first, then the import
+  assert.strictEqual(importProgress[0].stage, 'verify');
+  assert.strictEqual(importProgress[importProgress.length - 1].stage, 'import');
+
+  console.log('db-backup-stream tests passed');
+}
+
+run().catch(error => {
+  console.error(error);
+  process.exit(1);
+});
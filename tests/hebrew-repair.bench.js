@@ -0,0 +1,76 @@
+// Benchmark: Hebrew mojibake repair of a whole imported database
+//   deepRepairHebrewNames record by record vs repairCollectionHebrew (fast-path classifier + lookup decoder + memo)
+//   node tests/hebrew-repair.bench.js
+const assert = require('assert');
+const fs = require('fs');
+const path = require('path');
+const vm = require('vm');
+const { generateImportedDb } = require('./helpers/hebrew-mojibake');
+
+function loadRepair() {
+  const context = { console: { log() {}, warn() {}, error() {} }, TextDecoder };
+  context.window = context;
+  vm.createContext(context);
+  const file = path.join(__dirname, '..', 'js', 'cp1252Utf8Repair.js');
+  vm.runInContext(fs.readFileSync(file, 'utf8'), context, { filename: file });
+  return context;
+}
+
+// best of `runs` (GC pauses make single runs noisy)
+function time(fn, runs = 5) {
+  let best = { result: null, ms: Infinity };
+  for (let i = 0; i < runs; i++) {
+    const startedAt = process.hrtime.bigint();
+    const result = fn();
+    const ms = Number(process.hrtime.bigint() - startedAt) / 1e6;
+    if (ms < best.ms) best = { result, ms };
+  }
+  return best;
+}
+
+function run() {
+  const repair = loadRepair();
+  const KEYS = { teams: 'team_id', players: 'id', games: 'gameSerial' };
+
+  // Records are created inside the vm context (like rows read from IndexedDB in the page) -
+  // walking objects from another context goes through slow cross-context property access
+  const inContext = value => vm.runInContext('JSON.parse', repair)(JSON.stringify(value));
+
+  // warm-up (JIT) so the first row isn't mostly compile time
+  const warmup = inContext(generateImportedDb({ seed: 1, players: 2000, games: 500 }).broken.players);
+  warmup.map(repair.deepRepairHebrewNames);
+  repair.repairCollectionHebrew(warmup, { keyPath: 'id' });
+
+  console.log('players  broken  records  per record(ms)  batch(ms)  records/s (batch)  speedup  identical');
+  for (const [players, brokenShare] of [[2000, 0.5], [10000, 0.5], [10000, 0.05]]) {
+    const { clean, broken: generated } = generateImportedDb({ seed: 7, players, games: players / 4, brokenShare });
+    const broken = inContext(generated);
+    const records = Object.values(broken).reduce((sum, rows) => sum + rows.length, 0);
+
+    const perRecord = time(() => Object.fromEntries(
+      Object.entries(broken).map(([store, rows]) => [store, rows.map(repair.deepRepairHebrewNames)])
+    ));
+    const batch = time(() => {
+      const context = repair.createHebrewRepairContext();
+      return Object.fromEntries(Object.entries(broken).map(([store, rows]) =>
+        [store, repair.repairCollectionHebrew(rows, { context, keyPath: KEYS[store] }).records]));
+    });
+
+    assert.deepStrictEqual(JSON.parse(JSON.stringify(batch.result)), JSON.parse(JSON.stringify(perRecord.result)));
+    assert.deepStrictEqual(JSON.parse(JSON.stringify(batch.result)), clean);
+
+    console.log(
+      `${String(players).padStart(7)}  ${`${Math.round(brokenShare * 100)}%`.padStart(6)}  ${String(records).padStart(7)}  ` +
+      `${perRecord.ms.toFixed(0).padStart(14)}  ${batch.ms.toFixed(0).padStart(9)}  ` +
+      `${Math.round(records / (batch.ms / 1000)).toString().padStart(17)}  ` +
+      `${(perRecord.ms / batch.ms).toFixed(1).padStart(6)}x  ${'yes'.padStart(9)}`
+    );
+  }
+}
+
+try {
+  run();
+} catch (error) {
+  console.error(error);
+  process.exit(1);
+}
@@ -0,0 +1,138 @@
+const assert = require('assert');
+const fs = require('fs');
+const path = require('path');
+const vm = require('vm');
+const { createRandom } = require('./helpers/synthetic-season');
+const { createFakeDb } = require('./helpers/fake-indexeddb');
+const { toMojibake, generateImportedDb, FIRST_NAMES, TEAM_NAMES } = require('./helpers/hebrew-mojibake');
+
+function loadRepair(extraContext = {}) {
+  const context = {
+    console: { log() {}, warn() {}, error() {} },
+    TextDecoder,
+    IDBKeyRange: { lowerBound: (lower, lowerOpen) => ({ lower, lowerOpen }) },
+    ...extraContext
+  };
+  context.window = context;
+  vm.createContext(context);
+  const file = path.join(__dirname, '..', 'js', 'cp1252Utf8Repair.js');
+  vm.runInContext(fs.readFileSync(file, 'utf8'), context, { filename: file });
+  return context;
+}
+
+const plain = value => JSON.parse(JSON.stringify(value));
+
+async function run() {
+  const repair = loadRepair();
+
+  // Mojibake of real names is repaired, by both decoders
+  [...FIRST_NAMES, ...TEAM_NAMES].forEach(name => {
+    const broken = toMojibake(name);
+    assert.strictEqual(repair.fixFromCp1252PrintedUtf8(broken), name);
+    assert.strictEqual(repair.fastFixFromCp1252PrintedUtf8(broken), name);
+    assert.strictEqual(repair.classifyHebrewText(broken), 'suspect');
+    assert.strictEqual(repair.classifyHebrewText(name), 'clean');
+  });
+  assert.strictEqual(repair.classifyHebrewText('Maccabi Haifa'), 'clean');
+  assert.strictEqual(repair.classifyHebrewText('Maccabi \\x41'), 'suspect');
+  assert.strictEqual(repair.classifyHebrewText('CafÃ©'), 'suspect');
+
+  // Lookup-table decoder and classifier match the original functions on random input
+  {
+    const random = createRandom(23);
+    const alphabet = [
+      '×', '"', "'", ' ', '\\', 'x', '9', 'D', 'a', 'A', '-', '\u0090', '\u009D', ' ', '©', 'Ã', '©',
+      '“', '”', '™', '€', 'א', 'ש', 'Ж', '😀', '\uD800'
+    ];
+    for (let n = 0; n < 20000; n++) {
+      let text = '';
+      const length = 1 + Math.floor(random() * 12);
+      for (let i = 0; i < length; i++) text += alphabet[Math.floor(random() * alphabet.length)];
+
+      assert.strictEqual(repair.fastFixFromCp1252PrintedUtf8(text), repair.fixFromCp1252PrintedUtf8(text), JSON.stringify(text));
+      if (repair.classifyHebrewText(text) === 'clean') {
+        assert.strictEqual(repair.repairHebrewNames(text), text, JSON.stringify(text));
+      }
+    }
+  }
+
+  // Context: memo for repeated names, repairs that would add '?' are refused
+  {
+    const context = repair.createHebrewRepairContext();
+    const broken = toMojibake('מכבי חיפה');
+    assert.strictEqual(context.repair(broken), 'מכבי חיפה');
+    assert.strictEqual(context.repair(broken), 'מכבי חיפה');
+    assert.strictEqual(context.repair('כהן'), 'כהן');
+    assert.strictEqual(context.stats.memoHits, 1);
+    assert.strictEqual(context.stats.decoded, 1);
+    assert.strictEqual(context.stats.clean, 1);
+
+    assert.strictEqual(repair.repairHebrewNames('Жора'), '????');
+    assert.strictEqual(context.repair('Жора'), 'Жора');
+    assert.strictEqual(context.stats.lossySkipped, 1);
+  }
+
+  // Collections: same result as deepRepairHebrewNames record by record, copy-on-write, key fields untouched
+  const { clean, broken } = generateImportedDb({ seed: 3, players: 200, games: 60 });
+  {
+    const result = repair.repairCollectionHebrew(broken.players, { keyPath: 'id' });
+    assert.deepStrictEqual(plain(result.records), plain(broken.players.map(repair.deepRepairHebrewNames)));
+    assert.deepStrictEqual(plain(result.records), plain(clean.players));
+
+    const untouched = broken.players.findIndex((player, index) => !result.changed.some(entry => entry.index === index));
+    assert.ok(untouched >= 0);
+    assert.strictEqual(result.records[untouched], broken.players[untouched]);
+    assert.strictEqual(result.changed.length, broken.players.filter((player, index) => JSON.stringify(player) !== JSON.stringify(clean.players[index])).length);
+
+    const { record, changes } = repair.repairRecordHebrew(
+      { id: toMojibake('כהן-7'), name: toMojibake('כהן'), games: [{ team: toMojibake('מכבי חיפה') }] },
+      { keyPath: 'id' }
+    );
+    assert.strictEqual(record.id, toMojibake('כהן-7'));
+    assert.deepStrictEqual(plain(changes), [
+      { path: 'name', before: toMojibake('כהן'), after: 'כהן' },
+      { path: 'games[0].team', before: toMojibake('מכבי חיפה'), after: 'מכבי חיפה' }
+    ]);
+  }
+
+  // Whole database: streamed in batches, only changed records written back, report of what changed
+  {
+    const writes = [];
+    const repairWithAdapter = loadRepair({ dbAdapter: { notifyWrite: table => writes.push(table) } });
+    const db = createFakeDb({ teams: 'team_id', players: 'id', games: 'gameSerial' });
+    Object.entries(broken).forEach(([store, rows]) => rows.forEach(row => db.stores.get(store).rows.set(row[db.stores.get(store).keyPath], plain(row))));
+
+    const dry = await repairWithAdapter.repairDatabaseHebrew(db, { dryRun: true, batchSize: 25 });
+    assert.strictEqual(db.stores.get('players').rows.get('p-0').name, broken.players[0].name, 'dry run writes nothing');
+    assert.deepStrictEqual(writes, []);
+
+    const progress = [];
+    const report = await repairWithAdapter.repairDatabaseHebrew(db, {
+      batchSize: 25,
+      reportLimit: 10,
+      onProgress: event => progress.push(event)
+    });
+    ['teams', 'players', 'games'].forEach(store => {
+      const rows = Array.from(db.stores.get(store).rows.values());
+      assert.deepStrictEqual(plain(rows), plain(clean[store]), `${store} repaired`);
+      assert.strictEqual(report.stores[store].scanned, clean[store].length);
+      assert.strictEqual(report.stores[store].changedRecords, dry.stores[store].changedRecords);
+    });
+    assert.strictEqual(report.changes.length, 10);
+    assert.strictEqual(report.changes.length + report.omittedChanges,
+      Object.values(report.stores).reduce((sum, store) => sum + store.changedFields, 0));
+    assert.ok(report.stats.memoHits > 0, 'team names decoded once');
+    assert.strictEqual(progress.filter(event => event.store === 'players').length, 8);
+    assert.deepStrictEqual(writes, ['teams', 'players', 'games']);
+
+    const again = await repairWithAdapter.repairDatabaseHebrew(db, { batchSize: 25 });
+    assert.ok(Object.values(again.stores).every(store => store.changedRecords === 0), 'second run is a no-op');
+  }
+
+  console.log('hebrew-repair tests passed');
+}
+
+run().catch(error => {
+  console.error(error);
+  process.exit(1);
+});
@@ -0,0 +1,136 @@
+// Benchmark harness on the same vm loading the tests use
+//   loadIbbaModules(names) -> window with the loaded classes
+//   measureStage(fn, options) -> { samples, batch, opsPerSec, meanMs, p50Ms, p95Ms, heapGrowthBytes }
+//   compareToBaseline(results, baseline, options) -> [{ stage, metric, baseline, current, ratio }]
+const fs = require('fs');
+const path = require('path');
+const vm = require('vm');
+
+const IBBA_DIR = path.join(__dirname, '..', '..', 'js', 'ibba');
+
+function loadIbbaModules(names) {
+  const context = {
+    console: { log() {}, warn() {}, error() {}, time() {}, timeEnd() {} },
+    window: {},
+    document: { createElement() { return { innerHTML: '', get value() { return this.innerHTML; } }; } },
+    sessionStorage: { getItem() { return null; }, setItem() {}, removeItem() {} }
+  };
+  vm.createContext(context);
+  names.forEach(name => {
+    const file = path.join(IBBA_DIR, name);
+    vm.runInContext(fs.readFileSync(file, 'utf8'), context, { filename: file });
+  });
+  return context.window;
+}
+
+function collectGarbage() {
+  if (typeof global.gc === 'function') {
+    global.gc();
+    global.gc();
+  }
+}
+
+function percentile(sorted, p) {
+  if (sorted.length === 0) return 0;
+  const index = Math.min(sorted.length - 1, Math.max(0, Math.ceil(p / 100 * sorted.length) - 1));
+  return sorted[index];
+}
+
+/**
+ * Times fn (sync or async, receives the call index) in samples.
+ * Calls faster than minSampleMs are batched so one sample is at least minSampleMs long;
+ * p50/p95 are per call. Heap growth is retained heap after the run (exact with --expose-gc).
+ */
+async function measureStage(fn, options = {}) {
+  const { samples = 30, warmup = 3, warmupMs = 150, minSampleMs = 2, maxBatch = 10000 } = options;
+  let calls = 0;
+  // sync stages are not awaited (a microtask per call would dominate µs-scale stages)
+  const call = () => {
+    const result = fn(calls++);
+    return result && typeof result.then === 'function' ? result : null;
+  };
+
+  // warmup: at least `warmup` calls and `warmupMs` of running, so the JIT has settled
+  const warmupStart = process.hrtime.bigint();
+  for (let i = 0; i < warmup || Number(process.hrtime.bigint() - warmupStart) / 1e6 < warmupMs; i++) {
+    const pending = call();
+    if (pending) await pending;
+  }
+
+  // calibration: how many calls make one sample
+  let batch = 1;
+  const calibrateStart = process.hrtime.bigint();
+  const first = call();
+  if (first) await first;
+  const singleMs = Number(process.hrtime.bigint() - calibrateStart) / 1e6;
+  if (singleMs < minSampleMs) {
+    batch = Math.min(maxBatch, Math.ceil(minSampleMs / Math.max(singleMs, 1e-4)));
+  }
+
+  collectGarbage();
+  const heapBefore = process.memoryUsage().heapUsed;
+  const times = [];
+  for (let s = 0; s < samples; s++) {
+    const startedAt = process.hrtime.bigint();
+    for (let b = 0; b < batch; b++) {
+      const pending = call();
+      if (pending) await pending;
+    }
+    times.push(Number(process.hrtime.bigint() - startedAt) / 1e6 / batch);
+  }
+  collectGarbage();
+  const heapGrowthBytes = process.memoryUsage().heapUsed - heapBefore;
+
+  const sorted = times.slice().sort((a, b) => a - b);
+  const meanMs = times.reduce((sum, ms) => sum + ms, 0) / times.length;
+  return {
+    samples,
+    batch,
+    opsPerSec: meanMs > 0 ? 1000 / meanMs : 0,
+    meanMs,
+    p50Ms: percentile(sorted, 50),
+    p95Ms: percentile(sorted, 95),
+    heapGrowthBytes
+  };
+}
+
+/**
+ * A stage regresses when its p50 is slower than baseline by more than `tolerance` (0.25 = 25%)
+ * and by more than `minDeltaMs` (timer noise on sub-millisecond stages).
+ * Heap growth regresses past `heapTolerance` and `minHeapDeltaBytes` (only with --expose-gc numbers).
+ */
+function compareToBaseline(results, baseline, options = {}) {
+  const {
+    tolerance = 0.25,
+    minDeltaMs = 0.05,
+    heapTolerance = 1,
+    minHeapDeltaBytes = 4 * 1024 * 1024
+  } = options;
+  const regressions = [];
+
+  Object.entries(baseline.stages || {}).forEach(([stage, expected]) => {
+    const current = results.stages[stage];
+    if (!current) {
+      regressions.push({ stage, metric: 'missing', baseline: expected.p50Ms, current: null, ratio: null });
+      return;
+    }
+    if (current.p50Ms > expected.p50Ms * (1 + tolerance) && current.p50Ms - expected.p50Ms > minDeltaMs) {
+      regressions.push({ stage, metric: 'p50Ms', baseline: expected.p50Ms, current: current.p50Ms, ratio: current.p50Ms / expected.p50Ms });
+    }
+    if (results.gcExposed && baseline.gcExposed &&
+        current.heapGrowthBytes > Math.max(expected.heapGrowthBytes, 0) * (1 + heapTolerance) &&
+        current.heapGrowthBytes - expected.heapGrowthBytes > minHeapDeltaBytes) {
+      regressions.push({
+        stage,
+        metric: 'heapGrowthBytes',
+        baseline: expected.heapGrowthBytes,
+        current: current.heapGrowthBytes,
+        ratio: expected.heapGrowthBytes > 0 ? current.heapGrowthBytes / expected.heapGrowthBytes : null
+      });
+    }
+  });
+
+  return regressions;
+}
+
+module.exports = { loadIbbaModules, measureStage, compareToBaseline, percentile };
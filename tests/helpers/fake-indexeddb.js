@@ -0,0 +1,72 @@
+// In-memory stand-in for the parts of IndexedDB the batch readers/writers use
+const assert = require('assert');
+
+/**
+ * Minimal in-memory IndexedDB: getAll/getAllKeys with lowerBound ranges, add, put, clear
+ */
+function createFakeDb(storeDefs) {
+  const stores = new Map(Object.entries(storeDefs).map(([name, keyPath]) => [name, { keyPath, rows: new Map() }]));
+  const db = {
+    stores,
+    transactions: 0,
+    objectStoreNames: { contains: name => stores.has(name) },
+    transaction(names, mode) {
+      db.transactions++;
+      let pending = 0;
+      const tx = { mode, error: null };
+      const finish = () => {
+        if (--pending === 0) setImmediate(() => tx.oncomplete && tx.oncomplete());
+      };
+      const request = run => {
+        const req = {};
+        pending++;
+        setImmediate(() => {
+          try {
+            req.result = run();
+            if (req.onsuccess) req.onsuccess({ target: req });
+          } catch (error) {
+            req.error = error;
+            let prevented = false;
+            if (req.onerror) req.onerror({ target: req, preventDefault: () => { prevented = true; }, stopPropagation() {} });
+            if (!prevented) {
+              tx.error = error;
+              setImmediate(() => tx.onabort && tx.onabort());
+              return;
+            }
+          }
+          finish();
+        });
+        return req;
+      };
+      tx.objectStore = name => {
+        assert.ok(names.includes(name), `store ${name} not in transaction`);
+        const store = stores.get(name);
+        const inRange = (range) => {
+          const keys = Array.from(store.rows.keys()).sort((a, b) => (a < b ? -1 : a > b ? 1 : 0));
+          return range ? keys.filter(key => (range.lowerOpen ? key > range.lower : key >= range.lower)) : keys;
+        };
+        return {
+          keyPath: store.keyPath,
+          getAll: (range, limit) => request(() => inRange(range).slice(0, limit).map(key => store.rows.get(key))),
+          getAllKeys: (range, limit) => request(() => inRange(range).slice(0, limit)),
+          add: row => request(() => {
+            const key = row[store.keyPath];
+            if (store.rows.has(key)) throw new Error('ConstraintError');
+            store.rows.set(key, row);
+            return key;
+          }),
+          put: row => request(() => {
+            const key = row[store.keyPath];
+            store.rows.set(key, row);
+            return key;
+          }),
+          clear: () => request(() => store.rows.clear())
+        };
+      };
+      return tx;
+    }
+  };
+  return db;
+}
+
+module.exports = { createFakeDb };
@@ -0,0 +1,81 @@
+// Hebrew names printed the way broken imports store them: UTF-8 bytes shown as CP-1252
+// (bytes CP-1252 leaves undefined - 0x81, 0x8D, 0x8F, 0x90, 0x9D - appear as \xNN)
+const { createRandom } = require('./synthetic-season');
+
+const CP1252_BYTE_TO_CHAR = {
+  0x80: 0x20AC, 0x82: 0x201A, 0x83: 0x0192, 0x84: 0x201E, 0x85: 0x2026,
+  0x86: 0x2020, 0x87: 0x2021, 0x88: 0x02C6, 0x89: 0x2030, 0x8A: 0x0160,
+  0x8B: 0x2039, 0x8C: 0x0152, 0x8E: 0x017D, 0x91: 0x2018, 0x92: 0x2019,
+  0x93: 0x201C, 0x94: 0x201D, 0x95: 0x2022, 0x96: 0x2013, 0x97: 0x2014,
+  0x98: 0x02DC, 0x99: 0x2122, 0x9A: 0x0161, 0x9B: 0x203A, 0x9C: 0x0153,
+  0x9E: 0x017E, 0x9F: 0x0178
+};
+
+const FIRST_NAMES = ['אוהד', 'ים', 'נועם', 'איתי', 'דניאל', 'עומר', 'יונתן', 'רועי', 'אלון', 'גיא', 'שחר', 'עידו', 'טל', 'מתן', 'אביב'];
+const FAMILY_NAMES = ['כהן', 'לוי', 'מזרחי', 'פרץ', 'ביטון', 'אברהם', 'פרידמן', 'שפירא', 'גולן', 'ברק', 'נחום', 'אזולאי'];
+const TEAM_NAMES = ['מכבי חיפה', 'הפועל ירושלים', 'עירוני נהריה', 'אליצור נתניה', 'בני הרצליה', 'הפועל גליל עליון', 'מכבי רעננה', 'א.ס. רמת השרון'];
+
+function toMojibake(text) {
+  let out = '';
+  for (const byte of Buffer.from(text, 'utf8')) {
+    if (byte < 0x80 || byte >= 0xA0) out += String.fromCharCode(byte);
+    else if (CP1252_BYTE_TO_CHAR[byte]) out += String.fromCharCode(CP1252_BYTE_TO_CHAR[byte]);
+    else out += `\\x${byte.toString(16).toUpperCase()}`;
+  }
+  return out;
+}
+
+/**
+ * Imported database: teams / players / games where a share of the Hebrew strings are mojibake
+ * @returns {{ clean: {teams, players, games}, broken: {teams, players, games} }}
+ */
+function generateImportedDb({ seed = 1, players: playerCount = 300, games: gameCount = 100, brokenShare = 0.5 } = {}) {
+  const random = createRandom(seed);
+  const pick = list => list[Math.floor(random() * list.length)];
+  const maybeBreak = text => (random() < brokenShare ? toMojibake(text) : text);
+
+  const clean = { teams: [], players: [], games: [] };
+  const broken = { teams: [], players: [], games: [] };
+
+  TEAM_NAMES.forEach((name, index) => {
+    const team = { team_id: `t-${index + 1}`, name_he: name, name_en: `Team ${index + 1}` };
+    clean.teams.push(team);
+    broken.teams.push({ ...team, name_he: maybeBreak(name) });
+  });
+
+  for (let i = 0; i < playerCount; i++) {
+    const firstName = pick(FIRST_NAMES);
+    const familyName = pick(FAMILY_NAMES);
+    const team = pick(TEAM_NAMES);
+    const player = {
+      id: `p-${i}`,
+      name: `${firstName} ${familyName}`,
+      firstNameHe: firstName,
+      familyNameHe: familyName,
+      team,
+      jersey: String(Math.floor(random() * 99)),
+      games: Array.from({ length: 3 }, (_, g) => ({ gameId: g + 1, team, points: Math.floor(random() * 30) }))
+    };
+    clean.players.push(player);
+    broken.players.push({
+      ...player,
+      name: maybeBreak(player.name),
+      firstNameHe: maybeBreak(firstName),
+      familyNameHe: maybeBreak(familyName),
+      team: maybeBreak(team),
+      games: player.games.map(game => ({ ...game, team: maybeBreak(game.team) }))
+    });
+  }
+
+  for (let i = 0; i < gameCount; i++) {
+    const home = pick(TEAM_NAMES);
+    const away = pick(TEAM_NAMES.filter(name => name !== home));
+    const game = { gameSerial: i + 1, teams: [home, away], date: '2025-11-01', notes: 'Round 1' };
+    clean.games.push(game);
+    broken.games.push({ ...game, teams: game.teams.map(maybeBreak) });
+  }
+
+  return { clean, broken };
+}
+
+module.exports = { toMojibake, generateImportedDb, FIRST_NAMES, FAMILY_NAMES, TEAM_NAMES };
@@ -0,0 +1,233 @@
+// Loads the merge tools in a vm context and keeps a copy of the original full O(n²) alias scans
+// so the indexed scans can be checked (and benchmarked) against them.
+const fs = require('fs');
+const path = require('path');
+const vm = require('vm');
+const { createRandom } = require('./synthetic-season');
+
+const JS_DIR = path.join(__dirname, '..', '..', 'js');
+
+function loadMergeTools() {
+  const context = {
+    console: { log() {}, warn() {}, error() {} },
+    document: { readyState: 'complete', getElementById: () => null },
+    setTimeout,
+    alert() {}
+  };
+  context.window = context;
+  vm.createContext(context);
+  ['name_similarity.js', 'player_merge_tool.js', 'team_merge_tool.js'].forEach(name => {
+    const file = path.join(JS_DIR, name);
+    vm.runInContext(fs.readFileSync(file, 'utf8'), context, { filename: file });
+  });
+  return context;
+}
+
+// --- Original implementations (before the shared similarity engine) ---
+
+function levenshteinMatrix(str1, str2) {
+  const matrix = [];
+  for (let i = 0; i <= str2.length; i++) matrix[i] = [i];
+  for (let j = 0; j <= str1.length; j++) matrix[0][j] = j;
+  for (let i = 1; i <= str2.length; i++) {
+    for (let j = 1; j <= str1.length; j++) {
+      matrix[i][j] = str2.charAt(i - 1) === str1.charAt(j - 1)
+        ? matrix[i - 1][j - 1]
+        : Math.min(matrix[i - 1][j - 1] + 1, matrix[i][j - 1] + 1, matrix[i - 1][j] + 1);
+    }
+  }
+  return matrix[str2.length][str1.length];
+}
+
+function nameSimilarity(name1, name2) {
+  const maxLength = Math.max(name1.length, name2.length);
+  if (maxLength === 0) return 100;
+  return Math.round(((maxLength - levenshteinMatrix(name1, name2)) / maxLength) * 100);
+}
+
+function referencePlayerAliases(players, tools) {
+  const { getPlayerTeam, getPlayerJersey, selectTargetPlayer } = tools;
+  const nameOf = player => `${player.firstNameHe || ''} ${player.familyNameHe || ''}`.trim().toLowerCase();
+  const similar = (player1, player2) => {
+    const name1 = nameOf(player1);
+    const name2 = nameOf(player2);
+    if (!name1 || !name2) return false;
+    const team1 = getPlayerTeam(player1);
+    const team2 = getPlayerTeam(player2);
+    const jersey1 = getPlayerJersey(player1);
+    const jersey2 = getPlayerJersey(player2);
+    const sameTeam = team1 && team2 && team1 === team2;
+    const sameJersey = jersey1 && jersey2 && jersey1 === jersey2;
+    if (sameTeam && sameJersey && nameSimilarity(name1, name2) > 80) return true;
+    return nameSimilarity(name1, name2) > 95;
+  };
+
+  const aliases = [];
+  const processed = new Set();
+  const addGroup = group => {
+    if (group.length < 2) return;
+    const targetPlayer = selectTargetPlayer(group);
+    aliases.push({ targetPlayer, aliasPlayers: group.filter(p => p.id !== targetPlayer.id) });
+  };
+
+  const groups = new Map();
+  for (const player of players) {
+    const key = `${getPlayerTeam(player)}|${getPlayerJersey(player)}`;
+    if (!groups.has(key)) groups.set(key, []);
+    groups.get(key).push(player);
+  }
+  for (const groupPlayers of groups.values()) {
+    if (groupPlayers.length < 2) continue;
+    for (let i = 0; i < groupPlayers.length; i++) {
+      const player1 = groupPlayers[i];
+      if (processed.has(player1.id)) continue;
+      const group = [player1];
+      processed.add(player1.id);
+      for (let j = i + 1; j < groupPlayers.length; j++) {
+        const player2 = groupPlayers[j];
+        if (processed.has(player2.id)) continue;
+        if (similar(player1, player2)) {
+          group.push(player2);
+          processed.add(player2.id);
+        }
+      }
+      addGroup(group);
+    }
+  }
+
+  for (let i = 0; i < players.length; i++) {
+    const player1 = players[i];
+    if (processed.has(player1.id)) continue;
+    const group = [player1];
+    processed.add(player1.id);
+    for (let j = i + 1; j < players.length; j++) {
+      const player2 = players[j];
+      if (processed.has(player2.id)) continue;
+      const name1 = nameOf(player1);
+      const name2 = nameOf(player2);
+      if (name1 && name2 && nameSimilarity(name1, name2) > 95) {
+        group.push(player2);
+        processed.add(player2.id);
+      }
+    }
+    addGroup(group);
+  }
+  return aliases;
+}
+
+function referenceTeamAliases(teams) {
+  const nameOf = team => (team.name_he || team.name_en || '').toLowerCase();
+  const similar = (team1, team2) => {
+    const name1 = nameOf(team1);
+    const name2 = nameOf(team2);
+    if (name1 === name2) return true;
+    const words1 = name1.split(/\s+/).filter(w => w.length > 2);
+    const words2 = name2.split(/\s+/).filter(w => w.length > 2);
+    if (words1.filter(word => words2.includes(word)).length >= 2) return true;
+    if (name1.includes(name2) || name2.includes(name1)) return true;
+    return 1 - (levenshteinMatrix(name1, name2) / Math.max(name1.length, name2.length)) > 0.7;
+  };
+  const different = (team1, team2) => {
+    if (team1.team_id && team2.team_id) return team1.team_id !== team2.team_id;
+    return nameOf(team1).trim() !== nameOf(team2).trim();
+  };
+
+  const groups = [];
+  const processed = new Set();
+  for (let i = 0; i < teams.length; i++) {
+    if (processed.has(i)) continue;
+    const group = [i];
+    for (let j = i + 1; j < teams.length; j++) {
+      if (processed.has(j)) continue;
+      if (similar(teams[i], teams[j]) && different(teams[i], teams[j])) {
+        group.push(j);
+        processed.add(j);
+      }
+    }
+    if (group.length > 1) groups.push(group);
+    processed.add(i);
+  }
+  return groups;
+}
+
+// --- Synthetic data ---
+
+const FIRST = ['אבי', 'דניאל', 'יונתן', 'עומר', 'איתי', 'נועם', 'רועי', 'גיא', 'עידו', 'תומר', 'אלון', 'ניר',
+  "ג'יימס", 'מייקל', 'כריס', 'אנתוני', 'טייריק', 'דמיטרי', 'שחר', 'יובל', 'אורי', 'בן', 'רון', 'עמית'];
+const FAMILY = ['כהן', 'לוי', 'מזרחי', 'פרץ', 'ביטון', 'אברהם', 'פרידמן', 'אזולאי', 'גולדברג', 'שפירא',
+  'ג\'ונסון', 'וויליאמס', 'סמית\'', 'בראון', 'דייויס', 'רובינסון', 'קרמר', 'ברגר', 'אלמוג', 'שטרן',
+  'טרנר', 'יוג\'ין טרנר', 'הרננדס', 'וקנין', 'חדד', 'אוחיון', 'סויסה', 'בן חמו'];
+const LETTERS = 'אבגדהוזחטיכלמנסעפצקרשת';
+
+function mutate(random, name) {
+  const chars = name.split('');
+  const position = Math.floor(random() * chars.length);
+  const roll = random();
+  if (roll < 0.4) chars[position] = LETTERS[Math.floor(random() * LETTERS.length)];
+  else if (roll < 0.7) chars.splice(position, 1);
+  else chars.splice(position, 0, LETTERS[Math.floor(random() * LETTERS.length)]);
+  return chars.join('');
+}
+
+/**
+ * Players accumulated over several seasons: mostly distinct, some typo/duplicate aliases
+ */
+function generatePlayers({ seed = 1, count = 1000, teams = 80 } = {}) {
+  const random = createRandom(seed);
+  const pick = list => list[Math.floor(random() * list.length)];
+  const players = [];
+
+  const makePlayer = (firstNameHe, familyNameHe, team, jersey, games) => ({
+    id: `p${players.length}`,
+    firstNameHe,
+    familyNameHe,
+    games: Array.from({ length: games }, (_, g) => ({ gameSerial: 1000 + g, team, jersey }))
+  });
+
+  while (players.length < count) {
+    const first = pick(FIRST);
+    // long suffix makes most names unique, like real rosters accumulated across seasons
+    const family = `${pick(FAMILY)}${random() < 0.6 ? ` ${pick(FAMILY)}` : ''}`;
+    const team = random() < 0.08 ? '' : `team-${Math.floor(random() * teams)}`;
+    const jersey = random() < 0.08 ? '' : String(Math.floor(random() * 100));
+    players.push(makePlayer(first, family, team, jersey, 1 + Math.floor(random() * 20)));
+
+    const roll = random();
+    if (roll < 0.05) {
+      // same team & jersey, misspelled name (80% rule)
+      players.push(makePlayer(first, mutate(random, family), team, jersey, 1 + Math.floor(random() * 5)));
+    } else if (roll < 0.08) {
+      // exact duplicate from another season/team (95% rule)
+      players.push(makePlayer(first, family, `team-${Math.floor(random() * teams)}`, String(Math.floor(random() * 100)), 2));
+    }
+  }
+  return players.slice(0, count);
+}
+
+function generateTeams({ seed = 1, count = 120 } = {}) {
+  const random = createRandom(seed);
+  const cities = ['תל אביב', 'חיפה', 'ירושלים', 'באר שבע', 'רמת גן', 'הרצליה', 'נתניה', 'אשדוד', 'עפולה', 'גליל עליון',
+    'מגדל העמק', 'קריית גת', 'רחובות', 'חולון', 'כפר סבא', 'רעננה', 'אילת', 'טבריה', 'צפת', 'נהריה', 'עכו', 'לוד'];
+  const prefixes = ['הפועל', 'מכבי', 'אליצור', 'בני', 'עירוני', 'א.ס.'];
+  const teams = [];
+  while (teams.length < count) {
+    const name = `${prefixes[Math.floor(random() * prefixes.length)]} ${cities[Math.floor(random() * cities.length)]}`;
+    const roll = random();
+    const variant = roll < 0.2 ? mutate(random, name) : roll < 0.3 ? `${name} ${Math.floor(random() * 3)}` : name;
+    teams.push(random() < 0.5
+      ? { team_id: `t${teams.length}`, name_he: variant, name_en: variant, games: Math.floor(random() * 30) }
+      : { name_he: variant, name_en: variant });
+  }
+  return teams;
+}
+
+const aliasIds = aliases => aliases.map(alias => [alias.targetPlayer.id, ...alias.aliasPlayers.map(p => p.id)]);
+
+module.exports = {
+  loadMergeTools,
+  referencePlayerAliases,
+  referenceTeamAliases,
+  generatePlayers,
+  generateTeams,
+  aliasIds
+};
@@ -0,0 +1,185 @@
+// Seeded generator of IBBA event JSON (the shape IBBAAdapter.convertToInternalFormat consumes)
+//   generateSeason({ seed, teams, rounds, seasons, playersPerTeam }) -> Array<event>
+//   node tests/helpers/synthetic-season.js [--seed 42] [--teams 12] [--rounds 22] [--seasons 1] [--players 12] > events.json
+
+function createRandom(seed) {
+  // mulberry32
+  let state = seed >>> 0;
+  return () => {
+    state = (state + 0x6D2B79F5) >>> 0;
+    let t = state;
+    t = Math.imul(t ^ (t >>> 15), t | 1);
+    t ^= t + Math.imul(t ^ (t >>> 7), t | 61);
+    return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+  };
+}
+
+const TEAM_NAMES = [
+  'מכבי חיפה', 'הפועל גליל עליון', 'אליצור נתניה', 'הפועל רמת גן', 'מכבי רחובות',
+  'עירוני נהריה', 'הפועל קריית גת', 'אליצור יבנה', 'מכבי הרצליה', 'הפועל כפר סבא',
+  'בני יהודה', 'עירוני רמת השרון', 'הפועל עפולה', 'מכבי קריית מוצקין', 'אליצור אשקלון', 'הפועל ערד'
+];
+
+function formatMinutes(minutes) {
+  const whole = Math.floor(minutes);
+  const seconds = Math.floor((minutes - whole) * 60);
+  return `${whole}:${String(seconds).padStart(2, '0')}`;
+}
+
+function playerLine(random, minutesShare) {
+  const minutes = minutesShare * 40;
+  const fga = Math.round(random() * minutesShare * 30);
+  const fgm = Math.round(fga * (0.35 + random() * 0.25));
+  const threepa = Math.round(fga * random() * 0.5);
+  const threepm = Math.min(Math.round(threepa * (0.25 + random() * 0.2)), fgm);
+  const fta = Math.round(random() * minutesShare * 10);
+  const ftm = Math.round(fta * (0.6 + random() * 0.3));
+  const off = Math.round(random() * minutesShare * 5);
+  const def = Math.round(random() * minutesShare * 12);
+  const ast = Math.round(random() * minutesShare * 10);
+  const stl = Math.round(random() * minutesShare * 4);
+  const blk = Math.round(random() * minutesShare * 3);
+  const to = Math.round(random() * minutesShare * 6);
+  const pf = Math.round(random() * 5);
+  const pts = (fgm - threepm) * 2 + threepm * 3 + ftm;
+
+  return {
+    number: '',
+    status: 'sub',
+    pts, fgm, fga, threepm, threepa, ftm, fta, off, def, ast, stl, blk, to, pf,
+    pfa: Math.round(random() * 5),
+    blka: Math.round(random() * 2),
+    min: minutes > 0 ? formatMinutes(minutes) : '0:00',
+    pm: Math.round((random() - 0.5) * 30),
+    rate: pts + off + def + ast + stl + blk - (fga - fgm) - (fta - ftm) - to
+  };
+}
+
+function teamPerformance(random, teamId, roster) {
+  const performance = {};
+  const totals = {
+    pts: 0, fgm: 0, fga: 0, threepm: 0, threepa: 0, ftm: 0, fta: 0,
+    off: 0, def: 0, ast: 0, stl: 0, blk: 0, to: 0, pf: 0
+  };
+  let benchPoints = 0;
+
+  roster.forEach((playerId, index) => {
+    const share = index < 5 ? 0.6 + random() * 0.3 : (index < 10 ? random() * 0.45 : 0);
+    const line = playerLine(random, share);
+    line.number = String(index + 4);
+    line.status = index < 5 ? 'lineup' : 'sub';
+    performance[playerId] = line;
+    Object.keys(totals).forEach(key => { totals[key] += line[key]; });
+    if (index >= 5) benchPoints += line.pts;
+  });
+
+  performance[0] = totals;
+  return {
+    performance,
+    points: totals.pts,
+    advanced: {
+      pfb: Math.round(random() * 20),
+      pto: Math.round(random() * 20),
+      pipm: Math.round(random() * 40),
+      pipa: Math.round(40 + random() * 20),
+      psc: Math.round(random() * 15),
+      pbc: benchPoints
+    }
+  };
+}
+
+function splitQuarters(random, points) {
+  const weights = [random() + 0.5, random() + 0.5, random() + 0.5, random() + 0.5];
+  const sum = weights.reduce((a, b) => a + b, 0);
+  const quarters = weights.map(weight => Math.floor(points * weight / sum));
+  quarters[3] += points - quarters.reduce((a, b) => a + b, 0);
+  return { one: quarters[0], two: quarters[1], three: quarters[2], four: quarters[3] };
+}
+
+/**
+ * @param {Object} options
+ * @param {number} options.seed
+ * @param {number} options.teams - even number, up to 16
+ * @param {number} options.rounds - rounds per season (double round-robin = (teams - 1) * 2)
+ * @param {number} options.seasons
+ * @param {number} options.playersPerTeam
+ */
+function generateSeason(options = {}) {
+  const {
+    seed = 42,
+    teams: teamCount = 12,
+    rounds = (teamCount - 1) * 2,
+    seasons = 1,
+    playersPerTeam = 12
+  } = options;
+  const random = createRandom(seed);
+  const events = [];
+  let nextEventId = 700000;
+
+  for (let season = 0; season < seasons; season++) {
+    const teamIds = Array.from({ length: teamCount }, (_, i) => 1000 + season * 100 + i);
+    const rosters = new Map(teamIds.map((teamId, t) => [
+      teamId,
+      Array.from({ length: playersPerTeam }, (_, p) => String(800000 + season * 10000 + t * 100 + p))
+    ]));
+    const names = new Map(teamIds.map((teamId, t) => [teamId, TEAM_NAMES[t % TEAM_NAMES.length] + (t >= TEAM_NAMES.length ? ` ${t}` : '')]));
+    const seasonStart = Date.UTC(2021 + season, 9, 10, 18, 0, 0);
+
+    // circle-method round robin
+    const rotation = teamIds.slice();
+    for (let round = 0; round < rounds; round++) {
+      for (let i = 0; i < teamCount / 2; i++) {
+        let home = rotation[i];
+        let away = rotation[teamCount - 1 - i];
+        if (Math.floor(round / (teamCount - 1)) % 2 === 1) [home, away] = [away, home];
+
+        const homeSide = teamPerformance(random, home, rosters.get(home));
+        const awaySide = teamPerformance(random, away, rosters.get(away));
+        if (homeSide.points === awaySide.points) {
+          homeSide.points += 1;
+          homeSide.performance[0].pts += 1;
+          homeSide.performance[0].ftm += 1;
+          homeSide.performance[0].fta += 1;
+        }
+        const date = new Date(seasonStart + round * 7 * 86400000 + i * 3600000).toISOString().slice(0, 19);
+
+        events.push({
+          id: nextEventId++,
+          date,
+          date_gmt: date,
+          link: `https://ibasketball.co.il/event/${nextEventId}/`,
+          stage_id: round + 1,
+          teams: [home, away],
+          title: { rendered: `${names.get(home)} &#8211; ${names.get(away)}`.replace('&#8211;', '—') },
+          home: { team: names.get(home) },
+          away: { team: names.get(away) },
+          league: { name: 'לאומית', gender: 'M' },
+          winner: homeSide.points > awaySide.points ? home : away,
+          outcome: {},
+          performance: { [home]: homeSide.performance, [away]: awaySide.performance },
+          results: {
+            [home]: splitQuarters(random, homeSide.points),
+            [away]: splitQuarters(random, awaySide.points)
+          },
+          sp_teams: { [home]: homeSide.advanced, [away]: awaySide.advanced }
+        });
+      }
+      rotation.splice(1, 0, rotation.pop());
+    }
+  }
+
+  return events;
+}
+
+module.exports = { generateSeason, createRandom };
+
+if (require.main === module) {
+  const flags = { '--seed': 'seed', '--teams': 'teams', '--rounds': 'rounds', '--seasons': 'seasons', '--players': 'playersPerTeam' };
+  const options = {};
+  const argv = process.argv.slice(2);
+  for (let i = 0; i < argv.length; i += 2) {
+    if (!flags[argv[i]]) throw new Error(`Unknown option: ${argv[i]}`);
+    options[flags[argv[i]]] = Number(argv[i + 1]);
+  }
+  process.stdout.write(JSON.stringify(generateSeason(options)) + '\n');
+}
@@ -0,0 +1,163 @@
+// Seeded SportsPress/WordPress league pages - the markup IBBATableExtractor and the old DOM parsers read
+//   buildLeaguePage({ seed, teams, playersPerTeam, chromeKb, nonce }) -> html string
+//     .sp-league-table standings, .sp-player-list with tr[data-pm] rows, and page chrome
+//     (head, inline scripts/styles, menus, widgets, footer) around them
+//   node tests/helpers/wp-league-page.js [--seed 5] [--teams 14] [--players 13] [--chrome 160] > page.html
+const { createRandom } = require('./synthetic-season');
+
+const TEAM_NAMES = [
+  'מכבי חיפה', 'הפועל גליל עליון', 'אליצור נתניה', 'הפועל רמת גן', 'מכבי רחובות',
+  'עירוני נהריה', 'הפועל קריית גת', 'אליצור יבנה', 'מכבי הרצליה', 'הפועל כפר סבא',
+  'בני יהודה', 'עירוני רמת השרון', 'הפועל עפולה', 'מכבי קריית מוצקין', 'אליצור אשקלון', 'הפועל ערד'
+];
+const FIRST_NAMES = ['יונתן', 'איתי', 'עומר', 'נועם', 'דניאל', 'אורי', 'רון', 'גיא', 'תומר', 'עידו', 'אלון', 'Jordan', 'Marcus', 'Tyler'];
+const LAST_NAMES = ['כהן', 'לוי', 'מזרחי', 'פרץ', 'ביטון', 'אברהם', 'פרידמן', 'אזולאי', 'Williams', 'Johnson', 'Brown', 'O&#8217;Neal'];
+
+function teamName(t) {
+  return TEAM_NAMES[t % TEAM_NAMES.length] + (t >= TEAM_NAMES.length ? ` ${t}` : '');
+}
+
+function buildStandings(random, teams) {
+  const rows = Array.from({ length: teams }, (_, t) => {
+    const gp = 20 + Math.floor(random() * 3);
+    const w = Math.floor(random() * (gp + 1));
+    const bf = Math.round(gp * (72 + random() * 14));
+    const ba = Math.round(gp * (72 + random() * 14));
+    return { t, id: 5000 + t, gp, w, l: gp - w, bf, ba, bd: bf - ba, pts: w * 2 + (gp - w) };
+  }).sort((a, b) => b.pts - a.pts || b.bd - a.bd);
+
+  const body = rows.map((row, index) => `
+<tr class="${index % 2 ? 'odd' : 'even'}">
+  <td class="data-rank">${index + 1}</td>
+  <td class="data-name has-logo"><span class="team-logo"><img width="32" height="32" src="https://ibasketball.co.il/wp-content/uploads/logo-${row.id}.png" class="attachment-sp_fit_icon" alt="" loading="lazy" /></span><a href="https://ibasketball.co.il/team/${row.id}/">${teamName(row.t)}</a></td>
+  <td class="data-gp">${row.gp}</td><td class="data-w">${row.w}</td><td class="data-l">${row.l}</td>
+  <td class="data-bf">${row.bf}</td><td class="data-ba">${row.ba}</td><td class="data-bd">${row.bd}</td>
+  <td class="data-pts">${row.pts}</td>
+</tr>`).join('');
+
+  return `
+<div class="sp-template sp-template-league-table">
+  <h4 class="sp-table-caption">טבלת הליגה</h4>
+  <div class="sp-table-wrapper">
+    <table class="sp-league-table sp-data-table sp-sortable-table sp-responsive-table table_66a1 sp-scrollable-table" data-sp-rows="20">
+      <thead><tr>
+        <th class="data-rank">מיקום</th><th class="data-name">קבוצה</th><th class="data-gp">מש</th><th class="data-w">נצ</th>
+        <th class="data-l">הפ</th><th class="data-bf">זכות</th><th class="data-ba">חובה</th><th class="data-bd">הפרש</th><th class="data-pts">נק</th>
+      </tr></thead>
+      <tbody>${body}
+      </tbody>
+    </table>
+  </div>
+</div>`;
+}
+
+function buildPlayerList(random, teams, playersPerTeam) {
+  const rows = [];
+  for (let t = 0; t < teams; t++) {
+    for (let p = 0; p < playersPerTeam; p++) {
+      const id = 900000 + t * 100 + p;
+      const name = `${FIRST_NAMES[Math.floor(random() * FIRST_NAMES.length)]} ${LAST_NAMES[Math.floor(random() * LAST_NAMES.length)]}`;
+      const gp = 1 + Math.floor(random() * 20);
+      const pts = (random() * 22).toFixed(1);
+      const pm = Math.round((random() - 0.5) * 160);
+      rows.push(`
+<tr class="${rows.length % 2 ? 'odd' : 'even'}" data-id="${id}" data-pm="${pm}">
+  <td class="data-number">${p + 4}</td>
+  <td class="data-name"><a href="https://ibasketball.co.il/player/${id}/">${name}</a></td>
+  <td class="data-team"><a href="https://ibasketball.co.il/team/${5000 + t}/">${teamName(t)}</a></td>
+  <td class="data-gp">${gp}</td><td class="data-ppg">${pts}</td><td class="data-rpg">${(random() * 9).toFixed(1)}</td>
+  <td class="data-apg">${(random() * 6).toFixed(1)}</td><td class="data-pm">${pm > 0 ? '+' : ''}${pm}</td>
+</tr>`);
+    }
+  }
+
+  return `
+<div class="sp-template sp-template-player-list">
+  <h4 class="sp-table-caption">סטטיסטיקת שחקנים</h4>
+  <div class="sp-table-wrapper">
+    <table class="sp-player-list sp-data-table sp-sortable-table sp-responsive-table sp-scrollable-table" data-sp-rows="50">
+      <thead><tr>
+        <th class="data-number">#</th><th class="data-name">שחקן</th><th class="data-team">קבוצה</th><th class="data-gp">מש</th>
+        <th class="data-ppg">נק</th><th class="data-rpg">רב</th><th class="data-apg">אס</th><th class="data-pm">+/-</th>
+      </tr></thead>
+      <tbody>${rows.join('')}
+      </tbody>
+    </table>
+  </div>
+</div>`;
+}
+
+// Everything WordPress wraps around the tables: inline config scripts, styles, mega menus, widgets
+function buildChrome(random, targetBytes, nonce) {
+  const parts = [];
+  let size = 0;
+  let i = 0;
+  while (size < targetBytes) {
+    const kind = i % 4;
+    let part;
+    if (kind === 0) {
+      part = `<script type="text/javascript" id="wp-config-${i}">/* <![CDATA[ */ var sp_cfg_${i} = ${JSON.stringify({
+        nonce, ajax: 'https://ibasketball.co.il/wp-admin/admin-ajax.php', rows: Array.from({ length: 20 }, (_, k) => `<td class="x">${k}</td>`)
+      })}; if (a < b && c > d) { document.write('<table class="sp-league-table"></table>'); } /* ]]> */</script>`;
+    } else if (kind === 1) {
+      part = `<style id="inline-${i}">.sp-data-table td.data-${i}{padding:${i % 7}px} .menu-item-${i} > a:hover{color:#${(i * 4099 % 0xffffff).toString(16).padStart(6, '0')}}</style>`;
+    } else if (kind === 2) {
+      const links = Array.from({ length: 12 }, (_, k) => (
+        `<li id="menu-item-${i}-${k}" class="menu-item menu-item-type-post_type menu-item-object-sp_team"><a href="https://ibasketball.co.il/team/${5000 + k}/">${teamName(k)}</a></li>`
+      )).join('');
+      part = `<nav class="mega-menu" aria-label="menu ${i}"><ul class="sub-menu">${links}</ul></nav>`;
+    } else {
+      part = `<div class="widget widget_recent_entries"><!-- widget ${i} <table> --><h3 class="widget-title">חדשות</h3><ul>` +
+        Array.from({ length: 6 }, (_, k) => `<li><a href="https://ibasketball.co.il/${2025 - (k % 3)}/news-${i}-${k}/">כתבה ${i}-${k} &ndash; ${Math.floor(random() * 1000)}</a><span class="post-date">${k + 1}.10.2025</span></li>`).join('') +
+        '</ul></div>';
+    }
+    parts.push(part);
+    size += part.length;
+    i++;
+  }
+  return parts;
+}
+
+function buildLeaguePage({ seed = 5, teams = 14, playersPerTeam = 13, chromeKb = 160, nonce = 'a1b2c3d4e5' } = {}) {
+  const random = createRandom(seed);
+  const standings = buildStandings(random, teams);
+  const players = buildPlayerList(random, teams, playersPerTeam);
+  const chrome = buildChrome(createRandom(seed + 1), chromeKb * 1024, nonce);
+  const third = Math.floor(chrome.length / 3);
+
+  return `<!DOCTYPE html>
+<html dir="rtl" lang="he-IL">
+<head>
+<meta charset="UTF-8" />
+<meta name="viewport" content="width=device-width, initial-scale=1" />
+<title>ליגה לאומית 2025-2 &#8211; איגוד הכדורסל בישראל</title>
+${chrome.slice(0, third).join('\n')}
+</head>
+<body class="sp_league-template-default single single-sp_league postid-119474">
+<header id="masthead" class="site-header">${chrome.slice(third, 2 * third).join('\n')}</header>
+<main id="main" class="site-main">
+<article id="post-119474" class="post-119474 sp_league type-sp_league status-publish">
+<div class="entry-content">
+${standings}
+${players}
+</div>
+</article>
+</main>
+<footer id="colophon" class="site-footer">${chrome.slice(2 * third).join('\n')}</footer>
+</body>
+</html>
+`;
+}
+
+module.exports = { buildLeaguePage, teamName };
+
+if (require.main === module) {
+  const flags = { '--seed': 'seed', '--teams': 'teams', '--players': 'playersPerTeam', '--chrome': 'chromeKb', '--nonce': 'nonce' };
+  const options = {};
+  const argv = process.argv.slice(2);
+  for (let i = 0; i < argv.length; i += 2) {
+    if (!flags[argv[i]]) throw new Error(`Unknown option: ${argv[i]}`);
+    options[flags[argv[i]]] = flags[argv[i]] === 'nonce' ? argv[i + 1] : Number(argv[i + 1]);
+  }
+  process.stdout.write(buildLeaguePage(options));
+}
@@ -9,6 +9,9 @@ function loadAdapter(fetchImpl) {
   const context = {
     console: { log() {}, warn() {}, error() {} },
     fetch: fetchImpl,
+    setTimeout,
+    clearTimeout,
+    AbortController,
     window: {},
     document: {}
   };
@@ -65,6 +68,42 @@ async function run() {
     assert(proxiedUrls.some(url => url.includes('month=2026-06')), 'uses month fallback after proxy returns empty');
   }
 
+  {
+    const delay = ms => new Promise(resolve => setTimeout(resolve, ms));
+    const monthFetch = async (url, options = {}) => {
+      const month = new URL(url).searchParams.get('month');
+      await delay(month === '2025-10' ? 40 : 15);
+      if (options.signal?.aborted) throw new Error('aborted');
+      return {
+        ok: true,
+        json: async () => [
+          { id: `${month}-a`, date: `${month}-10T20:00:00` },
+          { id: `${month}-b`, date: `${month}-20T20:00:00` },
+          { id: 'shared', date: `${month}-25T20:00:00` }
+        ]
+      };
+    };
+
+    const serialAdapter = new (loadAdapter(monthFetch))();
+    const serialGames = await serialAdapter.fetchSeasonMonthGames(500, { concurrency: 1 });
+    const parallelAdapter = new (loadAdapter(monthFetch))();
+    const parallelGames = await parallelAdapter.fetchSeasonMonthGames(500, { concurrency: 4 });
+
+    assert.deepStrictEqual(Array.from(parallelGames, game => game.id), Array.from(serialGames, game => game.id));
+    assert.strictEqual(parallelGames.find(game => game.id === 'shared').date, '2026-06-25T20:00:00', 'later months win de-duplication');
+    assert.strictEqual(serialAdapter.lastFetchTimings.mode, 'serial');
+    assert.strictEqual(parallelAdapter.lastFetchTimings.mode, 'parallel');
+    assert.strictEqual(parallelAdapter.lastFetchTimings.months.length, 9);
+    assert(parallelAdapter.lastFetchTimings.totalMs < serialAdapter.lastFetchTimings.totalMs, 'parallel fetch is faster than serial');
+
+    const previewAdapter = new (loadAdapter(monthFetch))();
+    const previewGames = await previewAdapter.fetchSeasonMonthGames(5, { concurrency: 2 });
+
+    assert.deepStrictEqual(Array.from(previewGames, game => game.id), ['2026-06-b', '2026-06-a', 'shared', '2026-05-b', '2026-05-a']);
+    assert(previewAdapter.lastFetchTimings.cancelled, 'preview stops once limit is reached');
+    assert(previewAdapter.lastFetchTimings.monthsRequested < 9, 'skips remaining months after limit');
+  }
+
   console.log('ibba-adapter tests passed');
 }
 
@@ -0,0 +1,73 @@
+// Benchmark: IBBAAnalytics aggregation at 1x, 5x and 20x season size
+//   node tests/ibba-analytics.bench.js
+const fs = require('fs');
+const path = require('path');
+const vm = require('vm');
+const { generateSeason } = require('./helpers/synthetic-season');
+
+function loadModules() {
+  const context = {
+    console: { log() {}, warn() {}, error() {}, time() {}, timeEnd() {} },
+    window: {},
+    document: { createElement() { return { innerHTML: '', get value() { return this.innerHTML; } }; } }
+  };
+  vm.createContext(context);
+  ['ibba_adapter.js', 'ibba_analytics.js'].forEach(name => {
+    vm.runInContext(fs.readFileSync(path.join(__dirname, '..', 'js', 'ibba', name), 'utf8'), context);
+  });
+  return context.window;
+}
+
+function time(fn, iterations = 1) {
+  const startedAt = process.hrtime.bigint();
+  for (let i = 0; i < iterations; i++) fn();
+  return Number(process.hrtime.bigint() - startedAt) / 1e6 / iterations;
+}
+
+const { IBBAAdapter, IBBAAnalytics } = loadModules();
+const adapter = new IBBAAdapter();
+
+// A typical dashboard refresh: every getter the UI and the advanced report call
+const dashboard = analytics => {
+  analytics.getTeamStats();
+  analytics.getTeamAverages();
+  analytics.getTeamHomeAwayRecords();
+  analytics.getLeagueHomeAwayStats();
+  analytics.getPlayerStats();
+  analytics.getPlayerAverages();
+  analytics.getTopTeams('ppg', 10);
+  analytics.getTopPlayers('ppg', 10);
+};
+
+console.log('scale  games   build(ms)  uncached dashboard(ms)  cached dashboard(ms)  getTopTeams(ms)  getTopPlayers(ms)');
+[1, 5, 20].forEach(scale => {
+  // N past seasons, each with its own teams and rosters
+  const games = generateSeason({ seed: 7, teams: 12, seasons: scale }).map(event => adapter.convertToInternalFormat(event));
+
+  const analytics = new IBBAAnalytics();
+  const build = time(() => {
+    analytics.setGames(games.slice());
+    analytics.getAggregates();
+  }, 3);
+  const uncached = time(() => {
+    // each getter pays a full scan, as before the aggregation engine
+    ['getTeamStats', 'getTeamAverages', 'getTeamHomeAwayRecords', 'getLeagueHomeAwayStats',
+      'getPlayerStats', 'getPlayerAverages'].forEach(getter => {
+      analytics.invalidateAggregates();
+      analytics[getter]();
+    });
+    analytics.invalidateAggregates();
+    analytics.getTopTeams('ppg', 10);
+    analytics.invalidateAggregates();
+    analytics.getTopPlayers('ppg', 10);
+  }, 3);
+  analytics.getAggregates();
+  const cached = time(() => dashboard(analytics), 20);
+  const topTeams = time(() => analytics.getTopTeams('ppg', 10), 50);
+  const topPlayers = time(() => analytics.getTopPlayers('ppg', 10), 20);
+
+  console.log(
+    `${String(scale + 'x').padStart(5)}  ${String(games.length).padStart(5)}  ${build.toFixed(2).padStart(10)}  ` +
+    `${uncached.toFixed(2).padStart(22)}  ${cached.toFixed(2).padStart(20)}  ${topTeams.toFixed(3).padStart(15)}  ${topPlayers.toFixed(3).padStart(17)}`
+  );
+});
@@ -0,0 +1,96 @@
+const assert = require('assert');
+const fs = require('fs');
+const path = require('path');
+const vm = require('vm');
+
+function loadAnalytics() {
+  const file = path.join(__dirname, '..', 'js', 'ibba', 'ibba_analytics.js');
+  const context = {
+    console: { log() {}, warn() {}, error() {}, time() {}, timeEnd() {} },
+    window: {}
+  };
+
+  vm.runInNewContext(fs.readFileSync(file, 'utf8'), context);
+  return context.window.IBBAAnalytics;
+}
+
+function makeGame(gameId, home, away, homeScore, awayScore, withTeamStats = true) {
+  const line = (playerId, teamName, isHome, points, minutes) => ({
+    playerId,
+    teamName,
+    isHome,
+    jersey: playerId,
+    stats: { points, totalRebounds: 2, assists: 1, efficiency: points, plusMinus: 0, minutesPlayed: minutes },
+    calculated: {}
+  });
+
+  return {
+    gameId,
+    homeScore,
+    awayScore,
+    teams: [{ name: home, isHome: true }, { name: away, isHome: false }],
+    teamStats: withTeamStats
+      ? { home: { totalRebounds: 40, assists: 20 }, away: { totalRebounds: 30, assists: 10 } }
+      : null,
+    players: [
+      line(`${home}-1`, home, true, homeScore - 10, '30:00'),
+      line(`${home}-2`, home, true, 10, '0:00'),
+      line(`${away}-1`, away, false, awayScore, '35:30')
+    ]
+  };
+}
+
+const IBBAAnalytics = loadAnalytics();
+const games = [
+  makeGame(1, 'A', 'B', 80, 70),
+  makeGame(2, 'B', 'A', 90, 85, false),
+  makeGame(3, 'A', 'C', 60, 75)
+];
+
+const analytics = new IBBAAnalytics(games);
+let builds = 0;
+const build = analytics.buildAggregates.bind(analytics);
+analytics.buildAggregates = () => {
+  builds++;
+  return build();
+};
+
+const teamStats = analytics.getTeamStats();
+assert.strictEqual(teamStats.A.gamesPlayed, 3);
+assert.strictEqual(teamStats.A.wins, 1);
+assert.strictEqual(teamStats.A.totalPoints, 80 + 85 + 60);
+assert.strictEqual(teamStats.A.totalRebounds, 40 + 2 + 40, 'falls back to player sums without teamStats');
+assert.strictEqual(teamStats.B.totalEfficiency, 70 + 80 + 10);
+
+const homeAway = analytics.getTeamHomeAwayRecords();
+assert.strictEqual(homeAway.A.home.games, 2);
+assert.strictEqual(homeAway.A.away.losses, 1);
+assert.strictEqual(homeAway.B.home.winPpg, '90.0');
+
+const league = analytics.getLeagueHomeAwayStats();
+assert.strictEqual(league.homeWinsCount, 2);
+assert.strictEqual(league.awayWinsCount, 1);
+
+const players = analytics.getPlayerStats();
+assert(!players['A-2'], 'players with 0 minutes are skipped');
+assert.strictEqual(players['A-1'].gamesPlayed, 3);
+assert.strictEqual(Math.round(players['B-1'].totalMinutes * 10) / 10, 65.5);
+
+assert.strictEqual(analytics.getTopTeams('ppg', 1)[0].teamName, 'B');
+analytics.getTopPlayers('ppg', 2);
+assert.strictEqual(builds, 1, 'aggregates are built once for all getters');
+
+// callers that mutate results do not corrupt the cache
+analytics.getTeamAverages().sort((a, b) => a.ppg - b.ppg)[0].ppg = 'x';
+analytics.getTeamStats().A.wins = 99;
+assert.strictEqual(analytics.getTeamStats().A.wins, 1);
+assert.notStrictEqual(analytics.getTeamAverages().find(team => team.teamName === 'C').ppg, 'x');
+
+analytics.setGames(games.slice(0, 1));
+assert.strictEqual(analytics.getTeamStats().A.gamesPlayed, 1);
+games.push(makeGame(4, 'C', 'B', 70, 60));
+analytics.setGames(games);
+assert.strictEqual(analytics.getOverallStats().totalGames, 4);
+assert.strictEqual(builds, 3, 'rebuilds only when the game list changes');
+
+console.log('ibba-analytics tests passed');
@@ -0,0 +1,94 @@
+const assert = require('assert');
+const fs = require('fs');
+const path = require('path');
+const vm = require('vm');
+
+function loadModules(fetchImpl) {
+  const context = {
+    console: { log() {}, warn() {}, error() {} },
+    fetch: fetchImpl,
+    setTimeout,
+    clearTimeout,
+    AbortController,
+    window: {},
+    document: {
+      createElement() {
+        return { innerHTML: '', get value() { return this.innerHTML; } };
+      }
+    }
+  };
+
+  vm.createContext(context);
+  ['ibba_adapter.js', 'ibba_game_cache.js'].forEach(name => {
+    const file = path.join(__dirname, '..', 'js', 'ibba', name);
+    vm.runInContext(fs.readFileSync(file, 'utf8'), context);
+  });
+
+  return context.window;
+}
+
+function makeGame(id, date, played = true) {
+  return {
+    id,
+    date,
+    teams: [10, 20],
+    title: { rendered: 'Home — Away' },
+    home: { team: 'Home' },
+    away: { team: 'Away' },
+    performance: played ? { 10: { 0: { pts: 80 }, 1: { pts: 12 } }, 20: { 0: { pts: 70 } } } : ''
+  };
+}
+
+async function run() {
+  const season = {
+    '2025-10': [makeGame(1, '2025-10-12T20:00:00')],
+    '2025-11': [makeGame(2, '2025-11-09T20:00:00'), makeGame(3, '2025-11-30T20:00:00')],
+    '2025-12': [makeGame(4, '2025-12-20T20:00:00', false)]
+  };
+  const requestedMonths = [];
+  const { IBBAAdapter, IBBAGameCache } = loadModules(async url => {
+    const month = new URL(url).searchParams.get('month');
+    requestedMonths.push(month);
+    return { ok: true, json: async () => season[month] || [] };
+  });
+
+  const adapter = new IBBAAdapter();
+  adapter.seasonMonths = ['2025-10', '2025-11', '2025-12'];
+  const storage = new Map();
+
+  // Cold start - full season, only completed games are stored
+  const cold = new IBBAGameCache({ storage });
+  const coldGames = await cold.loadSeasonGames(adapter);
+  assert.deepStrictEqual(Array.from(coldGames, game => game.gameId), [4, 3, 2, 1]);
+  assert.strictEqual(cold.getStats().misses, 4);
+  assert.strictEqual(cold.getStats().hits, 0);
+  assert.strictEqual(storage.size, 3, 'future game is not cached');
+  assert.strictEqual(coldGames.find(game => game.gameId === 1).originalJson.id, 1);
+
+  // Warm start - only months from the newest cached game (minus safety window)
+  requestedMonths.length = 0;
+  season['2025-12'] = [makeGame(4, '2025-12-20T20:00:00', true)];
+  const warm = new IBBAGameCache({ storage });
+  const warmGames = await warm.loadSeasonGames(adapter);
+  assert.deepStrictEqual(Array.from(requestedMonths), ['2025-11', '2025-12']);
+  assert.deepStrictEqual(Array.from(warmGames, game => game.gameId), [4, 3, 2, 1]);
+  assert.strictEqual(warm.getStats().hits, 3);
+  assert.strictEqual(warm.getStats().misses, 1, 'only the newly completed game is converted');
+  assert.strictEqual(warmGames[0].homeScore, 80);
+  assert.strictEqual(storage.size, 4);
+
+  // Forced resync - whole season again
+  requestedMonths.length = 0;
+  const forced = new IBBAGameCache({ storage });
+  await forced.loadSeasonGames(adapter, { forceFullResync: true });
+  assert.deepStrictEqual(Array.from(requestedMonths), ['2025-10', '2025-11', '2025-12']);
+  assert.strictEqual(forced.getStats().hits, 0);
+  assert.strictEqual(forced.getStats().fullResync, true);
+
+  console.log('ibba-game-cache tests passed');
+}
+
+run().catch(error => {
+  console.error(error);
+  process.exit(1);
+});
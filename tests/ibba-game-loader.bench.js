@@ -0,0 +1,89 @@
+// Benchmark: games ingested per second, per-game saves vs bulk batches
+// Runs against an in-memory Supabase stand-in with a fixed round-trip latency.
+//   node tests/ibba-game-loader.bench.js [games] [latencyMs]
+const fs = require('fs');
+const path = require('path');
+const vm = require('vm');
+
+const GAME_COUNT = Number(process.argv[2]) || 200;
+const LATENCY_MS = Number(process.argv[3]) || 20;
+const PLAYERS_PER_GAME = 24;
+
+function createSupabaseStandIn() {
+  const tables = { games: new Map(), appearances: new Map(), player_stats: new Map() };
+  const roundTrip = () => new Promise(resolve => setTimeout(resolve, LATENCY_MS));
+  let requests = 0;
+
+  return {
+    tables,
+    get requests() { return requests; },
+    init: async () => true,
+    saveGame: async row => {
+      requests++;
+      await roundTrip();
+      tables.games.set(row.gameSerial, row);
+      return row;
+    },
+    saveGamesBulk: async ({ games, appearances, playerStats }) => {
+      requests++;
+      await roundTrip();
+      games.forEach(row => tables.games.set(row.gameSerial, row));
+      appearances.forEach(row => tables.appearances.set(`${row.gameId}:${row.playerId}`, row));
+      playerStats.forEach(row => tables.player_stats.set(`${row.gameId}:${row.playerId}`, row));
+      return { success: true };
+    }
+  };
+}
+
+function loadLoader(dbAdapter) {
+  const context = { console: { log() {}, warn() {}, error() {} }, setTimeout, clearTimeout, window: { dbAdapter } };
+  vm.createContext(context);
+  ['ibba_db_wrapper.js', 'ibba_game_loader.js'].forEach(name => {
+    vm.runInContext(fs.readFileSync(path.join(__dirname, '..', 'js', 'ibba', name), 'utf8'), context);
+  });
+  const { IBBADbWrapper, IBBAGameLoader } = vm.runInContext('({ IBBADbWrapper, IBBAGameLoader })', context);
+  return new IBBAGameLoader(null, new IBBADbWrapper());
+}
+
+function makeGames() {
+  return Array.from({ length: GAME_COUNT }, (_, g) => ({
+    gameId: 500000 + g,
+    gameSerial: 500000 + g,
+    date: '2025-11-01T20:00:00',
+    teams: [{ teamId: 1, name: 'Home' }, { teamId: 2, name: 'Away' }],
+    finalScore: { home: 80, away: 70 },
+    players: Array.from({ length: PLAYERS_PER_GAME }, (_, p) => ({
+      playerId: 900000 + p,
+      teamName: p < 12 ? 'Home' : 'Away',
+      jersey: p,
+      stats: { points: p, totalRebounds: p % 7, assists: p % 5, minutesPlayed: '20:00' }
+    }))
+  }));
+}
+
+async function measure(label, options) {
+  const db = createSupabaseStandIn();
+  const loader = loadLoader(db);
+  const startedAt = process.hrtime.bigint();
+  const result = await loader.saveGames(makeGames(), options);
+  const seconds = Number(process.hrtime.bigint() - startedAt) / 1e9;
+
+  console.log(
+    `${label.padEnd(28)} ${String(result.saved).padStart(5)} games  ` +
+    `${seconds.toFixed(2).padStart(6)}s  ${(result.saved / seconds).toFixed(1).padStart(8)} games/s  ` +
+    `${String(db.requests).padStart(5)} requests`
+  );
+}
+
+async function run() {
+  console.log(`Ingesting ${GAME_COUNT} games x ${PLAYERS_PER_GAME} players, ${LATENCY_MS}ms per round trip\n`);
+  await measure('per-game (saveGame)', {});
+  await measure('bulk batch=25 concurrency=1', { bulk: true, batchSize: 25, concurrency: 1 });
+  await measure('bulk batch=25 concurrency=2', { bulk: true, batchSize: 25, concurrency: 2 });
+  await measure('bulk batch=50 concurrency=4', { bulk: true, batchSize: 50, concurrency: 4 });
+}
+
+run().catch(error => {
+  console.error(error);
+  process.exit(1);
+});
@@ -0,0 +1,138 @@
+const assert = require('assert');
+const fs = require('fs');
+const path = require('path');
+const vm = require('vm');
+
+function loadLoader(dbAdapter) {
+  const context = {
+    console: { log() {}, warn() {}, error() {} },
+    setTimeout,
+    clearTimeout,
+    window: { dbAdapter }
+  };
+
+  vm.createContext(context);
+  ['ibba_db_wrapper.js', 'ibba_game_loader.js'].forEach(name => {
+    const file = path.join(__dirname, '..', 'js', 'ibba', name);
+    vm.runInContext(fs.readFileSync(file, 'utf8'), context);
+  });
+
+  return vm.runInContext('({ IBBADbWrapper, IBBAGameLoader })', context);
+}
+
+function makeGame(gameId, playerCount = 3) {
+  return {
+    gameId,
+    gameSerial: gameId,
+    date: '2025-11-01T20:00:00',
+    teams: [{ teamId: 1, name: 'Home' }, { teamId: 2, name: 'Away' }],
+    finalScore: { home: 80, away: 70 },
+    players: Array.from({ length: playerCount }, (_, i) => ({
+      playerId: 100 + i,
+      teamName: 'Home',
+      jersey: i,
+      stats: { points: i * 2, totalRebounds: i, minutesPlayed: '10:00' }
+    }))
+  };
+}
+
+async function run() {
+  const calls = [];
+  let failuresLeft = 1;
+  const { IBBADbWrapper, IBBAGameLoader } = loadLoader({
+    init: async () => true,
+    saveGamesBulk: async payload => {
+      calls.push(payload);
+      if (failuresLeft > 0) {
+        failuresLeft--;
+        throw new Error('transient');
+      }
+      return { success: true };
+    }
+  });
+
+  const loader = new IBBAGameLoader(null, new IBBADbWrapper());
+  const progress = [];
+  const games = Array.from({ length: 7 }, (_, i) => makeGame(i + 1));
+  const result = await loader.saveGames(games, {
+    bulk: true,
+    batchSize: 3,
+    concurrency: 1,
+    retryDelayMs: 0,
+    onProgress: update => progress.push(update)
+  });
+
+  assert.strictEqual(result.saved, 7);
+  assert.strictEqual(result.failed, 0);
+  assert.strictEqual(result.batches, 3);
+  assert.strictEqual(result.retries, 1, 'failed batch is retried');
+  assert.strictEqual(calls.length, 4);
+  assert.deepStrictEqual(Array.from(progress, update => update.completedBatches), [1, 2, 3]);
+
+  const firstBatch = calls[1];
+  assert.deepStrictEqual(Array.from(firstBatch.games, row => row.gameSerial), [1, 2, 3]);
+  assert.strictEqual(firstBatch.appearances.length, 9, 'one appearance row per player');
+  assert.strictEqual(firstBatch.playerStats[2].points, 4);
+  assert.strictEqual(firstBatch.playerStats[2].playerId, '102');
+
+  // Batch that keeps failing is reported, other batches still saved
+  const { IBBADbWrapper: Wrapper2, IBBAGameLoader: Loader2 } = loadLoader({
+    init: async () => true,
+    saveGamesBulk: async payload => {
+      if (payload.games.some(row => row.gameSerial === 4)) throw new Error('bad row');
+      return { success: true };
+    }
+  });
+  const failing = await new Loader2(null, new Wrapper2()).saveGamesBulk(games, {
+    batchSize: 3,
+    maxRetries: 1,
+    retryDelayMs: 0
+  });
+  assert.strictEqual(failing.saved, 4);
+  assert.strictEqual(failing.failed, 3);
+  assert.deepStrictEqual(Array.from(failing.errors, error => error.gameId).sort(), [4, 5, 6]);
+
+  // Per-game and bulk saves write the same rows (upserts by gameSerial / playerId+gameId)
+  const createTables = () => {
+    const tables = { games: new Map(), appearances: new Map(), player_stats: new Map() };
+    const upsert = (table, rows, keyOf) => rows.forEach(row => tables[table].set(keyOf(row), row));
+    const adapter = {
+      init: async () => true,
+      saveGame: async row => upsert('games', [row], r => r.gameSerial),
+      saveGamesBulk: async ({ games = [], appearances = [], playerStats = [] }) => {
+        upsert('games', games, r => r.gameSerial);
+        upsert('appearances', appearances, r => `${r.playerId}:${r.gameId}`);
+        upsert('player_stats', playerStats, r => `${r.playerId}:${r.gameId}`);
+        return { success: true };
+      }
+    };
+    // imported_at is the save time
+    const dump = () => JSON.parse(JSON.stringify(Object.fromEntries(Object.entries(tables).map(([name, rows]) => [
+      name,
+      Array.from(rows.entries()).sort().map(([, { imported_at, ...row }]) => row)
+    ]))));
+    return { adapter, dump };
+  };
+
+  const sameGames = [makeGame(1, 4), makeGame(2, 2)];
+  const perGame = createTables();
+  const { IBBADbWrapper: Wrapper3, IBBAGameLoader: Loader3 } = loadLoader(perGame.adapter);
+  const perGameResult = await new Loader3(null, new Wrapper3()).saveGames(sameGames);
+  assert.strictEqual(perGameResult.saved, 2);
+
+  const bulk = createTables();
+  const { IBBADbWrapper: Wrapper4, IBBAGameLoader: Loader4 } = loadLoader(bulk.adapter);
+  await new Loader4(null, new Wrapper4()).saveGames(sameGames, { bulk: true, retryDelayMs: 0 });
+
+  const perGameRows = perGame.dump();
+  assert.strictEqual(perGameRows.appearances.length, 6);
+  assert.strictEqual(perGameRows.player_stats.length, 6);
+  assert.deepStrictEqual(perGameRows, bulk.dump());
+
+  console.log('ibba-game-loader tests passed');
+}
+
+run().catch(error => {
+  console.error(error);
+  process.exit(1);
+});
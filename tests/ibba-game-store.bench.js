@@ -0,0 +1,89 @@
+// Benchmark: converted games as objects vs IBBAGameStore (typed-array columns) at 1, 5 and 20 seasons
+//   retained heap of the object graph (with / without originalJson) vs the store, and aggregation time
+//   node --expose-gc tests/ibba-game-store.bench.js
+const assert = require('assert');
+const { generateSeason } = require('./helpers/synthetic-season');
+const { loadIbbaModules } = require('./helpers/bench-harness');
+
+function collectGarbage() {
+  global.gc();
+  global.gc();
+}
+
+// retained heap of what build() returns (kept alive until measured)
+function retainedBytes(build) {
+  collectGarbage();
+  const before = process.memoryUsage().heapUsed;
+  const value = build();
+  collectGarbage();
+  const bytes = process.memoryUsage().heapUsed - before;
+  return { value, bytes };
+}
+
+// best of `runs` (GC pauses make single runs noisy)
+function time(fn, runs = 5) {
+  let best = Infinity;
+  for (let i = 0; i < runs; i++) {
+    const startedAt = process.hrtime.bigint();
+    fn();
+    best = Math.min(best, Number(process.hrtime.bigint() - startedAt) / 1e6);
+  }
+  return best;
+}
+
+function run() {
+  if (typeof global.gc !== 'function') {
+    console.error('run with node --expose-gc');
+    process.exit(1);
+  }
+
+  const { IBBAAdapter, IBBAAnalytics, IBBAGameStore } = loadIbbaModules(['ibba_adapter.js', 'ibba_analytics.js', 'ibba_game_store.js']);
+  const adapter = new IBBAAdapter();
+  const MB = 1024 * 1024;
+
+  console.log('seasons  games   lines  objects(MB)  no raw(MB)  store(MB)  ratio  lines objects/store(ms)  build objects/store(ms)');
+  for (const seasons of [1, 5, 20]) {
+    const events = generateSeason({ seed: 7, teams: 12, seasons });
+    // fresh raw JSON for every build (originalJson is part of the retained object graph)
+    const convert = () => JSON.parse(JSON.stringify(events)).map(event => adapter.convertToInternalFormat(event));
+
+    const objects = retainedBytes(convert);
+    const withoutRaw = retainedBytes(() => convert().map(({ originalJson, ...game }) => game));
+    const store = retainedBytes(() => IBBAGameStore.fromGames(convert()));
+
+    const games = objects.value;
+    const lines = store.value.lineCount;
+    const fromObjects = new IBBAAnalytics(games);
+    const fromStore = IBBAAnalytics.fromStore(store.value);
+    assert.deepStrictEqual(JSON.parse(JSON.stringify(fromStore.getAggregates())), JSON.parse(JSON.stringify(fromObjects.getAggregates())));
+
+    // the player-line pass (what the store replaces) and the whole build (team loop / averages are shared)
+    const linesObjects = time(() => {
+      const playerStats = {};
+      games.forEach(game => fromObjects.accumulatePlayerLines(game, playerStats));
+    });
+    const linesStore = time(() => {
+      const lineAggregation = store.value.createLineAggregation(fromStore);
+      games.forEach((game, gameIndex) => lineAggregation.accumulateGame(gameIndex));
+      lineAggregation.finish({});
+    });
+    const aggObjects = time(() => { fromObjects.invalidateAggregates(); fromObjects.getAggregates(); });
+    const aggStore = time(() => { fromStore.invalidateAggregates(); fromStore.getAggregates(); });
+
+    console.log(
+      `${String(seasons).padStart(7)}  ${String(games.length).padStart(5)}  ${String(lines).padStart(6)}  ` +
+      `${(objects.bytes / MB).toFixed(1).padStart(11)}  ${(withoutRaw.bytes / MB).toFixed(1).padStart(10)}  ` +
+      `${(store.bytes / MB).toFixed(1).padStart(9)}  ${(withoutRaw.bytes / store.bytes).toFixed(1).padStart(4)}x  ` +
+      `${`${linesObjects.toFixed(1)} / ${linesStore.toFixed(1)} (${(linesObjects / linesStore).toFixed(1)}x)`.padStart(23)}  ` +
+      `${`${aggObjects.toFixed(1)} / ${aggStore.toFixed(1)} (${(aggObjects / aggStore).toFixed(1)}x)`.padStart(23)}`
+    );
+  }
+  console.log('(ratio = objects without originalJson / store)');
+}
+
+try {
+  run();
+} catch (error) {
+  console.error(error);
+  process.exit(1);
+}
@@ -0,0 +1,128 @@
+const assert = require('assert');
+const fs = require('fs');
+const path = require('path');
+const vm = require('vm');
+const { generateSeason } = require('./helpers/synthetic-season');
+
+function loadModules() {
+  const context = {
+    console: { log() {}, warn() {}, error() {}, time() {}, timeEnd() {} },
+    document: { createElement() { return { innerHTML: '', get value() { return this.innerHTML; } }; } },
+    setTimeout
+  };
+  context.window = context;
+  vm.createContext(context);
+  ['ibba_adapter.js', 'ibba_analytics.js', 'ibba_game_store.js', 'ibba_season_registry.js'].forEach(name => {
+    const file = path.join(__dirname, '..', 'js', 'ibba', name);
+    vm.runInContext(fs.readFileSync(file, 'utf8'), context, { filename: file });
+  });
+  return context;
+}
+
+const plain = value => JSON.parse(JSON.stringify(value));
+const withoutRaw = games => games.map(({ originalJson, ...game }) => game);
+
+async function run() {
+  const { IBBAAdapter, IBBAAnalytics, IBBAGameStore, IBBASeasonRegistry } = loadModules();
+  const adapter = new IBBAAdapter();
+  const games = generateSeason({ seed: 11, teams: 8, rounds: 14, seasons: 2 }).map(event => adapter.convertToInternalFormat(event));
+
+  // Views: same shape and values as the converted player lines; headers without originalJson
+  const store = IBBAGameStore.fromGames(games);
+  {
+    const lines = games.reduce((sum, game) => sum + game.players.length, 0);
+    assert.strictEqual(store.lineCount, lines);
+    assert.strictEqual(store.capacity, lines, 'exact allocation');
+    assert.strictEqual(store.games.length, games.length);
+    assert.ok(!('originalJson' in store.games[0]));
+    assert.deepStrictEqual(plain(store.toGames()), plain(withoutRaw(games)));
+    assert.deepStrictEqual(plain(store.games), plain(withoutRaw(games)));
+
+    const original = games[3].players[2];
+    const view = store.games[3].players[2];
+    assert.strictEqual(view.playerId, original.playerId);
+    assert.strictEqual(view.teamId, original.teamId);
+    assert.strictEqual(view.isHome, original.isHome);
+    assert.strictEqual(view.stats.points, original.stats.points);
+    assert.strictEqual(view.stats.minutesPlayed, original.stats.minutesPlayed);
+    assert.deepStrictEqual(plain(view.calculated), plain(original.calculated));
+    assert.strictEqual(view.game, store.games[3]);
+    assert.strictEqual(store.getGame(games[3].gameId), store.games[3]);
+
+    // ids are interned once
+    const ids = new Set(games.flatMap(game => game.players.map(player => player.playerId)));
+    assert.strictEqual(Array.from(store.symbols).filter(symbol => ids.has(symbol)).length, ids.size);
+  }
+
+  // Values that don't fit Int16 switch the column to Float64, missing values are 0
+  {
+    const small = new IBBAGameStore(1);
+    small.addGame({ gameId: 1, players: [{ playerId: 'a', teamName: 'x', stats: { points: 10, efficiency: 7.5 } }] });
+    small.addGame({ gameId: 2, players: [{ playerId: 'a', teamName: 'x', stats: { points: 40000 } }] });
+    assert.strictEqual(small.capacity, 2);
+    assert.strictEqual(small.games[0].players[0].stats.efficiency, 7.5);
+    assert.strictEqual(small.games[1].players[0].stats.points, 40000);
+    assert.strictEqual(small.games[0].players[0].stats.assists, 0);
+    assert.strictEqual(Object.prototype.toString.call(small.columns.points), '[object Float64Array]');
+    assert.strictEqual(Object.prototype.toString.call(small.columns.assists), '[object Int16Array]');
+  }
+
+  // Analytics from the columns = analytics from the object graph
+  {
+    const fromObjects = new IBBAAnalytics(games);
+    const fromStore = IBBAAnalytics.fromStore(store);
+    assert.deepStrictEqual(plain(fromStore.getAggregates()), plain(fromObjects.getAggregates()));
+    assert.deepStrictEqual(plain(fromStore.getTopPlayers('ppg', 10)), plain(fromObjects.getTopPlayers('ppg', 10)));
+
+    // minutes only as "MM:SS" (no calculated) - same fallback as getPlayerMinutes
+    const noCalculated = games.slice(0, 5).map(game => ({
+      ...game,
+      players: game.players.map(({ calculated, ...player }) => player)
+    }));
+    assert.deepStrictEqual(
+      plain(IBBAAnalytics.fromStore(IBBAGameStore.fromGames(noCalculated)).getAggregates()),
+      plain(new IBBAAnalytics(noCalculated).getAggregates())
+    );
+
+    // after setGames the analytics no longer reads the store
+    fromStore.setGames(games.slice(0, 10));
+    assert.deepStrictEqual(plain(fromStore.getAggregates()), plain(new IBBAAnalytics(games.slice(0, 10)).getAggregates()));
+  }
+
+  // Transfer: columns move (source buffers detached), the rebuilt store reads the same
+  {
+    const transferStore = IBBAGameStore.fromGames(games);
+    const before = plain(transferStore.toGames());
+    const data = transferStore.toTransferable();
+    const transfer = transferStore.getTransferList(data);
+    assert.strictEqual(transfer.length, Object.keys(data.columns).length + 1);
+
+    const received = structuredClone(data, { transfer });
+    assert.strictEqual(transferStore.columns.points.byteLength, 0, 'source detached');
+
+    const rebuilt = IBBAGameStore.fromTransferable(received);
+    assert.deepStrictEqual(plain(rebuilt.toGames()), before);
+    assert.deepStrictEqual(plain(IBBAAnalytics.fromStore(rebuilt).getAggregates()), plain(new IBBAAnalytics(games).getAggregates()));
+    assert.throws(() => IBBAGameStore.fromTransferable({ version: 99 }), /Unsupported game store version/);
+  }
+
+  // Season registry: columnar full tier, smaller estimate, same answers
+  {
+    const season = { leagueId: 1, seasonId: 2, seasonMonths: ['2021-10'] };
+    const objectRegistry = new IBBASeasonRegistry({ seasons: [season], loader: async () => games });
+    const columnarRegistry = new IBBASeasonRegistry({ seasons: [season], loader: async () => games, columnar: true });
+    const objectAnalytics = await objectRegistry.getAnalytics();
+    const columnarAnalytics = await columnarRegistry.getAnalytics();
+    assert.ok(columnarAnalytics.store);
+    assert.deepStrictEqual(plain(columnarAnalytics.getAggregates()), plain(objectAnalytics.getAggregates()));
+    assert.ok(columnarRegistry.getMemoryUsage().totalBytes < objectRegistry.getMemoryUsage().totalBytes / 2);
+    assert.deepStrictEqual(plain(await columnarRegistry.getGames()), plain(withoutRaw(games)));
+  }
+
+  console.log('ibba-game-store tests passed');
+}
+
+run().catch(error => {
+  console.error(error);
+  process.exit(1);
+});
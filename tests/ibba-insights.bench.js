@@ -0,0 +1,79 @@
+// Benchmark: IBBAInsightsV2 for a full round of matchups, with and without the shared matchup context
+//   node tests/ibba-insights.bench.js
+const fs = require('fs');
+const path = require('path');
+const vm = require('vm');
+const { generateSeason } = require('./helpers/synthetic-season');
+
+const TEAMS = 12;
+
+function loadModules() {
+  const context = {
+    console: { log() {}, warn() {}, error() {}, time() {}, timeEnd() {} },
+    window: {},
+    document: { createElement() { return { innerHTML: '', get value() { return this.innerHTML; } }; } },
+    sessionStorage: { getItem() { return null; }, setItem() {}, removeItem() {} }
+  };
+  vm.createContext(context);
+  ['ibba_adapter.js', 'ibba_analytics.js', 'ibba_insights_templates.js', 'ibba_insights_v2.js', 'ibba_advanced.js']
+    .forEach(name => {
+      vm.runInContext(fs.readFileSync(path.join(__dirname, '..', 'js', 'ibba', name), 'utf8'), context);
+    });
+  return context.window;
+}
+
+function time(fn, iterations) {
+  const startedAt = process.hrtime.bigint();
+  for (let i = 0; i < iterations; i++) fn();
+  return Number(process.hrtime.bigint() - startedAt) / 1e6 / iterations;
+}
+
+async function run() {
+  const { IBBAAdapter, IBBAAnalytics, IBBAAdvanced, IBBAInsightsV2 } = loadModules();
+  const adapter = new IBBAAdapter();
+
+  console.log('seasons  games  round with context(ms)  round without context(ms)  speedup');
+  for (const seasons of [1, 5, 20]) {
+    const events = generateSeason({ seed: 7, teams: TEAMS, seasons });
+    const fixtures = events.slice(-TEAMS / 2).map(event => adapter.convertToInternalFormat(event));
+    const played = events.slice(0, -TEAMS / 2).map(event => adapter.convertToInternalFormat(event));
+
+    // אוספים את ה-reportData שהדוח המלא מעביר ל-generateMatchupInsights
+    const analytics = new IBBAAnalytics(played);
+    const advanced = new IBBAAdvanced(analytics);
+    advanced.standingsLoaded = true;
+
+    const calls = [];
+    const original = IBBAInsightsV2.prototype.generateMatchupInsights;
+    IBBAInsightsV2.prototype.generateMatchupInsights = function(teamA, teamB, reportData) {
+      calls.push([teamA, teamB, reportData]);
+      return original.call(this, teamA, teamB, reportData);
+    };
+    for (const fixture of fixtures) {
+      await advanced.buildMatchupReport(fixture.homeTeam, fixture.awayTeam);
+    }
+    IBBAInsightsV2.prototype.generateMatchupInsights = original;
+
+    const engine = new IBBAInsightsV2(analytics);
+    const iterations = seasons >= 20 ? 3 : 10;
+    const withContext = time(() => {
+      calls.forEach(([teamA, teamB, reportData]) => engine.generateMatchupInsights(teamA, teamB, reportData));
+    }, iterations);
+    const withoutContext = time(() => {
+      calls.forEach(([teamA, teamB, reportData]) => {
+        engine.buildMatchupInsights(teamA, teamB, reportData, analytics.getTeamAverages());
+      });
+    }, iterations);
+
+    console.log(
+      `${String(seasons).padStart(7)}  ${String(played.length).padStart(5)}  ` +
+      `${withContext.toFixed(1).padStart(22)}  ${withoutContext.toFixed(1).padStart(25)}  ` +
+      `${(withoutContext / withContext).toFixed(1).padStart(6)}x`
+    );
+  }
+}
+
+run().catch(error => {
+  console.error(error);
+  process.exit(1);
+});
@@ -0,0 +1,79 @@
+// Golden-file test: matchup reports for a full round must stay byte-identical
+//   UPDATE_GOLDEN=1 node tests/ibba-insights.test.js   (regenerate after an intended change)
+const assert = require('assert');
+const fs = require('fs');
+const path = require('path');
+const vm = require('vm');
+const { generateSeason, createRandom } = require('./helpers/synthetic-season');
+
+const GOLDEN_FILE = path.join(__dirname, 'fixtures', 'insights-round.golden.json');
+
+function loadModules() {
+  const storage = new Map();
+  const context = {
+    console: { log() {}, warn() {}, error() {}, time() {}, timeEnd() {} },
+    window: {},
+    document: { createElement() { return { innerHTML: '', get value() { return this.innerHTML; } }; } },
+    sessionStorage: {
+      getItem: key => storage.get(key) || null,
+      setItem: (key, value) => storage.set(key, value),
+      removeItem: key => storage.delete(key)
+    },
+    __random: createRandom(2024)
+  };
+
+  vm.createContext(context);
+  vm.runInContext('Math.random = __random;', context);
+  ['ibba_adapter.js', 'ibba_analytics.js', 'ibba_insights_templates.js', 'ibba_insights_v2.js', 'ibba_advanced.js']
+    .forEach(name => {
+      vm.runInContext(fs.readFileSync(path.join(__dirname, '..', 'js', 'ibba', name), 'utf8'), context);
+    });
+  return context.window;
+}
+
+async function buildRoundReports() {
+  const { IBBAAdapter, IBBAAnalytics, IBBAAdvanced } = loadModules();
+  const adapter = new IBBAAdapter();
+  const events = generateSeason({ seed: 11, teams: 12 });
+  const lastRound = Math.max(...events.map(event => event.stage_id));
+  const played = events.filter(event => event.stage_id < lastRound).map(event => adapter.convertToInternalFormat(event));
+  const fixtures = events.filter(event => event.stage_id === lastRound).map(event => adapter.convertToInternalFormat(event));
+
+  const advanced = new IBBAAdvanced(new IBBAAnalytics(played));
+  advanced.standingsLoaded = true; // no HTML standings offline - use the calculated fallback
+
+  const reports = [];
+  for (const fixture of fixtures) {
+    const report = await advanced.buildMatchupReport(fixture.homeTeam, fixture.awayTeam);
+    reports.push({
+      matchup: `${fixture.homeTeam} - ${fixture.awayTeam}`,
+      insightsV2: report.insightsV2,
+      insights: report.insights,
+      narrative: report.narrative
+    });
+  }
+  return JSON.parse(JSON.stringify(reports));
+}
+
+async function run() {
+  const reports = await buildRoundReports();
+
+  if (process.env.UPDATE_GOLDEN) {
+    fs.writeFileSync(GOLDEN_FILE, JSON.stringify(reports, null, 2) + '\n');
+    console.log(`wrote ${path.relative(process.cwd(), GOLDEN_FILE)}`);
+    return;
+  }
+
+  const golden = JSON.parse(fs.readFileSync(GOLDEN_FILE, 'utf8'));
+  assert.strictEqual(reports.length, golden.length);
+  reports.forEach((report, index) => {
+    assert.deepStrictEqual(report, golden[index], `insights changed for ${report.matchup}`);
+  });
+
+  console.log('ibba-insights tests passed');
+}
+
+run().catch(error => {
+  console.error(error);
+  process.exit(1);
+});
@@ -0,0 +1,149 @@
+// Benchmark: the IBBA pipeline stage by stage, with JSON results and a regression check
+//   node --expose-gc tests/ibba-pipeline.bench.js [--teams 12] [--rounds 22] [--seasons 1] [--seed 7]
+//        [--samples 50] [--out bench_results.json] [--baseline tests/fixtures/bench-baseline.json]
+//        [--tolerance 0.25] [--update-baseline]
+// Exits with 1 when a stage is slower (p50) than the stored baseline beyond the tolerance.
+const fs = require('fs');
+const path = require('path');
+const { generateSeason } = require('./helpers/synthetic-season');
+const { loadIbbaModules, measureStage, compareToBaseline } = require('./helpers/bench-harness');
+
+const ROOT = path.join(__dirname, '..');
+
+function parseArgs(argv) {
+  const args = {
+    teams: 12,
+    rounds: null,
+    seasons: 1,
+    seed: 7,
+    samples: 50,
+    out: path.join(ROOT, 'bench_results.json'),
+    baseline: path.join(__dirname, 'fixtures', 'bench-baseline.json'),
+    tolerance: 0.25,
+    updateBaseline: false
+  };
+  for (let i = 0; i < argv.length; i++) {
+    const flag = argv[i];
+    const next = () => argv[++i];
+    if (flag === '--teams') args.teams = Number(next());
+    else if (flag === '--rounds') args.rounds = Number(next());
+    else if (flag === '--seasons') args.seasons = Number(next());
+    else if (flag === '--seed') args.seed = Number(next());
+    else if (flag === '--samples') args.samples = Number(next());
+    else if (flag === '--out') args.out = path.resolve(next());
+    else if (flag === '--baseline') args.baseline = path.resolve(next());
+    else if (flag === '--tolerance') args.tolerance = Number(next());
+    else if (flag === '--update-baseline') args.updateBaseline = true;
+    else throw new Error(`Unknown option: ${flag}`);
+  }
+  if (args.rounds === null) args.rounds = (args.teams - 1) * 2;
+  return args;
+}
+
+async function run() {
+  const args = parseArgs(process.argv.slice(2));
+  const { IBBAAdapter, IBBAAnalytics, IBBAAdvanced, IBBAInsightsV2 } = loadIbbaModules([
+    'ibba_adapter.js', 'ibba_analytics.js', 'ibba_insights_templates.js', 'ibba_insights_v2.js', 'ibba_advanced.js'
+  ]);
+  const adapter = new IBBAAdapter();
+
+  // The last round is the upcoming fixtures; everything before it is played
+  const events = generateSeason({ seed: args.seed, teams: args.teams, rounds: args.rounds, seasons: args.seasons });
+  const fixtureEvents = events.slice(-args.teams / 2);
+  const playedEvents = events.slice(0, -args.teams / 2);
+  const played = playedEvents.map(event => adapter.convertToInternalFormat(event));
+  const fixtures = fixtureEvents.map(event => adapter.convertToInternalFormat(event));
+
+  const analytics = new IBBAAnalytics(played);
+  const advanced = new IBBAAdvanced(analytics);
+  advanced.standingsLoaded = true;
+
+  // reportData as the full report passes it to generateMatchupInsights
+  const matchups = [];
+  const original = IBBAInsightsV2.prototype.generateMatchupInsights;
+  IBBAInsightsV2.prototype.generateMatchupInsights = function(teamA, teamB, reportData) {
+    matchups.push([teamA, teamB, reportData]);
+    return original.call(this, teamA, teamB, reportData);
+  };
+  for (const fixture of fixtures) {
+    await advanced.buildMatchupReport(fixture.homeTeam, fixture.awayTeam);
+  }
+  IBBAInsightsV2.prototype.generateMatchupInsights = original;
+  if (matchups.length === 0) throw new Error('buildMatchupReport did not call generateMatchupInsights');
+
+  const insights = new IBBAInsightsV2(analytics);
+  const stages = {
+    // one event per call
+    convertToInternalFormat: i => adapter.convertToInternalFormat(playedEvents[i % playedEvents.length]),
+    // fresh instance: the single aggregation pass + both getters
+    'analytics.cold': () => {
+      const fresh = new IBBAAnalytics(played);
+      fresh.getTeamAverages();
+      fresh.getPlayerAverages();
+    },
+    'analytics.getTeamAverages': () => analytics.getTeamAverages(),
+    'analytics.getPlayerAverages': () => analytics.getPlayerAverages(),
+    'insights.generateMatchupInsights': i => {
+      const [teamA, teamB, reportData] = matchups[i % matchups.length];
+      insights.generateMatchupInsights(teamA, teamB, reportData);
+    },
+    'advanced.buildMatchupReport': i => {
+      const fixture = fixtures[i % fixtures.length];
+      return advanced.buildMatchupReport(fixture.homeTeam, fixture.awayTeam);
+    }
+  };
+
+  const results = {
+    generatedAt: new Date().toISOString(),
+    node: process.version,
+    gcExposed: typeof global.gc === 'function',
+    scale: { teams: args.teams, rounds: args.rounds, seasons: args.seasons, seed: args.seed, games: played.length },
+    stages: {}
+  };
+
+  console.log('stage                               ops/sec     p50(ms)     p95(ms)   heap(KB)');
+  for (const [name, fn] of Object.entries(stages)) {
+    const stage = await measureStage(fn, { samples: args.samples });
+    results.stages[name] = stage;
+    console.log(
+      `${name.padEnd(34)} ${stage.opsPerSec.toFixed(0).padStart(9)} ${stage.p50Ms.toFixed(3).padStart(11)} ` +
+      `${stage.p95Ms.toFixed(3).padStart(11)} ${(stage.heapGrowthBytes / 1024).toFixed(0).padStart(10)}`
+    );
+  }
+  if (!results.gcExposed) console.log('(heap growth is approximate - run with node --expose-gc)');
+
+  fs.writeFileSync(args.out, JSON.stringify(results, null, 2) + '\n');
+  console.log(`Wrote: ${path.relative(process.cwd(), args.out) || args.out}`);
+
+  if (args.updateBaseline) {
+    fs.writeFileSync(args.baseline, JSON.stringify(results, null, 2) + '\n');
+    console.log(`Baseline updated: ${path.relative(process.cwd(), args.baseline)}`);
+    return;
+  }
+  if (!fs.existsSync(args.baseline)) {
+    console.log('No baseline - run with --update-baseline to store one');
+    return;
+  }
+
+  const baseline = JSON.parse(fs.readFileSync(args.baseline, 'utf8'));
+  const sameScale = ['teams', 'rounds', 'seasons', 'seed'].every(key => baseline.scale?.[key] === results.scale[key]);
+  if (!sameScale) {
+    console.log(`Baseline is for a different scale (${JSON.stringify(baseline.scale)}) - not compared`);
+    return;
+  }
+
+  const regressions = compareToBaseline(results, baseline, { tolerance: args.tolerance });
+  if (regressions.length === 0) {
+    console.log(`No regressions against baseline (tolerance ${(args.tolerance * 100).toFixed(0)}%)`);
+    return;
+  }
+  regressions.forEach(({ stage, metric, baseline: expected, current, ratio }) => {
+    console.error(`REGRESSION ${stage} ${metric}: ${expected} -> ${current}${ratio ? ` (${ratio.toFixed(2)}x)` : ''}`);
+  });
+  process.exitCode = 1;
+}
+
+run().catch(error => {
+  console.error(error);
+  process.exit(1);
+});
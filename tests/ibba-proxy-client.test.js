@@ -0,0 +1,187 @@
+const assert = require('assert');
+const fs = require('fs');
+const path = require('path');
+const vm = require('vm');
+
+const TARGET = 'https://ibasketball.co.il/wp-json/sportspress/v2/events?month=2025-11';
+
+function loadClient(fetchImpl) {
+  const context = {
+    console: { log() {}, warn() {}, error() {} },
+    fetch: (...args) => fetchImpl(...args),
+    setTimeout,
+    clearTimeout,
+    AbortController,
+    Promise,
+    window: {}
+  };
+  vm.createContext(context);
+  vm.runInContext(fs.readFileSync(path.join(__dirname, '..', 'js', 'ibba', 'ibba_proxy_client.js'), 'utf8'), context);
+  return context.window.IBBAProxyClient;
+}
+
+function jsonResponse(body, status = 200) {
+  return {
+    ok: status >= 200 && status < 300,
+    status,
+    json: async () => JSON.parse(body),
+    text: async () => body
+  };
+}
+
+function hostOf(url) {
+  if (url.startsWith('https://corsproxy.io')) return 'corsproxy';
+  if (url.startsWith('https://api.allorigins.win/raw')) return 'allorigins-raw';
+  if (url.startsWith('https://api.allorigins.win/get')) return 'allorigins-get';
+  return 'other';
+}
+
+// fetch מדומה: לכל proxy התנהגות { delay, status, body } או fail
+function createFetch(behaviour, calls) {
+  return (url, { signal }) => new Promise((resolve, reject) => {
+    const host = hostOf(url);
+    calls.push(host);
+    const { delay = 0, status = 200, body = '{"ok":true}', hang = false } = behaviour[host] || {};
+    const timer = hang ? null : setTimeout(() => resolve(jsonResponse(body, status)), delay);
+    signal.addEventListener('abort', () => {
+      clearTimeout(timer);
+      const error = new Error('aborted');
+      error.name = 'AbortError';
+      reject(error);
+    });
+  });
+}
+
+async function run() {
+  const calls = [];
+  const behaviour = {};
+  const IBBAProxyClient = loadClient(createFetch(behaviour, calls));
+  let clock = 0;
+  const now = () => clock;
+
+  // Unknown proxies keep the caller's order, measured latency then wins
+  {
+    const client = new IBBAProxyClient({ now, defaultLatencyMs: 500 });
+    assert.deepStrictEqual(Array.from(client.rankProxies(['corsproxy', 'allorigins-raw'])), ['corsproxy', 'allorigins-raw']);
+    client.recordSuccess('corsproxy', 1200);
+    client.recordSuccess('allorigins-raw', 300);
+    assert.deepStrictEqual(Array.from(client.rankProxies(['corsproxy', 'allorigins-raw'])), ['allorigins-raw', 'corsproxy']);
+
+    // EWMA and success rate in the stats
+    client.recordSuccess('allorigins-raw', 1300);
+    client.recordFailure('allorigins-raw', 'HTTP 500');
+    const stats = client.getStats()['allorigins-raw'];
+    assert.strictEqual(stats.latencyMs, 600);
+    assert.strictEqual(stats.successRate, 0.67);
+    assert.strictEqual(stats.lastError, 'HTTP 500');
+    assert.strictEqual(stats.state, 'closed');
+  }
+
+  // Failing proxy falls through to the next one and opens its circuit after the threshold
+  {
+    const client = new IBBAProxyClient({ now, failureThreshold: 2, cooldownMs: 1000 });
+    behaviour.corsproxy = { status: 503 };
+    behaviour['allorigins-raw'] = { body: '[1,2]' };
+
+    const data = await client.fetch(TARGET, { proxies: ['corsproxy', 'allorigins-raw'] });
+    assert.deepStrictEqual(Array.from(data), [1, 2]);
+    // One failure is enough to demote it behind the healthy proxy
+    assert.deepStrictEqual(Array.from(client.rankProxies(['corsproxy', 'allorigins-raw'])), ['allorigins-raw', 'corsproxy']);
+    await assert.rejects(client.fetch(TARGET, { proxies: ['corsproxy'] }), /HTTP 503/);
+    assert.strictEqual(client.getState('corsproxy'), 'open');
+
+    // Open circuit is skipped entirely
+    calls.length = 0;
+    await client.fetch(TARGET, { proxies: ['corsproxy', 'allorigins-raw'] });
+    assert.deepStrictEqual(calls, ['allorigins-raw']);
+
+    // After the cooldown one probe is allowed; success closes the circuit
+    clock += 1000;
+    assert.strictEqual(client.getState('corsproxy'), 'half-open');
+    behaviour.corsproxy = { body: '"recovered"' };
+    client.health.get('allorigins-raw').latencyMs = 60000; // make the recovered proxy the first choice
+    calls.length = 0;
+    assert.strictEqual(await client.fetch(TARGET, { proxies: ['corsproxy', 'allorigins-raw'] }), 'recovered');
+    assert.deepStrictEqual(calls, ['corsproxy']);
+    assert.strictEqual(client.getState('corsproxy'), 'closed');
+
+    // A failed probe re-opens with a doubled cooldown
+    behaviour.corsproxy = { status: 500 };
+    client.recordFailure('corsproxy', 'x');
+    client.recordFailure('corsproxy', 'x');
+    clock += 1000;
+    assert.strictEqual(client.getState('corsproxy'), 'half-open');
+    client.recordFailure('corsproxy', 'x');
+    assert.strictEqual(client.getStats().corsproxy.openForMs, 2000);
+  }
+
+  // All proxies fail -> one error with every attempt
+  {
+    const client = new IBBAProxyClient({ now });
+    behaviour.corsproxy = { status: 500 };
+    behaviour['allorigins-raw'] = { status: 502 };
+    await assert.rejects(
+      client.fetch(TARGET, { proxies: ['corsproxy', 'allorigins-raw'] }),
+      error => /All proxies failed/.test(error.message) && error.attempts.length === 2
+    );
+  }
+
+  // Timeouts, validation and the allorigins /get wrapper
+  {
+    const client = new IBBAProxyClient({ now });
+    behaviour.corsproxy = { hang: true };
+    behaviour['allorigins-get'] = { body: JSON.stringify({ contents: '<html>short</html>' }) };
+    behaviour['allorigins-raw'] = { body: `<html>${'x'.repeat(2000)}</html>` };
+    const attempts = [];
+    const html = await client.fetch(TARGET, {
+      proxies: [{ id: 'corsproxy', timeoutMs: 20 }, 'allorigins-get', 'allorigins-raw'],
+      as: 'text',
+      validate: body => body.length > 1000,
+      onAttempt: info => attempts.push(info.attempt)
+    });
+    assert.ok(html.length > 2000);
+    assert.deepStrictEqual(attempts, [1, 2, 3]);
+    const stats = client.getStats();
+    assert.strictEqual(stats.corsproxy.lastError, 'timeout (20ms)');
+    assert.strictEqual(stats['allorigins-get'].lastError, 'Invalid response');
+  }
+
+  // Race mode: the faster of the top two wins, the loser is not counted as a failure
+  {
+    const client = new IBBAProxyClient({ race: true });
+    behaviour.corsproxy = { delay: 60, body: '"slow"' };
+    behaviour['allorigins-raw'] = { delay: 5, body: '"fast"' };
+    assert.strictEqual(await client.fetch(TARGET, { proxies: ['corsproxy', 'allorigins-raw'] }), 'fast');
+    const stats = client.getStats();
+    assert.strictEqual(stats.corsproxy.attempts, 0);
+    assert.strictEqual(stats['allorigins-raw'].successes, 1);
+
+    // Both racers fail -> the rest of the list is tried in order
+    behaviour.corsproxy = { status: 500 };
+    behaviour['allorigins-raw'] = { status: 500 };
+    behaviour['allorigins-get'] = { body: JSON.stringify({ contents: '{"id":7}' }) };
+    const data = await client.fetch(TARGET, { proxies: ['corsproxy', 'allorigins-raw', 'allorigins-get'] });
+    assert.strictEqual(data.id, 7);
+  }
+
+  // Caller cancellation is not recorded against the proxy
+  {
+    const client = new IBBAProxyClient();
+    behaviour.corsproxy = { hang: true };
+    const controller = new AbortController();
+    const pending = client.fetch(TARGET, { proxies: ['corsproxy', 'allorigins-raw'], signal: controller.signal });
+    setTimeout(() => controller.abort(), 5);
+    await assert.rejects(pending, /Request cancelled/);
+    assert.strictEqual(client.getStats().corsproxy.attempts, 0);
+  }
+
+  // Shared instance lives on window
+  assert.strictEqual(IBBAProxyClient.getShared(), IBBAProxyClient.getShared());
+
+  console.log('ibba-proxy-client tests passed');
+}
+
+run().catch(error => {
+  console.error(error);
+  process.exit(1);
+});
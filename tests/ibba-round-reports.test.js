@@ -0,0 +1,121 @@
+const assert = require('assert');
+const fs = require('fs');
+const path = require('path');
+const vm = require('vm');
+const { generateSeason, createRandom } = require('./helpers/synthetic-season');
+
+const IBBA_DIR = path.join(__dirname, '..', 'js', 'ibba');
+const GOLDEN_FILE = path.join(__dirname, 'fixtures', 'insights-round.golden.json');
+
+function loadModules() {
+  const context = {
+    console: { log() {}, warn() {}, error() {}, time() {}, timeEnd() {} },
+    require,
+    setTimeout,
+    AbortController,
+    window: {},
+    document: { createElement() { return { innerHTML: '', get value() { return this.innerHTML; } }; } },
+    sessionStorage: { getItem() { return null; }, setItem() {}, removeItem() {} },
+    __random: createRandom(2024)
+  };
+
+  vm.createContext(context);
+  vm.runInContext('Math.random = __random;', context);
+  ['ibba_adapter.js', 'ibba_analytics.js', 'ibba_insights_templates.js', 'ibba_insights_v2.js', 'ibba_advanced.js',
+    'ibba_round_reports.js'].forEach(name => {
+    vm.runInContext(fs.readFileSync(path.join(IBBA_DIR, name), 'utf8'), context);
+  });
+  return context.window;
+}
+
+function buildRound() {
+  const { IBBAAdapter, IBBAAnalytics, IBBAAdvanced, IBBARoundReports } = loadModules();
+  const adapter = new IBBAAdapter();
+  const events = generateSeason({ seed: 11, teams: 12 });
+  const lastRound = Math.max(...events.map(event => event.stage_id));
+  const played = events.filter(event => event.stage_id < lastRound).map(event => adapter.convertToInternalFormat(event));
+  const fixtures = events.filter(event => event.stage_id === lastRound).map(event => {
+    const game = adapter.convertToInternalFormat(event);
+    return { gameId: game.gameId, homeTeam: game.homeTeam, awayTeam: game.awayTeam };
+  });
+
+  const advanced = new IBBAAdvanced(new IBBAAnalytics(played));
+  advanced.standingsLoaded = true; // no HTML standings offline - use the calculated fallback
+  return { advanced, fixtures, IBBARoundReports };
+}
+
+async function run() {
+  // Main thread: one shared season context, identical output to per-fixture buildMatchupReport
+  {
+    const { advanced, fixtures, IBBARoundReports } = buildRound();
+    const runner = new IBBARoundReports(advanced, { useWorkers: false });
+    const streamed = [];
+    const results = await runner.run(fixtures, { onReport: (result, index) => streamed.push(index) });
+
+    const golden = JSON.parse(fs.readFileSync(GOLDEN_FILE, 'utf8'));
+    const actual = JSON.parse(JSON.stringify(results.map(({ fixture, report }) => ({
+      matchup: `${fixture.homeTeam} - ${fixture.awayTeam}`,
+      insightsV2: report.insightsV2,
+      insights: report.insights,
+      narrative: report.narrative
+    }))));
+    assert.deepStrictEqual(actual, golden);
+    assert.deepStrictEqual(streamed, [0, 1, 2, 3, 4, 5]);
+    assert.strictEqual(runner.lastRunTimings.mode, 'main');
+  }
+
+  // worker_threads pool: reports stream back and land in fixture order
+  const mainThread = buildRound();
+  const expected = await new mainThread.IBBARoundReports(mainThread.advanced, { useWorkers: false }).run(mainThread.fixtures);
+  {
+    const { advanced, fixtures, IBBARoundReports } = buildRound();
+    const runner = new IBBARoundReports(advanced, {
+      workerUrl: path.join(IBBA_DIR, 'ibba_round_reports_worker.js'),
+      concurrency: 2,
+      silentWorkers: true
+    });
+    const streamed = [];
+    const results = await runner.run(fixtures, { onReport: (result, index) => streamed.push(index) });
+
+    assert.strictEqual(runner.lastRunTimings.mode, 'worker');
+    assert.deepStrictEqual(streamed.slice().sort(), [0, 1, 2, 3, 4, 5]);
+    results.forEach((result, index) => {
+      assert.ok(!result.error, result.error);
+      assert.strictEqual(result.fixture, fixtures[index]);
+      assert.strictEqual(result.report.teamA.name, fixtures[index].homeTeam);
+      assert.deepStrictEqual(result.report.teamA.stats, JSON.parse(JSON.stringify(expected[index].report.teamA.stats)));
+      assert.deepStrictEqual(result.report.h2h, JSON.parse(JSON.stringify(expected[index].report.h2h)));
+      assert.ok(result.report.insights.length > 0);
+    });
+  }
+
+  // Cancel mid-round: the batch rejects, reports already streamed are kept
+  {
+    const { advanced, fixtures, IBBARoundReports } = buildRound();
+    const runner = new IBBARoundReports(advanced, {
+      workerUrl: path.join(IBBA_DIR, 'ibba_round_reports_worker.js'),
+      concurrency: 1,
+      silentWorkers: true
+    });
+    const streamed = [];
+    await assert.rejects(
+      runner.run(fixtures, {
+        onReport: (result, index) => {
+          streamed.push(index);
+          runner.cancel();
+        }
+      }),
+      /cancelled/
+    );
+    assert.deepStrictEqual(streamed, [0]);
+    assert.strictEqual(runner.lastRunTimings.cancelled, true);
+    assert.strictEqual(runner.workers.length, 0, 'workers are terminated');
+  }
+
+  console.log('ibba-round-reports tests passed');
+}
+
+run().catch(error => {
+  console.error(error);
+  process.exit(1);
+});
@@ -0,0 +1,186 @@
+const assert = require('assert');
+const fs = require('fs');
+const path = require('path');
+const vm = require('vm');
+const { generateSeason } = require('./helpers/synthetic-season');
+
+function loadModules() {
+  const context = {
+    console: { log() {}, warn() {}, error() {}, time() {}, timeEnd() {} },
+    document: { createElement() { return { innerHTML: '', get value() { return this.innerHTML; } }; } }
+  };
+  context.window = context;
+  vm.createContext(context);
+  ['ibba_adapter.js', 'ibba_analytics.js', 'ibba_insights_templates.js', 'ibba_insights_v2.js', 'ibba_season_registry.js']
+    .forEach(name => {
+      vm.runInContext(fs.readFileSync(path.join(__dirname, '..', 'js', 'ibba', name), 'utf8'), context);
+    });
+  return context;
+}
+
+const plain = value => JSON.parse(JSON.stringify(value));
+
+const { IBBAAdapter, IBBAAnalytics, IBBASeasonRegistry, IBBAInsightsV2 } = loadModules();
+const converter = new IBBAAdapter();
+// 3 עונות סינתטיות: 2021-10, 2022-10, 2023-10 (אותם שמות קבוצות, שחקנים אחרים)
+const events = generateSeason({ seed: 5, teams: 6, rounds: 10, seasons: 3 });
+const SEASONS = [2021, 2022, 2023].map((year, index) => ({
+  leagueId: 500 + index,
+  seasonId: 600 + index,
+  label: `${year}/${String(year + 1).slice(2)}`,
+  seasonMonths: [`${year}-10`, `${year}-11`, `${year}-12`]
+}));
+const gamesFor = season => events
+  .filter(event => event.date.slice(0, 4) === season.seasonMonths[0].slice(0, 4))
+  .map(event => converter.convertToInternalFormat(event));
+const allGames = SEASONS.flatMap(gamesFor);
+
+function createRegistry(options = {}) {
+  const calls = [];
+  const registry = new IBBASeasonRegistry({
+    seasons: SEASONS,
+    loader: async season => {
+      calls.push(season.key);
+      await new Promise(resolve => setTimeout(resolve, 5));
+      return gamesFor(season);
+    },
+    ...options
+  });
+  return { registry, calls };
+}
+
+async function run() {
+  // רישום וסדר כרונולוגי
+  {
+    const { registry } = createRegistry({ seasons: [SEASONS[2], SEASONS[0], SEASONS[1]] });
+    assert.deepStrictEqual(plain(registry.getSeasonKeys()), ['500:600', '501:601', '502:602']);
+    assert.throws(() => registry.resolveKeys(['1:2']), /Unknown season/);
+  }
+
+  // טעינה עצלה: שום דבר לא נטען עד השאילתה, ושאילתות מקבילות חולקות טעינה אחת
+  {
+    const { registry, calls } = createRegistry();
+    assert.strictEqual(calls.length, 0);
+    const [first, second] = await Promise.all([registry.getSeason('500:600'), registry.getSeason('500:600')]);
+    assert.strictEqual(first, second);
+    assert.deepStrictEqual(calls, ['500:600']);
+    assert.strictEqual(first.tier, 'full');
+    assert.strictEqual(first.games.length, 30);
+
+    await registry.getSeason('500:600');
+    assert.strictEqual(registry.stats.hits, 1);
+    assert.strictEqual(calls.length, 1);
+  }
+
+  // keepFullSeasons: העונה הכי פחות בשימוש נשמרת כסכומים בלבד, ונטענת מחדש רק כשצריך משחקים
+  {
+    const { registry, calls } = createRegistry({ keepFullSeasons: 1 });
+    await registry.getSeason('500:600');
+    await registry.getSeason('501:601');
+    const tiers = plain(registry.getMemoryUsage().seasons.map(season => [season.key, season.tier]));
+    assert.deepStrictEqual(tiers, [['500:600', 'compact'], ['501:601', 'full']]);
+    assert.strictEqual(registry.stats.demoted, 1);
+
+    const compact = await registry.getSeason('500:600');
+    assert.strictEqual(compact.tier, 'compact');
+    assert.strictEqual(compact.games, null);
+    assert.strictEqual(compact.lines.length, 30);
+    assert.strictEqual(calls.length, 2);
+
+    const full = await registry.getSeason('500:600', { full: true });
+    assert.strictEqual(full.tier, 'full');
+    assert.strictEqual(calls.length, 3);
+  }
+
+  // תקציב זיכרון: מעל maxBytes עונות מצומצמות ישנות נמחקות, ונטענות שוב כשמבקשים
+  {
+    const probe = createRegistry().registry;
+    const entry = await probe.getSeason('500:600');
+    probe.demote(entry);
+    const compactBytes = entry.bytes;
+
+    const { registry, calls } = createRegistry({ keepFullSeasons: 0, maxBytes: Math.round(compactBytes * 1.5) });
+    await registry.getSeason('500:600');
+    await registry.getSeason('501:601');
+    const usage = registry.getMemoryUsage();
+    assert.deepStrictEqual(plain(usage.seasons.map(season => season.key)), ['501:601']);
+    assert.strictEqual(registry.stats.evicted, 1);
+
+    await registry.getSeason('500:600');
+    assert.deepStrictEqual(calls, ['500:600', '501:601', '500:600']);
+  }
+
+  // getAnalytics: הסכומים הממוזגים זהים לחישוב על כל המשחקים (גם כשחלק מהעונות מצומצמות)
+  {
+    const { registry } = createRegistry({ keepFullSeasons: 1 });
+    const merged = await registry.getAnalytics();
+    const expected = new IBBAAnalytics(allGames);
+
+    assert.deepStrictEqual(plain(merged.getOverallStats()), plain(expected.getOverallStats()));
+    const byTeam = list => plain(list).sort((a, b) => a.teamName.localeCompare(b.teamName));
+    assert.deepStrictEqual(byTeam(merged.getTeamAverages()), byTeam(expected.getTeamAverages()));
+    const byPlayer = list => plain(list).sort((a, b) => String(a.playerId).localeCompare(String(b.playerId)));
+    assert.deepStrictEqual(byPlayer(merged.getPlayerAverages()), byPlayer(expected.getPlayerAverages()));
+
+    // עונה מלאה אחת - המופע של העונה עצמה
+    const single = await registry.getAnalytics(['502:602']);
+    assert.strictEqual(single, registry.entries.get('502:602').analytics);
+
+    assert.strictEqual((await registry.getGames(['500:600', '501:601'])).length, 60);
+  }
+
+  // H2H לאורך עונות + ממוצעים לכל עונה
+  {
+    const { registry } = createRegistry({ keepFullSeasons: 1 });
+    const teamA = allGames[0].homeTeam;
+    const teamB = allGames[0].awayTeam;
+    const h2h = await registry.getH2HHistory(teamA, teamB);
+
+    const meetings = allGames.filter(game =>
+      (game.homeTeam === teamA && game.awayTeam === teamB) || (game.homeTeam === teamB && game.awayTeam === teamA));
+    assert.strictEqual(h2h.totalGames, meetings.length);
+    assert.strictEqual(h2h.seasons, 3);
+    assert.strictEqual(h2h.bySeason.reduce((sum, season) => sum + season.games, 0), meetings.length);
+    assert.strictEqual(h2h.teamAWins + h2h.teamBWins, h2h.totalGames);
+    const dates = h2h.games.map(game => game.date);
+    assert.deepStrictEqual(plain(dates), plain(dates.slice().sort((a, b) => new Date(a) - new Date(b))));
+
+    const seasons = await registry.getTeamSeasons(teamA);
+    assert.deepStrictEqual(plain(seasons.map(season => season.label)), ['2021/22', '2022/23', '2023/24']);
+    const expected = new IBBAAnalytics(gamesFor(SEASONS[0])).getTeamAverages().find(team => team.teamName === teamA);
+    assert.deepStrictEqual(plain(seasons[0].stats), plain(expected));
+    assert.strictEqual((await registry.getTeamSeasons('אין כזו קבוצה'))[0].stats, null);
+  }
+
+  // Insights לאורך עונות
+  {
+    const insights = new IBBAInsightsV2();
+    const row = (winPct, pointDiff) => ({ stats: { gamesPlayed: 10, winPct: winPct.toFixed(1), pointDiff: pointDiff.toFixed(1) } });
+
+    const allTime = insights.detectAllTimeH2H('A', 'B', { totalGames: 5, teamAWins: 1, teamBWins: 4, seasons: 2, avgMargin: '8.0' });
+    assert.strictEqual(allTime.teamName, 'B');
+    assert.strictEqual(allTime.record, '4-1');
+    assert.strictEqual(insights.detectAllTimeH2H('A', 'B', { totalGames: 5, teamAWins: 3, teamBWins: 2, seasons: 2 }), null);
+    assert.strictEqual(insights.detectAllTimeH2H('A', 'B', { totalGames: 5, teamAWins: 5, teamBWins: 0, seasons: 1 }), null);
+
+    const up = insights.detectSeasonOverSeason('A', [{ label: '2023/24', ...row(30, -4) }, { label: '2024/25', ...row(60, 2) }]);
+    assert.strictEqual(up.type, 'SEASON_IMPROVEMENT');
+    assert.strictEqual(up.previousSeason, '2023/24');
+    const down = insights.detectSeasonOverSeason('A', [row(50, 3), row(45, -4)]);
+    assert.strictEqual(down.type, 'SEASON_DECLINE');
+    assert.strictEqual(insights.detectSeasonOverSeason('A', [row(50, 1), row(55, 2)]), null);
+
+    const { registry } = createRegistry();
+    const data = await registry.getMultiSeasonData(allGames[0].homeTeam, allGames[0].awayTeam);
+    const generated = insights.generateMultiSeasonInsights(allGames[0].homeTeam, allGames[0].awayTeam, data);
+    assert.deepStrictEqual(Object.keys(generated), ['H2H', 'MOMENTUM']);
+    [...generated.H2H, ...generated.MOMENTUM].forEach(insight => assert.ok(insight.text && insight.icon));
+  }
+
+  console.log('ibba-season-registry tests passed');
+}
+
+run().catch(error => {
+  console.error(error);
+  process.exit(1);
+});
@@ -0,0 +1,98 @@
+// Benchmark: extracting the standings / Plus-Minus tables from saved league pages
+//   node --expose-gc tests/ibba-table-extractor.bench.js [--samples 30] [--out extract_results.json] [page.html ...]
+// Default pages: tests/fixtures/pages/*.html (regenerate with tests/helpers/wp-league-page.js).
+// Stages per page and kind:
+//   fullTokenize - the whole page through the tokenizer (what any whole-document parse has to walk)
+//   slice        - cutting out the table only (main thread cost when the parse runs in the worker)
+//   extract.cold - slice + hash + parse, empty cache
+//   extract.hit  - slice + hash, result from the cache (unchanged table)
+//   domParser    - jsdom DOMParser + querySelectorAll, the old code path (only when jsdom is installed)
+const fs = require('fs');
+const path = require('path');
+const { measureStage } = require('./helpers/bench-harness');
+// required directly, not through the vm loader: global lookups inside a vm context are much slower than in a page
+const IBBATableExtractor = require('../js/ibba/ibba_table_extractor.js');
+
+const PAGES_DIR = path.join(__dirname, 'fixtures', 'pages');
+
+function parseArgs(argv) {
+  const args = { samples: 30, out: null, pages: [] };
+  for (let i = 0; i < argv.length; i++) {
+    const flag = argv[i];
+    if (flag === '--samples') args.samples = Number(argv[++i]);
+    else if (flag === '--out') args.out = path.resolve(argv[++i]);
+    else if (flag.startsWith('--')) throw new Error(`Unknown option: ${flag}`);
+    else args.pages.push(path.resolve(flag));
+  }
+  if (args.pages.length === 0) {
+    args.pages = fs.readdirSync(PAGES_DIR).filter(name => name.endsWith('.html')).map(name => path.join(PAGES_DIR, name));
+  }
+  return args;
+}
+
+function loadDomParser() {
+  try {
+    const { JSDOM } = require('jsdom');
+    return new JSDOM('').window.DOMParser;
+  } catch (error) {
+    return null;
+  }
+}
+
+const DOM_QUERIES = {
+  standings: doc => doc.querySelector('.sp-league-table').querySelectorAll('tbody tr').length,
+  plusMinus: doc => doc.querySelectorAll('tr[data-pm]').length
+};
+
+async function run() {
+  const args = parseArgs(process.argv.slice(2));
+  const DOMParser = loadDomParser();
+  const results = { generatedAt: new Date().toISOString(), node: process.version, pages: {} };
+
+  console.log('page / stage                                  ops/sec     p50(ms)     p95(ms)');
+  for (const file of args.pages) {
+    const html = fs.readFileSync(file, 'utf8');
+    const name = path.basename(file);
+    const stages = {
+      fullTokenize: () => IBBATableExtractor.tokenize(html, { onOpen() {}, onClose() {}, onText() {} })
+    };
+    for (const kind of ['standings', 'plusMinus']) {
+      const cold = new IBBATableExtractor({ useWorker: false });
+      const warm = new IBBATableExtractor({ useWorker: false });
+      warm.extractSync(html, kind);
+      stages[`${kind}.slice`] = () => IBBATableExtractor.KINDS[kind].slice(html);
+      stages[`${kind}.extract.cold`] = () => {
+        cold.clearCache();
+        cold.extractSync(html, kind);
+      };
+      stages[`${kind}.extract.hit`] = () => warm.extractSync(html, kind);
+      if (DOMParser) {
+        stages[`${kind}.domParser`] = () => DOM_QUERIES[kind](new DOMParser().parseFromString(html, 'text/html'));
+      }
+    }
+
+    const fragments = IBBATableExtractor.KINDS.standings.slice(html).concat(IBBATableExtractor.KINDS.plusMinus.slice(html));
+    results.pages[name] = {
+      bytes: html.length,
+      slicedBytes: fragments.reduce((sum, fragment) => sum + fragment.length, 0),
+      stages: {}
+    };
+    console.log(`${name} (${(html.length / 1024).toFixed(0)}KB, tables ${(results.pages[name].slicedBytes / 1024).toFixed(0)}KB)`);
+    for (const [stage, fn] of Object.entries(stages)) {
+      const result = await measureStage(fn, { samples: args.samples });
+      results.pages[name].stages[stage] = result;
+      console.log(`  ${stage.padEnd(42)} ${result.opsPerSec.toFixed(0).padStart(9)} ${result.p50Ms.toFixed(3).padStart(11)} ${result.p95Ms.toFixed(3).padStart(11)}`);
+    }
+  }
+  if (!DOMParser) console.log('(jsdom not installed - domParser stages skipped)');
+
+  if (args.out) {
+    fs.writeFileSync(args.out, JSON.stringify(results, null, 2) + '\n');
+    console.log(`Wrote: ${path.relative(process.cwd(), args.out) || args.out}`);
+  }
+}
+
+run().catch(error => {
+  console.error(error);
+  process.exit(1);
+});
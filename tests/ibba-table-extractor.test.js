@@ -0,0 +1,169 @@
+const assert = require('assert');
+const fs = require('fs');
+const path = require('path');
+const vm = require('vm');
+const { buildLeaguePage } = require('./helpers/wp-league-page');
+
+const IBBA_DIR = path.join(__dirname, '..', 'js', 'ibba');
+const PAGE_FILE = path.join(__dirname, 'fixtures', 'pages', 'league-2025-2.html');
+
+function loadModules(names, extra = {}) {
+  const context = {
+    console: { log() {}, warn() {}, error() {}, time() {}, timeEnd() {} },
+    require,
+    setTimeout,
+    clearTimeout,
+    AbortController,
+    sessionStorage: { getItem() { return null; }, setItem() {}, removeItem() {} },
+    ...extra
+  };
+  context.window = context;
+  vm.createContext(context);
+  names.forEach(name => {
+    const file = path.join(IBBA_DIR, name);
+    vm.runInContext(fs.readFileSync(file, 'utf8'), context, { filename: file });
+  });
+  return context;
+}
+
+const plain = value => JSON.parse(JSON.stringify(value));
+
+async function run() {
+  const html = fs.readFileSync(PAGE_FILE, 'utf8');
+  const { IBBATableExtractor } = loadModules(['ibba_table_extractor.js']);
+
+  // Tokenizer: entities, comments, script/style content, unquoted attributes, implicit cell closes, nested tables
+  {
+    const rows = plain(IBBATableExtractor.parseTableRows(`
+      <table class=outer>
+        <!-- <tr><td>comment</td></tr> -->
+        <thead><tr><th>a<th>b</tr></thead>
+        <tbody>
+          <tr data-id=7 class="odd"><td class="data-name"><a href='/player/7/'>Tom &amp; Jerry&#8217;s</a>
+              <td>1<br>2<script>var x = '<td>no</td>';</script>
+          <tr><td><table><tr><td>inner</td></tr></table> after</td></tr>
+        </tbody>
+      </table>`));
+    assert.deepStrictEqual(rows.map(row => row.section), ['thead', 'tbody', 'tbody']);
+    assert.deepStrictEqual(rows[0].cells.map(cell => cell.text), ['a', 'b']);
+    assert.deepStrictEqual(rows[1].attrs, { 'data-id': '7', class: 'odd' });
+    assert.deepStrictEqual(rows[1].cells.map(cell => cell.text), ['Tom & Jerry’s', '1 2']);
+    assert.deepStrictEqual(rows[1].cells[0].links, [{ href: '/player/7/', text: 'Tom & Jerry’s' }]);
+    assert.deepStrictEqual(rows[2].cells.map(cell => cell.text), ['inner after']);
+  }
+
+  // Slicing: only the matching table, never '<table' inside scripts or comments
+  {
+    const page = `<head><script>document.write('<table class="sp-league-table"></table>');</script></head>
+      <body><!-- <table class="sp-league-table"> --><table class="layout"><tr><td>
+      <table class="sp-league-table sp-data-table"><tr><td><table><tr><td>x</td></tr></table></td></tr></table>
+      </td></tr></table><table class="sp-league-tablex"></table></body>`;
+    const fragments = IBBATableExtractor.sliceTablesByClass(page, 'sp-league-table');
+    assert.strictEqual(fragments.length, 1);
+    assert.ok(fragments[0].startsWith('<table class="sp-league-table sp-data-table">'));
+    assert.ok(fragments[0].endsWith('</table></td></tr></table>'));
+    assert.strictEqual(IBBATableExtractor.sliceTablesContaining(page, 'data-pm=').length, 0);
+  }
+
+  // Saved page: standings, Plus/Minus rows and player links
+  {
+    const extractor = new IBBATableExtractor({ useWorker: false });
+    const standings = plain(await extractor.extract(html, 'standings'));
+    assert.strictEqual(standings.length, 14);
+    assert.deepStrictEqual(Object.keys(standings[0]), ['rank', 'name', 'gp', 'w', 'l', 'bf', 'ba', 'bd', 'pts']);
+    assert.deepStrictEqual(standings.map(row => Number(row.rank)), Array.from({ length: 14 }, (_, i) => i + 1));
+
+    const plusMinus = await extractor.extract(html, 'plusMinus');
+    assert.strictEqual(plusMinus.length, 14 * 13);
+    assert.deepStrictEqual(plain(plusMinus[0]), { id: '900000', pm: '-24' });
+
+    const links = await extractor.extract(html, 'playerLinks');
+    assert.strictEqual(links.length, 14 * 13);
+    assert.ok(links.some(link => link.text.includes('O’Neal')), 'entities decoded in link text');
+  }
+
+  // Cache by hash of the sliced table: page chrome (nonce) changes still hit, a changed table misses
+  {
+    const extractor = new IBBATableExtractor({ useWorker: false });
+    const first = await extractor.extract(buildLeaguePage({ nonce: 'aaaa' }), 'standings');
+    const again = await extractor.extract(buildLeaguePage({ nonce: 'bbbb' }), 'standings');
+    assert.strictEqual(again, first);
+    assert.deepStrictEqual({ ...extractor.stats }, { hits: 1, misses: 1, workerParses: 0, inlineParses: 1 });
+
+    const changed = await extractor.extract(buildLeaguePage({ seed: 6 }), 'standings');
+    assert.notStrictEqual(changed, first);
+    assert.strictEqual(extractor.stats.inlineParses, 2);
+
+    const small = new IBBATableExtractor({ useWorker: false, cacheSize: 2 });
+    ['<table class="sp-league-table"><tr><td class="data-rank">1</td></tr></table>', 'a', 'b']
+      .forEach(page => small.extractSync(page, 'standings'));
+    assert.strictEqual(small.cache.size, 2);
+    assert.throws(() => small.extractSync(html, 'nope'), /Unknown extract kind/);
+  }
+
+  // Worker (worker_threads): same result as inline; a broken worker falls back to the main thread
+  {
+    const inline = new IBBATableExtractor({ useWorker: false });
+    const worker = new IBBATableExtractor({
+      workerUrl: path.join(IBBA_DIR, 'ibba_table_extractor_worker.js'),
+      minWorkerBytes: 0
+    });
+    for (const kind of ['standings', 'plusMinus', 'playerLinks']) {
+      assert.deepStrictEqual(plain(await worker.extract(html, kind)), plain(await inline.extract(html, kind)));
+    }
+    assert.strictEqual(worker.stats.workerParses, 3);
+    assert.strictEqual(worker.stats.inlineParses, 0);
+    worker.terminate();
+
+    const broken = new IBBATableExtractor({ workerUrl: path.join(IBBA_DIR, 'missing_worker.js'), minWorkerBytes: 0 });
+    const standings = await broken.extract(html, 'standings');
+    assert.strictEqual(standings.length, 14);
+    assert.strictEqual(broken.workerFailed, true);
+    assert.strictEqual(broken.stats.inlineParses, 1);
+  }
+
+  // Callers: IBBAAdvanced standings, IBBAPlayerNames Plus/Minus, IBBAPlayerSync players
+  {
+    const context = loadModules([
+      'ibba_table_extractor.js', 'ibba_proxy_client.js', 'ibba_analytics.js', 'ibba_insights_templates.js',
+      'ibba_insights_v2.js', 'ibba_advanced.js', 'ibba_player_names.js', 'ibba_player_sync.js'
+    ], { document: { createElement() { return {}; } } });
+    const shared = context.IBBATableExtractor.getShared();
+    shared.useWorker = false;
+    const proxyClient = { fetch: async () => html };
+
+    const advanced = new context.IBBAAdvanced(new context.IBBAAnalytics([]));
+    advanced.proxyClient = proxyClient;
+    const standings = await advanced.loadStandingsFromHTML();
+    assert.strictEqual(standings.size, 14);
+    const leader = Array.from(standings.values()).find(row => row.rank === 1);
+    assert.strictEqual(typeof leader.wins, 'number');
+    assert.strictEqual(leader.gamesPlayed, leader.wins + leader.losses);
+    assert.strictEqual(leader.pointDiff, leader.pointsFor - leader.pointsAgainst);
+
+    const names = new context.IBBAPlayerNames(null, { storage: null });
+    names.proxyClient = proxyClient;
+    names.namesMap.set('900000', { name: 'a' });
+    names.namesMap.set('901305', { name: 'b' });
+    assert.strictEqual(await names.loadPlayerStatsFromHTML(), 2);
+    assert.strictEqual(names.namesMap.get('900000').totalPlusMinus, -24);
+
+    const IBBAPlayerSync = vm.runInContext('IBBAPlayerSync', context);
+    const players = await new IBBAPlayerSync().parsePlayersFromHtml(html);
+    assert.strictEqual(players.length, 14 * 13);
+    assert.strictEqual(players[0].source, 'ibba_league_page_alt');
+    const cards = await new IBBAPlayerSync().parsePlayersFromHtml(
+      '<body><div class="player-card" data-player-id="12"><h3> Avi&nbsp;Cohen </h3><span class="team-name">Hapoel</span>' +
+      '<a data-team-id="55" href="/team/55/">t</a></div></body>'
+    );
+    assert.deepStrictEqual(plain(cards.map(({ playerId, name, teamId, teamName }) => ({ playerId, name, teamId, teamName }))),
+      [{ playerId: '12', name: 'Avi Cohen', teamId: '55', teamName: 'Hapoel' }]);
+  }
+
+  console.log('ibba-table-extractor tests passed');
+}
+
+run().catch(error => {
+  console.error(error);
+  process.exit(1);
+});
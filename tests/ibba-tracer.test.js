@@ -0,0 +1,170 @@
+const assert = require('assert');
+const fs = require('fs');
+const path = require('path');
+const vm = require('vm');
+const { generateSeason } = require('./helpers/synthetic-season');
+
+function loadModules(names, extra = {}) {
+  const context = {
+    console: { log() {}, warn() {}, error() {}, time() {}, timeEnd() {} },
+    document: { createElement() { return { innerHTML: '', get value() { return this.innerHTML; } }; } },
+    sessionStorage: { getItem() { return null; }, setItem() {}, removeItem() {} },
+    ...extra
+  };
+  context.window = context;
+  vm.createContext(context);
+  names.forEach(name => {
+    const file = path.join(__dirname, '..', 'js', 'ibba', name);
+    vm.runInContext(fs.readFileSync(file, 'utf8'), context, { filename: file });
+  });
+  return context;
+}
+
+async function run() {
+  // Core API
+  {
+    let clock = 0;
+    const { IBBATracer } = loadModules(['ibba_tracer.js']);
+    const tracer = new IBBATracer({ now: () => clock });
+
+    // Off: no spans, the same no-op span every time
+    assert.strictEqual(tracer.startSpan('a'), IBBATracer.NOOP_SPAN);
+    assert.strictEqual(tracer.trace('a', () => 42), 42);
+    assert.strictEqual(tracer.getSpans().length, 0);
+
+    tracer.enable();
+    const result = tracer.trace('outer.run', () => {
+      clock += 1;
+      const inner = tracer.startSpan('inner.step', { k: 1 });
+      clock += 2;
+      inner.end({ rows: 3 });
+      return 'ok';
+    });
+    assert.strictEqual(result, 'ok');
+    const [inner, outer] = tracer.getSpans();
+    assert.strictEqual(inner.parentId, outer.id);
+    assert.strictEqual(inner.duration, 2);
+    assert.strictEqual(outer.duration, 3);
+    assert.deepStrictEqual({ ...inner.attrs }, { k: 1, rows: 3 });
+    assert.strictEqual(outer.category, 'outer');
+
+    // Async spans end when the promise settles; errors are recorded and rethrown
+    const pending = tracer.trace('fetch.page', async () => {
+      clock += 10;
+      await null;
+      clock += 5;
+      return 'page';
+    });
+    assert.strictEqual(await pending, 'page');
+    await assert.rejects(tracer.trace('fetch.fail', async () => { throw new Error('boom'); }), /boom/);
+    assert.throws(() => tracer.trace('sync.fail', () => { throw new Error('bad'); }), /bad/);
+    const byName = Object.fromEntries(tracer.getSpans().map(span => [span.name, span]));
+    assert.strictEqual(byName['fetch.page'].duration, 15);
+    assert.strictEqual(byName['fetch.fail'].error, 'boom');
+    assert.strictEqual(byName['sync.fail'].error, 'bad');
+
+    const summary = tracer.summarize();
+    const outerRow = summary.find(row => row.name === 'outer.run');
+    assert.strictEqual(outerRow.selfMs, 1);
+    assert.strictEqual(summary[0].name, 'fetch.page');
+
+    // maxSpans caps memory
+    const capped = new IBBATracer({ enabled: true, maxSpans: 2 });
+    for (let i = 0; i < 5; i++) capped.trace('x', () => i);
+    assert.strictEqual(capped.getSpans().length, 2);
+    assert.strictEqual(capped.dropped, 3);
+
+    // instrument: originals untouched while disabled, restored on disable
+    class Worker {
+      detectA(x) { return this.detectB(x) + 1; }
+      detectB(x) { return x * 2; }
+      other() { return 'other'; }
+    }
+    const originalA = Worker.prototype.detectA;
+    const lazy = new IBBATracer();
+    lazy.instrument(Worker.prototype, name => name.startsWith('detect'), { category: 'work' });
+    assert.strictEqual(Worker.prototype.detectA, originalA);
+    lazy.enable();
+    assert.notStrictEqual(Worker.prototype.detectA, originalA);
+    assert.strictEqual(new Worker().detectA(5), 11);
+    assert.deepStrictEqual(Array.from(lazy.getSpans(), span => span.name), ['work.detectB', 'work.detectA']);
+    assert.strictEqual(lazy.getSpans()[0].parentId, lazy.getSpans()[1].id);
+    assert.ok(!lazy.getSpans().some(span => span.name === 'work.other'));
+    lazy.disable();
+    assert.strictEqual(Worker.prototype.detectA, originalA);
+    new Worker().detectA(1);
+    assert.strictEqual(lazy.getSpans().length, 2);
+  }
+
+  // Pipeline: adapter → analytics → advanced report → insights detectors, exported as JSON
+  {
+    const context = loadModules([
+      'ibba_tracer.js', 'ibba_adapter.js', 'ibba_analytics.js', 'ibba_insights_templates.js',
+      'ibba_insights_v2.js', 'ibba_advanced.js'
+    ]);
+    const { IBBATracer, IBBAAdapter, IBBAAnalytics, IBBAAdvanced } = context;
+    const tracer = IBBATracer.getShared();
+    assert.strictEqual(tracer.isEnabled(), false);
+    tracer.enable();
+
+    const adapter = new IBBAAdapter();
+    const games = generateSeason({ seed: 3, teams: 8, rounds: 10 }).map(event => adapter.convertToInternalFormat(event));
+    const analytics = new IBBAAnalytics(games);
+    const advanced = new IBBAAdvanced(analytics);
+    advanced.standingsLoaded = true;
+    const report = await advanced.buildMatchupReport(games[0].homeTeam, games[0].awayTeam);
+    assert.ok(report);
+
+    const spans = tracer.getSpans();
+    const names = new Set(spans.map(span => span.name));
+    ['adapter.convertToInternalFormat', 'analytics.buildAggregates', 'advanced.buildMatchupReport',
+      'advanced.getSeasonContext', 'insights.generateMatchupInsights', 'insights.detectHotHand', 'insights.detectWinningStreak']
+      .forEach(name => assert.ok(names.has(name), `missing span ${name}`));
+    assert.strictEqual(spans.filter(span => span.name === 'adapter.convertToInternalFormat').length, games.length);
+    assert.strictEqual(spans.find(span => span.name === 'adapter.convertToInternalFormat').attrs.gameId, games[0].gameId);
+
+    // every detector span hangs under the report
+    const byId = new Map(spans.map(span => [span.id, span]));
+    const rootOf = span => (span.parentId === null ? span : rootOf(byId.get(span.parentId)));
+    spans.filter(span => span.name.startsWith('insights.detect')).forEach(span => {
+      assert.strictEqual(rootOf(span).name, 'advanced.buildMatchupReport');
+    });
+    const reportSpan = spans.find(span => span.name === 'advanced.buildMatchupReport');
+    assert.strictEqual(reportSpan.attrs.teamA, games[0].homeTeam);
+
+    const exported = JSON.parse(JSON.stringify(tracer.exportJSON()));
+    assert.strictEqual(exported.format, 'ibba-trace');
+    assert.strictEqual(exported.spans.length, spans.length);
+    assert.ok(exported.summary.some(row => row.name === 'insights.detectHotHand' && row.count >= 2));
+    const chrome = tracer.exportChromeTrace();
+    assert.strictEqual(chrome.traceEvents.length, spans.length);
+    assert.ok(chrome.traceEvents.every(event => event.ph === 'X' && event.dur >= 0));
+
+    // switched off: original methods, nothing recorded
+    tracer.disable();
+    tracer.clear();
+    await advanced.buildMatchupReport(games[0].homeTeam, games[0].awayTeam);
+    assert.strictEqual(tracer.getSpans().length, 0);
+    assert.ok(!/tracer\.trace/.test(IBBAAdvanced.prototype.buildMatchupReport.toString()));
+  }
+
+  // DB wrapper
+  {
+    const stored = [{ gameSerial: 1 }, { gameSerial: 2 }];
+    const context = loadModules(['ibba_tracer.js', 'ibba_db_wrapper.js'], {
+      dbAdapter: { init: async () => true, getGames: async () => stored }
+    });
+    const tracer = context.IBBATracer.getShared().enable();
+    const IBBADbWrapper = vm.runInContext('IBBADbWrapper', context);
+    const rows = await new IBBADbWrapper().getAllGames();
+    assert.strictEqual(rows.length, 2);
+    assert.deepStrictEqual(Array.from(tracer.getSpans(), span => span.name), ['db.getAllGames']);
+  }
+
+  console.log('ibba-tracer tests passed');
+}
+
+run().catch(error => {
+  console.error(error);
+  process.exit(1);
+});
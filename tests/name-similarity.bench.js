@@ -0,0 +1,45 @@
+// Benchmark: player alias scan (player_merge_tool.js) - full pairwise scan vs the bigram-indexed scan
+//   node tests/name-similarity.bench.js
+const assert = require('assert');
+const {
+  loadMergeTools, referencePlayerAliases, referenceTeamAliases, generatePlayers, generateTeams, aliasIds
+} = require('./helpers/merge-tools');
+
+function time(fn) {
+  const startedAt = process.hrtime.bigint();
+  const result = fn();
+  return { result, ms: Number(process.hrtime.bigint() - startedAt) / 1e6 };
+}
+
+function run() {
+  const tools = loadMergeTools();
+
+  console.log('players  groups  full scan(ms)  indexed scan(ms)  speedup  identical');
+  for (const count of [500, 2000, 5000]) {
+    const players = generatePlayers({ seed: 17, count });
+    const full = time(() => referencePlayerAliases(players, tools));
+    const indexed = time(() => tools.detectPlayerAliases(players));
+
+    const expected = aliasIds(full.result);
+    assert.deepStrictEqual(JSON.parse(JSON.stringify(aliasIds(indexed.result))), expected);
+
+    console.log(
+      `${String(count).padStart(7)}  ${String(expected.length).padStart(6)}  ` +
+      `${full.ms.toFixed(0).padStart(13)}  ${indexed.ms.toFixed(0).padStart(16)}  ` +
+      `${(full.ms / indexed.ms).toFixed(1).padStart(6)}x  ${'yes'.padStart(9)}`
+    );
+  }
+
+  const teams = generateTeams({ seed: 5, count: 400 });
+  const fullTeams = time(() => referenceTeamAliases(teams));
+  const indexedTeams = time(() => tools.detectTeamAliases(teams).map(alias => alias.teams.map(team => teams.indexOf(team))));
+  assert.deepStrictEqual(JSON.parse(JSON.stringify(indexedTeams.result)), fullTeams.result);
+  console.log(`\nteams: ${teams.length}, groups: ${fullTeams.result.length}, full ${fullTeams.ms.toFixed(0)}ms, indexed ${indexedTeams.ms.toFixed(0)}ms (identical)`);
+}
+
+try {
+  run();
+} catch (error) {
+  console.error(error);
+  process.exit(1);
+}
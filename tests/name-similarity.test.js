@@ -0,0 +1,59 @@
+const assert = require('assert');
+const { createRandom } = require('./helpers/synthetic-season');
+const {
+  loadMergeTools, referencePlayerAliases, referenceTeamAliases, generatePlayers, generateTeams, aliasIds
+} = require('./helpers/merge-tools');
+
+function run() {
+  const tools = loadMergeTools();
+  const { NameSimilarity } = tools;
+
+  // Bounded Levenshtein = exact distance up to the bound, bound + 1 past it
+  const random = createRandom(3);
+  const alphabet = 'אבגדה ab';
+  const randomName = () => Array.from({ length: Math.floor(random() * 10) }, () => alphabet[Math.floor(random() * alphabet.length)]).join('');
+  for (let t = 0; t < 20000; t++) {
+    const a = randomName();
+    const b = randomName();
+    const bound = Math.floor(random() * 5);
+    const distance = NameSimilarity.levenshteinDistance(a, b);
+    assert.strictEqual(NameSimilarity.boundedLevenshtein(a, b, bound), distance <= bound ? distance : bound + 1, `${a} / ${b} / ${bound}`);
+  }
+  assert.strictEqual(NameSimilarity.levenshteinDistance('רוברט טרנר', "רוברט יוג'ין טרנר"), 7);
+
+  // The index never drops a pair that passes the threshold
+  const names = Array.from({ length: 300 }, randomName);
+  const isSimilar = (distance, maxLength) => 1 - distance / maxLength > 0.6;
+  const index = NameSimilarity.createIndex(names, { words: true });
+  for (let i = 0; i < names.length; i++) {
+    const candidates = new Set(index.candidates(i, { isSimilar, substrings: true, words: true }));
+    for (let j = i + 1; j < names.length; j++) {
+      const [a, b] = [names[i], names[j]];
+      const expected = a === b || a.includes(b) || b.includes(a)
+        || isSimilar(NameSimilarity.levenshteinDistance(a, b), Math.max(a.length, b.length));
+      if (expected) assert.ok(candidates.has(j), `missed ${JSON.stringify([a, b])}`);
+    }
+  }
+
+  // Player alias groups identical to the full pairwise scan
+  const players = generatePlayers({ seed: 7, count: 600 });
+  const expectedPlayers = aliasIds(referencePlayerAliases(players, tools));
+  assert.ok(expectedPlayers.length > 20, 'fixture has alias groups');
+  assert.deepStrictEqual(JSON.parse(JSON.stringify(aliasIds(tools.detectPlayerAliases(players)))), expectedPlayers);
+
+  // Team alias groups identical too
+  const teams = generateTeams({ seed: 5, count: 120 });
+  const expectedTeams = referenceTeamAliases(teams);
+  const actualTeams = tools.detectTeamAliases(teams).map(alias => alias.teams.map(team => teams.indexOf(team)));
+  assert.ok(expectedTeams.length > 5, 'fixture has team alias groups');
+  assert.deepStrictEqual(JSON.parse(JSON.stringify(actualTeams)), expectedTeams);
+
+  console.log('name-similarity tests passed');
+}
+
+try {
+  run();
+} catch (error) {
+  console.error(error);
+  process.exit(1);
+}
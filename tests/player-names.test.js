@@ -3,15 +3,14 @@ const fs = require('fs');
 const path = require('path');
 const vm = require('vm');
 
-function loadPlayerNames(consoleImpl) {
-  const file = path.join(__dirname, '..', 'js', 'ibba', 'ibba_player_names.js');
-  const source = fs.readFileSync(file, 'utf8');
+function loadPlayerNames(consoleImpl, fetchImpl = null) {
+  const dir = path.join(__dirname, '..', 'js', 'ibba');
   const storage = new Map();
   const context = {
     console: consoleImpl,
-    fetch: async () => {
+    fetch: fetchImpl || (async () => {
       throw new Error('proxy down');
-    },
+    }),
     setTimeout: () => 1,
     clearTimeout: () => {},
     AbortController,
@@ -28,14 +27,72 @@ function loadPlayerNames(consoleImpl) {
     }
   };
 
-  vm.runInNewContext(source, context);
-  return context.window.IBBAPlayerNames;
+  vm.createContext(context);
+  ['ibba_proxy_client.js', 'ibba_player_names.js'].forEach(name => {
+    vm.runInContext(fs.readFileSync(path.join(dir, name), 'utf8'), context);
+  });
+  context.IBBAPlayerNames = context.window.IBBAPlayerNames;
+  context.storage = storage;
+  return context;
 }
 
-async function run() {
+const silentConsole = { log() {}, warn() {}, error() {} };
+
+/**
+ * Fake SportsPress players endpoint: paging, X-WP-TotalPages, include=, modified_after
+ */
+function createFakeApi(count, { totalPagesHeader = true } = {}) {
+  const players = Array.from({ length: count }, (_, i) => ({
+    id: 900000 + i,
+    title: { rendered: `שחקן ${i}` },
+    number: String(i % 100),
+    current_teams: [100 + (i % 12)],
+    modified: '2025-01-01T00:00:00'
+  }));
+  const api = { players, requests: [], inFlight: 0, maxInFlight: 0 };
+
+  api.fetch = async url => {
+    if (!url.startsWith('https://ibasketball.co.il/wp-json/sportspress/v2/players')) {
+      throw new Error('proxy down');
+    }
+    const params = new URL(url).searchParams;
+    api.requests.push(params);
+    api.inFlight++;
+    api.maxInFlight = Math.max(api.maxInFlight, api.inFlight);
+    await new Promise(resolve => setImmediate(resolve));
+    api.inFlight--;
+
+    let matching = players;
+    if (params.get('include')) {
+      const ids = new Set(params.get('include').split(','));
+      matching = matching.filter(player => ids.has(String(player.id)));
+    }
+    if (params.get('modified_after')) {
+      const since = params.get('modified_after');
+      matching = matching.filter(player => `${player.modified}Z` > since);
+    }
+    const perPage = Number(params.get('per_page'));
+    const page = Number(params.get('page'));
+    const totalPages = Math.max(1, Math.ceil(matching.length / perPage));
+    if (page > totalPages) {
+      return { ok: false, status: 400, headers: { get: () => null }, json: async () => ({}) };
+    }
+    return {
+      ok: true,
+      status: 200,
+      headers: {
+        get: name => (totalPagesHeader && name === 'X-WP-TotalPages' ? String(totalPages) : null)
+      },
+      json: async () => JSON.parse(JSON.stringify(matching.slice((page - 1) * perPage, page * perPage)))
+    };
+  };
+  return api;
+}
+
+async function testStatsEnrichmentFailure() {
   const errors = [];
   const warnings = [];
-  const IBBAPlayerNames = loadPlayerNames({
+  const { IBBAPlayerNames } = loadPlayerNames({
     log() {},
     warn: (...args) => warnings.push(args.join(' ')),
     error: (...args) => errors.push(args.join(' '))
@@ -47,6 +104,96 @@ async function run() {
   assert.strictEqual(count, 0);
   assert.strictEqual(errors.length, 0, 'optional enrichment failure should not log console.error');
   assert(warnings.some(line => line.includes('Failed to load player stats from HTML')));
+}
+
+async function testParallelPaging() {
+  for (const totalPagesHeader of [true, false]) {
+    const api = createFakeApi(950, { totalPagesHeader });
+    const { IBBAPlayerNames } = loadPlayerNames(silentConsole, api.fetch);
+    const loader = new IBBAPlayerNames(null, { pageConcurrency: 4 });
+    const progress = [];
+
+    await loader.loadAllPlayerNames(update => progress.push(update));
+
+    assert.strictEqual(loader.namesMap.size, 950);
+    assert.strictEqual(loader.getPlayerName(900949), 'שחקן 949');
+    assert.ok(api.maxInFlight > 1, 'pages are fetched concurrently');
+    if (totalPagesHeader) {
+      // page count known from the header - no requests past the last page
+      assert.strictEqual(api.requests.length, 10);
+    } else {
+      assert.ok(api.requests.length <= 10 + 4, 'speculative requests bounded by concurrency');
+    }
+    assert.strictEqual(progress[progress.length - 1].stage, 'complete');
+    assert.ok(loader.lastSync, 'full load sets a sync point');
+  }
+}
+
+async function testCompactCacheAndDeltaSync() {
+  const api = createFakeApi(250);
+  const context = loadPlayerNames(silentConsole, api.fetch);
+  const { IBBAPlayerNames, storage } = context;
+
+  const loader = new IBBAPlayerNames(null);
+  await loader.loadAllPlayerNames();
+
+  const saved = JSON.parse(storage.get(loader.cacheKey));
+  assert.strictEqual(saved.v, 8);
+  assert.ok(Array.isArray(saved.players[0]), 'players stored as compact rows');
+  assert.deepStrictEqual(saved.players[0], [900000, 'שחקן 0', '0', 100]);
+
+  // Warm start within cacheExpiry: served from cache, no API calls
+  api.requests.length = 0;
+  const warm = new IBBAPlayerNames(null);
+  await warm.refreshPromise;
+  assert.strictEqual(warm.namesMap.size, 250);
+  assert.strictEqual(api.requests.length, 0);
+
+  // Stale cache: only players modified since the last sync are fetched
+  saved.syncedAt = Date.now() - 60 * 60 * 1000;
+  storage.set(loader.cacheKey, JSON.stringify(saved));
+  api.players[3].title.rendered = 'שם מתוקן';
+  api.players[3].modified = new Date().toISOString().slice(0, 19);
+
+  const stale = new IBBAPlayerNames(null);
+  assert.strictEqual(stale.getPlayerName(900003), 'שחקן 3', 'cached data is available immediately');
+  await stale.refreshPromise;
+  assert.strictEqual(stale.getPlayerName(900003), 'שם מתוקן');
+  assert.strictEqual(api.requests.length, 1);
+  assert.ok(api.requests[0].get('modified_after'));
+  assert.ok(JSON.parse(storage.get(loader.cacheKey)).syncedAt > saved.syncedAt, 'sync point advanced');
+
+  // Other format versions are ignored
+  storage.set(loader.cacheKey, JSON.stringify({ ...saved, v: 7 }));
+  const other = new IBBAPlayerNames(null);
+  assert.strictEqual(other.hasCachedNames(), false);
+  assert.strictEqual(storage.has(loader.cacheKey), false);
+
+  // Expired past the TTL
+  storage.set(loader.cacheKey, JSON.stringify({ ...saved, syncedAt: Date.now() - 8 * 24 * 60 * 60 * 1000 }));
+  assert.strictEqual(new IBBAPlayerNames(null).hasCachedNames(), false);
+}
+
+async function testMissingPlayersById() {
+  const api = createFakeApi(3000);
+  const { IBBAPlayerNames } = loadPlayerNames(silentConsole, api.fetch);
+  const loader = new IBBAPlayerNames(null);
+
+  const ids = ['900005', '902999', 901500, '123'];
+  const found = await loader.loadMissingPlayers(ids);
+
+  assert.strictEqual(found, 3);
+  assert.strictEqual(loader.getPlayerName('902999'), 'שחקן 2999');
+  assert.strictEqual(api.requests.length, 1, 'one include= request instead of a page scan');
+  assert.strictEqual(api.requests[0].get('leagues'), null);
+  assert.deepStrictEqual(api.requests[0].get('include').split(','), ['900005', '902999', '901500', '123']);
+}
+
+async function run() {
+  await testStatsEnrichmentFailure();
+  await testParallelPaging();
+  await testCompactCacheAndDeltaSync();
+  await testMissingPlayersById();
 
   console.log('player-names tests passed');
 }
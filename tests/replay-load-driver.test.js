@@ -0,0 +1,79 @@
+const assert = require('assert');
+const http = require('http');
+const { runLoad, createReplayFetch } = require('../tools/ibba_replay/load_driver');
+const { generateSeason } = require('./helpers/synthetic-season');
+
+// a minimal stand-in for the Python replay server: month lists by ?month=, 503 for one month
+function startUpstream(events, failMonth) {
+  const requests = [];
+  const server = http.createServer((req, res) => {
+    const url = new URL(req.url, 'http://localhost');
+    requests.push(url.pathname + url.search);
+    const month = url.searchParams.get('month');
+    if (month === failMonth) {
+      res.writeHead(503, { 'Content-Type': 'application/json' });
+      return res.end('{"error":"injected"}');
+    }
+    const body = month ? events.filter(event => event.date.startsWith(month)) : events.slice(0, 10);
+    res.writeHead(200, { 'Content-Type': 'application/json; charset=UTF-8' });
+    res.end(JSON.stringify(body));
+  });
+  return new Promise(resolve => server.listen(0, '127.0.0.1', () => {
+    resolve({ server, requests, origin: `http://127.0.0.1:${server.address().port}` });
+  }));
+}
+
+async function run() {
+  const events = generateSeason({ seed: 5, teams: 4, rounds: 2 });
+  const months = [...new Set(events.map(event => event.date.slice(0, 7)))].sort();
+  const season = { leagueId: 1, seasonId: 2, seasonMonths: months };
+  const upstream = await startUpstream(events);
+
+  try {
+    // routing: ibasketball.co.il -> origin, Vercel proxy -> handler, anything else refused
+    const seen = [];
+    const replayFetch = createReplayFetch('http://replay', { handler: async (req, res) => { seen.push(req.query.url); res.json({}); } },
+      async url => { seen.push(url); return new Response('[]'); });
+    await replayFetch('https://ibasketball.co.il/wp-json/wp/v2/events/1?x=1');
+    await replayFetch('/api/proxy?url=' + encodeURIComponent('https://ibasketball.co.il/a'));
+    await assert.rejects(replayFetch('https://corsproxy.io/?https://ibasketball.co.il/a'), /not available in a replay run/);
+    assert.deepStrictEqual(seen, ['http://replay/wp-json/wp/v2/events/1?x=1', 'https://ibasketball.co.il/a']);
+
+    // adapter: every month from the origin, one sample per operation
+    const adapter = await runLoad({ origin: upstream.origin, target: 'adapter', concurrency: 2, requests: 4, season });
+    assert.strictEqual(adapter.samples.length, 4);
+    assert.ok(adapter.samples.every(sample => sample.ok && sample.games === events.length));
+    assert.strictEqual(upstream.requests.length, 4 * months.length);
+
+    // proxy: round robin over the URLs, served from the proxy cache after the first round
+    const urls = months.map(month => `https://ibasketball.co.il/wp-json/sportspress/v2/events?month=${month}`);
+    upstream.requests.length = 0;
+    const proxy = await runLoad({ origin: upstream.origin, target: 'proxy', concurrency: 1, requests: urls.length * 3, urls });
+    assert.ok(proxy.samples.every(sample => sample.ok));
+    assert.strictEqual(upstream.requests.length, urls.length);
+    assert.strictEqual(proxy.stats.proxy.hits, urls.length * 2);
+
+    // loader: loadNewGames against an empty DB
+    const loader = await runLoad({ origin: upstream.origin, target: 'loader', concurrency: 1, requests: 2, season, limit: 10 });
+    assert.ok(loader.samples.every(sample => sample.ok), JSON.stringify(loader.samples));
+  } finally {
+    upstream.server.close();
+  }
+
+  // a failed month fails the adapter operation
+  const failing = await startUpstream(events, months[0]);
+  try {
+    const result = await runLoad({ origin: failing.origin, target: 'adapter', concurrency: 1, requests: 1, season });
+    assert.strictEqual(result.samples[0].ok, false);
+    assert.match(result.samples[0].error, /month\(s\) failed/);
+  } finally {
+    failing.server.close();
+  }
+
+  console.log('replay-load-driver tests passed');
+}
+
+run().catch(error => {
+  console.error(error);
+  process.exit(1);
+});
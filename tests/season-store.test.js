@@ -0,0 +1,133 @@
+// Cross-check of tools/season_store (Python + NumPy) against IBBAAnalytics on a fixture season
+const assert = require('assert');
+const fs = require('fs');
+const os = require('os');
+const path = require('path');
+const vm = require('vm');
+const { spawnSync } = require('child_process');
+const { generateSeason } = require('./helpers/synthetic-season');
+
+const ROOT = path.join(__dirname, '..');
+const PYTHON = process.env.PYTHON || 'python3';
+
+function loadBrowserClasses() {
+  const context = {
+    console: { log() {}, warn() {}, error() {}, time() {}, timeEnd() {} },
+    document: {
+      // decodeHtmlEntities - the fixture titles only use literal characters
+      createElement: () => ({ set innerHTML(value) { this.value = value; } })
+    }
+  };
+  context.window = context;
+  vm.createContext(context);
+  ['ibba_adapter.js', 'ibba_analytics.js'].forEach(name => {
+    const file = path.join(ROOT, 'js', 'ibba', name);
+    vm.runInContext(fs.readFileSync(file, 'utf8'), context, { filename: file });
+  });
+  return context.window;
+}
+
+function python(args) {
+  const result = spawnSync(PYTHON, ['-m', 'tools.season_store', ...args], { cwd: ROOT, encoding: 'utf8' });
+  assert.strictEqual(result.status, 0, result.stderr || result.stdout);
+  return result.stdout;
+}
+
+// toFixed(1) strings vs Python floats
+function assertClose(actual, expected, label) {
+  assert.ok(Math.abs(actual - parseFloat(expected)) < 1e-9, `${label}: ${actual} vs ${expected}`);
+}
+
+function run() {
+  const probe = spawnSync(PYTHON, ['-c', 'import numpy'], { encoding: 'utf8' });
+  if (probe.status !== 0) {
+    console.log('season-store tests skipped (python3 with numpy not available)');
+    return;
+  }
+
+  const { IBBAAdapter, IBBAAnalytics } = loadBrowserClasses();
+  const tmp = fs.mkdtempSync(path.join(os.tmpdir(), 'season-store-'));
+
+  try {
+    const seasonA = generateSeason({ seed: 5, teams: 12 });
+    const seasonB = generateSeason({ seed: 9, teams: 10, rounds: 9 });
+    // Unplayed game (no box score) and a duplicate event are dropped on ingest
+    seasonA.push({ ...seasonA[0], id: 1, performance: '' });
+    seasonB.push(seasonB[seasonB.length - 1]);
+
+    fs.writeFileSync(path.join(tmp, 'a.json'), JSON.stringify(seasonA));
+    fs.writeFileSync(path.join(tmp, 'b.json'), JSON.stringify({ games: seasonB }));
+    const store = path.join(tmp, 'store');
+
+    const ingestOutput = python(['ingest', store, path.join(tmp, 'a.json') + ':2021-22', path.join(tmp, 'b.json')]);
+    assert.ok(ingestOutput.includes('Skipped (not played / no box score): 1'));
+    const meta = JSON.parse(fs.readFileSync(path.join(store, 'meta.json'), 'utf8'));
+    assert.deepStrictEqual(meta.seasons, ['2021-22', 'b']);
+    assert.strictEqual(meta.counts.games, seasonA.length - 1 + seasonB.length - 1);
+    assert.ok(fs.existsSync(path.join(store, 'lines', 'pts.npy')));
+
+    const adapter = new IBBAAdapter();
+    [['2021-22', seasonA], ['b', seasonB]].forEach(([label, events]) => {
+      const report = JSON.parse(python(['report', store, '--season', label, '--json', '-']));
+      const games = events.map(event => adapter.convertToInternalFormat(event)).filter(game => game.players.length > 0);
+      const analytics = new IBBAAnalytics(Array.from(new Map(games.map(game => [game.gameId, game])).values()));
+
+      // Teams: averages + home/away splits
+      const teamAverages = analytics.getTeamAverages();
+      const homeAway = analytics.getTeamHomeAwayRecords();
+      assert.strictEqual(report.teams.length, teamAverages.length);
+      teamAverages.forEach(expected => {
+        const actual = report.teams.find(team => team.teamName === expected.teamName);
+        assert.ok(actual, expected.teamName);
+        ['gamesPlayed', 'wins', 'losses'].forEach(field => assert.strictEqual(actual[field], expected[field], field));
+        ['winPct', 'ppg', 'oppPpg', 'pointDiff', 'rpg', 'apg', 'spg', 'bpg', 'tpg', 'fpg', 'fgPct', 'threePtPct', 'ftPct',
+          'efficiencyAvg', 'fastBreakPpg', 'pointsFromToPpg', 'paintPpg', 'secondChancePpg', 'benchPpg']
+          .forEach(field => assertClose(actual[field], expected[field], `${label} ${expected.teamName} ${field}`));
+        ['home', 'away'].forEach(location => {
+          const record = homeAway[expected.teamName][location];
+          ['games', 'wins', 'losses'].forEach(field => assert.strictEqual(actual[location][field], record[field]));
+          ['ppg', 'oppPpg', 'winPct', 'winPpg']
+            .forEach(field => assertClose(actual[location][field], record[field], `${label} ${location} ${field}`));
+        });
+      });
+
+      // Players: averages over games with minutes > 0
+      const playerAverages = analytics.getPlayerAverages();
+      assert.strictEqual(report.players.length, playerAverages.length);
+      const byId = new Map(report.players.map(player => [player.playerId, player]));
+      playerAverages.forEach(expected => {
+        const actual = byId.get(String(expected.playerId));
+        assert.ok(actual, expected.playerId);
+        assert.strictEqual(actual.gamesPlayed, expected.gamesPlayed);
+        assert.strictEqual(actual.jersey, expected.jersey);
+        assert.strictEqual(actual.teamName, expected.teamName);
+        assert.strictEqual(actual.totalPoints, expected._totalPoints);
+        ['ppg', 'rpg', 'apg', 'spg', 'bpg', 'tpg', 'fpg', 'foulsDrawnPg', 'mpg', 'efficiencyAvg', 'plusMinusPg',
+          'fgPct', 'threePtPct', 'ftPct']
+          .forEach(field => assertClose(actual[field], expected[field], `${label} ${expected.playerId} ${field}`));
+      });
+
+      // Rankings: same metric values in the same order as getTopPlayers / getTopTeams
+      assert.deepStrictEqual(
+        report.rankings.players.map(player => player.ppg),
+        Array.from(analytics.getTopPlayers('ppg', 10), player => parseFloat(player.ppg))
+      );
+      assert.deepStrictEqual(
+        report.rankings.teams.map(team => team.ppg),
+        Array.from(analytics.getTopTeams('ppg', 10), team => parseFloat(team.ppg))
+      );
+    });
+
+    // All seasons in one pass: groups stay per season
+    const all = JSON.parse(python(['report', store, '--json', '-', '--player-metric', 'apg', '--top', '3']));
+    assert.strictEqual(all.teams.length, 22);
+    assert.deepStrictEqual(all.rankings.players.map(player => `${player.season}:${player.rank}`),
+      ['2021-22:1', '2021-22:2', '2021-22:3', 'b:1', 'b:2', 'b:3']);
+  } finally {
+    fs.rmSync(tmp, { recursive: true, force: true });
+  }
+
+  console.log('season-store tests passed');
+}
+
+run();
@@ -0,0 +1,157 @@
+const assert = require('assert');
+const fs = require('fs');
+const path = require('path');
+const vm = require('vm');
+const { createRandom } = require('./helpers/synthetic-season');
+
+function loadTableViewModel() {
+  const listeners = [];
+  const context = {
+    console: { log() {}, warn() {}, error() {} },
+    Intl,
+    innerHeight: 740,
+    addEventListener: (type, fn) => listeners.push({ type, fn }),
+    removeEventListener: (type, fn) => {
+      const index = listeners.findIndex(listener => listener.fn === fn && listener.type === type);
+      if (index >= 0) listeners.splice(index, 1);
+    },
+    requestAnimationFrame: fn => { fn(); return 1; },
+    document: { body: {} }
+  };
+  context.window = context;
+  context.listeners = listeners;
+  vm.createContext(context);
+  const file = path.join(__dirname, '..', 'js', 'table_view_model.js');
+  vm.runInContext(fs.readFileSync(file, 'utf8'), context, { filename: file });
+  return context;
+}
+
+function createFakeTbody() {
+  return {
+    top: 0,
+    innerHTML: '',
+    parentElement: null,
+    getBoundingClientRect() {
+      return { top: this.top };
+    },
+    querySelector() {
+      return { getBoundingClientRect: () => ({ height: 37 }) };
+    }
+  };
+}
+
+async function run() {
+  const context = loadTableViewModel();
+  const { TableViewModel, VirtualTableBody } = context;
+  const random = createRandom(21);
+  const names = ['כהן', 'לוי', 'אבוטבול', 'מזרחי', 'Smith', 'בן דוד', 'פרץ', 'אזולאי'];
+
+  const players = Array.from({ length: 3000 }, (_, i) => ({
+    id: `p${i}`,
+    name: `${names[Math.floor(random() * names.length)]} ${Math.floor(random() * 50)}`,
+    team: `team-${Math.floor(random() * 20)}`,
+    games: Array.from({ length: 1 + Math.floor(random() * 10) }, () => ({ points: Math.floor(random() * 30) }))
+  }));
+
+  let loads = 0;
+  let averageCalls = 0;
+  const view = new TableViewModel({
+    load: async () => {
+      loads++;
+      return { players };
+    },
+    prepare: ({ players: all }) => all.map(p => ({ ...p, _hay: p.name.toLowerCase() })),
+    sortKeys: {
+      avgPoints: p => {
+        averageCalls++;
+        return p.games.reduce((sum, g) => sum + g.points, 0) / p.games.length;
+      }
+    }
+  });
+
+  // Concurrent loads share one fetch
+  await Promise.all([view.load(), view.load()]);
+  assert.strictEqual(loads, 1);
+  assert.strictEqual(view.rows.length, 3000);
+
+  // Sorting matches the original comparator (stable, localeCompare 'he', numeric subtraction)
+  const average = p => p.games.reduce((sum, g) => sum + g.points, 0) / p.games.length;
+  for (const [field, direction] of [['name', 'asc'], ['name', 'desc'], ['avgPoints', 'desc'], ['avgPoints', 'asc']]) {
+    const keyOf = field === 'name' ? p => p.name : average;
+    const expected = players.slice().sort((a, b) => {
+      const [x, y] = direction === 'asc' ? [keyOf(a), keyOf(b)] : [keyOf(b), keyOf(a)];
+      return typeof x === 'string' ? x.localeCompare(y, 'he') : x - y;
+    }).map(p => p.id);
+    const actual = view.query({ sortField: field, sortDirection: direction }).map(p => p.id);
+    assert.deepStrictEqual(Array.from(actual), expected, `${field} ${direction}`);
+  }
+
+  // Sort keys are derived once per row, not per comparison; no refetch for sort/filter
+  assert.strictEqual(averageCalls, 3000);
+  const filtered = view.query({ filter: p => p.team === 'team-3', sortField: 'avgPoints', sortDirection: 'desc' });
+  assert.ok(filtered.length > 0 && filtered.every(p => p.team === 'team-3'));
+  assert.strictEqual(averageCalls, 3000);
+  assert.strictEqual(loads, 1);
+
+  // derive runs after the filter (e.g. duplicate merging)
+  const derived = view.query({ filter: p => p.team === 'team-3', derive: rows => rows.slice(0, 5) });
+  assert.strictEqual(derived.length, 5);
+
+  // invalidate -> next ensureLoaded refetches
+  view.invalidate();
+  assert.strictEqual(view.isLoaded(), false);
+  await view.ensureLoaded();
+  await view.ensureLoaded();
+  assert.strictEqual(loads, 2);
+
+  // Visible window math
+  assert.deepStrictEqual(
+    { ...VirtualTableBody.computeRange({ count: 3000, rowHeight: 40, overscan: 10, offsetTop: 0, viewportHeight: 800 }) },
+    { start: 0, end: 30 }
+  );
+  assert.deepStrictEqual(
+    { ...VirtualTableBody.computeRange({ count: 3000, rowHeight: 40, overscan: 10, offsetTop: -4000, viewportHeight: 800 }) },
+    { start: 90, end: 130 }
+  );
+  assert.deepStrictEqual(
+    { ...VirtualTableBody.computeRange({ count: 3000, rowHeight: 40, overscan: 10, offsetTop: -200000, viewportHeight: 800 }) },
+    { start: 2989, end: 3000 }
+  );
+
+  // Virtual body renders only the window (+ spacers), re-renders on scroll
+  const tbody = createFakeTbody();
+  let rendered = 0;
+  const body = new VirtualTableBody(tbody, {
+    columns: 4,
+    rowHeight: 37,
+    overscan: 5,
+    renderRow: row => { rendered++; return `<tr><td>${row.id}</td></tr>`; }
+  });
+  const sorted = view.query({ sortField: 'name', sortDirection: 'asc' });
+  body.setRows(sorted);
+  assert.ok(rendered < 40, `rendered ${rendered} rows`);
+  assert.ok(tbody.innerHTML.includes(`<td>${sorted[0].id}</td>`));
+  assert.ok(tbody.innerHTML.includes('data-spacer="bottom"'));
+  assert.ok(!tbody.innerHTML.includes('data-spacer="top"'));
+
+  tbody.top = -37 * 1000;
+  context.listeners.find(listener => listener.type === 'scroll').fn();
+  assert.ok(tbody.innerHTML.includes(`<td>${sorted[1000].id}</td>`));
+  assert.ok(!tbody.innerHTML.includes(`<td>${sorted[0].id}</td>`));
+  assert.ok(tbody.innerHTML.includes('data-spacer="top"'));
+
+  // Small tables are rendered in full
+  body.setRows(sorted.slice(0, 50));
+  assert.strictEqual((tbody.innerHTML.match(/<tr>/g) || []).length, 50);
+  assert.ok(!tbody.innerHTML.includes('virtual-spacer'));
+
+  body.destroy();
+  assert.strictEqual(context.listeners.length, 0);
+
+  console.log('table-view-model tests passed');
+}
+
+run().catch(error => {
+  console.error(error);
+  process.exit(1);
+});
@@ -0,0 +1,218 @@
+const assert = require('assert');
+const fs = require('fs');
+const path = require('path');
+const vm = require('vm');
+const { createRandom } = require('./helpers/synthetic-season');
+const { createFakeDb } = require('./helpers/fake-indexeddb');
+
+function loadModules(extraContext = {}) {
+  const context = {
+    console: { log() {}, warn() {}, error() {} },
+    ...extraContext
+  };
+  context.window = context;
+  vm.createContext(context);
+  ['team_aggregates.js', 'db_adapter.js'].forEach(name => {
+    const file = path.join(__dirname, '..', 'js', name);
+    vm.runInContext(fs.readFileSync(file, 'utf8'), context, { filename: file });
+  });
+  return context;
+}
+
+const plain = value => JSON.parse(JSON.stringify(value));
+
+// League in the app's storage format: games rows + players with games[] (one entry per game played)
+function buildLeague(seed, teamCount = 6, gameCount = 40) {
+  const random = createRandom(seed);
+  const teams = Array.from({ length: teamCount }, (_, i) => `קבוצה ${i + 1}`);
+  const players = teams.flatMap(team => Array.from({ length: 8 }, (_, p) => ({ id: `${team}-${p}`, team, games: [] })));
+  const games = [];
+
+  for (let serial = 1; serial <= gameCount; serial++) {
+    const home = teams[Math.floor(random() * teamCount)];
+    let away = teams[Math.floor(random() * teamCount)];
+    if (away === home) away = teams[(teams.indexOf(home) + 1) % teamCount];
+    games.push({ gameSerial: serial, teams: [home, away] });
+    players.filter(player => player.team === home || player.team === away).forEach(player => {
+      if (random() < 0.2) return; // did not play
+      const fga = Math.round(random() * 15);
+      player.games.push({
+        gameId: serial, team: player.team,
+        points: Math.round(random() * 20), rebounds: Math.round(random() * 8), assists: Math.round(random() * 6),
+        steals: Math.round(random() * 3), blocks: Math.round(random() * 2), turnovers: Math.round(random() * 4),
+        fouls: Math.round(random() * 5), fieldGoalsMade: Math.round(fga * 0.45), fieldGoalsAttempted: fga,
+        threePointsMade: 1, threePointsAttempted: 3, freeThrowsMade: 2, freeThrowsAttempted: 3,
+        efficiency: Math.round(random() * 250) / 10
+      });
+    });
+  }
+  return { teams, players, games };
+}
+
+async function run() {
+  const { TeamAggregates } = loadModules();
+  const { buildGameTotals, collectGameLines, fromPlayers, diff, toTeamsAggregateRow, toHomeAwayStats, TeamAggregateStore } = TeamAggregates;
+
+  // buildGameTotals: team sums + home/away + opponent points
+  {
+    const rows = buildGameTotals(7, ['A', 'B'], [
+      { gameId: 7, team: 'A', points: 50, rebounds: 10 },
+      { gameId: 7, team: 'A', points: 30, rebounds: 5 },
+      { gameId: 7, team: 'B', points: 70, rebounds: 20 }
+    ]);
+    const byTeam = Object.fromEntries(rows.map(row => [row.team, row]));
+    assert.strictEqual(byTeam.A.points, 80);
+    assert.strictEqual(byTeam.A.rebounds, 15);
+    assert.strictEqual(byTeam.A.isHome, true);
+    assert.strictEqual(byTeam.A.opponentPoints, 70);
+    assert.strictEqual(byTeam.B.isHome, false);
+    assert.strictEqual(byTeam.B.opponentPoints, 80);
+
+    const [summary] = TeamAggregates.summarize(rows).filter(row => row.team === 'A');
+    assert.strictEqual(summary.homeWins, 1);
+    assert.strictEqual(summary.homeWinMarginSum, 10);
+    assert.deepStrictEqual(plain(toHomeAwayStats(summary, true)), {
+      homeWins: 1, homeLosses: 0, awayWins: 0, awayLosses: 0, avgWinMargin: 10, avgLossMargin: 0
+    });
+  }
+
+  // fromPlayers matches the getTeamsAggregate / calculateHomeAwayStats rules
+  const league = buildLeague(9);
+  const full = fromPlayers(league.players, league.games);
+  {
+    const team = league.teams[0];
+    const lines = league.players.flatMap(player => player.games).filter(line => line.team === team);
+    const row = toTeamsAggregateRow(full.aggregates.find(aggregate => aggregate.team === team));
+    assert.strictEqual(row.games, new Set(lines.map(line => line.gameId)).size);
+    assert.strictEqual(row.totalPoints, lines.reduce((sum, line) => sum + line.points, 0));
+    assert.ok(Math.abs(row.avgEfficiency - lines.reduce((sum, line) => sum + line.efficiency, 0) / row.games) < 1e-9);
+
+    let homeWins = 0;
+    let homeLosses = 0;
+    league.games.filter(game => game.teams[0] === team).forEach(game => {
+      const score = name => lines.concat(league.players.flatMap(player => player.games).filter(line => line.team !== team))
+        .filter(line => line.gameId === game.gameSerial && line.team === name)
+        .reduce((sum, line) => sum + line.points, 0);
+      const margin = score(team) - score(game.teams[1]);
+      if (margin > 0) homeWins++;
+      if (margin < 0) homeLosses++;
+    });
+    const stats = toHomeAwayStats(full.aggregates.find(aggregate => aggregate.team === team), true);
+    assert.strictEqual(stats.homeWins, homeWins);
+    assert.strictEqual(stats.homeLosses, homeLosses);
+  }
+
+  // Incremental store: save every game, re-save some with new stats, delete some → same as a full recompute
+  {
+    const store = new TeamAggregateStore({ storage: true });
+    for (const game of league.games) {
+      await store.applyGame(game.gameSerial, buildGameTotals(game.gameSerial, game.teams, collectGameLines(league.players, game.gameSerial)));
+    }
+    assert.deepStrictEqual(plain(diff(await store.getAll(), full.aggregates)), []);
+
+    const edited = plain(league);
+    edited.players.forEach(player => player.games.forEach(line => {
+      if (line.gameId % 5 === 0) line.points += 7;
+    }));
+    for (const game of edited.games.filter(game => game.gameSerial % 5 === 0)) {
+      await store.applyGame(game.gameSerial, buildGameTotals(game.gameSerial, game.teams, collectGameLines(edited.players, game.gameSerial)));
+    }
+    const deleted = new Set([2, 3, 11]);
+    for (const gameSerial of deleted) await store.removeGame(gameSerial);
+    edited.players.forEach(player => { player.games = player.games.filter(line => !deleted.has(line.gameId)); });
+    edited.games = edited.games.filter(game => !deleted.has(game.gameSerial));
+
+    const expected = fromPlayers(edited.players, edited.games).aggregates;
+    assert.deepStrictEqual(plain(diff(await store.getAll(), expected)), []);
+    assert.strictEqual((await store.get(league.teams[1])).team, league.teams[1]);
+
+    // diff reports drift
+    const tampered = plain(expected);
+    tampered[0].points += 1;
+    assert.deepStrictEqual(plain(diff(tampered, expected)), [
+      { team: tampered[0].team, field: 'points', stored: expected[0].points + 1, expected: expected[0].points }
+    ]);
+  }
+
+  // dbAdapter (Supabase mode): one read of team_aggregates, mirrored locally until the next save
+  {
+    const reads = [];
+    const rpcs = [];
+    const tables = { teams: [], team_aggregates: full.aggregates, players: league.players, games: league.games };
+    const query = table => {
+      const result = () => Promise.resolve({ data: plain(tables[table]), error: null });
+      const builder = {
+        select: () => { reads.push(table); return builder; },
+        order: () => builder,
+        then: (resolve, reject) => result().then(resolve, reject)
+      };
+      return builder;
+    };
+    const context = loadModules({
+      supabaseConfig: { url: 'https://example.supabase.co', key: 'anon' },
+      supabase: { createClient: () => ({ from: query, rpc: name => { rpcs.push(name); return Promise.resolve({ error: null }); } }) }
+    });
+    await context.dbAdapter.init();
+
+    const first = await context.dbAdapter.getTeamAggregates();
+    await context.dbAdapter.getTeamAggregates();
+    const one = await context.dbAdapter.getTeamAggregate(league.teams[2]);
+    assert.strictEqual(reads.filter(table => table === 'team_aggregates').length, 1);
+    assert.strictEqual(first.length, league.teams.length);
+    assert.strictEqual(one.team, league.teams[2]);
+
+    const check = await context.dbAdapter.checkTeamAggregates({ repair: true });
+    assert.strictEqual(check.consistent, true);
+    assert.deepStrictEqual(plain(rpcs), []);
+
+    tables.team_aggregates = plain(full.aggregates).map(row => ({ ...row, games: row.games + 1 }));
+    const drift = await context.dbAdapter.checkTeamAggregates({ repair: true });
+    assert.strictEqual(drift.consistent, false);
+    assert.strictEqual(drift.mismatches.length, league.teams.length);
+    assert.deepStrictEqual(plain(rpcs), ['rebuild_team_aggregates']);
+  }
+
+  // dbAdapter (IndexedDB mode): a write that bypasses saveGame / deleteGame (backup restore) drops the mirror
+  {
+    const db = createFakeDb({ games: 'gameSerial', players: 'id', teams: 'team_id' });
+    const fill = data => {
+      db.stores.get('games').rows = new Map(plain(data.games).map(game => [game.gameSerial, game]));
+      db.stores.get('players').rows = new Map(plain(data.players).map(player => [player.id, player]));
+    };
+    fill(league);
+    const context = loadModules({
+      indexedDB: {
+        open: () => {
+          const request = {};
+          setImmediate(() => request.onsuccess({ target: { result: db } }));
+          return request;
+        }
+      }
+    });
+    // in-memory mirror (the fake IndexedDB has no indexes)
+    const { TeamAggregateStore: Store } = context.TeamAggregates;
+    context.TeamAggregates.TeamAggregateStore = class extends Store {
+      constructor() { super({ storage: true }); }
+    };
+    await context.dbAdapter.init();
+
+    assert.deepStrictEqual(plain(diff(await context.dbAdapter.getTeamAggregates(), full.aggregates)), []);
+
+    // Restore a different database, as reloadAfterRestore reports it
+    const restored = buildLeague(99, 4, 12);
+    fill(restored);
+    context.dbAdapter.notifyWrite('teams');
+    assert.deepStrictEqual(plain(diff(await context.dbAdapter.getTeamAggregates(), full.aggregates)), []);
+    context.dbAdapter.notifyWrite('players');
+    const rebuilt = await context.dbAdapter.getTeamAggregates();
+    assert.strictEqual(rebuilt.length, restored.teams.length);
+    assert.deepStrictEqual(plain(diff(rebuilt, fromPlayers(restored.players, restored.games).aggregates)), []);
+  }
+
+  console.log('team-aggregates tests passed');
+}
+
+run().catch(error => {
+  console.error(error);
+  process.exit(1);
+});
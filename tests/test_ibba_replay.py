@@ -0,0 +1,121 @@
+"""
+tools/ibba_replay: request keys, archive round-trip and the replay server.
+
+    python -m pytest tests/test_ibba_replay.py
+    python tests/test_ibba_replay.py
+"""
+
+import json
+import sys
+import tempfile
+import unittest
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from tools.ibba_replay.archive import Archive, compute_etag, loose_key, request_key  # noqa: E402
+from tools.ibba_replay.server import ReplayServer  # noqa: E402
+
+
+EVENTS_URL = "https://ibasketball.co.il/wp-json/sportspress/v2/events?leagues=3&seasons=119474&per_page=50"
+
+
+class RequestKeyTest(unittest.TestCase):
+    def test_host_dropped_and_params_sorted(self):
+        self.assertEqual(request_key("https://ibasketball.co.il/wp-json/x?b=2&a=1"), "/wp-json/x?a=1&b=2")
+        self.assertEqual(request_key("http://127.0.0.1:8765/wp-json/x?a=1&b=2"), "/wp-json/x?a=1&b=2")
+        self.assertEqual(request_key("https://ibasketball.co.il"), "/")
+
+    def test_cache_busters_ignored(self):
+        self.assertEqual(request_key("https://ibasketball.co.il/league/?_=123&cb=4&nocache=1"), "/league/")
+        self.assertEqual(request_key("/a?x=1&_=99"), "/a?x=1")
+
+    def test_loose_key_drops_date_window(self):
+        key = request_key(EVENTS_URL + "&before=2025-11-01T00:00:00&after=2025-10-01T00:00:00")
+        self.assertIn("before=", key)
+        self.assertEqual(loose_key(key), request_key(EVENTS_URL))
+        self.assertEqual(loose_key("/a?before=1"), "/a")
+
+
+class ArchiveTest(unittest.TestCase):
+    def test_add_save_reload(self):
+        with tempfile.TemporaryDirectory() as root:
+            archive = Archive(Path(root))
+            body = b'[{"id":1}]'
+            entry = archive.add(EVENTS_URL, 200, "application/json; charset=UTF-8", body, elapsed_ms=12.34)
+            archive.add("https://ibasketball.co.il/league/2025-2/", 200, "text/html", b"<html></html>")
+            archive.add_season({"leagueId": 3, "seasonId": 119474, "seasonMonths": ["2025-10"]})
+            archive.save()
+
+            self.assertEqual(entry["etag"], compute_etag(body))
+            self.assertTrue(entry["body"].endswith(".json"))
+
+            reloaded = Archive(Path(root))
+            self.assertEqual(len(reloaded), 2)
+            self.assertEqual(reloaded.seasons, [{"leagueId": 3, "seasonId": 119474, "seasonMonths": ["2025-10"]}])
+            found = reloaded.lookup(EVENTS_URL)
+            self.assertEqual(found, entry)
+            self.assertEqual(reloaded.read_body(found), body)
+            self.assertEqual(reloaded.urls("/league"), ["https://ibasketball.co.il/league/2025-2/"])
+            self.assertIsNone(reloaded.lookup("https://ibasketball.co.il/other"))
+
+    def test_unknown_version_rejected(self):
+        with tempfile.TemporaryDirectory() as root:
+            (Path(root) / "index.json").write_text(json.dumps({"version": 99, "entries": []}), encoding="utf-8")
+            with self.assertRaises(SystemExit):
+                Archive(Path(root))
+
+
+class ReplayServerTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.archive = Archive(Path(self.tmp.name))
+        self.body = b'[{"id":7}]'
+        self.entry = self.archive.add(EVENTS_URL, 200, "application/json", self.body)
+        self.server = ReplayServer(self.archive, port=0).start()
+
+    def tearDown(self):
+        self.server.stop()
+        self.tmp.cleanup()
+
+    def get(self, key, headers=None):
+        request = urllib.request.Request(self.server.origin + key, headers=headers or {})
+        try:
+            with urllib.request.urlopen(request, timeout=5) as response:
+                return response.status, response.headers, response.read()
+        except urllib.error.HTTPError as error:
+            with error:
+                return error.code, error.headers, error.read()
+
+    def test_hit(self):
+        status, headers, body = self.get(request_key(EVENTS_URL) + "&_=1")
+        self.assertEqual(status, 200)
+        self.assertEqual(headers["X-Replay"], "HIT")
+        self.assertEqual(headers["ETag"], self.entry["etag"])
+        self.assertEqual(body, self.body)
+
+    def test_loose_match(self):
+        status, headers, body = self.get(request_key(EVENTS_URL) + "&before=2025-11-01T00:00:00")
+        self.assertEqual(status, 200)
+        self.assertEqual(headers["X-Replay"], "LOOSE")
+        self.assertEqual(body, self.body)
+        self.assertEqual(self.server.snapshot()["looseMatches"], 1)
+
+    def test_not_modified(self):
+        status, headers, body = self.get(request_key(EVENTS_URL), {"If-None-Match": self.entry["etag"]})
+        self.assertEqual(status, 304)
+        self.assertEqual(body, b"")
+        self.assertEqual(self.server.snapshot()["notModified"], 1)
+
+    def test_miss(self):
+        status, headers, body = self.get("/wp-json/sportspress/v2/events/404")
+        self.assertEqual(status, 404)
+        self.assertEqual(headers["X-Replay"], "MISS")
+        self.assertEqual(json.loads(body), {"error": "not recorded", "key": "/wp-json/sportspress/v2/events/404"})
+        self.assertEqual(self.server.snapshot()["misses"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
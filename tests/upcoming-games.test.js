@@ -3,7 +3,7 @@ const fs = require('fs');
 const path = require('path');
 const vm = require('vm');
 
-function loadUpcomingModule() {
+function loadUpcomingModule(overrides = {}) {
   const file = path.join(__dirname, '..', 'js', 'app_upcoming_games_pure.js');
   const source = fs.readFileSync(file, 'utf8');
   const context = {
@@ -49,14 +49,20 @@ function loadUpcomingModule() {
       querySelectorAll() {
         return [];
       }
-    }
+    },
+    ...overrides
   };
 
-  vm.runInNewContext(`${source}\nwindow.__test = { findDefaultRound, groupGamesByRound, getFallbackGamesFromLoadedSeason };`, context);
+  vm.runInNewContext(`${source}\nwindow.__test = {
+    findDefaultRound, groupGamesByRound, getFallbackGamesFromLoadedSeason,
+    buildRoundIndex, refreshRoundStatus, findDefaultRoundInIndex, diffRoundIndex, loadRoundIndex, saveRoundIndex,
+    loadUpcomingGames, renderSelectedRound, state: () => ({ currentRound, pendingRevalidation, cachedGamesByRound })
+  };`, context);
   return context.window.__test;
 }
 
-const { findDefaultRound, groupGamesByRound, getFallbackGamesFromLoadedSeason } = loadUpcomingModule();
+const upcoming = loadUpcomingModule();
+const { findDefaultRound, groupGamesByRound, getFallbackGamesFromLoadedSeason } = upcoming;
 
 const fallbackGames = getFallbackGamesFromLoadedSeason();
 assert.strictEqual(fallbackGames.length, 2, 'uses already loaded games when upcoming API is empty');
@@ -67,4 +73,134 @@ assert.strictEqual(fallbackGames[1].away.team, 'Away B');
 const grouped = groupGamesByRound(fallbackGames);
 assert.strictEqual(findDefaultRound(grouped), '30', 'ended seasons default to most recent past round');
 
-console.log('upcoming-games tests passed');
+// ========================================
+// אינדקס מחזורים
+// ========================================
+
+const DAY = 24 * 60 * 60 * 1000;
+const NOW = Date.parse('2026-03-10T12:00:00');
+const apiGame = (id, round, daysFromNow, home, away) => ({
+  id, stage_id: round, date: new Date(NOW + daysFromNow * DAY).toISOString(), home: { team: home }, away: { team: away }
+});
+const API_GAMES = [
+  apiGame(11, 1, -14, 'A', 'B'), apiGame(12, 1, -14, 'C', 'D'),
+  apiGame(21, 2, -7, 'A', 'C'), apiGame(22, 2, 1, 'B', 'D'),
+  apiGame(31, 3, 7, 'A', 'D'), apiGame(32, 3, 6, 'B', 'C'),
+  apiGame(101, 10, 14, 'D', 'A')
+];
+
+const index = upcoming.buildRoundIndex(API_GAMES, NOW);
+assert.deepStrictEqual(Array.from(index.order), ['1', '2', '3', '10'], 'rounds sorted numerically');
+assert.strictEqual(index.rounds['3'].firstDate, API_GAMES[5].date, 'games inside a round sorted by date');
+assert.deepStrictEqual(Array.from(index.rounds['3'].games, game => game.home.team), ['B', 'A']);
+assert.deepStrictEqual(['1', '2', '3'].map(key => index.rounds[key].status), ['played', 'partial', 'upcoming']);
+assert.strictEqual(index.rounds['2'].played, 1);
+
+// same default round as the full scan
+const grouped2 = upcoming.groupGamesByRound(API_GAMES);
+assert.strictEqual(upcoming.findDefaultRoundInIndex(index, NOW), '2');
+assert.strictEqual(upcoming.findDefaultRoundInIndex(index, Date.now()), upcoming.findDefaultRound(grouped2), 'same rules as findDefaultRound');
+assert.strictEqual(upcoming.findDefaultRoundInIndex(index, NOW + 2 * DAY), '3');
+assert.strictEqual(upcoming.findDefaultRoundInIndex(index, NOW + 30 * DAY), '10', 'ended season → latest played round');
+assert.strictEqual(upcoming.findDefaultRoundInIndex(index, NOW - 30 * DAY), '1');
+
+// status refresh reports rounds whose played/upcoming split moved
+assert.deepStrictEqual(Array.from(upcoming.refreshRoundStatus(index, NOW + 2 * DAY)), ['2']);
+assert.strictEqual(index.rounds['2'].status, 'played');
+
+// diff: only changed / new / removed rounds
+const moved = API_GAMES.map(game => game.id === 31 ? { ...game, date: new Date(NOW + 8 * DAY).toISOString() } : game)
+  .filter(game => game.stage_id !== 10)
+  .concat(apiGame(41, 4, 21, 'C', 'A'));
+const diff = upcoming.diffRoundIndex(index, upcoming.buildRoundIndex(moved, NOW));
+assert.deepStrictEqual(Array.from(diff.changed), ['3', '4']);
+assert.deepStrictEqual(Array.from(diff.removed), ['10']);
+assert.deepStrictEqual(Array.from(upcoming.diffRoundIndex(null, index).changed), ['1', '2', '3', '10']);
+
+// ========================================
+// טעינה: מהאינדקס השמור מיד, רענון ברקע, הצגה מחדש רק של המחזור שהשתנה
+// ========================================
+
+function createPage(responses) {
+  const storage = new Map();
+  const elements = {
+    roundSelector: { innerHTML: '' },
+    upcomingGamesContainer: { innerHTML: '' }
+  };
+  const renders = { dropdown: 0, table: 0 };
+  ['roundSelector', 'upcomingGamesContainer'].forEach(id => {
+    let html = '';
+    Object.defineProperty(elements[id], 'innerHTML', {
+      get: () => html,
+      set: value => { html = value; renders[id === 'roundSelector' ? 'dropdown' : 'table']++; }
+    });
+  });
+  const fetches = [];
+  const page = loadUpcomingModule({
+    fetch: async url => {
+      fetches.push(url);
+      const games = responses.shift();
+      return { ok: true, json: async () => JSON.parse(JSON.stringify(games)) };
+    },
+    localStorage: {
+      getItem: key => (storage.has(key) ? storage.get(key) : null),
+      setItem: (key, value) => storage.set(key, String(value))
+    },
+    document: {
+      createElement: () => ({
+        innerHTML: '',
+        set textContent(value) { this.innerHTML = value; },
+        get value() { return this.innerHTML; }
+      }),
+      getElementById: id => elements[id] || null,
+      querySelectorAll: () => []
+    }
+  });
+  return { page, storage, elements, renders, fetches };
+}
+
+async function runLoadTests() {
+  const upcomingGames = API_GAMES.map(game => ({ ...game, date: new Date(Date.now() + (Date.parse(game.date) - NOW)).toISOString() }));
+
+  // first visit: API → render → saved index
+  const first = createPage([upcomingGames]);
+  await first.page.loadUpcomingGames();
+  assert.strictEqual(first.fetches.length, 1);
+  assert.strictEqual(first.page.state().currentRound, '2');
+  assert.strictEqual(first.storage.size, 1, 'index saved');
+  const [savedKey, savedIndex] = Array.from(first.storage.entries())[0];
+
+  // repeat visit: rendered from the saved index before the API answers
+  const changedGames = upcomingGames.map(game => game.id === 31 ? { ...game, away: { team: 'E' } } : game);
+  const repeat = createPage([changedGames]);
+  repeat.storage.set(savedKey, savedIndex);
+  await repeat.page.loadUpcomingGames();
+  assert.strictEqual(repeat.page.state().currentRound, '2', 'shown from cache');
+  assert.ok(repeat.elements.upcomingGamesContainer.innerHTML.includes('B'));
+  const tableRendersBefore = repeat.renders.table;
+
+  // background revalidation: round 3 changed, shown round 2 did not → dropdown only
+  const changed = await repeat.page.state().pendingRevalidation;
+  assert.deepStrictEqual(Array.from(changed), ['3']);
+  assert.strictEqual(repeat.renders.table, tableRendersBefore, 'shown round not re-rendered');
+  assert.strictEqual(repeat.page.state().cachedGamesByRound['3'].find(game => game.id === 31).away.team, 'E');
+  assert.ok(repeat.storage.get(savedKey).includes('"E"'), 'new index saved');
+
+  // the changed round is re-rendered when it is the one on screen
+  const again = changedGames.map(game => game.id === 32 ? { ...game, home: { team: 'F' } } : game);
+  const third = createPage([again]);
+  third.storage.set(savedKey, repeat.storage.get(savedKey));
+  await third.page.loadUpcomingGames();
+  third.page.renderSelectedRound('3');
+  const before = third.renders.table;
+  assert.deepStrictEqual(Array.from(await third.page.state().pendingRevalidation), ['3']);
+  assert.strictEqual(third.renders.table, before + 1, 'shown round re-rendered');
+  assert.ok(third.elements.upcomingGamesContainer.innerHTML.includes('F'));
+
+  console.log('upcoming-games tests passed');
+}
+
+runLoadTests().catch(error => {
+  console.error(error);
+  process.exit(1);
+});
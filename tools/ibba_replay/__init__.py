@@ -0,0 +1,36 @@
+"""
+Record/replay stand-in for ibasketball.co.il and a load generator for the app's fetch paths.
+
+Record once (live site, politely) or import an events file, then serve the archive locally
+with latency, errors, timeouts, rate limiting and bandwidth limits, and drive api/proxy.js,
+IBBAAdapter and IBBAGameLoader.loadNewGames against it (Node.js runs the app's own modules).
+
+    python -m tools.ibba_replay record fixtures/ --season 3:119474:2025-10,2025-11 --games --loader-limit 50
+    python -m tools.ibba_replay record fixtures/ --url https://ibasketball.co.il/league/2025-2/
+    python -m tools.ibba_replay import fixtures/ events.json --season 3:119474:
+    python -m tools.ibba_replay serve fixtures/ --port 8765 --latency 80 --error-rate 0.05
+    python -m tools.ibba_replay load fixtures/ --target adapter --concurrency 1,4,16 --requests 50 --latency 80
+
+Layout of an archive directory:
+    index.json      format version, seasons recorded, one entry per request (path + sorted query)
+    bodies/*        response bodies, content-addressed
+"""
+
+from .archive import Archive, request_key
+from .loadgen import format_table, run_load, summarize
+from .record import Recorder, import_events, load_events_file, parse_season
+from .server import FaultProfile, ReplayServer
+
+__all__ = [
+    "Archive",
+    "FaultProfile",
+    "Recorder",
+    "ReplayServer",
+    "format_table",
+    "import_events",
+    "load_events_file",
+    "parse_season",
+    "request_key",
+    "run_load",
+    "summarize",
+]
@@ -0,0 +1,195 @@
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+from .archive import Archive
+from .loadgen import format_table, run_load
+from .record import Recorder, import_events, load_events_file, parse_season
+from .server import FaultProfile, ReplayServer
+
+
+TARGETS = ("proxy", "adapter", "loader")
+
+
+def add_fault_arguments(parser):
+    faults = parser.add_argument_group("faults")
+    faults.add_argument("--latency", type=float, default=0.0, help="Fixed delay per response (ms)")
+    faults.add_argument("--jitter", type=float, default=0.0, help="+/- uniform jitter (ms)")
+    faults.add_argument("--replay-latency", type=float, default=0.0, help="Add recorded upstream time x FACTOR")
+    faults.add_argument("--error-rate", type=float, default=0.0, help="Share of requests answered with --error-status")
+    faults.add_argument("--error-status", type=int, default=503)
+    faults.add_argument("--timeout-rate", type=float, default=0.0, help="Share of requests that hang and drop the connection")
+    faults.add_argument("--timeout-ms", type=float, default=20000.0)
+    faults.add_argument("--rate-limit", type=float, default=0.0, help="Requests/second over all clients, excess -> 429")
+    faults.add_argument("--burst", type=int, default=10)
+    faults.add_argument("--max-concurrent", type=int, default=0, help="Requests handled at once (0 = unlimited)")
+    faults.add_argument("--bandwidth", type=float, default=0.0, help="Bytes/second per response (0 = unlimited)")
+    faults.add_argument("--seed", type=int, default=1)
+
+
+def fault_profile(args):
+    return FaultProfile(
+        latency_ms=args.latency,
+        jitter_ms=args.jitter,
+        replay_latency=args.replay_latency,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        timeout_rate=args.timeout_rate,
+        timeout_ms=args.timeout_ms,
+        rate_limit=args.rate_limit,
+        burst=args.burst,
+        max_concurrent=args.max_concurrent,
+        bandwidth=args.bandwidth,
+        seed=args.seed,
+    )
+
+
+def cmd_record(args):
+    if not args.season and not args.url:
+        raise SystemExit("Nothing to record - pass --season and/or --url")
+    started = time.perf_counter()
+    archive = Archive(Path(args.archive))
+    recorder = Recorder(archive, delay=args.delay, refresh=args.refresh)
+    try:
+        for value in args.season or []:
+            season = parse_season(value)
+            print(f"Season {season['leagueId']}:{season['seasonId']} ({len(season['seasonMonths'])} months)")
+            recorder.record_season(season, games=args.games, loader_limit=args.loader_limit)
+        for url in args.url or []:
+            recorder.record(url)
+    finally:
+        archive.save()
+    counts = recorder.counts
+    print(f"Wrote: {args.archive} ({len(archive)} entries)")
+    print(f"Recorded: {counts['recorded']}  Skipped: {counts['skipped']}  Failed: {counts['failed']}")
+    print(f"Elapsed: {time.perf_counter() - started:.2f}s")
+
+
+def cmd_import(args):
+    events = load_events_file(Path(args.events))
+    if not events:
+        raise SystemExit(f"No events in {args.events}")
+    archive = Archive(Path(args.archive))
+    season = import_events(archive, events, parse_season(args.season), loader_limit=args.loader_limit)
+    archive.save()
+    print(f"Wrote: {args.archive} ({len(archive)} entries)")
+    print(f"Season {season['leagueId']}:{season['seasonId']}  Events: {len(events)}  Months: {', '.join(season['seasonMonths'])}")
+
+
+def cmd_serve(args):
+    archive = Archive(Path(args.archive))
+    if not len(archive) and not args.record_missing:
+        raise SystemExit(f"Empty archive: {args.archive} (record or import first, or pass --record-missing)")
+    server = ReplayServer(archive, fault_profile(args), host=args.host, port=args.port,
+                          record_missing=args.record_missing, verbose=args.verbose)
+    print(f"Serving {len(archive)} entries on {server.origin} (stats: {server.origin}/__replay/stats)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+        print(json.dumps({key: value for key, value in server.snapshot().items() if key != "faults"}))
+
+
+def cmd_load(args):
+    archive = Archive(Path(args.archive))
+    season = parse_season(args.season) if args.season else (archive.seasons[0] if archive.seasons else None)
+    if args.target in ("adapter", "loader") and not season:
+        raise SystemExit("No season in the archive - pass --season LEAGUE:SEASON:YYYY-MM,...")
+    urls = args.url or archive.urls(args.url_prefix)
+    if args.target == "proxy" and not urls:
+        raise SystemExit("No recorded URLs for the proxy target")
+    concurrency = [int(value) for value in args.concurrency.split(",") if value]
+    options = {
+        "resetCacheAfterWarmup": args.cold,
+        "monthConcurrency": args.month_concurrency,
+        "monthTimeoutMs": args.month_timeout,
+        "since": args.since,
+        "until": args.until,
+        "limit": args.limit,
+    }
+    options = {key: value for key, value in options.items() if value}
+
+    server = None
+    origin = args.origin
+    if not origin:
+        server = ReplayServer(archive, fault_profile(args)).start()
+        origin = server.origin
+    try:
+        summaries = run_load(origin, args.target, concurrency, requests=0 if args.duration else args.requests, duration_s=args.duration,
+                             season=season, urls=urls, warmup=args.warmup, options=options, server=server, node=args.node)
+    finally:
+        if server:
+            server.stop()
+
+    if args.json:
+        text = json.dumps(summaries, ensure_ascii=False, indent=2 if args.json != "-" else None)
+        if args.json == "-":
+            sys.stdout.write(text + "\n")
+            return
+        Path(args.json).write_text(text + "\n", encoding="utf-8")
+        print(f"Wrote: {args.json}")
+    print(format_table(summaries))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m tools.ibba_replay", description="Record/replay ibasketball.co.il and load-test the app's fetch paths")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    record = sub.add_parser("record", help="Record live responses into an archive")
+    record.add_argument("archive", help="Archive directory (created or extended)")
+    record.add_argument("--season", action="append", help="LEAGUE:SEASON:YYYY-MM,YYYY-MM (the adapter's month requests)")
+    record.add_argument("--games", action="store_true", help="Also record every game by id (wp/v2/events/ID)")
+    record.add_argument("--loader-limit", type=int, default=0, help="Also record the loader's events list with this per_page")
+    record.add_argument("--url", action="append", help="Any other URL (league pages, standings)")
+    record.add_argument("--delay", type=float, default=0.2, help="Seconds between live requests")
+    record.add_argument("--refresh", action="store_true", help="Re-record URLs already in the archive")
+    record.set_defaults(func=cmd_record)
+
+    importer = sub.add_parser("import", help="Build an archive from an events JSON file instead of the live site")
+    importer.add_argument("archive")
+    importer.add_argument("events", help="events.json (e.g. node tests/helpers/synthetic-season.js > events.json)")
+    importer.add_argument("--season", required=True, help="LEAGUE:SEASON: or LEAGUE:SEASON:YYYY-MM,... (months default to the event dates)")
+    importer.add_argument("--loader-limit", type=int, default=50)
+    importer.set_defaults(func=cmd_import)
+
+    serve = sub.add_parser("serve", help="Serve an archive as a stand-in for ibasketball.co.il")
+    serve.add_argument("archive")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8765)
+    serve.add_argument("--record-missing", action="store_true", help="Fetch and record requests that are not in the archive")
+    serve.add_argument("--verbose", action="store_true")
+    add_fault_arguments(serve)
+    serve.set_defaults(func=cmd_serve)
+
+    load = sub.add_parser("load", help="Drive api/proxy.js, IBBAAdapter or IBBAGameLoader against a replay server")
+    load.add_argument("archive")
+    load.add_argument("--target", choices=TARGETS, default="adapter")
+    load.add_argument("--concurrency", default="1,4,16", help="Comma-separated levels, one run each")
+    load.add_argument("--requests", type=int, default=50, help="Operations per level")
+    load.add_argument("--duration", type=float, default=0.0, help="Seconds per level (overrides --requests)")
+    load.add_argument("--warmup", type=int, default=1, help="Operations before measuring")
+    load.add_argument("--cold", action="store_true", help="Clear the proxy cache after the warmup")
+    load.add_argument("--season", help="LEAGUE:SEASON:YYYY-MM,... (default: first season in the archive)")
+    load.add_argument("--url", action="append", help="Proxy target URLs (default: every recorded URL)")
+    load.add_argument("--url-prefix", default="", help="Only recorded keys starting with this path")
+    load.add_argument("--month-concurrency", type=int, default=0, help="IBBAAdapter.monthFetchConcurrency")
+    load.add_argument("--month-timeout", type=int, default=0, help="IBBAAdapter.monthFetchTimeoutMs")
+    load.add_argument("--since", help="loader: since (default auto)")
+    load.add_argument("--until", help="loader: until (default now)")
+    load.add_argument("--limit", type=int, default=0, help="loader: limit (default 50)")
+    load.add_argument("--origin", help="Use a running replay server instead of starting one (faults are then its own)")
+    load.add_argument("--node", default="node")
+    load.add_argument("--json", help="Write the results as JSON (- for stdout)")
+    add_fault_arguments(load)
+    load.set_defaults(func=cmd_load)
+
+    args = parser.parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
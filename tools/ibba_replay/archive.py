@@ -0,0 +1,138 @@
+import hashlib
+import json
+import threading
+import time
+from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+
+FORMAT_VERSION = 1
+ORIGIN = "https://ibasketball.co.il"
+
+# Cache busters - never part of the key
+IGNORED_PARAMS = {"_", "cb", "nocache"}
+
+# Date windows (IBBAGameLoader.loadNewGames -> fetchGames before/after are "now"-relative):
+# when there is no exact recording, the same request without them is served
+LOOSE_PARAMS = {"before", "after"}
+
+
+def request_key(url):
+    """
+    Archive key of a URL: path + query with sorted parameters, without host
+    (direct, proxied and replayed requests for the same resource share one key).
+    """
+    parts = urlsplit(url)
+    params = sorted((key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True) if key not in IGNORED_PARAMS)
+    path = parts.path or "/"
+    return f"{path}?{urlencode(params)}" if params else path
+
+
+def loose_key(key):
+    """The key without LOOSE_PARAMS (fallback match)."""
+    path, _, query = key.partition("?")
+    params = [(k, v) for k, v in parse_qsl(query, keep_blank_values=True) if k not in LOOSE_PARAMS]
+    return f"{path}?{urlencode(params)}" if params else path
+
+
+def compute_etag(body: bytes):
+    return 'W/"' + hashlib.sha1(body).hexdigest()[:27] + '"'
+
+
+class Archive:
+    """
+    Recorded responses on disk:
+        index.json      format version, seasons recorded, one entry per request key
+        bodies/*        response bodies (content-addressed, shared between identical responses)
+
+    Entries: { key, url, status, contentType, etag, lastModified, body, bytes, elapsedMs, recordedAt }
+    """
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.entries = {}
+        self.loose = {}
+        self.seasons = []
+        self.lock = threading.Lock()
+        self.bodies = {}
+        index = self.root / "index.json"
+        if index.exists():
+            data = json.loads(index.read_text(encoding="utf-8"))
+            if data.get("version") != FORMAT_VERSION:
+                raise SystemExit(f"Unsupported archive version {data.get('version')} in {index}")
+            self.seasons = data.get("seasons", [])
+            for entry in data.get("entries", []):
+                self._index(entry)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def _index(self, entry):
+        self.entries[entry["key"]] = entry
+        self.loose.setdefault(loose_key(entry["key"]), entry["key"])
+
+    def lookup(self, url_or_key):
+        """Entry for a request: exact key, else the same request without LOOSE_PARAMS, else None."""
+        key = url_or_key if url_or_key.startswith("/") else request_key(url_or_key)
+        entry = self.entries.get(key)
+        if entry is None:
+            fallback = self.loose.get(loose_key(key))
+            entry = self.entries.get(fallback) if fallback else None
+        return entry
+
+    def read_body(self, entry):
+        """Body bytes (kept in memory after the first read - the server serves them repeatedly)."""
+        body = self.bodies.get(entry["body"])
+        if body is None:
+            body = (self.root / entry["body"]).read_bytes()
+            self.bodies[entry["body"]] = body
+        return body
+
+    def add(self, url, status, content_type, body: bytes, etag=None, last_modified=None, elapsed_ms=0.0):
+        """Store a response (replaces an earlier recording of the same key)."""
+        digest = hashlib.sha1(body).hexdigest()[:16]
+        extension = "json" if "json" in (content_type or "") else ("html" if "html" in (content_type or "") else "bin")
+        name = f"bodies/{digest}.{extension}"
+        entry = {
+            "key": request_key(url),
+            "url": url,
+            "status": status,
+            "contentType": content_type or "application/octet-stream",
+            "etag": etag or compute_etag(body),
+            "lastModified": last_modified,
+            "body": name,
+            "bytes": len(body),
+            "elapsedMs": round(elapsed_ms, 1),
+            "recordedAt": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        }
+        with self.lock:
+            path = self.root / name
+            if not path.exists():
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_bytes(body)
+            self.bodies[name] = body
+            self._index(entry)
+        return entry
+
+    def add_season(self, season):
+        """Remember a recorded season ({ leagueId, seasonId, seasonMonths }) - the load generator's defaults."""
+        with self.lock:
+            self.seasons = [s for s in self.seasons if (s["leagueId"], s["seasonId"]) != (season["leagueId"], season["seasonId"])]
+            self.seasons.append(season)
+
+    def save(self):
+        with self.lock:
+            self.root.mkdir(parents=True, exist_ok=True)
+            data = {
+                "version": FORMAT_VERSION,
+                "origin": ORIGIN,
+                "seasons": self.seasons,
+                "entries": sorted(self.entries.values(), key=lambda entry: entry["key"]),
+            }
+            tmp = self.root / "index.json.tmp"
+            tmp.write_text(json.dumps(data, ensure_ascii=False, indent=1) + "\n", encoding="utf-8")
+            tmp.replace(self.root / "index.json")
+
+    def urls(self, prefix=""):
+        """Recorded URLs (optionally only keys starting with prefix), for the load generator's request mix."""
+        return [entry["url"] for key, entry in sorted(self.entries.items()) if key.startswith(prefix) and entry["status"] == 200]
@@ -0,0 +1,213 @@
+// Load driver for tools/ibba_replay: runs the app's own fetch paths against a replay server
+//   node tools/ibba_replay/load_driver.js '{"origin":"http://127.0.0.1:8765","target":"adapter","concurrency":4,"requests":100}'
+//   prints one JSON result to stdout: { target, concurrency, elapsedMs, samples: [{ ms, ok, error }], stats }
+//
+// targets:
+//   proxy   - api/proxy.js handler (one warm instance) for the recorded URLs, round robin
+//   adapter - IBBAAdapter.fetchSeasonMonthGames + convertToInternalFormat (direct fetch, proxy fallback)
+//   loader  - IBBAGameLoader.loadNewGames with an in-memory DB (every game is new)
+//
+// All https://*.ibasketball.co.il requests go to the replay origin; the Vercel proxy URLs
+// ('vercel', 'vercel-relative') run the api/proxy.js handler in-process; any other host is refused
+// (no public CORS proxies from a load test).
+const fs = require('fs');
+const path = require('path');
+const vm = require('vm');
+const { performance } = require('perf_hooks');
+
+const ROOT = path.join(__dirname, '..', '..');
+const PROXY_HOSTS = new Set(['basketball-stats-manager.vercel.app', 'localhost']);
+
+async function loadProxy() {
+  // api/proxy.js is an ES module (Vercel function) - same loading as tests/api-proxy.test.js
+  const source = fs.readFileSync(path.join(ROOT, 'api', 'proxy.js'), 'utf8');
+  return import(`data:text/javascript;base64,${Buffer.from(source).toString('base64')}`);
+}
+
+function createResponse() {
+  return {
+    statusCode: 200,
+    headers: {},
+    body: '',
+    setHeader(name, value) { this.headers[name.toLowerCase()] = value; },
+    status(code) { this.statusCode = code; return this; },
+    json(data) { this.headers['content-type'] = 'application/json'; this.body = JSON.stringify(data); return this; },
+    send(data) { this.body = data; return this; },
+    end() { return this; }
+  };
+}
+
+/**
+ * fetch for the drivers: ibasketball.co.il -> replay origin, Vercel proxy -> in-process handler
+ */
+function createReplayFetch(origin, proxy, realFetch = globalThis.fetch) {
+  const callProxy = async (url, init = {}) => {
+    const res = createResponse();
+    const headers = {};
+    if (init.headers?.['If-None-Match']) headers['if-none-match'] = init.headers['If-None-Match'];
+    await proxy.handler({ method: 'GET', query: Object.fromEntries(url.searchParams), headers }, res);
+    return new Response(res.statusCode === 304 ? null : res.body, { status: res.statusCode, headers: res.headers });
+  };
+
+  return async function replayFetch(input, init = {}) {
+    const url = new URL(typeof input === 'string' ? input : input.url, 'http://localhost');
+    if (url.hostname.endsWith('ibasketball.co.il')) {
+      return realFetch(`${origin}${url.pathname}${url.search}`, init);
+    }
+    if (url.pathname === '/api/proxy' && PROXY_HOSTS.has(url.hostname) && proxy) {
+      return callProxy(url, init);
+    }
+    throw new TypeError(`fetch failed: ${url.host} is not available in a replay run`);
+  };
+}
+
+function loadIbbaModules(names, fetch) {
+  const quiet = { log() {}, warn() {}, error() {}, info() {}, time() {}, timeEnd() {} };
+  const context = {
+    console: quiet,
+    fetch,
+    Response,
+    URL,
+    AbortController,
+    setTimeout,
+    clearTimeout,
+    location: { protocol: 'http:', hostname: 'localhost' },
+    document: { createElement() { return { innerHTML: '', get value() { return this.innerHTML; } }; } }
+  };
+  context.window = context;
+  vm.createContext(context);
+  names.forEach(name => {
+    const file = path.join(ROOT, 'js', 'ibba', name);
+    vm.runInContext(fs.readFileSync(file, 'utf8'), context, { filename: file });
+  });
+  return context;
+}
+
+/**
+ * One operation per target: async (index) => details (throws = failed operation)
+ */
+async function createTarget(config, fetch, proxy) {
+  const season = config.season || {};
+
+  if (config.target === 'proxy') {
+    const urls = config.urls || [];
+    if (urls.length === 0) throw new Error('proxy target needs urls');
+    return {
+      run: async index => {
+        const res = createResponse();
+        await proxy.handler({ method: 'GET', query: { url: urls[index % urls.length] }, headers: {} }, res);
+        if (res.statusCode >= 400) throw new Error(`HTTP ${res.statusCode}`);
+        return { cache: res.headers['x-proxy-cache'] };
+      },
+      stats: () => ({ proxy: proxy.getProxyStats() })
+    };
+  }
+
+  const window = loadIbbaModules(['ibba_proxy_client.js', 'ibba_adapter.js', 'ibba_game_loader.js'], fetch);
+  // IBBAGameLoader is a top-level class (not on window) - same lookup as tests/ibba-game-loader.test.js
+  const { IBBAGameLoader } = vm.runInContext('({ IBBAGameLoader })', window);
+  const proxyClient = new window.IBBAProxyClient();
+  const createAdapter = () => {
+    const adapter = new window.IBBAAdapter(season);
+    adapter.proxyClient = proxyClient;
+    if (config.monthConcurrency) adapter.monthFetchConcurrency = config.monthConcurrency;
+    if (config.monthTimeoutMs) adapter.monthFetchTimeoutMs = config.monthTimeoutMs;
+    return adapter;
+  };
+  const stats = () => ({ proxy: proxy.getProxyStats(), proxyClient: proxyClient.getStats() });
+
+  if (config.target === 'adapter') {
+    return {
+      run: async () => {
+        const adapter = createAdapter();
+        const events = await adapter.fetchSeasonMonthGames(Infinity);
+        const games = events.map(event => adapter.convertToInternalFormat(event));
+        const failedMonths = adapter.lastFetchTimings.months.filter(month => month.status !== 'ok');
+        if (failedMonths.length > 0) throw new Error(`${failedMonths.length} month(s) failed`);
+        return { games: games.length };
+      },
+      stats
+    };
+  }
+
+  if (config.target === 'loader') {
+    // IBBAGameLoader's DB: nothing stored yet (the load is the fetch + convert + filter path)
+    const db = { checkGamesExist: async () => [] };
+    return {
+      run: async () => {
+        const loader = new IBBAGameLoader(createAdapter(), db);
+        const result = await loader.loadNewGames(config.since || 'auto', config.until || 'now', config.limit || 50);
+        if (!result.success) throw new Error(result.error);
+        return { games: result.total };
+      },
+      stats
+    };
+  }
+
+  throw new Error(`Unknown target: ${config.target}`);
+}
+
+/**
+ * concurrency workers, each running operations back to back, until `requests` operations
+ * (or `durationMs`) - per-operation latency in samples
+ */
+async function runLoad(config) {
+  const realFetch = globalThis.fetch;
+  const proxyModule = await loadProxy();
+  const proxy = { handler: proxyModule.default, getProxyStats: proxyModule.getProxyStats };
+  const fetch = createReplayFetch(config.origin, proxy, realFetch);
+
+  const { log, error } = console;
+  console.log = console.error = () => {}; // the proxy handler logs every request
+  globalThis.fetch = fetch; // api/proxy.js fetches upstream with the global fetch
+  try {
+    proxyModule.resetProxyCache();
+    const target = await createTarget(config, fetch, proxy);
+    for (let i = 0; i < (config.warmup || 0); i++) {
+      await target.run(i).catch(() => {});
+    }
+    if (config.resetCacheAfterWarmup) proxyModule.resetProxyCache();
+
+    const samples = [];
+    const total = config.requests || Infinity;
+    const deadline = config.durationMs ? performance.now() + config.durationMs : Infinity;
+    let next = 0;
+    const worker = async () => {
+      while (next < total && performance.now() < deadline) {
+        const index = next++;
+        const startedAt = performance.now();
+        try {
+          const details = await target.run(index);
+          samples.push({ ms: performance.now() - startedAt, ok: true, ...details });
+        } catch (err) {
+          samples.push({ ms: performance.now() - startedAt, ok: false, error: err.message });
+        }
+      }
+    };
+
+    const startedAt = performance.now();
+    await Promise.all(Array.from({ length: Math.max(1, config.concurrency || 1) }, worker));
+    return {
+      target: config.target,
+      concurrency: config.concurrency || 1,
+      elapsedMs: performance.now() - startedAt,
+      samples,
+      stats: target.stats()
+    };
+  } finally {
+    globalThis.fetch = realFetch;
+    console.log = log;
+    console.error = error;
+  }
+}
+
+if (require.main === module) {
+  runLoad(JSON.parse(process.argv[2] || '{}'))
+    .then(result => process.stdout.write(`${JSON.stringify(result)}\n`))
+    .catch(err => {
+      process.stderr.write(`${err.stack || err.message}\n`);
+      process.exit(1);
+    });
+}
+
+module.exports = { runLoad, createReplayFetch };
@@ -0,0 +1,118 @@
+import json
+import math
+import shutil
+import subprocess
+from pathlib import Path
+
+
+DRIVER = Path(__file__).with_name("load_driver.js")
+PERCENTILES = (50, 90, 95, 99)
+
+
+def percentile(sorted_values, p):
+    """Nearest rank (same as tests/helpers/bench-harness.js)."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, math.ceil(p / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def summarize(result):
+    """Driver result -> throughput, latency percentiles (successful operations) and error counts."""
+    samples = result["samples"]
+    ok = sorted(sample["ms"] for sample in samples if sample["ok"])
+    errors = {}
+    for sample in samples:
+        if not sample["ok"]:
+            errors[sample["error"]] = errors.get(sample["error"], 0) + 1
+    elapsed_s = result["elapsedMs"] / 1000 or 1e-9
+    summary = {
+        "target": result["target"],
+        "concurrency": result["concurrency"],
+        "operations": len(samples),
+        "ok": len(ok),
+        "failed": len(samples) - len(ok),
+        "elapsedMs": round(result["elapsedMs"], 1),
+        "throughput": round(len(ok) / elapsed_s, 2),
+        "meanMs": round(sum(ok) / len(ok), 2) if ok else 0.0,
+        "maxMs": round(ok[-1], 2) if ok else 0.0,
+        "errors": errors,
+        "stats": result.get("stats", {}),
+    }
+    for p in PERCENTILES:
+        summary[f"p{p}Ms"] = round(percentile(ok, p), 2)
+    cache = {}
+    for sample in samples:
+        if sample.get("cache"):
+            cache[sample["cache"]] = cache.get(sample["cache"], 0) + 1
+    if cache:
+        summary["proxyCache"] = cache
+    return summary
+
+
+def run_driver(config, node="node"):
+    """Run load_driver.js once (one target, one concurrency level) and return its JSON result."""
+    if shutil.which(node) is None:
+        raise SystemExit(f"Node.js not found ({node}) - the load driver runs the app's JS modules")
+    completed = subprocess.run(
+        [node, str(DRIVER), json.dumps(config)],
+        capture_output=True,
+        text=True,
+        encoding="utf-8",
+    )
+    if completed.returncode != 0:
+        raise SystemExit(f"load driver failed:\n{completed.stderr.strip()}")
+    return json.loads(completed.stdout)
+
+
+def run_load(origin, target, concurrency_levels, requests=0, duration_s=0.0, season=None, urls=None,
+             warmup=0, options=None, server=None, node="node"):
+    """
+    One driver run per concurrency level against the replay origin.
+    With an in-process ReplayServer its counters are reset before and attached after each run.
+    """
+    summaries = []
+    for concurrency in concurrency_levels:
+        config = {
+            "origin": origin,
+            "target": target,
+            "concurrency": concurrency,
+            "requests": requests or None,
+            "durationMs": duration_s * 1000 if duration_s else None,
+            "season": season,
+            "urls": urls,
+            "warmup": warmup,
+            **(options or {}),
+        }
+        if server:
+            server.reset_stats()
+        summary = summarize(run_driver(config, node=node))
+        if server:
+            summary["server"] = {key: value for key, value in server.snapshot().items() if key != "faults"}
+        summaries.append(summary)
+    return summaries
+
+
+def format_table(summaries):
+    lines = [
+        f"{'target':<8} {'conc':>4} {'ops':>6} {'fail':>5} {'ops/s':>9} "
+        + " ".join(f"{f'p{p}(ms)':>9}" for p in PERCENTILES)
+        + f" {'max(ms)':>9}  upstream"
+    ]
+    for summary in summaries:
+        server = summary.get("server") or {}
+        upstream = f"{server.get('requests', '-')} req" if server else "-"
+        if server.get("injectedErrors") or server.get("injectedTimeouts") or server.get("throttled"):
+            upstream += f" ({server['injectedErrors']} err, {server['injectedTimeouts']} timeout, {server['throttled']} 429)"
+        if server.get("misses"):
+            upstream += f" {server['misses']} not recorded"
+        lines.append(
+            f"{summary['target']:<8} {summary['concurrency']:>4} {summary['operations']:>6} {summary['failed']:>5} "
+            f"{summary['throughput']:>9.1f} "
+            + " ".join(f"{summary[f'p{p}Ms']:>9.1f}" for p in PERCENTILES)
+            + f" {summary['maxMs']:>9.1f}  {upstream}"
+        )
+    for summary in summaries:
+        for error, count in summary["errors"].items():
+            lines.append(f"  c={summary['concurrency']}: {count} x {error}")
+    return "\n".join(lines)
@@ -0,0 +1,143 @@
+import json
+import time
+import urllib.error
+import urllib.request
+from collections import defaultdict
+from pathlib import Path
+
+from .archive import ORIGIN, Archive, request_key
+
+
+USER_AGENT = "Basketball-Stats-Manager/1.0"  # same as api/proxy.js
+
+
+# Request URLs built the same way as js/ibba/ibba_adapter.js - a replay only matches what was recorded
+
+def month_url(league_id, season_id, month):
+    """IBBAAdapter.fetchSeasonMonthGames"""
+    return (
+        f"{ORIGIN}/wp-json/sportspress/v2/events?order=asc&by=post_date"
+        f"&seasons={season_id}&leagues={league_id}&month={month}&per_page=1000"
+    )
+
+
+def game_url(game_id):
+    """IBBAAdapter.fetchGame"""
+    return f"{ORIGIN}/wp-json/wp/v2/events/{game_id}"
+
+
+def events_url(league_id, limit):
+    """IBBAAdapter.fetchGames without the before/after window (matched loosely on replay)"""
+    return f"{ORIGIN}/wp-json/wp/v2/events?leagues={league_id}&per_page={limit}"
+
+
+def parse_season(value):
+    """'LEAGUE:SEASON:2025-10,2025-11' -> { leagueId, seasonId, seasonMonths }"""
+    try:
+        league, season, months = value.split(":", 2)
+        return {"leagueId": int(league), "seasonId": int(season), "seasonMonths": [m for m in months.split(",") if m]}
+    except ValueError:
+        raise SystemExit(f"Bad season {value!r} - expected LEAGUE:SEASON:YYYY-MM,YYYY-MM")
+
+
+def fetch(url, timeout=30):
+    """GET from the live site -> (status, content type, body, etag, last modified, elapsed ms)."""
+    request = urllib.request.Request(url, headers={"User-Agent": USER_AGENT, "Accept": "application/json, text/html;q=0.9, */*;q=0.8"})
+    started = time.perf_counter()
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            body = response.read()
+            headers = response.headers
+            status = response.status
+    except urllib.error.HTTPError as error:
+        body = error.read()
+        headers = error.headers
+        status = error.code
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    return status, headers.get("Content-Type"), body, headers.get("ETag"), headers.get("Last-Modified"), elapsed_ms
+
+
+class Recorder:
+    """Fetches URLs from the live site into an archive (politely: one at a time, with a delay)."""
+
+    def __init__(self, archive: Archive, delay=0.2, refresh=False, log=print):
+        self.archive = archive
+        self.delay = delay
+        self.refresh = refresh
+        self.log = log
+        self.counts = {"recorded": 0, "skipped": 0, "failed": 0}
+
+    def record(self, url):
+        """Record one URL; returns the parsed JSON body (or None)."""
+        existing = self.archive.entries.get(request_key(url))
+        if existing and existing["status"] == 200 and not self.refresh:
+            self.counts["skipped"] += 1
+            return self._json(existing["contentType"], self.archive.read_body(existing))
+
+        try:
+            status, content_type, body, etag, last_modified, elapsed_ms = fetch(url)
+        except OSError as error:
+            self.counts["failed"] += 1
+            self.log(f"  ! {url}: {error}")
+            return None
+        finally:
+            if self.delay:
+                time.sleep(self.delay)
+
+        self.archive.add(url, status, content_type, body, etag, last_modified, elapsed_ms)
+        self.counts["recorded"] += 1
+        self.log(f"  {status} {len(body):>8} B {elapsed_ms:>7.0f} ms  {url}")
+        return self._json(content_type, body) if status == 200 else None
+
+    @staticmethod
+    def _json(content_type, body):
+        if "json" not in (content_type or ""):
+            return None
+        try:
+            return json.loads(body)
+        except ValueError:
+            return None
+
+    def record_season(self, season, games=False, loader_limit=0):
+        """Month lists of a season (+ every game by id, + the loader's events list)."""
+        self.archive.add_season(season)
+        for month in season["seasonMonths"]:
+            events = self.record(month_url(season["leagueId"], season["seasonId"], month)) or []
+            if games:
+                for event in events:
+                    if isinstance(event, dict) and event.get("id") is not None:
+                        self.record(game_url(event["id"]))
+        if loader_limit:
+            self.record(events_url(season["leagueId"], loader_limit))
+
+
+def import_events(archive: Archive, events, season, loader_limit=50):
+    """
+    Archive from an events JSON file (e.g. node tests/helpers/synthetic-season.js > events.json)
+    instead of the live site: month lists grouped by event date, one entry per game, the loader's list.
+    """
+    by_month = defaultdict(list)
+    for event in events:
+        by_month[str(event.get("date") or "")[:7]].append(event)
+    months = season["seasonMonths"] or sorted(month for month in by_month if month)
+    season = {**season, "seasonMonths": months}
+
+    def add_json(url, data):
+        archive.add(url, 200, "application/json; charset=UTF-8", json.dumps(data, ensure_ascii=False).encode("utf-8"))
+
+    for month in months:
+        add_json(month_url(season["leagueId"], season["seasonId"], month), by_month.get(month, []))
+    for event in events:
+        add_json(game_url(event["id"]), event)
+    if loader_limit:
+        latest = sorted(events, key=lambda event: str(event.get("date") or ""), reverse=True)[:loader_limit]
+        add_json(events_url(season["leagueId"], loader_limit), latest)
+    archive.add_season(season)
+    return season
+
+
+def load_events_file(path: Path):
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    if isinstance(data, dict):
+        data = data.get("games") or data.get("events") or []
+    return [event for event in data if isinstance(event, dict) and event.get("id") is not None]
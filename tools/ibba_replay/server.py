@@ -0,0 +1,236 @@
+import json
+import random
+import threading
+import time
+from dataclasses import asdict, dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from .archive import ORIGIN, Archive, request_key
+from .record import fetch
+
+
+@dataclass
+class FaultProfile:
+    """What the replay server does to each request (all off by default)."""
+
+    latency_ms: float = 0.0        # fixed delay before the response
+    jitter_ms: float = 0.0         # + uniform(-jitter, +jitter)
+    replay_latency: float = 0.0    # + recorded upstream time x factor (1.0 = as slow as the live site was)
+    error_rate: float = 0.0        # share of requests answered with error_status
+    error_status: int = 503
+    timeout_rate: float = 0.0      # share of requests that hang for timeout_ms and then drop the connection
+    timeout_ms: float = 20000.0
+    rate_limit: float = 0.0        # requests/second over all clients (token bucket), excess -> 429
+    burst: int = 10
+    max_concurrent: int = 0        # requests handled at once, the rest wait (0 = unlimited)
+    bandwidth: float = 0.0         # bytes/second per response (0 = unlimited)
+    seed: int = 1
+
+
+class TokenBucket:
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def take(self):
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True
+            return False
+
+
+class ReplayHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128  # default 5: bursts of connections at high concurrency hit SYN retries (~1 s)
+
+
+class ReplayServer:
+    """
+    Serves an archive over HTTP as if it were ibasketball.co.il (paths and queries as recorded,
+    any host), with the faults of a FaultProfile. Misses are 404 unless record_missing is set,
+    in which case they are fetched from the live site and added to the archive.
+
+        GET /__replay/stats   counters (JSON)
+        GET /__replay/reset   zero the counters
+    """
+
+    def __init__(self, archive: Archive, faults: FaultProfile = None, host="127.0.0.1", port=0, record_missing=False, verbose=False):
+        self.archive = archive
+        self.faults = faults or FaultProfile()
+        self.record_missing = record_missing
+        self.verbose = verbose
+        self.random = random.Random(self.faults.seed)
+        self.random_lock = threading.Lock()
+        self.bucket = TokenBucket(self.faults.rate_limit, self.faults.burst) if self.faults.rate_limit > 0 else None
+        self.slots = threading.BoundedSemaphore(self.faults.max_concurrent) if self.faults.max_concurrent > 0 else None
+        self.stats_lock = threading.Lock()
+        self.reset_stats()
+        self.httpd = ReplayHTTPServer((host, port), self._handler_class())
+        self.thread = None
+
+    @property
+    def origin(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def reset_stats(self):
+        with self.stats_lock:
+            self.stats = {
+                "requests": 0, "served": 0, "looseMatches": 0, "notModified": 0, "misses": 0, "recorded": 0,
+                "injectedErrors": 0, "injectedTimeouts": 0, "throttled": 0, "bytes": 0,
+                "inFlight": 0, "peakInFlight": 0,
+            }
+
+    def count(self, key, amount=1):
+        with self.stats_lock:
+            self.stats[key] += amount
+
+    def roll(self):
+        with self.random_lock:
+            return self.random.random()
+
+    def delay_for(self, entry):
+        faults = self.faults
+        delay = faults.latency_ms
+        if faults.jitter_ms:
+            with self.random_lock:
+                delay += self.random.uniform(-faults.jitter_ms, faults.jitter_ms)
+        if faults.replay_latency and entry:
+            delay += entry.get("elapsedMs", 0) * faults.replay_latency
+        return max(0.0, delay) / 1000
+
+    def start(self):
+        """Serve in a background thread (for the load generator); returns self."""
+        self.thread = threading.Thread(target=self.httpd.serve_forever, name="ibba-replay", daemon=True)
+        self.thread.start()
+        return self
+
+    def serve_forever(self):
+        self.httpd.serve_forever()
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self.record_missing:
+            self.archive.save()
+
+    def snapshot(self):
+        with self.stats_lock:
+            return {**self.stats, "entries": len(self.archive), "faults": asdict(self.faults)}
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            server_version = "ibba-replay/1"
+            disable_nagle_algorithm = True  # headers and body are separate writes (delayed ACK = +40 ms)
+
+            def log_message(self, format, *args):
+                if server.verbose:
+                    super().log_message(format, *args)
+
+            def do_GET(self):
+                if self.path.startswith("/__replay/"):
+                    if self.path.startswith("/__replay/reset"):
+                        server.reset_stats()
+                    return self.send_json(200, server.snapshot())
+
+                server.count("requests")
+                if server.slots:
+                    server.slots.acquire()
+                with server.stats_lock:
+                    server.stats["inFlight"] += 1
+                    server.stats["peakInFlight"] = max(server.stats["peakInFlight"], server.stats["inFlight"])
+                try:
+                    self.handle_replay()
+                finally:
+                    with server.stats_lock:
+                        server.stats["inFlight"] -= 1
+                    if server.slots:
+                        server.slots.release()
+
+            def handle_replay(self):
+                faults = server.faults
+                if server.bucket and not server.bucket.take():
+                    server.count("throttled")
+                    return self.send_json(429, {"error": "rate limited"}, {"Retry-After": "1"})
+                if faults.timeout_rate and server.roll() < faults.timeout_rate:
+                    server.count("injectedTimeouts")
+                    time.sleep(faults.timeout_ms / 1000)
+                    self.close_connection = True
+                    return
+                if faults.error_rate and server.roll() < faults.error_rate:
+                    server.count("injectedErrors")
+                    time.sleep(server.delay_for(None))
+                    return self.send_json(faults.error_status, {"error": "injected", "status": faults.error_status})
+
+                key = request_key(self.path)
+                entry = server.archive.lookup(key)
+                if server.record_missing and (entry is None or entry["key"] != key):
+                    entry = self.record(key) or entry
+                if entry is None:
+                    server.count("misses")
+                    return self.send_json(404, {"error": "not recorded", "key": key}, {"X-Replay": "MISS"})
+                if entry["key"] != key:
+                    server.count("looseMatches")
+
+                time.sleep(server.delay_for(entry))
+                headers = {
+                    "ETag": entry["etag"],
+                    "X-Replay": "HIT" if entry["key"] == key else "LOOSE",
+                }
+                if entry.get("lastModified"):
+                    headers["Last-Modified"] = entry["lastModified"]
+                if self.headers.get("If-None-Match") == entry["etag"]:
+                    server.count("notModified")
+                    return self.send_body(304, None, b"", headers)
+
+                body = server.archive.read_body(entry)
+                server.count("served")
+                server.count("bytes", len(body))
+                return self.send_body(entry["status"], entry["contentType"], body, headers)
+
+            def record(self, key):
+                live_url = f"{ORIGIN}{key}"
+                try:
+                    status, content_type, body, etag, last_modified, elapsed_ms = fetch(live_url)
+                except OSError:
+                    return None
+                server.count("recorded")
+                return server.archive.add(live_url, status, content_type, body, etag, last_modified, elapsed_ms)
+
+            def send_json(self, status, data, headers=None):
+                body = json.dumps(data, ensure_ascii=False).encode("utf-8")
+                return self.send_body(status, "application/json; charset=utf-8", body, headers or {})
+
+            def send_body(self, status, content_type, body, headers):
+                self.send_response(status)
+                self.send_header("Access-Control-Allow-Origin", "*")
+                self.send_header("Access-Control-Expose-Headers", "ETag, X-Replay")
+                if content_type:
+                    self.send_header("Content-Type", content_type)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                if not body:
+                    return
+                rate = server.faults.bandwidth
+                if rate <= 0:
+                    self.wfile.write(body)
+                    return
+                chunk = max(1024, int(rate / 20))  # ~20 writes per second
+                for start in range(0, len(body), chunk):
+                    self.wfile.write(body[start:start + chunk])
+                    self.wfile.flush()
+                    time.sleep(min(chunk, len(body) - start) / rate)
+
+        return Handler
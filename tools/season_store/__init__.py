@@ -0,0 +1,29 @@
+"""
+Offline season store: IBBA event JSON -> columnar NumPy arrays -> batch analytics.
+
+The browser computes the same numbers in IBBAAnalytics; this package is the headless
+path for archiving seasons and building reports.
+
+    python -m tools.season_store ingest store/ 2024.json 2025.json:2025-26
+    python -m tools.season_store report store/ --season 2025-26 --top 10
+    python -m tools.season_store report store/ --json report.json
+
+Layout of a store directory:
+    meta.json          format version, season labels, counts
+    lines/*.npy        one row per player per played game (memory-mapped on read)
+    team_games/*.npy   one row per team per played game (performance['0'] totals + sp_teams)
+    dictionaries.npz   seasons, team ids/names, player ids, jerseys, game ids/dates/rounds
+"""
+
+from .store import SeasonStore, StoreBuilder, build_store, load_events
+from .analytics import player_table, rank, team_table
+
+__all__ = [
+    "SeasonStore",
+    "StoreBuilder",
+    "build_store",
+    "load_events",
+    "player_table",
+    "rank",
+    "team_table",
+]
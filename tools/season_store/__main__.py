@@ -0,0 +1,121 @@
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+from .analytics import player_table, rank, team_table
+from .store import SeasonStore, build_store
+
+
+def parse_input(value):
+    """'path.json' or 'path.json:LABEL' (label defaults to the file name without extension)."""
+    path, sep, label = value.rpartition(":")
+    if not sep or not path or "/" in label or "\\" in label:
+        path, label = value, ""
+    path = Path(path)
+    return (label or path.stem), path
+
+
+def cmd_ingest(args):
+    started = time.perf_counter()
+    inputs = [parse_input(value) for value in args.inputs]
+    for _, path in inputs:
+        if not path.exists():
+            raise SystemExit(f"Input not found: {path}")
+
+    meta = build_store(Path(args.store), inputs)
+    counts = meta["counts"]
+    print(f"Wrote: {args.store}")
+    print(f"Seasons: {', '.join(meta['seasons'])}")
+    print(f"Games: {counts['games']}  Lines: {counts['lines']}  Teams: {counts['teams']}  Players: {counts['players']}")
+    if counts["skippedEvents"]:
+        print(f"Skipped (not played / no box score): {counts['skippedEvents']}")
+    print(f"Elapsed: {time.perf_counter() - started:.2f}s")
+
+
+def format_team(record):
+    home, away = record["home"], record["away"]
+    return (
+        f"  {record['teamName'][:24]:<24} {record['wins']:>3}-{record['losses']:<3}"
+        f" {record['ppg']:>6.1f} {record['oppPpg']:>6.1f} {record['pointDiff']:>+6.1f}"
+        f"   home {home['wins']}-{home['losses']}  away {away['wins']}-{away['losses']}"
+    )
+
+
+def format_player(record, metric):
+    return (
+        f"  {record['rank']:>3}. #{record['jersey']:<3} {record['playerId']:<10}"
+        f" {record['teamName'][:24]:<24} {record['gamesPlayed']:>3} GP  {metric} {record[metric]:.1f}"
+    )
+
+
+def cmd_report(args):
+    started = time.perf_counter()
+    store = SeasonStore(Path(args.store))
+    season = store.season_index(args.season)
+
+    teams = team_table(store, season)
+    players = player_table(store, season)
+    if args.min_games:
+        players = [player for player in players if player["gamesPlayed"] >= args.min_games]
+
+    report = {
+        "seasons": [args.season] if args.season else store.seasons,
+        "teams": teams,
+        "players": players,
+        "rankings": {
+            "teams": rank(teams, args.team_metric, args.top),
+            "players": rank(players, args.player_metric, args.top),
+        },
+    }
+    elapsed = time.perf_counter() - started
+
+    if args.json:
+        text = json.dumps(report, ensure_ascii=False, indent=2 if args.json != "-" else None)
+        if args.json == "-":
+            sys.stdout.write(text + "\n")
+        else:
+            Path(args.json).write_text(text + "\n", encoding="utf-8")
+            print(f"Wrote: {args.json} ({elapsed:.2f}s)")
+        return
+
+    for label in report["seasons"]:
+        print(f"== {label} ==")
+        print(f"  {'team':<24} {'W-L':>7} {'PPG':>6} {'OPP':>6} {'DIFF':>6}")
+        for record in teams:
+            if record["season"] == label:
+                print(format_team(record))
+        print(f"-- top {args.top} players by {args.player_metric} --")
+        for record in report["rankings"]["players"]:
+            if record["season"] == label:
+                print(format_player(record, args.player_metric))
+        print()
+    print(f"Teams: {len(teams)}  Players: {len(players)}  Elapsed: {elapsed:.2f}s")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m tools.season_store", description="Offline IBBA season store and batch analytics")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    ingest = sub.add_parser("ingest", help="Build a store from IBBA event JSON files (one file per season)")
+    ingest.add_argument("store", help="Output directory (an existing store is replaced; any other non-empty directory is refused)")
+    ingest.add_argument("inputs", nargs="+", help="events.json or events.json:SEASON_LABEL")
+    ingest.set_defaults(func=cmd_ingest)
+
+    report = sub.add_parser("report", help="Team / player totals, averages, home-away splits and rankings")
+    report.add_argument("store")
+    report.add_argument("--season", help="Season label (default: all seasons)")
+    report.add_argument("--top", type=int, default=10)
+    report.add_argument("--team-metric", default="ppg")
+    report.add_argument("--player-metric", default="ppg")
+    report.add_argument("--min-games", type=int, default=0)
+    report.add_argument("--json", help="Write the full report as JSON (- for stdout)")
+    report.set_defaults(func=cmd_report)
+
+    args = parser.parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
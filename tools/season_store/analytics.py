@@ -0,0 +1,225 @@
+import numpy as np
+
+
+TEAM_PER_GAME = {
+    # field: column (or tuple of columns summed) in team_games - same fields as IBBAAnalytics.computeTeamAverages
+    "rpg": ("off", "def"),
+    "apg": "ast",
+    "spg": "stl",
+    "bpg": "blk",
+    "tpg": "to",
+    "fpg": "pf",
+    "efficiencyAvg": "efficiency",
+    "fastBreakPpg": "pfb",
+    "pointsFromToPpg": "pto",
+    "paintPpg": "pipm",
+    "secondChancePpg": "psc",
+    "benchPpg": "pbc",
+}
+
+PLAYER_PER_GAME = {
+    # field: column (or tuple) in lines - same fields as IBBAAnalytics.computePlayerAverages
+    "ppg": "pts",
+    "rpg": ("off", "def"),
+    "apg": "ast",
+    "spg": "stl",
+    "bpg": "blk",
+    "tpg": "to",
+    "fpg": "pf",
+    "foulsDrawnPg": "pfa",
+    "efficiencyAvg": "rate",
+    "plusMinusPg": "pm",
+}
+
+SHOOTING = {"fgPct": ("fgm", "fga"), "threePtPct": ("threepm", "threepa"), "ftPct": ("ftm", "fta")}
+
+
+def to_fixed_1(values):
+    """
+    Number.prototype.toFixed(1) as floats: nearest by the exact binary value (30.45 -> 30.4),
+    exact ties (.25 / .75) away from zero. Runs once per group, not per line.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    nearest = np.array([float(f"{value:.1f}") for value in values.ravel()]).reshape(values.shape)
+    quarters = values * 4
+    tie = (quarters == np.floor(quarters)) & (np.mod(quarters, 2) == 1)
+    return np.where(tie, np.sign(values) * np.floor(np.abs(values) * 10 + 0.5) / 10, nearest)
+
+
+def group_by(*keys):
+    """Dense group ids for a composite integer key: (first row index per group, inverse, group count)."""
+    key = np.zeros(len(keys[0]), dtype=np.int64)
+    for part in keys:
+        part = np.asarray(part, dtype=np.int64)
+        key = key * (int(part.max()) + 1 if len(part) else 1) + part
+    _, first, inverse = np.unique(key, return_index=True, return_inverse=True)
+    return first, inverse.reshape(-1), len(first)
+
+
+def group_sum(inverse, count, values):
+    return np.bincount(inverse, weights=np.asarray(values, dtype=np.float64), minlength=count)
+
+
+def column_sum(columns, inverse, count, spec):
+    names = spec if isinstance(spec, tuple) else (spec,)
+    return sum(group_sum(inverse, count, columns[name]) for name in names)
+
+
+def select(columns, mask):
+    if mask is None:
+        return {name: np.asarray(values) for name, values in columns.items()}
+    return {name: np.asarray(values)[mask] for name, values in columns.items()}
+
+
+def season_mask(columns, season):
+    return None if season is None else np.asarray(columns["season"]) == season
+
+
+def pct(made, attempted):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(attempted > 0, to_fixed_1(made / np.maximum(attempted, 1) * 100), 0.0)
+
+
+def per_game(total, games):
+    return to_fixed_1(total / np.maximum(games, 1))
+
+
+def team_table(store, season=None):
+    """
+    Team totals / averages / home-away splits per (season, team), vectorized over team_games.
+    Mirrors IBBAAnalytics.getTeamAverages + getTeamHomeAwayRecords for each season.
+    Note: teams are keyed by IBBA team id (the browser groups one season by title name).
+    """
+    rows = select(store.team_games, season_mask(store.team_games, season))
+    if len(rows["game"]) == 0:
+        return []
+
+    first, inverse, count = group_by(rows["season"], rows["team"])
+    score = rows["score"].astype(np.int64)
+    against = rows["opp_score"].astype(np.int64)
+    won = score > against
+    lost = score < against
+    home = rows["home"]
+
+    games = np.bincount(inverse, minlength=count)
+    wins = np.bincount(inverse, weights=won, minlength=count)
+    losses = np.bincount(inverse, weights=lost, minlength=count)
+    points = group_sum(inverse, count, score)
+    points_against = group_sum(inverse, count, against)
+
+    table = {
+        "gamesPlayed": games,
+        "wins": wins,
+        "losses": losses,
+        "winPct": np.where(games > 0, to_fixed_1(wins / np.maximum(games, 1) * 100), 0.0),
+        "ppg": per_game(points, games),
+        "oppPpg": per_game(points_against, games),
+        "pointDiff": per_game(points - points_against, games),
+    }
+    for field, spec in TEAM_PER_GAME.items():
+        table[field] = per_game(column_sum(rows, inverse, count, spec), games)
+    for field, (made, attempted) in SHOOTING.items():
+        table[field] = pct(group_sum(inverse, count, rows[made]), group_sum(inverse, count, rows[attempted]))
+
+    splits = {}
+    for location, mask in (("home", home), ("away", ~home)):
+        loc_games = np.bincount(inverse, weights=mask, minlength=count)
+        loc_wins = np.bincount(inverse, weights=mask & won, minlength=count)
+        splits[location] = {
+            "games": loc_games,
+            "wins": loc_wins,
+            "losses": np.bincount(inverse, weights=mask & lost, minlength=count),
+            "ppg": per_game(group_sum(inverse, count, score * mask), loc_games),
+            "oppPpg": per_game(group_sum(inverse, count, against * mask), loc_games),
+            "winPct": np.where(loc_games > 0, to_fixed_1(loc_wins / np.maximum(loc_games, 1) * 100), 0.0),
+            "winPpg": np.where(loc_wins > 0, per_game(group_sum(inverse, count, score * (mask & won)), loc_wins), 0.0),
+        }
+
+    seasons = rows["season"][first]
+    teams = rows["team"][first]
+    # Default order like the browser: per season, PPG descending (stable)
+    order = np.lexsort((-table["ppg"], seasons))
+
+    labels = store.seasons
+    team_ids = store.dicts["team_ids"]
+    team_names = store.dicts["team_names"]
+    result = []
+    for g in order:
+        record = {
+            "season": labels[seasons[g]],
+            "teamId": int(team_ids[teams[g]]),
+            "teamName": str(team_names[teams[g]]),
+        }
+        record.update({field: values[g].item() for field, values in table.items()})
+        for field in ("gamesPlayed", "wins", "losses"):
+            record[field] = int(record[field])
+        for location, split in splits.items():
+            record[location] = {field: values[g].item() for field, values in split.items()}
+            for field in ("games", "wins", "losses"):
+                record[location][field] = int(record[location][field])
+        result.append(record)
+    return result
+
+
+def player_table(store, season=None):
+    """
+    Player totals / averages per (season, player), over lines with minutes > 0.
+    Mirrors IBBAAnalytics.getPlayerAverages (jersey and team come from the first played game).
+    """
+    lines = store.lines
+    played = np.asarray(lines["seconds"]) > 0
+    mask = played if season is None else played & (np.asarray(lines["season"]) == season)
+    rows = select(lines, mask)
+    if len(rows["game"]) == 0:
+        return []
+
+    first, inverse, count = group_by(rows["season"], rows["player"])
+    games = np.bincount(inverse, minlength=count)
+    table = {"gamesPlayed": games}
+    for field, spec in PLAYER_PER_GAME.items():
+        table[field] = per_game(column_sum(rows, inverse, count, spec), games)
+    # minutes + seconds / 60 per line, like IBBAAdapter.convertMinutesToDecimal, so the sums match
+    seconds = rows["seconds"]
+    minutes = seconds // 60 + (seconds % 60) / 60
+    table["mpg"] = per_game(group_sum(inverse, count, minutes), games)
+    for field, (made, attempted) in SHOOTING.items():
+        table[field] = pct(group_sum(inverse, count, rows[made]), group_sum(inverse, count, rows[attempted]))
+    table["totalPoints"] = group_sum(inverse, count, rows["pts"])
+
+    seasons = rows["season"][first]
+    order = np.lexsort((-table["ppg"], seasons))
+
+    labels = store.seasons
+    player_ids = store.dicts["player_ids"]
+    jerseys = store.dicts["jerseys"]
+    team_ids = store.dicts["team_ids"]
+    team_names = store.dicts["team_names"]
+    result = []
+    for g in order:
+        line = first[g]
+        record = {
+            "season": labels[seasons[g]],
+            "playerId": str(player_ids[rows["player"][line]]),
+            "jersey": str(jerseys[rows["jersey"][line]]),
+            "teamId": int(team_ids[rows["team"][line]]),
+            "teamName": str(team_names[rows["team"][line]]),
+        }
+        record.update({field: values[g].item() for field, values in table.items()})
+        record["gamesPlayed"] = int(record["gamesPlayed"])
+        record["totalPoints"] = int(record["totalPoints"])
+        result.append(record)
+    return result
+
+
+def rank(records, metric, limit=None):
+    """Rank records within each season by metric (descending, stable - like getSortedByMetric)."""
+    by_season = {}
+    for record in records:
+        by_season.setdefault(record["season"], []).append(record)
+
+    ranked = []
+    for season_records in by_season.values():
+        ordered = sorted(season_records, key=lambda record: -(record.get(metric) or 0))
+        for position, record in enumerate(ordered[:limit] if limit else ordered, start=1):
+            ranked.append({**record, "rank": position})
+    return ranked
@@ -0,0 +1,301 @@
+import html
+import json
+import re
+import shutil
+from pathlib import Path
+
+import numpy as np
+
+
+FORMAT_VERSION = 1
+
+# Player box-score line columns (one row per player per game), in IBBA performance keys
+LINE_STATS = [
+    "pts", "fgm", "fga", "threepm", "threepa", "ftm", "fta", "off", "def",
+    "ast", "stl", "blk", "to", "pf", "pfa", "blka", "pm", "rate",
+]
+
+# Team-game columns (one row per team per game): the performance['0'] totals + sp_teams
+TEAM_STATS = [
+    "fgm", "fga", "threepm", "threepa", "ftm", "fta", "off", "def",
+    "ast", "stl", "blk", "to", "pf",
+]
+TEAM_ADVANCED = ["pfb", "pto", "pipm", "pipa", "psc", "pbc"]
+
+TITLE_SPLIT_RE = re.compile(r"\s*[—–-]\s*")
+LEADING_INT_RE = re.compile(r"^\s*([+-]?\d+)")
+
+
+def parse_int(value):
+    """parseInt() semantics: leading integer or 0."""
+    match = LEADING_INT_RE.match(str(value))
+    return int(match.group(1)) if match else 0
+
+
+def minutes_to_seconds(value):
+    """'MM:SS' -> seconds (same parsing as IBBAAdapter.convertMinutesToDecimal)."""
+    if not value or value == "0:00":
+        return 0
+    parts = str(value).split(":")
+    minutes = parse_int(parts[0])
+    seconds = parse_int(parts[1]) if len(parts) > 1 else 0
+    return minutes * 60 + seconds
+
+
+def number(value):
+    """`stats.x || 0` for numbers that may arrive as strings."""
+    if value in (None, "", False):
+        return 0
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        try:
+            return int(float(value))
+        except (TypeError, ValueError):
+            return 0
+
+
+def load_events(path: Path):
+    """
+    Read IBBA event JSON: a list of events (API shape), or {"games": [...]}.
+    Events are de-duplicated by id, last one wins (like the month merge in IBBAAdapter).
+    """
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    if isinstance(data, dict):
+        data = data.get("games") or data.get("events") or []
+    events = {}
+    for event in data:
+        if isinstance(event, dict) and event.get("id") is not None:
+            events[event["id"]] = event
+    return list(events.values())
+
+
+class Dictionary:
+    """Value -> dense int code."""
+
+    def __init__(self):
+        self.codes = {}
+        self.values = []
+
+    def code(self, value):
+        code = self.codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self.codes[value] = code
+            self.values.append(value)
+        return code
+
+
+def check_replaceable(out_dir: Path):
+    """Only an empty directory or an existing season store (meta.json with formatVersion) is replaced."""
+    if not out_dir.is_dir():
+        raise SystemExit(f"Output exists and is not a directory: {out_dir}")
+    if not any(out_dir.iterdir()):
+        return
+    meta_file = out_dir / "meta.json"
+    try:
+        meta = json.loads(meta_file.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        meta = None
+    if not isinstance(meta, dict) or "formatVersion" not in meta:
+        raise SystemExit(f"Refusing to replace {out_dir}: not empty and not a season store (no meta.json)")
+
+
+class StoreBuilder:
+    """
+    Collects events season by season into flat column lists, then writes the store.
+    Only played games are kept (events with player lines) - same rule as IBBAGameLoader.
+    """
+
+    def __init__(self):
+        self.seasons = []
+        self.teams = Dictionary()
+        self.team_names = {}
+        self.players = Dictionary()
+        self.jerseys = Dictionary()
+        self.game_ids = []
+        self.game_dates = []
+        self.game_rounds = []
+        self.game_seasons = []
+        self.lines = {name: [] for name in ["season", "game", "team", "player", "home", "jersey", "seconds"] + LINE_STATS}
+        self.team_games = {
+            name: []
+            for name in ["season", "game", "team", "opponent", "home", "score", "opp_score", "efficiency"]
+            + TEAM_STATS + TEAM_ADVANCED
+        }
+        self.skipped = 0
+
+    def add_season(self, label, events):
+        season = len(self.seasons)
+        self.seasons.append(label)
+        for event in events:
+            if not self.add_event(season, event):
+                self.skipped += 1
+        return season
+
+    def add_event(self, season, event):
+        performance = event.get("performance")
+        teams = event.get("teams") or []
+        if not isinstance(performance, dict) or len(teams) < 2:
+            return False
+
+        home_id, away_id = teams[0], teams[1]
+        title = (event.get("title") or {}).get("rendered") or ""
+        names = TITLE_SPLIT_RE.split(title)
+        home_name = html.unescape(names[0].strip()) if names and names[0].strip() else "Unknown"
+        away_name = html.unescape(names[1].strip()) if len(names) > 1 and names[1].strip() else "Unknown"
+
+        sides = []
+        for team_id, name, is_home in ((home_id, home_name, True), (away_id, away_name, False)):
+            team_performance = performance.get(str(team_id)) or {}
+            sides.append((team_id, name, is_home, team_performance))
+
+        if not any(key != "0" for _, _, _, team_performance in sides for key in team_performance):
+            return False
+
+        game = len(self.game_ids)
+        self.game_ids.append(int(event["id"]))
+        self.game_dates.append(str(event.get("date") or ""))
+        self.game_rounds.append(number(event.get("stage_id") or event.get("stage")))
+        self.game_seasons.append(season)
+
+        scores = [number((team_performance.get("0") or {}).get("pts")) for _, _, _, team_performance in sides]
+        advanced = event.get("sp_teams") or {}
+        team_codes = [self.teams.code(int(team_id)) for team_id, _, _, _ in sides]
+
+        for side, (team_id, name, is_home, team_performance) in enumerate(sides):
+            team = team_codes[side]
+            self.team_names[team] = name
+            efficiency = 0
+
+            for player_id, stats in team_performance.items():
+                if player_id == "0":
+                    continue
+                efficiency += number(stats.get("rate"))
+                lines = self.lines
+                lines["season"].append(season)
+                lines["game"].append(game)
+                lines["team"].append(team)
+                lines["player"].append(self.players.code(str(player_id)))
+                lines["home"].append(is_home)
+                lines["jersey"].append(self.jerseys.code(str(stats.get("number") or "")))
+                lines["seconds"].append(minutes_to_seconds(stats.get("min")))
+                for key in LINE_STATS:
+                    lines[key].append(number(stats.get(key)))
+
+            totals = team_performance.get("0") or {}
+            extra = advanced.get(str(team_id)) or {}
+            rows = self.team_games
+            rows["season"].append(season)
+            rows["game"].append(game)
+            rows["team"].append(team)
+            rows["opponent"].append(team_codes[1 - side])
+            rows["home"].append(is_home)
+            rows["score"].append(scores[side])
+            rows["opp_score"].append(scores[1 - side])
+            rows["efficiency"].append(efficiency)
+            for key in TEAM_STATS:
+                rows[key].append(number(totals.get(key)))
+            for key in TEAM_ADVANCED:
+                rows[key].append(number(extra.get(key)))
+
+        return True
+
+    def write(self, out_dir: Path):
+        """Write one .npy per column (memory-mappable) + dictionaries.npz + meta.json."""
+        out_dir = Path(out_dir)
+        if out_dir.exists():
+            check_replaceable(out_dir)
+            shutil.rmtree(out_dir)
+        (out_dir / "lines").mkdir(parents=True)
+        (out_dir / "team_games").mkdir()
+
+        def column(name, values):
+            if name == "home":
+                return np.asarray(values, dtype=np.bool_)
+            if name in ("season",):
+                return np.asarray(values, dtype=np.int16)
+            if name in ("pts", "seconds", "efficiency", "score", "opp_score", "game", "team", "opponent", "player", "jersey"):
+                return np.asarray(values, dtype=np.int32)
+            return np.asarray(values, dtype=np.int16)
+
+        for name, values in self.lines.items():
+            np.save(out_dir / "lines" / f"{name}.npy", column(name, values))
+        for name, values in self.team_games.items():
+            np.save(out_dir / "team_games" / f"{name}.npy", column(name, values))
+
+        np.savez(
+            out_dir / "dictionaries.npz",
+            seasons=np.asarray(self.seasons, dtype=np.str_),
+            team_ids=np.asarray(self.teams.values, dtype=np.int64),
+            team_names=np.asarray([self.team_names.get(i, "") for i in range(len(self.teams.values))], dtype=np.str_),
+            player_ids=np.asarray(self.players.values, dtype=np.str_),
+            jerseys=np.asarray(self.jerseys.values, dtype=np.str_),
+            game_ids=np.asarray(self.game_ids, dtype=np.int64),
+            game_dates=np.asarray(self.game_dates, dtype=np.str_),
+            game_rounds=np.asarray(self.game_rounds, dtype=np.int32),
+            game_seasons=np.asarray(self.game_seasons, dtype=np.int16),
+        )
+
+        meta = {
+            "format": "season-store",
+            "formatVersion": FORMAT_VERSION,
+            "seasons": self.seasons,
+            "counts": {
+                "games": len(self.game_ids),
+                "lines": len(self.lines["game"]),
+                "teamGames": len(self.team_games["game"]),
+                "teams": len(self.teams.values),
+                "players": len(self.players.values),
+                "skippedEvents": self.skipped,
+            },
+        }
+        (out_dir / "meta.json").write_text(json.dumps(meta, ensure_ascii=False, indent=2), encoding="utf-8")
+        return meta
+
+
+class SeasonStore:
+    """Read side: columns are memory-mapped, dictionaries are loaded in full (small)."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        meta_file = self.path / "meta.json"
+        if not meta_file.exists():
+            raise SystemExit(f"Not a season store (missing meta.json): {self.path}")
+        self.meta = json.loads(meta_file.read_text(encoding="utf-8"))
+        if self.meta.get("formatVersion") != FORMAT_VERSION:
+            raise SystemExit(f"Unsupported store version {self.meta.get('formatVersion')} (expected {FORMAT_VERSION})")
+
+        self.lines = self._load_columns("lines")
+        self.team_games = self._load_columns("team_games")
+        with np.load(self.path / "dictionaries.npz", allow_pickle=False) as dictionaries:
+            self.dicts = {name: dictionaries[name] for name in dictionaries.files}
+
+    def _load_columns(self, group):
+        return {
+            file.stem: np.load(file, mmap_mode="r")
+            for file in sorted((self.path / group).glob("*.npy"))
+        }
+
+    @property
+    def seasons(self):
+        return [str(label) for label in self.dicts["seasons"]]
+
+    def season_index(self, label):
+        if label is None:
+            return None
+        seasons = self.seasons
+        if label not in seasons:
+            raise SystemExit(f"Unknown season {label!r} (store has: {', '.join(seasons)})")
+        return seasons.index(label)
+
+
+def build_store(out_dir: Path, inputs):
+    """inputs: [(label, path), ...] - one IBBA event JSON file per season."""
+    out_dir = Path(out_dir)
+    if out_dir.exists():
+        check_replaceable(out_dir)  # before parsing the inputs, not after
+    builder = StoreBuilder()
+    for label, path in inputs:
+        builder.add_season(label, load_events(path))
+    return builder.write(out_dir)